@@ -0,0 +1,259 @@
+"""
+Vectorized Ludo simulator
+
+Advances a batch of independent games in lockstep with NumPy. The rules
+are the ones of engine.Game (and therefore of gui.py/player.py), evaluated
+with masked array operations instead of Python objects. A game ends as
+soon as the first player has brought all figures to the end zone, like in
+the GUI; its slot in the batch is then handed to the next game, so the
+arrays stay full until the last games are running.
+"""
+
+import numpy as np
+
+import engine
+
+MAX_DICE = 16
+BATCH_SIZE = 8192
+
+RING = np.array(engine.RING, dtype=np.int8)
+SPECIAL = np.array(engine.SPECIAL, dtype=bool)
+COLORS = np.arange(engine.NUM_PLAYERS)
+
+# the special fields lie at the same progress for every color
+assert (SPECIAL == SPECIAL[0]).all()
+SPECIAL_PROGRESS = SPECIAL[0]
+RING_FLAT = RING.ravel()
+RING_OFFSETS = (COLORS * RING.shape[1])[None, :, None]
+
+POLICIES = ['random', 'greedy']
+
+
+class BatchGame:
+    """
+    Plays num_games games, batch_size of them at a time. Every slot of the
+    batch holds one running game, stored as arrays:
+
+    figures  (B, 4, 4) progress of every figure, see engine
+    current  (B,)      color to move
+    dice     (B,)      last rolled dice value
+    pending  (B, n)    dice not used yet, count (B,) of them are valid;
+                       n starts at MAX_DICE and doubles when a roll needs it
+    rolling  (B,)      True if the current player has to roll
+    game     (B,)      index of the game in the slot, -1 once the slot is empty
+
+    winner (num_games,) is the winning color of every game, -1 while it is
+    not finished. Empty slots are compacted out of the arrays when the last
+    games no longer fill the batch.
+    """
+
+    def __init__(self, num_games, seed=None, policies=None, batch_size=BATCH_SIZE):
+        self.num_games = num_games
+        self.rng = np.random.default_rng(seed)
+        size = min(num_games, batch_size)
+        self.figures = np.zeros((size, engine.NUM_PLAYERS, engine.NUM_FIGURES), dtype=np.int8)
+        self.current = np.zeros(size, dtype=np.int8)
+        self.dice = np.zeros(size, dtype=np.int8)
+        self.pending = np.zeros((size, MAX_DICE), dtype=np.int8)
+        self.count = np.zeros(size, dtype=np.int8)
+        self.rolling = np.ones(size, dtype=bool)
+        self.game = np.arange(size)
+        self.started = size
+        self.winner = np.full(num_games, -1, dtype=np.int8)
+        self.plies = 0
+
+        policies = policies or ['random'] * engine.NUM_PLAYERS
+        for policy in policies:
+            if policy not in POLICIES:
+                raise ValueError("Error! unknown policy {}".format(policy))
+        self.greedy = np.array([policy == 'greedy' for policy in policies])
+
+        self.slots = np.arange(MAX_DICE)
+        self.index = np.arange(size)
+
+    def isOver(self):
+        return self.started == self.num_games and not (self.game >= 0).any()
+
+    def getWinners(self):
+        return self.winner
+
+    def legalMoves(self):
+        """
+        Boolean mask (B, 4, slots) of figures that can move with
+        pending[slot] in every slot of the batch, together with the resulting
+        progress. Only the first slot of every distinct dice value is marked,
+        like engine.legalMoves. Slots beyond the longest pending list are
+        left out.
+        """
+        own = self.figures[self.index, self.current]
+        slots = max(int(self.count.max()), 1)
+        legal = np.zeros((len(own), engine.NUM_FIGURES, slots), dtype=bool)
+        result = np.full((len(own), engine.NUM_FIGURES, slots), -1, dtype=np.int8)
+
+        # one column per pending dice, later columns only for the few games with more dice
+        for slot in range(slots):
+            if slot == 0:
+                games = self.index[self.count > 0]
+            else:
+                games = self.index[self.count > slot]
+                dice = self.pending[games, slot]
+                games = games[~(self.pending[games, :slot] == dice[:, None]).any(axis=1)]
+            dice = self.pending[games, slot]
+            progress = own[games]
+
+            # engine.ADVANCE: a six leaves home, nobody overshoots the end
+            moved = progress + dice[:, None]
+            moved[moved > engine.END] = -1
+            leave = np.where(dice == 6, 1, -1).astype(np.int8)
+            moved = np.where(progress == engine.HOME, leave[:, None], moved)
+
+            blocked = moved == progress[:, 0, None]
+            for figure in range(1, engine.NUM_FIGURES):
+                blocked |= moved == progress[:, figure, None]
+            legal[games, :, slot] = (moved >= 0) & (SPECIAL_PROGRESS[np.maximum(moved, 0)] | ~blocked)
+            result[games, :, slot] = moved
+        return legal, result
+
+    def nextPlayer(self, games):
+        self.count[games] = 0
+        self.rolling[games] = True
+        self.current[games] = (self.current[games] + 1) % engine.NUM_PLAYERS
+
+    def roll(self, games):
+        dice = self.rng.integers(1, 7, size=len(games), dtype=np.int8)
+        self.dice[games] = dice
+        count = self.count[games]
+        if count.max() >= self.pending.shape[1]:
+            # captures and finished figures roll again without spending the pending dice
+            self.pending = np.concatenate([self.pending, np.zeros_like(self.pending)], axis=1)
+            self.slots = np.arange(self.pending.shape[1])
+        self.pending[games, count] = dice
+        count = count + 1
+
+        six = dice == 6
+        triple = six & (count >= 3)
+        triple[triple] = ((self.pending[games[triple], count[triple] - 2] == 6)
+                          & (self.pending[games[triple], count[triple] - 3] == 6))
+        count[triple] -= 3
+        self.count[games] = count
+        self.rolling[games] = six
+
+    def choose(self, games, figures, legal, result):
+        """Pick one (figure, slot) per game among the legal ones."""
+        score = self.rng.random(legal.shape, dtype=np.float32)
+
+        current = self.current[games]
+        greedy = self.greedy[current]
+        if greedy.any():
+            own = figures[np.arange(len(games)), current]
+            heuristic = result.astype(np.float64)
+            heuristic += 100.0 * (result == engine.END)
+            heuristic += 50.0 * (own[:, :, None] == engine.HOME)
+            heuristic += 200.0 * self.captures(current, figures, result)
+            score = np.where(greedy[:, None, None], score + heuristic, score)
+
+        score = np.where(legal, score, -1.0)
+        best = score.reshape(len(games), -1).argmax(axis=1)
+        slots = legal.shape[2]
+        return best // slots, best % slots
+
+    def captures(self, current, figures, result):
+        """Mask of moves in result that would send an opponent figure home."""
+        square = RING[current[:, None, None], np.maximum(result, 0)]
+        square = np.where((result > 0) & ~SPECIAL[current[:, None, None], np.maximum(result, 0)], square, -1)
+
+        others = RING[COLORS[None, :, None], figures]
+        others = np.where(COLORS[None, :, None] == current[:, None, None], -1, others)
+        others = others.reshape(len(current), -1)
+        hit = square[:, :, :, None] == others[:, None, None, :]
+        return (hit & (square[:, :, :, None] >= 0)).any(axis=3)
+
+    def move(self, games, legal, result):
+        """Play one of the legal moves in the given slots, legal and result as from legalMoves."""
+        legal, result = legal[games], result[games]
+        figures = self.figures[games]
+        figure, slot = self.choose(games, figures, legal, result)
+        current = self.current[games]
+        rows = np.arange(len(games))
+        target = result[rows, figure, slot]
+
+        # own figures never share a field that is not special, so every hit is an opponent
+        square = RING[current, target]
+        capture = np.nonzero((square >= 0) & ~SPECIAL_PROGRESS[target])[0]
+        others = RING_FLAT[RING_OFFSETS + figures[capture]]
+        hit = others == square[capture, None, None]
+        figures[capture] = np.where(hit, engine.HOME, figures[capture])
+        captured = np.zeros(len(games), dtype=bool)
+        captured[capture] = hit.any(axis=(1, 2))
+        figures[rows, current, figure] = target
+        self.figures[games] = figures
+
+        width = legal.shape[2]
+        pending = self.pending[games, :width]
+        shifted = np.concatenate([pending[:, 1:], np.zeros((len(games), 1), dtype=np.int8)], axis=1)
+        self.pending[games, :width] = np.where(self.slots[None, :width] >= slot[:, None], shifted, pending)
+        count = self.count[games] - 1
+        self.count[games] = count
+
+        rolling = (target == engine.END) | captured
+        self.rolling[games] = rolling
+        won = target == engine.END
+        won[won] = (figures[rows[won], current[won]] == engine.END).all(axis=1)
+        self.nextPlayer(games[~won & ~rolling & (count == 0)])
+        if won.any():
+            self.winner[self.game[games[won]]] = current[won]
+            self.finish(games[won])
+
+    def finish(self, games):
+        """Start the next games in the slots of finished ones, or empty the slots."""
+        new = games[:self.num_games - self.started]
+        self.figures[new] = engine.HOME
+        self.current[new] = 0
+        self.count[new] = 0
+        self.rolling[new] = True
+        self.game[new] = np.arange(self.started, self.started + len(new))
+        self.started += len(new)
+
+        empty = games[len(new):]
+        if len(empty):
+            self.game[empty] = -1
+            self.rolling[empty] = False
+            self.count[empty] = 0
+            if 4 * (self.game < 0).sum() >= len(self.game):
+                self.compact()
+
+    def compact(self):
+        keep = self.game >= 0
+        self.figures = self.figures[keep]
+        self.current = self.current[keep]
+        self.dice = self.dice[keep]
+        self.pending = self.pending[keep]
+        self.count = self.count[keep]
+        self.rolling = self.rolling[keep]
+        self.game = self.game[keep]
+        self.index = np.arange(len(self.game))
+
+    def step(self):
+        """
+        Apply one ply to every game of the batch: the players that have to
+        roll roll, then every player with pending dice moves or, without a
+        legal move, passes the turn. The move masks are computed once.
+        """
+        active = self.game >= 0
+        to_roll = self.index[active & self.rolling]
+        if len(to_roll):
+            self.roll(to_roll)
+
+        waiting = active & ~self.rolling
+        legal, result = self.legalMoves()
+        can_move = legal.any(axis=(1, 2))
+        self.nextPlayer(self.index[waiting & ~can_move])
+        to_move = self.index[waiting & can_move]
+        if len(to_move):
+            self.move(to_move, legal, result)
+        self.plies += 1
+
+    def run(self, max_plies=10000000):
+        while not self.isOver() and self.plies < max_plies:
+            self.step()
+        return self.winner
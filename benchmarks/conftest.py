@@ -0,0 +1,21 @@
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def app():
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+@pytest.fixture
+def ludo(app):
+    from ludo import Ludo
+    window = Ludo()
+    yield window
+    window.close()
@@ -0,0 +1,79 @@
+"""
+Benchmarks of the Qt board model
+
+Run with the offscreen platform (set by conftest.py) and save the results
+as JSON to compare later runs against:
+
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import pytest
+
+from board import Board
+from player import Player
+
+HUMANS = [(True, name, None) for name in ("Red", "Green", "Yellow", "Blue")]
+
+
+def test_board_init(app, benchmark):
+    benchmark(Board)
+
+
+def test_add_figures(ludo, benchmark):
+    scene = ludo.board.getScene()
+
+    def clear():
+        for figures in ludo.figures:
+            for figure in figures:
+                figure.getPosition().removeFigure(figure)
+                scene.removeItem(figure)
+
+    benchmark.pedantic(ludo.add_figures, setup=clear, rounds=50)
+
+
+@pytest.mark.parametrize("kind", ["normal", "special", "end"])
+def test_set_position(ludo, benchmark, kind):
+    board = ludo.board
+    field = {"normal": board.fields[3], "special": board.fields[1], "end": board.end_fields[0]}[kind]
+    figure, other = ludo.figures[0][:2]
+    other.setPosition(field)
+    if kind == "special":
+        ludo.figures[1][0].setPosition(field)
+
+    def roundTrip():
+        figure.setPosition(field)
+        figure.moveToHome()
+
+    benchmark(roundTrip)
+
+
+def test_player_move_capture(ludo, benchmark):
+    board = ludo.board
+    player = Player("Red", ludo.colors['RED'], 'RED', ludo)
+    player.setFigures(ludo.figures[0])
+    figure = ludo.figures[0][0]
+    victim = ludo.figures[1][0]
+
+    def setup():
+        figure.setPosition(board.fields[3])
+        victim.setPosition(board.fields[5])
+        player.setEnabled(True)
+        player.dice = [2]
+        player.setCurrentDice((2, None))
+        figure.setResultPosition(board.fields[5])
+
+    benchmark.pedantic(player.move, args=(figure,), setup=setup, rounds=200)
+    assert victim.getPosition() is victim.start_position
+
+
+def test_reset(ludo, benchmark):
+    board = ludo.board
+
+    def setup():
+        ludo.start(HUMANS)
+        for color, figures in enumerate(ludo.figures):
+            figures[0].setPosition(board.fields[13 * color + 3])
+            figures[1].setPosition(board.end_fields[color])
+
+    benchmark.pedantic(ludo.reset, setup=setup, rounds=50)
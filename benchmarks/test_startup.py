@@ -0,0 +1,31 @@
+"""
+Import-time budget of the headless rules
+
+Every tournament and search worker imports engine, so it has to stay free
+of PyQt5 and cheap to import. Measured in a fresh interpreter.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENGINE_IMPORT_BUDGET_MS = 50.0
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import engine
+elapsed = time.perf_counter() - start
+print(1000.0 * elapsed, any(name.split('.')[0] == 'PyQt5' for name in sys.modules))
+"""
+
+
+def test_engine_import_budget():
+    output = subprocess.run([sys.executable, "-c", SCRIPT], cwd=ROOT, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    elapsed, has_qt = output.split()
+    assert has_qt == "False", "engine must not import PyQt5"
+    assert float(elapsed) < ENGINE_IMPORT_BUDGET_MS, \
+        "importing engine took {} ms, budget is {} ms".format(elapsed, ENGINE_IMPORT_BUDGET_MS)
@@ -1,20 +1,75 @@
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
+from contextlib import contextmanager
 from gui import Field, StartField, EndField, LastField, SafeField, SpecialField, HomeField
 import resources
+import engine
+
+class BoardScene(QGraphicsScene):
+    """
+    Scene that paints a pre-rendered pixmap as background instead of the
+    static items of the board, see Board.flattenBackground.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.background = None
+        self.background_rect = None
+        self.transactions = 0
+        self.dirty_fields = set()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Defer Field.drawFigures until the outermost transaction ends, then
+        draw every field that changed once.
+        """
+        self.transactions += 1
+        try:
+            yield
+        finally:
+            self.transactions -= 1
+            if self.transactions == 0:
+                dirty, self.dirty_fields = self.dirty_fields, set()
+                for field in dirty:
+                    field.drawFigures()
+
+    def deferDraw(self, field):
+        if self.transactions == 0:
+            return False
+        self.dirty_fields.add(field)
+        return True
+
+    def setBackgroundPixmap(self, pixmap, rect):
+        self.background = pixmap
+        self.background_rect = rect
+        self.update()
+
+    def drawBackground(self, painter, rect):
+        if self.background is None:
+            super().drawBackground(painter, rect)
+            return
+        exposed = rect.intersected(self.background_rect)
+        ratio = self.background.devicePixelRatio()
+        source = exposed.translated(-self.background_rect.topLeft())
+        source = QRectF(source.topLeft() * ratio, source.size() * ratio)
+        painter.drawPixmap(exposed, self.background, source)
+
 
 class Board(QWidget):
-    def __init__(self):
+    def __init__(self, flatten=True):
         super().__init__()
 
         self.view = QGraphicsView()
-        self.scene = QGraphicsScene(self)
+        self.scene = BoardScene(self)
         self.view.setScene(self.scene)
         self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setRenderHint(QPainter.Antialiasing)
 
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.timeout.connect(self.redraw)
+
         self.rect = self.scene.addRect(QRectF(0, 0, 600, 600))
         self.rect.setPen(QPen(Qt.black, 2.0))
 
@@ -174,29 +229,66 @@ class Board(QWidget):
 
         self.end_fields = []
         endRed = EndField(240, 285, 30, 30)
+        endRed.setIndex(engine.END_SQUARE)
         self.scene.addItem(endRed)
         self.end_fields.append(endRed)
 
         endGreen = EndField(285, 240, 30, 30)
+        endGreen.setIndex(engine.END_SQUARE+1)
         self.scene.addItem(endGreen)
         self.end_fields.append(endGreen)
 
         endYellow = EndField(330, 285, 30, 30)
+        endYellow.setIndex(engine.END_SQUARE+2)
         self.scene.addItem(endYellow)
         self.end_fields.append(endYellow)
 
         endBlue = EndField(285, 330, 30, 30)
+        endBlue.setIndex(engine.END_SQUARE+3)
         self.scene.addItem(endBlue)
         self.end_fields.append(endBlue)
 
         self.setupNextField()
         self.setupPreviousField()
         self.setupNextSafeZone()
+        self.setupMoveTables()
+        if flatten: self.flattenBackground()
+
+        self.hilight = self.scene.addRect(QRectF())
+        self.hilight.setZValue(1.0)
+        self.hilight.setVisible(False)
 
         vLayout = QVBoxLayout()
         self.setLayout(vLayout)
         vLayout.addWidget(self.view)
 
+    def flattenBackground(self):
+        """
+        Render all visible items into one background pixmap and take them out
+        of the scene. Fields only get hidden, they still lay out the figures
+        standing on them. Items that are hidden now, like the highlight of the
+        home fields, stay live.
+        """
+        rect = self.scene.itemsBoundingRect()
+        self.scene.setSceneRect(rect)
+        ratio = QGuiApplication.instance().devicePixelRatio()
+        pixmap = QPixmap((rect.size() * ratio).toSize())
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.scene.render(painter, QRectF(QPointF(0, 0), rect.size()), rect)
+        painter.end()
+
+        for item in self.scene.items():
+            if not item.isVisible():
+                continue
+            if isinstance(item, Field):
+                item.setVisible(False)
+            else:
+                self.scene.removeItem(item)
+        self.scene.setBackgroundPixmap(pixmap, rect)
+
     def setupNextField(self):
         ends = {56:0, 61:1, 66:2, 71:3}
         for id, box in enumerate(self.fields):
@@ -211,11 +303,20 @@ class Board(QWidget):
             prev_id = 51 if id < 1 else id-1
             box.setPreviousField(self.fields[prev_id])
 
+    def setupMoveTables(self):
+        squares = self.fields + self.end_fields + [starts[0] for starts in self.starts]
+        self.move_tables = []
+        for rows in engine.MOVE_TABLE:
+            table = [[squares[id] if id != engine.OVERSHOOT else None for id in row] for row in rows]
+            self.move_tables.append(table)
+
     def addStartFields(self, homeField, next_index):
         circles = homeField.getHomeField()
         starts = []
+        start_index = engine.START_SQUARE + len(self.starts)
         for circle in circles:
             box = StartField(circle.boundingRect())
+            box.setIndex(start_index)
             box.setNextField(self.fields[next_index])
             starts.append(box)
             self.scene.addItem(box)
@@ -230,14 +331,13 @@ class Board(QWidget):
     def drawSpecial(self, index, color='black'):
         brect = self.fields[index].boundingRect()
         idx = self.fields[index].getIndex()
+        self.scene.removeItem(self.fields[index])
         self.fields[index] = None
 
         box = SpecialField(brect)
         box.setIndex(idx)
-        pmap = QPixmap(":/images/star")
-        if color != 'black':
-            pmap = QPixmap(":/images/star-{}".format(color))
-        pmap = pmap.scaled(QSize(30, 30), Qt.KeepAspectRatio)
+        path = ":/images/star" if color == 'black' else ":/images/star-{}".format(color)
+        pmap = resources.pixmap(path, QSize(30, 30))
         pmap_item = QGraphicsPixmapItem(pmap)
         pmap_item.setPos(brect.topLeft().x()+5.0, brect.topLeft().y()+5.0)
         self.scene.addItem(box)
@@ -254,8 +354,44 @@ class Board(QWidget):
             return self.starts[index]
         return None
 
+    def getMoveTable(self, index):
+        if index < 4:
+            return self.move_tables[index]
+        return None
+
+    def transaction(self):
+        """Context manager batching the figure redraws of several moves, see BoardScene.transaction."""
+        return self.scene.transaction()
+
+    def placeFigures(self, placements):
+        """Move every figure of the (figure, field) pairs in placements in one transaction."""
+        with self.transaction():
+            for figure, field in placements:
+                if figure.getPosition() is not field: figure.setPosition(field)
+
+    def getHilight(self):
+        return self.hilight
+
     def getDiceBox(self):
         return self.diceBox
 
     def getScene(self):
         return self.scene
+
+    def setRedrawRate(self, fps=None):
+        """
+        Limit repaints of the view to fps frames per second. With fps 0 the
+        view only repaints on redraw(), with None every scene change is
+        painted again.
+        """
+        self.redraw_timer.stop()
+        if fps is None:
+            self.view.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+            self.redraw()
+            return
+        self.view.setViewportUpdateMode(QGraphicsView.NoViewportUpdate)
+        if fps > 0:
+            self.redraw_timer.start(int(1000 / fps))
+
+    def redraw(self):
+        self.view.viewport().update()
@@ -0,0 +1,441 @@
+"""
+Headless Ludo engine
+
+Pure python implementation of the rules used by the Qt board in gui.py,
+board.py and player.py. Nothing in here imports PyQt5, so whole games can
+be simulated without a QApplication or a QGraphicsScene.
+
+Every figure is stored as its progress along the path of its own color:
+0 is the start field at home, 1..51 are the fields of the ring starting at
+the colored star, 52..56 are the safe fields behind the LastField turn-off
+and 57 is the end zone.
+"""
+
+import random
+
+COLORS = ['RED', 'GREEN', 'YELLOW', 'BLUE']
+NUM_PLAYERS = 4
+NUM_FIGURES = 4
+
+RING_SIZE = 52
+SAFE_SIZE = 5
+HOME = 0
+LAST = RING_SIZE - 1
+END = LAST + SAFE_SIZE + 1
+
+# ring indices as used by Board.fields
+START_FIELDS = [1, 14, 27, 40]
+LAST_FIELDS = [51, 12, 25, 38]
+SPECIAL_FIELDS = frozenset([1, 9, 14, 22, 27, 35, 40, 48])
+
+# square ids shared with Board: 0..71 are Board.fields, followed by the
+# EndField and the StartFields of every color
+NUM_FIELDS = RING_SIZE + NUM_PLAYERS * SAFE_SIZE
+END_SQUARE = NUM_FIELDS
+START_SQUARE = END_SQUARE + NUM_PLAYERS
+NUM_SQUARES = START_SQUARE + NUM_PLAYERS
+OVERSHOOT = -1
+
+
+def ringIndex(color, progress):
+    """Board.fields index of a figure of color on the ring (1 <= progress <= LAST)."""
+    return (START_FIELDS[color] + progress - 1) % RING_SIZE
+
+
+def resultPosition(progress, dice):
+    """Progress after moving dice fields, or None if the move is not possible."""
+    if progress == HOME:
+        return 1 if dice == 6 else None
+    result = progress + dice
+    if result > END:
+        return None
+    return result
+
+
+def buildPaths():
+    """PATHS[color][progress] is the square a figure of color occupies."""
+    paths = []
+    for color in range(NUM_PLAYERS):
+        path = [START_SQUARE + color]
+        path += [ringIndex(color, progress) for progress in range(1, LAST + 1)]
+        path += [RING_SIZE + color * SAFE_SIZE + id for id in range(SAFE_SIZE)]
+        path.append(END_SQUARE + color)
+        paths.append(path)
+    return paths
+
+
+def buildMoveTable(paths):
+    """
+    MOVE_TABLE[color][square][dice] is the square reached from square by
+    dice, or OVERSHOOT. Index 0 of every row is unused so that dice can be
+    used directly.
+    """
+    table = []
+    for color in range(NUM_PLAYERS):
+        rows = [[OVERSHOOT] * 7 for _ in range(NUM_SQUARES)]
+        for progress, square in enumerate(paths[color]):
+            for dice in range(1, 7):
+                result = resultPosition(progress, dice)
+                if result is not None:
+                    rows[square][dice] = paths[color][result]
+        table.append(rows)
+    return table
+
+
+def buildProgress(paths):
+    """PROGRESS[color][square] is the progress of a figure of color on square, or None."""
+    progress = [[None] * NUM_SQUARES for _ in range(NUM_PLAYERS)]
+    for color in range(NUM_PLAYERS):
+        for value, square in enumerate(paths[color]):
+            progress[color][square] = value
+    return progress
+
+
+PATHS = buildPaths()
+PROGRESS = buildProgress(PATHS)
+MOVE_TABLE = buildMoveTable(PATHS)
+
+# the same tables in progress space, used by the engine itself
+ADVANCE = [[resultPosition(progress, dice) if dice else None for dice in range(7)]
+           for progress in range(END + 1)]
+RING = [[PATHS[color][progress] if HOME < progress <= LAST else OVERSHOOT
+         for progress in range(END + 1)] for color in range(NUM_PLAYERS)]
+SPECIAL = [[progress == END or RING[color][progress] in SPECIAL_FIELDS
+            for progress in range(END + 1)] for color in range(NUM_PLAYERS)]
+
+
+# zones a figure can be in, counted per player
+HOME_ZONE = 0
+RING_ZONE = 1
+LANE_ZONE = 2
+END_ZONE = 3
+ZONE = [HOME_ZONE] + [RING_ZONE] * LAST + [LANE_ZONE] * SAFE_SIZE + [END_ZONE]
+
+
+def isSpecial(color, progress):
+    return SPECIAL[color][progress]
+
+
+# Zobrist keys. Figures of one color are interchangeable, so a position is
+# hashed by how many figures of each color stand on every progress value.
+# The keys for a count of 0 are 0, which makes empty fields free.
+ZOBRIST_SEED = 0x4c75646f
+ZOBRIST_DICE_SLOTS = 16
+
+
+def buildZobrist():
+    rng = random.Random(ZOBRIST_SEED)
+    figures = [[[0] + [rng.getrandbits(64) for _ in range(NUM_FIGURES)]
+                for progress in range(END + 1)] for color in range(NUM_PLAYERS)]
+    turn = [rng.getrandbits(64) for color in range(NUM_PLAYERS)]
+    rolling = rng.getrandbits(64)
+    dice = [[0] + [rng.getrandbits(64) for _ in range(6)] for slot in range(ZOBRIST_DICE_SLOTS)]
+    return figures, turn, rolling, dice
+
+
+ZOBRIST_FIGURES, ZOBRIST_TURN, ZOBRIST_ROLLING, ZOBRIST_DICE = buildZobrist()
+
+
+def diceHash(dice):
+    value = 0
+    for slot, dice_value in enumerate(dice):
+        value ^= ZOBRIST_DICE[slot % ZOBRIST_DICE_SLOTS][dice_value]
+    return value
+
+
+# compact encoding: 16 figures of 6 bits (sorted per color), 2 bits for the
+# current player, 1 bit for rolling, 4 bits for the number of pending dice
+# and 3 bits for each of them; 127 bits, which fit into 16 bytes
+PROGRESS_BITS = 6
+MAX_ENCODED_DICE = 8
+ENCODED_BYTES = 16
+
+
+def decode(code):
+    """Game for an integer or bytes from Game.encode()/Game.toBytes()."""
+    if isinstance(code, (bytes, bytearray)):
+        code = int.from_bytes(code, 'big')
+    dice = []
+    for _ in range(MAX_ENCODED_DICE):
+        dice.append(code & 7)
+        code >>= 3
+    num_dice = code & 15
+    code >>= 4
+    rolling = bool(code & 1)
+    code >>= 1
+    current = code & 3
+    code >>= 2
+    values = []
+    for _ in range(NUM_PLAYERS * NUM_FIGURES):
+        values.append(code & (1 << PROGRESS_BITS) - 1)
+        code >>= PROGRESS_BITS
+    values.reverse()
+    figures = [values[color * NUM_FIGURES:(color + 1) * NUM_FIGURES] for color in range(NUM_PLAYERS)]
+
+    game = Game()
+    game.setState(figures, current, dice[::-1][:num_dice], rolling)
+    return game
+
+
+class Game:
+    """
+    State of a single game together with the turn logic of Player and Ludo.
+
+    A turn mirrors Player.setDice: every six is kept in dice and the player
+    rolls again, three consecutive sixes are thrown away. Once a non-six is
+    rolled the pending dice are used one by one through move(). Capturing
+    a figure or reaching the end zone earns another roll. A player with no
+    legal move left loses the remaining dice and the turn passes on.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.figures = [[HOME] * NUM_FIGURES for _ in range(NUM_PLAYERS)]
+        self.current = 0
+        self.dice = []
+        self.rolling = True
+        self.winners = []
+        self.moves = 0
+        self.updateHash()
+
+    def copy(self):
+        game = Game.__new__(Game)
+        game.rng = self.rng
+        game.figures = [list(figs) for figs in self.figures]
+        game.counts = [list(counts) for counts in self.counts]
+        game.zone_counts = [list(counts) for counts in self.zone_counts]
+        game.current = self.current
+        game.dice = list(self.dice)
+        game.rolling = self.rolling
+        game.winners = list(self.winners)
+        game.moves = self.moves
+        game.hash = self.hash
+        game.dice_hash = self.dice_hash
+        game.move_cache = self.move_cache
+        return game
+
+    def setState(self, figures, current, dice, rolling=False):
+        self.figures = [list(figs) for figs in figures]
+        self.current = current
+        self.dice = list(dice)
+        self.rolling = rolling
+        self.updateHash()
+        self.winners = [color for color in range(NUM_PLAYERS) if self.hasWon(color)]
+
+    def updateHash(self):
+        """Recompute counts and hashes from scratch; move() keeps them up to date."""
+        self.counts = [[0] * (END + 1) for _ in range(NUM_PLAYERS)]
+        self.zone_counts = [[0] * 4 for _ in range(NUM_PLAYERS)]
+        self.hash = ZOBRIST_TURN[self.current]
+        if self.rolling:
+            self.hash ^= ZOBRIST_ROLLING
+        for color, figs in enumerate(self.figures):
+            counts = self.counts[color]
+            for progress in figs:
+                counts[progress] += 1
+                self.zone_counts[color][ZONE[progress]] += 1
+            for progress, count in enumerate(counts):
+                self.hash ^= ZOBRIST_FIGURES[color][progress][count]
+        self.dice_hash = diceHash(self.dice)
+        self.move_cache = None
+
+    def key(self):
+        """Zobrist hash of the position; figures of one color are interchangeable."""
+        return self.hash ^ self.dice_hash
+
+    def setFigure(self, color, figure, progress):
+        counts = self.counts[color]
+        keys = ZOBRIST_FIGURES[color]
+        old = self.figures[color][figure]
+        self.hash ^= keys[old][counts[old]] ^ keys[old][counts[old] - 1]
+        counts[old] -= 1
+        self.hash ^= keys[progress][counts[progress]] ^ keys[progress][counts[progress] + 1]
+        counts[progress] += 1
+        zone_counts = self.zone_counts[color]
+        zone_counts[ZONE[old]] -= 1
+        zone_counts[ZONE[progress]] += 1
+        self.figures[color][figure] = progress
+        self.move_cache = None
+
+    def setRolling(self, rolling):
+        if rolling != self.rolling:
+            self.hash ^= ZOBRIST_ROLLING
+            self.rolling = rolling
+
+    def encode(self):
+        """Pack the position into one integer below 2**128, see decode()."""
+        if len(self.dice) > MAX_ENCODED_DICE:
+            raise ValueError("Error! can not encode {} pending dice".format(len(self.dice)))
+        code = 0
+        for figs in self.figures:
+            for progress in sorted(figs):
+                code = code << PROGRESS_BITS | progress
+        code = code << 2 | self.current
+        code = code << 1 | int(self.rolling)
+        code = code << 4 | len(self.dice)
+        for slot in range(MAX_ENCODED_DICE):
+            code = code << 3 | (self.dice[slot] if slot < len(self.dice) else 0)
+        return code
+
+    def toBytes(self):
+        return self.encode().to_bytes(ENCODED_BYTES, 'big')
+
+    def getFigures(self, color):
+        return self.figures[color]
+
+    def getCurrentPlayer(self):
+        return self.current
+
+    def getDice(self):
+        return self.dice
+
+    def isRolling(self):
+        return self.rolling
+
+    def countIn(self, color, zone):
+        return self.zone_counts[color][zone]
+
+    def hasWon(self, color):
+        return self.zone_counts[color][END_ZONE] == NUM_FIGURES
+
+    def isOver(self):
+        return len(self.winners) >= NUM_PLAYERS - 1
+
+    def getWinner(self):
+        return self.winners[0] if self.winners else None
+
+    def getRanking(self):
+        rest = [color for color in range(NUM_PLAYERS) if color not in self.winners]
+        return self.winners + rest
+
+    def rollDice(self):
+        return self.setDice(self.rng.randint(1, 6))
+
+    def setDice(self, dice):
+        if not self.rolling:
+            raise ValueError("Error! player {} has to move first".format(self.current))
+
+        self.dice_hash ^= ZOBRIST_DICE[len(self.dice) % ZOBRIST_DICE_SLOTS][dice]
+        self.dice.append(dice)
+        if dice == 6:
+            if len(self.dice) > 2 and all(x == 6 for x in self.dice[-3:]):
+                self.dice = self.dice[:-3]
+                self.dice_hash = diceHash(self.dice)
+            return dice
+
+        self.setRolling(False)
+        if not self.legalMoves():
+            self.nextPlayer()
+        return dice
+
+    def canMove(self, color, figure, dice):
+        result = ADVANCE[self.figures[color][figure]][dice]
+        if result is None:
+            return False
+        if SPECIAL[color][result]:
+            return True
+        return self.counts[color][result] == 0
+
+    def captures(self, color, result):
+        """(color, figure) pairs sent home when a figure of color moves to result."""
+        victims = []
+        index = RING[color][result]
+        if index == OVERSHOOT or index in SPECIAL_FIELDS:
+            return victims
+        for other in range(NUM_PLAYERS):
+            if other == color:
+                continue
+            progress = PROGRESS[other][index]
+            if progress is None or not self.counts[other][progress]:
+                continue
+            for id, value in enumerate(self.figures[other]):
+                if value == progress:
+                    victims.append((other, id))
+        return victims
+
+    def legalFigures(self, dice):
+        """
+        Figures of the current player that can move by dice. Results are
+        cached per dice value until a figure moves or the turn passes.
+        """
+        cache = self.move_cache
+        if cache is None:
+            cache = self.move_cache = [()] + [None] * 6
+        figures = cache[dice]
+        if figures is None:
+            special = SPECIAL[self.current]
+            counts = self.counts[self.current]
+            figures = []
+            for figure, progress in enumerate(self.figures[self.current]):
+                result = ADVANCE[progress][dice]
+                if result is not None and (special[result] or not counts[result]):
+                    figures.append(figure)
+            figures = cache[dice] = tuple(figures)
+        return figures
+
+    def legalMovesByDice(self):
+        """Legal figures for every dice value 1..6 in one pass; entry 0 is empty."""
+        return [()] + [self.legalFigures(dice) for dice in range(1, 7)]
+
+    def legalMoves(self):
+        moves = []
+        for dice in sorted(set(self.dice)):
+            for figure in self.legalFigures(dice):
+                moves.append((figure, dice))
+        return moves
+
+    def move(self, figure, dice):
+        color = self.current
+        if self.rolling or not self.canMove(color, figure, dice):
+            raise ValueError("Error! figure {} can not move by {}".format(figure, dice))
+
+        result = ADVANCE[self.figures[color][figure]][dice]
+        roll_again = result == END
+
+        for other, id in self.captures(color, result):
+            self.setFigure(other, id, HOME)
+            roll_again = True
+
+        self.dice.remove(dice)
+        self.dice_hash = diceHash(self.dice)
+        self.setFigure(color, figure, result)
+        self.moves += 1
+
+        if self.hasWon(color):
+            self.winners.append(color)
+            self.nextPlayer()
+            return
+
+        if roll_again:
+            self.setRolling(True)
+        elif not self.dice or not self.legalMoves():
+            self.nextPlayer()
+
+    def nextPlayer(self):
+        self.dice = []
+        self.dice_hash = 0
+        self.setRolling(True)
+        if self.isOver():
+            return
+        color = self.current
+        while True:
+            color = color + 1 if color != NUM_PLAYERS - 1 else 0
+            if color not in self.winners:
+                break
+        self.hash ^= ZOBRIST_TURN[self.current] ^ ZOBRIST_TURN[color]
+        self.current = color
+        self.move_cache = None
+
+    def play(self, strategies=None):
+        """Play until the game is over. strategies[color](game, moves) picks a move."""
+        while not self.isOver():
+            if self.rolling:
+                self.rollDice()
+                continue
+            moves = self.legalMoves()
+            if strategies and strategies[self.current]:
+                figure, dice = strategies[self.current](self, moves)
+            else:
+                figure, dice = self.rng.choice(moves)
+            self.move(figure, dice)
+        return self.getRanking()
@@ -3,6 +3,7 @@ from PyQt5.QtGui import *
 from PyQt5.QtCore import *
 import resources
 import random
+import engine
 
 class DiceWidget(QGraphicsPixmapItem):
     def __init__(self, parent=None):
@@ -10,13 +11,13 @@ class DiceWidget(QGraphicsPixmapItem):
         self.enabled = False
         self.c = Communicate()
         self.images = []
-        self.images.append(QPixmap(":/images/dice"))
-        self.images.append(QPixmap(":/images/dice1"))
-        self.images.append(QPixmap(":/images/dice2"))
-        self.images.append(QPixmap(":/images/dice3"))
-        self.images.append(QPixmap(":/images/dice4"))
-        self.images.append(QPixmap(":/images/dice5"))
-        self.images.append(QPixmap(":/images/dice6"))
+        self.images.append(resources.pixmap(":/images/dice"))
+        self.images.append(resources.pixmap(":/images/dice1"))
+        self.images.append(resources.pixmap(":/images/dice2"))
+        self.images.append(resources.pixmap(":/images/dice3"))
+        self.images.append(resources.pixmap(":/images/dice4"))
+        self.images.append(resources.pixmap(":/images/dice5"))
+        self.images.append(resources.pixmap(":/images/dice6"))
         self.setPixmap(self.images[0])
         self.dice = 0
         self.graphics_rotation = QGraphicsRotation()
@@ -30,6 +31,7 @@ class DiceWidget(QGraphicsPixmapItem):
         self.animation.setStartValue(self.graphics_rotation.angle())
         self.animation.setEndValue(360)
         self.animation.finished.connect(self.throwDice)
+        self.animated = True
 
     def mousePressEvent(self, mouse_event):
         if not self.enabled: return
@@ -47,9 +49,22 @@ class DiceWidget(QGraphicsPixmapItem):
 
     def roll(self):
         if not self.enabled: return
+        if not self.animated:
+            self.throwDice()
+            return
         self.setPixmap(self.images[0])
         self.animation.start()
 
+    def stop(self):
+        """Abort a running roll without throwing the dice and show the blank face."""
+        self.animation.stop()
+        self.graphics_rotation.setAngle(0)
+        self.setPixmap(self.images[0])
+        self.enabled = False
+
+    def setAnimated(self, animated):
+        self.animated = animated
+
     def setEnabled(self, enabled):
         self.enabled = enabled
 
@@ -62,10 +77,14 @@ class Figure(QGraphicsEllipseItem):
         self.diameter = diameter
         self.enabled = False
         self.hilight = None
+        self.hilighted = False
         self.current_position = None
         self.start_position = None
         self.color = None
+        self.color_id = -1
+        self.owner = None
         self.result_position = None
+        self.move_table = None
         self.setAcceptHoverEvents(True)
         self.setPen(QPen(Qt.black, 2.0))
         self.c = Communicate()
@@ -86,18 +105,17 @@ class Figure(QGraphicsEllipseItem):
 
     def hilightField(self, fig):
         pos = fig.getResultPosition()
-        if pos is not None:
-            scene = pos.scene()
-            fig.hilight = scene.addRect(pos.boundingRect())
-            color = fig.getColor()
-            fig.hilight.setPen(QPen(color, 4.0))
+        if pos is None or fig.hilight is None: return
+        pen = QPen(fig.getColor(), 4.0)
+        if fig.hilight.pen() != pen: fig.hilight.setPen(pen)
+        fig.hilight.setRect(pos.boundingRect())
+        fig.hilight.setVisible(True)
+        fig.hilighted = True
 
     def unhilightField(self, fig):
-        if fig.hilight is not None:
-            pos = fig.getResultPosition()
-            scene = pos.scene()
-            scene.removeItem(fig.hilight)
-            fig.hilight = None
+        if fig.hilighted:
+            fig.hilight.setVisible(False)
+            fig.hilighted = False
 
     def setEnabled(self, enabled):
         self.enabled = enabled
@@ -112,18 +130,35 @@ class Figure(QGraphicsEllipseItem):
         self.color = color
         self.setBrush(QBrush(self.color))
 
+    def getColorId(self):
+        return self.color_id
+
+    def setColorId(self, color_id):
+        self.color_id = color_id
+
+    def setOwner(self, owner):
+        self.owner = owner
+
     def setPosition(self, position):
         self.unhilightField(self)
-        if self.current_position: self.current_position.removeFigure(self)
+        old_position = self.current_position
+        if old_position: old_position.removeFigure(self)
         self.current_position = position
         self.current_position.addFigure(self)
+        if self.owner: self.owner.figureMoved(old_position, position)
 
     def setStartPosition(self, position):
         self.start_position = position
 
+    def getStartPosition(self):
+        return self.start_position
+
     def getPosition(self):
         return self.current_position
 
+    def setMoveTable(self, table):
+        self.move_table = table
+
     def getResultPosition(self):
         return self.result_position
 
@@ -131,53 +166,38 @@ class Figure(QGraphicsEllipseItem):
         return self.diameter
 
     def setDiameter(self, diameter):
+        if diameter == self.diameter: return
         self.diameter = diameter
         self.setRect(0, 0, diameter, diameter)
 
     def enableIfPossible(self, dice):
-        enabled = False
-        if isinstance(self.current_position, EndField):
-            return enabled
-        if isinstance(self.current_position, StartField):
-            if dice == 6:
-                self.setEnabled(True)
-                enabled = True
-                self.result_position = self.current_position.next(self.color)
-            return enabled
-
         self.findResultPosition(dice)
-        if self.result_position:
-            if self.result_position.isSpecial():
-                self.setEnabled(True)
-                enabled = True
-            else:
-                figs = self.result_position.getFigures()
-                if len(figs) > 0:
-                    existing_color = figs[0].getColor()
-                    if self.color != existing_color:
-                        self.setEnabled(True)
-                        enabled = True
-                else:
-                    self.setEnabled(True)
-                    enabled = True
+        enabled = self.legalResultPosition(dice) is not None
+        if enabled: self.setEnabled(True)
         return enabled
 
     def findResultPosition(self, dice):
-        self.result_position = None
+        self.result_position = self.move_table[self.current_position.getIndex()][dice]
 
-        result_position_temp = self.current_position
-        while dice > 0:
-            dice -= 1
-            if result_position_temp:
-                result_position_temp = result_position_temp.next(self.color)
-            else:
-                break
-        if dice == 0 and result_position_temp:
-            self.result_position = result_position_temp
+    def legalResultPosition(self, dice):
+        """Field this figure would move to with dice, or None if it can not move."""
+        position = self.move_table[self.current_position.getIndex()][dice]
+        if position is None:
+            return None
+        if position.isSpecial() or position.countOf(self.color_id) == 0:
+            return position
+        return None
+
+    def setResultPosition(self, position):
+        self.result_position = position
 
     def getHilight(self):
         return self.hilight
 
+    def setHilight(self, hilight):
+        """Share the board's highlight item, shown on the result field while hovered."""
+        self.hilight = hilight
+
     def moveToHome(self):
         self.setPosition(self.start_position)
 
@@ -189,6 +209,11 @@ class Communicate(QObject):
     dice_rolled = pyqtSignal(int)
 
 class Field(QGraphicsRectItem):
+    zone = engine.RING_ZONE
+    fig_diameter = 24.0
+    text_size = 15
+    text_offset = QPointF(0.65, 0.85)
+
     def __init__(self, x, y, w, h, parent=None):
         super().__init__(x, y, w, h, parent)
         self.index = -1
@@ -198,6 +223,7 @@ class Field(QGraphicsRectItem):
         self.next_field = None
         self.prev_field = None
         self.figures = []
+        self.counts = [0, 0, 0, 0]
         self.text = None
 
     def setNextField(self, field):
@@ -215,13 +241,26 @@ class Field(QGraphicsRectItem):
     def getFigures(self):
         return self.figures
 
+    def countOf(self, color_id):
+        return self.counts[color_id]
+
+    def hasOpponent(self, color_id):
+        return len(self.figures) > self.counts[color_id]
+
     def addFigure(self, figure):
         self.figures.append(figure)
-        self.drawFigures()
+        self.counts[figure.getColorId()] += 1
+        self.redrawFigures()
 
     def removeFigure(self, figure):
-        temp = [x for x in self.figures if x != figure]
-        self.figures = temp
+        self.figures.remove(figure)
+        self.counts[figure.getColorId()] -= 1
+        self.redrawFigures()
+
+    def redrawFigures(self):
+        """Draw the figures now, or at the end of the scene's running transaction."""
+        scene = self.scene()
+        if scene is not None and scene.deferDraw(self): return
         self.drawFigures()
 
     def setColor(self, color):
@@ -231,33 +270,33 @@ class Field(QGraphicsRectItem):
         pass
 
     def drawFigures(self):
-        scene = self.scene()
-        fig_count = 0
-
-        if self.text:
-            scene.removeItem(self.text)
-            self.text = None
-
+        center = self.boundingRect().center()
+        fig_radius = 0.5 * self.fig_diameter
         for fig in self.figures:
-            fig_count += 1
-            scene.removeItem(fig)
-            center = self.boundingRect().center()
-            fig.setDiameter(24.0)
-            fig_radius = 0.5 * fig.getDiameter()
-            top_left = center - QPointF(fig_radius, fig_radius)
-            fig.setPos(top_left)
-            scene.addItem(fig)
-
-        if fig_count > 1:
-            self.text = QGraphicsTextItem()
-            fig = self.figures[0]
-            fig_radius = 0.5 * fig.getDiameter()
-            center = self.boundingRect().center()
-            top_left = center - QPointF(fig_radius*0.65, fig_radius*0.85)
-            self.text.setPos(top_left)
-            self.text.setFont(QFont("Times", 15, QFont.Bold))
-            self.text.setPlainText(str(fig_count))
-            scene.addItem(self.text)
+            fig.setDiameter(self.fig_diameter)
+            fig.setPos(center - QPointF(fig_radius, fig_radius))
+
+        offset = self.text_offset * fig_radius
+        self.text = self.drawCount(self.text, len(self.figures), center - offset, self.text_size)
+
+    def drawCount(self, text, count, top_left, size):
+        """
+        Show count at top_left in the label text, which is created on first
+        use and only hidden afterwards. Returns the label.
+        """
+        if count < 2:
+            if text: text.setVisible(False)
+            return text
+
+        if text is None:
+            text = QGraphicsTextItem()
+            text.setFont(QFont("Times", size, QFont.Bold))
+            text.setZValue(1.0)
+            self.scene().addItem(text)
+        text.setPos(top_left)
+        if text.toPlainText() != str(count): text.setPlainText(str(count))
+        text.setVisible(True)
+        return text
 
     def setIndex(self, index):
         self.index = index
@@ -269,6 +308,8 @@ class Field(QGraphicsRectItem):
         return self.is_special
 
 class StartField(Field):
+    zone = engine.HOME_ZONE
+
     def __init__(self, rect, parent=None):
         super().__init__(rect.x()+1.0, rect.y()+1.0, rect.width()-2.0, rect.height()-2.0, parent)
         self.setVisible(False)
@@ -278,75 +319,45 @@ class SpecialField(Field):
     def __init__(self, rect, parent=None):
         super().__init__(rect.x()+1.0, rect.y()+1.0, rect.width()-2.0, rect.height()-2.0, parent)
         self.name = "Start"
-        self.color_counts = [0, 0, 0, 0]
         self.num_fig_colors = 0
         self.texts = [None, None, None, None]
-        self.colors =[QColor(205, 92, 92), QColor(85, 107, 47), QColor(218, 165, 32), QColor(0, 191, 255)]
         self.is_special = True
         self.setBrush(QBrush(Qt.lightGray))
         self.shifts = [QPointF(-10.0, -10.0), QPointF(10.0, -10.0), QPointF(10.0, 10.0), QPointF(-10.0, 10.0)]
 
     def addFigure(self, fig):
-        color = fig.getColor()
-        index = self.colors.index(color)
-        if self.color_counts[index] == 0: self.num_fig_colors += 1
-        self.color_counts[index] += 1
+        if self.counts[fig.getColorId()] == 0: self.num_fig_colors += 1
         super().addFigure(fig)
 
     def removeFigure(self, fig):
-        color = fig.getColor()
-        index = self.colors.index(color)
-        if self.color_counts[index] == 1: self.num_fig_colors -= 1
-        self.color_counts[index] -= 1
+        if self.counts[fig.getColorId()] == 1: self.num_fig_colors -= 1
         super().removeFigure(fig)
 
     def drawFigures(self):
-        scene = self.scene()
-        if self.text:
-            scene.removeItem(self.text)
-            self.text = None
-
-        for text in self.texts:
-            if text:
-                scene.removeItem(text)
-                text = None
-
-        if self.num_fig_colors == 1:
-            color = self.figures[0].getColor()
-            index = self.colors.index(color)
-            self.text = self.texts[index]
+        if self.num_fig_colors < 2:
+            for text in self.texts:
+                if text: text.setVisible(False)
             super().drawFigures()
             return
 
+        if self.text: self.text.setVisible(False)
+        center = self.boundingRect().center()
+        fig_radius = 8.0
         for fig in self.figures:
-            color = fig.getColor()
-            index = self.colors.index(color)
-            center = self.boundingRect().center()
-            center = self.get_new_center(center, index)
-            fig.setDiameter(16.0)
-            fig_radius = 0.5 * fig.getDiameter()
-            top_left = center - QPointF(fig_radius, fig_radius)
-            fig.setPos(top_left)
-            scene.addItem(fig)
+            fig.setDiameter(2.0 * fig_radius)
+            fig.setPos(self.get_new_center(center, fig.getColorId()) - QPointF(fig_radius, fig_radius))
 
+        offset = QPointF(fig_radius*0.90, fig_radius*1.10)
         for index in range(4):
-            count = self.color_counts[index]
-            if count > 1:
-                text = QGraphicsTextItem()
-                center = self.boundingRect().center()
-                center = self.get_new_center(center, index)
-                fig_radius = 0.5 * fig.getDiameter()
-                top_left = center - QPointF(fig_radius*0.90, fig_radius*1.10)
-                text.setPos(top_left)
-                text.setFont(QFont("Times", 12, QFont.Bold))
-                text.setPlainText(str(count))
-                scene.addItem(text)
-                self.texts[index] = text
+            top_left = self.get_new_center(center, index) - offset
+            self.texts[index] = self.drawCount(self.texts[index], self.counts[index], top_left, 12)
 
     def get_new_center(self, center, index):
         return center+self.shifts[index]
 
 class SafeField(Field):
+    zone = engine.LANE_ZONE
+
     def __init__(self, x, y, w, h, parent=None):
         super().__init__(x, y, w, h, parent)
         self.color = QColor()
@@ -377,41 +388,17 @@ class LastField(Field):
         return self.next_field
 
 class EndField(Field):
+    zone = engine.END_ZONE
+    fig_diameter = 18.0
+    text_size = 13
+    text_offset = QPointF(0.85, 1.0)
+
     def __init__(self, x, y, w, h, parent=None):
         super().__init__(x, y, w, h, parent)
         self.setVisible(False)
         self.is_special = True
         self.name = "End"
 
-    def drawFigures(self):
-        scene = self.scene()
-
-        fig_count = 0
-        if self.text:
-            scene.removeItem(self.text)
-            self.text = None
-
-        for fig in self.figures:
-            fig_count += 1
-            scene.removeItem(fig)
-            center = self.boundingRect().center()
-            fig.setDiameter(18.0)
-            fig_radius = 0.5 * fig.getDiameter()
-            top_left = center - QPointF(fig_radius, fig_radius)
-            fig.setPos(top_left)
-            scene.addItem(fig)
-
-        if fig_count > 1:
-            self.text = QGraphicsTextItem()
-            fig = self.figures[0]
-            fig_radius = 0.5 * fig.getDiameter()
-            center = self.boundingRect().center()
-            top_left = center - QPointF(fig_radius*0.85, fig_radius)
-            self.text.setPos(top_left)
-            self.text.setFont(QFont("Times", 13, QFont.Bold))
-            self.text.setPlainText(str(fig_count))
-            scene.addItem(self.text)
-
 class HomeField(QObject):
     def __init__(self, x, y, rotation, color, scene, parent=None):
         super().__init__(parent)
@@ -495,14 +482,14 @@ class PlayerIcon(QWidget):
         painter.drawEllipse(self.rect().adjusted(1, 1, -1, -1))
 
 class PlayerOption(QWidget):
-    def __init__(self, color):
+    def __init__(self, color, strategies):
         super().__init__()
 
         self.icon = PlayerIcon(color)
         self.computer_option = QRadioButton("Computer")
         self.human_option = QRadioButton("Human")
         self.player_name = QLineEdit()
-        self.spacer = OnDemandSpacer()
+        self.strategy = QComboBox()
         self.h_layout = QHBoxLayout()
 
         self.computer_option.setChecked(True)
@@ -513,23 +500,28 @@ class PlayerOption(QWidget):
         self.player_name.setVisible(False)
         self.player_name.setFixedWidth(180)
 
-        self.spacer.setVisible(True)
-        self.spacer.setFixedWidth(180)
+        self.strategy.addItems(strategies)
+        self.strategy.setCurrentText("expectiminimax")
+        self.strategy.setVisible(True)
+        self.strategy.setFixedWidth(180)
 
         self.h_layout.addWidget(self.icon)
         self.h_layout.addWidget(self.computer_option)
         self.h_layout.addWidget(self.human_option)
         self.h_layout.addWidget(self.player_name)
-        self.h_layout.addWidget(self.spacer)
+        self.h_layout.addWidget(self.strategy)
 
         self.human_option.toggled.connect(self.player_name.setVisible)
-        self.human_option.toggled.connect(self.spacer.setHidden)
+        self.human_option.toggled.connect(self.strategy.setHidden)
 
         self.setLayout(self.h_layout)
 
     def getPlayerName(self):
         return self.player_name
 
+    def getStrategy(self):
+        return self.strategy.currentText()
+
     def getComputerOption(self):
         return self.computer_option
 
@@ -538,23 +530,25 @@ class PlayerOption(QWidget):
 
 
 class NewGameDialog(QDialog):
-    trigger = pyqtSignal(list)
-    def __init__(self, title):
+    trigger = pyqtSignal(list, bool)
+    def __init__(self, title, strategies):
         super().__init__()
 
         self.ok_button = QPushButton("Start Demo")
         self.ok_button.setEnabled(True)
         self.ok_button.setDefault(True)
         self.cancel_button = QPushButton("Cancel")
+        self.turbo_option = QCheckBox("Turbo")
+        self.turbo_option.setToolTip("Play the demo without animations and delays")
         self.spacer = OnDemandSpacer()
         self.h_layout_button = QHBoxLayout()
         self.buttons = QWidget()
 
         self.player_list = []
-        self.player_list.append(PlayerOption(QColor(205, 92, 92)))
-        self.player_list.append(PlayerOption(QColor(85, 107, 47)))
-        self.player_list.append(PlayerOption(QColor(218, 165, 32)))
-        self.player_list.append(PlayerOption(QColor(0, 191, 255)))
+        self.player_list.append(PlayerOption(QColor(205, 92, 92), strategies))
+        self.player_list.append(PlayerOption(QColor(85, 107, 47), strategies))
+        self.player_list.append(PlayerOption(QColor(218, 165, 32), strategies))
+        self.player_list.append(PlayerOption(QColor(0, 191, 255), strategies))
 
         self.v_layout = QVBoxLayout()
         self.v_layout.addWidget(self.buttons)
@@ -562,6 +556,7 @@ class NewGameDialog(QDialog):
         for player in self.player_list:
             self.v_layout.addWidget(player)
 
+        self.h_layout_button.addWidget(self.turbo_option)
         self.h_layout_button.addWidget(self.spacer)
         self.h_layout_button.addWidget(self.ok_button)
         self.h_layout_button.addWidget(self.cancel_button)
@@ -606,12 +601,15 @@ class NewGameDialog(QDialog):
         if any_human: button_title = "Start Game"
         self.ok_button.setText(button_title)
         self.ok_button.setEnabled(ok)
+        if any_human: self.turbo_option.setChecked(False)
+        self.turbo_option.setEnabled(not any_human)
 
     def savePlayerData(self):
         player_data = []
         for player in self.player_list:
             is_human = player.getHumanOption().isChecked()
             name = player.getPlayerName().text() if is_human else ""
-            player_data.append((is_human, name))
+            strategy = player.getStrategy()
+            player_data.append((is_human, name, strategy))
         self.accept()
-        self.trigger.emit(player_data)
+        self.trigger.emit(player_data, self.turbo_option.isChecked())
@@ -14,20 +14,132 @@ Last edited: August 2017
 """
 
 import sys
+import argparse
+from startup import StartupProfile
+
+profile = StartupProfile()
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
-from PyQt5.QtCore import QPointF, QTime, QCoreApplication, QEventLoop
+from PyQt5.QtCore import QPointF, QObject, QTimer, QThreadPool, pyqtSignal
+profile.mark("import PyQt5")
+import resources
+profile.mark("import resources")
 from gui import NewGameDialog, Figure, DiceWidget
-from player import Player
+profile.mark("import gui")
 from board import Board
-import resources
+profile.mark("import board")
+from player import Player, ComputerPlayer
+from strategy import STRATEGIES
+import engine
+profile.mark("import player")
+
+# dice buttons created up front, more are added when a turn has more pending dice
+DICE_BUTTONS = 3
+
+class TurnScheduler(QObject):
+    """
+    Runs the next step of a turn from the event loop once its delay has
+    passed, so that roll, animation, choice and move never nest inside
+    each other's signal handlers. Only one step is pending at a time: a
+    step scheduled while another one waits is refused, so that nothing
+    replaces a pending roll.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.action = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.fire)
+
+    def isPending(self):
+        return self.action is not None
+
+    def schedule(self, action, delay_ms=0):
+        if self.isPending():
+            print("step {} refused, {} is pending".format(action.__name__, self.action.__name__))
+            return False
+        self.action = action
+        self.timer.start(delay_ms)
+        return True
+
+    def cancel(self):
+        self.timer.stop()
+        self.action = None
+
+    def fire(self):
+        action = self.action
+        self.action = None
+        if action: action()
+
+
+class TurnDispatcher(QObject):
+    """
+    Routes dice rolls to the active player, and dice choices and figure
+    clicks to it only while it is a human player. The dice, the figures and
+    the group of dice buttons are connected to it once, so the number of
+    connections does not depend on the number of players or dice buttons
+    and changing turns is a plain assignment.
+
+    While a roll is pending (scheduled or animating) dice choices and figure
+    clicks are ignored, the roll belongs to the current turn.
+    """
+    dice_chosen = pyqtSignal(list)
+    rolling_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.player = None
+        self.rolling = False
+        self.dice_buttons = QButtonGroup(self)
+        self.dice_buttons.buttonClicked[int].connect(self.chooseDice)
+
+    def setPlayer(self, player):
+        self.player = player
+
+    def getPlayer(self):
+        return self.player
+
+    def setRolling(self, rolling):
+        if rolling == self.rolling: return
+        self.rolling = rolling
+        self.rolling_changed.emit(rolling)
+
+    def isRolling(self):
+        return self.rolling
+
+    def addDiceButton(self, button):
+        button.setCheckable(True)
+        self.dice_buttons.addButton(button)
+
+    def setDiceValue(self, button, dice):
+        self.dice_buttons.setId(button, dice)
+
+    def clearDiceChoice(self):
+        if self.dice_buttons.checkedButton() is None: return
+        self.dice_buttons.setExclusive(False)
+        self.dice_buttons.checkedButton().setChecked(False)
+        self.dice_buttons.setExclusive(True)
+
+    def diceRolled(self, dice):
+        self.setRolling(False)
+        if self.player: self.player.setDice(dice)
+
+    def chooseDice(self, dice):
+        if not self.player or not self.player.isHuman() or self.rolling: return
+        self.player.setCurrentDice((dice, None))
+        self.dice_chosen.emit([dice, None])
+
+    def figureClicked(self, figure):
+        if not self.player or not self.player.isHuman() or self.rolling: return
+        if self.player.hasFigure(figure): self.player.move(figure)
+
 
 class Ludo(QMainWindow):
 
     def __init__(self):
         super().__init__()
 
-        icon = QIcon(":/images/game")
+        icon = resources.icon(":/images/game")
         self.setWindowIcon(icon)
 
         self.colors = {}
@@ -36,20 +148,22 @@ class Ludo(QMainWindow):
         self.colors['YELLOW'] = QColor(218, 165, 32)
         self.colors['BLUE'] = QColor(0, 191, 255)
 
+        profile.mark("main window")
         self.board = Board()
+        profile.mark("Board()")
         self.setCentralWidget(self.board)
         self.setFixedSize(635, 720)
 
         menu = self.menuBar().addMenu("&Game")
         self.toolbar = self.addToolBar("Game")
         self.toolbar.setMovable(False)
-        icon = QIcon(":/images/icon")
+        icon = resources.icon(":/images/icon")
         self.new_game_action = QAction(icon, "&New Game", self)
         self.new_game_action.setShortcuts(QKeySequence.New)
         self.new_game_action.setStatusTip("Start a New Game")
         self.new_game_action.triggered.connect(self.start_game)
 
-        icon = QIcon(":/images/reset")
+        icon = resources.icon(":/images/reset")
         self.reset_action = QAction(icon, "&Reset Game", self)
         self.reset_action.setShortcuts(QKeySequence.SelectEndOfDocument)
         self.reset_action.setStatusTip("Reset Game")
@@ -61,8 +175,15 @@ class Ludo(QMainWindow):
         menu.addAction(self.reset_action)
         self.toolbar.addAction(self.reset_action)
 
+        self.turbo_action = QAction("&Turbo", self)
+        self.turbo_action.setCheckable(True)
+        self.turbo_action.setEnabled(False)
+        self.turbo_action.setStatusTip("Play computer games without animations and delays")
+        self.turbo_action.toggled.connect(self.setTurbo)
+        menu.addAction(self.turbo_action)
+
         menu.addSeparator()
-        exit_icon = QIcon(":/images/exit")
+        exit_icon = resources.icon(":/images/exit")
         exit_action = QAction(exit_icon, "&Exit", self)
         exit_action.triggered.connect(self.close)
         exit_action.setShortcuts(QKeySequence.Quit)
@@ -82,21 +203,40 @@ class Ludo(QMainWindow):
 
         self.status_label = QLabel("Ready")
         self.statusBar().addPermanentWidget(self.status_label)
-        self.right_spacer = None
-        self.dice_widgets = []
+        self.scheduler = TurnScheduler(self)
+        self.dispatcher = TurnDispatcher(self)
+        self.dispatcher.dice_chosen.connect(self.activatePlayerFigures)
+        self.dispatcher.rolling_changed.connect(self.enableDiceButtons)
 
+        self.right_spacer = QWidget()
+        self.right_spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.spacer_action = self.toolbar.addWidget(self.right_spacer)
+        self.spacer_action.setVisible(False)
+        self.dice_widgets = []
+        self.dice_actions = []
+        for _ in range(DICE_BUTTONS):
+            self.addDiceButton()
+        self.seat_players = [{} for _ in range(4)]
+        self.roll_delay = 1000
+        self.turbo_fps = 10
+
+        profile.mark("menus and toolbar")
         self.add_figures()
+        profile.mark("add_figures")
 
         self.dice = DiceWidget()
+        profile.mark("DiceWidget")
         dice_pos = self.board.getDiceBox().boundingRect().topLeft()
         dice_pos -= QPointF(10, 10)
         self.dice.setPos(dice_pos)
         self.board.getScene().addItem(self.dice)
 
         self.dice.c.dice_rolled.connect(self.updateStatusMessage)
+        self.dice.c.dice_rolled.connect(self.dispatcher.diceRolled)
 
         self.setWindowTitle('Ludo')
         self.show()
+        profile.mark("show")
 
     def add_figures(self):
         self.figures = []
@@ -105,6 +245,7 @@ class Ludo(QMainWindow):
         for index in range(4):
             figures = []
             start_fields = self.board.getStartField(index)
+            move_table = self.board.getMoveTable(index)
 
             for start_field in start_fields:
                 figure = Figure(24.0)
@@ -112,153 +253,186 @@ class Ludo(QMainWindow):
                 figure.setPosition(start_field)
                 figure.setStartPosition(start_field)
                 figure.setColor(self.colors[colors[index]])
+                figure.setColorId(index)
+                figure.setMoveTable(move_table)
+                figure.setHilight(self.board.getHilight())
+                figure.c.clicked.connect(self.dispatcher.figureClicked)
                 figures.append(figure)
 
             self.figures.append(figures)
 
     def start_game(self):
-        dialog = NewGameDialog("Choose Players...")
+        dialog = NewGameDialog("Choose Players...", list(STRATEGIES))
         dialog.trigger.connect(self.start)
         dialog.exec()
         del dialog
 
+    def setTurbo(self, enabled):
+        self.roll_delay = 0 if enabled else 1000
+        self.dice.setAnimated(not enabled)
+        self.board.setRedrawRate(self.turbo_fps if enabled else None)
+
     def reset(self):
+        self.scheduler.cancel()
+        self.dispatcher.setPlayer(None)
+        self.dispatcher.setRolling(False)
+        self.removeCurrentDiceWidget()
+        self.turbo_action.setChecked(False)
+        self.turbo_action.setEnabled(False)
         self.new_game_action.setEnabled(True)
         self.status_label.setText("Ready")
         self.reset_action.setEnabled(False)
-        self.dice.setPixmap(self.dice.images[0])
-        self.dice.setEnabled(False)
+        self.dice.stop()
 
         for index, player in enumerate(self.players):
-            player.continue_game.disconnect(self.setCurrentPlayer)
-            player.game_won.disconnect(self.finished)
-            player.roll_dice.disconnect(self.roll_dice)
-            player.enable_player_figures.disconnect(self.activatePlayerFigures)
-            player.three_sixes_message.disconnect(self.threeSixesMessage)
-            player.update_dice_widget.disconnect(self.drawDiceWidget)
-
+            if player: player.reset()
             rect_box = self.board.getHome(index)
             rect_box.getHilightedRect().setVisible(False)
-            start_fields = self.board.getStartField(index)
-            figures = self.figures[index]
-            self.dice.c.dice_rolled.disconnect(player.setDice)
-            for id, start_field in enumerate(start_fields):
-                figure = figures[id]
-                figure.c.clicked.disconnect(player.move)
-
-        l = len(self.players)
-        for _ in range(l):
-            del self.players[0]
-
-        for player in self.players:
-            player = None
-
+            for figure in self.figures[index]:
+                figure.setOwner(None)
         self.players = [None]*4
-        for index in range(4):
-            start_fields = self.board.getStartField(index)
-            figures = self.figures[index]
-            for id, start_field in enumerate(start_fields):
-                figure = figures[id]
-                figure.setPosition(start_field)
 
-    def start(self, player_data):
+        self.board.placeFigures([(figure, figure.getStartPosition())
+                                 for figures in self.figures for figure in figures])
+
+    def closeEvent(self, event):
+        """Stop the computer players and wait for their searches before the window goes away."""
+        self.scheduler.cancel()
+        computers = [seat[False] for seat in self.seat_players if False in seat]
+        for player in computers:
+            player.cancel()
+        QThreadPool.globalInstance().waitForDone()
+        for player in computers:
+            player.shutdown()
+        super().closeEvent(event)
+
+    def getPlayer(self, index, is_human):
+        """
+        Player of one kind for seat index. Players are created and wired to
+        the window once and reused by later games after Player.reset.
+        """
+        player = self.seat_players[index].get(is_human)
+        if player is not None:
+            return player
+
+        color_name = engine.COLORS[index]
+        color = self.colors[color_name]
+        player = Player("", color, color_name, self) if is_human else ComputerPlayer("", color, color_name, parent=self)
+        player.continue_game.connect(self.setCurrentPlayer)
+        player.game_won.connect(self.finished)
+        player.roll_dice.connect(self.roll_dice)
+        if is_human: player.enable_player_figures.connect(self.activatePlayerFigures)
+        player.three_sixes_message.connect(self.threeSixesMessage)
+        player.update_dice_widget.connect(self.drawDiceWidget)
+        if not is_human: player.setAllFigures(self.figures)
+        self.seat_players[index][is_human] = player
+        return player
+
+    def start(self, player_data, turbo=False):
         self.reset_action.setEnabled(True)
         self.new_game_action.setEnabled(False)
         self.status_label.setText("Game Started...")
         self.dice.setEnabled(True)
-        colors = ['RED', 'GREEN', 'YELLOW', 'BLUE']
-
-        for index, (is_human, name) in enumerate(player_data):
-            color_name = colors[index]
-            color = self.colors[color_name]
-            if not is_human: name = "Computer_" + str(index)
-
-            player = Player(name, color, color_name, self) if is_human else Player(name, color, color_name, self)
-            player.continue_game.connect(self.setCurrentPlayer)
-            player.game_won.connect(self.finished)
-            player.roll_dice.connect(self.roll_dice)
-            player.enable_player_figures.connect(self.activatePlayerFigures)
-            player.three_sixes_message.connect(self.threeSixesMessage)
-            player.update_dice_widget.connect(self.drawDiceWidget)
 
-            start_fields = self.board.getStartField(index)
-            figures = self.figures[index]
-            player.setFigures(figures)
-            self.dice.c.dice_rolled.connect(player.setDice)
-            for id, start_field in enumerate(start_fields):
-                figure = figures[id]
-                figure.c.clicked.connect(player.move)
+        for index, (is_human, name, strategy) in enumerate(player_data):
+            player = self.getPlayer(index, is_human)
+            if not is_human:
+                name = "Computer_" + str(index)
+                player.setStrategy(strategy)
+            player.setName(name)
+            player.setFigures(self.figures[index])
             self.players[index] = player
 
+        is_demo = not any(is_human for is_human, _, _ in player_data)
+        self.turbo_action.setEnabled(is_demo)
+        self.turbo_action.setChecked(is_demo and turbo)
+
         self.current_player = self.players[0]
+        self.dispatcher.setPlayer(self.current_player)
         self.showTurn()
         self.current_player.setEnabled(True)
+        self.dispatcher.setRolling(True)
         self.dice.roll()
 
+    def addDiceButton(self):
+        widget = QPushButton()
+        widget.setAutoFillBackground(True)
+        action = self.toolbar.addWidget(widget)
+        action.setVisible(False)
+        self.dispatcher.addDiceButton(widget)
+        self.dice_widgets.append(widget)
+        self.dice_actions.append(action)
+
     def drawDiceWidget(self, dice_list):
-        self.removeCurrentDiceWidget()
-        color = self.current_player.getColor()
-        self.right_spacer = QWidget()
-        self.right_spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.toolbar.addWidget(self.right_spacer)
-        for dice in dice_list:
-            widget = QPushButton(str(dice))
-            pal = widget.palette()
-            pal.setColor(QPalette.Button, color)
-            widget.setAutoFillBackground(true)
-            widget.setPalette(pal)
-            widget.update()
-            self.toolbar.addWidget(widget)
-            for player in self.players:
-                widget.clicked.connect(player.setCurrentDice)
-            widget.clicked.connect(self.activatePlayerFigures)
-            widget.clicked.connect(self.uncheckOtherDiceWidgets)
-            self.dice_widgets.append(widget)
+        """
+        Show the pending dice on the pooled toolbar buttons, growing the pool
+        if needed.
+        """
+        color, _ = self.current_player.getColor()
+        self.dispatcher.clearDiceChoice()
+        while len(self.dice_widgets) < len(dice_list):
+            self.addDiceButton()
+
+        for index, widget in enumerate(self.dice_widgets):
+            action = self.dice_actions[index]
+            if index >= len(dice_list):
+                action.setVisible(False)
+                continue
+            dice = dice_list[index]
+            widget.setText(str(dice))
+            self.dispatcher.setDiceValue(widget, dice)
+            if widget.palette().color(QPalette.Button) != color:
+                pal = widget.palette()
+                pal.setColor(QPalette.Button, color)
+                widget.setPalette(pal)
+            action.setVisible(True)
+        self.spacer_action.setVisible(len(dice_list) > 0)
+        self.enableDiceButtons()
+
+    def enableDiceButtons(self, data=None):
+        """
+        The dice buttons only take clicks on the turn of a human player, and
+        not while a roll is pending.
+        """
+        player = self.dispatcher.getPlayer()
+        enabled = player is not None and player.isHuman() and not self.dispatcher.isRolling()
+        for action in self.dice_actions:
+            action.setEnabled(enabled)
 
     def removeCurrentDiceWidget(self):
-        del self.right_spacer
-        self.right_spacer = None
-        for widget in self.dice_widgets:
-            for player in self.players:
-                widget.clicked.disconnect(player.setCurrentDice)
-            widget.clicked.disconnect(self.activatePlayerFigures)
-            widget.clicked.disconnect(self.uncheckOtherDiceWidgets)
-
-        l = len(self.dice_widgets)
-        for _ in range(l):
-            del self.dice_widgets[0]
-
-        for widget in self.dice_widgets:
-            widget = None
-        self.dice_widgets = []
-
-    def uncheckOtherDiceWidgets(self, data):
-        diceValue, widget = data
-        other_widgets = [w for w in self.dice_widgets if w != widget]
-        for widget in other_widgets:
-            widget.uncheck()
+        self.dispatcher.clearDiceChoice()
+        for action in self.dice_actions:
+            action.setVisible(False)
+        self.spacer_action.setVisible(False)
 
     def activatePlayerFigures(self, data):
         diceValue, _ = data
         print(diceValue)
-        figures = self.current_player.getFigures()
-        is_any_enabled = False
-        for figure in figures:
-            enable = figure.enableIfPossible(diceValue)
-            is_any_enabled = is_any_enabled or enable
+        for figure in self.current_player.getFigures():
+            figure.setEnabled(False)
+
+        legal_moves = self.current_player.legalMoves()
+        for figure, position in legal_moves[diceValue]:
+            figure.setResultPosition(position)
+            figure.setEnabled(True)
+
+        if not any(legal_moves[dice] for dice in set(self.current_player.dice)):
+            self.scheduler.schedule(self.passTurn)
 
-        if not is_any_enabled:
-            self.setCurrentPlayer(False)
+    def passTurn(self):
+        self.setCurrentPlayer(False)
 
     def setCurrentPlayer(self, is_active):
         if not is_active:
             self.current_player.setEnabled(False)
+            self.removeCurrentDiceWidget()
             try:
                 player_id = self.players.index(self.current_player)
             except ValueError:
                 return
             player_id = player_id+1 if player_id != 3 else 0
             self.current_player = self.players[player_id]
+            self.dispatcher.setPlayer(self.current_player)
             self.current_player.setEnabled(True)
             self.roll_dice()
             print(self.current_player.getName())
@@ -270,13 +444,8 @@ class Ludo(QMainWindow):
         print("throwing dice for player {}".format(self.current_player.getName()))
         self.showTurn()
         self.dice.resetDice()
-        self.delay(1.0)
-        self.dice.roll()
-
-    def delay(self, time_in_sec=1.0):
-        dice_time = QTime.currentTime().addSecs(time_in_sec)
-        while QTime.currentTime() < dice_time:
-            QCoreApplication.processEvents(QEventLoop.AllEvents, 100)
+        self.dispatcher.setRolling(True)
+        self.scheduler.schedule(self.dice.roll, self.roll_delay)
 
     def showTurn(self):
         for idx in range(4):
@@ -305,7 +474,7 @@ class Ludo(QMainWindow):
         index = colors.index(color_name)
         msg = "{0} ({1}) You Got 3 consecutive 6s! Sorry, you need to roll the dice agian."
         msg = msg.format(self.current_player.getName(), color_name)
-        self.statusBar().setText(msg)
+        self.statusBar().showMessage(msg)
         self.status_label.setText("")
 
     def finished(self):
@@ -315,6 +484,7 @@ class Ludo(QMainWindow):
         msg = "Player: {0} ({1}) WON!!!".format(self.current_player.getName(), color_name)
         self.statusBar().showMessage(msg)
         self.status_label.setText("")
+        self.board.redraw()
 
     def how_to_play(self):
         QMessageBox.about(self, "How to Play LUDO",
@@ -343,8 +513,46 @@ class Ludo(QMainWindow):
                 "&copy; by Sadanand Singh 2018-19")
 
 
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Ludo in PyQt5")
+    parser.add_argument("--tournament", nargs="*", metavar="STRATEGY",
+                        help="play computer strategies against each other without the GUI")
+    parser.add_argument("--games", type=int, default=1000,
+                        help="number of tournament games (default: 1000)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed of the tournament dice streams")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print the wall time of every startup phase up to the first paint and exit")
+    args, qt_args = parser.parse_known_args(argv)
+
+    if args.tournament is not None:
+        from tournament import checkLineup
+        args.tournament = args.tournament or ['greedy', 'random']
+        try:
+            checkLineup(args.tournament)
+        except ValueError as error:
+            parser.error(str(error))
+    return args, qt_args
+
+
 if __name__ == '__main__':
 
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.tournament is not None:
+        from tournament import runTournament
+        runTournament(args.tournament, args.games, args.workers, args.seed)
+        sys.exit(0)
+
+    profile.mark("parse arguments")
+    app = QApplication(sys.argv[:1] + qt_args)
+    profile.mark("QApplication")
     ex = Ludo()
+    if args.profile_startup:
+        app.processEvents()
+        ex.board.view.viewport().repaint()
+        profile.mark("first paint")
+        print(profile.report())
+        sys.exit(0)
     sys.exit(app.exec_())
\ No newline at end of file
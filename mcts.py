@@ -0,0 +1,168 @@
+"""
+Monte Carlo Tree Search for computer players
+
+Playouts use the headless engine with random moves until the first player
+has won. Dice rolls are chance nodes whose children are sampled uniformly.
+The root is parallelized: every worker process grows its own tree from the
+same position and the visit statistics of the root moves are merged before
+the move with the most visits is played.
+"""
+
+import math
+import os
+import random
+import time
+
+from search import SearchCancelled
+
+EXPLORATION = 1.4
+MAX_PLAYOUT_MOVES = 2000
+
+# seconds between two looks at the cancel event while the workers search
+CANCEL_POLL = 0.05
+
+
+class Node:
+    def __init__(self, game, mover=None):
+        self.mover = mover
+        self.visits = 0
+        self.wins = 0.0
+        self.children = {}
+        self.untried = None if game.isRolling() else game.legalMoves()
+
+    def select(self):
+        log_visits = math.log(self.visits)
+        best, best_value = None, None
+        for move, child in self.children.items():
+            value = child.wins / child.visits + EXPLORATION * math.sqrt(log_visits / child.visits)
+            if best_value is None or value > best_value:
+                best, best_value = move, value
+        return best
+
+
+def playout(game, rng):
+    for _ in range(MAX_PLAYOUT_MOVES):
+        if game.winners:
+            return game.winners[0]
+        if game.isRolling():
+            game.setDice(rng.randint(1, 6))
+        else:
+            game.move(*rng.choice(game.legalMoves()))
+    return None
+
+
+def searchTree(game, iterations=None, time_limit=None, seed=None, cancel=None):
+    """
+    Grow one tree from game. Returns {move: (visits, wins)} for the root
+    moves, wins counted for the player to move at the root. Raises
+    SearchCancelled once the threading.Event cancel is set.
+    """
+    rng = random.Random(seed)
+    root = Node(game)
+    deadline = time.perf_counter() + time_limit if time_limit else None
+    count = 0
+
+    while True:
+        if iterations is not None and count >= iterations:
+            break
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if cancel is not None and cancel.is_set():
+            raise SearchCancelled()
+        count += 1
+
+        node = root
+        state = game.copy()
+        path = [node]
+
+        while not state.winners:
+            if state.isRolling():
+                dice = rng.randint(1, 6)
+                state.setDice(dice)
+                key = ('dice', dice)
+                if key not in node.children:
+                    node.children[key] = Node(state)
+                node = node.children[key]
+            elif node.untried:
+                move = node.untried.pop(rng.randrange(len(node.untried)))
+                mover = state.getCurrentPlayer()
+                state.move(*move)
+                child = Node(state, mover)
+                node.children[move] = child
+                path.append(child)
+                break
+            else:
+                move = node.select()
+                state.move(*move)
+                node = node.children[move]
+            path.append(node)
+
+        winner = playout(state, rng)
+        for node in path:
+            node.visits += 1
+            if node.mover is not None and node.mover == winner:
+                node.wins += 1.0
+
+    return {move: (child.visits, child.wins) for move, child in root.children.items()}
+
+
+class MCTS:
+    """
+    Strategy running root-parallel MCTS with a budget per move: iterations
+    split over the workers if given, time_limit seconds otherwise.
+    """
+
+    def __init__(self, iterations=None, time_limit=1.0, workers=None):
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.workers = workers or os.cpu_count()
+        self.executor = None
+        self.rng = random.Random()
+
+    def __call__(self, game, moves, cancel=None):
+        if len(moves) == 1:
+            return moves[0]
+        stats = self.search(game, cancel)
+        return max(moves, key=lambda move: stats.get(move, (0, 0.0))[0])
+
+    def search(self, game, cancel=None):
+        root = game.copy()
+        root.rng = None
+        iterations, time_limit = None, self.time_limit
+        if self.iterations is not None:
+            iterations, time_limit = max(1, self.iterations // self.workers), None
+        seeds = [self.rng.getrandbits(64) for _ in range(self.workers)]
+
+        if self.workers == 1:
+            results = [searchTree(root, iterations, time_limit, seeds[0], cancel)]
+        else:
+            # imported here, multiprocessing is a large share of the GUI startup time
+            from concurrent.futures import ProcessPoolExecutor, wait
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            if cancel is not None and cancel.is_set():
+                raise SearchCancelled()
+            futures = [self.executor.submit(searchTree, root, iterations, time_limit, seed)
+                       for seed in seeds]
+            # the event cannot reach the worker processes: stop waiting for them instead
+            pending = futures
+            while pending:
+                if cancel is not None and cancel.is_set():
+                    for future in pending:
+                        future.cancel()
+                    raise SearchCancelled()
+                _, pending = wait(pending, timeout=CANCEL_POLL)
+            results = [future.result() for future in futures]
+
+        stats = {}
+        for result in results:
+            for move, (visits, wins) in result.items():
+                total_visits, total_wins = stats.get(move, (0, 0.0))
+                stats[move] = (total_visits + visits, total_wins + wins)
+        return stats
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes; a later search starts new ones."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
@@ -0,0 +1,221 @@
+#!/usr/local/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Perft for Ludo move generation
+
+Counts every position reachable from a start position within a number of
+plies, where a ply is either a dice roll (all six outcomes) or a move (all
+legal moves). The count is reported for the headless engine and for the
+Qt board model (Figure.enableIfPossible/findResultPosition on a real
+scene), together with nodes per second. Both must give the same numbers;
+a difference means the two move generators disagree.
+"""
+
+import argparse
+import sys
+import time
+
+import engine
+
+
+def perft(game, depth):
+    """Number of leaf positions depth plies below game."""
+    if depth == 0 or game.isOver():
+        return 1
+    nodes = 0
+    if game.isRolling():
+        for dice in range(1, 7):
+            child = game.copy()
+            child.setDice(dice)
+            nodes += perft(child, depth - 1)
+    else:
+        for move in game.legalMoves():
+            child = game.copy()
+            child.move(*move)
+            nodes += perft(child, depth - 1)
+    return nodes
+
+
+class BoardPosition:
+    """
+    Turn state of engine.Game on top of the figures of a Ludo window. Moves
+    are generated with Figure.enableIfPossible, applied with setPosition
+    and moveToHome and undone again after the recursion.
+    """
+
+    def __init__(self, ludo, game):
+        self.figures = ludo.figures
+        self.squares = ludo.board.fields + ludo.board.end_fields
+        self.starts = [ludo.board.getStartField(color) for color in range(engine.NUM_PLAYERS)]
+        self.current = game.getCurrentPlayer()
+        self.dice = list(game.getDice())
+        self.rolling = game.isRolling()
+        self.winners = list(game.winners)
+
+        for color, figs in enumerate(self.figures):
+            for id, figure in enumerate(figs):
+                progress = game.getFigures(color)[id]
+                if progress == engine.HOME:
+                    figure.setPosition(self.starts[color][id])
+                else:
+                    figure.setPosition(self.squares[engine.PATHS[color][progress]])
+
+    def state(self):
+        return self.current, list(self.dice), self.rolling, list(self.winners)
+
+    def restore(self, state):
+        self.current, dice, self.rolling, winners = state
+        self.dice = list(dice)
+        self.winners = list(winners)
+
+    def isOver(self):
+        return len(self.winners) >= engine.NUM_PLAYERS - 1
+
+    def hasWon(self, color):
+        for figure in self.figures[color]:
+            if figure.getPosition().zone != engine.END_ZONE:
+                return False
+        return True
+
+    def legalMoves(self):
+        moves = []
+        for dice in sorted(set(self.dice)):
+            for figure in self.figures[self.current]:
+                if figure.enableIfPossible(dice):
+                    figure.setEnabled(False)
+                    moves.append((figure, figure.getResultPosition(), dice))
+        return moves
+
+    def nextPlayer(self):
+        self.dice = []
+        self.rolling = True
+        if self.isOver():
+            return
+        color = self.current
+        while True:
+            color = color + 1 if color != engine.NUM_PLAYERS - 1 else 0
+            if color not in self.winners:
+                break
+        self.current = color
+
+    def setDice(self, dice):
+        self.dice.append(dice)
+        if dice == 6:
+            if len(self.dice) > 2 and all(x == 6 for x in self.dice[-3:]):
+                self.dice = self.dice[:-3]
+            return
+        self.rolling = False
+        if not self.legalMoves():
+            self.nextPlayer()
+
+    def move(self, figure, position, dice):
+        """Apply a move and return what undo() needs to take it back."""
+        victims = []
+        if not position.isSpecial() and position.hasOpponent(self.current):
+            victims = [(fig, fig.getPosition()) for fig in position.getFigures()]
+        start = figure.getPosition()
+
+        for fig, _ in victims:
+            fig.moveToHome()
+        figure.setPosition(position)
+
+        self.dice.remove(dice)
+        if self.hasWon(self.current):
+            self.winners.append(self.current)
+            self.nextPlayer()
+        elif victims or position.zone == engine.END_ZONE:
+            self.rolling = True
+        elif not self.dice or not self.legalMoves():
+            self.nextPlayer()
+        return figure, start, victims
+
+    def undo(self, undo):
+        figure, start, victims = undo
+        figure.setPosition(start)
+        for fig, position in victims:
+            fig.setPosition(position)
+
+
+def boardPerft(position, depth):
+    if depth == 0 or position.isOver():
+        return 1
+    nodes = 0
+    state = position.state()
+    if position.rolling:
+        for dice in range(1, 7):
+            position.setDice(dice)
+            nodes += boardPerft(position, depth - 1)
+            position.restore(state)
+    else:
+        for figure, result, dice in position.legalMoves():
+            undo = position.move(figure, result, dice)
+            nodes += boardPerft(position, depth - 1)
+            position.undo(undo)
+            position.restore(state)
+    return nodes
+
+
+def startPosition(seed, plies):
+    """Position after plies random plies of a game with the given seed."""
+    game = engine.Game(seed)
+    for _ in range(plies):
+        if game.isOver():
+            break
+        if game.isRolling():
+            game.rollDice()
+        else:
+            game.move(*game.rng.choice(game.legalMoves()))
+    return game
+
+
+def report(name, depth, nodes, elapsed):
+    rate = nodes / elapsed if elapsed > 0 else float('inf')
+    print("{:<8}depth {:>2}  nodes {:>12}  {:>8.3f}s  {:>12.0f} nodes/s".format(name, depth, nodes, elapsed, rate))
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Perft node counts for Ludo move generation")
+    parser.add_argument("--depth", type=int, default=4, help="maximum depth in plies (default: 4)")
+    parser.add_argument("--position", default=None,
+                        help="start position as hex of Game.encode() (default: a random midgame)")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the random midgame (default: 1)")
+    parser.add_argument("--plies", type=int, default=120, help="plies played for the random midgame (default: 120)")
+    parser.add_argument("--no-gui", action="store_true", help="only run the headless engine")
+    args = parser.parse_args(argv)
+
+    if args.position:
+        game = engine.decode(int(args.position, 16))
+    else:
+        game = startPosition(args.seed, args.plies)
+    print("position {:032x}".format(game.encode()))
+
+    counts = []
+    for depth in range(1, args.depth + 1):
+        start = time.perf_counter()
+        nodes = perft(game, depth)
+        report("engine", depth, nodes, time.perf_counter() - start)
+        counts.append(nodes)
+
+    if args.no_gui:
+        return 0
+
+    from PyQt5.QtWidgets import QApplication
+    from ludo import Ludo
+
+    app = QApplication(sys.argv[:1])
+    ludo = Ludo()
+    position = BoardPosition(ludo, game)
+    mismatch = False
+    for depth in range(1, args.depth + 1):
+        start = time.perf_counter()
+        nodes = boardPerft(position, depth)
+        report("board", depth, nodes, time.perf_counter() - start)
+        if nodes != counts[depth - 1]:
+            print("MISMATCH at depth {}: engine {} board {}".format(depth, counts[depth - 1], nodes))
+            mismatch = True
+    return 1 if mismatch else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
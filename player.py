@@ -2,6 +2,10 @@ from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
 from gui import *
+import threading
+import engine
+from strategy import getStrategy
+from search import SearchCancelled
 
 class Player(QObject):
     update_dice_widget = pyqtSignal(list)
@@ -16,15 +20,51 @@ class Player(QObject):
         self.name = name
         self.color = color
         self.color_name = color_name
+        self.color_id = engine.COLORS.index(color_name)
         self.is_active = False
         self.current_dice = -1
         self.figures = []
         self.dice = []
+        self.zone_counts = [0, 0, 0, 0]
+        self.move_cache = None
 
     def hasWon(self):
-        for fig in self.figures:
-            if not isinstance(fig.getPosition(), EndField):
-                return False
+        return self.zone_counts[engine.END_ZONE] == len(self.figures)
+
+    def countAtHome(self):
+        return self.zone_counts[engine.HOME_ZONE]
+
+    def countOnRing(self):
+        return self.zone_counts[engine.RING_ZONE]
+
+    def countInLane(self):
+        return self.zone_counts[engine.LANE_ZONE]
+
+    def countFinished(self):
+        return self.zone_counts[engine.END_ZONE]
+
+    def figureMoved(self, old_position, new_position):
+        if old_position: self.zone_counts[old_position.zone] -= 1
+        self.zone_counts[new_position.zone] += 1
+        self.move_cache = None
+
+    def legalMoves(self):
+        """
+        (figure, result position) pairs for every dice value 1..6, computed in
+        one pass with the rules of Figure.enableIfPossible. Only the player's
+        own figures can block a move, so the result stays valid until one of
+        them moves.
+        """
+        if self.move_cache is None:
+            self.move_cache = [[] for _ in range(7)]
+            for fig in self.figures:
+                for dice in range(1, 7):
+                    position = fig.legalResultPosition(dice)
+                    if position is not None:
+                        self.move_cache[dice].append((fig, position))
+        return self.move_cache
+
+    def isHuman(self):
         return True
 
     def hasFigure(self, figure):
@@ -34,6 +74,11 @@ class Player(QObject):
 
     def setFigures(self, figs):
         self.figures = [fig for fig in figs]
+        self.move_cache = None
+        self.zone_counts = [0, 0, 0, 0]
+        for fig in self.figures:
+            fig.setOwner(self)
+            self.zone_counts[fig.getPosition().zone] += 1
 
     def getFigures(self):
         return self.figures
@@ -44,6 +89,16 @@ class Player(QObject):
     def getName(self):
         return self.name
 
+    def setName(self, name):
+        self.name = name
+
+    def reset(self):
+        """Forget the turn state so that the player can be reused for a new game."""
+        self.is_active = False
+        self.current_dice = -1
+        self.dice = []
+        self.move_cache = None
+
     def setCurrentDice(self, data):
         dice, _ = data
         if not self.is_active: return
@@ -62,10 +117,12 @@ class Player(QObject):
             self.update_dice_widget.emit(self.dice)
             self.roll_dice.emit()
             return
+        self.current_dice = dice
         self.enable_player_figures.emit([dice, None])
 
     def setEnabled(self, enable):
         self.is_active = enable
+        if not enable: self.dice = []
 
     def move(self, figure):
         if not self.is_active:
@@ -80,21 +137,18 @@ class Player(QObject):
 
         if not new_position: return
 
-        if not new_position.isSpecial():
-            allFigures = new_position.getFigures()
-            for fig in allFigures:
-                if fig.getColor() != self.color:
+        roll_again = False
+        with figure.scene().transaction():
+            if not new_position.isSpecial() and new_position.hasOpponent(self.color_id):
+                for fig in list(new_position.getFigures()):
                     fig.moveToHome()
-                    self.roll_dice.emit()
-                else:
-                    new_position = None
-                    break
+                roll_again = True
+            figure.setPosition(new_position)
 
         self.dice.remove(self.current_dice)
         self.update_dice_widget.emit(self.dice)
         if isinstance(new_position, EndField):
-            self.roll_dice.emit()
-        figure.setPosition(new_position)
+            roll_again = True
 
         for fig in self.figures:
             fig.setEnabled(False)
@@ -103,6 +157,134 @@ class Player(QObject):
             self.game_won.emit()
             return
 
-        self.is_active = len(self.dice) > 0
+        self.is_active = len(self.dice) > 0 or roll_again
         self.continue_game.emit(self.is_active)
+        if roll_again:
+            self.roll_dice.emit()
         return
+
+
+class ThinkSignals(QObject):
+    finished = pyqtSignal(int, object)
+
+
+class ThinkTask(QRunnable):
+    """
+    Runs a strategy on a QThreadPool thread and reports the chosen move.
+    cancelled belongs to this task alone; setting it aborts the search,
+    even if the task has not started yet.
+    """
+    def __init__(self, strategy, game, moves, token):
+        super().__init__()
+        self.strategy = strategy
+        self.game = game
+        self.moves = moves
+        self.token = token
+        self.cancelled = threading.Event()
+        self.signals = ThinkSignals()
+
+    def run(self):
+        try:
+            move = self.strategy(self.game, self.moves, cancel=self.cancelled)
+        except SearchCancelled:
+            return
+        if not self.cancelled.is_set():
+            self.signals.finished.emit(self.token, move)
+
+
+class ComputerPlayer(Player):
+    """
+    Player moving on its own. Instead of enabling figures for a human to
+    click, enable_player_figures hands the position to a strategy from
+    strategy.py, which picks the figure and the dice value to use; the move
+    itself goes through Player.move.
+
+    The strategy runs on the global QThreadPool so the GUI keeps painting
+    while it thinks. Every request carries a token; cancel() invalidates
+    the pending one so that a late result is dropped, and stops its search.
+    """
+    def __init__(self, name, color, color_name, strategy='expectiminimax', parent=None):
+        super().__init__(name, color, color_name, parent)
+
+        self.strategy = getStrategy(strategy)
+        self.all_figures = []
+        self.awaiting_roll = False
+        self.token = 0
+        self.task = None
+
+        self.roll_dice.connect(self.waitForDice)
+        self.enable_player_figures.connect(self.play, Qt.QueuedConnection)
+        self.continue_game.connect(self.resume, Qt.QueuedConnection)
+
+    def isHuman(self):
+        return False
+
+    def setStrategy(self, strategy):
+        self.shutdown(wait=False)
+        self.strategy = getStrategy(strategy)
+
+    def reset(self):
+        self.shutdown(wait=False)
+        self.awaiting_roll = False
+        super().reset()
+
+    def setAllFigures(self, figures):
+        self.all_figures = figures
+
+    def waitForDice(self):
+        self.awaiting_roll = True
+
+    def setDice(self, dice):
+        if self.is_active: self.awaiting_roll = False
+        super().setDice(dice)
+
+    def getGame(self):
+        figures = []
+        for color, figs in enumerate(self.all_figures):
+            progress = engine.PROGRESS[color]
+            figures.append([progress[fig.getPosition().getIndex()] for fig in figs])
+        game = engine.Game()
+        game.setState(figures, self.color_id, self.dice)
+        return game
+
+    def play(self, data=None):
+        if not self.is_active or self.awaiting_roll or not self.dice: return
+
+        game = self.getGame()
+        moves = game.legalMoves()
+        if not moves:
+            self.is_active = False
+            self.continue_game.emit(False)
+            return
+
+        if self.task is not None: return
+        self.token += 1
+        self.task = ThinkTask(self.strategy, game, moves, self.token)
+        self.task.signals.finished.connect(self.applyMove)
+        QThreadPool.globalInstance().start(self.task)
+
+    def applyMove(self, token, move):
+        if token != self.token: return
+        self.task = None
+        if not self.is_active: return
+
+        figure_id, dice = move
+        figure = self.figures[figure_id]
+        self.current_dice = dice
+        figure.enableIfPossible(dice)
+        self.move(figure)
+
+    def cancel(self):
+        self.token += 1
+        if self.task is not None:
+            self.task.cancelled.set()
+        self.task = None
+
+    def shutdown(self, wait=True):
+        """Cancel the pending request and release the worker processes of the strategy."""
+        self.cancel()
+        if hasattr(self.strategy, 'shutdown'):
+            self.strategy.shutdown(wait)
+
+    def resume(self, is_active):
+        if is_active: self.play()
@@ -1,8408 +1,65 @@
-# -*- coding: utf-8 -*-
+"""
+Images of the game
 
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.11.0)
-#
-# WARNING! All changes made in this file will be lost!
+The images listed in resources/resources.qrc are compiled into a binary
+resource file with
 
-from PyQt5 import QtCore
+    rcc -binary resources/resources.qrc -o resources/resources.rcc
 
-qt_resource_data = b"\
-\x00\x00\x25\x52\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x50\x00\x00\x00\x4f\x08\x06\x00\x00\x00\x7c\x91\x42\xe3\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x24\xcf\x49\x44\
-\x41\x54\x78\xda\xd5\x7c\x0b\x8c\x65\x47\x79\xe6\x5f\xe7\x75\xfb\
-\x3e\xfa\x39\xfd\xee\xf1\xbc\x3c\xe3\x99\xf1\xcc\x10\x12\xc0\x18\
-\x08\x04\x90\x36\x9b\xc0\x22\x58\x90\x4d\x36\x59\xd8\x84\x48\x44\
-\x41\x51\xc2\x6e\xa4\x84\x6c\xb2\x31\x68\xf3\x52\x14\x29\xd9\x4d\
-\xa2\x68\xad\x48\x44\x82\x00\x5a\x36\x6c\x20\xbc\x76\x93\x2c\x06\
-\x81\xb1\x01\x03\xc6\x33\xf6\x8c\xed\x19\x7b\x1e\xfd\xee\xdb\x7d\
-\xfb\x76\xdf\x7b\xcf\xbb\xf6\xfb\xab\x4e\x6d\xdd\x47\xcf\xf4\x38\
-\x0b\x82\x94\x5d\x73\xea\xbc\xea\xd4\xf9\xce\xf7\xff\xff\x57\xff\
-\x39\x7d\x85\x94\x92\x5e\x68\x11\x28\xef\x7f\xff\xfb\xdd\x7a\xbd\
-\xee\xf2\xfa\x50\x1c\x57\xf3\x5a\xcd\xe1\xb6\xe3\x38\x5e\xb9\x2c\
-\xbd\x24\x89\xa2\xa4\x54\x12\x41\x1c\x88\x2c\xdb\x08\x89\xc6\xc9\
-\x94\x72\xb9\x1c\x91\x2d\x29\xd9\x92\x9b\xc6\x03\x0f\x3c\x80\xf6\
-\x0f\x7e\x79\xc1\x00\x0a\x94\xfb\xde\x7f\x9f\x3f\x5b\x9f\x15\xf4\
-\x89\x4f\xfc\xe2\xc2\xb1\xa3\xff\x69\x68\x7c\x6c\xbc\xbd\xb1\xb1\
-\xd6\xd8\xda\x7e\x2c\x75\x9c\x47\x86\x8e\x1e\x7a\xba\x7a\xcf\x4b\
-\xaf\xb6\xc2\x76\x5d\x88\x21\x47\xfa\x52\x00\x58\x91\x87\xbb\x0d\
-\x52\xa5\x42\x59\x96\xb5\xf7\x07\x74\x10\xd4\x7f\xbe\x00\x5a\xe6\
-\x89\xed\xed\xed\x52\xf2\xf9\xcf\xbc\xec\xd4\xe9\xd3\x0f\xbd\xf1\
-\xdf\xdc\x27\x2a\x24\x29\x76\x5c\x6a\x65\xb9\x5c\x5d\x5d\x93\xd7\
-\x2f\x3d\xed\x34\x16\x57\x92\x9d\xc6\xf6\xf3\x71\xe0\x3f\x15\xe6\
-\xf9\xc3\xb5\x73\x67\x2e\x06\x73\x73\x3b\xcd\xe6\xd6\xb2\xe7\x79\
-\xe8\xc9\x11\xbb\xbb\xd1\x56\x57\xdf\x2d\x2c\xfe\xd9\xb1\x94\x01\
-\x7c\xc1\xe0\x45\x51\xe4\x7a\x9f\xfe\xf4\x1f\xbf\xe3\x3f\xfe\xea\
-\xbb\x4e\x57\x2b\x0e\xec\x96\x84\xe7\x13\xb9\x58\xfa\x25\xca\x5c\
-\x97\xa2\x20\xa0\x56\x14\x52\xa3\xb9\x93\xaf\x2c\xaf\x8a\x1b\x4f\
-\x3e\x29\x3a\x5b\xcd\xc6\x6e\x1c\x5d\xda\x69\xb7\x1f\xae\x1e\x3f\
-\x7e\xa9\xf6\xa2\xb3\xd7\x36\xd6\xb7\xae\xe5\xb9\xc6\x21\xc0\x39\
-\xbb\xbb\xbb\x03\xa0\xe2\x7a\x62\x6c\x6c\x2c\xbc\x5d\x96\xfe\xe0\
-\x02\x08\xd3\xdd\xdd\x3d\xec\xa3\x0c\x05\x9f\xfd\xcc\x57\xde\xf9\
-\xde\x5f\x3c\x39\xab\x77\x92\x70\x3d\x12\x23\x23\x24\x00\x02\x90\
-\x64\x67\x88\x05\x6a\x12\x93\xc4\xfe\x88\x04\xb5\xe3\x88\xda\x79\
-\x2e\xeb\x9b\x0d\x7a\xee\xc9\x0b\x62\x77\xad\x9e\xb4\x9a\x3b\xd7\
-\xe1\x2b\x9f\x6e\x76\x3a\x5f\x1a\x7e\xd1\xd9\x4b\xc1\xec\xec\xee\
-\xfa\xca\xfa\xa2\x83\xf3\xdd\xb2\x2b\x5a\x5b\xad\xcd\x1f\x60\x96\
-\xde\x3e\x80\x1f\xf8\xc0\x07\x3c\xb0\xcf\x4f\xd3\xd4\x9f\xad\x06\
-\x47\x6a\x4f\x5e\xfa\xd6\xfd\x6f\xfa\x09\x67\xd4\xd1\xe0\x39\x13\
-\x07\x14\x90\x14\x94\x88\x4a\x43\x0c\x9c\x5e\x47\x91\x59\x8a\x36\
-\x03\x0a\x60\xf3\x8c\x64\xae\xef\x30\xc4\xfa\xee\x6e\x93\xb6\x76\
-\x5b\x72\x75\x65\x95\x16\x2f\x80\xa5\xcd\x9d\xad\x76\x96\x3f\xdd\
-\xdc\xd9\x79\xb8\x76\xe2\xce\xa7\xab\x67\xce\x5c\x5d\x6b\x6c\x5e\
-\x4b\xb3\x54\xb2\x1f\x75\x52\x87\xc2\x30\xfc\x7e\xb2\xf4\x85\x03\
-\x78\xff\xfd\xf7\xbb\xe3\xe3\xe3\xce\xfc\x3c\xf9\x44\xf3\xd3\xd9\
-\x63\x5f\x7f\xed\x89\x83\x0b\x1f\x7c\xeb\xcb\x5f\x42\x5e\x9a\x80\
-\x79\x63\x24\xaa\x55\x84\xe3\x32\x09\x80\x22\x01\x96\x2a\xd8\x47\
-\xe8\x5f\xaa\x76\x4a\x68\x60\x1f\xf1\x36\x05\xae\x44\xe5\xd5\x3c\
-\x8e\x29\x07\xb0\x31\x36\xef\xb6\x5b\xb4\x93\xa6\x72\x7d\x6b\x9b\
-\xae\x5f\xba\x24\x5a\xf5\xad\xa4\xdd\x6a\x5d\x4b\x4a\x43\x17\x5b\
-\x49\xfa\xe5\xda\x8b\xce\x5c\x72\x27\x27\x77\xb6\x36\xb6\x96\x09\
-\x85\x59\xda\xd9\xee\x7c\xbf\x58\x7a\xfb\x00\xce\xce\xce\x7a\xf0\
-\x51\xc3\xfe\xb0\x3f\x42\x9f\xfb\x3f\xef\xfd\x89\xfb\xde\xf2\x9e\
-\x57\x4c\x4e\xba\xce\x50\x09\xa3\xac\x10\xf9\x01\x09\x2c\x15\x40\
-\xa4\x41\xe2\xae\x81\x0c\x96\x39\xaf\x5b\x10\x65\x86\xed\xbc\x5f\
-\xf2\xfe\x02\x64\x85\x2c\xf1\x42\x26\x99\x62\x6d\x42\x12\x0c\x6d\
-\x51\x0b\xfb\xeb\xad\x56\xbe\xba\xbe\x2e\x56\x9e\xb9\x2c\xa2\x9d\
-\xdd\xcd\x0e\x89\x8b\xbb\x61\xf8\x48\xf5\xd8\xb1\x8b\x95\x33\xa7\
-\xaf\xd5\x5b\xcd\x1b\xf0\xa5\xea\x66\x7c\xe9\x53\xa7\xd3\x69\x74\
-\x83\xfa\xbd\x8a\xf8\x0c\xe0\xfe\xb2\xe5\xbe\xfb\x9c\xa3\x47\x8f\
-\x56\x3c\x2f\xaa\xc8\xa0\x32\x3c\xf2\xd5\x6f\xfc\xf7\x7f\x7d\xff\
-\x5b\x7f\xf8\xce\xf2\x90\xf6\x75\x43\x15\x12\x95\x2a\x49\x47\x18\
-\xf0\x8a\x85\x34\x6d\x0d\xa4\x01\x96\x81\x54\xfb\x72\x6e\xf3\x42\
-\xb5\x29\x03\x70\x42\xa2\x29\x75\xbf\x29\xd6\x8b\xe3\xf2\x10\x2c\
-\x05\xa8\x1d\x41\xd4\x6c\xb7\x69\x3b\x4d\xe4\x6a\xa3\x29\x97\x9e\
-\x7b\xde\xe9\x6c\xef\x24\x9d\x30\x7c\xae\xd1\xee\x7c\xc7\x3b\x70\
-\xe0\x6b\xe5\xb3\x77\x5f\x74\x27\x0f\xb4\x9a\x9b\xcd\x15\xf6\xa5\
-\xce\x90\x23\xe2\xdd\xf8\x05\x47\x7c\x04\x4d\x0c\xaa\x18\x36\xca\
-\xff\x17\x80\x60\x60\x75\x68\x68\xa8\x72\xf0\xe0\xec\x59\xef\xa1\
-\x2f\x7d\xf2\xcd\x6f\xf8\xf1\xca\xec\x70\x0d\xa0\xb9\x0c\x9e\xf6\
-\x6f\x24\x08\xb7\xdf\x0f\xe2\x00\x90\x66\x5d\x33\x93\x7d\x64\x66\
-\x99\x98\x80\x77\x06\x64\x3e\x16\x55\x01\x9d\xa1\x9a\xf3\xcd\x71\
-\x30\xfb\x08\xeb\x0c\xe8\x0e\xf6\xaf\x77\x3a\xf9\xea\xe6\xa6\xd8\
-\xb8\xbe\x48\x49\x18\xd5\x23\xe1\x3e\x19\xca\xfc\x91\xa1\xc3\x87\
-\x9e\x0a\x4e\x9d\xbc\xbe\x93\x84\xcb\x64\xa8\x16\xe6\x8a\xa1\x37\
-\x67\xe9\xf3\xf4\xfc\xf3\x84\xfa\x7c\x3a\x35\x35\xa5\x2e\x7d\xe6\
-\xcc\x19\xd9\xcf\x4c\x8f\x6e\xa3\x54\xab\x55\xbf\x52\x89\xe0\xe6\
-\xc6\x0e\xa4\xd7\x6e\xcc\xd6\x46\x47\x2a\xa3\xec\xf3\x72\x42\xcd\
-\xb4\x69\x1a\x90\x4c\xb1\xc0\xe9\x60\x62\xcc\x15\xc5\xb6\x85\x5a\
-\x0a\xac\xab\xff\xb8\x2f\xe1\x68\x4b\x12\xea\xae\xf4\x32\xd5\x26\
-\x4f\x19\xd8\x8a\xb6\x01\x95\x77\x06\xd8\x36\x09\x09\x35\xe1\x64\
-\x74\x47\x1e\x38\xf9\xe4\x24\xed\x4e\x1e\xa0\x46\x18\x4e\x6e\x65\
-\xd9\xab\x57\x77\x5b\xaf\x5a\x5b\x5a\x71\xc3\xcb\x97\xa3\x20\xc9\
-\x2e\xb7\xd2\xe4\x11\x67\x6a\xf2\x42\x70\xfa\xd4\x53\xe2\xc0\x44\
-\x2b\x6e\xc7\xeb\x14\x10\x5f\x7d\x94\x62\xda\x26\x94\x38\x8e\x2b\
-\x59\x36\xd3\x3e\x72\xa4\x2d\xa7\xa7\xef\xf1\x2b\xb8\xf9\xa5\xa5\
-\x25\xc9\x23\x87\x3b\x13\x1f\xff\xf8\xc7\x73\x89\x72\x5b\x00\xbe\
-\xf6\xb5\xaf\x75\x4d\x1b\x1d\x53\x76\xf1\xd2\xe9\x33\x3f\x7a\xaf\
-\x2c\x49\xdc\x37\x64\x8a\x61\x0d\x65\xb9\x41\xae\xf8\xdf\x32\x50\
-\xdd\xbc\x59\xcf\x35\x58\xd8\x61\x8c\x83\xb7\x59\x3f\x59\x1c\x2f\
-\xb8\xa9\x59\xa9\xd9\x2d\x8b\x48\xee\x09\x0e\xb9\xfa\x9c\x34\x06\
-\x33\x8d\x1b\xc8\x49\xe4\xda\x93\xd6\xb0\xad\xea\x79\x34\x9f\x4b\
-\x71\x77\x79\xc8\xed\x1c\x3d\x42\x5b\xed\x56\xa9\x21\xf3\xbb\xd7\
-\xc2\xf8\xe4\xda\xce\x8e\xd3\xfc\xf2\x57\x28\x4b\x92\x75\xe8\xd6\
-\x0b\xa9\xe7\x3e\xe2\x1d\x5c\xb8\xe0\x9f\x3e\x79\x2d\x4e\x69\x43\
-\xca\x48\xfa\xbe\x3b\x12\xc7\xc3\x8d\x3c\x8f\x65\x14\xd5\x87\x26\
-\x26\x26\xd8\xb4\x3b\x08\xa6\x19\xeb\x61\x94\x8c\x41\xf4\xf6\x33\
-\x5f\x00\x58\x00\x31\x56\xcd\x32\x47\x4e\x8d\x4f\xfc\xe8\xf4\xf8\
-\xb8\xba\x19\xd9\xc5\x3c\xe1\xe6\x06\x20\x26\x86\x31\x57\xdd\xce\
-\x0b\x93\xed\x66\x9f\x10\xd6\x1c\x2d\x33\xad\x79\xf3\x3e\x0d\x7c\
-\x01\x24\xd9\x6b\x79\x9e\x31\x6b\x85\xa9\xc4\x3a\x40\xb5\xd7\x64\
-\xf3\xd6\x3e\x55\x9d\x17\x40\x52\x4d\xe3\x21\x4c\xe5\x82\xee\x14\
-\xe4\xa6\xd5\x0a\x35\xe1\xbf\xeb\x51\x34\xbd\x29\xe5\xe4\x4a\x27\
-\x7c\x4d\xe3\xd9\x67\xdd\xe4\xfc\xf9\x10\x98\x3f\x13\x05\xfe\x23\
-\xee\xc4\xf8\x13\xfe\xd9\x93\xe7\xbd\xb1\x89\xdd\xd8\x09\xd6\xdc\
-\xa4\x95\xed\xec\x24\x4c\xa6\x36\x72\x00\x19\xe3\xc2\x20\xde\x96\
-\x09\xcf\xcc\xcc\x94\xf8\xc6\x82\x5a\xe0\xf8\x71\x74\x62\x8c\xa7\
-\x62\xa5\x12\xc9\xd6\xae\x1e\x24\x0a\xdf\x8c\x61\x9c\x20\x69\xad\
-\x19\x37\xb2\xb9\xb6\x4e\x3b\x5b\x0d\xe8\x6a\x41\x93\x0b\xf3\x14\
-\xf0\xb9\x1a\x48\x96\x32\x1a\x20\x1d\x40\x0d\x13\x0d\x68\x7a\xa9\
-\xfa\x43\xcd\x4c\x50\x21\x6d\xee\x8e\xd0\xd6\x5e\xe8\xcf\x3c\x06\
-\x88\x9e\xa7\x99\x1a\x76\x54\xdf\x66\x96\xa3\x59\xca\x2e\xc2\x25\
-\x91\x25\x34\x02\xd3\x1f\xc6\xfe\x3b\xe2\xc4\x39\xc7\xa8\x0c\x57\
-\xa9\xee\xb9\x43\x75\x99\x9f\x5b\xcd\xf2\xd3\x9b\x6b\xc0\xec\xf3\
-\x8b\x3c\xae\xa5\x6c\x7a\xf2\x23\xc1\xbf\x78\xdd\x5f\xf9\x3e\x6c\
-\xc1\x1d\x0b\x92\x24\xd9\x3a\x77\xee\x1c\x5b\xe7\xfe\x26\x7c\xe4\
-\xc8\x11\xcf\xb4\x0f\x8d\x4d\x9e\xa2\x4a\x79\x66\x6c\x72\x4a\x03\
-\x97\x93\x36\xdd\x3c\x21\x12\x26\x80\x08\x32\x20\x5c\x7d\xf6\x32\
-\xfd\xaf\xff\xf9\x29\xda\xdd\xa8\xd3\x08\x80\x73\x93\x94\xf2\xe5\
-\x65\x3a\x7d\xef\x3d\xf4\x92\x37\xfc\x4b\x72\x3d\xcf\x00\x32\x10\
-\x5c\xb8\xad\x4a\x66\x58\x9a\x69\xa9\xc3\xfb\xd4\xb1\x54\xb0\xd4\
-\x02\x2e\x00\x1c\x56\x14\xb0\x62\x68\x88\x7d\xa7\x36\x06\x8e\xc4\
-\xf0\x93\x39\x82\x8d\xf4\xd9\xe7\x06\x24\xdb\xa9\x7e\x66\xae\xab\
-\x7c\x78\x09\xee\x69\x16\xfd\x4c\x83\xbd\x77\x75\x42\x2f\x45\x7b\
-\x0b\x27\xaf\xfb\xce\xc2\xc5\x7a\xfd\x57\xc3\x4f\x7e\xf6\x68\xf9\
-\x2d\x6f\xfc\xcf\xae\x9b\x86\x9e\x57\xce\xe0\xce\x76\xe1\x17\x73\
-\xef\x76\xfd\x1f\x7c\xc0\xe4\xce\x93\x4f\x1d\x9f\xc4\xdc\xb7\x4c\
-\x18\x68\xe0\x21\x92\xad\x13\xa9\xdb\xd2\xce\xde\x30\x86\x19\xf1\
-\xf4\x85\x0b\xf4\xc9\x0f\x7f\x8c\x8e\xff\xd2\x2f\xd1\xa9\x57\xbf\
-\x5a\x09\x6c\x2e\x69\xbd\x4e\xeb\x0f\xfe\x37\x7a\xf8\x2f\xff\x8a\
-\x5e\xf9\xef\xfe\x2d\xa7\xbf\xac\x1f\xd4\xe0\xf5\x46\x6b\xb5\xdd\
-\x82\x6b\x4c\x5e\x57\x6b\xee\xdd\xdb\x4d\x74\xc7\x0a\xcf\x92\x0a\
-\x6b\x40\xbb\x52\x21\xea\x84\x24\x02\x41\x8e\xeb\x03\xc4\x5d\x66\
-\xa9\xbe\x06\xc6\x91\x37\x77\x14\xa0\x6c\x5d\x02\xfa\x73\x0c\x0f\
-\x6d\x94\x1f\xa0\xef\x3b\x17\x76\x76\x5f\x83\x63\xee\xca\x85\xfb\
-\x94\x48\x3a\x70\x67\x94\x70\x52\xc4\xa1\xfd\x0b\x0f\xae\x0a\xc4\
-\xf3\xe6\xe5\xcb\x27\xee\x3c\x7b\x2e\x87\x29\xe2\x62\xdb\xda\xec\
-\xe2\x44\x4b\x8a\x28\x56\x4b\x42\x0d\x77\x77\xe9\xd3\x1f\xfa\x28\
-\x9d\xfd\xdd\xdf\xa5\x49\xd0\x9c\xc1\x33\x05\x3a\x8d\x26\x7e\xfd\
-\x7d\x94\x8c\x8e\xd1\xe5\xcf\xff\x6f\x98\x56\x71\x6e\x8c\xca\xd3\
-\x3f\xd3\x97\xda\x96\x80\xdc\xa8\xea\x1a\x29\xd6\xd5\x3e\xdb\xe6\
-\x7d\xba\xea\x76\x1c\x6b\x53\x65\xa6\x47\x31\xb6\x67\x94\xa7\x99\
-\x0e\x34\xb9\x02\x58\x9b\x38\xa4\x17\x07\x40\x51\xad\xa9\x4a\x60\
-\xab\x33\x54\xc6\xd8\x26\xc9\x09\x86\x18\x40\x3e\x4e\x9d\x97\x03\
-\x29\x57\x07\xa9\x2a\x1e\x44\xc9\x49\xf3\xa3\xd2\x0d\xe6\x65\x59\
-\x96\x46\x46\xa4\xef\xdc\x2a\x80\x18\xff\x47\xd4\x86\xc5\x86\x34\
-\x3b\x3f\xff\x8a\x51\x46\xcf\x0f\xb4\x09\x27\xb1\x01\xae\x00\x31\
-\x52\x83\x7f\xe2\xe1\x47\x68\xea\xc5\x2f\xa6\xda\xc9\x93\xfd\x7d\
-\x92\x87\x81\x05\x18\xf0\xc8\x7b\xdf\x4b\x8d\xa7\x2e\x51\xb6\xdb\
-\xd6\x00\xc4\xb1\x05\xce\x02\xd3\x05\x6a\xa4\xb7\x31\x38\x61\x48\
-\xe6\x9a\x84\xe3\x29\x2e\xc0\xc3\x3e\x2c\x0d\xb8\xb6\x02\x00\xb3\
-\x9f\x8c\xe6\x44\xd5\x3e\x95\x74\x02\xc4\xf5\x14\x68\xee\xc8\x28\
-\x8e\xcf\xb5\x11\xa4\xa9\x7a\x00\x9b\x6c\x5e\x23\xc3\x1b\x82\xe4\
-\x29\x72\xc4\x38\xef\x2a\x65\x62\x42\xca\x11\x98\xf0\x6d\x96\xc3\
-\xc7\x8e\x1f\xcd\x9e\xbd\x7a\xa4\x9a\xe5\x82\xb8\x63\xbe\xd1\x76\
-\xc7\x68\x77\x6b\xc2\x18\xd1\xf2\xf3\x57\x69\xfc\x8d\xff\x8a\x4c\
-\x61\x33\x45\x06\x07\x55\x79\x61\x6d\xb6\xac\x23\xcf\x9e\xa5\x68\
-\x79\x85\x4a\xd3\x53\x6c\x6e\xd6\xc7\xf5\x47\x63\x22\xeb\xeb\xac\
-\x69\xeb\xb6\x31\xff\x2c\x2b\x8e\xcb\x50\xad\xa9\xdb\xca\xdb\x34\
-\xa3\x8c\xab\x31\x41\x89\xe7\xe1\x79\x11\xa4\xd2\x56\x8b\x8f\x01\
-\x70\xba\xf2\xb6\x35\x12\xb9\x98\x9d\x69\x90\x70\x18\xbc\x1a\xe5\
-\x1c\x7f\x9c\x24\x74\xa2\x8a\x77\x3b\x01\x64\x74\x74\xee\x40\xe7\
-\xca\x95\x19\x78\xbd\xf2\xf8\xc2\x41\x7d\x33\x99\x91\x0b\xb2\xcf\
-\xdc\x89\x7c\xf6\x83\x00\x0b\x45\x31\xae\x54\x2a\x71\xae\xaf\x17\
-\x40\x14\x01\xd1\xeb\xe4\x99\x62\x99\xb9\x69\x94\x22\x50\x58\xd9\
-\x03\x50\x7a\x83\x06\x19\x80\x2c\xa0\xaa\x66\x7a\x9f\x01\xc3\x02\
-\x99\xf5\x02\x89\xa5\x06\xae\xd0\x90\x24\x78\xa9\xc0\xcb\xa2\x48\
-\xd5\x74\x7b\x9b\x72\xf4\xd7\xe6\xf9\x38\xf4\x5b\xf9\xe0\xbc\x2b\
-\xc0\x75\x4c\xb7\x47\x60\x83\xb3\xb9\xf4\x96\x4a\x99\xe7\x7b\xb7\
-\x29\xa0\xe5\xd6\xe3\x4f\x9c\x78\xe9\x2b\xee\x45\x10\xcb\x04\x67\
-\x5d\xb2\x8d\x0d\xec\x48\x8b\x19\x41\x31\xdb\x28\x44\xf2\x78\xad\
-\x46\x5b\xcf\x3e\x4b\xee\x6b\x5e\xa3\xc0\xc3\x14\xd0\x80\xc8\x80\
-\x6a\x00\x79\xe0\x30\x45\x51\xab\x28\x36\x93\xb0\x2c\xd3\x60\x19\
-\x16\x6a\x06\x92\x66\x8b\x05\xb2\xd8\x6e\xa5\x8d\x6e\x23\x81\x4b\
-\x4f\x62\x0e\x76\x63\x75\x95\x5c\xf4\x51\xc6\x35\x8f\x82\xe1\x77\
-\x1c\x84\x0a\x10\x2e\x8f\x4f\xfb\x36\xc3\x74\x6e\x2b\xd3\x87\x8b\
-\xe8\x74\x28\xc5\xf9\xf1\x66\x5d\xb1\x30\x03\x03\xeb\x9e\xa7\x5c\
-\x8f\x3b\x37\xb7\x0e\xc8\x67\xc0\xbc\x96\xa4\xac\xe9\x38\x62\x44\
-\xca\xb4\xe3\xed\x2f\xa0\x25\x22\x4e\x26\xe7\xa6\x67\x5e\x3d\xea\
-\xb8\x2a\x6d\x92\x2d\x2f\x69\xb9\x92\x26\xfa\xa6\xfb\xa6\x6c\xc7\
-\xef\x3a\x41\x8f\x7e\xee\xf3\xe4\xff\xec\xcf\x32\x68\x3d\x20\x1a\
-\x16\x8a\xc5\x45\xda\x5d\x5d\x21\x31\x33\xc5\x3e\xcc\x02\x62\x34\
-\x5e\x61\xb6\x16\x48\x66\x56\xe1\xbb\x48\xf4\x44\x5b\x59\x88\xea\
-\xab\xc8\x29\x7e\xf1\x5b\xdf\xa6\x83\x6f\x7c\x23\x9d\xfe\xf7\xff\
-\x81\x1c\x5c\x3b\xdb\xdc\xa4\xad\xbf\xfd\x5b\x5a\xff\xea\xd7\xe8\
-\xdc\x8b\xce\xf1\xf5\x0b\x2d\x9f\x59\x20\x01\x54\xd2\x6c\x52\x8a\
-\xe0\x97\x6c\x37\x75\x90\xca\x73\xe5\x99\xd6\xd9\x2f\x0e\x0f\xc7\
-\x22\x40\x03\xe1\x86\x00\x33\x41\x24\x61\x4c\x25\x5c\x37\xf6\x6e\
-\x47\x40\x73\xce\x8d\x76\x77\x8e\x8e\x10\x39\x2c\x52\xf3\x1d\xf8\
-\x09\x0e\x18\x9d\xd0\x4e\xd1\x50\x8d\x74\xa8\x80\x81\x47\xee\xb8\
-\x83\xc2\x3f\xfd\x53\xf2\x7f\xf3\x37\x79\xd0\x3d\x40\x7a\x78\xba\
-\x3b\x7f\xf6\x67\x54\x9e\x9b\xd3\xce\xbd\x30\x59\x94\xfe\x99\x48\
-\xaf\xff\x2b\x4c\xd7\x32\xd5\xca\x9f\x8d\xad\x2d\xfa\xca\xe3\xdf\
-\xa1\x17\xfd\xde\xef\xd1\xf0\xdd\x77\xdb\x9b\x40\x12\xb3\x02\x5f\
-\xdb\xfe\xd4\xa7\xe8\xea\x47\x3e\x42\x87\x4f\xde\x85\x5b\x70\xb9\
-\x0f\xce\xee\x28\xf6\x25\x38\x17\xe6\x8c\x65\x43\x05\x0e\xcc\xd1\
-\x54\x8d\x40\x88\x4d\x8c\xdd\x99\x9b\x09\x09\x22\x08\x17\xaa\x4b\
-\x29\x7c\x5c\xbc\x8a\xba\x93\x65\xbe\xeb\xdd\x8e\x80\x3e\x3c\x3e\
-\x75\xba\x93\x5c\x98\x99\xbe\xf3\x4e\x44\xb8\x48\xd5\x6c\x73\xab\
-\x48\x08\x14\x73\x5d\xa7\x10\xbd\x82\x14\x3b\x8f\xfc\xf0\x8b\x69\
-\xe9\x5b\x8f\x93\x78\xdf\xfb\xa8\xf4\xf3\x3f\x4f\xc1\x5d\x77\x51\
-\x30\x31\x41\x02\xa6\xbd\xfb\xe0\x83\x24\xeb\x70\x01\xe3\xe3\x3a\
-\x72\x6b\xec\x0a\x20\x6d\x90\x30\xe6\x26\xf5\x7c\xb0\x2b\xa0\xf4\
-\x06\x17\xae\xe7\xaf\x3c\x47\x47\x7e\xfa\xa7\x0d\x78\x03\xd1\xbf\
-\xf6\x96\xb7\x50\xf2\xc4\x13\xd4\xb9\x71\x83\x4a\x63\x63\xca\xdc\
-\xa1\x86\x55\x44\xcf\xb8\x76\x3a\xca\x6c\x53\x66\x3a\x83\xc7\xae\
-\x0b\xe7\xed\xc0\x5a\xca\x33\xd3\x3c\xc8\x4d\xf4\x53\x12\x02\xcc\
-\xcb\xc4\x5a\xe6\x4a\x57\x78\x8e\xe7\xed\xe3\xff\x10\x40\x46\x0f\
-\x6c\x7f\xe7\x89\x13\x6e\x9a\x89\x12\x47\x5d\xb0\x28\x5d\x5c\xd2\
-\xf2\x02\xd4\x27\x6d\xb5\x36\x13\x63\xc4\xb0\x80\xa7\xbd\xfb\xb4\
-\x32\x8b\xf0\xbf\xfe\x17\xea\xe0\x59\x25\xd8\x06\xb7\xcb\xd4\x26\
-\xc9\x29\x30\x05\x9e\x4d\xac\xf2\x02\x6b\x3d\xe6\x69\x05\x34\x19\
-\xa6\xf6\x46\xde\xe2\x86\x37\x57\x56\xe8\xdc\x4f\xfe\xe4\x80\x64\
-\x42\xd5\x2e\x03\xeb\xf4\x8e\x77\x50\x0e\x6d\x9a\xb5\x5a\x4a\x40\
-\x27\x08\x14\x00\x4e\xf5\x91\x60\x09\xd6\xe9\xc9\x95\x10\x0a\xbc\
-\x6d\xd7\x55\x7d\xbb\x73\x33\x09\x8b\x89\x1c\x15\x97\x5e\x12\x9c\
-\xd2\x48\xc9\xc1\x70\x76\xbc\xdb\x10\xd0\x32\xb9\x72\xe5\xce\x97\
-\xdd\xf3\xf2\x5c\x20\x1a\xa5\xcb\xcb\x7c\x71\xcd\x8c\x2c\xb3\xbe\
-\xaf\x90\x11\xc6\x1f\x1a\xc7\x2f\xa0\x19\xcb\x87\x0e\x9b\x2c\xa1\
-\x9e\x9b\xb2\x8f\x51\x41\xc3\x06\x89\xde\xc4\x82\xd0\x6d\xde\x67\
-\xb3\x32\x96\x71\xb6\xad\x6a\x0a\x35\x50\x66\xa0\x20\x8d\x50\x18\
-\x30\xe3\x6f\x7b\x00\x14\x70\x2b\x49\xb9\x4c\x21\x00\x04\x78\x7c\
-\x1f\xca\x85\x24\xac\x2f\xd9\x6c\x79\x18\x42\x68\xf6\xa1\x6e\xf2\
-\x8b\xad\x20\x90\xce\xc8\xc8\x86\x7a\x24\x0c\x1e\x4a\xee\xe4\xc2\
-\x21\xb1\x19\xb9\x89\xf0\x6e\x16\x40\xb4\xff\x6b\xa9\x8c\xd7\xd4\
-\xd4\xf4\x2b\x46\xf3\x5c\x00\x30\x25\x78\x49\xd3\x5f\x3f\xd5\x42\
-\x32\xa8\xb2\x47\x66\xc5\x00\x83\xa2\x8f\x63\xf0\xfb\x8f\xcb\x7b\
-\xa6\x6a\xf6\x78\xb3\xcf\xb6\x8b\xf3\x2d\xfb\x0c\x98\x43\xbc\x04\
-\xa3\x7d\x80\x08\x3f\xcb\x3e\xd7\x80\x68\x01\x04\x78\x6d\xb4\x77\
-\x1a\x0d\x4e\x65\x69\xdd\xa7\xfd\x1d\xb3\x4e\xb3\xaf\x30\x5d\xa6\
-\x5c\x03\xc7\xfa\x53\x93\x61\x1f\xa9\x04\x84\xf6\x2a\x10\xa4\x0a\
-\x31\x25\xf7\x29\x07\x0f\x1f\x3a\x9c\xee\xec\x1c\x61\x00\x09\xa0\
-\x21\xa7\xc3\x1a\xc9\x00\xd7\x33\x0f\xcd\x8d\x49\xf5\xb6\xbb\xb5\
-\x9a\xde\x8e\x6a\x66\x02\xec\xb4\x0d\x93\xf2\xbe\xbe\x72\xdd\xee\
-\xb9\x4e\xae\xcf\xe9\x39\xd6\x11\x82\x26\xe1\x5f\xd3\xaf\x7c\x85\
-\x81\xe3\xaa\x40\x2c\x03\x30\x24\x43\x39\x21\xac\x6a\x79\x69\x89\
-\xa2\xab\x57\x29\x65\x73\x65\xf0\x70\xae\x01\x2f\x2b\xc0\x4b\x18\
-\xc0\x02\xc4\x5d\xdf\x97\xce\xec\x74\x54\x40\xb7\x4c\x7d\x65\x23\
-\x6b\xb7\xbd\x5b\x05\x90\x5a\x6d\x7a\xa2\xf5\xf4\x95\xe9\x34\x8a\
-\xca\x07\x66\x66\x74\xc4\x44\xcd\x4d\x1e\xd0\x48\x18\xcb\x18\x95\
-\x74\xbd\x74\xfd\x3a\x5d\x82\x0e\x63\x71\x5a\xc6\x53\xbc\x13\x82\
-\xf9\xe8\xc1\x83\xe4\xa3\xdd\x1d\x65\x51\x7a\x19\x67\xd9\x6a\x58\
-\xd6\x1b\x85\xfb\x2b\xd9\x19\xc5\x0c\x02\xc3\x36\xa2\xac\x87\xc4\
-\x45\x30\x32\xc2\xec\x33\x51\x5f\xb1\xd0\x41\x26\xa6\xf9\xd1\x8f\
-\x52\x33\x0c\xb5\xb9\x5a\x93\xe5\x65\x2f\xfb\x50\x3b\x9a\x85\xa2\
-\xaa\x00\x94\x1b\x64\x02\x19\xd1\xa2\xb6\xd4\x6c\x9b\x97\xde\x2d\
-\x05\x34\xc5\x72\xfb\x89\x27\x4e\x9e\xb8\xeb\x2e\x39\x94\xa6\x42\
-\x02\x80\x74\x7d\x5d\x0d\xde\x08\x5b\x2e\x06\xc8\x06\x7c\xcb\x27\
-\x1f\x79\x84\x46\x4e\x9f\xa6\xb9\xf7\xbc\x87\x02\x44\xd9\x1c\x8c\
-\x5d\xfa\xf4\xa7\xe9\xda\x97\xbf\x4c\xf7\xf0\xfc\xb8\x5a\xed\xf1\
-\x79\x18\xc9\x5e\x26\xac\x8f\x31\x6c\xb4\x00\x1b\x33\x36\x4c\xd6\
-\x59\x14\x4e\x47\x61\x6c\xc3\xd8\x27\x7e\xe7\x77\x28\x40\x06\xc8\
-\x7b\xe9\x4b\xf5\xbc\x5b\x40\xf7\xb3\x39\xfe\xf6\x6f\xd3\xf3\x9f\
-\xfb\x1c\xa5\x1a\xb8\x6e\xf0\xec\x3a\x2a\xc0\x53\x0c\x6c\xa2\x3f\
-\x17\x6d\x67\x7a\x7a\x5d\x1b\xaa\xe4\x74\xd9\x0d\xf6\xcb\xdd\xc5\
-\xdb\x4f\x40\x4f\x8e\x8d\xbf\x6a\x04\xf3\x17\x14\x91\x6f\x6c\xf0\
-\x80\x7b\x7d\x58\xc1\x92\x08\xcc\xfb\xe4\xc3\x0f\xd3\x21\x48\x96\
-\x99\x37\xbc\x81\xba\x4b\xed\x47\x7e\x84\x42\xec\xbb\xf8\x27\x7f\
-\x42\xe7\x7e\xe8\x87\x10\x89\x7d\xbe\x98\x75\x03\x36\x3b\xdd\x03\
-\x6e\x6e\xd9\x6a\x81\x63\x40\xd9\xff\x16\xc0\xc1\x8a\x88\xd0\x1f\
-\xdc\x0c\x39\xf0\x81\x09\xd2\x68\xbb\x90\x4e\x3e\x1e\x62\x76\xe0\
-\x80\x7a\x25\xba\xf8\xc5\x2f\xd2\x06\xc6\x1e\x12\xf5\x80\x97\xf2\
-\xd2\x82\xa7\x74\x5f\x84\xe3\x53\x96\x2f\xe8\x3f\x18\x1e\x4e\x20\
-\x54\xf2\x42\x64\x2c\xe1\x5f\x93\x5e\xdc\x50\x04\x5b\x8d\x23\xef\
-\x96\x02\xda\x75\x45\xbe\xd5\x38\x3e\x3e\x3a\xe6\xa0\x13\x1e\xac\
-\xf6\x41\x1c\x48\x2c\x2b\x54\xfb\xe9\x6b\xd7\xe8\x00\x80\xd2\xe0\
-\x0d\x96\xf2\xab\x5e\x45\x3e\x34\x60\x1d\x0c\x9d\x3e\x7c\xb8\x37\
-\x60\x74\x31\x30\xef\x66\xa6\xf1\x8f\x0c\x1c\x67\x5e\xb4\x2f\xd4\
-\xfa\x0d\x55\x6a\x30\x79\x1f\xcb\x11\xbe\x33\xb5\x6f\x07\xee\xa3\
-\x89\x2a\xcd\x18\x8b\x9a\xef\x09\x9e\xdd\x16\x33\x03\x8b\x7d\x2d\
-\xb0\x77\x68\x61\x36\xe4\x91\x90\xc8\x57\xf4\x03\x57\x33\xed\x55\
-\x60\x20\x08\x30\x2b\x06\xde\x4a\x40\xcf\x96\x6b\x27\x3a\x71\x3c\
-\x3d\x3d\x37\xc7\x69\x21\xfd\xc4\x31\xe5\xa1\x7e\x3f\x86\xe5\x15\
-\xc8\x9b\x3b\xc0\xbe\xae\x32\xa8\xc3\xde\xfe\x76\x4a\x1f\x7a\x48\
-\x03\x67\x81\x1a\x88\xa8\x64\x1e\x92\xe3\x68\xc0\x5a\x2d\xee\x8c\
-\x59\xa6\xd9\x87\x36\xb6\xe9\x60\x62\xcf\xe5\x31\x9a\x3e\xfa\x6b\
-\x9f\xd9\x0e\x82\x97\x6a\xe6\xe9\x20\xe2\x38\xaa\x56\xa6\xe1\xff\
-\x84\x58\x17\x8c\xa1\x7e\x6b\xb8\x44\x8e\xa7\xce\x12\xa2\x8a\x41\
-\xed\x92\x77\x33\xff\x57\x1e\x2d\x4f\x6c\x7f\xfb\xf1\xe3\x6e\x9e\
-\x3b\x15\x1e\x58\x10\xa8\x6c\x72\xae\xfd\x5f\x8f\xef\xe3\xe2\xe2\
-\x98\x60\x7a\xda\xa4\xaf\x4c\x34\x34\x00\xaa\x6d\x12\x0e\x5d\x8e\
-\x8d\x69\x2d\x68\xa3\xb2\x79\x37\x62\x72\x77\x0c\xa8\xcd\x09\xf2\
-\x31\xec\xf8\xa3\x48\x33\x0e\xfb\xd1\x56\xdb\x85\x36\x69\x03\x92\
-\x7d\x00\x7b\x83\x67\xa2\xed\x80\xdf\xe3\xbe\xe2\xae\x00\xd2\x42\
-\x45\x61\x01\xcd\xf3\x4c\x51\x24\x4a\x16\xb1\x05\x6a\x1a\x72\x18\
-\x3a\x84\xa8\x44\x7b\x31\xb0\xc7\xff\x75\xae\xdf\x38\x75\xea\xe8\
-\xb1\x0c\xe0\xb8\x30\x5f\xe3\xab\x0c\x00\x3d\xef\x78\xcb\x0c\x40\
-\xa7\xc3\x40\x75\x67\x5f\x8c\x98\xd5\x0c\xe4\x54\xd1\xc8\x88\x65\
-\x0d\x00\x32\xa6\x9a\xb3\x09\x32\xb3\xa2\x48\xb3\x1c\x6d\x5c\x53\
-\x1f\xe3\xba\x6c\xa2\x16\x78\x21\xac\x8f\x2c\x80\xdb\x46\xdd\x42\
-\x65\x06\x94\xb0\x7f\xcc\x7c\x77\xb3\x0f\x78\xa6\x9d\x14\xe0\xa5\
-\x0c\x20\xae\x17\xb0\x84\x19\x19\xae\x93\x7e\xc1\x0a\xf0\x8c\xcb\
-\x17\x1b\xa6\xcd\x2f\xdd\xbd\xbd\x05\xb4\x4e\xd5\x8f\xd4\x86\xef\
-\x1d\x4f\x53\xc7\xf8\x19\x33\x7f\x54\x4f\xa4\xcf\x77\x2d\xc0\x61\
-\xb7\xff\xfe\xef\x69\x18\xd1\xb7\x4b\x42\x18\x10\xb5\x90\x5d\x5b\
-\xa3\x6d\x88\xd8\x9c\x23\xb1\xe3\x68\x66\x71\x7f\x6c\xa6\xcc\x2a\
-\x54\x23\xd2\xd5\x1c\xb9\x30\x61\x03\x9c\x65\x9a\x05\xae\x8d\xfa\
-\x2d\xf4\x9f\xa3\x4e\xdf\x7b\x2f\x79\x38\xa7\xf5\xcc\x33\x54\x47\
-\xb6\x67\x1a\x7d\x0d\x19\x96\x59\xc0\x6c\xbb\xab\x46\xda\x7c\x55\
-\x6d\xeb\xf9\x6f\x28\x24\xf3\xaf\xe0\x89\x50\x6b\xab\xe6\x9d\xed\
-\xea\xea\x6a\x74\xcb\x17\xeb\x93\xb3\xd3\x0b\xed\xed\xed\x63\xc3\
-\xb5\x9a\x50\x17\x6b\xb5\xd8\x07\xd9\xe8\x8b\x65\x37\x90\xf8\xf4\
-\x83\xae\xfd\xe3\x3f\x92\x87\x49\xbb\x7f\xea\xd4\x00\x88\x0e\x58\
-\xd6\xf9\xbb\xbf\x53\xac\x49\x99\x4d\xc6\xaf\x6d\x6f\x5b\xbf\x86\
-\xed\x4a\x64\x33\xb8\x85\xbe\xb3\xe6\xa8\x4a\x0f\x88\xbb\x0c\x1e\
-\xce\x3b\xfc\xce\x77\xd2\xfc\x5b\xdf\xaa\xc6\x63\x4a\x74\xe9\x12\
-\x6d\xfd\xd6\x6f\x91\x00\x8b\x85\x65\xdf\x00\x70\x79\x61\xba\x69\
-\xc1\xc2\x8c\x81\x74\x5d\x59\x33\x02\x5a\xca\xe5\x5c\xe5\x36\xb2\
-\x25\xc1\x33\xe1\xcc\xfa\x3f\x2e\xce\x5e\x01\x04\x37\x3c\xde\x7e\
-\xea\xd9\x39\xcc\x11\xcb\x93\xec\xb3\x98\x11\x9a\x81\x76\xd6\xa0\
-\xfd\x97\xae\x68\x33\xcb\x16\x16\x16\xc8\xf9\x83\x3f\xa0\xe0\xfc\
-\x79\xf2\x84\xd0\x69\x2c\xd4\x0a\x9b\xe0\x27\x3e\x41\x5b\x7f\xfd\
-\xd7\xd4\xc1\x43\x48\x90\xa3\x4b\x90\x64\x88\xc1\x48\x65\x9a\x2c\
-\x3f\xb0\x3d\x4b\x53\xd5\x97\x59\x4a\xcb\x16\xdb\xee\x0a\x36\xcf\
-\xa1\xef\xc3\xc8\xc0\xcc\xbf\xed\x6d\x05\x78\xb6\x94\xf0\x3e\x66\
-\xea\x0f\xff\x90\x20\x43\x7a\xce\xcd\xfa\x59\x28\x44\x8f\xf9\x46\
-\xa8\x1c\xda\x5c\x00\x28\x49\x9b\x2b\xc8\x07\x63\x70\xa4\x42\x19\
-\x8f\x7c\x8b\xb6\x88\xcb\x43\x0f\x3d\x94\x79\x7b\x05\x90\xcc\xcd\
-\x64\xeb\xa9\x8b\x27\xe7\xe6\xe6\xf2\xa1\x24\x71\x72\x13\x01\x35\
-\x80\x03\x5f\x16\x18\x46\x42\x37\x91\x0b\x66\xc5\xc8\x78\x94\x8e\
-\x1c\xa1\x0c\xd1\x3b\x02\x03\x9b\xdf\xf8\x06\x35\xaf\x5c\xa1\x90\
-\x4d\x4d\x47\x4f\x66\x99\x96\x26\x83\xce\x7f\x2f\xd6\x0d\x48\x92\
-\x10\xeb\x1d\xd4\x93\x6f\x7e\x33\x99\x62\x02\x98\x09\x5a\x02\x5a\
-\x70\xe8\x75\xaf\xa3\xe6\x3f\xfc\x03\x45\x66\xca\x36\x18\x91\x7b\
-\xe4\x4b\x07\xe7\x79\x68\xbb\x53\x53\x88\xbe\xc6\xd3\x8b\x45\x34\
-\x8d\xb2\x40\x47\x31\xb5\x5a\xad\x44\xad\xef\x25\xa0\x79\x39\x14\
-\xf8\xaf\x1c\x4e\x53\xed\xe0\xc1\x16\x00\x67\xab\x8e\xc4\x06\x44\
-\x6b\x76\xcc\x54\x9d\x0e\xa1\x6d\x00\x26\xc1\x44\xc9\xb9\x36\x3e\
-\x26\x49\x78\x1e\xcd\xd7\x32\x5f\x5f\x59\x80\x06\x97\x16\xd8\x9b\
-\x80\x1a\xa1\x4e\x20\xbb\xe2\x94\xcb\xc6\x87\xf7\x04\x2d\x00\xa8\
-\xfd\x2e\x74\x69\xf2\xd5\xaf\x52\x93\x1f\x1c\x91\xad\x1c\xc1\x0b\
-\xf0\x52\x06\xaf\x58\x86\x1c\x04\x87\x6b\x89\xd0\x02\x5a\xe8\x00\
-\x22\x8a\xf1\x64\x75\x23\xa0\xed\x4c\x64\x0f\x01\x8d\xbf\x5a\x28\
-\x85\x8d\xed\xbb\x58\x40\x93\xd1\x5c\x79\xce\xa6\x35\x90\x69\x21\
-\x03\x2a\x47\x4f\xf8\x33\x06\x2f\xc5\xd2\x04\x81\xbc\xdd\xd6\xac\
-\xed\x8d\x9c\xb7\x06\x6f\x00\xb8\xc1\xb6\x40\x0d\x5c\xd7\xb0\xce\
-\xf8\x5c\x2b\x9d\xcc\x3e\xcc\xc3\x1b\x36\xd3\x32\x10\x50\x52\xc7\
-\xd1\xec\x2b\x6a\xcc\x53\xc2\x85\xb9\x50\x3f\x15\x5a\x91\xb9\x40\
-\xd1\x02\x7a\x40\xad\xa0\x78\x7b\x09\x68\x64\x9b\x17\x92\x4e\x38\
-\x33\x75\x78\xcc\xa6\x7d\x00\xc4\x80\x80\x36\xef\x73\x1d\x87\xc1\
-\x63\xd9\xa1\x25\x88\xeb\x32\xc3\x2c\xcb\x6e\x17\x34\xbb\xbe\x6f\
-\x3b\xe0\x79\x2a\x66\x3f\x84\x31\xe0\x0d\xb7\x91\x4e\x03\x29\x2c\
-\xda\xda\xe2\xb1\x77\x07\x90\x81\xec\x8b\x61\x5f\xc6\x63\x60\x17\
-\x30\x33\x13\x21\xea\x6e\xe0\x6c\xfd\xf1\x52\x66\x05\x74\x96\x95\
-\xda\x84\xc2\x9f\xb8\x29\x06\xf6\xfb\x3f\xb7\xec\x8e\xed\x3e\xf6\
-\xf8\x89\x91\xa9\x29\xa7\x16\x86\xdc\x21\x67\x95\x4d\x76\xc4\x0a\
-\xe0\xb6\xea\x47\xbf\xc9\xc2\x20\x43\x1c\xbb\xc6\xfb\x01\x68\xc0\
-\xe6\xe5\x38\xbd\xc0\xed\x03\xda\x00\x48\xfb\x80\xe8\xa0\x56\x18\
-\x24\xf8\xb7\xe0\xa7\x7e\xca\xa4\xb0\x54\x35\x2c\x14\x61\xc8\xd2\
-\x0a\x34\x92\x03\xa6\xcb\x35\x31\xd2\xc5\xf8\x42\x06\x0f\xc7\x3a\
-\xb3\x10\xd0\x86\x4c\x10\xd0\x0e\x19\x78\x8c\x80\xb6\xc5\xdb\x4b\
-\x40\x67\xcb\x2b\xa7\x83\x72\x05\x39\xfc\x92\xab\xf4\x99\xcd\xcb\
-\x71\xd5\x1d\x33\x70\x00\x31\x02\x78\xdf\xe1\xdc\x18\x80\x9b\xc2\
-\xcb\x1b\x1f\x0c\xc8\x91\x5e\x5f\x44\x84\x5d\x00\x03\xc7\xa4\xdc\
-\x13\x30\xda\x07\xa8\xc1\xe5\xe0\xfe\x80\x1f\xf0\xc7\x3e\x46\xfe\
-\x89\x13\xe4\xff\xd8\x8f\x31\xf3\x0c\x90\x2a\x3b\xd3\xfa\xf0\x87\
-\xe9\xc9\xcf\x7e\x96\x12\x0d\x60\x6f\x04\x36\x91\xd7\x98\x32\x2a\
-\xfb\xbf\xc0\xf7\xa4\x3b\x5c\xdb\xd0\xd7\xb1\x02\x5a\x26\x51\xbd\
-\x5b\x40\x9b\xb6\x37\x28\xa0\xc1\x20\xe1\xbc\x7c\x3c\x8e\x5d\x08\
-\x5d\x76\x30\x5a\x40\xa3\x8d\xc2\x91\x53\x31\x2e\xe7\x68\x0b\x00\
-\xbf\x8e\x73\xaa\xf7\xdc\x43\xaf\xf8\x95\x5f\x51\x29\x75\x53\x62\
-\x24\x0e\xb6\x3e\xf0\x01\x72\x71\x6c\xd5\x82\xf8\x4f\x5c\x0e\xb6\
-\x8d\x2f\x8e\x90\x5e\xeb\xfc\xfe\xef\x53\xf9\x4b\x5f\x22\x1f\x1a\
-\xd4\xe3\x37\x7d\x10\xeb\x0d\xbc\xca\xfc\x36\xf2\x7f\x4b\x79\xde\
-\xcf\x3e\x6b\xce\xac\x49\xd9\xc2\x8c\xfe\x43\x7b\x78\x66\x26\xec\
-\x89\xea\x42\xb0\x1b\x5c\xc1\x49\x56\x40\xdf\xfc\x13\xdf\x36\xd5\
-\x46\x27\x66\xda\xcd\xe6\xf1\x11\x06\x43\x8b\x5b\x55\x65\x31\x07\
-\x4d\xa1\xe1\x64\x31\x73\xb8\x0a\x30\xcb\xc8\xf1\x9d\xf8\x8d\xdf\
-\x18\xd0\x61\xc1\xf1\xe3\x34\x85\xf4\x55\xfb\x17\x7e\x41\x09\x67\
-\xe7\xbb\x04\x1e\x40\x1b\x60\xe3\x1a\x12\x19\x8d\xbf\xf9\x1b\x1a\
-\x82\xd6\x74\x8a\x08\xbd\xda\x93\xa6\x1f\x0c\x20\x48\x1e\x98\xe0\
-\x61\xc1\x85\xd6\xf3\xfa\x04\x34\x09\xb0\x30\xd5\xe8\x59\x01\x6d\
-\x3f\x3a\x77\x7a\x03\x88\x37\xda\xb9\xf0\xd4\x7c\x9a\xa6\x95\x89\
-\x52\x89\xa3\x2e\x07\x11\x36\x55\x2d\x7c\x01\x5e\x1a\x86\x5a\xf4\
-\xb2\xcf\x83\x99\x1c\x7a\xd7\xbb\x06\xc0\x83\xff\x51\xa6\x54\xc6\
-\x3b\xd9\xb1\x9f\xf9\x19\x72\x7d\xdf\x0a\xe2\x17\xb2\x34\x6d\x2b\
-\xa0\xed\xb6\xbe\x63\x79\x4a\xb7\x86\xba\xa8\x97\x83\x51\x57\x07\
-\x89\x9e\xc4\x29\xd8\x67\x02\x88\x5a\x77\x94\x80\x9e\x89\xb0\x58\
-\x37\x02\xda\xde\x13\x35\xba\x05\x34\x19\x86\xda\x00\xc2\x25\xa0\
-\xe8\xf2\x73\xa7\xab\xb5\x5a\x5e\xd1\xe9\x2b\x3d\x7d\x43\x3b\x86\
-\x29\xc6\x00\x31\x2d\xde\x62\x85\x2c\x9c\x31\x80\xf2\xb1\x63\x64\
-\x0a\x7c\x10\xbf\x83\xe8\x79\x0f\x31\xf2\xfa\xd7\x53\x69\x72\xd2\
-\x32\xe1\x85\x80\x68\x40\xe3\xe5\xde\xc0\xd9\x6c\xcb\x60\xce\x4f\
-\xaf\xdb\xbe\xec\xb9\x36\xfa\x6a\x96\x16\x00\x06\xa8\xde\xd4\xe4\
-\x1a\xe9\xa2\x32\xd0\x36\x81\xaa\x0b\x0b\xe8\x7e\x13\xb6\x02\x3a\
-\xe0\xb4\x54\xf6\xf2\xe1\x24\x91\xa0\x38\x9b\xac\x62\x60\x52\x00\
-\x97\x59\x69\xa2\x2e\x58\xf6\x3c\x23\x62\x8d\x06\xe3\xda\xfb\x26\
-\x0c\x12\x43\x62\xdf\x66\x97\x19\x0a\x63\x7e\x5d\x6d\xd1\x1b\xcd\
-\x6e\x3b\x22\x5b\x90\x06\x41\xcc\x34\x73\xcd\x8c\xa3\xd7\xa4\xb5\
-\xf9\x1a\x49\xa3\xfc\x5f\x75\x64\x38\x06\xd5\x4c\x9a\x09\x64\xb6\
-\xc3\xea\x13\xd0\x16\xc0\xfe\x0c\x74\xd2\xd8\xbe\xbb\xc6\x38\xaa\
-\x6f\xa0\x5b\x0a\xc0\x88\x85\x31\x33\xb2\x98\x7d\x98\x81\x97\x18\
-\x54\x44\xdc\xca\xe1\xc3\x3d\x89\x03\xae\x06\x40\x87\x53\x4d\xd0\
-\x86\xb1\x10\x16\xb0\xc1\x3f\x56\xb1\x20\xaa\xf6\x20\xb0\xa2\x0f\
-\xb0\x55\x58\xc0\x16\xae\x07\xed\xa9\x04\x75\x8d\xdf\xc0\xc1\xad\
-\xb8\xc6\xa7\x19\x73\x37\xeb\xf6\x5c\x63\xb6\xbd\x40\xb3\x18\x9f\
-\x9f\x8b\x74\xe6\x25\x5f\x35\x02\x5a\xbf\xc2\x1c\x10\xd0\xd6\xb4\
-\x7b\x04\xf4\xc6\xd6\xc1\x24\x8a\xe6\x47\x30\x98\xa4\x48\x6e\x86\
-\x90\x23\x00\x8e\x67\x22\x03\x0c\x28\x13\x0a\x5e\xd4\x04\xbf\xfc\
-\xcb\x7b\xa7\xb0\x70\x4e\x8c\x0c\xf4\x2a\xa2\x62\x6a\x00\xb1\x83\
-\xe8\x01\x49\x5a\xbb\xb9\x25\x2b\x73\xd4\x2b\x60\x7e\x19\xc9\x82\
-\xbb\xf1\xa5\xc1\xc8\xb9\x73\x4a\x25\xb4\xbe\xf9\x4d\x6a\x7c\xf0\
-\x83\x24\x10\x50\xa0\x14\xba\x01\x1b\x00\x32\x73\x1c\x0b\x62\x51\
-\x05\xaa\x3b\xab\x05\x34\x5f\x59\xe5\x0e\x20\xa0\x55\x96\x28\x89\
-\xb0\xdb\x0a\xe8\x9b\x44\xe1\x78\x34\xb9\x70\xfe\x24\x1c\xbe\xa8\
-\x44\x91\x9e\x7c\xe3\xe9\xa6\x00\x21\x35\xaf\x31\x85\xe8\x35\x29\
-\x06\x16\x42\xd5\xc5\x4d\x78\x6f\x7a\x93\xd1\x61\xea\x7d\x6c\x09\
-\xed\xe4\xd1\x47\xe9\xb9\x0f\x7d\x88\xb6\xf7\x32\x5d\x21\xec\xb6\
-\x3e\x16\x0e\x16\x7b\xfc\x22\x6e\x68\xfc\x95\xaf\xa4\x13\xbf\xf6\
-\x6b\x44\x86\xd5\xd8\x56\x83\x94\xe2\x97\x57\x0d\x28\x02\x7e\xf7\
-\xb2\x1d\xc7\x7b\x04\x1c\xc3\x40\x6b\xc6\x66\x3a\xe7\x63\xe9\x00\
-\xc0\xae\xe7\x75\xc3\x25\x97\xf2\xbd\x05\xb4\x05\x50\x1f\xdc\xaa\
-\x72\x33\x5f\xab\x9f\x0d\x92\x24\xe5\x29\x5e\x8c\x01\xa4\x1c\x81\
-\x4d\xca\x5c\x08\x0b\x5c\x17\x5b\xea\x08\x32\x95\x3f\xff\x73\xaa\
-\x3e\xf6\x18\x05\x60\x44\xc0\x13\x7c\x6c\xef\xe0\x55\xe6\x33\x7f\
-\xf1\x17\xf4\x64\xbd\x4e\xfd\xc5\x02\x65\xdb\xe8\x7f\x6f\xf0\xba\
-\x1c\x51\x52\x44\xd1\x3b\xa1\x39\x71\xed\x01\x80\x1d\x58\xc0\xc4\
-\x03\x0f\x50\xfc\x73\x3f\x47\x8d\x38\xee\xd3\x7d\x36\xe0\x24\x1a\
-\xbc\x9e\x74\xd6\xb0\x07\x01\x5d\xab\xd6\xf5\x78\xe0\xff\x6e\x2d\
-\xa0\x2d\x80\x33\x33\x01\x44\xbb\x07\xcc\x5c\x29\x3a\xe1\xcb\x30\
-\x7d\xf3\x94\xbf\x62\xea\xb2\x80\x2e\x82\x86\xec\x33\x23\xea\x02\
-\xf5\x32\x5e\x19\x2e\x03\xb0\x89\xcf\x7c\x86\xfc\xe2\xa9\x2e\x03\
-\xf8\x88\xc8\xb2\xb6\x87\x81\x96\x75\xb6\xf4\x1f\x63\x81\x31\xa5\
-\xc3\x89\x5b\xa4\xa7\x9c\xa1\xa1\x1e\xc9\x64\xaa\xf9\x74\x38\x47\
-\xe4\x1f\xc6\x58\x36\x4c\x60\xe9\x36\x5f\x6e\xdb\xe0\xa1\xb7\x3b\
-\x0e\x67\xa0\x3b\xdd\x7f\xb2\x29\xd4\xf6\x41\x01\x3d\x00\x60\xbb\
-\x5d\xc2\xd4\x85\xfd\x99\x73\x20\xeb\xb4\x4f\x96\x39\x68\xf0\x8d\
-\x15\x11\x58\x1a\x10\x2c\x60\x7b\x46\xc7\x6d\xae\x5a\x76\x58\xf2\
-\xdc\x9c\x75\xba\xf4\x06\x16\xbb\xb4\xcc\xb3\xe0\x17\x2f\x91\x2a\
-\xe3\xe3\xdd\xe9\xab\x81\x14\x96\x2a\x98\xda\x71\x49\x7b\xb5\xa4\
-\x36\x57\x3b\x7d\xb3\xfe\x8f\x73\x80\x73\x33\xff\x4f\x40\x93\xe0\
-\xe3\xb5\x80\x46\x30\xc4\xbc\xa1\xd4\x23\xa0\x07\x4c\x38\x48\x83\
-\x91\xe4\xe9\x8b\x07\x31\x71\xae\x54\xc0\xba\x44\xbf\x25\x33\xc0\
-\x0d\x54\xb2\x0c\xbc\xd5\xdc\xd6\x96\x7d\xb6\x33\x58\x03\x45\x74\
-\xa5\x33\xf5\xba\x1e\x2c\x82\x1a\x17\x1b\xb0\x2c\x88\x06\x40\xc9\
-\x0a\xa2\x00\x4b\x16\x40\x19\x2d\x99\x62\x89\x20\xd2\xc3\x46\x17\
-\xdb\x90\x81\x8e\x75\x06\x1a\xff\x4a\xed\x91\xed\x27\x1c\x3b\x56\
-\x40\xf7\x15\x47\xe7\x3f\x53\x99\x5e\xbb\x76\x37\x5f\xcb\xe7\xa0\
-\x61\xa6\x3a\xbc\xec\x4e\xf7\x14\x35\xdd\x63\x22\x6e\x8e\xb5\xdb\
-\x6c\x4d\xcc\xfe\xbd\x6b\x4f\x3e\xce\xf6\x61\xae\x69\xaf\x15\x33\
-\x38\xf8\x80\xc8\x97\xd2\x7c\x7d\x35\xf8\x11\x11\xfb\x42\x64\xc0\
-\x97\x4d\x1f\x06\x34\xfb\xda\xd2\x0a\xe8\xe2\x1a\x01\x33\x69\x6a\
-\x6a\xad\x78\x98\x45\x12\xd5\x0a\xe8\xad\x41\x01\x6d\x01\xc4\x20\
-\x86\x52\x97\x73\xf8\x9d\x7b\xfc\x2c\x53\x83\x8c\xb8\x0a\x61\x2e\
-\xc8\xb5\xff\xa6\x7b\x81\xb4\xc0\xda\x6d\xe6\xdc\xbd\xb7\xdb\x3a\
-\x98\x97\x33\xa0\x17\x4b\x0b\x66\xc2\xf2\x03\x55\x22\x68\xf9\xae\
-\xcb\xac\x33\x20\x6a\x00\x01\x24\xbf\x8f\x39\x8f\xe8\x1f\x1a\xa0\
-\x6c\xb5\xd3\x37\x3b\x66\xe5\xff\x2a\x23\xc3\x89\xf4\x5c\x9d\x7f\
-\x76\x84\x02\xaf\x5f\x40\xaf\xaf\xaf\xef\x19\xe3\x38\x7a\xe4\x14\
-\x12\x6a\x67\xce\xcd\x32\xa7\xe3\x38\xd6\x14\xfb\xa2\xa4\x29\x3d\
-\xa6\xb5\x57\x80\xd8\xdf\x6c\x07\xa3\xaf\x35\xe3\xfe\x08\xdb\xb3\
-\x7f\x11\x7e\x79\x04\x1f\x2a\x8d\xfd\xd1\x1f\x51\x80\x68\xeb\x1f\
-\x3d\x4a\x3e\x6b\x50\x04\xbb\x04\xcc\xfb\x26\x92\x17\x5f\xe7\xfc\
-\xa5\xf5\xdb\xbd\x3e\xd0\x98\xb4\x5e\xaa\xfd\xa5\x85\xf9\xb0\xb8\
-\xce\x8a\x15\xec\xce\x6a\x9e\x01\x72\xd1\x6e\x0f\x0a\x68\x5b\x3c\
-\x44\xda\xd4\xab\x78\xc3\x78\x8c\xcf\xec\xb6\xda\xe7\x3a\x69\xea\
-\xd8\x4e\x6e\x02\xca\x1e\x12\x82\xba\x9d\xbd\x6d\xdb\x2c\xcc\xad\
-\x40\xec\xd6\x85\x83\xc1\x64\x20\xe0\x7c\x07\xf7\xb4\x82\x74\xd5\
-\x59\x88\xe7\x29\xcc\x82\x52\xbc\xcc\xba\x82\x77\xc1\xdf\x82\xfe\
-\xbb\x26\xa5\xf1\xdf\xbd\x3a\xb0\xc7\x92\xac\xff\x73\x50\xdd\x99\
-\xa9\x18\x07\x6d\xf0\x99\x84\x8a\x1d\x4b\x39\xe5\x85\x71\xb7\xad\
-\xff\xdb\x93\x81\x15\x59\xf2\xf2\xac\x4d\xa7\x4f\xfd\x8f\xec\x1b\
-\x8f\xbd\xfe\x9a\xe3\x8c\x01\x55\x11\xe4\x39\x57\xf2\x07\x67\x20\
-\x83\x9a\x50\xca\x5e\x10\xfb\x66\x15\x5c\x1d\x7d\x9c\x5d\xdf\x27\
-\xa0\x88\x41\x36\xf6\x3c\x98\x25\x6c\x5f\x42\x4a\x5f\x5e\xbf\xae\
-\xdf\xb3\x18\x46\xf5\x07\x3e\xfd\x2e\xc6\xb0\x4f\x07\x10\x6c\x33\
-\x35\x50\x01\xc4\x0a\x68\x01\x01\xcd\xe7\xe9\x04\x7e\x1b\x01\x64\
-\x1c\xfa\xef\xd1\x94\x6e\x52\xbc\x0a\xe6\x6b\xb9\xac\xc5\xee\x99\
-\xd3\xcb\x95\xa3\x87\x7e\xbd\x74\xfe\xc9\xfb\xb3\xfa\xe6\x9d\xc9\
-\xc6\xe6\x42\x33\x0c\x4b\x89\xbe\x59\xe9\xa4\xa9\x60\x30\x3d\x66\
-\x55\xff\xac\xa4\xff\x26\xad\x69\xda\x9b\xee\x13\xc5\x8e\xde\xa6\
-\xfb\xb2\x6c\x55\x8c\xd8\xab\x08\x7b\x5c\xaf\x0a\x30\x4b\x0b\x56\
-\x77\x5b\x6b\x56\x1b\x38\x06\xb4\x60\xd9\xf7\x72\x51\xab\xd5\x39\
-\x77\x85\x33\x6e\x90\xec\xfe\x84\x63\xff\xe2\x6d\x6f\xcb\xa8\x3a\
-\x91\x4f\xe0\xf4\xb6\x53\x2d\x5f\x73\xef\x79\xc9\x97\x89\xc4\xa5\
-\xb2\xa0\x63\xd4\x0e\xc7\xd2\x95\xb5\xc3\xf9\xda\xda\x48\xba\xb4\
-\x5c\xea\x6c\x35\x82\x0e\x8b\x6b\x22\x35\xcf\x75\x0b\x40\xdd\xee\
-\x8c\xb3\x10\x83\xda\xcf\x9a\xba\x01\xc0\x02\x59\x6c\x13\xbd\x6c\
-\xb5\x80\x1a\xd0\xcd\xb9\xbc\xb4\x3e\x69\x80\x71\x64\xa4\x4b\x5f\
-\x1b\xcc\x33\xe2\xd9\xfa\x46\xd4\x0a\x32\xd0\x56\x30\xa1\xa1\x32\
-\xd0\xd9\x0a\x10\xb4\x02\xfa\x56\x00\xba\xd3\xae\x83\x61\x6c\x7b\
-\x51\xee\x63\xb8\xd3\xb9\x90\x57\x78\xa8\xe8\x74\x54\x94\xcb\x91\
-\x77\xf4\x8e\x58\x1c\x3b\x34\x13\x48\xe1\x56\x65\xee\x66\x9b\x9b\
-\xe3\xd9\xea\x5a\x90\xaf\xac\xf9\x9d\xa5\x95\x20\xec\x74\x44\xc7\
-\x3c\x79\xcb\x50\x6d\xa2\x37\xf7\x65\x56\x43\x59\xf0\x2c\x4b\x0d\
-\xb0\xa6\xdd\xcd\x58\x53\x8d\x7f\xd3\x7a\xd1\x82\x67\xdb\x7a\xbf\
-\x99\x06\x76\x89\x67\xc3\x44\x17\x4b\x6f\xae\x2b\x03\xad\x07\x00\
-\x01\x4d\xfb\x09\x68\x0b\x60\x44\x51\xea\x92\x1b\x7b\x52\x84\x08\
-\xc8\xd7\x1d\xc7\xe3\x9e\xab\xb8\x72\x87\x04\x9d\xc3\x08\x63\x22\
-\xb1\x89\xa1\x1d\xe4\x0c\xa3\x7b\xe0\xc0\xb6\x3b\x79\x60\x9c\xce\
-\x9c\xa6\x12\xdf\x5f\x18\x0a\x00\x0a\x50\xd7\xbd\x78\x71\xc9\x6f\
-\x6f\x35\xfc\x88\x59\xaa\xc5\xab\x66\x90\x65\xe9\x00\xa0\xa2\x2b\
-\x38\x18\x86\x39\xb6\x6d\xb6\xeb\x6d\x9a\xf9\x06\x40\x7d\x6c\x3f\
-\x2b\x85\xd8\x3b\x5f\x68\x4d\x57\x6f\xe7\xd9\x07\x11\xbf\xc2\xfc\
-\xa7\x08\x68\x0b\xe0\x3c\xcd\x23\xd1\xbc\x2b\xd0\x79\x1b\xa8\xe7\
-\x99\x93\xaf\x39\x52\x94\x8a\x3f\x15\x7a\x8c\x88\x8e\xe2\x51\x94\
-\xa1\x2a\xeb\x78\x08\x07\x05\x93\x43\xd2\xba\xd4\xa3\x9e\x22\x68\
-\x2f\xef\xf0\xa1\xba\x77\xe4\xd0\x78\x89\x5e\x42\xc3\xec\xb0\x37\
-\x14\x4b\xbd\x7c\x75\xcd\x6f\x2f\x2d\x07\xed\x4e\x28\xe2\xc2\x7c\
-\x48\x03\x60\xd8\x65\x4a\x9f\x79\xda\xfd\xa2\xaf\xed\x68\xc6\x59\
-\x90\x1d\x87\x97\x5c\xad\x99\x9b\xe3\xad\x7c\xb1\x7e\xaf\x4b\xc6\
-\x04\x82\x54\x06\xda\x52\xcb\x0a\xe8\x5b\x24\x10\x06\xb3\x31\x51\
-\x14\xa5\x07\x0e\x1c\x68\x36\x93\xa6\x1f\x64\x41\x23\x75\xd2\xd0\
-\x77\x9c\x0c\x80\x95\x30\x3d\x6a\xe4\x19\x1d\x86\x3a\xe4\x58\xb2\
-\x4a\x84\x16\xc9\x3b\x8a\xef\x5d\x97\x05\xd1\x2c\x71\x01\xa8\x44\
-\x00\x54\x38\xe4\x4c\x4d\x36\xf0\x45\x00\x58\x7a\x37\xf1\xa4\x6a\
-\x3c\xec\x38\xd9\xca\xda\x98\x61\xe9\x6e\x03\x2c\xc5\xf3\x31\x66\
-\x25\x2c\x20\xfd\xd1\x76\x6f\x30\xed\x3e\xc3\x40\x0d\x9a\x65\xa5\
-\x7d\x38\x26\x02\x77\x05\x1a\x53\x6b\xb5\x5a\x02\x5b\x55\x1d\x15\
-\x81\xbd\xa7\xac\x72\x06\x7a\x9f\x22\x50\xd5\xcf\x79\xf2\x2f\xb3\
-\x01\x48\x17\xd3\xa1\x1a\x98\x58\xc9\xbd\xdc\x07\x14\x0b\x44\x19\
-\xdb\xb4\x23\x78\x89\x75\x80\x2a\x74\xc0\xa2\x83\xdc\x28\xec\x66\
-\x81\x6c\x99\xc3\xc6\xee\xac\xe8\x94\x06\x41\xdd\x95\xce\x04\x28\
-\x96\xd6\x15\x4b\x01\x2c\x58\xba\x12\xb4\xe3\x58\xc4\x46\xe8\xf6\
-\x83\x6a\x81\xe5\x3a\xc0\x32\x32\x0c\xdc\xfb\x21\xd8\x6f\xa2\x8b\
-\x99\x87\x44\xcd\x5d\x97\x8e\x9e\xba\x6b\x67\xe8\x55\xf7\x3e\x07\
-\xcb\x3d\x8f\x01\x2f\x72\x0e\x30\xa7\xec\x9b\x4e\x4e\x1b\x79\xbe\
-\xb3\xcc\x00\x32\x03\xbf\xf0\x85\x2f\xdc\x5c\xc6\x48\x8d\x48\xfe\
-\xee\x77\xbf\x3b\xc5\xb4\x28\xc7\xea\x4e\x0a\x65\x13\x38\x29\x26\
-\x26\x25\xc4\x07\xf5\x23\x80\x53\x99\xeb\x0a\x18\xf8\x3a\x78\x38\
-\x5b\x8c\x71\xc9\xc9\x68\x5e\xb2\x41\x73\xf8\x17\x74\xb0\x08\x0c\
-\x8b\x0a\x3b\xa9\xd7\x35\x4b\x85\x65\xa9\x10\x53\x7c\x41\x67\x6a\
-\x0a\x2c\x9d\x1a\xf7\xcf\x9c\x51\x1f\x41\x8e\xb7\xdb\x2e\xa2\xfd\
-\x28\x40\xf5\xa3\xc5\x65\xbf\xb5\xd5\xf0\x3a\x66\x3e\x6c\xc1\x30\
-\x11\x7b\x80\xa1\xa6\x6d\xb7\xdb\x00\x95\xdb\xcc\x8b\x89\xbe\xca\
-\xf4\xec\x27\x6c\x92\x3d\x8b\xf9\x06\xd0\x94\x7d\xfd\x9f\x25\x46\
-\x31\x22\x80\xe8\xcd\xcf\x6f\x89\x7a\x7d\x56\x80\x8d\x88\x17\x7e\
-\x99\x3d\x42\x92\x94\x84\xe7\x65\x23\x99\xe7\x09\x7d\x92\x38\x60\
-\x3a\x70\x05\x4d\x53\xc6\x0d\xd2\x25\x93\x0b\x20\x6c\x71\x03\xf9\
-\x9e\x2c\xc5\x86\xf9\xbe\xec\xe9\x20\x4b\x21\xe4\xe1\x4b\x61\xf6\
-\xab\x5e\xba\xbc\xea\xb7\x96\x57\x83\x76\x92\x18\x5f\x4a\xd2\x32\
-\xcf\x06\xa5\x5e\x76\xda\x77\xc8\x9a\x85\xfa\x9c\x82\x81\x65\xac\
-\x1f\x79\xfb\xdb\x6e\x40\x03\x5e\x64\xd7\x84\x61\x3e\x9a\xc3\x8c\
-\x71\xe4\x2a\x92\xa8\x57\x84\x88\x5b\x8f\x3e\xfa\x74\x8b\x01\x94\
-\x28\xb7\xf4\x81\xc5\x01\x0c\xa4\xa2\x2a\x9b\x34\xff\x26\x4a\xbd\
-\x9e\x24\xde\xbc\x57\xaa\x65\x0e\x82\x9f\xd3\xf1\xf3\xa8\x42\x54\
-\xe5\xf7\x25\x3b\x0c\x68\x0a\xff\x81\x13\xea\x0c\x9e\x27\xe4\x04\
-\x91\x0f\xbd\x95\xad\x09\x99\xcd\x10\x0d\xb2\xd4\x29\x58\x2a\xc0\
-\x52\xa9\xf5\x47\x01\xaa\x61\xa9\x50\x2c\x95\xfc\x50\x1c\x17\xa2\
-\x6a\x6a\xcb\x99\x02\x4b\xf1\xc9\x48\x99\xc7\xc9\x2c\x5d\x5d\x55\
-\x2c\xed\x80\xa5\xed\xed\xa6\x17\xda\x84\x44\x2f\x1b\xbb\x58\x98\
-\x77\x89\x6b\x2a\x6a\xd9\x75\x72\x31\x5c\x5d\x67\xf2\x61\xc3\x55\
-\x0e\x99\x22\x27\x09\xd3\x5e\x8f\x91\x9d\x2e\x65\x31\xdd\x4e\xf1\
-\x4c\xa3\x0f\xc8\x0c\x20\x8a\x0b\x17\x2e\x08\xda\xa2\x8e\x3b\xeb\
-\x9a\xe3\xd0\xeb\x4e\xa9\x68\xb7\x59\x5d\x0d\x0f\x0f\xe3\xde\x5a\
-\xbc\xde\x4c\x1c\x31\x52\x12\xac\xe2\xf3\x4d\xc8\xa1\x09\x75\x63\
-\x0e\xad\x1a\x96\x4a\x97\x96\x8a\x2b\x2d\x68\x3d\x28\x6e\x68\x5f\
-\x2a\x15\xc0\x86\xa5\x02\x66\x0f\x10\xe7\x0b\x67\xb6\x6e\x58\x2a\
-\xaa\x15\x72\x8f\x1d\xdd\xf0\x8e\x1d\x19\xe3\x41\x8c\x66\xb9\x83\
-\xa7\x3c\xca\x7e\x34\x59\x59\xf5\x76\xc1\xd2\x10\x2c\x8d\x58\x34\
-\x13\xf5\xff\x75\xa7\x95\x45\x58\x0e\xcf\xce\xf0\xa0\x43\x5c\x2c\
-\x15\x8c\x7f\x96\xf3\x70\x17\x5d\x24\x45\xfd\xd4\x97\xed\xb0\x14\
-\x1a\x4c\x6e\x0f\xc0\x41\x20\xa5\x40\x31\xc0\xf1\x4f\xe0\x71\x4a\
-\xc7\xcc\xae\xf1\xd3\x47\xca\x68\x77\x76\x76\x22\xe4\xe3\x02\x6e\
-\x43\x54\x77\x7c\x00\x9a\xa6\x8a\x4a\x4d\x24\x49\x86\x39\x8c\x59\
-\x96\x7a\x13\x59\x9e\x31\x05\xd6\xf0\xcf\x8c\xa7\xf7\x2d\xc1\xa8\
-\xe6\x15\xc0\x0e\x19\x96\xf2\xd5\x35\xd8\xa2\x60\x29\x40\xc5\xca\
-\x9c\xd0\xb8\xac\x61\x70\xd3\xe4\x32\x4b\xa7\x37\x9d\xa9\xe9\x71\
-\xff\xdc\x59\xaa\xf0\xae\x76\xdb\x01\x43\xc7\x50\xbd\xce\x8d\xa5\
-\xa0\xd9\xdc\xf1\x42\x95\xdb\xb4\xb3\x93\x2a\xfa\x28\xdf\x7b\x0f\
-\xf7\xcf\x49\x84\x67\x49\x30\x03\xc4\x75\x18\x1a\x0c\xc8\x4b\x11\
-\x12\x14\x23\xf8\x67\xef\xbe\x27\xbf\x23\x6d\xda\x0c\xaa\x69\xf3\
-\x2f\x5c\x92\x2d\x25\xb2\x05\x2c\x75\xca\xba\x05\xf3\x77\x92\x11\
-\xde\x89\x2c\x90\x28\x58\x6a\x7d\x69\x4f\xd1\x6c\x54\x31\x4e\xb5\
-\x73\x62\x7f\xba\x9f\x2f\x35\x37\xc4\xbe\x14\xa7\x4a\xc2\x03\xcb\
-\xd6\xeb\xa3\x30\x7d\x17\x91\xdf\x15\x43\xe5\xc4\x3f\x72\xc7\x86\
-\xb3\x30\xb7\x84\xbd\x4f\xc1\xe0\x9b\x00\x6c\x29\x4f\xe5\xe3\x8e\
-\x23\x1a\x51\x94\xdf\xc0\x75\x3a\x57\x6b\x57\x93\x8f\xbf\xff\xe3\
-\x89\x44\xf9\x2e\x02\xb8\x3f\xa0\x36\xf1\x68\x59\xca\xc5\xb0\x14\
-\x24\x15\x6c\xf6\xf0\xa3\xea\x38\xe3\x4b\xb9\xdd\x1f\xa0\x7c\x12\
-\x33\xe6\xdd\x86\xa3\x4c\x3a\x27\x06\x85\x59\x6a\xc0\xb5\x60\xeb\
-\x62\x74\xa9\x12\x5a\x24\xa6\x0a\x2d\x95\x62\x75\x04\xcd\x44\x0a\
-\xcc\xaa\xa4\x9a\x62\xd4\xe1\x1b\xd9\x3d\xf0\x8b\xf3\x67\x60\xc2\
-\xeb\x42\x04\xcf\x63\x7c\x11\xb2\xcf\xe1\x83\x0f\x3e\x18\x72\x37\
-\xdf\x2d\x00\xbf\xf7\x2c\x05\xa8\xa6\xcd\x2c\xe5\x94\x1a\xb7\x99\
-\xa5\x6a\x9b\x02\x27\x9f\x71\x84\xa3\x06\x9c\xcb\x5c\x38\xc2\x9d\
-\x37\xe7\x18\x5f\x6a\x22\xbe\xb4\xf9\x81\x19\x30\x58\x69\x69\x6c\
-\x6b\xa2\x5d\xc3\xf2\x3a\xf6\x6e\x72\x37\xae\x10\xe7\x21\xdb\xea\
-\xae\xeb\x40\x8a\x22\xd0\x39\x4e\xe7\x6b\x5f\xfb\x5a\x07\xd1\x97\
-\x25\x5d\xfe\xdd\x32\xe1\xef\x31\x4b\x07\x41\xe5\x9f\x1b\xe5\xa5\
-\x61\x29\x4f\xee\xa3\x3e\x96\xfa\x8a\x9d\xa2\xf0\xa5\x19\x21\xae\
-\xea\x88\x8f\xc2\x66\x5f\x00\x5a\x00\x21\xc6\x51\x43\x6c\x6b\x63\
-\x3d\x83\xe9\x36\x40\xe0\xcb\x00\x93\x81\xdd\xf2\x29\x5e\xec\x74\
-\x9c\xe4\xc6\x8d\x1b\xbb\xec\x61\xcc\xaf\x54\x7e\xb7\x00\xfc\xfe\
-\xb1\x94\xa1\xaa\xeb\x15\x1b\xf1\xab\xe4\x80\xa5\x99\x61\x69\xbf\
-\x2f\xcd\xcc\x0a\x03\xe7\xcc\x81\x8c\x31\xe8\x9a\xc8\x5c\x4e\x02\
-\xfc\x0d\x78\xc5\x16\xfb\xb9\x5c\x8a\x26\x26\x07\xcd\x2c\x8b\x9b\
-\x10\x6c\x9c\x0b\xc0\x1f\xb4\x5f\x0d\x01\x9e\x34\xec\xfb\x01\x04\
-\x70\x7f\x40\xed\x27\x77\x96\xa1\xfb\xb0\x74\xc0\x97\x7a\x99\x9c\
-\x80\x39\x4a\x00\x9b\x33\x63\xd5\x67\xef\x88\xb6\x50\xb4\x35\x91\
-\x89\x4e\xe6\x8a\x0d\x37\xe3\x3f\x03\xc4\x12\xc0\xc5\x28\xf8\x85\
-\x92\x04\x2a\x38\x7f\xe0\x01\x80\x77\x9b\xe5\xff\x02\xd3\x92\xc8\
-\xa0\x5f\xad\x5e\x7c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x46\x5f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x00\x48\x00\x00\
-\x00\x48\x00\x46\xc9\x6b\x3e\x00\x00\x00\x09\x76\x70\x41\x67\x00\
-\x00\x00\x80\x00\x00\x00\x80\x00\x30\xe1\x31\x9a\x00\x00\x45\x88\
-\x49\x44\x41\x54\x78\xda\xe5\xbd\x77\x90\x24\xd9\x7d\xdf\xf9\x49\
-\x57\x95\x95\xe5\xbb\x5c\x7b\x33\xdd\xd3\xdd\xe3\xdd\xce\x7a\x37\
-\xd8\x85\x59\x80\x0b\x4b\x60\x09\x90\x20\xc0\x93\xa1\x08\x29\x74\
-\x27\x81\xa7\x7f\xc4\x0b\x31\x8e\x77\x11\xba\x88\x93\x22\xee\x2e\
-\x44\x4a\x21\x41\xa2\x28\x29\x08\x7a\x18\x92\x20\x16\xd8\x5d\x60\
-\x17\xbb\xb3\x66\xdc\x8e\x37\x3d\xed\x7d\x57\x55\x97\x77\x59\x95\
-\x79\x7f\x64\x65\x55\xb5\x9b\xe9\x9e\x9d\x21\x66\x96\xbf\x88\x8c\
-\xcc\xaa\x4a\x57\xef\xfb\x7d\xbf\xf7\x7b\xbf\xf7\x7b\xbf\x27\x98\
-\xe6\xab\xdc\x43\x11\x5a\xf6\xf6\x26\x6e\xb1\x97\xea\xc7\xf6\x26\
-\xb5\x6c\xe2\xba\xfd\xfa\x4d\x5e\x77\xae\x58\x7f\xae\x09\x54\x81\
-\x32\x50\x04\x0a\x40\xbe\xbe\x2f\xd5\x7f\x33\xea\xe7\xdd\x23\x39\
-\x71\x2f\xcb\xf7\x03\x8b\xfc\x01\xae\x15\xd8\x1c\x58\xa9\xe5\xf3\
-\x56\x80\xde\x6a\x93\x6f\xb1\x49\x80\xb2\xee\x3b\x65\x93\xf3\xec\
-\x77\x32\x00\x1d\x0b\xf0\x2c\xb0\x0a\x24\x80\x24\x90\xc6\x22\x43\
-\x05\xa8\x71\x4f\x49\x70\xff\xca\x76\x09\xd0\x0a\x68\x6b\x6d\x6b\
-\x3d\xde\xaa\x56\xde\x0a\x2c\x65\xdd\xde\x51\x3f\xb6\x37\xc7\x16\
-\xbf\x39\x00\xa5\x94\xce\x7b\xe2\xd7\x67\xa3\x82\x28\xc8\x08\x82\
-\x9c\x9a\x5e\x6a\xd3\x8b\x65\x07\x20\x08\x08\x82\x89\x69\x62\x98\
-\x55\xa3\x66\x54\xba\x8e\xee\xbe\x14\xdb\x3f\x70\x11\x98\xab\x6f\
-\x0b\x40\x1c\xc8\x61\x69\x87\xbf\x93\x24\x10\x6e\xd3\x04\xd8\xc0\
-\xdb\x00\x38\x01\x17\xa0\xd6\x8f\xd7\x03\x66\x6f\xf6\xf9\x36\xb8\
-\x8e\x96\x4d\xd9\xe2\xd8\x01\x38\x66\xdf\xbb\xd6\x2b\x88\x82\xa2\
-\x17\x4a\xae\xd4\xec\x4a\x9b\x20\x08\x92\x5e\x2c\xcb\x99\xf9\x84\
-\x07\xa0\x5a\xaa\xc8\xb9\xa5\x55\xcf\xed\xfe\x98\x16\x0a\xe3\x0e\
-\x87\xa9\x14\x0a\xa4\x67\xa6\x01\x08\xf4\xc6\x56\x8f\xfe\xea\xc7\
-\x7e\x10\xe8\x8d\x9e\x01\x6e\x02\xd3\xc0\x32\x96\x36\xb0\x9b\x84\
-\xbb\x4c\x82\xfb\xbb\x09\xb8\x1d\x01\x44\x2c\x60\x5c\x80\x17\x08\
-\xd4\x37\x1f\xe0\xa1\x49\x06\x9b\x1c\xad\x60\xda\x9f\x9d\xcb\x57\
-\xa6\xda\xf5\x42\xd9\x8d\x20\x38\x56\xae\x4d\xc7\x04\x41\x90\x0a\
-\xc9\xac\x5a\x5c\xcd\xaa\x00\xb9\xc5\xa4\xa7\x5a\xd6\xb7\xd4\x46\
-\xfe\x9e\x3e\x1c\x9a\x66\x1d\x77\xf7\xa1\xd8\xc7\x3d\xbd\xf5\xef\
-\x4d\xb4\x50\x18\x2d\x14\xaa\x5f\x61\xae\xd9\xeb\x85\x3c\x63\xaf\
-\xfc\x88\xb1\x57\x7e\x8c\x59\xd3\xab\x07\x7e\xf1\x99\x77\x06\x9e\
-\x39\xf4\x32\x70\x15\x98\xc0\xd2\x06\xf7\x88\x04\x0f\x2e\x01\x04\
-\xac\x1a\xea\x06\x82\x40\x14\xe8\xac\x6f\x51\x20\x98\x9e\x5d\xe9\
-\xc8\x2d\xad\x86\x5a\x81\xcd\xcc\xc5\x3d\x7a\xa9\x22\xdf\xae\xa6\
-\xfa\x7b\xfa\x71\x68\x6e\x00\xc2\xc3\x7b\x01\xd0\x42\x11\xdc\xe1\
-\xb0\xf5\x7b\x03\xe8\x56\x30\xd7\x02\xbb\xfe\xb7\x74\xa2\x84\x5e\
-\xa9\x59\xd7\x87\x9c\x28\x0e\x71\xcd\x75\x85\x44\x9c\x93\xbf\xfb\
-\xef\x48\xcf\xcc\xb0\xff\x0b\x4f\x9f\x1b\xfe\xf8\xf1\xbf\x04\x2e\
-\x01\xe3\x58\x24\x48\x71\xd7\x49\x70\x7f\x13\xe0\x56\x36\x80\x88\
-\x55\x8b\x7d\x40\x0c\x18\x5c\x38\x37\xf6\xcc\xe5\xef\xbd\xf5\xe9\
-\x72\xb6\xe0\x2b\xa5\xf3\xea\x66\x17\x45\x46\xf6\xa3\xa8\xe0\xef\
-\x8a\xd2\xf3\x70\x14\x30\x89\x8c\xec\xc7\xaa\xa5\x11\xb4\x50\xa4\
-\x7e\xe6\x76\x81\xbd\xf5\x39\xa9\x78\x91\x0b\x6f\x2f\x32\x79\x2d\
-\x49\x4d\xaf\xe1\x2c\x4f\xe3\x14\xf3\x08\x18\xe4\xb5\x83\x74\xf4\
-\x79\xe9\xd9\xed\xa3\x7b\x97\x17\x2d\x14\xe2\xe9\x6f\x7e\x93\xd7\
-\xff\xcd\xbf\xe1\xe2\x9f\xbd\x7e\x18\x10\x87\x3f\x7e\xdc\x36\x5e\
-\x6d\x49\x71\xcf\x9a\x83\xfb\x4f\xb6\x22\x80\x6d\xcd\xbb\xb0\x6a\
-\x7f\x77\x31\x99\x3d\xf2\xde\xb7\xfe\xfa\x6b\x0e\x8f\x5b\xe9\x79\
-\xe4\x11\x2a\x39\x91\xae\xa3\x8f\x23\xab\x2a\x5a\x28\xba\x05\xb0\
-\x10\x5f\x48\x37\x6e\xaa\x78\x5d\x9b\x9c\x73\xe7\xe0\x83\xc9\xcb\
-\x7f\x74\x9d\xa9\x6b\x4b\xcc\x4f\xc4\xc9\xa6\x8a\xe8\x85\x1c\x1f\
-\x7f\x3c\x89\x4b\x35\x38\x77\x46\xe3\xda\x39\x27\xb1\xee\x20\xfe\
-\x90\x9b\xfd\x8f\x44\xd9\xff\x48\x88\xa7\xbf\xf9\xcf\x6d\x12\x1c\
-\x14\x04\x41\xdc\xfd\xb1\x87\xec\xff\x6c\x13\x21\xc5\xdf\x11\x12\
-\xdc\x4a\x03\xd8\xea\x3f\x04\xf4\x5e\xfd\xeb\xb7\x5f\x00\x49\x79\
-\xe6\x5f\x7c\x03\x57\xd0\x49\x6a\x46\xc1\xd0\x1d\x04\xfb\x07\x11\
-\xc4\xd6\x6e\x37\x4c\x5e\x5d\xe2\xca\xa9\x19\xe2\x8b\x19\x5c\x99\
-\xb3\x88\x8a\x83\x0a\x3e\xca\x8e\x6e\x5c\x6e\x07\x1d\xfd\x41\x7a\
-\x86\xda\xe8\x1f\xdd\xbc\xcd\xde\x89\xda\x2f\x97\xaa\xac\xae\xe4\
-\x98\x9f\x4c\x30\x79\x75\x91\x5a\xd5\xe0\xd2\x19\xd0\x29\xe0\x56\
-\x2f\xe1\x0d\xb8\x08\xb5\xfb\xe9\xec\x0f\x91\x8a\xe7\x58\x9c\xce\
-\xf1\xc2\x2f\xf7\xd7\x49\xf0\x6f\xb9\xf0\xa7\x3f\xdd\x0f\xb0\xfb\
-\x63\x0f\xb5\x6a\x01\x01\x8b\x04\x45\x3e\xe4\x24\x90\x7e\xfb\xb7\
-\xbf\xb6\xd9\xf7\x32\x96\x91\x17\x06\xfa\x81\xfd\xef\xfd\xc7\xbf\
-\xfa\x44\xf7\xf1\x67\x44\x2d\x34\x8c\xd3\x67\xe0\xf2\x1b\x14\x12\
-\x02\x7a\xb1\x88\xea\x0f\x34\xca\xe8\xd2\xbb\x53\xfc\xf4\xbb\x17\
-\x79\xff\xad\x71\x26\xae\x2c\x30\x79\x23\x45\x6f\xdb\x3c\xcb\xd3\
-\xcb\x9c\xbb\x50\x65\x79\x2e\xc5\xd2\x6c\x8a\xb9\x89\x14\xf3\xe3\
-\x29\xbc\x41\x15\x5f\x50\xe5\x4e\xc0\x07\xf0\x05\x55\xf2\x69\x03\
-\xc5\x29\xe3\xf6\xa9\x38\x55\x05\x80\x8f\x7f\xfe\x20\xcf\x7e\x7a\
-\x88\xd7\xff\xf2\x3a\x89\xc5\x0c\x95\x92\x4e\xa5\xac\xe3\x74\xb9\
-\x18\x18\x0d\xe0\x6d\x53\xe9\x39\xfe\x10\x4b\x97\x2e\x33\xfd\xf6\
-\x85\xa8\xec\x74\x04\x43\x83\x9d\x19\x2c\xc0\x6b\x2d\x7b\xa3\xbe\
-\xdd\xa1\x0c\xfc\xbc\x31\xbe\xa5\x6c\xa5\x01\x24\x2c\xeb\xde\x0f\
-\xc4\xae\xfd\xcd\xbb\x4f\x54\xcb\xba\x3c\xfc\x89\x4f\xa2\x17\xaa\
-\xa4\x67\x0c\x82\x7d\x06\x81\x5e\x9d\xd5\xc9\x3c\x85\xc4\x0a\x5a\
-\x28\x0c\x98\x24\x97\x73\x2c\xcd\x26\x99\x19\x5b\xe6\xe6\xc5\x79\
-\x8a\xa5\x3c\xaf\xbc\x91\xc2\xa4\x86\x83\x38\x3e\x4f\x10\x5f\xc0\
-\x4b\xac\x3b\x40\xff\x9e\x0e\x52\xf1\x02\xcf\x7f\x69\x2f\x5d\x03\
-\x01\x76\x0a\x3e\x98\x0c\xec\x09\xe0\xf1\x8f\xf0\xd6\xdf\xb8\xe8\
-\x1b\x89\x11\x9f\x4f\x93\x4e\xe6\x39\xfa\x54\x27\x1f\xfd\xc5\xbd\
-\x0c\x8c\x74\xf0\xa3\xbf\xb8\x81\x61\x40\xb8\x33\x80\xd7\xef\x42\
-\xf3\x48\x00\x28\x9a\xca\xd3\xdf\xfc\x5f\x78\xfb\xf7\xfe\x83\xa5\
-\x09\x04\xc4\xdd\x1f\x7d\xa8\xd5\xeb\x28\x62\x39\x8f\x8a\x58\x0e\
-\xa5\x0f\x40\x84\xfb\x53\x36\xd3\x00\x02\x16\xf8\x6d\x40\x37\x30\
-\x7c\xe5\xbb\x6f\x3e\x17\xe8\x19\xd6\x76\x3d\xfb\x1c\xaa\xcf\x4d\
-\x31\x91\xa7\x98\xaa\xe1\x0e\x81\xe4\x30\xc9\x2d\x97\x90\x55\x15\
-\xd9\xe1\x40\xf3\x38\x58\x99\xcd\xa0\x38\x65\x54\xcd\x81\x22\x2b\
-\xc4\x22\x51\x3e\xfb\xab\x47\xb9\x71\x79\x89\x4c\x36\x4d\x39\x03\
-\xa9\x78\x1e\x59\x16\x91\x14\x09\xcd\xad\x32\xb0\xb7\xb5\x39\xd8\
-\x59\x93\xe0\xf6\x2a\x8c\x1e\x09\x31\xb0\x27\x48\xac\xdb\x4f\xb8\
-\xc3\x8f\x28\xca\xe4\x33\x15\x54\x4d\x25\xd2\x19\xa0\xa3\x3f\xc4\
-\xfe\x87\x63\x3c\xfe\x89\x0e\xbc\x41\xa5\x71\xbd\xa4\xc8\xf4\x3d\
-\xfe\x28\x85\x44\x82\xeb\x3f\x7c\x33\x62\x1a\x66\x2c\x32\xda\x9b\
-\xc1\xaa\xfd\xad\x9a\xa0\xb6\xee\x05\xb6\x29\x0f\x9e\x06\xb0\xfb\
-\xfe\x6e\xac\x3e\x7f\x64\xe5\xda\x4c\xf8\xd8\xd7\x3f\x09\x98\x08\
-\x22\xf8\x7b\xc2\x24\x27\x16\xc9\xcc\x57\xf1\xf7\x80\x5e\x34\xc8\
-\x2e\x2c\x20\xf5\xf6\x10\xe9\xf4\xf2\xc2\xaf\x1c\xe5\xad\xbf\xb9\
-\x46\x7b\x4f\x1b\xf1\xc5\x34\x81\x80\xc2\xd7\xbe\xf9\x08\x9f\x7a\
-\xe9\x51\xfe\xfd\xef\xbc\x4e\x21\x5f\xc5\x1b\xd0\xf0\x06\x35\x3a\
-\xfb\x42\xec\xda\x17\xbe\x25\xc0\xdb\xfd\xcd\x1f\x72\xe2\x0f\x39\
-\xd8\xf7\x70\x88\x66\x65\xdd\xde\xf5\xc7\xbe\xfe\xcb\x00\x5c\xfd\
-\xab\xb7\x87\xd2\x73\xf1\x2f\x3f\xf6\x8d\xcf\xb4\x7a\x28\x6d\xf7\
-\x76\x01\xcb\x75\x7c\x8f\xc7\x0f\xfe\xf6\x64\x33\x0d\xa0\x60\x39\
-\x7d\x62\xc0\xc0\xc4\xeb\xe7\x9f\x5f\x3c\x3f\xde\x7d\xe8\xa5\x5f\
-\x41\xd1\x5c\x80\x89\x28\x8b\x38\xbd\x2e\x32\x73\x19\xaa\x65\x13\
-\x5f\x07\x54\x72\x02\x95\x5c\x09\xd5\xe7\xc3\xed\x73\x32\x7a\xa4\
-\x93\xf6\xde\x00\x6d\x51\x2f\x6e\x9f\x46\x2e\x55\xa2\x52\x36\xe9\
-\x1f\x8d\xe2\x0f\x07\xe9\xe8\x0f\x71\xe4\xc9\x7e\x8e\x3f\xd7\x4f\
-\xef\xee\xb6\xdb\x02\xb4\xb3\xdf\x76\x06\xbe\x7d\xdc\x79\xf8\x00\
-\x85\x44\x92\xd9\xf7\x2e\x78\x52\x33\x2b\x7d\x3d\xc7\x47\xd3\x34\
-\x6d\x00\x5b\x0b\x18\xec\x48\x13\x3c\x58\x1a\xc0\xee\xfe\xa9\x58\
-\x46\x60\x20\x71\x73\xae\xdb\xdf\xd3\x57\xf7\xb2\x99\x8d\x4d\x56\
-\x65\xfc\x3d\x61\x52\x53\xcb\x38\xdc\xe0\xeb\x12\x58\x9d\x2c\x93\
-\x5d\x58\xc4\xd7\xd5\x01\x98\x74\x0e\x04\xe9\x5c\xd7\xb6\xc7\x17\
-\x72\x9c\xf8\xa2\xfb\x8e\x00\xba\x97\xe0\xdb\xfb\x63\x5f\xff\x0a\
-\xfe\x9e\x2e\xce\xff\xd1\x5f\xb4\xbf\xfa\x7f\xfe\xf7\x5f\x7a\xfc\
-\x9f\x7c\xce\xa3\xfa\xdd\xb6\x5b\xdb\xb6\x0d\xb2\x58\x23\x8c\x0f\
-\xfc\xf8\x81\xb8\xc9\x77\x32\x16\x01\xbc\x40\x30\x39\xbe\x10\x88\
-\x0c\x8f\xd2\x0a\xbe\xbd\xb9\x82\x1a\xbe\xae\x20\xa9\xa9\x2a\x7a\
-\xbe\x86\xbf\xab\x4a\x39\x97\xa3\x90\x48\x6c\x59\xc0\xe1\x8e\xfb\
-\x17\x7c\x7b\x3f\xf4\xdc\xd3\x1c\xfb\xfa\x97\x49\x4d\x2d\x05\x5e\
-\xff\xbf\xff\xe8\xb3\xa5\x4c\xfe\x31\x60\x3f\x30\x08\x74\x60\x19\
-\xc7\x2e\x9a\x23\x8f\x0f\xac\x88\x9b\x7c\xb6\x7d\xff\x9e\x52\x3a\
-\x1f\xcd\x2d\xad\x7a\xc2\x23\x9b\x13\x00\x4c\xdc\x11\x2f\x5a\xc8\
-\xc3\xea\x64\x05\xa8\xe2\x89\xd6\xc8\xc7\x93\x94\x73\xb9\xdb\x14\
-\xfe\xad\x41\xf8\x79\x81\x6f\xef\xfb\x1e\x3f\xce\xd3\xbf\xf9\x0d\
-\xca\xd9\x92\xe7\xe5\x7f\xf9\xad\xcf\xaf\x5c\x9d\x7e\x1e\x38\x00\
-\x0c\x61\xb9\xc3\x03\xf5\x72\x52\x78\x80\x49\x70\x2b\x02\x78\x17\
-\xde\xbf\x39\x04\x10\x19\x1e\x61\x2b\x02\x80\x49\xa0\xaf\x0d\x45\
-\x73\xb2\x72\xad\x84\xd3\x57\x45\xf5\x1b\x64\x17\x96\xa9\x96\x2b\
-\x1f\x00\x84\x9f\x1f\xf8\xf6\x39\xe1\xe1\x41\x9e\xfe\xe6\x6f\x20\
-\x48\xb2\x7c\xf2\xdf\x7d\xe7\xc4\xdc\x99\x1b\x2f\x60\x91\x60\x18\
-\xe8\xc2\xf2\x92\x6a\x3c\xc0\x24\x58\x4f\x00\x09\x8b\x00\x1a\xe0\
-\xcd\xcc\xc7\x63\xfe\x9e\xde\x86\xf1\x77\xab\xad\x6d\x30\x8c\xe4\
-\x50\x58\xb9\x52\xc4\x1d\xd1\x91\x94\x1a\x99\xb9\x45\x4c\xa3\xd5\
-\x60\x7e\x70\xc0\xb7\x8f\xfd\x3d\x9d\x3c\xf7\xbf\xfd\x33\xdc\xd1\
-\x88\xfc\xce\xbf\xff\xde\xe3\x37\x5e\x3e\xf5\x39\xe0\x20\x16\x09\
-\xba\x69\x92\xc0\xc1\x03\x48\x82\x56\x02\xd8\x06\xa0\x4d\x00\x5f\
-\xe2\xe6\x7c\x20\xd0\xd3\xc3\xed\xc0\x07\x03\x51\x12\x08\x0f\x85\
-\xa9\x96\x4d\x92\x63\x45\x02\xbd\x3a\x46\xad\x4a\x7a\x6e\xe9\x2e\
-\x02\xf4\xb7\x0b\xbe\xbd\xd7\x42\x41\x9e\xfe\xe6\xaf\x13\x19\xd9\
-\xc5\x85\x3f\xfd\xe9\xfe\x53\xff\xe5\x07\x5f\x01\x0e\xd1\x24\x41\
-\x1b\x0f\x68\x73\xb0\xbe\x17\xa0\x60\x19\x80\x1a\xe0\xcd\x2d\x26\
-\x3d\x83\x27\xb6\x6e\xff\x6d\xf0\xed\x82\x92\x9c\x22\xd1\x3d\x51\
-\x96\x2e\x2d\x92\x9a\x2a\x12\xe8\x15\x48\x4d\x43\x76\x31\x8e\xb7\
-\xbd\xb5\x17\x71\x27\x00\xdd\x1b\xf0\xaf\xbf\x9f\xe5\xe6\x85\x2c\
-\xf1\xa5\x32\x42\x25\x83\x54\xcb\xa2\x92\xa4\x2a\xf9\x09\x0d\xf5\
-\x13\xeb\xf3\xd1\x3d\xe8\xc4\x1f\x52\x79\xea\x9b\xbf\xce\xe9\xdf\
-\xff\x63\xa6\xde\x3a\xdd\xa3\x17\x2b\x5f\x79\xec\x1b\x9f\xf9\x36\
-\x4d\xc0\x5b\x1f\xa2\xb7\x1c\xdf\xd7\xd2\x4a\x00\x3b\xf2\xc7\x09\
-\xb8\xd3\xb3\x2b\x9d\xd5\xb2\x2e\xdf\x5a\x03\xb4\x82\x60\xa9\x7a\
-\x45\x93\x09\xf6\x07\x88\xdf\x88\xa3\xb8\x45\x3c\x51\x81\xec\x62\
-\x0e\xc5\xe5\x44\xf5\x6b\x3b\x06\xe8\x5e\x82\x7f\xf6\x8d\x55\x4e\
-\xbd\xb6\xcc\xc4\x95\x05\x8a\xb9\x12\x95\x42\x9e\x27\x0e\x2c\x13\
-\xea\x71\x20\x29\x69\x4e\xfe\x20\x09\xde\x5e\xc2\x9d\x7e\x62\xdd\
-\x2e\x1e\x3a\xe1\xe3\xd8\xd7\xbf\x88\x16\x0a\x72\xe5\xfb\x3f\x6e\
-\x3f\xf9\xbb\xdf\xfd\xa5\xc7\xbe\xf1\x19\xfb\xcf\xaf\x1f\x3b\x78\
-\x20\xba\x88\xeb\x09\xa0\x60\xa9\x32\xf7\xea\xc4\x42\x27\x80\xbf\
-\xa7\x9b\xed\x82\xdf\xec\x19\x68\x54\x4b\x3e\xe2\xd7\x53\x74\x1e\
-\x91\x70\x87\x05\xb2\x8b\x09\x04\x49\xc0\xe9\x51\x5b\xae\xdb\x1c\
-\xa0\xf8\x42\x9e\xe4\x72\x11\xbd\x5c\x6b\xbc\x9c\xdb\xa7\x10\x8c\
-\x38\xf1\x87\x94\x6d\x03\x7c\xbb\xdf\x12\x8b\x65\xa6\x6f\x2c\xb1\
-\x30\x19\xe7\xe6\xc5\x79\x0a\xb9\x32\xef\xbc\x0a\xbf\xf8\x69\x78\
-\xe8\xa8\xcc\xbb\x3f\xcb\xe2\xf4\xeb\x04\xc2\x1e\xc2\x1d\x7e\x96\
-\x66\x63\xec\x39\xea\xe3\x91\x17\x9f\x43\x0b\x05\x38\xfd\xfb\x7f\
-\xda\x7e\xf2\x77\xbf\xfb\xe5\xc7\xbe\xf1\x99\x0a\xd6\xf0\x71\x19\
-\xcb\x53\xf8\xb7\x10\x6d\x7c\x77\x64\x3d\x01\x1c\xd4\x9d\x40\xe9\
-\xb9\x78\x34\x32\xb2\x95\xf5\xbf\x35\xf8\xf6\xe6\xef\xf1\xa1\x17\
-\x2b\x2c\xbc\x9f\xa2\xeb\x68\x90\x9a\xee\x24\xbb\x90\x44\xea\x8d\
-\x20\x3b\xe5\x96\xeb\x9b\x80\xcc\x4d\x64\x39\xf5\xea\x2c\x89\xa5\
-\x3c\xd9\xf8\x2a\x7d\xd2\xeb\x78\x7d\x0e\x0c\x64\x96\xca\xfd\x54\
-\xbd\xc3\x04\x42\x2e\xfa\x46\x7c\x8c\x1c\x0e\xa2\x79\xa5\x3b\x06\
-\x1f\xa0\xa3\xcf\x45\xef\xee\x28\xb9\x54\x81\xee\xa1\x28\x0b\x93\
-\x09\x92\xa9\x38\xff\xf9\x7b\x09\xfe\xd3\xf7\x2c\xf2\xa9\x04\xf0\
-\xa9\x11\x7a\x86\x22\xa4\x56\xb2\xe8\xe5\x7e\x3c\x7e\x89\x7d\x8f\
-\x1f\x05\x4c\x4e\xff\xfe\x9f\xb5\xbf\xf7\xad\xbf\xfe\xd2\xf1\xbf\
-\xf7\xc9\x1c\x96\x83\xc8\x0e\x39\x7f\x20\x06\x8f\x5a\x5d\xc1\x2a\
-\x56\xdf\xb6\x03\xd8\x75\xf9\xbb\x6f\x3e\xd5\xd6\xbf\x5b\x8d\xed\
-\xdf\xb7\x63\xf0\xed\x4d\xf5\x3b\x29\x24\x8a\xe4\x97\x8b\xb4\xed\
-\x72\x52\xc9\x8b\x14\x57\x8b\xb8\x82\x6e\x04\x61\x2d\x20\x85\xac\
-\xce\x5f\xfd\xc1\x55\xae\x9e\x9e\xe1\xea\x99\x29\xc6\xaf\xae\x70\
-\xe1\xaa\x82\x53\xc8\xd1\xde\x21\x73\xfa\xbd\x3c\x37\x6e\x94\x48\
-\x2c\xe5\x58\x99\x2b\x32\x79\x35\x87\xac\x48\x44\xbb\x5c\xdc\x09\
-\xf8\x60\x12\xed\x72\x20\x8a\x32\x08\x2e\xdc\x5e\x15\x97\xc7\x89\
-\x3f\xe0\x27\xa0\x85\xd1\xc4\x36\xbc\x8e\x30\x42\x55\xc1\xe1\x90\
-\xa9\x94\xaa\x68\x1e\x15\x51\x14\x09\xb5\xfb\x18\xd8\xeb\x24\xd0\
-\xd3\x0e\xc0\xcd\x57\xdf\x0b\x7a\x62\x6d\xba\xbf\x2b\x3c\x07\x64\
-\xea\x24\xa8\x7b\x0a\x1f\x0c\x57\xb0\x40\x33\x92\xd7\x72\x02\xa5\
-\x72\xaa\x16\x5e\xeb\xfe\xdd\x09\xf8\x60\x22\xca\x02\xb1\xbd\x21\
-\x66\x4f\x2d\x10\xbf\x91\x26\x32\x12\x20\x35\x0d\xa9\xe9\x38\x81\
-\xde\x10\x82\x28\x34\x00\x29\xe4\x2a\xd4\xaa\x06\x4b\xb3\x49\x6e\
-\x5e\x9c\x27\x15\xcf\x51\x24\xc1\xb9\xcb\x15\xf8\x23\x70\xe0\xc1\
-\x25\x67\x09\x84\x3d\x74\xf6\x87\x08\xb5\xfb\x29\x17\x2b\xe4\xd2\
-\x15\x1e\xf9\x68\x74\xc7\xe0\xdb\xc7\x47\x9e\xf2\xd1\x3d\xa8\x72\
-\xfe\x2d\x0f\x9d\xe3\x21\xd2\xc9\x3c\xc9\xa5\x2c\x2f\xfd\xc3\xfd\
-\x74\x0d\x04\xb9\x79\x69\x85\x3f\xff\x2f\xe7\x29\xe4\xab\x04\x22\
-\x1e\x3a\xfb\x42\xc4\x7a\x9a\xa3\x89\x7b\x5e\x3c\xc1\xfc\xb9\x2b\
-\x5c\xf9\xfe\x5b\x4f\xf4\x3c\x3c\x7a\x12\x2b\xe4\x3c\x4e\xd3\x5d\
-\x7c\x5f\x8b\xad\x01\x44\x9a\xd1\x3f\x3d\xa5\x74\x7e\xff\x95\xef\
-\x9f\x3c\x32\xf2\xc2\xc7\x5b\xc6\x00\x76\x06\x7e\xa3\x7b\x28\x8b\
-\xa8\x3e\x07\xf1\xb1\x14\x92\x22\xe0\xed\x54\x28\x24\xa1\x92\x2b\
-\xa3\xfa\x54\x04\xc1\x22\x81\xe6\x55\x58\x9c\xce\x21\x8a\x32\xa6\
-\x69\xa2\x38\x64\xcc\x92\x42\xb5\x62\x52\xa3\x4c\x99\x2c\x39\x63\
-\x89\x62\xae\x4c\x72\xb6\x4c\xad\x5a\x43\xaf\x54\x51\x1c\x1a\xbb\
-\x0f\xfa\x51\x9c\x6b\x03\x40\x77\xd2\x34\xb8\xbd\x22\xbb\xf6\x6a\
-\xec\x3e\xe8\x21\xda\xed\x26\xda\xe5\xc7\xe1\x94\x59\x9e\x2b\x61\
-\x9a\x22\xc3\x07\x63\xb8\xfd\x1e\xf6\x3f\x12\xe6\xf8\x73\x7e\x06\
-\xf7\x3b\xd6\x5c\xaf\xfa\xdd\x8c\xff\xe4\x3d\x47\xdb\xae\xce\x15\
-\x4f\x34\x30\x85\x35\xf1\xa4\x3e\xe9\x64\xe0\xbe\xb6\x03\x6c\x0d\
-\x60\xf7\x00\x54\x40\x4b\x8c\xcd\x75\x03\x84\x87\x87\x3f\x10\xf8\
-\xf6\x35\x6a\x40\x21\x3c\xe4\x67\xe5\xfa\x2a\x0e\x8f\x42\xa0\x17\
-\x52\xd3\x90\x5b\xce\xe0\x6d\xf7\x35\xce\x7b\xfe\x8b\x03\x38\x9c\
-\x12\x9a\xc7\xc9\xdc\x44\x9c\xf8\x42\x9a\x5c\xaa\x80\xc7\xa7\xb0\
-\x7b\x5f\x98\xf9\xa9\x34\x97\xcf\x2c\x22\xc9\x22\x81\xb0\x07\x97\
-\x47\xa5\xde\x96\xdc\x31\xf8\x6b\xfa\xfb\x5e\x81\xe1\x43\x2e\x86\
-\x0f\x6d\x34\x54\x8f\x7f\x3c\xb2\xe5\xf5\x9d\x87\xf7\x00\x90\x9a\
-\x5a\xea\x8d\xed\xeb\xb7\xc3\xe5\x1f\x88\x71\x02\x9b\x00\xf6\x94\
-\x2b\xab\x0b\x38\xb3\x1c\xfb\xa0\x35\x7f\xfd\x35\xfe\x1e\x0f\xe5\
-\x6c\x99\x85\x73\x2b\xf4\x3c\xda\xde\x20\x01\x80\xb7\xdd\x0b\x98\
-\x28\x0e\x91\xe7\x7e\xb1\x8f\xc9\xab\x01\xae\x9c\xf6\xb3\x32\x97\
-\x27\xb3\x5a\xe0\x63\x9f\x1b\xa0\x67\x77\x08\xa3\x56\xe3\xfc\x5b\
-\x33\xbc\xfe\xc3\x69\xdc\x3e\x0d\x7f\xc8\xcd\x93\x9f\xea\xd8\x86\
-\x31\x08\xb7\x27\xc8\xf6\xaf\x37\x0d\x93\x6a\xc9\xd2\x5c\x7a\xd1\
-\xf2\xa5\xb5\xed\x1a\xa0\xb8\x9a\x0d\x62\x81\xef\xa0\x19\x43\x70\
-\x5f\x4b\xab\x06\xb0\x7b\x00\x5a\x7a\x3e\xe1\x77\x87\xd7\x07\x55\
-\xdc\x39\xf8\x96\x18\x84\x87\xfd\x94\xd2\x25\xe6\xcf\x2e\xd3\xf7\
-\x78\x27\x81\x5e\xbd\x4e\x02\xb3\x41\x02\x80\xfe\x51\x2f\xfd\xa3\
-\x5e\x0a\x59\x9d\xe5\xb9\x02\x35\xdd\xe0\xea\xfb\xcb\x00\xa8\x3e\
-\x8d\xe7\xbf\x38\x8a\x37\xa8\xd0\xbd\x4b\xbb\x27\xe0\xeb\x05\x6b\
-\x5f\x2d\x9b\x98\x06\xd4\x74\xa8\xe9\x02\x86\x2e\x52\xd3\xd7\x15\
-\xa0\xd3\x44\x90\xc0\xac\x01\x82\xd0\x3a\x07\x72\x7d\xb8\xf9\x7d\
-\x29\xb6\x9a\xb2\x5d\xc0\x2e\xc0\x5d\x5c\xcd\xaa\x1d\x07\x1f\xda\
-\x04\xc8\x3b\x07\x1f\x4c\x44\xc9\x24\xb6\xd7\xcf\xec\xa9\x15\x12\
-\x63\xab\x84\x86\x82\x2d\x24\x00\x6f\xbb\x67\xcd\x3d\x34\xaf\x4c\
-\xff\xa8\x97\xbb\x55\x73\xab\x65\x03\xb3\x06\x86\x61\x52\x2b\xd7\
-\xbf\x2b\x99\x18\x06\x18\xba\xb9\x01\x5c\x49\x01\x51\x01\x51\x34\
-\x71\x68\xd6\xf9\x8a\xab\xbe\xd7\xd6\xf6\xf0\x64\xf5\xbe\x6e\xea\
-\xb7\x14\xb9\x65\xdf\xe8\x01\xa4\xa6\x96\x02\x83\x27\xec\x28\x9d\
-\xbb\x03\x3e\xa6\x01\xa6\x81\xd3\x23\x13\xd9\xed\x63\xf1\xf2\x2a\
-\xae\x36\x15\xad\xcd\xd5\x20\x41\xb5\xa4\xe3\xeb\xf2\x22\x29\xdb\
-\x6d\xd7\x4d\xf4\x42\xd3\x59\xa4\x17\x6b\x8d\xdf\x2a\x05\xeb\x7d\
-\xcc\x9a\x49\xb5\xbc\x11\x1c\xa5\x0e\xa8\xa4\x98\x38\xd4\xb5\xe0\
-\xca\xaa\x81\xb0\x59\xa4\xc4\x2d\x24\x1f\x4f\xe1\x6d\xf7\x6f\x16\
-\x39\x74\x5f\x8b\x4c\x73\xea\xb6\x03\x70\xa5\x67\x57\xda\x01\x02\
-\x3d\x5d\xdc\x6d\xf0\x31\xad\x63\x5f\xbb\x93\xec\xb2\x93\xc5\xf7\
-\x97\xe9\x7f\xb2\x07\xd9\x29\x12\xe8\xd5\xc9\x2e\x98\x24\xc7\x53\
-\x28\xda\x56\xc1\xca\x6b\x01\xdf\xf0\x67\xea\xea\xd8\x3a\x36\x10\
-\xeb\xc7\x9e\xa8\xf5\x3e\xa2\x62\x22\x29\x3b\xc7\xa4\x90\x28\xb4\
-\x1c\x17\x1b\xc7\xf9\x78\xeb\xf7\x29\x22\xa3\x4f\x2d\xf2\x00\x7a\
-\x02\xed\x39\x80\x4e\xc0\x95\x5b\x5a\x0d\x03\xf8\x7b\x3a\xb9\x17\
-\xe0\x63\x58\xae\xf2\x8e\x3d\x1e\x6e\xbe\x19\x67\xe5\x46\x82\xd8\
-\xde\x08\xb2\xd3\x24\xd8\xaf\x53\xce\x89\xd4\xca\x5b\x83\xec\x0a\
-\x9a\x88\x2d\xb5\xf3\x4e\x6a\xab\x5e\xd0\xd1\x8b\x96\xbe\x2f\xa5\
-\xcb\x18\x35\xeb\x3f\x58\x40\x5b\xda\xa7\x98\x2c\x6c\x7a\xad\x53\
-\x35\x1b\xc4\x72\xa9\x06\x92\x04\xd9\x95\x14\xa2\x2c\xe1\xf0\xa8\
-\xf9\x96\x02\xa9\x37\xad\xaf\xd9\x85\xd3\xaa\xce\x80\x13\xf7\x05\
-\x39\x5a\x93\x2e\xa8\x80\xb6\x72\x7d\xa6\xd3\xdf\xd3\xc5\xbd\x04\
-\x1f\xd3\x40\x94\x4c\xa2\x43\x1a\x0b\x97\x57\x69\xeb\x0f\xa0\x68\
-\x96\x8f\xdf\xe9\x31\xac\x68\xc4\x1d\x4a\x4d\x37\x28\x67\x4a\x40\
-\x1d\xd4\xaa\xf5\x6e\x76\x2d\xd5\x8b\x3a\x7a\xa1\xa5\x91\x17\xac\
-\x1e\xa4\xe2\x04\x87\x03\x04\x11\x9c\x4e\x70\xd4\x07\x74\x43\xbb\
-\x8c\x06\xd1\x1c\x2a\x48\xd2\xba\x07\x9a\x4d\xfc\xaa\xc5\x12\xaa\
-\xdf\x4d\x64\xa4\x37\x59\x2f\x4b\x0f\x96\x57\x55\xa4\x39\x28\x64\
-\xac\xdd\xbf\xb6\xbe\x00\x5b\x09\xb2\x3e\x88\xc2\xd8\xf8\xfd\xdd\
-\x21\x50\x2b\x01\x9c\x80\xbb\xb8\x9a\xd3\xdc\xa1\xd6\x28\xdd\xbb\
-\x0f\xbe\xb5\xd5\xf0\xb7\xcb\xc4\xc7\x45\xd2\xb3\x19\xc2\xc3\xa1\
-\x2d\x5f\xd2\x06\xd7\xda\x97\xd7\x00\x6b\x7f\xdf\x2a\x8a\x62\xa0\
-\x38\xea\x4e\x1a\xb5\x66\x81\xe7\x01\x2d\x66\x69\x16\x51\x12\x50\
-\x5d\x86\xc5\x00\x51\xb4\xd0\x17\x45\xeb\xb3\xbd\xb1\x1d\xb5\x62\
-\x82\x09\xe5\x72\x8d\xe8\x9e\xbe\x62\xbd\x0c\xdb\xb0\xdc\xe9\x12\
-\x96\x33\xa8\x75\x4e\x81\x6d\x23\x18\xeb\xb6\xd6\x42\x6c\x3d\xb7\
-\x75\x5b\x77\xdd\x6b\xad\xe7\x6f\x72\xbf\xed\x11\xc4\x26\x40\xa3\
-\x0b\x68\xf5\x00\x86\xee\x39\xf8\xf6\xb1\x27\xbc\x79\x7b\x1f\xbf\
-\x9e\x20\x1f\x2f\xac\x69\x7f\x25\xc9\xc4\xe9\xb4\x40\x74\xbb\xab\
-\x00\x04\x22\x06\x8a\x62\xbd\x8f\xe6\xde\xba\xe9\x68\x48\x2b\xc0\
-\x82\x00\xa2\x60\x55\x6f\x49\x6a\x92\x41\x10\x6e\xdd\x81\x33\x5b\
-\x0e\x4c\x10\x54\x27\xd1\xbd\x7d\xb5\x3a\xf8\x7d\xf5\xb2\xec\xc0\
-\x9a\x51\xb4\xde\x30\x6c\x1d\x36\xae\xad\xfb\x6d\xfd\xb9\x9b\x4d\
-\x4e\xa9\xae\xfb\xac\xd7\xb7\x32\xcd\xd1\x48\x1d\x5e\xab\xc1\x89\
-\xdb\x0e\x46\xb5\x12\xc0\x05\xb8\x53\x53\x4b\x81\xd1\x4f\xdd\xaa\
-\xfd\xbf\x7b\xe0\x63\x9a\x94\x73\x35\x34\x6d\xed\x4b\xc5\xaf\x27\
-\x48\x8e\xad\xe0\xf7\x97\x68\xeb\xd6\x51\x14\x03\x55\xdd\x06\xb8\
-\xb7\xe3\xbc\x50\x9f\x00\x6c\xd7\x78\x59\x02\x45\x01\x59\x61\xec\
-\xad\x6b\x2c\x5c\x9a\xc6\xdc\x41\xd7\xdd\xe1\x72\xe0\xef\x0e\x53\
-\xcc\x96\x90\x9d\x0e\x67\x6a\x6a\xe9\xb0\x51\x33\xf6\x98\xa6\x51\
-\xf1\x77\x45\x12\x8a\xa6\x16\x31\xcd\x1a\x60\x98\x86\x59\x73\x78\
-\xd4\x52\x74\x4f\xdf\xf2\x3a\x00\x5b\x01\xde\x6c\xaf\xdf\x62\xaf\
-\x63\x8d\x3c\xda\x39\x90\xb2\x58\x83\x51\x39\x8b\x0c\xaf\xe9\xb7\
-\xd3\x04\x6b\x08\x60\xf7\x00\xdc\xa1\xe0\xb6\xc0\xbf\xf4\x6e\x91\
-\x85\xa9\x0a\x4e\x97\xc8\xa3\x1f\x75\xa1\x38\x76\x06\x7e\x63\xdf\
-\x22\x35\xdd\x20\x39\x9e\x24\x16\xcd\xe0\xf7\x97\xb6\x0f\xee\xed\
-\xa4\x01\xbe\x64\xd5\x7a\xc5\x02\x3f\x1d\x2f\x70\xf2\xf7\x5f\xa5\
-\x90\xcc\xe2\xef\x69\xa7\xf3\xf0\xe8\x86\x4b\xe3\xd7\x27\x36\xbd\
-\xa5\x5e\x81\xf8\x78\x9c\x95\x6b\x93\x60\x35\xa3\x6d\x2d\x3f\xf7\
-\x6d\xe7\xb5\x54\xbf\xbb\xa4\x06\x3c\xa5\xd6\xef\x42\x83\x9d\xa9\
-\xfa\x7f\x36\x4d\xd3\xac\x45\x46\x7b\x97\x31\xcd\xaa\x69\x98\x7a\
-\x78\xb8\x7b\x59\xf5\xbb\x73\x58\x35\xbd\x8c\xd5\xcc\xa4\x81\x15\
-\x60\x09\x58\xc4\x6a\xbf\x32\x34\x35\xce\x2d\x09\x60\xe7\xe9\x71\
-\xe5\x96\x56\x43\xb0\x55\x0f\x60\x2d\xf8\x67\xdf\x28\x70\xea\xb5\
-\x24\x13\x57\x16\x69\xef\x6d\xc3\xe1\x8c\xf0\xc8\x73\xca\x0e\xc1\
-\x37\xd0\xcb\xd6\x4c\x23\x5b\x56\x27\x56\x11\xa9\xe0\xf7\xe6\xee\
-\xe2\x68\x7a\x5d\xd5\x0b\x92\x45\x04\x59\x06\xc5\xc1\xd4\xf9\x59\
-\x4e\x7f\xfb\x0d\xb4\x50\x80\xa7\x7f\xf3\xd7\x08\x0f\xf7\x6f\x71\
-\xfd\xb3\x77\xf4\xd4\xf8\xf5\xc9\x0d\xdf\xe5\xe3\x29\x0a\x89\xd4\
-\x1a\x0e\xa4\x67\x16\x54\xbd\xd8\xe4\x40\xfc\xc6\x42\x20\x3d\xb3\
-\xd8\xf8\x3c\xfe\x93\x73\x43\x9b\xdd\xdf\x13\x0b\xe6\x64\xd5\x51\
-\x95\x1d\x4a\x49\x0b\xfb\x66\xfb\x9f\x3c\xf0\x72\x78\x77\xf7\x3b\
-\x75\x90\xea\x5a\xe2\xb5\xda\xad\xb4\x80\x9d\xad\xcb\x09\xb8\x56\
-\xae\xcf\x74\x69\x9b\x1a\x80\x6b\xc1\x5f\x99\xaf\xf2\xfe\x5b\x19\
-\x2e\xbf\x37\x69\xcd\x00\xce\x95\x08\x84\x3d\x1c\x7d\x52\x42\x51\
-\xcc\x6d\x83\x8f\x61\xa0\x97\xac\xb8\x01\x5b\x52\x33\x69\x02\xde\
-\x7c\xdd\xb7\x0a\x73\x2b\x6d\x9c\xbf\xd1\x41\x7c\x55\x05\xd3\xc4\
-\xe7\xa9\x32\xd4\x9b\x64\xdf\xae\xd9\x1d\xe0\x5f\x9f\xe8\x2b\xda\
-\xe0\x3b\x99\x3a\x3f\xc7\xe9\x6f\xbf\x41\x64\xa4\x9f\x47\x7f\xe3\
-\xcb\x28\x9a\xba\xfd\xfb\x6d\x53\x36\x23\x54\x78\x78\xe7\xf7\xd1\
-\x0b\x25\xd2\xb3\x4d\x42\xa4\x66\x16\xd1\x0b\x25\x00\x8f\xad\x9d\
-\xa6\x4f\x5e\x6e\x4f\x4d\x2f\xf7\x3c\xff\xaf\xbe\x16\xc7\x6a\x16\
-\x8a\x34\x03\x53\xb6\x6c\x3f\x6d\x0d\xa0\x02\xae\x6a\xa9\xe2\x70\
-\x87\xd7\xab\xff\x8d\x6d\xfe\x85\x93\x05\x16\xa7\x92\xcc\x8c\xad\
-\x30\x3f\x99\xc0\x1f\xf6\x50\x2e\x56\x48\xc7\x0d\xc2\x31\x73\x07\
-\xe0\x5b\xef\xa5\xb8\xac\x2e\x60\x29\x53\x46\x2f\xe8\xf8\x23\x69\
-\x30\xab\xbc\x73\x69\x37\x17\xae\x7a\x99\xb8\x3c\xcf\xea\x4a\x96\
-\x62\xae\x4c\xb4\x3b\xc8\xcc\x50\x94\xe9\x85\x7d\x3c\xff\xf0\x25\
-\x14\xf9\x96\x1a\xae\x69\xd0\x89\xa2\x65\xe8\x29\x0a\xa9\x44\x81\
-\xd3\xdf\x7e\x83\xce\xc3\xa3\x3c\xfa\x8d\x2f\x6f\x7a\xd9\xfc\x44\
-\x95\xd4\xfc\x2a\x8b\x8b\x1a\xb5\xba\x9f\x40\x92\x44\xba\x87\x14\
-\x06\xf6\x28\x28\x8e\xbf\x3d\x37\xbf\xa2\xa9\x6b\xc8\xb4\x96\x58\
-\xcf\x92\x99\x93\xc9\xcc\x8f\xf3\xee\x7f\xfc\x56\x2c\x35\xb5\x74\
-\x38\xd0\x17\x6b\xcd\x85\x68\xa7\xc0\xdb\x92\x00\x0d\x37\x70\x66\
-\x3e\xe1\xe9\x38\x78\xf0\x96\xe0\x17\xb2\x06\x4b\x17\xaf\x32\x37\
-\x51\x62\x7e\x32\x41\x91\x04\x95\x52\x27\xf9\x4c\x89\x5c\xa6\x4e\
-\x80\x6d\x80\x8f\x59\x43\x2f\x19\xf5\x3f\x68\x11\x20\x3d\x93\x46\
-\x75\x96\x51\xe4\x32\x97\xc6\xfb\x38\x75\xc6\xc9\xf9\x93\x57\x98\
-\xbc\xba\xc8\xf2\x62\x1c\x83\x2a\x6d\x81\x30\xf3\x93\x09\xca\xc5\
-\x21\xda\xfc\x7d\x3c\xb2\xf7\xfa\xad\xd0\xaf\x13\xa0\x6e\xe5\x2b\
-\x0e\xf4\x9a\xc8\x1b\xbf\xf7\x43\xfc\x3d\xed\x1c\xfb\xfa\xe7\xd6\
-\x9c\xad\x57\x4c\xae\x9f\xab\x30\xfe\xea\x9b\x88\xab\xd7\xc8\x14\
-\x9c\x9c\x5b\x3c\x48\xad\xee\x53\x90\x64\x91\x8e\xbe\x10\xc7\x9e\
-\x89\xf2\xd4\x8b\x6e\xee\x07\xd1\x0b\x22\xe5\x9c\x48\x6c\x5f\x3f\
-\xfe\x9e\x76\x6e\xfc\xf8\xf4\x53\xc7\xff\xde\x27\x2f\x03\xf3\x34\
-\xf2\x20\x6e\x6d\x0c\xda\xe0\xab\x80\x96\x5b\x4c\x7a\x94\x47\xed\
-\x6c\x1d\x9b\x5b\xfb\x2b\xd7\x27\xe8\xd2\xc6\x50\x0a\x55\x32\xa5\
-\x15\x6a\x54\xa8\x94\x2c\x07\x4b\x3e\xdd\x0a\xf4\xad\xc1\x07\x83\
-\x42\xc6\xc0\xe9\x6b\xaa\xff\x42\xbc\x80\xa6\xe6\xd1\x75\x81\x8b\
-\x63\x31\x96\x66\x17\x58\x5d\xce\x72\x73\xf1\x3c\x0b\x9c\xc6\xa0\
-\x46\x28\x35\x4c\xe9\xe2\x51\x34\x8f\x93\x60\x74\x2f\x07\x06\x14\
-\x34\xb5\xc8\xa6\x22\x88\x4d\xa3\x4f\xb2\xda\xfd\xd3\x7f\xf8\x1e\
-\x08\x22\x8f\x7d\x63\xad\xda\x9f\x9b\xa8\xf2\xe6\x5f\x65\x99\x19\
-\x4b\x32\x77\x43\x62\xc0\x63\xb2\x12\xcf\xf3\xee\x99\xab\x64\x53\
-\x56\x57\xb4\x7f\xd4\x0a\x01\x2b\x97\x23\xdc\x2f\x92\x4f\x48\x28\
-\x9a\x89\xa2\x19\x74\x1e\xde\xc3\xc4\xeb\xef\x76\x00\xed\x58\x13\
-\x56\xdc\x75\x7c\x4b\x0d\x00\xd7\x89\x1d\x09\xec\x04\x5c\x56\x18\
-\x78\x27\xb7\xea\xea\xa5\x92\x32\x2b\x09\x91\xa5\xa5\x2a\x25\x52\
-\x00\x56\x60\x06\x10\x0c\xb3\x6d\xf0\x2d\x03\xb0\x59\xfb\x6b\xba\
-\x41\x29\x53\xc6\xeb\x4a\x31\xb7\xd2\xc6\xec\x64\x96\x70\x47\x80\
-\x6c\x75\x85\x59\x4e\x52\x20\x41\x89\x14\x0b\x9c\x26\x51\x9a\x62\
-\x79\x76\x95\x95\xb9\x14\x13\xf3\x51\x30\xaa\x1b\x37\xfb\x1d\x10\
-\x40\xb4\x6a\xff\xc2\xf5\x38\xf3\x17\xa6\xd8\xf3\xe2\x09\xb4\x50\
-\xa0\x51\x08\xa9\xb8\xc1\x2b\x7f\x9a\xe6\xfd\xb7\x26\x79\xf7\x95\
-\x2b\xbc\xfd\xea\x38\xff\xf9\x8f\x0d\x7e\x74\x4a\x40\x76\x17\x71\
-\xa8\x0a\x83\xfb\x3b\xe9\x1f\x6d\x67\xe4\x70\x0f\x83\xfb\x9c\xdc\
-\x0f\x52\xd3\x05\xf4\x82\x80\x3b\x64\x69\xf8\xe8\x9e\x3d\x94\xd2\
-\x79\x75\xf9\xea\xf4\x28\x56\x8f\xc4\x53\x27\xc0\x96\x5e\xad\x46\
-\x13\xb0\x7c\x65\xaa\x03\x40\x0b\xf9\xb7\x04\x1f\x4c\x12\x99\x20\
-\x17\x97\xf6\xb0\x94\x38\x4f\x8d\x0a\x1a\x21\x9c\xaa\x8c\x3f\xe4\
-\xc1\xe1\xdc\x3e\xf8\x98\x06\x7a\x49\x44\x6b\xb7\xc8\x93\x5b\xcc\
-\x02\xa0\x39\xd3\x2c\x25\xfb\x48\x27\xf2\xec\x39\xd6\x4b\x86\x19\
-\xca\x64\x1b\x2f\x6c\x50\x23\xc3\x2c\xa9\xf8\x88\x15\xbf\x97\x75\
-\x83\xb9\x89\x1d\x20\xd4\x1d\x3b\x92\x08\x8a\x82\x5e\x93\x78\xff\
-\x7b\xa7\x88\x8c\xf4\x33\xf4\xdc\xa3\x6b\x4e\x9d\x1b\xd7\x99\x19\
-\x5b\x66\x69\x66\x95\xe5\xd9\x14\x4e\x55\x41\xf3\xb4\xf1\x7f\xfc\
-\xe7\xcf\xb3\xfb\x50\x1f\xdf\xfe\x77\x3f\x23\x97\x37\x19\x18\x8d\
-\x70\xfc\x39\x0f\x03\x7b\x14\xee\x07\x29\x24\x24\x24\xc5\x6c\x0c\
-\x4d\x8b\x72\x17\xb2\x53\x25\x7e\x75\x7a\x20\x3a\xda\x1b\xac\x13\
-\x40\xad\x63\xbc\xa9\xb1\x64\x1b\x81\x4e\xbd\x50\xf6\x5a\x04\xb0\
-\x8d\xc0\xcd\x9d\x3c\x46\xcd\xa0\x90\x2b\x51\xab\x1a\xd4\x28\xf3\
-\xf7\xff\xd9\x0b\xf8\x42\x1e\x54\xb7\x42\x38\x5a\xdd\x36\xf8\x98\
-\x06\xc5\xac\x44\xdb\xb0\x15\x5f\x57\xca\x94\xd1\x9c\x59\x30\xab\
-\xe4\x8b\x2a\x85\x6c\x1c\x7f\xc8\xdd\xd0\x32\xad\x62\x13\xa2\x52\
-\xd2\xd1\x75\x79\x23\x01\x84\x7a\x2c\x86\x28\xd6\xad\x7e\x95\xb1\
-\x9f\x4d\x50\x48\xe6\x78\xfa\x7f\xfd\x07\x1b\xee\x17\x88\x48\x74\
-\xf4\x85\x10\x80\x68\x77\x90\x5a\xb5\x86\xe6\x51\x51\x35\x95\xc4\
-\x52\x86\x83\x8f\xf5\xd1\xd6\x69\x32\x7c\xd8\xf1\xb7\x6a\xfc\xdd\
-\x4a\x6a\xba\x40\x29\x2d\xe2\x6d\xb7\xfe\xbb\x5e\x10\xa8\x96\x05\
-\xda\x0f\x8c\xb2\x78\x69\x32\xb6\xf7\xb3\x4f\xb6\x61\xe5\x78\xac\
-\x4f\x59\x7b\xad\xbc\x99\x1d\xd0\x48\xda\x9c\x9a\x5a\x0a\xdd\x0e\
-\x7c\x4c\x03\x04\x90\x64\x6b\x64\xc4\x4d\x8c\x8e\xde\x00\x9f\xfc\
-\x95\x87\xb9\x7c\xfa\x2a\x98\xfa\xb6\xc1\x2f\xe7\xad\xbb\xdb\x36\
-\x40\x21\x5e\xc0\xeb\x4c\x83\x59\x43\x91\x2b\x84\x3a\xfc\x88\xa2\
-\x48\x7b\xa4\x07\xd6\xd9\x79\x5e\x3a\x70\xa8\x32\xbe\x36\x8d\xa0\
-\x27\xd5\xe8\x32\x5a\xe0\xd7\x01\x12\x95\x7a\xbb\xaf\x92\xcf\x9b\
-\x5c\xf9\xe1\xfb\x1b\x54\xbf\x2d\x5d\x03\x32\x5f\xf8\xf5\x30\xb3\
-\x37\xfd\x24\x97\x6b\xe8\x65\x93\x58\x8f\x8c\xe2\xac\x10\xeb\x36\
-\x18\x3e\xee\xe0\x7e\x13\xbb\xf6\xab\x7e\x7b\xd0\x4b\x44\xf5\xea\
-\xc4\xf6\xf6\x30\xfb\x07\xe7\x02\x58\x4d\x80\x8f\xe6\xc4\x55\x7b\
-\x60\x6a\x03\x01\x24\x40\xd6\xcb\x15\xd5\x1d\x0e\x70\x3b\xf7\xae\
-\x53\x15\x70\xaa\x8a\x05\x80\xdc\xce\xe4\xf5\x04\x4b\x33\x49\x22\
-\x1d\x95\x6d\x83\x8f\x69\xa2\x97\x2d\xa0\x14\x97\xd2\x68\xff\xc3\
-\x6d\x59\x30\xaa\xc4\x02\xcb\x88\x62\x3b\xe5\x62\x85\xe7\x9f\xfe\
-\x04\x3f\x7a\xf3\x3b\xe8\x58\x86\x98\x46\x88\x00\xfd\x84\xda\xfd\
-\xb4\xc5\x7c\x04\x3d\x37\xac\x36\xbf\x41\x80\xba\xda\x17\x45\x90\
-\x1d\xa0\xb8\x38\xfd\x3f\xde\x41\x0b\x05\x36\xa8\xfe\x56\xf1\x87\
-\x44\xfc\xa1\xfb\xa3\x6d\xbf\x9d\xac\xaf\xfd\xe5\xac\x40\x25\x0f\
-\xa1\xfe\x12\xd2\x70\x0f\x00\x13\xaf\x9f\xdf\x3f\xf0\xf4\xc1\xf3\
-\x34\x0d\x41\x69\x33\x02\xac\x5f\xb4\xe1\x96\xe0\x63\x1a\xc4\xba\
-\xac\x89\x11\xa1\x76\x3f\x3d\x43\x51\x0a\x25\x81\x0b\xa7\xe7\xe8\
-\x1f\xd4\xb7\x0d\x3e\x86\x41\xb9\x20\xa0\x85\xac\xcc\xa1\xf6\x30\
-\xae\xe6\x48\x82\x59\xa3\xbb\x6d\x96\x8e\xde\x36\x2e\xbe\x33\xc9\
-\x9e\xfd\x23\xbc\xf8\xc4\xd7\x71\x13\x25\x40\x3f\xfd\x3c\x4b\x47\
-\x7b\x17\x3d\x43\x11\x62\x1d\x2a\xfd\xe1\x9b\x75\xbb\xa3\x3e\x88\
-\x26\xd4\x07\x77\x64\x27\x38\x34\xe6\xc7\x52\xc4\xc7\x96\x38\xf8\
-\xd2\x0b\xf7\xc4\xd9\xf3\xf3\x90\x72\x46\x5c\x53\xfb\x73\x4b\x02\
-\xaa\xb7\x82\x24\x55\xd1\xda\xbc\x68\x21\x3f\x89\x9b\x73\x5d\x58\
-\x99\x4c\xdc\x58\x76\x80\x04\xaf\x6d\x68\xbf\x64\x36\xea\x7c\x6e\
-\x35\xb0\xd3\xdd\x6f\xe2\x0f\xb9\x19\xdc\xdf\x09\x40\xff\x48\x3b\
-\x8f\x9f\xa8\xed\x08\x7c\x30\x28\xe4\x44\x9c\xf5\x1a\x57\x48\x14\
-\x51\xa4\x12\xa2\x60\x60\x9a\x22\x2e\xa5\xc0\xfe\x5d\x93\x64\x52\
-\x51\xce\xbe\x71\x83\xaf\x7c\xf5\x25\x16\xce\x9a\xd4\x2a\x26\xb1\
-\xee\x20\x83\xfb\x3b\x19\x39\xdc\xc3\xe3\xa3\xa7\x31\xcd\xba\x81\
-\x2b\xd4\xe3\x2f\x44\x07\x48\x1a\x38\x3c\xe8\xa6\xca\xe9\x6f\xbf\
-\x46\xe7\xe1\xd1\x4d\x7d\xfc\x1f\x54\xd2\x09\x83\xd5\x95\x1a\xf9\
-\x4c\xd3\x67\x1d\x8c\x48\x44\xba\xa4\x7b\x66\x2b\x98\x06\x14\x92\
-\x12\x5a\x9b\x55\x99\x4b\x29\x81\x5a\x05\x02\xed\x85\x7a\xf9\x42\
-\x64\x77\x0f\x89\xf1\xb9\x00\x56\x57\xd0\x4b\xd3\x10\xdc\x20\x32\
-\xf5\x51\x27\xd3\xb0\x2d\xa9\x5b\x8f\xea\x69\x6e\x83\x27\x3f\x26\
-\xe3\x74\xf5\xe2\x74\xc2\x43\x4f\xd4\x88\xc4\xaa\x3b\x02\x1f\xb3\
-\x46\xb9\x28\xe1\xab\xb7\xff\xa5\x74\x09\xa7\x92\xc7\x6c\xe9\xad\
-\x1c\xee\x3f\x4f\xa5\xfa\x10\xe7\x2e\x87\xb8\x71\x7e\x96\x2f\xfc\
-\xc3\x67\x59\x98\x4c\xe0\x6b\xd3\xe8\x19\x8a\xf2\xcc\xe1\x0b\x74\
-\x04\x17\x9a\xd7\x08\x12\x88\x32\xc8\x2a\x82\x43\x03\xa7\x97\x33\
-\x7f\x74\x16\x44\x89\x83\x2f\xbd\x70\xd7\x00\x28\x64\x4d\x2e\xfe\
-\x6c\x99\x95\x73\xef\x53\xcb\x2c\xb0\x5a\x6a\x63\x55\xda\x4f\x3a\
-\x91\xc7\x1f\x72\xe3\xd4\x1c\xb4\x45\x35\x1e\xbe\x47\xbd\x85\xe2\
-\xaa\x65\x7f\xb9\x82\x16\x01\x72\xcb\x20\x39\x4a\xbc\xf5\x4a\x0d\
-\xa7\x4b\xe4\xe1\x67\x0c\xc2\xbb\x7b\x98\x7a\xfb\xa2\xa7\x94\xce\
-\x47\x55\xbf\xdb\x4b\x33\x54\x7d\x83\x1d\x20\x63\x8d\x2a\x15\x64\
-\xa7\x92\xcf\xc7\x57\x6f\x09\xbe\xfd\xfd\xc0\xee\x1a\x03\x43\xdb\
-\xb7\xf6\xd7\x83\x6f\x54\x4d\x8c\x9a\x80\xea\x6d\xf6\x00\x7c\x72\
-\x01\xd3\x5c\x5b\x6b\x8e\x0f\x9e\x26\xea\xef\x67\x7c\xb1\x87\x64\
-\xc6\xc3\xe8\x1e\x89\x90\x2f\xc3\x70\xc7\x9b\xf8\xb5\x54\xf3\x7c\
-\x41\x04\x41\x06\xc9\x89\xa0\xb8\x30\x9d\x1e\x16\xc7\x52\xcc\x5f\
-\x9c\xe1\xe0\x4b\x2f\x6c\x6a\xf8\xed\x54\xf4\x8a\xc9\xc5\x77\xca\
-\x5c\x38\x99\x23\x3e\x35\x4f\x48\x9f\xa4\xb3\x5d\xe0\xfd\xf3\xcb\
-\xbc\x77\xf9\x4c\xe3\x3c\x7f\xd8\xc3\xd0\xfe\x2e\x42\xed\xfd\x77\
-\x9d\x00\xad\xb5\x5f\x10\xa1\x98\xb2\x42\xd6\x93\x99\x22\x17\x4f\
-\xe5\x40\x10\x50\x1c\x1e\x46\x46\xba\x01\x58\x78\xff\xe6\xd0\xc0\
-\xd3\x07\xdf\xe5\x16\x86\xa0\x8c\xe5\x2b\xce\xf6\x1c\x1f\xbd\x78\
-\xe3\xe5\x53\x47\xa7\xde\x3a\x4b\xdf\xa3\x07\x76\x3c\xaa\xb7\x5d\
-\xf0\x31\x0d\xca\x45\x8b\xc5\x4e\x9f\x93\x9a\x6e\xa0\x17\x74\xd4\
-\x60\xb6\xa9\xce\x5b\xa4\x37\x34\x4d\x6f\x68\x7a\x63\x61\xb4\xaa\
-\x7e\xc1\x52\xfd\x82\xec\xb2\x54\x3f\x2a\xa7\xff\xe8\x95\x4d\xfb\
-\xfc\x77\x2a\x3f\xfe\x93\x1c\x63\x17\x92\x4c\x5d\x5b\x62\xf2\xea\
-\x22\x89\x45\x8d\x48\x70\x8e\x0b\x13\x3a\x12\x09\x14\x34\xbc\x1e\
-\x2f\xfe\xb0\x07\xcd\xa7\xe2\x54\x77\x18\xa8\xb8\x0d\x59\x5f\xfb\
-\xf3\x4b\xe0\x72\x17\x88\xdf\xa8\xb1\x3c\x9b\x22\x9b\x2a\xe0\xf1\
-\x0d\x32\x72\xc0\x8b\xd6\xe6\x23\x33\x1f\x8f\xb1\xb6\x27\x20\x63\
-\x0d\x0e\xad\x21\x40\x1e\x48\x05\xfa\x62\x37\x3b\x0e\x0f\x2d\x5e\
-\xf9\xfe\x4f\xda\xfb\x1e\xd9\x7f\xcf\xc0\xc7\x34\x28\xe4\x54\x5c\
-\x6d\x6b\x0d\x40\x87\x5c\xc4\x30\x77\x5a\x68\x56\x70\x87\x20\x28\
-\x20\xa9\xe0\x70\x83\xd3\xcb\x3b\xff\xf5\x24\x88\x12\x8f\xfe\xc6\
-\x97\x77\x78\xbf\xcd\x65\xf2\xaa\xce\xec\xcd\x1c\x17\xdf\x99\xe0\
-\xfa\xb9\x59\xb2\xa9\x02\x25\x52\x94\x0c\x37\xff\xea\xdf\x7c\x9a\
-\xd3\x3f\x9d\x62\x7a\x3c\x4d\xcf\x50\x94\xde\xe1\x18\xed\xbd\x7e\
-\x8e\x3d\xe3\xfa\xe0\x0f\x6e\x91\x0d\xb5\x7f\x15\xaa\x15\x93\x60\
-\x24\x4d\xa5\xec\xa0\x5a\xad\x91\x4d\x15\x48\xc5\x73\xcc\x4e\x04\
-\x08\x74\x45\x48\xdc\x9c\x0f\x60\x19\x82\x2d\xd3\xd5\x5e\x13\x5a\
-\xfd\x01\x32\x56\x34\xc9\x2a\xb0\xb8\xf7\xd3\x8f\x9f\x7c\xe5\x7f\
-\xff\x83\xcf\x4d\x9d\x3c\x47\xdf\xc3\xfb\xef\x09\xf8\xb6\x06\x50\
-\x83\x75\xf5\x9f\x2e\x23\x4b\x15\x6b\x89\xa7\x6d\xc5\xe1\xb5\xe2\
-\x2f\x22\x88\x32\xa6\xec\x44\x70\x68\x08\xaa\x87\xf1\x53\x33\xc4\
-\x6f\x2e\xf2\xe8\x37\xee\xf6\x10\xaf\x80\x37\xa0\xd1\x3f\x1a\xa3\
-\x5c\xaa\x02\x3d\x0c\xed\x0d\xf1\xb9\x7f\xf0\x11\x3e\xfd\xb5\x32\
-\x2f\xff\xc9\x39\x32\x19\x93\x91\x23\x6e\x8e\x3e\xa3\xde\x75\x23\
-\x70\x63\xdb\x6f\xe0\x72\xe7\x91\xa4\x0a\xa6\x21\x53\x29\xe9\x14\
-\x72\x65\x96\xe7\x52\xdc\xbc\xe2\x63\xf7\xee\x6e\xce\xff\xf9\x4f\
-\x5b\x09\x60\x1b\x82\xcd\x29\xd9\x34\x9b\x80\x14\xb0\xe8\xef\x8e\
-\x5c\xea\x38\x3c\xf4\xd8\xf9\x3f\xf9\x71\x7b\xe7\xfe\x41\x6b\x98\
-\xf6\x2e\x83\x8f\x69\x50\xcc\x3b\xf0\xf4\xd5\x0d\xc0\x4c\x19\xc7\
-\x26\xed\xff\xed\xf1\xb0\x55\xbf\x82\xa0\xa8\x08\x4e\x8d\xf4\xaa\
-\xce\xd5\x97\xcf\xd3\xf7\xf8\xe1\xbb\x6a\xf5\xf7\x8f\x2a\x3c\x74\
-\x22\x80\xcb\xed\x40\xaf\xd4\xc8\xa5\x0b\x08\x82\x40\x67\xaf\x8f\
-\x99\x6b\xf3\x94\xca\x79\x06\x0f\x79\x18\xdc\xef\x40\xf3\xde\x7d\
-\xeb\x7f\x63\xed\x37\xa9\x55\xc0\x13\x5a\x05\xd3\x40\x14\x05\x34\
-\x8f\x4a\xa5\xa4\x93\x8a\xe7\x58\x59\x34\x38\x7e\xd4\xea\xa5\xcd\
-\x9d\xbe\xbe\xbb\xeb\xd8\xf0\x39\xd6\x1a\x82\x8d\x6e\x8b\x8c\x35\
-\x52\x94\xc6\x5a\x3d\x6b\xfa\xc8\x2f\x3f\xff\xca\xcb\xbf\xf5\xad\
-\x97\xc6\x5e\x7b\x4f\xde\xf3\xc2\xa3\x77\x1d\x7c\xbd\x2c\x52\x33\
-\x44\x9c\x3e\x4b\x03\xe8\x05\x1d\x87\x54\xdc\xb4\xfd\xbf\x05\xfa\
-\xf5\xda\xaf\x80\xac\x82\x43\x03\xd5\xcb\xd9\xff\xf2\x0a\x8a\x5b\
-\xe3\xe0\x97\xee\x9e\xd5\x6f\xcb\x91\xa7\x54\x8e\x3c\xa5\x12\x5f\
-\x30\xb0\x66\xd1\x5b\xe2\x0f\xe5\xeb\xb5\xfd\xde\x39\x91\xd6\xd7\
-\xfe\xec\x92\x81\xea\xca\x22\x89\x15\x30\x45\xdc\x1e\x0b\xcf\x62\
-\xae\x4c\x31\x57\x26\x9f\x2d\x81\x16\x05\x20\x3d\xb3\xdc\xd1\x75\
-\x6c\xd8\x4b\xd3\x0e\x90\x68\x19\x17\x10\xeb\x1f\x0a\x58\x0b\x2a\
-\xce\xa9\x7e\xf7\xd5\xc1\xe7\x8e\x8e\x5d\xf9\xc1\x49\xd2\xb3\x4b\
-\x77\x15\x7c\x0c\x83\x72\xa9\x1e\xff\x5f\xef\x01\x14\x12\x05\x14\
-\xc9\x9a\x87\xbf\xed\xad\x5e\xf3\x91\x9c\xe0\x70\x21\x38\x3d\x5c\
-\x7f\xe3\x06\xe9\xf9\x24\x0f\xfd\xda\xe7\xee\xa9\xc3\x27\xdc\x21\
-\xae\xd9\xee\xf5\xd8\xc0\x86\xda\x9f\xb4\xe6\x35\x7a\xbd\xf1\x46\
-\xb9\x7a\x3c\x35\xdc\x3e\x15\x4f\x40\xa3\x90\x2b\x53\x2e\x54\x58\
-\x9a\x83\xc8\x50\x17\x89\x9b\xf3\x21\x9a\x86\x60\xbd\x19\x68\x3a\
-\x84\xec\x6e\x81\xad\x05\x96\x80\xe9\x7d\x9f\x7d\xf2\x15\x4f\x2c\
-\x98\x3b\xff\xe7\x3f\xbd\xab\xe0\x83\x49\xa5\x2c\xa3\xb5\x59\x00\
-\x95\xea\x31\xfe\x8a\x5c\xc6\x44\xdc\xde\x26\x48\xf5\x2e\x9f\x03\
-\x1c\x2a\x82\xea\x26\xb9\x90\xe3\xea\xcb\xe7\xd8\xf3\xe2\x89\x5b\
-\xc4\xf5\xfd\xfc\x45\xaf\x98\xc4\x17\x0c\xe2\x0b\x06\x97\xde\x2d\
-\x33\x79\x55\x27\xbe\x60\xa0\x57\xb6\x8e\x78\x5d\x5f\xfb\x33\x8b\
-\x35\x5c\xae\x74\xbd\xf6\x5b\x65\x1b\x6c\xd3\x71\xfb\x5d\x68\x1e\
-\x27\xb9\x54\x81\x74\x22\x0f\xa6\x49\x78\xb0\x93\xec\x62\xd2\x53\
-\x27\x80\x1b\x4b\x4d\xad\x71\x08\xd9\x9e\xc0\x2a\x96\x2d\x90\x00\
-\x66\x81\xf0\xbe\xcf\x3e\x79\xe6\x9d\xff\xf0\xfd\xa7\xa7\xde\xbd\
-\x42\xdf\x43\xc3\x77\x05\x7c\xcc\x1a\x7a\x45\x42\xf1\x58\xef\x60\
-\xcf\xd4\x91\x84\xea\x36\x6d\x00\x3b\xa4\x5b\x46\x90\x1d\x08\x0e\
-\x17\x35\x53\xe1\xec\x9f\xbd\x86\xbf\xa7\x9d\x3d\x2f\x3e\xfb\xf3\
-\xc6\x78\x53\xd0\x27\xae\xe8\xdc\xbc\x50\x26\x35\x39\x89\x58\x49\
-\xb0\x50\x68\x06\x0c\xbb\x7d\x2e\x9c\x2e\x85\x91\xc3\xda\x06\xe3\
-\x71\x7d\xed\x2f\x24\x0d\x6a\x15\x13\x6f\x60\xd9\xfa\xb1\x2e\x91\
-\x48\x19\xb7\x37\x88\xcb\xe3\xc4\xe5\xb1\x9a\xa2\xa5\x05\x81\xd1\
-\x9e\x36\x4a\xe9\xbc\x9a\x9e\x5d\xe9\xf6\x77\x47\x6c\x43\x50\xa1\
-\xc5\x1f\x60\xb3\xc1\xc0\x0a\x31\xce\x62\xd9\x02\x53\x5d\xc7\x86\
-\x4f\xf6\x3e\xb6\x77\xd7\xf9\xef\xbc\xd5\xdd\xb9\xb7\x17\xc5\x29\
-\x7f\x60\xf0\x31\x0c\x74\x5d\xc6\xe5\xb2\x1e\x5b\xce\x94\x71\xca\
-\xf9\xed\x77\xff\x04\x11\x41\x90\x1a\xaa\x1f\x55\xe3\xda\x6b\x57\
-\x29\x24\x73\x3c\xf7\x8f\xbf\xfa\xf3\xc6\x7a\x83\x5c\x7a\xb7\xcc\
-\xc5\x77\x0b\xac\xcc\x65\x69\xcb\xfc\x90\x70\x9b\x41\xb5\x5c\xe2\
-\xbb\xaf\x34\x23\x98\x34\x8f\x13\x6f\xc0\x45\x2a\xde\x49\xa5\x1c\
-\xe1\xa9\x5f\x68\x4e\x92\xd8\xd0\xf6\x2f\xd4\xd0\xd4\x55\x24\xb1\
-\x04\x66\x73\xae\x9a\x22\x57\x89\x44\x4d\x02\x61\x4f\x23\x3a\x0b\
-\xd3\x24\xb2\xcb\x8a\x60\x5a\x9d\x58\xe8\xaa\x13\xa0\x35\x79\xc5\
-\x1a\x02\xb4\x6a\x81\x55\xac\x45\x14\xc7\xf7\x7f\xfe\xe9\x9f\xce\
-\x9f\xb9\xf1\xd2\xf9\xef\xbe\x25\x1f\xfb\xe2\x13\x1f\x18\x7c\x4c\
-\x83\x62\x49\x23\x54\xf7\x01\xe4\xe3\x05\x64\xa9\xbc\xbd\xee\x9f\
-\x20\x58\xab\x93\xc9\x0e\x04\x87\x13\xc1\xe9\x62\x75\x21\xcb\xf8\
-\x1b\x97\xd8\xf3\xe2\x09\xfc\xf5\x8c\x5d\xf7\x8b\xfc\xcd\x1f\xe6\
-\x98\xb9\x91\x65\xec\xc2\x1c\xcb\xb3\xab\xa4\x97\x7d\x3c\xbe\x7f\
-\x91\xe5\x54\x81\x8b\xe7\x2e\xa3\x53\xc4\x45\x08\x11\x89\xe1\xc3\
-\x3d\x78\x02\x1a\xe5\x52\xd3\xb8\xac\xe9\xc2\xda\xda\x9f\xa8\x51\
-\x2d\x1b\x84\x23\x8b\x56\xb9\xaf\x1b\xd8\x1b\xdc\x5d\x64\x72\x2c\
-\xc4\xf2\xec\xaa\x45\x0a\x87\x89\xa2\xca\x68\x41\x2f\xf1\xb1\xb9\
-\x8e\xfe\xa7\x0e\xae\x37\x04\x69\x25\x80\x4d\x82\x0a\xd6\xac\x92\
-\x15\x60\x46\xf5\xbb\x2f\x1f\x7c\xe9\xc4\xfb\x67\xfe\xe0\xe5\x63\
-\x7d\xc7\x76\x11\x1e\x88\x7c\x20\xf0\xab\x55\xeb\x71\xb2\x6a\x3d\
-\xbf\x9c\x29\xe1\x55\x2a\xdb\xeb\x01\xd8\xaa\x5f\x72\x58\xdd\x3e\
-\x55\xe3\xdc\x9f\xbe\x82\x3b\xda\xc1\xf0\x27\x4e\x00\xe6\xed\xef\
-\xf1\xb7\x24\xd7\xdf\xaf\x30\x73\x23\xc7\xd9\x37\x6e\x30\x5b\x8f\
-\x9c\x2e\x91\xe2\xfc\x78\x0a\x93\x1a\x3d\x5d\x9d\xa4\xe7\x02\xb4\
-\x85\xfd\x74\xf4\x87\xe8\xec\x0f\xd1\x3f\xda\x4e\xef\xee\x66\xdc\
-\x41\x21\x21\x21\x4a\x26\x5a\x3d\xdc\xab\x90\xa8\xa1\xa9\xc9\x7a\
-\xed\xb7\xd7\xb3\x6a\x92\x60\xa0\x3f\x4f\x5b\x24\x4c\xa8\xdd\x8f\
-\xe6\x53\x69\x0b\x59\xe3\x33\x81\xce\x36\xea\xeb\x2e\xdb\x86\x60\
-\xdd\x0e\xb0\x1c\x42\xeb\x09\xd0\x6a\x10\x2e\x02\x93\xfd\x4f\x1e\
-\x78\x63\xfc\xa7\xef\x0f\x9e\xfa\xe3\x37\x03\x9f\xf8\x17\x9f\xbe\
-\x63\xf0\xc1\x40\xd7\xeb\xab\x75\xb9\x64\xf4\x82\x4e\x4d\x37\x90\
-\xd5\x0a\xb7\xcd\xa4\x22\x08\x08\x82\x88\x20\xc9\x88\x8a\x03\x51\
-\x55\xb9\xf1\xb3\xab\x14\x56\x73\x1c\xfd\xea\xff\x74\x47\x73\xfe\
-\xef\xa5\xe8\x65\x93\x54\x22\x47\xa5\x54\x6d\x24\xb4\xaa\x55\x35\
-\xa0\x93\x7f\xf9\xff\xfd\x02\x07\x1e\x1b\xe4\x7f\xfc\xbf\x6f\x30\
-\x3f\x9d\x23\xd6\xdb\x46\xac\x3b\xc8\xa3\x1f\xf3\x32\x7c\xc8\x22\
-\x40\xb5\xbc\x7e\xbc\xdf\xa0\x9c\x35\x68\x0f\xcd\xad\x69\xfb\x5b\
-\x49\xa0\xc8\x55\x8e\x1c\x2b\x90\xcd\x58\xfd\xff\x68\xb4\x0c\xa6\
-\x41\x78\xb0\x9d\xf3\xdf\x7b\x27\x80\x35\x2a\x68\x13\xc0\xce\x5f\
-\x64\xae\x1f\x22\xb4\x9b\x82\x3c\x4d\x83\x30\x74\xec\x6b\x1f\x7f\
-\xfd\xa7\xff\xd7\x1f\x7e\xf2\xca\x8f\xcf\xcb\x7b\x3e\xb2\xef\x8e\
-\xc0\xc7\x34\x28\x16\x35\x9c\xde\xe6\x1c\x00\x00\x59\xac\x6c\xc3\
-\x00\xb4\x9c\x3e\x42\x3d\xb2\xb7\x54\xa8\x31\xf1\xc6\x25\xfa\x9f\
-\x7c\x1c\x77\xb4\x03\xbd\x50\xdd\x90\xb2\xe5\xe7\x29\x03\x7b\x1c\
-\xf4\x0d\x87\xf1\xf8\x54\x96\x67\x53\x8d\x10\x3a\x80\xce\x81\x08\
-\x1e\xbf\xca\x27\xbf\x7c\x98\xf7\x7e\xb6\xc0\xf0\x21\x8d\x03\x8f\
-\xaa\x6b\x1c\x48\xb9\x65\x19\x45\x6b\x8e\xf7\x67\xe7\x75\x34\xe7\
-\x0a\x92\x60\xd7\xfe\x56\x69\x92\x60\x78\x77\x06\x87\xc3\x4b\x45\
-\x17\x89\x44\xac\x73\x03\x1d\x01\x00\x96\xaf\x4e\xf7\x45\x47\x7b\
-\xcf\xb2\xce\x21\xb4\xd9\x18\xb1\x81\xd5\x14\x34\x0c\x42\x7f\x77\
-\xe4\x5c\xdf\xe3\xfb\x0f\x5c\x79\xe5\xec\x40\xdf\xe1\x5e\xb4\x80\
-\x6b\xc7\xe0\x63\x18\x54\xab\x0a\x8a\xda\x34\x00\x1d\x72\x69\x5b\
-\xea\x5f\x58\xa3\xfe\x1d\xdc\xf8\xf1\x79\x10\x45\x0e\xfc\xe2\x33\
-\xe4\x13\x26\xe9\x39\x19\x59\x35\x1b\x59\x41\x24\xa7\x95\x44\xe2\
-\x4e\x33\x82\x7c\x50\xd1\xbc\x02\x9f\xfb\x07\x7e\x26\xae\x68\x2c\
-\xcd\xb4\x51\x2e\xd6\x1a\x53\x20\xf3\x85\x1c\xd7\xaf\x64\x09\x46\
-\x24\x7e\xe9\x9f\xb6\x6d\xf0\x23\x94\x73\x22\x7a\x41\x20\xd0\xd3\
-\xac\xfd\xa5\x6c\x8d\x88\x7f\xc5\x2a\x4b\x83\x4d\x62\x7c\x9b\x24\
-\xe8\xef\xcb\x5a\xcd\x65\xbd\x5c\xc3\x03\x96\x43\x28\x35\xb5\xd4\
-\x19\x1d\xed\x5d\xdf\x13\xd8\x34\x48\xa0\xd5\x20\x4c\x61\x19\x84\
-\x13\x87\xbe\xfc\x91\x1f\x2e\x5d\x9e\xfc\x95\xd3\x7f\xfe\x9e\xe7\
-\xa9\x5f\x7b\x62\xc7\xe0\x83\x81\x5e\x55\x70\xd5\x3d\x80\xf9\x78\
-\x01\x51\xa8\x62\x6c\xc3\x00\x14\x04\xc9\x4a\x20\x29\xc9\x08\x8a\
-\x83\x99\x53\x37\x38\xf6\x75\xcb\xe1\xe3\x57\x75\xca\x59\x11\xa3\
-\x2a\x50\x29\x58\xf7\xd2\xe3\x1b\x35\x8a\x9d\x13\x48\x14\xcd\x46\
-\x42\x27\x41\xb4\xd2\xca\x00\x08\x92\xd9\x38\xbe\x1b\xa2\x38\x04\
-\x86\x0f\x39\x1a\x6a\x7d\x3b\x62\x1a\x90\x5f\x96\x50\xfd\x46\x43\
-\xa3\xe5\x96\x74\x9c\x72\x1a\xa7\x94\xb2\x40\x15\xb8\x2d\x09\xd6\
-\x8b\xbf\x23\x48\x66\x3e\x6e\x87\x89\xb7\xf6\x04\xb6\x5c\x39\x74\
-\x7d\x53\x30\x83\xe5\x1b\x38\xfb\xce\x7f\xf8\xfe\x53\xf3\x57\xe6\
-\xe9\x1c\x89\xee\x08\x7c\x4c\x93\x62\xd9\x4b\xa0\xde\x04\x94\x33\
-\x25\x54\x51\xdf\xa6\x0b\x58\x6c\x04\x7c\x64\x57\x32\x00\xf4\x3d\
-\x7e\xb8\x01\xa2\xad\x2a\x6d\x83\xc9\x96\x6a\x59\xc0\xac\x09\x18\
-\x06\xd4\xea\x31\x88\x35\xbd\x49\x94\x6a\x49\x58\xdb\xa4\xd6\x45\
-\x10\xd7\x66\xfd\x72\xd4\xc1\xb8\xd7\x9a\x25\xb7\x2c\x63\xd4\x04\
-\x3c\x51\xbd\xfe\xfe\x26\xc5\xd5\x2a\x11\xef\x54\xbd\x6c\x69\x06\
-\xef\xed\x80\x04\x81\xce\x20\x69\xcb\x10\xf4\xb0\xce\x10\xbc\xd5\
-\xe2\xd1\x35\x2c\xdf\x80\x3d\x4e\x30\xd5\x75\x6c\xf8\x64\xc7\xe1\
-\xa1\xdd\xa7\xff\xe2\x6c\x7b\xe4\x7f\x3e\x61\xa5\x67\xdd\x26\xf8\
-\x55\xdd\xee\x01\xc8\xd4\x74\x83\x9a\x6e\x20\xb9\xf4\x6d\x39\x80\
-\x04\x44\xeb\x3c\x41\x44\x2f\x5b\xaa\xd1\x34\x20\xb7\x2c\x51\xab\
-\xd4\x4f\xaa\xeb\x58\x0b\x24\x2b\x59\x94\x05\xa2\x89\xd3\xfe\xeb\
-\xb7\x10\x9b\x2c\x60\x05\x59\x18\x55\xeb\xd8\xa8\xb1\xa5\x66\x69\
-\x25\x4a\x6b\x52\x2a\x3b\xdb\x18\xdc\x9e\x2c\xa6\x01\xd5\x92\x48\
-\x71\xd5\x9a\xe2\x15\xe8\xa9\x36\x72\x1e\xe5\x96\x2a\x28\x52\x0e\
-\xa7\xbc\x6a\x81\x6b\x07\xef\xed\x90\x04\xfe\xf6\x00\x53\xa7\xc7\
-\x03\xac\x8d\x0d\x90\xb0\x7c\xaa\x5b\xbf\x1b\x6b\x7d\x03\x73\x40\
-\xdb\x91\x5f\x7e\xfe\xb5\x97\x7f\xeb\x5b\x5f\xbc\xf2\x93\x6b\xf2\
-\xc1\x8f\x8e\x6c\x0b\x7c\x0c\x4b\xfd\x03\x38\xbd\x4a\x23\xeb\x87\
-\x2c\xe9\x1b\x7c\x00\x25\xdd\x49\xb9\xda\x1c\x58\xf1\xbb\x32\xd6\
-\x39\x76\xac\x7f\x3d\xec\x3b\x71\x53\x41\x94\x4c\x5c\x01\x2b\x1e\
-\xd1\xa8\x59\xaf\x5c\x2d\x41\xb5\x06\x46\xcd\x44\x2f\xda\x71\xae\
-\x26\x26\x26\x8a\x5a\x9f\x26\xa8\x58\x9e\x64\xc9\x21\x20\x39\xac\
-\x94\x31\x8a\xcb\xfe\xcb\x56\x03\xb9\x56\xd6\x16\xa8\x6e\x6b\x90\
-\xb2\xa5\x41\x8c\x1a\x54\xcb\xd6\x77\x86\x0e\xf9\xf8\xce\xc7\x07\
-\x64\xa7\x89\xaf\x6b\xad\x31\x9b\x5f\xd1\x09\x38\x67\x9a\x96\xbf\
-\x3d\x90\xbb\x43\x12\x04\x3a\xac\xc9\x3e\xcb\x57\xa7\x7b\xa3\xa3\
-\xbd\x6e\x5a\x0c\xc1\x5b\x11\xc0\x2e\x11\xdb\x20\x6c\xf8\x06\x46\
-\x7f\xe1\xb1\x2b\x17\xff\xec\xf5\x03\x7d\x07\x3a\xf0\xc7\xb4\xdb\
-\x82\x8f\x59\xa3\x54\xf1\xe2\xf4\x58\x45\x5b\x48\x14\x11\x85\xda\
-\x1a\xf5\x5f\xad\x49\x4c\x2e\xb7\x73\x73\x36\xc8\xea\x8a\x35\xf1\
-\xc3\xa9\x39\x88\x46\xba\x39\x34\xb2\x48\xd0\x69\xf5\x16\x64\xa7\
-\xd5\xa6\x4a\x0a\x04\x7a\x74\x04\xd1\x6c\x8e\x55\xd8\x93\x5a\xed\
-\xae\x2a\xd6\x6f\x95\x7c\x3d\xad\x6b\xc9\xaa\xe5\x95\x92\x40\xad\
-\x08\x55\x5d\xa0\x5a\x11\x1a\xda\x43\x14\x41\x76\x09\x88\x32\x28\
-\x2e\x01\x41\x12\x70\x68\x22\xa2\x2c\xa0\x68\xcd\x77\xb5\x41\x52\
-\xd6\x64\x36\xd9\xbc\xfd\xb5\xc9\xb2\x95\xdc\xca\xf6\x30\xaa\x26\
-\xb2\x5a\x58\xdb\xf5\xbb\x03\x12\x84\xfb\xad\xa5\x79\xeb\x86\xa0\
-\x1d\x25\xac\x6c\x97\x00\xeb\x7d\x03\x13\xc3\x1f\x3f\xfe\x93\xd9\
-\x53\xd7\x7a\xce\xff\xe8\x5a\xe0\xa9\xaf\x1c\xba\x2d\xf8\x96\x01\
-\xe8\x40\x71\x5b\x3a\xb2\x52\xd0\x37\x10\xe0\xcc\xf8\x10\xd3\x93\
-\x3a\x17\xde\xbe\xc8\xc2\xa4\xb5\xf0\xa4\x43\x55\xd8\x7b\xbc\x8f\
-\x8a\xd1\xcd\x63\x87\x97\x08\xb8\x4d\xbc\xb1\x50\xbd\xf0\x97\x11\
-\x44\xff\x6d\xc1\xc7\x34\x70\xb8\xac\xcf\x0e\xb5\xfe\x5d\x23\xf0\
-\xd5\xda\x6a\xba\x40\xb5\x02\x35\x5d\xa4\x5a\xb1\x6c\x86\xf2\xaa\
-\x44\xad\x06\xa9\x92\xf5\xce\xa6\x69\xa5\x87\x53\x34\x11\x51\x12\
-\x70\xb8\xc5\x3a\x6f\x4c\x1c\x6e\x19\x51\xb6\x6a\xbd\x28\x09\x38\
-\x3c\xcd\x62\xfd\x20\xdd\x53\xb3\x75\x10\x6e\x0d\x6b\x76\x4e\x02\
-\x7f\x47\xc0\x36\x04\x77\x44\x00\x9b\x04\x6b\x86\x8c\x81\x9b\x07\
-\xbe\xf0\xf4\xbb\x6f\xfc\xdb\x3f\xf9\xd8\xd8\x7b\x33\x0c\x3d\xd4\
-\x71\x4b\xf0\x31\x0d\xaa\x35\x67\x23\x08\xb4\x9c\x2e\x21\x49\xcd\
-\xf6\x7f\x2a\x1e\x63\x72\xbc\xc2\xca\x5c\x8a\x53\x3f\xbb\x40\xa2\
-\x3a\x8e\x4e\x01\x2f\x9d\xe4\xd2\x05\x9c\x2e\x91\x70\xa4\x9d\x87\
-\x42\x4b\x98\x86\x55\x5b\x4a\xc9\x55\x3c\x61\xdf\xa6\xe0\xeb\x15\
-\x93\xb9\x09\x73\x4d\xb8\xf6\xc0\x6e\xd0\xdc\x1b\xc1\x07\x13\x49\
-\xae\x21\x49\x26\xb8\x36\xd7\x26\x46\x4d\x40\x2f\x49\x96\x3d\x50\
-\x92\x30\x6a\x02\xa5\x15\x09\xb3\x7e\x4e\x6e\x41\x42\xaf\x88\x36\
-\x6a\x16\x70\xf5\xe3\x06\x39\x4c\x13\x59\x95\x90\x5d\x12\x98\xa0\
-\xb8\x24\x64\xd5\x1a\x8b\x73\x05\x6f\x31\x7c\x6d\x97\xeb\x7a\x70\
-\x77\x48\x82\x40\xbb\xbf\xd5\x10\xb4\x9b\x00\x79\x3b\x04\x80\x8d\
-\x83\x45\xd3\x91\xd1\xde\xf7\x06\x3f\x72\x64\xf8\xca\xcf\x2e\xf4\
-\xf7\xed\x0f\xa1\x28\xe2\x96\xe0\x63\x1a\x14\xf5\x00\x7e\x4f\xd3\
-\x09\xe4\x72\xd4\x1a\xed\xff\xe4\x42\x90\x72\x31\x45\x2e\x9f\x61\
-\xb2\xfa\x33\x92\xdc\x04\x40\xe1\x0a\xc6\x42\x95\xc8\x69\x2f\x83\
-\xfb\x43\x64\x8b\x1a\x6d\x7e\x50\x54\x47\x13\xf0\x75\xe0\xcf\x4d\
-\x9a\xbc\xf9\xc3\x0a\x89\xe5\x02\x89\xc5\x34\x35\xdd\xa0\x2d\xe6\
-\xc5\xdf\xe6\x66\xe4\xa0\xcc\xd1\x47\x0d\x2b\x8b\x89\xb9\xb5\xc6\
-\x58\x7f\x4f\x51\x34\x70\xba\x2c\xd7\xaa\xcb\xcd\x6d\xb5\x4e\xa9\
-\xa0\x34\x3e\x97\x4b\x0a\x46\xcd\x22\x80\x9e\x97\x28\xa6\xac\xe4\
-\xd6\x59\x5d\xa6\x52\x91\x1a\x44\x91\x55\x89\xce\x23\xd1\x46\x9c\
-\x04\x80\xec\x14\xa8\x1a\x2a\x4e\x56\x37\x07\x77\x07\x24\xf0\xb7\
-\xfb\x98\xbb\x3c\xdf\x4a\x00\xe7\x4e\x08\x60\x37\x05\xb6\x41\x38\
-\x0f\xb4\x8d\x7c\xe2\xe1\x9f\xce\x9d\xbe\xde\x7e\xfa\xaf\x6e\xa8\
-\x8f\x7e\x76\xf7\x96\xe0\x1b\x35\xeb\x8d\x64\x97\xd4\xf0\x00\x0a\
-\x98\x18\xa6\x48\xa1\xec\x22\xbd\x5a\xc1\xe9\x72\xd0\xbd\x27\x40\
-\xea\x3b\x93\x8d\x87\xea\x14\x48\x70\x9d\xd5\x95\xfd\xc4\xe7\xb3\
-\x14\x4a\x6e\x82\x46\x05\x6f\x67\x98\x95\xeb\x93\x84\x77\xf7\xac\
-\x01\x60\xe2\x9a\xc9\xeb\x7f\x55\x64\xec\xe2\x1c\xb3\x63\xcb\x24\
-\x16\xad\x2e\xa3\x43\x55\xe8\x19\x8a\x90\x4e\x76\x92\x5c\xf6\xf2\
-\xfc\x8b\x36\x09\x6e\x0f\x3e\x98\xc4\x97\x1d\x2c\x2d\x5a\x45\x15\
-\x0c\xea\x44\xc2\x45\xeb\xfa\x2d\x08\xa4\xaa\xa5\xc6\x67\xd5\x59\
-\xd8\xe4\x9e\xac\xb9\xae\x58\x50\x49\x67\x3c\xcc\x9f\x31\xe9\x7b\
-\xa2\xab\x91\x33\x49\x76\x88\x54\xcb\x4e\xec\x39\x99\x1f\x84\x04\
-\x81\x76\x1f\xd5\xb2\x2e\xa7\x67\x57\xda\xfd\xdd\x91\x86\x4b\x78\
-\xbb\x04\xb0\xb5\x80\x8e\xe5\x1b\x88\x03\x33\x6a\xc0\x73\xf9\xd0\
-\x97\x9f\x3b\xfd\xce\xbf\xff\xde\x13\xf3\x37\x92\x74\xee\xf2\xb3\
-\xd9\x90\x71\xa5\xea\x05\xc0\xe9\x69\xf6\x00\x04\xc1\xc4\x34\x45\
-\xaa\x86\x4c\xa9\x50\xa1\x2d\xea\x65\x3e\xb5\x88\xb1\xde\xe2\xa6\
-\x48\x55\x37\x30\x0c\x4b\xb5\x36\xe7\x81\x6e\x54\xfb\xef\xfd\xa4\
-\xc2\xfc\x54\x82\x2b\xa7\xa6\xb8\x79\x75\x9a\x2c\xf3\x98\xd4\x50\
-\x09\xb0\x3c\xdb\x49\x21\x57\x06\x06\xf0\xf8\xbc\x3c\xf5\x5c\xe9\
-\xb6\xe0\xcf\xcd\x3a\x39\xf5\x8e\xc6\xf2\x82\x4e\x3e\x63\x0d\xe1\
-\x3a\x35\x07\x6d\x61\x0f\xfb\x0f\x14\xd8\xb7\x77\x75\xe3\x3d\x6e\
-\x4b\x28\x36\x9c\xe7\x52\xf3\x38\x1d\x05\xa6\xa6\x55\x56\x27\x33\
-\x84\x86\x02\x00\x48\x4e\x81\x6a\xd1\xd5\x6c\x02\x3e\x00\x09\xfc\
-\x31\x0b\x83\xdc\xd2\x6a\xa4\x4e\x00\x07\xa0\xec\x84\x00\xb0\xd6\
-\x37\xb0\x08\x4c\x76\x1d\xdd\x7d\x32\x32\xd2\x33\x72\xfe\xd5\xe9\
-\x70\xa4\x73\x04\xc5\x29\x6c\xf0\x12\x96\xab\x1e\x9c\x75\xc3\xa8\
-\xd9\x03\xb0\xda\x7f\xd3\x14\x90\x15\x4b\x15\xc6\x22\x1d\x1b\x1e\
-\xa8\xe2\x47\x71\x48\x28\x8a\x8c\x51\x4f\xf5\x1e\xda\xd5\x49\xfc\
-\xfa\x14\x7c\xf2\x89\x46\x41\x4e\x5c\x33\x28\xe4\xaa\x98\x35\x83\
-\x1b\x57\xc7\x99\xe5\x24\x29\x26\x31\xa8\xa1\x11\xa2\x94\x3b\x0c\
-\xa7\xac\xf1\x77\x5f\x70\x37\x07\x8f\x8a\xf8\x03\xd5\x2d\x81\x9a\
-\x18\x57\x79\xfd\x15\x95\xc9\x6b\x0b\xcc\xdc\x58\x26\x15\xcf\x51\
-\xab\xd6\x08\x84\x3d\x74\xf4\x87\xc9\xa4\x3a\xc8\x65\xc3\x3c\xf2\
-\xf0\xf2\x8e\xc0\x2f\x14\x14\x0a\x45\xab\x09\x53\xa4\x2a\x7e\x4f\
-\x16\xb0\x9a\x99\x80\x7f\x95\xd4\x9c\xab\x41\x00\xd9\x29\x52\xaa\
-\xd5\x33\xb6\x7c\x40\x12\x28\x4e\x09\x2d\xa0\xb1\x72\x7d\xa6\xab\
-\xeb\xd8\xb0\x46\x7d\xda\xf8\x4e\x09\x60\xd6\xb5\x40\x01\x2b\x09\
-\xd1\x1c\x10\x3c\xfe\xf7\x3f\xf5\xa3\x97\x7f\xeb\x5b\x5f\xbc\x72\
-\x72\x41\x3e\xf8\x4c\xfb\x06\x17\x71\xb5\xe6\x44\xae\x13\xa0\xa6\
-\xd7\xea\x37\xb2\xde\xcc\xa3\x16\xf1\x87\xda\x99\xbe\xbe\xcc\xb1\
-\x67\x87\xf9\xf4\x47\xbf\xc4\xf7\x7e\xf4\xc7\x80\x35\x13\x38\xca\
-\x01\x82\x51\x1f\xfe\xb0\x17\x8f\x9a\xc5\x34\x04\x4c\x13\x2a\x85\
-\xf2\x9a\x02\x9f\xbd\x69\x50\xab\x1a\x24\x97\xb3\x56\x02\x89\x3a\
-\xf8\x00\x05\x12\xcc\x73\x1a\x35\x17\x60\x66\x2c\x48\xd7\xae\x08\
-\xe3\xd7\xfd\x1c\x39\xae\x6f\x0a\x54\x21\x2f\xf1\xee\x5b\x2a\xf3\
-\x53\x09\x2e\x9c\x1c\x67\x72\x6c\x96\x5c\x75\xc5\xd2\x00\x63\x7e\
-\xba\x66\xbb\x28\xe6\x4a\xc0\x00\xc1\xa0\x9f\xe1\xc1\xe4\x6d\xc1\
-\x5f\x49\x78\x39\x7f\x39\xc2\xec\x9c\xda\x18\x1c\xf2\x04\x5c\x04\
-\x83\x06\x8f\x1f\x99\x20\x12\x5c\xc5\xef\x4d\xb1\x12\x8f\x92\x5b\
-\xca\xe3\x89\xb9\x51\xdc\x12\x19\xc3\x6b\x69\x55\x41\xfa\xc0\x24\
-\x70\x07\x5c\x14\x57\x73\x1a\x4d\x6f\xe0\x8e\x09\x60\x93\xc0\x8e\
-\x1b\x58\x06\xa6\x55\xbf\xfb\xe2\xc1\x97\x4e\x0c\x9f\xf9\x83\x97\
-\x8f\x75\xee\xf2\x10\xee\x52\x9b\xd6\xab\x69\x50\xa9\x79\x51\xed\
-\x51\xc0\x74\xb9\x31\x09\xd4\x96\x8e\x50\x91\x45\x97\xc2\xf5\xf7\
-\x67\xf9\xea\x17\xfe\x11\x97\xde\x9c\xa7\x54\xa8\x10\xa0\x9f\xd1\
-\xd1\x51\x46\x8f\xf6\x12\x09\x99\x38\xc4\x0a\x46\xcd\x49\x5b\x5f\
-\x07\x63\xaf\x9c\x5a\x53\xe0\xb5\x9a\x81\x53\x53\x08\x44\x3c\xe4\
-\x59\xda\xd0\x94\x94\x48\x91\x65\x9e\x54\xbc\xcf\xca\x2c\x12\x0f\
-\x6e\xd9\xe6\x5f\x78\x5f\x23\x19\x2f\x53\xca\x97\xb9\x71\x75\x9c\
-\x39\xde\x25\xc5\x64\x9d\x94\x61\xaa\xb3\x8f\x01\x56\x6a\x1c\x5f\
-\xa0\x87\x81\xde\x94\x95\xad\x6c\x2b\x6d\x32\xd3\xc6\x1b\x6f\xb5\
-\x33\x3d\xb6\xcc\xd2\xcc\x54\xc3\x36\xf1\x06\x5c\x74\x0e\x84\x49\
-\xad\x0e\xf1\xf4\x23\x53\x0c\x74\x2d\xe2\xd1\x32\xe4\x96\x3c\x78\
-\x62\x6e\x44\x49\xc0\x30\x15\x8c\x9a\x84\x28\x7d\x70\x12\x84\xfb\
-\x82\x2c\x4c\x66\x55\x9a\x5d\x41\xc7\x9d\x12\xc0\x36\x08\x1b\xbe\
-\x81\xfe\x27\x0f\xbc\x3e\xfe\xd3\xf7\x07\x4f\xfd\x68\x2e\xf0\xdc\
-\x2f\xf5\xa1\x28\x34\xfc\x03\xe5\x9a\x0f\x8f\xba\x36\xdd\x76\x2b\
-\x01\xfa\xa2\x49\xb2\xc3\x31\xae\x5d\x4a\x71\xe3\xdc\x3c\xff\xf8\
-\x1f\xfd\x53\x5e\xfb\xf3\xb3\xf8\xc3\x1e\x46\x8e\xf4\xb0\x6b\x34\
-\x4a\x7f\x74\x19\xa3\x26\x60\xd4\x40\x72\xda\x49\x25\x52\x68\x6d\
-\x5e\x30\x4d\x04\x01\xdc\x1e\x95\x60\xd8\xbb\xe5\x8b\x17\x49\x50\
-\xab\x1a\x14\x73\x65\x0c\x63\x73\xf0\x31\x4d\x16\xe6\x25\x04\xaa\
-\xe4\x33\x25\x56\xb9\xc9\x2a\x37\x1b\x84\xca\x32\xcf\x1c\xef\xe2\
-\x98\xf5\x12\x9b\x0c\xd0\xb3\x3b\xca\xdc\xbc\x9b\xfe\x9e\xd4\xa6\
-\xe0\xa7\x32\x2e\x7e\xf6\x76\x07\x57\xcf\x4e\x73\xf3\xe2\x1c\x13\
-\x57\xe7\xc8\x57\x93\x56\x8d\x94\xdb\x48\x2c\x66\x28\x17\x75\xa0\
-\x0f\xcf\xb3\x45\x5c\xae\x3c\xf1\xe5\x3c\xed\x44\x50\xfd\xb2\xe5\
-\xc8\x32\xbc\xa8\x42\xb2\x0e\xe8\x9d\x93\x40\xf3\xab\xa4\xa6\xc6\
-\x02\x75\x02\xb8\x00\xc7\x9d\x4e\x60\xdb\x2c\x6e\xe0\xc6\xe3\xff\
-\xe4\x73\x3f\xa8\x94\xa9\x9e\x7f\x7d\xb9\x01\xbe\x51\x93\x30\x50\
-\x50\x5a\xa2\x80\x10\x4c\x4c\x84\xc6\x26\x8a\x26\xfb\xfa\x97\xd9\
-\x7f\x38\x40\xa4\x2b\x88\x3f\xe4\xe1\x23\x5f\x38\xca\x33\x9f\x3e\
-\xc4\xa1\x63\x6d\x1c\x1a\x5c\x46\x96\x6a\x0d\x87\xa3\x3b\x6c\x65\
-\x64\x2d\x24\x52\x0d\xe0\x9c\xaa\x80\x61\x18\x74\xf6\x87\x88\x6a\
-\x83\x88\x48\x1b\x5e\x5a\xc6\x72\xdd\x39\x54\xa5\xb9\x66\xe1\x26\
-\x6d\x77\x26\x2d\xa0\x6a\x0e\x6a\x94\x49\x31\xb5\x41\x9b\x64\x99\
-\x27\xcf\x12\x89\xc5\x0c\xe9\x44\x8e\x7c\x5e\xde\xb2\xcd\xbf\x70\
-\x25\x46\x62\x31\x43\x26\x99\xe7\xea\xc5\x31\xc6\xab\x3f\xe5\x1a\
-\xdf\xe7\x1a\xdf\xe7\x46\xf5\x47\xdc\xb8\x3a\xce\xf5\x73\x33\xcc\
-\xdc\x5c\xe6\xd4\xa5\x7e\x3c\xae\x34\x86\x6e\x50\xce\x58\x83\x1c\
-\xb2\x53\xa4\x6a\xb8\x5a\x34\x6a\x3d\x0f\x42\xab\xf7\xd5\x58\x6b\
-\x73\x35\x1d\x73\x6b\x5d\xf4\xee\xfa\x6c\xec\xf4\xec\x4a\x84\x0f\
-\xd0\x04\xd8\x62\xc7\x0d\x64\xb0\xc2\xc9\x3d\xaa\xdf\x1d\x38\xf8\
-\xa5\x67\x87\xce\xfc\xb7\x1f\x1d\xf7\xb5\x47\x88\x0c\x0e\x93\xd7\
-\x63\x00\xa8\x01\xab\x7f\x5b\xd3\x0d\x24\x51\xdc\x90\x05\x56\x10\
-\x60\xa4\x7b\x99\x81\x76\x05\xbd\x66\xbd\x96\x28\x64\x70\x39\xac\
-\x6e\xa3\x61\x88\x18\x86\x40\xad\x66\xf9\xde\x5d\x41\x2f\xa9\xd9\
-\x65\xc2\x43\x5d\x60\x9a\xc4\xba\x04\x26\xae\x95\x88\x76\x05\xf8\
-\xe8\xc7\x9e\x63\xe1\x3b\x57\x1a\xfe\x04\x00\x27\x5e\xfc\xf4\x10\
-\x08\xbb\xf1\x05\x35\xbc\x5e\x83\xcd\x0d\x37\xeb\xa3\xc7\xef\xa2\
-\x46\x65\x8b\x3f\x5e\x43\xc7\xea\x15\x94\x0b\x3a\x56\x5c\xcd\x46\
-\xf0\x75\x5d\x64\x62\xca\x4d\xad\xba\x4a\x31\x5f\xb6\x32\x9c\xb5\
-\xe4\xbb\xb1\x9b\x15\xe7\x98\x8b\x50\xbb\x8f\xee\xc1\x08\x85\x92\
-\x03\x45\xae\x50\x48\x16\x71\xfa\x1c\x48\xaa\x48\xb5\xa0\xd6\x01\
-\xa5\xa5\x56\xef\x5c\x13\x84\xfb\x02\x00\xe4\x96\x56\x43\xfe\xee\
-\x88\x13\x50\x3e\xc8\x14\xd6\xf5\x71\x03\xf3\xc0\xcd\xfe\xa7\x0e\
-\xbe\xda\x71\x78\x68\xf1\xf2\x5b\xb3\xac\xa4\x22\xb8\x7b\x3a\x08\
-\x0d\xae\x55\xcb\xa6\x29\x6c\x39\xe9\x43\x91\x6a\x68\x8e\x32\x9a\
-\xa3\x8c\xaa\xe8\x8d\xef\xab\xe5\xaa\x65\x00\xd6\x04\xca\xd9\x3c\
-\xaa\xdf\x43\x21\x99\x6e\x78\xf4\x06\x86\x6a\xa8\x9a\xc8\xf4\xd8\
-\x0a\x1f\xfd\xc2\xa3\x8c\x86\x9e\x21\xc2\x1e\x34\x42\x78\xe9\xa4\
-\x83\x63\x44\x3d\xfd\x44\xbb\x83\x84\x3b\x03\xec\x1a\x2a\x6f\x01\
-\xbe\x69\x8d\x01\xa8\x0a\x87\x1e\xda\x8f\xc2\xc6\x49\x9e\x22\x12\
-\x12\xf6\x98\x44\xcb\x82\x95\xeb\xba\x7a\xe9\x8c\x8b\x72\xd1\x5a\
-\x7c\xda\x1d\x81\x0c\x1b\xd3\xdb\x66\x99\x27\x5f\x4d\x92\x8a\xe7\
-\xc8\xae\x16\x58\xcd\x7a\xd0\xd4\x5c\x63\x69\x1a\xd5\x27\x53\xaa\
-\x85\xd7\x4e\xd4\xfd\x00\x9a\x40\x51\x65\x52\x53\x4b\x0d\x0d\xf0\
-\x41\xe7\x30\x6f\x16\x37\x70\xfd\xc8\x57\x9e\xfb\x4b\x57\x50\xcb\
-\x5d\xfd\xc1\x9f\x21\x88\x59\xfc\xdd\xcd\x51\x93\xb6\x5d\x41\x0c\
-\x53\xaa\x6f\xb7\x9e\x01\x54\xce\x17\x59\x9d\x9e\x62\xea\x9d\x37\
-\xb9\xfa\x37\xdf\x63\xf6\xdc\xdb\xe5\x42\x6a\x2a\xee\xeb\x76\x4f\
-\x04\xfb\xa3\xf9\xf4\xec\x0a\xb6\x6f\x5f\x71\x18\x1c\x7f\xca\xc4\
-\xa9\x2a\x9c\x3f\x39\xce\x97\x7e\xed\x93\x0c\xa9\x1f\x61\x90\x8f\
-\x31\xc0\x47\xe8\x0f\x1c\x66\xcf\x43\x7d\xec\x7b\x78\x80\x81\x21\
-\x91\x48\xa4\xbc\x29\xf8\x98\x06\x9d\x9d\x3a\xa9\x95\x2c\x5d\x03\
-\x61\x1e\x1a\x39\x81\xc2\xda\x7c\xf6\x2e\x42\x68\x84\xf0\x87\x3d\
-\x84\x62\x3e\xdc\xee\x0a\x5b\xf5\xf3\xf3\x99\x22\xfe\x90\x87\x32\
-\xd9\x35\xe9\xee\x6c\xa9\x51\xa1\x46\x85\x62\xae\x4c\xad\x6a\x90\
-\x2f\x38\x71\xa9\x59\x0a\x49\x8b\x00\xb2\x2a\x52\x31\x7c\x4d\xe0\
-\x3f\x20\x09\x02\x51\x0f\x7a\xa9\x62\xc7\x05\xee\xc8\x11\xb4\x95\
-\xb4\xba\x89\x97\x00\x55\x0d\x78\x5c\x4f\xff\xe6\x4b\xce\x97\x7f\
-\xeb\x5b\x5f\x3e\xf9\xbb\x7f\x28\x3f\xfd\x9b\xbf\xd6\x48\xd2\x10\
-\xdb\x17\x45\x52\x24\x92\xe3\x49\x6a\xba\x81\x89\xd9\x48\xec\x55\
-\xd3\x2b\x14\xe2\xcb\xe4\x13\xcb\x14\x12\xcb\x94\xd2\xab\xc8\x4e\
-\xa5\x1a\xec\x6f\x4f\xf5\x3f\xf9\xf8\x6c\xef\x63\xfb\x6e\x38\xbd\
-\x5a\x09\xf0\xab\x7e\xcf\xf1\x99\x77\xae\xba\x5b\x7d\xfb\x03\x83\
-\x55\xf8\xb8\xc4\x1b\x2f\x87\x58\x9e\x4b\x71\xec\xd9\x61\x52\xf1\
-\x1c\xb2\x2c\x12\xed\x0e\xd2\x3d\x18\x61\x68\x8f\x9b\xa7\x4f\x64\
-\xb6\x04\x1f\x4c\x06\x07\x0b\x8c\xdf\x70\x31\x33\xb6\xcc\xd7\x7e\
-\xfd\x25\xc6\xfe\xf9\x04\x2b\x5c\xa1\x42\x16\x07\x5e\xda\x39\x44\
-\x34\xdc\x41\xac\x3b\x88\xc7\xaf\xd1\xd5\x3e\xbd\xa5\x93\xc7\xed\
-\x73\xa1\x79\x9d\xf8\xb5\x10\x4e\xbc\x1b\x48\x20\x22\x21\x20\x35\
-\x26\x74\x28\x8a\x8e\xaa\x14\xea\x76\x40\x19\xd9\x29\x5a\x3d\x01\
-\x53\x46\xa4\xda\x54\xf5\x77\xda\x1c\x58\xc7\xf5\xdc\xf9\x5b\x47\
-\x04\xed\x44\x5a\x47\x0c\x53\x58\xa3\x4c\x8a\xea\x77\xcb\x8f\xfc\
-\xc6\xa7\xbd\xef\xfc\xde\xf7\x7e\xe1\x95\xdf\xf9\x3d\xf9\xe0\x97\
-\x5e\xc0\xca\x42\x66\x89\xbf\x47\x64\xec\xc7\x17\x30\xaa\x06\x95\
-\x42\x9e\x42\x62\x09\xbd\x60\xe5\x8e\xf3\xc4\x82\xb9\xe8\xde\x8e\
-\x54\xc7\xc1\x27\xc7\xbb\x8e\x0d\x5f\xc6\xd2\x2e\x49\x2c\x1f\x84\
-\x13\xe8\xf4\x77\x85\xbb\xf5\x62\xb9\x43\x2f\x96\xac\xb1\x81\x7a\
-\xa1\x0f\x0c\x56\xf0\x7c\x4e\xe2\xfc\x99\x60\x3d\xe7\x9f\x81\x20\
-\x80\xe6\x91\xd8\x3d\xa2\xb3\xff\x60\x06\x45\xa9\x6d\x09\x3e\x98\
-\xf4\xf7\x65\xe8\xee\x73\x73\xe3\x72\x11\xbd\x5c\xe5\xb3\x9f\xf9\
-\x3c\x3f\xfe\xee\x49\xca\xa4\x71\xe2\xa7\xbd\xbd\xdd\xca\x1a\x7a\
-\xa4\x87\xfd\x7b\x56\x51\xa4\xea\xa6\xe0\xfb\x3d\x39\x9c\x2e\x85\
-\x7c\xa6\xc4\x63\xcf\x1c\xe3\xdb\xdf\xd9\xc5\x4c\xe1\xfd\x35\x85\
-\xe7\xa5\x13\xb7\xdc\x46\x20\xec\x21\x10\xf1\x10\x0b\x5e\xc7\xa9\
-\xe4\x11\xc5\x1a\xa5\x4c\x05\x7f\xb7\xd5\x7c\x56\xcc\x00\xaa\xb0\
-\x52\xaf\xfd\x1f\x80\x04\x98\x60\x34\xff\xec\xdd\x20\x80\x4d\x82\
-\x56\x07\x91\x04\x08\xb1\xbd\xfd\xd5\xa7\x7f\xf3\xa5\xd4\x99\xff\
-\xf6\xf2\x8b\xa7\x7f\xff\x2f\x36\x5d\x14\xc8\x5e\x30\xa1\xf7\x91\
-\xe1\x55\x5f\x57\x78\xa9\xe3\xd0\xe0\x98\xea\x77\x2f\x63\x8d\x39\
-\xa4\xea\xfb\x34\x96\xdf\x01\xac\xc5\x98\x6a\xc1\x5d\x1d\x13\xc0\
-\xd1\xf4\xec\x0a\xe1\xc1\xfa\xfa\x06\x75\x00\x22\x31\x9d\xe7\x3e\
-\x51\x41\xaf\x40\x3a\x25\xa1\x28\x35\xfc\xfe\xca\x96\x6d\xfe\x66\
-\x16\xfc\xf3\x1f\x59\x04\x33\xc6\xd8\xd5\x12\x5d\xbb\x22\x1c\x7d\
-\x74\x1f\xe5\x52\x15\xa7\x2a\xd3\xd1\x1f\x66\x60\x4f\x3b\x83\x43\
-\x26\x47\xf6\xcf\x6d\x0a\x3e\xa6\x81\x22\xd7\x18\xe8\xcd\x70\xe1\
-\x82\x42\xcf\x60\x98\xcf\x7d\xec\xab\xfc\xf7\xef\xe4\x1a\x4e\x2a\
-\x37\x51\xba\x78\x98\xce\xee\x18\x9d\xfd\x61\x82\xfe\x2a\x7e\x2d\
-\x0d\x98\xa8\x8e\x42\x7d\x7d\x24\x2f\x92\x53\xa4\x62\xf8\x51\xc5\
-\x95\xe6\x3b\xde\x21\x09\x2a\xa5\x2a\xa6\xb5\x8a\x49\x05\xa8\xde\
-\x2d\x02\xc0\xda\xb1\x02\xfb\xf1\xe5\x40\x5f\x2c\xf5\x91\xdf\xfa\
-\xea\x95\xc5\xf3\xe3\xfb\xf4\x62\xb9\x4d\x10\x05\x07\x20\x38\xdc\
-\xae\x62\x74\x6f\xdf\x3c\x96\x11\x59\xac\x03\x9c\xa3\xb9\xf4\x49\
-\xb6\xfe\x39\x5f\x27\x56\x11\x4b\xbb\x14\x00\xaf\xea\x73\x2f\xcb\
-\x4e\xa5\x9a\x9a\x5b\x91\xc3\x83\x1d\x9b\x03\xa0\x98\x84\x23\x55\
-\xb6\xb6\xf6\xb7\x1e\x00\x52\xe4\x2a\xcf\x9f\x98\xa7\x3d\xd6\xc6\
-\x8d\x31\x1f\xde\xc0\x81\x46\x7b\xee\xf6\x08\xec\x1b\x5d\x65\xdf\
-\xf0\xc2\x96\xe0\xdb\xf7\x3c\x30\x3c\xc3\xc4\xf4\x3e\x2e\x9d\x9a\
-\xe2\x23\xbf\xf0\x08\x37\xce\x2c\x31\x31\x7d\x03\x93\x1a\x2e\x42\
-\x74\x74\xc7\x18\xdc\xdf\x49\xd7\x60\x84\x87\xf6\x5c\x6d\xdc\x43\
-\x73\x66\x28\x64\xad\x5e\x88\xc3\x2d\x51\x4e\xfb\xd7\xd6\xb7\x3b\
-\x20\x81\x5e\xae\x91\x5e\xce\x33\xf2\x99\x9e\x99\x7a\x79\x56\xee\
-\x26\x01\x6c\x12\xd4\xad\x2b\x6c\x96\x65\x81\xa5\xf6\x83\xbb\x6e\
-\x62\x39\x20\xea\x0b\xb3\x35\x7e\x2f\xd3\x5c\xe0\xa0\x75\x2b\xb5\
-\xfc\x66\xaf\x8f\xa3\x62\x0d\x62\x64\x81\x8c\xa7\xbd\x2d\x57\x48\
-\x66\x03\xdb\x1d\xd5\xdb\x2e\xf8\xcd\x1a\x6c\x72\xe4\xe0\x12\x47\
-\x0e\x98\xc4\x13\x5a\xfd\xdc\x0c\xe1\x60\x66\xcb\x36\x7f\xfd\x3d\
-\x03\x9e\x1c\x4f\x1d\x9f\xe0\x75\xa3\x9f\x6b\xe7\x66\xf9\xd4\xaf\
-\x3c\xce\x6b\x7f\x6e\xf5\x2c\xbc\x01\x17\xdd\x43\x51\xfa\x86\x63\
-\x1c\x18\x49\xd2\x15\x5e\x6c\xdc\xc3\xa9\xe4\x88\xc7\xeb\x03\x50\
-\x6e\x99\xe2\xea\xba\x85\x95\xee\x80\x04\xf3\xd7\x57\x01\xe8\x3e\
-\x3e\x7a\xa3\x5e\x91\xca\x77\x9b\x00\xf6\x6b\x54\x58\xab\x11\x92\
-\xb4\x04\x21\xd4\xcf\x5d\xbf\xea\x55\x85\xc6\x8a\x57\x8d\xd5\x37\
-\xed\x15\x38\xed\x52\x15\xea\xa4\x28\x02\x79\x5f\x67\x28\x97\x9e\
-\x8b\x07\xee\x05\xf8\xeb\x3f\x87\xdb\xb2\xeb\xce\xbd\x3d\xf8\x0d\
-\xbb\xa4\x73\x11\xcf\xb3\x45\xde\x3a\xbb\x9b\xe4\xaa\xc4\x93\x9f\
-\x3a\x00\x58\x33\x83\x03\x41\x89\x43\xc3\x13\x0c\x77\x4f\xac\x79\
-\xb6\x22\x59\xfe\x8f\x72\xa6\x8c\x1a\x50\x58\x9d\x0a\x6f\x5e\xdc\
-\x3b\x20\x41\x7c\x26\x43\x64\xa4\x27\x8e\xd5\xb4\xe6\x80\xe2\xdd\
-\x26\x80\x4d\x82\xd6\x65\xcf\xca\xf5\x87\xd9\x69\x69\x5b\x17\x06\
-\xb6\xcf\x59\xbf\x74\x9a\xd1\x72\x4e\xab\xd8\xa4\x2a\x59\x04\x08\
-\x27\xa7\x4f\x5e\xee\xbe\xd7\xe0\x6f\xd5\xcf\xdf\x09\xf1\x22\x81\
-\x24\x9f\x79\xf6\x6d\xd2\x39\x0f\x4b\xc9\x00\xba\x2e\x11\x6b\x9b\
-\x20\xec\x8b\x6f\xfa\x6c\xa7\x6c\x99\x3c\x7a\xb1\x8a\xea\xb7\x22\
-\x86\x2a\x86\x1f\x87\x98\xbe\x63\x12\xcc\x8f\xa5\x18\xf9\x85\x7d\
-\xf3\x58\x76\x55\xf6\x5e\x11\xa0\x95\x08\xf6\xf2\x67\xb6\x4b\x4d\
-\x58\xf7\xfb\x66\xc7\xb7\x92\x35\x04\x08\xf4\xc5\x16\x80\x83\xe9\
-\xb9\x38\xfe\x8e\x96\xa5\x6e\xee\x33\xf0\x9b\xc7\x26\x7e\x77\x06\
-\xbf\x3b\xbd\xad\x67\xbb\x9c\x69\x4a\x99\x60\x7d\x60\x68\x2b\x02\
-\x6c\x8f\x04\xf3\x13\x19\xf4\x72\x8d\xd8\xbe\xfe\x31\x2c\x0d\x90\
-\xc5\x6a\x02\x4e\xdc\x43\x0e\xdc\x31\xd0\x5b\xc8\x6b\x36\x01\xca\
-\x40\x21\x3a\xda\x3b\x0d\x90\x4f\x66\xf1\x77\x04\xee\x7b\xf0\x77\
-\xfa\x6c\x45\x2a\x36\x56\x4a\x75\x78\x64\xaa\x05\xed\x16\x65\x73\
-\x6b\x12\x2c\x8c\x65\xf0\xc4\x82\x39\x7f\x77\x64\x12\x4b\x03\xe4\
-\x81\xf2\xdd\xcf\x66\x78\x6f\xc5\xd6\x2a\xf6\x62\x89\x39\x4f\x2c\
-\x98\x4b\xcf\xdb\x6a\xf4\xc3\x03\xbe\x45\x80\xe6\xa4\x52\xd5\xaf\
-\x50\xac\x85\x6e\x5f\x3c\x5b\x78\x0c\xe7\xc7\xb3\x74\x1f\x1b\x9e\
-\xc3\x8a\xe6\x4a\xd7\xcb\x4f\x7f\xc0\x08\x70\xa2\xb5\x77\x51\x04\
-\xb2\xde\x8e\x50\x2e\x7e\x73\xf1\x43\x07\x3e\xa6\x81\x2a\x67\x1b\
-\x63\x02\xb2\x2a\x51\xae\xf9\xb6\x51\x46\x1b\x49\x30\x7f\x33\x8b\
-\x5e\xae\xd1\xf5\xd0\xc8\x95\x3a\x01\x32\xf5\xf2\xab\x3e\x60\x04\
-\x80\x75\x04\xc8\xfb\x3a\x43\xa9\xd4\x42\xf2\x43\x07\x3e\xa6\x89\
-\x22\x5a\x59\x54\xf5\xa2\x8e\xd3\x23\x63\x98\x0a\x55\x43\xbb\x7d\
-\x09\xad\x23\xc1\xc2\x78\xce\x56\xff\xe3\x58\xea\xbf\xbe\xb4\x2c\
-\xb5\x07\x99\x00\x25\x20\x17\xe8\x89\x2e\xea\xc5\x0a\x85\xd5\xdc\
-\x87\x0a\x7c\x00\xa7\x6c\x45\x0e\xe9\x85\x2a\x0e\x8f\x15\x6a\x5e\
-\x36\x2c\x2d\x50\xa8\x78\xf8\xf1\xf9\x67\x39\x3b\x71\xe4\xb6\x24\
-\x98\x9f\xc8\x33\xf0\xd4\xc1\x49\xac\x08\x2e\xbb\xfd\xaf\x00\x3b\
-\x4e\xce\x7b\x3f\x88\x41\xd3\x0e\xc8\x75\x1d\x1b\xbe\x09\x90\x9a\
-\x4f\x7c\xa8\xc0\xb7\xff\x8b\x22\x95\x1a\x86\xa0\x1a\x70\x50\xa9\
-\xf9\x01\xb8\x36\xb7\x9b\xcb\x57\x9d\x9c\xba\xdc\xc3\xf5\x85\x91\
-\x2d\x49\x30\x75\x2d\x8b\x5e\x36\xe8\x79\x64\xcf\x05\xd6\xb6\xff\
-\x55\x38\xf1\x40\x12\xc0\x64\xed\xaa\xd9\x19\xcb\x10\x5c\xfd\xd0\
-\x81\x0f\xa0\xca\xd9\xc6\x5c\x0a\x87\x47\xa6\x58\xb5\x0c\xc1\x64\
-\x2e\xc0\xca\x7c\x8a\x89\x2b\x0b\x9c\x1b\x1f\x45\xaf\x6d\x9e\x87\
-\x60\x61\xa2\x48\x64\xa4\x27\xae\xfa\xdd\xd3\x58\x0e\xb9\x5c\xbd\
-\xec\x6a\x70\x8b\xf5\xe4\xee\x5f\x69\x18\x82\xf6\xca\xd9\x19\x6f\
-\x47\x28\x17\x1f\x5f\xfa\xd0\x81\x0f\xe0\x54\x72\x0d\x0d\xe0\xf4\
-\x28\x94\x6b\xd6\xe8\xa0\x51\xb3\x62\x1b\x13\x8b\x69\x12\xf1\x2a\
-\x73\xc9\xee\x0d\x25\x55\xc8\xd6\x98\x9f\x2c\x11\xdb\x3f\x30\x8b\
-\x35\xb9\xd7\x6e\xff\xf5\xfa\xc3\x1f\x44\x02\x00\x56\x13\xd0\xe8\
-\x09\x84\x06\x3b\x97\x53\x0b\xa9\x0f\x1d\xf8\x00\x9a\x92\x6a\x6a\
-\x00\xaf\xb2\xc1\x10\xac\x94\x74\x12\x8b\x69\x66\xe2\x9d\x1b\xae\
-\x9d\x9f\x2c\x22\x3b\x95\xea\xf0\xc7\x8f\xbf\x87\x45\x00\x7b\x2d\
-\xe1\xaa\x9d\x32\xfe\x41\x25\x80\x3d\xde\x50\x04\x72\x81\xbe\xd8\
-\xbc\x5e\xaa\x90\x5e\x58\xfd\x50\x81\x0f\xa0\x2a\x56\x00\x49\x21\
-\x51\xac\x4f\xaf\x37\xd7\x74\x07\x53\xf1\x1c\xa9\x95\x1c\x0b\x89\
-\x8d\x3e\x82\xa9\x6b\x05\x22\x7b\xfa\xe2\x58\x91\xdb\xb6\xfa\x2f\
-\xd3\x32\x97\xfd\x43\x41\x80\xe8\x68\xef\xa4\xec\x54\xaa\xa9\x85\
-\xd5\x0f\x15\xf8\x00\xa2\x50\x5d\x63\x08\xba\x82\x4e\x2a\x86\x0f\
-\x51\x12\x71\x79\x9c\xd4\xaa\x06\xd9\x54\x81\x42\x51\x24\x5d\x08\
-\x36\xae\x4b\x27\x74\xd2\x09\x9d\xa1\xe7\x8e\x5e\xa4\x69\xfd\xdb\
-\xea\xbf\x79\xff\x9f\x37\x92\x77\x28\x26\x2d\x3d\x01\x20\xed\x69\
-\x6f\xcb\xc5\x27\x56\x3e\x54\xe0\xdb\xa2\x2a\x39\xf2\xf5\x39\x95\
-\x96\x21\xd8\x86\x47\x2d\xe0\x74\x29\x48\xb2\x48\x21\x57\x26\x97\
-\x2e\x92\x2f\x37\x57\x34\x1f\xbb\x90\x43\xf5\xbb\x4b\x91\x91\x9e\
-\xcb\x34\x9d\x3f\x75\xe3\xaf\xb9\x62\xc8\x03\x4a\x80\x13\x36\x01\
-\xca\xd4\x7b\x02\xa1\xc1\xce\x54\x6a\x21\x75\x5b\x00\xe6\x17\x7d\
-\x5c\xba\x1a\xe5\xd2\xb5\x18\x97\xae\xb5\x33\xbf\xe8\xbf\xaf\xc1\
-\x07\x70\xca\xad\x86\xa0\x83\x52\xd5\x47\xd0\x93\xc2\xe3\x73\xe1\
-\x09\x68\xd4\xaa\x06\x55\xbd\xc6\x6a\x2e\xd0\xb8\x66\x7e\xa2\x44\
-\xff\x13\xfb\xa7\x68\xaa\xff\x2c\xeb\xd4\x3f\xdc\x9d\x98\xc0\x9f\
-\x97\xac\xe9\x09\x84\x77\x77\x4f\xdf\x7c\xf5\x6c\xbf\x5e\xac\xa0\
-\x38\xa5\x0d\x00\x14\x8a\x0a\x27\xdf\xeb\x60\xec\xba\x40\x7c\x31\
-\x4d\xb5\x52\x43\x76\x48\x84\xdb\x23\xf4\xf6\x47\x79\xec\xc8\x24\
-\x01\x6f\x8e\xfb\x0d\x7c\x00\xcd\xb1\x4a\x3c\x69\xc5\x1d\x3a\x3c\
-\x56\x80\x68\x9b\x37\x47\x20\xec\xc1\x1b\x70\xb1\x30\x99\xb0\x52\
-\xc4\xd7\x65\xea\x5a\x01\xbd\x62\xb0\xeb\xc4\x91\x33\x34\xad\xff\
-\x02\xa0\xaf\x5f\x3f\xf8\x41\x26\x40\xab\x1d\x90\xed\x3a\x36\x7c\
-\x03\x78\x7a\x65\x62\x85\xce\x91\x18\xad\x00\xe8\xba\xc8\x8f\x5e\
-\xeb\xe5\xea\xf9\x14\x57\xcf\x4c\xb1\x34\x9b\xa2\x98\x2b\xe3\xf2\
-\x38\x89\x75\x07\x98\xdb\x1d\x23\x93\x19\xe2\xe3\xcf\x5c\xb7\x48\
-\xb0\x0d\xf0\x0b\x25\x95\xd9\xe5\xb0\xb5\x78\x35\x10\x0b\x26\x08\
-\xfb\x56\xee\x3a\xf8\x60\x35\x01\x60\x19\x82\x5a\xc8\x05\xa6\x89\
-\xcb\x59\x25\xe0\x2b\x13\x08\x7b\x29\xe6\xca\x6b\xce\x9f\xbe\x5e\
-\xa0\xe3\xf0\xd0\xa2\xea\x77\x4f\x61\x11\xc0\xf6\xfd\x6f\xba\x76\
-\xf0\x83\x2a\xf6\xd0\x70\x11\x4b\xbd\xa5\x3c\xb1\x60\x2e\x3e\x19\
-\xf7\x58\x39\x0c\x9b\x00\x9c\xb9\xd0\xce\xe2\x42\x95\xf9\xc9\x38\
-\x97\x4e\x8d\xb3\x52\xbd\x61\x85\x78\xa7\xbc\x2c\xcc\xf6\x93\x4d\
-\xd5\x43\xaf\x9c\x83\x7c\xea\xd9\x0b\x28\x52\x3d\xde\x7e\x13\xf0\
-\xf5\xaa\xc4\xc5\xf1\x5d\x5c\xb8\xd6\xce\xca\x42\x9a\x7c\xa6\x88\
-\xac\xc8\xb4\x45\x63\x74\x74\x08\x3c\xbe\xff\x3c\x11\xdf\xca\x5d\
-\x03\x1f\x6c\x43\xb0\x48\x29\x53\x42\x0b\xb9\x70\x05\x9d\x94\x4b\
-\x3e\xfa\xa2\x0b\x4c\x74\x86\x49\x2c\xa6\xeb\x13\x54\xac\xbe\xff\
-\xca\x7c\x99\x47\x5e\xdc\x73\x83\xb5\xd6\x7f\xa3\xef\xdf\x2a\x0f\
-\x30\x01\x4e\x98\xf0\x5a\xab\x21\x98\x6a\xdb\xd5\x91\x5a\x99\x98\
-\xf5\xac\xaf\x7d\xd7\xc7\xbc\xe8\xe5\x1c\xd3\x63\x8b\x4c\x57\xdf\
-\x66\x85\xcb\x8d\xf9\x7e\x6d\x0c\x62\x5c\x7d\x0c\x87\xaa\x10\x6a\
-\xf7\x31\x31\x14\x65\xb8\x6f\x76\xcb\x9a\xff\xfa\xd9\x03\x5c\xb9\
-\x22\x71\xf9\xd4\x15\x96\x67\x57\xc9\xa6\x0a\x38\xeb\xd7\xf6\xec\
-\x8e\x91\xce\x3e\xc4\x73\x0f\x9d\xa5\xab\x6d\x8e\xed\x82\x1f\xcf\
-\xc6\x58\x4a\x45\x00\x88\x05\x56\x08\x7b\x97\x36\x9c\xe3\x94\x73\
-\x2d\x1e\x41\x85\x62\xb6\x8d\x91\xae\x4b\x5c\x68\xdf\x85\x37\xa0\
-\xe1\xf1\xb9\x50\xe4\x95\x86\xf1\xd7\x75\x6c\xf8\x3c\x96\xf5\xbf\
-\xa1\xef\xdf\x2a\x0f\x30\x01\x80\xa6\x21\x98\x07\xd2\xa1\xc1\xae\
-\xd9\xe9\x93\x97\xbb\xf5\x62\xa5\x3e\x19\xd5\x24\x9e\x70\x93\x49\
-\xe4\x09\xb5\xfb\x28\x91\x22\xce\xb5\x35\x93\x3d\x93\xdc\xac\x67\
-\x10\x89\xb2\x34\xb3\xca\xcc\x42\x1b\xc3\xbd\x33\x9b\x82\x7f\x69\
-\x7c\x17\x57\xaf\xca\xcc\x8d\xaf\x70\xf1\xed\x71\x56\x72\x33\x64\
-\x98\xc1\x81\x17\xdf\x64\x77\x7d\xa6\x6f\x05\xd5\x79\x90\xcf\x3d\
-\xb9\x84\x22\x96\x6f\x09\xfe\xc4\xf2\x00\xa7\xc6\x0e\xb1\xbc\x50\
-\x26\x9d\xcc\x23\xc9\x22\xfe\xb6\x3e\x3a\x3a\xe0\xa1\xa1\xf7\xe9\
-\x6a\x6b\x4e\x25\x53\x95\x1c\xd9\xb4\xdd\x15\x54\x49\x4d\x07\xe9\
-\xf2\xe6\x38\x30\x30\x4e\xb9\xd8\x63\xa5\xd8\x09\xcd\xf1\xca\xdf\
-\x14\x18\x7c\xfe\xf8\x34\xd6\x54\xbd\x04\x96\x76\x6c\xb8\x7e\x3f\
-\x6c\x04\xb0\xed\x80\x02\x90\x1e\x78\xfa\xe0\xa5\xb3\xff\xfd\x47\
-\x8f\xae\x4c\x25\xe8\x1c\x89\x34\x40\xd4\x2b\x55\xfc\x21\x77\x63\
-\x1a\xd6\x7a\x49\x33\x43\x32\x9e\x26\x9b\x2a\x90\x58\xed\xde\xd2\
-\xe0\x1b\x9b\x89\xb1\x38\xbd\x4c\xb9\xa4\x33\x93\xbb\xc0\x0c\x6f\
-\x35\xee\xe7\x26\x8a\x39\xf9\x1c\x2e\x8f\x93\xb6\x98\x8f\x8b\xdd\
-\x7b\x38\x32\x70\xd6\x7a\xc0\x26\xe0\x9f\x9d\x38\xc2\x99\x6b\xbd\
-\x5c\x39\x35\xc9\xfc\x64\x82\x5c\xca\xea\xe6\xf9\xc3\x1e\x3a\xfb\
-\x43\x24\x92\xc7\x38\x71\x54\x61\x20\x3a\x01\x80\xe6\x48\xb1\x92\
-\xa8\xf7\x04\xec\x74\xbb\x35\x1f\x47\x06\xce\xe2\x56\x0b\xb8\x9d\
-\x79\x56\x26\x96\x6d\xe3\xef\x34\x6b\x47\xfe\x36\xad\xfd\xf0\xe1\
-\x22\x40\x16\x48\x06\xfa\x62\xa9\xf8\x54\x32\xd0\x39\x1c\xaa\x03\
-\x88\xb5\xdc\x0d\x30\xb4\xb7\x8f\x57\xaf\x3b\x36\x90\xc0\xa4\x86\
-\x59\xaf\x20\x15\xdd\xd2\x1c\xeb\xc1\x4f\xe7\x3c\xac\xc4\x45\xdc\
-\x3e\x95\x74\x3e\xce\x22\xe7\xd6\xdc\x27\xcf\x32\x8b\x9c\xc3\x33\
-\xd6\x46\xcf\x50\x94\xc5\x64\x14\x06\xd8\x14\xfc\x95\x4c\x8c\xb3\
-\xd7\x7a\x99\xba\xb6\xc8\x85\xb7\xc7\x99\x5d\x9c\x20\xcb\x3c\x00\
-\xde\xc9\x4e\x96\x67\x07\xa8\x94\x74\x04\xf1\x10\xc1\x27\x53\x04\
-\xb4\xd5\x46\x90\x68\x21\x51\x40\x0b\x69\x88\xb2\x40\xb9\xea\xc5\
-\x29\x65\x18\xee\xb8\x06\xc0\x2b\xaf\xe6\x6c\xe3\x6f\x92\xa6\xf1\
-\x57\xa2\x65\x99\xb8\xf5\xf2\x80\xfa\x01\x6c\x39\x61\xd2\x34\x04\
-\x33\x40\xb2\x7d\x5f\xff\xd2\xfc\xb5\xe5\x86\xea\x0d\x07\xd3\xf8\
-\xda\xdc\x54\x75\x83\xc7\x9f\x3e\x4e\x1b\x83\x1b\xee\xe2\xa5\x13\
-\xaf\xc7\x8b\xe6\x71\xd2\x11\xc9\x6c\xda\xd5\xd3\x75\x99\x42\xb6\
-\x44\xa4\xd3\x4f\xac\xcf\x4f\x89\xd4\x86\xfb\x64\x59\x20\x5f\xaa\
-\x6b\x92\x8c\x6f\xcb\x36\xff\xfc\xd4\x5e\x66\xc7\xe3\x14\x73\x15\
-\xc6\x16\xcf\x32\xce\x2b\xcc\x70\x92\x19\x4e\x32\xc5\x1b\x4c\x2c\
-\x5e\xe2\xe6\xc5\x79\x66\xc6\x96\xb9\x30\xb5\x0f\x00\x49\xac\x22\
-\x09\xd5\xc6\x42\x5b\x4e\xaf\x83\x72\xb5\x39\xeb\xda\xf6\xfc\xf5\
-\x3e\xb2\xe7\x3a\x56\x86\x77\xdb\xf8\xab\xb0\x89\xf1\x67\xcb\x03\
-\x4e\x00\x60\xad\x47\x70\x35\x3c\xda\x3b\x51\x48\x15\x29\xa4\x8a\
-\x0d\x03\x6c\x78\x57\x8a\xb9\xf1\x15\xfc\x01\x0f\x9f\xfb\xe8\x57\
-\x89\xb0\x07\x05\x0d\x09\x07\x6d\x0c\x12\xe3\x10\x1d\xfd\x21\x3a\
-\xfa\x42\xf4\xb4\x27\xb6\xe8\xe7\x83\x24\x8b\x28\x0e\x19\x4d\xd3\
-\x1a\xd3\xc3\xef\x44\xe6\xe3\x6d\xc8\x8a\x44\xd7\xa8\x8f\x15\xae\
-\xac\x21\x93\xa5\x49\xde\x67\x7e\x76\x89\x95\xf9\x34\x53\x4b\xcd\
-\xb5\x90\x9c\x4a\x0e\xbd\x68\x55\x66\x57\xd0\xd9\x18\x19\x04\xcb\
-\xf3\xe7\x89\x05\x73\xf5\x55\x42\x97\xb1\x22\x7f\x1b\xe3\xfe\x5b\
-\xbd\xcb\x87\x81\x00\x76\x33\x90\x03\x56\xa3\xa3\xbd\xd7\x54\xbf\
-\xbb\x34\x7f\xbd\xd9\x27\x3f\x30\x3c\x4f\x5b\xd8\xc9\xe5\x53\xd3\
-\x7c\xe4\xc5\x47\x38\x14\xfb\x04\xbb\x79\x81\x11\x5e\x64\x50\xfe\
-\x08\xbb\x47\x77\x31\x74\xa0\x8b\xce\x5e\x37\x03\x1d\xf3\x6c\xe6\
-\xe4\x09\xfb\x56\x2c\x4d\x52\xad\xb1\x67\xdf\x30\xbd\xa1\x3d\x1b\
-\x5e\xc4\x4b\x07\x6e\xd5\x8f\x37\xa0\xe1\xd5\x8a\x9b\xbe\x6c\x3c\
-\x1b\x23\xb3\x5a\xa0\x2d\xea\xc1\xa4\x46\x81\xf8\x86\x73\x2a\x64\
-\xc9\x57\x93\x24\x16\x33\x18\xb5\x26\x76\xaa\x92\x23\x1f\xb7\x6c\
-\x05\xa7\xd7\x41\xa1\x62\xf9\xfe\xf5\x8a\xc1\xd4\xb5\x02\xfd\x4f\
-\x1e\x18\xc7\x4a\xdc\x65\xbb\x7e\x37\x78\xfe\xd6\xcb\x87\x81\x00\
-\x26\x16\x01\xf2\x58\xac\x5f\x8a\xee\xe9\x5b\x9e\x3a\xbf\x80\xdd\
-\x96\x6b\x6a\x91\x8f\x3f\x73\x9d\xfe\xe1\x00\xc9\xe5\x2c\x2f\x7c\
-\xe5\x51\x0e\x1d\x3e\xcc\xa1\xc3\x87\x39\xf2\xe4\x08\x07\x1f\xdf\
-\xc5\xc1\x47\xba\xf8\xd8\x63\xe7\x51\xe4\x7a\x77\x79\x13\x67\xd0\
-\x70\xcf\x02\x89\xc5\x0c\x7a\xa5\xca\xaf\x7e\xfe\x1b\x04\xe8\x47\
-\xc2\x81\x88\x44\x80\x7e\x3a\x38\x46\xcf\x50\x84\x48\x57\x80\xde\
-\xc8\xfc\xa6\x2f\xab\x48\x15\x64\x45\x42\xf3\xa8\x75\x00\xb6\x36\
-\xc3\x24\x79\x2d\x3c\xaa\x9c\x43\x2f\x5a\x4d\x80\xbd\xf8\x66\x51\
-\x6f\x63\xec\x42\xde\x1e\xf6\x7d\x1b\xab\xef\x6f\x1b\x7f\xfa\xad\
-\x6a\x3f\x3c\xf8\x46\x20\x2d\xfe\x00\x3b\x8b\xe9\xd2\xee\x8f\x1e\
-\x7b\xfb\x95\xdf\xb9\xdc\x5b\x48\x15\xd1\x7c\x56\x4e\xbe\x80\x37\
-\xc7\x8b\xcf\x5d\xe2\xc2\xf5\x6e\x26\x67\xfc\xb8\x3f\x73\x88\xaa\
-\x5e\xc3\xd7\xe6\xa6\xbf\x2b\xc9\xb1\x91\x33\x68\x6a\x3d\xab\xe7\
-\x16\xee\xdd\x03\x03\xd7\x98\x5c\x78\x82\xcb\xa7\xa6\x39\xfa\xe8\
-\x3e\x4e\xbc\xfe\x15\xae\x5c\xbb\x0c\x58\x09\x9f\xfa\x87\xba\x19\
-\x3a\xd0\xc5\xc0\x6e\x3f\xfb\x7b\xdf\xda\xf4\x6d\xfd\xda\x2a\x9a\
-\x57\x45\x2f\xeb\xec\xd9\x37\x4c\x67\x68\x80\xa9\xc4\xa5\x35\xe7\
-\xb8\x08\x35\xa6\x8c\xab\xce\xa6\xfd\xa6\xc8\x25\xf4\x94\x45\x00\
-\x51\x16\x51\x54\x99\x52\xd5\xcb\xd8\xf9\x1c\x7d\x4f\x1e\x9a\xc5\
-\xaa\xfd\xf6\xb8\xff\x96\x5d\xbf\x56\xf9\x10\x10\x00\x68\xe6\x27\
-\xc8\x00\xcb\xfe\x9e\xe8\xc5\x40\x6f\xf4\xf9\xf3\x3f\xbe\xd9\xf6\
-\xe8\xe7\x47\xb1\x41\xd5\x9c\x45\x1e\x39\x70\x9d\x47\xf6\x9b\xa4\
-\xb3\x6e\xf4\xaa\x44\xd8\x9f\x64\xbb\xbe\x7d\xcd\x91\xe7\xe1\xd1\
-\x2b\xc0\x1e\xae\x9d\x9b\xe1\x85\x2f\x3f\x86\xfa\x9d\xe6\x44\xcf\
-\xae\x5d\x61\x46\x0e\x84\x79\x62\xef\x69\x14\xa9\xb2\xe5\xcb\xf6\
-\xc7\x16\x79\xfb\x5d\x85\x48\x87\x9f\xaf\x7e\xfe\xd7\xf9\x7f\xfe\
-\xe3\xbf\x26\x8f\xe5\xfc\x71\x13\xa3\x93\x63\xf4\xf4\x77\xd0\xb5\
-\x2b\x4c\x5f\x6c\xb1\x71\x5d\x63\xba\x58\x41\x47\xd1\x14\x9c\x3e\
-\x85\x89\xd3\x65\xf4\x8a\xc1\xc8\x0b\x8f\x9c\xa4\xd9\xf7\xdf\xd2\
-\xf3\xb7\x5e\xa4\xdf\xfe\xed\xdf\xfe\x79\x83\x77\x17\x64\x12\xac\
-\x69\x67\x22\xd6\xfc\x43\x59\x94\x65\xe5\xfa\xab\x17\xf6\xcd\xdf\
-\x48\x62\x54\x0d\x54\xb7\x62\xad\x70\x52\x07\x55\x75\x94\xd1\x9c\
-\xc5\x1d\x0f\xec\x04\x3d\x29\xba\x23\x2b\x38\x3c\x6d\x64\x4b\x3e\
-\xc2\x1d\x7e\xba\x07\x23\x0c\x1f\xea\x61\xdf\x1e\x9d\xa7\xf6\xbd\
-\x4b\xd4\xb7\x7c\xcb\xb7\xf5\xbb\xb3\xcc\xe7\xf6\x72\xf1\xdd\x49\
-\x1e\x7a\x72\x3f\x89\x6b\x22\xd5\x84\x87\x20\xbb\x88\xb0\x87\x5d\
-\xfd\x83\xec\x3e\xd8\xcd\xbe\xa3\x31\x9e\xda\xf7\x6e\x83\x4c\xa2\
-\x60\x10\xcf\xf6\xe3\xed\xf0\xa0\x68\x0a\x6a\x40\xe5\xfc\x9f\xfe\
-\x35\x91\x3d\x3d\x8b\x03\x4f\x1d\x78\x05\xb8\x81\x95\xb1\x2d\x05\
-\x94\xe1\xc4\x6d\xfd\xce\x1f\x12\x0d\x70\xc2\x84\xd7\x5a\xf3\x18\
-\x3b\xfb\x1e\xdf\xf7\x03\x5f\x47\x28\x71\xe5\x2f\xdf\x7a\xe1\xfa\
-\xe9\xe5\xd8\xf9\x57\x27\x55\xc5\x29\x11\x88\x6a\x84\xbb\x3d\xf8\
-\x23\x2e\xdc\x3e\x05\x7f\xa4\x9e\x8a\x75\x07\xa3\x7a\x01\x2d\xc9\
-\x53\x7b\xde\xe4\xd1\x61\x85\x74\x3e\x60\x81\xaa\xad\xde\xb2\xd6\
-\xb7\x4a\x40\x5b\xe5\xc9\x7d\x67\xd0\x2b\x87\xb8\xfe\xfe\x2c\x9f\
-\xfc\xe2\xb3\xb8\xbf\x17\xa0\x5a\xa9\xe1\x0d\xb8\xe8\xd9\x1d\x63\
-\xe8\x40\x17\x0f\x8f\x9c\x41\x73\xe4\x1a\xd7\x25\xf3\x56\xdc\x9f\
-\xd3\x67\xb5\xff\xf3\x67\x2f\x52\x4a\x67\xd8\xfb\xe9\xcf\xbe\x4d\
-\x53\xfd\xdb\xc3\xbe\xdb\x1a\x74\x10\x1a\xb9\xed\x1f\x78\x79\x4d\
-\xc0\x9a\x7e\xee\x01\x82\x40\x0c\xe8\x02\x3a\x81\xf6\xf4\xcc\xf2\
-\xe0\xd2\xe5\xa9\xa1\xcc\x7c\x3c\x9c\x99\x4f\x78\x52\x53\x4b\x01\
-\xfb\x4a\x7f\x44\xc5\xed\x73\xe0\x0f\x3b\x51\x9c\x22\x81\xb0\x03\
-\xcd\x2b\xa3\x79\xe5\xbb\x3a\xaa\xb7\x5e\x56\x32\x31\xce\x4f\xed\
-\x65\x6a\xce\x4f\xb1\x50\xa6\xaa\xd7\xf0\xfa\x35\xfa\xba\xd2\x1c\
-\x1b\x3c\x47\x40\x5b\x6d\x9c\x5b\xd2\x3d\x4c\xc4\x1f\x22\x32\x1c\
-\x22\x3c\x1c\x42\x2f\x94\x78\xe5\x77\x7e\x0f\x7f\x4f\x78\xf1\xb1\
-\x6f\x7c\xe6\x3f\x01\xa7\x80\x6b\x58\x46\x60\x0e\x4e\x54\xb7\xf3\
-\x0e\x1f\x12\x0d\xd0\x10\x7b\x61\x0b\xdb\x41\x94\xc7\xea\x13\xb7\
-\xf9\x7b\xa2\xd7\xfc\x3d\x51\x3f\x16\x41\xbc\x80\x37\x3d\xbb\xd2\
-\x9e\x5b\x5a\x0d\xaf\x5c\x9f\xe9\x2a\xae\xe6\xb4\x85\xc5\xac\x9a\
-\x5b\x4c\x7a\xaa\x65\xbd\x51\x2e\x9a\x57\xc6\xed\x53\x50\x1c\x02\
-\xfe\xb0\x02\x26\x44\x3a\xad\x14\xee\x16\x49\xa4\x3b\x78\x4d\x4b\
-\x22\xbe\x25\x9e\x3b\xb0\x44\x61\xc4\x43\xa1\x1e\xcd\xa3\x39\xf3\
-\x6b\x6a\x3d\x40\xb9\xea\x61\x3a\x79\x18\x6f\xbb\x87\xf0\xb0\x15\
-\xfb\x37\xf6\xca\xdb\x14\x12\x29\x1e\xfd\x8d\x17\x7f\x02\x4c\x61\
-\x25\xe8\x6a\x89\xfa\xd9\x9e\x7c\x88\x34\x00\xd4\xb5\x80\x88\x45\
-\x6c\x07\x56\x46\x11\x3b\x33\xb6\xbb\xe5\x58\x6b\xd9\x5c\x2d\xdf\
-\xd9\xc7\xae\xe5\x2b\x53\x9d\x7a\xa1\xec\x4d\xcd\x2c\x47\xaa\xa5\
-\x8a\x9a\x99\x8b\x7b\xf4\x52\x45\xae\x96\x2a\x72\x6e\x69\x75\xc3\
-\x1a\x64\xfe\x90\x82\xc3\x59\x5f\xac\xb1\xd3\xb9\xf6\xfb\x96\xc5\
-\x21\xfd\x61\x05\x65\x07\x09\x5a\x0d\x53\x66\x3a\x79\x84\x7c\x41\
-\x22\xbc\xdb\x8d\xa4\x48\xcc\x9f\xbd\xc2\xd8\x2b\x6f\xd3\xff\xe4\
-\x81\x0b\x47\x7f\xf5\x63\xff\x15\xb8\x08\x8c\x63\x35\x01\xdb\xae\
-\xfd\xf0\xa1\x23\x80\x2d\xaf\xad\x31\x08\x69\x12\xa2\x75\x73\x6e\
-\x63\xb3\x53\xd2\xa8\xf5\xcf\x8e\xd6\xef\x67\xdf\xbb\xd6\x27\x88\
-\x82\xa2\x17\x4a\xae\xd4\xec\x4a\x9b\x20\x08\x92\x5e\x2c\xcb\xf5\
-\xc5\x9a\x01\x68\x6d\x6a\x6e\x25\xad\x04\x6a\x15\xbd\xa6\x92\x4d\
-\x16\xa9\xe9\x4d\xfb\x42\xf5\xbb\x4b\xbe\xae\xf0\xcc\xd1\xaf\x7e\
-\xec\x7f\x68\x21\xdf\x39\x60\x02\x4b\xf5\xd7\x9d\x3f\x27\xb6\x0d\
-\xea\x87\x94\x00\xad\xf2\x9a\x5d\xfd\x24\x2c\x52\xd8\x1a\xc2\xce\
-\x58\xa2\xd0\x24\x88\x5c\xff\xdc\xba\x39\x6e\xf1\xd9\xd1\xb2\x77\
-\x6c\x72\xaf\xd6\xfb\x49\x80\x32\xfb\xde\xd5\x2e\x10\x44\x41\x14\
-\x9a\xef\x23\x08\x62\x6a\x7a\x29\xa8\x17\xcb\x0e\xd6\x25\xd1\x08\
-\xf4\x44\x57\x15\x97\xb3\x68\x9a\x66\xd5\x34\xcc\x72\xcf\xc3\xa3\
-\xd7\xb0\x0c\xdd\x45\x2c\xc3\x6f\x9e\x35\x03\x3f\xdb\xaf\xfd\xf0\
-\x77\x82\x00\x9b\x49\x83\x14\x76\x06\x9d\x56\x72\x48\x2d\x9b\xbc\
-\x6e\xdf\xaa\x51\x6e\xb5\xdd\xea\x5a\x69\xdd\xf3\xd6\x3f\x73\x7d\
-\x0a\x9d\xd6\x2c\x2b\xb6\xc7\x33\x8b\xe5\xec\x49\xd2\x4c\xa1\x57\
-\x1f\xf5\xdb\x7e\xed\x87\xbf\xb3\x04\xb8\x95\x6c\x20\x47\xeb\x7e\
-\xfd\x26\xb1\x11\xc0\xd6\xef\xd7\x1f\xb7\x7e\xb6\x89\xb7\xfe\xde\
-\x76\x16\x4f\x9b\x00\xad\x39\x94\xec\xec\x28\x76\xa2\x2c\x3b\x9b\
-\x9a\xce\x1d\x80\x0f\xf0\xff\x03\x9b\xc6\x80\x13\x61\xf5\x6d\xf8\
-\x00\x00\x00\x25\x74\x45\x58\x74\x63\x72\x65\x61\x74\x65\x2d\x64\
-\x61\x74\x65\x00\x32\x30\x30\x36\x2d\x30\x35\x2d\x31\x31\x54\x31\
-\x36\x3a\x33\x39\x3a\x34\x36\x2b\x30\x38\x3a\x30\x30\x9d\xb7\x43\
-\x79\x00\x00\x00\x25\x74\x45\x58\x74\x6d\x6f\x64\x69\x66\x79\x2d\
-\x64\x61\x74\x65\x00\x32\x30\x30\x36\x2d\x30\x35\x2d\x31\x31\x54\
-\x31\x36\x3a\x33\x39\x3a\x34\x36\x2b\x30\x38\x3a\x30\x30\xc2\x06\
-\x35\x4d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\xde\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x08\x73\x49\x44\x41\x54\x78\x5e\xed\x5b\xe9\x6f\
-\x54\x55\x14\x27\x51\xe3\xf2\x49\xe3\xbf\x80\xdb\x07\xb5\x33\x75\
-\x41\x04\xd9\xdc\x77\x50\x8c\x8a\x01\xa2\x2c\x0a\x12\xd7\x10\xa3\
-\x81\xa0\x22\x26\x26\x9a\x48\x54\x5c\x3e\xa0\x30\xef\x55\x41\x44\
-\x0b\x14\x94\xbe\x99\xb6\xc0\xd0\x9d\x16\x28\x5b\x4b\x17\x28\xb4\
-\x50\xda\xe9\x42\x57\x5a\xae\xe7\xf7\x7a\x9b\xce\x74\xce\x7b\xf3\
-\xde\x9b\xf7\xda\x31\xf1\x97\xfc\x32\x93\x99\x7b\xcf\x3d\xe7\xce\
-\x7d\xe7\x9e\x73\xee\x9d\x71\xff\xc3\x63\xdc\xbd\xfb\x97\x1b\x7d\
-\x5a\x60\x96\x4f\x53\x56\xf9\x35\x35\xc3\x17\x54\x4a\xe8\xfd\x29\
-\x7a\xdf\xe2\xd7\x94\xcb\x83\x54\x5b\xf0\x19\xbe\xd3\xdb\xa0\x6d\
-\xb6\x3a\x13\x7d\xa5\x98\xff\x16\xd2\x43\xca\xad\x64\xcc\x1a\x7f\
-\x50\x29\xf3\x07\xd5\x01\xa2\x70\xc8\x01\x9a\x8c\x52\x9a\x94\xd5\
-\x90\x29\xc5\xa7\x26\xd2\x8b\x7f\xb8\x8a\x14\x9e\xe7\x0b\xaa\x05\
-\x23\x8c\x70\x8d\x3e\x4d\xdd\x4f\xaf\xf3\xa6\x84\x42\x57\xca\x61\
-\xc7\x1e\x50\x86\x94\x5a\x4a\x4b\xb9\x26\x5a\x59\x4f\xa9\xa9\xd5\
-\xb4\xc2\x16\x8f\xf9\x44\xf8\xb3\x33\x26\xd3\x12\x3d\xc4\x2a\x39\
-\x2a\x54\xca\xd3\x83\x81\xfb\xa5\x3a\xa3\x87\x09\xe1\xdf\xae\xa5\
-\x5f\xe1\x7b\xdd\x81\xb1\x8a\x8d\x22\x75\x1d\x94\x75\x53\x42\xeb\
-\xaf\x91\xea\x79\x0b\xdd\xc1\x8d\xe9\xaf\x6e\x40\x4d\x3d\x70\xc7\
-\xee\x8c\x9b\xa5\x9a\xde\xc0\x17\xcc\x98\x41\x8e\xa8\x9d\x55\x20\
-\x05\x48\x0e\xb8\xcd\x9f\x1d\x98\x26\xd5\x75\x17\x69\x21\xf5\x79\
-\x5a\x6a\x3d\xdc\xc0\x4e\x39\x35\xef\x77\x71\x5f\xce\x6f\xec\x77\
-\xce\xa9\xf4\x40\x57\xa9\xb6\x3b\x48\xd7\x94\xd9\xe4\x75\xfb\xf9\
-\x01\x13\xf3\xc1\xbd\x7f\x88\x95\x47\xf6\x8b\x4d\xf5\x27\x44\x45\
-\x7b\xb3\x68\xeb\xeb\x15\x97\xc5\x30\x3a\xfb\x2f\x89\xfa\xae\x0e\
-\x91\xd3\x54\x2f\xd6\x56\x95\x89\xf9\x25\xff\x88\x74\x46\x8e\x55\
-\xea\xba\x52\x20\x25\xd5\x4f\x0e\xf4\x6c\x4d\xa7\x59\xed\xe5\x06\
-\x32\x23\x0c\x78\xfb\x60\xae\x08\x35\x9d\x16\x97\x2e\x0f\x48\x53\
-\xad\xa3\xbe\xbb\x43\xfc\x54\x73\x48\x3c\x44\x93\xc7\xc9\x4f\x4c\
-\xd2\x99\x74\x97\x66\x38\x83\x8c\xe8\x5a\xf9\x01\x8c\xb9\xe8\x80\
-\x26\x0e\xb7\x35\x4b\x53\x92\x43\x77\x7f\xbf\x58\x5f\x57\xa1\x3f\
-\x2e\xdc\x58\x66\x84\xee\x8e\x1d\x63\x7a\x66\xe6\x75\x34\x8b\xe5\
-\x9c\x60\x23\x4e\xce\xdb\x2c\x76\x9d\xab\x95\xaa\xbb\x8b\xf3\x3d\
-\x5d\x62\x49\x59\x90\x1d\xd7\x8c\x08\xa5\x1d\x6d\x91\x64\xfc\x3a\
-\x4e\xa0\x11\xe7\x14\xed\xd2\x9f\x63\x2f\x01\xbf\xf1\x73\xdd\x11\
-\xdb\xfe\x81\x26\xe1\x1b\x69\x96\x35\x20\xc2\xb3\x13\xe4\xbc\x4e\
-\x4b\xbe\x8b\x1c\x99\x15\x34\xf6\x74\x8a\xfc\xe6\x06\xb1\xf5\x6c\
-\x95\xd8\x72\xa6\x52\x7f\x85\xf3\xab\xed\x6c\x8b\x71\x8c\x66\xc8\
-\x6a\xac\x11\xf7\xe6\xfc\xca\xea\xc2\x92\x6c\x49\xd3\x32\x26\x4a\
-\xf3\xcc\x81\xf8\xda\x4e\xa0\xb3\xac\x3c\x24\x7a\x07\xfa\xa5\x6a\
-\x3c\x6a\xc8\xb8\x2f\x2b\x4b\xc4\xd3\xfb\x33\x59\x19\x43\xc4\x73\
-\xbe\xe2\x48\x58\xec\x6b\x3e\x9b\x70\x32\x30\x09\xb6\x56\x02\x05\
-\x4a\x96\x72\x07\x5a\xfa\x4b\x58\x01\x0c\x5f\x2a\xdc\xa9\x3b\x29\
-\x23\x9c\xea\x6a\x17\xcb\x0f\xef\x75\xb4\xa5\xbd\x58\x98\x25\xf6\
-\x5e\x38\x23\x25\xf1\x58\x5f\x5b\xc1\xf6\x35\xa6\xb2\x48\x9a\xc9\
-\x43\xcf\xec\x2c\x66\x75\xd3\xf6\x6c\xd1\xb7\x2a\x23\x60\x69\x4f\
-\xcc\x4d\x3e\xc8\xf9\xb0\x62\x9f\x1e\x27\x18\x01\x5b\x2d\xd7\x8f\
-\x23\x45\x8a\x27\x4d\x57\x81\x3f\x14\x98\xcf\x75\xe4\x98\xd9\x70\
-\x52\xaa\x10\x0b\x2c\x5d\x2c\x77\xae\x8f\x53\xbe\x50\x90\xa5\xfb\
-\x0e\x0e\x17\x7a\xbb\xc5\xd4\x3d\xd6\xb7\x48\x5f\x48\x7d\x45\x9a\
-\x1b\x0f\x5a\x22\x85\x5c\x27\x8e\x6d\x97\x7a\xa5\x0a\xb1\x70\xdb\
-\xf8\x21\xce\xcc\xdf\x2e\x5a\xfa\x7a\xe4\x28\xb1\x80\x33\xe5\xfa\
-\x70\x44\x51\x45\x9a\x1b\x0b\x5f\x4e\xc6\x6d\x5c\x07\x23\x16\x47\
-\xce\xc9\xe1\x87\xb1\xad\xa1\x9a\x6d\xeb\x16\x17\x96\x66\x8b\x81\
-\xcb\xf1\xee\x11\x91\x66\x22\x07\x1b\xcd\xb4\x1c\xe5\x26\x69\xf6\
-\x30\x68\x66\x3e\xe3\x1a\x1b\xf1\x89\xf0\x5f\xa2\xac\xb5\x49\x57\
-\x00\x4a\x6d\x6f\xb0\xb9\x35\x59\xe4\x1b\x14\xfc\x20\x3f\x18\x62\
-\xd5\xc5\x56\x7d\xcc\x91\x28\x6c\x69\x8c\x69\x87\x95\xf8\x00\x05\
-\x66\x9c\x4c\xf2\x05\x9f\x48\xb3\x87\x41\xcb\x1f\x05\x4c\xb6\x83\
-\x19\x1f\xdd\xb7\x55\xcc\x20\x87\xc8\x7d\xe7\x06\x5b\x0d\x96\xbd\
-\x15\x20\x01\xe3\x64\x12\x8b\xa5\xd9\x83\x40\xf9\x99\x3e\x4c\xa6\
-\x7a\xeb\x19\x7f\xa0\x84\xc8\x09\xe0\x34\x27\xe5\x1a\xad\x00\xa5\
-\xff\xf6\x3d\xca\x0d\xd2\x7c\x2c\xff\xc0\x2c\xae\x61\x2a\x10\x8f\
-\x95\xd1\xb2\x37\xc3\x3b\x09\xb6\xc7\xb4\x60\xe0\x19\x69\x3e\x26\
-\x40\x59\xc5\x35\x4a\x15\xa2\x3e\xc0\x39\x3f\x23\xec\x3e\x57\xc7\
-\xca\x89\xa5\xb2\x52\x9a\xaf\x3f\xff\x2a\xdf\x28\x75\x98\x71\xfa\
-\xb8\x34\xcf\x1c\xd8\x9e\x1f\xde\xbb\x95\x95\x11\x4d\x72\xfa\x01\
-\x69\xbe\xbe\x02\x4a\xb9\x46\xa9\xc4\x49\xb9\x9b\xc4\x99\xee\x8b\
-\xd2\x4c\x63\x7c\x7a\xac\x80\xed\x1f\x47\x4d\x29\x92\xe6\xd3\x04\
-\x04\x95\x3a\xb6\x51\x02\x7e\x71\xa2\x58\x9c\xe8\x88\x88\xc7\xf6\
-\xfd\xc9\x7e\xef\x36\x97\x96\x85\xa4\x99\x3c\x10\x9b\x58\xcd\x3b\
-\x60\xb3\x34\x5f\x9f\x00\xdb\x55\x9f\xe7\x28\x32\xeb\x1d\x18\x2c\
-\x75\xe5\x5d\xa8\x67\xdb\x78\x41\x04\x5b\x1c\x90\x91\xce\xcc\xdf\
-\xc6\xf6\x61\xa9\xa9\x11\x69\x3e\x7c\x80\xbd\x2d\x10\xb3\x7c\xa0\
-\xf5\xbc\x1c\x7a\x10\x48\x5a\xb8\xb6\x6e\x13\x49\x58\x33\xc5\xff\
-\x23\xf1\xed\xc9\x72\xb6\xbd\x11\xb1\x15\x4a\xf3\xed\x4f\xc0\x9a\
-\xe3\x85\x72\xd8\x61\x40\xa9\xe9\x1e\x06\x44\xd1\xfc\x80\x52\xec\
-\x68\x54\x5e\x8c\x88\x7b\x42\xf6\xa2\xd0\x98\x09\xb0\xf3\x08\x3c\
-\x42\x91\x5f\xc7\xa5\x3e\x39\x74\x2c\x10\x0e\x73\x7d\xbc\x60\x6e\
-\x53\xbd\x3e\x26\xb6\xc7\xb9\xc5\x7f\xb3\x6d\x4c\x19\xfd\x08\xc0\
-\x21\xb0\x8d\x18\x06\xcf\x9f\xd6\x07\x36\xc2\x9b\xe4\xa8\xb8\x7e\
-\x6e\x13\x8e\x17\x65\xb4\x1f\x29\x52\xe4\xbe\x4f\x44\xd8\x2c\xcd\
-\xb7\xbe\x0d\xbe\x77\x28\x4f\x9a\x69\x8c\xb3\xb4\x55\x61\xcb\xe2\
-\xfa\xa7\x14\xa3\xb7\x41\x2b\x81\x10\x32\x2b\x94\xa6\xad\x00\x41\
-\x0b\x27\x23\x95\x38\x32\x10\x4a\x18\x0a\x6f\xae\xaf\x94\xe6\x25\
-\x06\x9e\x4b\x84\xaf\x9c\x9c\xd4\x61\x74\x28\x9c\xad\xce\xe4\x1b\
-\x0d\xf2\xd5\x92\xdd\x96\x4b\xd6\x43\x38\x49\x09\xcc\x04\x0f\xea\
-\x03\x6e\x31\x26\x19\x32\x4b\x87\x61\x04\xca\xda\x4e\xe0\xd4\x41\
-\x79\x4d\x6c\x81\x31\xe9\x30\x60\xe4\x08\x47\xee\xb9\x76\xd0\xd9\
-\xdf\x27\xee\x0a\x65\xc4\xc9\x4c\x96\x90\xb9\xa0\x34\x5b\x0f\x8d\
-\x1d\x39\xdc\x68\x07\x38\x04\xda\x17\x57\x73\x8d\xe1\xfc\xd6\x55\
-\x1f\xd4\x0f\x28\x87\x88\xd0\x97\x43\x3b\x65\x62\xd1\xed\x96\x1f\
-\xda\x13\x27\x2f\x59\xe2\xfc\xb1\x34\x32\x1c\x85\xa2\x62\x84\xc9\
-\xe0\xda\x1a\x91\x1c\xe0\xc7\xd2\xec\x61\xe0\x24\x98\x6b\xcc\x11\
-\x4a\x44\x0c\x4a\x55\x6b\x8e\x17\xb1\x7d\xdc\x20\x7e\x79\x6e\xf2\
-\xeb\xba\xda\xd9\xf6\x46\xf4\x85\x36\x8c\x97\x66\xc7\x82\x1e\x83\
-\x7c\xae\x03\xc7\xaf\x2a\x4b\xe5\xf0\xb1\xe8\xa3\x04\x69\x59\x79\
-\x0e\xdb\x27\x59\x6e\xa8\x3b\x2a\x47\x89\x45\x0f\x25\x42\x5c\x7b\
-\x03\x86\xa5\xb9\xf1\x48\xd3\x94\xb9\x4c\x07\x96\x88\xbd\x8d\xee\
-\x00\x20\x4b\xc4\x91\x18\xd7\xcf\x09\xf1\xcb\xab\xa7\x8f\x49\xe9\
-\xf1\xc0\xcd\x13\xae\x1f\x4f\x65\x8e\x34\x37\x1e\x83\x47\x63\x6a\
-\x35\xdf\x31\x9e\x48\x89\x31\xfb\x1c\xb0\x6d\x06\x4e\x1d\x4b\xfa\
-\x78\x0c\x37\x44\x0a\x5a\x1a\x07\x85\x32\x38\xde\x11\xb1\x3c\x06\
-\x79\xff\xaa\x84\x07\xa4\xd4\x68\x31\xd7\xd9\x88\x1f\x55\x84\x4d\
-\x63\x04\x54\x71\x50\x9e\xb6\x9b\xad\xc1\xbb\x23\xc5\xbd\x68\x90\
-\x78\x01\xf0\x43\x4f\x85\xad\x1f\x88\xf8\x43\xca\x02\x69\xa6\x31\
-\xf4\x55\x60\xf3\x66\x08\x0e\x22\x12\x01\x65\xea\x8d\xa7\x8e\xea\
-\xa7\x3b\xf7\x1b\x6c\x5d\x28\x63\xbf\x55\x9e\x2b\xfe\x38\x53\x65\
-\x6a\x38\x00\xef\xff\x72\xd1\x4e\x56\x0e\x4b\x4d\x3d\x30\x7b\xd3\
-\xa6\x2b\xa4\x99\xe6\xa0\x1d\x61\x12\x2e\x15\xb0\x82\x0c\x88\xf2\
-\x98\xd5\xca\x2d\xda\xe1\x64\xb9\xbc\xb5\x49\xe4\xb7\x34\xe8\x37\
-\xc7\x8c\x0e\x3f\x39\xa0\xf6\x30\xbb\x60\x07\xab\x87\x01\x07\xfc\
-\xa1\x8d\x13\xa4\x79\xd6\xe0\x0b\xaa\xdf\x31\x82\x4c\xf9\x3e\xed\
-\xfb\x89\x7e\xb9\x64\x81\x18\xe0\xf1\xb0\xdd\x1a\xa4\xb2\x56\x9a\
-\x65\x1d\xfa\x7d\x60\x07\xc7\x65\x38\x33\x2c\x32\x71\x5a\x4e\x81\
-\xed\x15\xa7\x44\x76\x23\x4b\xf2\x69\x25\xe3\xb3\xb2\xae\x96\x66\
-\xd9\xc3\x5d\xda\xc6\x5b\x48\x80\xed\x82\x29\x6a\x86\xd8\x06\xab\
-\x1d\xe6\x10\xd1\xc0\xe3\xb2\xb3\xb1\x56\x3c\x49\x13\xcb\x8d\x65\
-\x46\xe8\x6e\x18\xf4\x58\x05\x39\x0f\x47\x17\x25\x41\xfc\x5a\xef\
-\x1e\xcc\xd3\xab\x48\x43\x15\x64\xab\x40\xed\x01\xe1\x34\xee\x05\
-\x70\xb2\x13\x53\xe9\x81\xee\xd2\x8c\xe4\xa0\xff\xe7\x07\xd7\x4f\
-\xd9\x81\xac\x11\x39\x05\xca\x65\xc8\x10\x71\x2b\x0c\x0e\xb0\xb6\
-\xb3\x5d\x77\x7e\x38\xfb\x2b\x89\x9c\x13\x3b\x1a\x6b\xc4\xe7\x14\
-\x4a\xe3\xca\x9d\xdd\xa5\x1e\x4d\xe8\x4a\xf1\xfe\xd3\x52\x7d\x77\
-\xe0\xc5\x65\x69\x2f\x48\x86\x77\xbb\x76\x4f\x78\x24\x70\x15\xdd\
-\x89\x4f\x18\x35\x6a\x6a\x24\x2d\xa8\x4c\x91\xea\x7a\x03\x5c\x2f\
-\x41\x50\xc1\x2a\x30\x86\x44\x3d\x83\xbd\xfa\xe2\x05\x70\xf7\x96\
-\x96\xda\xb7\x76\x83\x25\x8f\x88\xbf\xd6\x7d\xed\x78\xab\x4b\x06\
-\xb8\x7e\xea\x24\x56\x70\x8b\x7a\x15\xcb\x6e\x84\xe7\x36\x64\x06\
-\xb9\x90\x68\x39\x8b\x4c\x96\xe4\x87\xaa\xd2\x82\x81\xd7\x12\x66\
-\x76\xa3\x09\x28\x83\x4b\x88\xa4\x60\x78\xa4\xc2\x2e\x32\x8c\x31\
-\x52\xca\x70\x0e\xf8\x93\x02\xea\x6e\xa4\x70\x71\x32\xf1\x83\xde\
-\x57\x53\x8a\x20\x2b\xe9\x88\x6e\xac\x80\xf2\x33\x65\x97\xcf\x92\
-\x21\x2b\xc8\x20\x85\x0c\x2b\x26\xd6\xd2\x23\xd3\x42\xaf\x28\xc5\
-\x0f\xc8\xf7\xf4\x19\x19\x8b\x36\xd4\x16\x75\xfb\x3b\x43\xeb\xaf\
-\x97\x62\xfe\x87\x37\x18\x37\xee\x5f\xbb\xec\xa5\x60\xd2\x19\xe2\
-\x5a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x23\x7e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x50\x00\x00\x00\x4f\x08\x06\x00\x00\x00\x7c\x91\x42\xe3\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x22\xfb\x49\x44\
-\x41\x54\x78\xda\xcd\x9c\x59\x8c\x24\xc7\x79\xe7\xbf\x88\x3c\xea\
-\xee\xaa\xea\xea\x6b\x7a\xba\xe7\xe2\x90\x23\x8a\x4b\xf1\x90\x64\
-\xad\xb1\xda\xd5\x48\xf6\xf2\x41\x36\xb0\xf0\x4a\xa4\x81\xb5\x65\
-\xf8\x49\xc4\x5a\xfb\xa2\xf5\x01\xd8\x58\xc0\x94\x0d\x18\xf0\x3e\
-\x78\xb1\x12\xfc\x60\x02\xf6\xbe\x18\xd8\x07\xca\x36\x2c\xc1\x07\
-\x0c\x41\x1a\x69\x4d\x91\xe2\x8a\xa4\x44\x72\x68\xce\x70\x86\xd3\
-\x33\xd3\x73\x76\x57\x55\x77\xd7\x99\x47\x44\xec\xf7\x45\x54\x30\
-\x2a\x3b\xa7\x9a\x2d\x62\xbd\xcb\x1c\x7e\x8c\xcc\xc8\xcc\xaa\xca\
-\x5f\xfd\xbf\x23\x22\xb3\x8b\x29\xa5\xe0\x83\xbe\x7c\xe5\x2b\x8c\
-\x67\x7b\x9e\xd9\xb7\xbd\xe1\x6f\x00\xc0\x09\xbd\x5e\x0b\xa7\xf7\
-\x0c\xa0\x58\xc6\xff\x81\xaa\x28\x19\x44\x81\x8a\x78\x54\x2c\x2a\
-\x99\xc6\xb1\x2f\xaa\xd5\x68\xbc\xbb\xeb\xfb\x00\x30\xaa\xd7\x37\
-\xc5\xb9\x73\x5b\xf2\xdc\xd9\x73\x12\x9e\x01\xa5\x0e\x09\xe6\x03\
-\x07\x90\x31\xc6\x0d\x23\xfa\x2f\x0f\x6a\x7a\x6b\x34\x5a\x2e\x4c\
-\x6f\x7b\x5e\x54\xa6\x76\x38\xd9\x0e\x79\x38\x07\x31\xf5\xa7\xc4\
-\x43\x02\xf0\x3a\x4b\x53\x25\x78\x61\xc0\x79\x92\x30\xc6\x8b\x63\
-\x2e\x77\xf9\x98\x47\xb5\x5a\x1c\x23\xcc\x64\x73\x73\x53\x3c\xf7\
-\xdc\x73\x09\x00\x68\x8a\x87\x01\xf8\x81\x55\x95\x69\x4f\x4c\x60\
-\x8d\x72\xb0\xec\xba\x0a\x4a\x75\x21\x84\xb2\xdb\xc5\xb0\xb8\x98\
-\x24\x89\x8a\xff\xe9\xad\x15\xb1\x79\xe3\x7e\x18\x8e\x1e\x61\xfd\
-\xc1\x7d\x5e\x9a\xdc\x27\x95\x6a\x32\xc6\xb6\xc4\xca\xf2\xff\xa8\
-\xfc\xdb\x9f\xf9\x86\x94\xc9\x36\x62\xe0\x52\xa6\xc3\xe1\x50\xee\
-\xf8\xbe\x9f\xbc\xfa\xea\xab\x09\x29\x51\xfd\xae\x92\x1f\x00\x80\
-\x59\x55\x99\x26\x0f\x6b\xb6\xaa\xbc\xf2\xf4\x76\x10\x40\x53\x88\
-\x54\x4d\xf6\xa9\x4a\xa5\xb6\x9c\xf4\x7a\xc1\xe0\xc7\x6f\x1c\x8b\
-\x6e\xdf\x3e\x1d\x72\xfe\x38\x1f\x0e\x4e\xab\x24\x59\x53\x4a\x15\
-\xc2\xc0\x57\x15\x50\xa2\x91\xa4\x7e\x25\x4d\xa1\x18\x27\xb0\xc5\
-\x00\x2e\x08\x95\x06\x9f\xf9\xd4\x7f\x09\xd6\x8f\x5d\x4a\x20\xba\
-\xee\x49\xbe\x27\x84\xb7\xd7\xe3\xbd\x91\xe8\x88\xa8\xdb\xed\x46\
-\xa8\x44\xad\xdc\xff\x37\x00\x1d\x28\xa7\xa9\x67\xde\x9f\x0b\x3a\
-\x58\xe5\x77\x61\x1d\x3d\xba\x56\x8c\xe3\xa4\x35\xda\xbc\x31\xd7\
-\x7b\xe3\xfc\x89\x72\xb1\xf4\x53\x72\x67\xf7\xb8\x97\xc4\xa7\x40\
-\x8a\x85\x52\xb3\xc1\x0b\xbe\x27\xea\x8c\xb1\x4a\x1c\xf1\x2a\x30\
-\x08\xdb\x6d\x28\x0e\x06\x20\x47\x63\xa0\x17\x91\x08\x4f\x24\x09\
-\x1e\x2e\xe0\x5c\xa9\x2c\x76\x57\x8f\x7c\xbb\xf8\xb3\x9f\xfe\x0b\
-\x64\xd4\x61\x12\xee\x4a\x29\x76\x84\x18\xde\xe2\x7c\x6e\xb4\xb3\
-\xb3\x23\x56\x57\x9f\x1d\x3f\xe3\xe2\xe1\x4c\x80\xff\x2c\xb0\x36\
-\xf6\xc1\x5a\x3e\x00\x56\xa5\xd2\x98\xa7\x56\x08\x41\x8d\x5c\x5c\
-\x5c\x5e\xa7\x8b\xdc\x7d\xed\xf5\x23\xc3\x8d\x8d\x53\xcd\xf9\xf9\
-\x4f\xa8\xc1\xf0\x38\xba\xe0\x3a\x72\xa9\xb4\xd6\xd7\xa0\x1c\x04\
-\xb2\xee\x79\xac\x14\x8d\x59\xad\x50\x84\xc2\x70\x08\xde\x68\x08\
-\x2a\x15\x20\xa2\x08\x04\x42\x13\x63\xb4\xe1\x08\x64\x12\x83\x40\
-\x78\x69\xbf\x87\xeb\xa9\xde\xff\x5a\x10\xc2\x95\xd6\xc2\xb5\xd2\
-\xbf\xfb\xb9\xe7\x24\xc0\x16\x82\x38\xcf\x39\xdb\x4e\xd3\x74\x94\
-\xa6\xec\x06\x86\x8c\xf1\xd6\xd6\xd6\x08\x55\x28\x0f\x02\xe8\x1f\
-\x12\x16\xb3\xab\x16\x16\x9a\x03\x65\x5a\x07\x8a\x5a\xfc\x07\xd0\
-\x85\xc8\x2b\x97\x27\xc0\xf4\xfe\xb9\xb9\x56\x33\x8e\x63\x86\xee\
-\xa2\x68\x7b\x75\x75\xed\x98\xe8\xf7\x0b\xfd\xf3\x6f\x9e\x8c\x37\
-\x6f\x9c\x58\x58\x39\xf2\x71\x75\xfe\xc2\x71\x0e\x72\xf9\xfe\x13\
-\x27\xfd\xe2\xea\x8a\x9a\x2b\x95\x54\x95\x01\xaf\xcf\x35\xc0\x1b\
-\xf6\x21\x44\x38\x90\x24\x78\x88\x02\x19\x11\xa4\x21\x48\xdf\x03\
-\xe1\x07\x88\x9f\xde\x8c\x3e\x92\x02\x5e\x2a\x6a\x9f\x67\x51\x0c\
-\x10\x47\x08\x31\x06\x85\x20\x25\x9e\x57\x45\x25\xb2\x7e\x6f\x59\
-\x31\x68\x80\x82\x18\x38\x3b\x25\x99\x92\xca\xf7\xb7\xb9\xec\xfb\
-\x61\x18\xfa\x6b\x6b\x6b\x94\xd1\x23\xb4\x9f\x5c\x81\x04\x0d\x21\
-\xb1\xf3\xe7\xcf\x6b\x68\xf8\x6d\xb0\x13\x67\x4f\xf8\x26\xac\x3b\
-\x17\x2c\x95\x86\xca\x9e\x13\xc7\x5e\x25\xa3\xb2\x62\xad\x91\xa2\
-\x0b\xfa\x9e\xcf\x96\x51\x55\x85\x42\xc1\x8b\xae\x5e\x6b\x74\xde\
-\x38\x7f\x72\x71\x79\xf9\x5f\xa9\x41\x7f\xcd\x4f\xc5\x3a\xf7\xbd\
-\xc6\xfa\x23\x1f\x61\x95\x4a\x45\xce\x15\x0b\xac\xa8\x24\xab\xd6\
-\x9b\xe0\x23\xac\x40\x48\xe3\x7e\xa3\x91\xbe\x78\x25\x53\x50\x08\
-\x24\xdd\xdd\xd5\x7d\x12\xd5\x24\x09\x4e\x22\x70\x1f\x1e\x4b\x2a\
-\x0e\x43\xed\xa6\x0a\xe1\xca\x14\xfb\x38\x87\x64\x77\x0f\x92\xf6\
-\x36\x8c\xae\x6f\x42\x8a\xca\xdc\x56\x00\xff\xab\x54\x82\xea\xaf\
-\xfc\x87\xef\xf2\x42\xe1\x32\x92\xb8\x05\x52\xdd\x12\x4c\xfe\x18\
-\x52\x7f\x17\xbf\xe4\x1b\x83\xc1\x60\x0c\x00\xc9\xb3\xcf\x3e\x9b\
-\xce\x52\xa1\x3f\x4b\x6d\x4f\x3e\xf9\x24\xbf\x79\xf3\x26\x7f\xe8\
-\x21\x60\xed\xf6\x0a\x5b\x59\x59\xd1\xca\x2a\x8f\x22\x16\x3b\x55\
-\x11\x34\x0d\xca\x00\x03\x20\x60\x47\x17\x57\xd6\x50\xf7\x5e\xff\
-\xf5\xd7\x57\x47\x1b\xd7\xef\x5b\x5e\x5b\xfd\x69\xff\xe2\x3b\x27\
-\xfc\x30\x58\x2d\x95\x8a\xc5\x87\x9f\xf8\x59\xd5\x68\xd4\x55\xb5\
-\x54\x64\xc1\x38\x62\x95\xe6\x3c\x82\x12\x28\x1c\x9f\xeb\xac\x4a\
-\x2e\xd7\xdb\x03\xc5\x51\x55\x08\x4a\xa5\x29\x42\x8a\x41\x92\xd2\
-\xfa\x03\x50\x8c\x21\x18\x84\x49\x2a\x42\x38\x80\xca\xe3\x8a\x81\
-\xbe\x46\xfc\x68\x12\x41\x7a\x78\xae\xa4\x28\x83\xfb\x15\xba\x2d\
-\x03\x04\x9e\x0a\x3c\xd6\x47\xc8\x12\x28\xa1\x00\x02\x94\x5b\xdb\
-\xab\x7c\x6d\x35\x25\x77\x51\x0c\x6a\x9e\xf2\x4a\xe0\xc9\x7e\xa1\
-\xa0\xe6\xa2\xc8\x8f\x49\x38\x70\xc0\xe2\xef\x87\x47\xe0\x88\x05\
-\x02\x63\x51\x14\x79\x51\x74\xba\x54\xad\xf6\x39\x63\x9c\x27\x83\
-\x90\x71\xbf\xda\x08\x02\x54\x9f\x10\x0a\xb3\x20\x6b\xce\x35\x8f\
-\x60\x30\x2f\x8d\x2f\x5e\x3c\x1d\xdf\xbc\x7d\x6a\xf1\xc8\xca\xc7\
-\xbd\xb7\x2e\x9f\x42\x50\x4b\xf7\x3f\xf4\x61\x5e\xfd\xd8\x47\x55\
-\x6b\xa1\x05\xd5\x20\x60\xd5\xc5\x65\xf0\x45\x0a\xbe\x94\x8c\x17\
-\x8a\x8c\x5c\x50\x25\x11\x28\x54\x84\xf2\x38\x08\x54\x08\x41\x51\
-\xa4\xaa\x41\x1f\xc4\x1e\x42\x04\x06\x48\x44\x03\x93\xa4\x40\x50\
-\x1a\x00\x36\xc0\x0a\x05\xbd\xce\xe8\x9f\x1f\x90\x02\x09\x9e\x89\
-\x34\x08\x19\x3f\x20\x7d\xa3\xa4\x4a\xed\xd6\x18\x2a\x50\xb1\x31\
-\x7d\x21\xfa\x4b\x28\x30\xa6\x44\xbb\x53\xf3\xd6\x57\x43\xa6\x80\
-\xbc\x67\x47\x71\x58\x53\xa9\xec\x08\x11\xe0\xc9\x31\xa0\x80\x70\
-\xd1\x4c\xc4\x6c\x80\xce\x65\xf1\xa4\xf3\x1c\xa0\xc2\x87\xc3\x52\
-\xe0\xd5\xbc\x2a\x67\x71\xc8\x58\x81\x87\x61\x69\xb9\x5a\xf5\xfd\
-\xd1\xe5\xcb\x8b\xd1\x95\x6b\x0f\xd4\x4a\xe5\x9f\xe2\xe3\xe8\x64\
-\xa9\x52\x3e\x55\x6c\xd4\xea\x6b\x1f\x7b\x1c\x9a\xad\x79\x35\xdf\
-\x6c\x50\x80\x67\xe5\x6a\x0d\x02\x04\x14\x20\x64\x13\x93\xc8\x19\
-\x62\x7a\x27\xa3\xac\x5b\xb7\x40\x21\x4c\x45\xca\xda\xde\x32\x6a\
-\x01\x02\x9a\x12\x50\xe3\x82\x68\x04\x4a\x71\x02\xc2\x11\x92\x6f\
-\x2e\xc3\x63\xd8\x4a\x73\xbe\xf9\xf0\x16\x9e\x73\x63\xdd\x9a\x75\
-\x31\x18\x20\x3c\xb4\xe1\x88\x54\x6c\x42\x02\x5a\x2d\x49\xd8\x5e\
-\xbb\x53\x46\x78\xe4\x5d\xeb\x88\xe0\x36\x7d\x64\x14\xcb\x91\xd4\
-\x4b\x77\xcb\xb8\xb4\xdb\xfd\x04\xa0\xaa\xf9\xdc\xcb\x8d\x7d\x53\
-\xd4\x7e\x85\xa3\xf2\x18\xba\x2c\x5b\x5d\x7d\xc8\xef\xf7\xfb\x55\
-\x25\xfa\x73\xfc\x07\xaf\x9d\x19\xec\xee\x3d\x5c\x2a\x96\xfe\x25\
-\xf7\xfc\x07\xab\xad\xe6\xf1\xe5\x85\xf9\xc2\x91\x27\x7e\x46\xad\
-\x1c\x59\x51\x8d\xfa\x1c\x2f\x68\xaf\x29\x43\x28\x15\x70\x04\xc7\
-\x83\x50\x5f\x04\x98\x8c\x0a\x6a\x30\xa2\x92\xde\xf4\x91\x2b\xa2\
-\xaa\x80\x33\x04\x25\x40\x4a\x41\x81\x94\x2e\xd2\x1d\x43\x2d\x4c\
-\x44\x84\xa0\x75\x19\x26\x74\x3f\x9a\x69\xc0\x81\xd2\xfb\x1c\xac\
-\xd4\xb4\x92\xe0\x2b\x52\x9a\xc9\xba\x08\x2d\x1d\xf4\xf5\x97\x22\
-\x95\x02\x39\x91\x53\x09\xb7\xbb\xdb\xdb\x14\x8e\x38\x19\xee\x3a\
-\xce\x24\x42\xe4\x92\x15\xe8\xa3\x21\xe0\x52\xe9\xe1\x10\xe0\x4a\
-\x3a\xd3\x85\x27\xca\xd3\x21\xac\x74\xf1\x62\x6d\xe7\x1f\xfe\xe1\
-\x2b\x0b\x0b\xad\xcf\x56\x57\x96\x8f\x2d\x3c\xf2\x88\xb7\x74\x74\
-\x55\x1d\x39\x76\x54\xd5\x4a\x25\x5e\x46\x97\x29\x00\x43\x65\x49\
-\xfa\x3a\x18\x2b\x16\x01\xa4\x71\x21\xe5\xe9\x2c\xa2\x15\x65\x2e\
-\x8c\x94\x14\x19\x55\x11\x94\x54\xe8\x7d\xa0\x21\x49\x50\xf6\xc2\
-\xc1\x00\x33\x80\xac\x7b\x4a\x60\x52\x19\x45\x39\x58\x64\x79\x58\
-\x42\x2b\x8f\x60\xb9\x75\x29\xcc\xb6\x94\xa6\x84\x41\x45\x27\x77\
-\xb7\xcc\xfb\x73\x0e\x82\x54\xc9\x18\x94\xb1\x4d\x7b\x7d\x1f\x8f\
-\x5b\x00\x8f\x63\xfc\x20\x0a\x00\x5c\x70\xba\xa4\x16\x80\xec\xe5\
-\x91\xe5\x15\xa8\x33\xed\xca\x78\xdc\x98\xdf\xdd\x79\xf9\x53\xff\
-\xf9\x3f\xad\x9e\x58\x3b\xca\x31\x13\x42\x11\x98\x76\x41\x1d\x51\
-\x8a\x25\x60\x74\x91\x84\xcb\x23\x65\xe0\x1a\xc5\x24\xfb\x81\xb1\
-\x83\x09\xf1\xee\xc5\xe9\xf8\x46\x20\x26\xa0\x2c\x38\xa0\x63\x69\
-\x9f\xed\x13\x64\x62\x0a\x94\x51\xaa\xdd\x06\x99\xdd\xa6\x2f\x42\
-\x6a\x40\xe6\x7d\x65\x6a\xb3\xaf\x55\xa4\xd9\x96\x7a\x9f\x84\xb4\
-\xd3\x05\xd1\xeb\xeb\xe4\x21\xf0\x75\x52\x52\x21\x80\xb6\x12\x1e\
-\x27\xd0\x54\x77\x27\x60\xad\x79\xc6\x80\x2e\x55\xad\x2b\x80\x5b\
-\x04\x07\x4b\x99\x39\x6c\x86\x98\x0f\x88\x53\x3c\x0b\xa0\xc2\xf2\
-\x21\x64\xaf\xbe\xfa\xe8\xe9\x9f\x7b\xe2\xe8\xa3\x4b\x8b\xcc\x47\
-\xb7\x62\xbe\x07\x8c\xa3\x85\x05\x6c\xb9\xbe\x50\x9d\xa0\x39\x68\
-\x38\x4c\x4e\xdc\x07\x94\x51\xa1\x71\x1d\xa3\x24\x69\xfa\xc0\xc2\
-\x15\x0e\x04\xb5\xc6\x94\x51\x91\x01\x4a\x17\x6e\xcc\x40\x32\xaa\
-\xa5\xe3\x09\x84\x50\xae\x1f\xb7\x2d\xac\x31\xba\x65\xa7\xdd\x01\
-\x4f\x29\x0c\x23\x15\x08\xd1\x43\xa4\x05\x18\xc5\x68\x91\x16\x55\
-\xda\xeb\x41\xd2\xed\x12\x40\xda\xd6\x09\x44\x98\x1a\x0e\x18\xad\
-\x6f\xb7\xc3\xa0\x35\xbf\x08\x13\x70\x8a\xc3\x2a\x93\x70\x67\x1a\
-\xd4\x24\xb9\x8a\x1c\x40\xda\xb1\xb0\xb0\xe0\x45\x42\xac\x55\x6b\
-\x35\xe5\xc7\x11\x63\xfa\x42\x7c\xd0\xaa\x4b\x53\x84\x18\x9a\x12\
-\x9a\xeb\xe0\xed\xd4\x44\x1f\xc0\xba\x97\x86\x22\x0c\x5c\xb7\x9d\
-\x51\x19\x19\x81\x01\xe7\x8e\x53\x31\x4c\x58\x98\x1a\x9c\xdd\x2f\
-\x27\xe0\xc0\x82\xc3\xed\x3e\xd6\x74\xdf\x7f\xf9\x15\xd8\xb9\x75\
-\x1b\x9a\x27\x4f\x42\x81\xb0\x5c\xbb\x0e\xad\x56\x0b\x8e\x9e\xbe\
-\x0f\xbc\x50\xc7\x61\x33\x22\xd1\x43\xb9\x11\x0d\xe1\x8c\xf2\x26\
-\xf0\xe4\x04\x64\x91\xdc\xb9\x8d\x00\xe1\x7e\xea\x39\x02\x00\x37\
-\x3c\xbd\xdf\x2c\x91\xaf\x47\x4c\xf1\x4c\x17\x7e\xe8\xa1\x87\x18\
-\x26\x0d\xe0\x47\x96\xae\xde\xbd\x7e\x9d\xa7\x27\xd6\x21\xe4\x4c\
-\x83\xe3\x5a\x71\xdc\x28\x50\x01\x80\x05\x33\xed\x7e\xca\x01\x32\
-\xfd\x0e\x0e\x99\x59\x57\x0e\xb2\x48\x27\xad\x74\xb0\x94\x05\x29\
-\x74\x72\xc1\x1d\x5a\x49\x79\xf7\x16\xb0\xbb\xb3\x0b\xdf\xfc\xd6\
-\xb7\xe1\xe8\xcf\xff\x3c\x3c\xf2\xe4\x93\xc0\x4b\x25\x93\xac\x10\
-\x52\xf2\x37\x7f\x03\xb7\xbf\xfe\x75\x58\x7e\xf8\x61\x72\x59\x9d\
-\x3c\xe2\xbb\x77\xcd\x90\x4e\x4a\x93\x40\x28\x63\x4f\xa4\x94\xa2\
-\x15\xf0\xfd\xc7\x77\x31\x91\xe4\x16\xbe\x0c\xa0\x3a\x00\x54\x2e\
-\x96\x42\x3a\xfc\x5e\x99\xd8\xdf\xd8\xd8\xf0\x6b\xb5\x9a\xc7\x1f\
-\x7b\xe8\xad\xdd\x0b\x57\x04\x0e\x04\xbd\x82\x1f\x00\xf3\x0c\x34\
-\xcc\xbe\xee\xe2\x48\x5d\x2e\x36\x65\x80\xb2\x0c\x5c\x91\x2f\x27\
-\xa4\x22\x17\xb6\xf1\x32\xe3\x8e\xc6\x4d\x69\xdd\xb8\xb5\x3b\x96\
-\x40\xd2\x97\xe4\x62\xdf\x77\x5e\xfa\x21\xac\x7d\xfe\xf3\xb0\xfa\
-\xd4\x53\x30\xbd\x78\x95\x0a\x14\x7f\xe9\x97\xc0\x47\x45\x46\xcf\
-\x3e\x0b\xbc\x56\xc3\xcc\x3b\xd0\x10\x93\x24\x21\x78\xa6\x00\xb7\
-\xea\x9b\x58\x51\x4a\xd8\xdb\xd9\xf5\x91\x60\x93\x06\x5c\x78\xd0\
-\x51\x01\x6a\x93\x11\x1c\x5f\xcd\xc7\x00\x7b\x70\xc0\xc2\x4f\x9c\
-\x38\x91\x62\x41\xcc\xfd\x62\xd3\x1f\x74\x77\x6e\x0e\x84\x00\x1e\
-\xc7\xba\xe6\xe2\x36\x6e\xa5\x09\x40\x92\xa2\x25\x7a\x9d\xa1\x65\
-\xd6\xd1\xd4\xa4\x4f\x51\x7f\x9c\xa2\xc5\x74\x0e\x99\xe9\x8f\x23\
-\x3a\xc6\x80\x89\x68\x9f\xde\x6f\x14\x18\xa7\x66\x3d\x89\xd1\x68\
-\x3b\x36\xfd\x7a\x7f\x62\xe2\x59\x92\x60\xbc\x6b\x03\x79\xcb\x91\
-\xcf\x7d\x0e\xb2\xb3\x36\x01\xa9\x44\x97\x53\xa5\x27\x9e\x80\xea\
-\x99\x33\xa0\xb6\xb7\x29\xf6\x91\xfa\xf4\xb9\x46\x75\x0e\x9e\x85\
-\x59\x40\xb0\x69\x92\x30\x1c\xe1\x78\xca\x42\x61\xb0\x96\xc5\xb4\
-\x0d\x26\x91\xe4\x17\x1a\xae\x61\xad\x23\xf0\x33\x48\xaf\xdb\xdd\
-\x79\xb5\x17\x27\x0a\xc8\x85\x27\xb1\x0a\xe2\x08\x6d\x0a\x56\x4c\
-\x30\x26\x00\xf5\xc5\xea\x3e\x0b\x83\xc0\x11\x44\xb3\xae\xe1\x10\
-\x54\x5a\x17\xfa\x18\x69\x20\x3b\x50\x64\x04\xc9\x82\xb4\xfb\xd1\
-\xa4\xde\x6f\x5f\x4b\xc0\xd6\xed\x2d\x68\x3d\xf6\x98\xae\x02\xec\
-\x82\x99\x12\x8a\xc5\x22\x01\x34\x10\x51\x89\x15\x54\x67\x10\x45\
-\x90\xd0\x78\x59\x4a\x0d\xca\xba\xae\x53\xa0\x69\x7d\xbb\x7f\x7b\
-\xbb\xc0\x00\x16\x69\x9d\x29\x66\x59\x42\x98\x84\x73\xd9\x44\x92\
-\x5d\x7c\x1c\xe0\x73\x21\x4a\x63\xa5\x54\x03\xa7\x4a\x2e\xdf\xee\
-\x74\xe5\x43\x2b\xcb\x1e\x1b\x8f\xa9\x42\x36\x60\x4c\xc6\x72\xb1\
-\x4d\x49\x57\x2c\x0b\x09\x37\xae\x6c\xc0\x8f\x5e\xf8\x01\xdc\xbc\
-\x70\x51\x97\x3e\xcd\x46\x1d\x1e\x7c\xfc\x51\x58\x7b\xe8\x41\x9b\
-\xc1\xd1\x52\x97\x6d\xdf\xad\xeb\xa6\x33\xb5\x2b\x4d\xf0\x38\x03\
-\x54\xda\x3a\xcf\x1c\x4b\xa0\xc3\x29\x78\x3e\x7a\x09\x7e\x7e\x02\
-\x48\x46\x30\xb5\x1a\xc3\x95\x15\xe8\x8c\x4c\x01\x2f\xd0\x72\xe0\
-\x18\x33\xfd\x13\xa8\x1e\x9a\xd8\xee\x84\xde\x89\xe3\x80\x3d\x47\
-\x24\xb0\xcd\xe9\x4c\x1c\xf9\x35\x04\x21\xef\x5d\xc6\xf4\x7a\x3d\
-\x46\x7c\xf0\xdb\x1b\x84\x4b\x8b\x57\x36\xaf\x5c\xf5\xc4\xf1\x63\
-\xe0\x73\xcf\xb8\xa1\xe7\xd9\x9a\xce\xb4\xd2\x25\x0c\xb2\x17\xbf\
-\xf7\x8f\xf0\xe2\x77\xbe\x0b\xeb\x9f\xfb\x3c\xdc\xf7\x1f\xbf\x04\
-\x9c\x0a\xd5\xab\x57\xe1\xd2\x5f\x7c\x1d\xee\xfc\xf0\x15\x78\xec\
-\xa9\x7f\xaf\xcb\x21\x37\x7a\xb0\x05\xaf\x7a\xb7\x6e\x93\x36\x4e\
-\xda\x58\x48\xeb\xba\x5f\xb9\x82\x18\xad\x1a\x84\x90\xbc\xfd\x76\
-\xc6\x75\xc9\x2c\x44\x6a\x09\x22\xa3\xcc\x4b\xa3\x10\x0b\xcf\xb8\
-\x6b\x2e\xfe\x59\x65\x06\x78\x2c\x8e\x89\x4d\x22\x21\xa6\x13\xfd\
-\x09\x9b\x48\xdc\x92\x1b\xd2\x71\x4c\x22\x3a\x06\x06\x41\xc2\x8a\
-\xff\xe2\xcc\xc6\x78\x30\x84\x41\x7f\x40\x87\x9a\x40\x6f\x62\x9d\
-\x8b\x85\xda\x45\x8d\xab\xfd\xf8\xa5\xff\x0d\x2f\x3e\xff\x22\x7c\
-\xe4\xab\x5f\x83\x65\xcc\x88\xe1\xf2\x32\xf8\x8b\x8b\x50\xf8\xd8\
-\xc7\xa0\xf6\x87\xff\x15\xbc\x7f\xfd\x6f\xe0\xf2\x37\xff\x8e\x8e\
-\xb5\xb1\x4c\xbb\xa9\x4a\xc8\x12\x17\xeb\xac\xdb\xe2\x7e\xbb\x4f\
-\xa6\xc2\x4c\x55\xe1\x36\x19\x9d\xbb\x50\xaf\x03\xc6\x19\x88\xde\
-\x7a\x8b\xa6\xf3\xb5\x02\x2d\x44\xeb\xca\x65\x6c\x93\xbf\xfe\x6b\
-\xe8\x29\x95\x05\x66\x6d\xa2\x3e\x70\x40\x69\x64\x45\x23\x95\xc0\
-\x51\x52\x47\xa7\xa1\xb9\x4c\x9c\x5f\xf8\xd9\xb3\x66\x25\x49\x02\
-\x26\xcb\x95\x8d\x74\x34\xea\x0d\xa8\x7c\xb1\xaa\x89\x4c\x0c\x54\
-\xba\x30\x35\xf1\xcd\x82\xfc\xc7\x6f\x7f\x17\xee\xff\xf5\x5f\x87\
-\x70\x69\x69\xfa\x1b\x22\x25\xe8\x80\x5e\xf9\xd2\x97\x20\x3c\x76\
-\x0c\xc6\x57\xaf\xe1\xf9\x2e\xd9\x60\x6c\xb3\xf0\xcc\x7a\x14\xeb\
-\x56\x6a\xa8\xb8\x9f\x8c\xde\x97\x20\xda\xe3\xf5\x90\x11\xe0\xcc\
-\xf1\xe3\xd0\xa3\xa1\xe7\xcd\x9b\x04\x91\x14\x6f\x4d\xc7\xb3\xe8\
-\x1b\xdf\x80\xcd\xbf\xfc\xcb\x8c\xbb\x4a\x97\x40\xb4\x81\x6d\xcd\
-\x3e\x73\xde\x78\xcc\x11\x42\xcb\x8c\x2a\x09\x33\x43\x88\x26\x13\
-\x83\x59\xee\x99\x48\xb0\xe3\x2c\x30\xb6\x1b\xa5\x69\x5a\xa3\x51\
-\xdb\xdd\x1b\xb7\xde\xec\x03\x7c\x82\x2e\x94\xdc\x88\xd1\x45\xc9\
-\x89\x62\x95\x34\xea\x53\x0a\xb6\xee\xdc\xd1\x25\x46\xfd\x91\x47\
-\xa6\xe1\x65\x5c\x89\x14\x12\x7e\xe1\x57\x60\xf4\xb5\xff\x0e\xfe\
-\xfc\xfc\x64\x5a\xca\xc5\x42\x65\xb6\x4d\x4d\x68\xc6\xc7\x76\x68\
-\xe6\x4a\x1c\xed\x86\xd4\x28\x6d\xf3\xcd\x26\x78\xb8\x7f\x07\xbf\
-\xb8\xca\x2f\xfc\x02\x78\xa8\x00\x0f\x55\x0f\x98\x71\x07\x7f\xff\
-\xf7\x70\xf3\xcf\xff\x1c\xba\x49\xe2\xd4\xb7\xaf\xb5\x93\x09\x30\
-\xd5\x1f\x28\x65\x00\x6f\xb5\x43\xbe\xba\x82\x6a\xe0\xb7\x19\x53\
-\xcc\x9b\x4e\x24\x0c\x86\xf7\x8c\x81\x94\x85\x71\x28\x47\x17\xdc\
-\x0f\xc3\xc2\xbc\x68\x36\x2f\x77\xa3\xf8\xe3\xaa\xac\x38\x0b\x0b\
-\x54\xa0\xba\x69\x25\x91\xea\x16\xc9\x41\x32\x18\x41\x09\x6b\xad\
-\xa9\x25\x13\x8b\xc8\x08\x20\x29\x50\x04\xa1\x29\x5d\x26\x63\x54\
-\xb0\x31\x6e\x2a\x99\x48\xdb\x4a\x69\x60\x51\x6b\xe7\xd2\x6d\x1f\
-\x80\xee\xaf\x35\x1a\x10\xe2\xf1\xc9\x37\xbf\x09\xbd\xbf\xfd\x5b\
-\x18\x12\x94\x4e\x07\x06\x69\x9a\x73\x4f\x95\x2d\x5d\x2c\x40\xbd\
-\x6e\xf7\x31\x30\x8b\x68\x6b\x80\x7a\xb4\x7a\xd8\x21\x1d\xc7\xe9\
-\x6a\x81\x53\xd7\x4c\x6f\x14\x39\x2b\x2c\x2f\x6e\x5c\xb9\x74\x19\
-\x80\xe0\x11\x34\xe3\x62\xd8\x46\x93\x12\xc3\xb8\xb2\xaf\x24\xf0\
-\xf1\x08\xec\x62\x83\xb9\x85\x68\xeb\xb2\x72\xbd\xae\x15\x63\xcb\
-\x12\x88\x5d\x5d\xa7\x22\xea\x4b\xcd\x36\xf5\x9b\x21\x1c\x99\x85\
-\x68\x93\x88\x35\x33\x35\xb5\xbb\x6b\x12\x19\xee\x8b\xb0\xde\xeb\
-\x6d\x6d\x41\x9f\x5e\xdf\x42\x76\xee\xbb\x5f\x7d\x0e\xa8\x5e\x77\
-\xfb\x38\x7d\xb9\xed\x4e\xc8\x0c\xba\x23\xae\x42\xe7\xcb\xc6\x95\
-\xa3\xf2\x3d\xee\x11\x11\x6c\xb7\xc4\xfd\xdd\x76\xf9\xe4\x89\x77\
-\xc6\xa3\x31\x1f\xee\x74\xcd\x58\x96\x7b\xa6\xe8\xb5\x35\x59\x14\
-\x69\x88\x2d\x54\x41\x91\x2e\xe0\xc2\x05\x0b\x30\x97\x15\x09\xa0\
-\x87\x01\x3f\x08\x43\x13\xe3\xa2\x89\x69\x98\x1a\xa8\xb1\xe9\xd2\
-\xc6\xaa\x8d\xcc\xa9\x91\xf6\xd3\xb8\x56\x9f\x9b\x62\x31\x1d\x61\
-\x08\x49\x69\xdb\x80\xcd\x82\x33\xb6\x5f\x89\xb9\x63\xb4\x42\x26\
-\x6a\xf4\x28\x91\xdc\xd9\x2a\x81\x3d\x4f\x51\x0c\x74\x5a\x1b\xe4\
-\x12\x49\x16\x60\x62\x3b\xf6\xea\xb5\x1f\xc6\x83\x51\x8c\x05\x35\
-\xa1\x76\xb1\xc9\x26\x11\xea\x8f\xcd\x68\xe2\xd1\x0f\x7f\x08\x7a\
-\x7f\xf4\x47\xc0\x87\x43\x0a\xe8\x36\x33\xda\xec\x68\xc6\x99\x7f\
-\xf6\x67\x20\x9b\x0d\xa3\x62\x93\x24\x8c\xaa\xc7\x91\x56\x97\x05\
-\x27\x33\xe0\xb2\x30\x05\x1e\x2f\x46\x23\xad\x3e\x81\xb1\x2e\xed\
-\x76\xf5\x17\x69\x6b\x45\x70\x60\x32\xd0\xc8\xf2\x60\x0d\x30\x96\
-\xdd\xa7\x67\x74\xc6\xfd\xbe\x0f\x4a\x35\x55\x06\x51\x36\x91\xcc\
-\x02\x08\x9d\x4e\x27\xa2\x56\x8e\x25\xa4\x42\xde\xde\x8b\x63\xe3\
-\xc2\x49\x6a\x2f\xda\x8e\x32\x4c\x79\x81\xed\x7d\xa7\xee\x83\x93\
-\xcd\x3a\x8c\x7f\xeb\xb7\x00\x5e\x7e\xd9\xcc\xdc\xd0\x8b\xa2\x42\
-\x18\x2a\xb3\xf3\x85\x2f\x80\x10\xc2\xb9\x68\x92\x10\x0c\x6c\x53\
-\x0b\xcb\xba\x6b\x76\xdb\x29\xcf\xa8\x75\x3c\x36\xae\xdb\x6e\x43\
-\x8c\x2e\x2b\xe8\xfd\x5d\x5c\xcc\x19\x64\x63\x9f\x8b\x7b\xf9\x92\
-\xc6\xb4\x93\x4c\x1c\xa3\x49\x9c\x1b\xb4\x4c\x6c\x26\x76\x23\x92\
-\x7c\x26\xf6\x15\x4a\xec\xe9\xa7\x9f\xd6\x09\x67\x84\x56\xe3\x1c\
-\xee\xde\xbd\xf3\x23\xcc\x64\xeb\x72\x38\x64\x10\x14\x10\x5e\xdb\
-\x64\x5f\xe9\x62\x93\x2d\xa8\xef\x7f\xf0\x43\xd0\xba\x71\x13\x3a\
-\x7f\xfc\xc7\x90\xfe\xe9\x9f\x42\x8a\xae\x3d\x44\x05\x26\xdb\x5b\
-\xe0\x2d\x2c\x82\xe4\x8c\xe2\x9e\x3b\x6f\x2a\xab\x82\x8b\x4b\xce\
-\x0d\x6d\x9c\x12\x82\x14\x6a\x5a\x34\x9a\x55\x91\xc9\xc4\xed\x1d\
-\xf0\x3c\x14\xa7\xb2\xdc\xba\xdb\x6f\x17\xd7\xc7\xed\x54\x3f\x0e\
-\xe9\xfc\xf9\xe6\xe1\xe6\x06\xad\x02\x29\x91\x68\xca\x62\xd4\x47\
-\xf7\x63\xc5\xa5\xa5\x8d\xcb\x97\x2e\x2b\x10\x3a\x88\xdb\x7b\xaf\
-\x36\x8e\x91\xfb\x90\x99\x75\xb4\x06\x96\x16\x27\x1f\xb8\x1f\x56\
-\x8f\xae\x42\xbd\x5c\x82\x22\xd5\x65\x8b\x08\x8f\x20\x09\xe7\x8e\
-\x99\x0c\x9b\x55\x5d\xa6\x5f\x5a\xa5\x13\xb8\xad\x2d\x03\x4f\x08\
-\x03\xd0\x9d\x3b\x5b\x75\xae\xb5\xc7\xe5\x14\xe8\x16\xa7\x46\xa0\
-\xf7\xde\x36\x89\x84\x86\x74\x54\x0f\x82\x5d\xdc\xdc\xe0\xc1\xf7\
-\x85\xbb\xe3\x6e\x7b\x75\xfd\xe8\xd5\xc1\x9d\x3b\x3c\x36\x12\x05\
-\x08\x42\x90\x83\x21\x8d\x87\xdd\x0d\x1b\x29\x5d\x96\xa4\x7e\x5b\
-\xcb\x51\x1d\x97\xfd\xf0\xe6\x83\x65\x15\x98\x55\x9f\x53\xa1\x9d\
-\x51\x26\x57\xa7\x58\x47\x30\xed\x8c\x8a\xde\x97\x87\x96\x37\x99\
-\x7d\x7d\x67\x19\x65\xe6\x21\x32\x33\x22\x29\x17\xa6\x03\x9c\x3a\
-\x78\x6e\x90\xdb\x63\x57\x57\x57\xe3\x28\x8a\x35\xf1\xf2\x99\xd3\
-\xd7\xd2\x71\x22\xbb\x98\xe9\xdc\xfd\x0b\x65\x66\x78\x75\x3c\xb3\
-\x2a\xd4\xf1\xcc\xc6\x37\x82\x97\x8f\x65\x46\x79\xb9\x58\x27\xf3\
-\x2a\x24\x23\x48\x54\xa6\x90\x51\xdc\x33\xc9\x23\x8a\x1c\x3c\x07\
-\xfc\x00\xcb\x2b\x11\x66\x6c\x83\x52\x64\x2e\x91\x74\x77\xfc\x77\
-\xf9\xd9\x4c\xec\x12\xc9\xec\x24\x42\x05\xf5\x60\xe0\x8d\x69\x7d\
-\xab\xdf\xbf\x44\xc4\xbb\x14\xbb\x18\x37\x03\xf3\xc9\x58\x15\x22\
-\x93\x44\x04\xee\x13\x53\x75\x1b\x64\x32\x68\x0e\xa4\xdd\x76\x50\
-\x6d\x6b\xc1\x99\x78\x47\x37\xbf\xcd\x44\x28\xd9\x78\x4c\xf0\xe8\
-\xbc\x43\xc3\x93\x33\x8e\xcb\x4d\x24\x18\x97\x9d\x28\xd2\x02\x53\
-\x10\xa5\x29\x53\x83\xe1\x02\xec\x9b\x1b\x14\x42\xb2\xdc\x90\xce\
-\x02\xdc\xff\x0c\x1c\x47\x68\xdb\xdb\xdb\x6f\xec\xa4\x42\xa9\x41\
-\xdf\x14\xbc\xae\x76\x23\xa5\xe5\x4a\x0d\x49\xe6\xee\xbb\x6a\x40\
-\x32\x1b\xdb\x2c\x58\x9b\x04\xac\xbb\x9a\xf3\x68\x4a\xbe\xd3\x21\
-\x80\xb6\xd6\x23\xa8\x3f\x11\x3c\x70\xc7\xe5\x55\x97\xb3\xec\x62\
-\x15\x98\x32\x9d\x48\x42\x6c\x16\xed\x3e\xc9\x11\x5e\x90\x9f\x1b\
-\xcc\x15\xd2\x36\x91\x78\xbe\xc7\x8b\x0b\xad\xab\x5b\x69\x2a\xe9\
-\xd9\x3a\xa8\x54\x48\x7d\xe6\x62\x5d\x3c\x73\x96\x55\x9d\x1b\x3d\
-\x38\x77\x75\xf0\x9c\xbb\x5a\xa8\xa6\xb6\x1b\x0e\xe9\xcb\xd1\xea\
-\x4b\x71\x5b\xbf\xd7\xe1\xe1\x39\xcb\xdc\xf7\x98\x15\x2b\x9d\xeb\
-\xda\xc5\xc1\x27\x80\x9d\x02\x36\x8c\xf4\x49\xf3\x0a\x9c\xb1\x55\
-\x00\xaa\x6f\x05\x9b\x1e\x91\x38\x80\x2e\x13\xeb\x65\xbb\xbb\xbd\
-\xe5\x2f\xcc\x5f\xbe\x7a\xf9\x32\x4f\x95\xa2\x8c\x68\x1f\xda\xc9\
-\xb8\xa0\x85\x23\xf3\x19\xd5\xd5\x71\x16\x5c\x3e\x91\x90\xea\x8c\
-\xab\x26\x09\xb5\xe6\xd6\x23\xf6\xd9\x92\xe6\xfd\xc0\x9b\x9d\x99\
-\xf3\x20\x19\xd9\x7e\x88\x4a\x21\xc0\x76\x05\x98\xde\x7b\xc4\x62\
-\x0a\x80\x2d\xdf\xeb\x41\xac\xfd\x0a\x44\x52\x75\xbd\x52\x38\x75\
-\xf2\x1d\x21\x04\xeb\xee\xec\x80\xe2\xdc\x81\x73\x70\x32\x26\x4d\
-\x1c\xb3\x40\x4d\x6b\x41\xe7\x8d\xe0\xe9\xe3\x6d\xbc\x4b\xf7\xf6\
-\x2c\xec\x99\x6e\x27\x67\x6f\xcf\x36\xa3\xc6\xfc\x18\xd8\x01\x75\
-\xf0\x6c\x1c\xdc\xda\xf2\x0d\x21\x3a\x5f\xae\x51\x39\x23\xa5\x62\
-\x1a\x50\x92\xb0\xa9\x21\x5d\xde\x85\xa3\x28\x62\x25\x6c\xef\x8a\
-\xf4\xbc\xc7\x58\xbf\x6b\x5d\x92\x3e\x48\x10\x58\x58\xd9\x4c\xea\
-\x2e\xdc\x6d\x67\x5d\xd8\x29\xd2\xd4\x95\x3a\x41\xa4\x26\xee\x51\
-\xc6\x25\xe8\xf7\x82\x97\xef\x9b\xad\xbe\x43\xc6\x3a\x67\x6c\x62\
-\xe0\x5a\x0d\x70\x34\x1a\x73\x15\x27\xf3\xe0\xea\x40\xbb\xb7\xb5\
-\x2f\x91\xe4\x01\x9a\x87\x0a\xcd\xd2\x6d\xb7\x2f\xe0\x88\xc4\x8d\
-\x1c\x94\xca\x95\x1e\x92\xcc\x25\x91\x99\x2a\x25\x88\xa8\x68\xaa\
-\xef\x6c\x59\x62\xc6\xb4\x4a\xbd\x17\xbc\x9c\x1d\xf6\x38\x38\x00\
-\xa4\x53\x9f\x75\x63\xb7\x9e\x30\x06\x72\xbb\x4d\x2a\x5b\xb4\x43\
-\x3a\xce\x99\xe2\x9c\x2b\xdf\x2f\xce\xe5\x62\xe0\xfe\x4c\x3c\x1c\
-\xaa\x41\x25\x08\x59\xd0\x9a\x7f\xa7\xeb\x79\x42\x4a\xa9\x13\x89\
-\x70\x59\xd5\x82\xcb\x25\x11\xe9\x54\x97\x75\x67\x3b\x75\x2f\x04\
-\xc5\x3a\x52\x1e\x65\x5b\xa7\xe6\xd9\x50\xf2\xca\x3a\x3c\x64\x3a\
-\x60\x86\x42\x33\xca\x73\x00\x6d\xc9\xd3\x46\x80\x8c\x29\x84\xa7\
-\x0f\x95\x0c\x56\x93\xc9\x5f\x06\x4c\x67\x62\x0b\x30\x97\x48\x68\
-\x09\x5b\xad\x2b\x9b\xb7\x6e\xb1\xe9\xfa\x4e\x10\x08\xe7\xa2\x0e\
-\x50\xbe\x80\xce\xa9\x10\xd5\x47\xf0\xec\x64\x84\x83\x9d\x87\x72\
-\x78\x78\xf9\xe3\x1c\xb4\x7c\x59\x33\x1b\xa0\x52\x6e\x62\x55\x29\
-\x3d\x37\x68\xfa\xd9\x91\x4c\x88\xdb\x37\x37\xc8\x61\xc6\xb2\xb7\
-\xd7\x6d\x07\x47\x57\xdf\x49\x84\xe0\xbb\x93\xfb\xab\xac\x58\xcc\
-\x97\x32\x0e\x52\xd6\x9d\xa9\xcf\x15\xc9\x54\x9a\x90\xea\x4c\xfc\
-\x23\x98\x26\xe1\xe4\x54\x77\x18\x78\xf2\x3d\x94\x97\x50\x3d\x87\
-\x26\xf3\xe0\xcc\xe2\x66\xad\x73\x10\x6d\x1b\xdd\xb9\x5b\x72\x34\
-\xd4\x51\x73\x9c\x5c\xce\xdc\x64\x9a\x01\x30\x01\x4d\xd9\x53\xbd\
-\x66\xed\x25\x04\x93\x74\xcd\x4d\x1d\x53\x5f\xf9\xbe\x8b\x75\xd6\
-\x1c\x4c\x63\xae\x40\x26\xa3\xd2\x84\xcc\xac\x9b\x9b\x47\x07\xab\
-\xe9\x7d\xc2\xeb\x60\xff\x46\xa1\x00\x77\x4b\x25\x18\x36\x1a\x20\
-\xe9\xf6\x02\x5a\x90\x53\x5f\x26\xfe\xe5\xca\x19\x82\x32\xee\xf5\
-\x3d\xa6\x64\x23\xff\x54\x3e\x6b\x1d\x30\x99\xe0\x12\x49\xb9\x5c\
-\xad\x48\x7a\x1f\xcf\xbb\xb5\x23\xe5\xb1\xa3\x1a\x4e\xd6\xc0\x5d\
-\x8c\x9b\x39\x76\x4a\x22\x50\x66\x22\x20\x8e\x73\xc3\xb2\x03\x33\
-\xe8\xa1\xe1\xb9\xfe\x9b\x8c\x41\xaf\x5e\x87\x07\x7e\xe3\x37\xa0\
-\xfe\xf8\xe3\x00\xcc\x3c\x5b\x1d\xbf\xf0\x02\xa4\x5f\xfd\x2a\xec\
-\x62\xa9\xd4\x55\xca\xf4\xdb\xf3\x2c\x38\xd7\x4f\xeb\xba\x2f\xa2\
-\xd2\xa5\xbb\x1b\xb0\x66\xd3\x80\x33\x2a\xbc\x69\x19\xd9\x4c\xec\
-\x14\x98\x1b\xd2\x99\x80\xd9\x1b\x0c\x5e\xeb\x00\x48\x82\x00\x41\
-\x60\xdd\x2e\x57\xe7\x99\xd6\x29\x32\xd5\xe3\xe5\x58\x97\x2a\x29\
-\xc2\xc3\xf5\x69\x50\xae\xfd\xbf\x00\x0f\xbf\x60\xe8\x62\x92\x7b\
-\x14\xe7\x24\xeb\x1f\xfd\xa8\x83\xc1\x39\x94\x3f\xf5\x29\x68\xfe\
-\xc9\x9f\xc0\x49\xbc\x1d\x5a\xc4\xfe\x14\x40\x9b\xc8\x8e\x9b\xb3\
-\x35\xa1\xc9\xc4\x7a\x48\x07\x53\x43\x3a\x33\x22\x01\x48\x78\x38\
-\x37\x33\x06\x52\x22\xb1\x99\x98\x73\x0e\xc1\x7c\xf3\xca\xf5\x4e\
-\x47\x59\x40\xb6\x74\x99\xae\xf1\x84\x2b\x5f\x28\xde\x99\x32\x05\
-\x8d\xdc\xd6\x9a\x9c\x01\xef\xbd\xa0\xc9\x03\xe0\x89\x89\x6d\xa1\
-\xcb\x9e\xfa\xd5\x5f\xc5\xcf\x3a\x9f\xbb\xc5\x5a\xc2\x7d\x95\x53\
-\xa7\xa0\xfe\x6b\xbf\x06\xeb\xb5\x1a\x85\x21\x6d\x82\x5a\x00\xdd\
-\x02\x5a\xa6\xb0\xa6\xfd\x60\x86\x74\xa6\x37\x9b\x48\xa6\x6f\x32\
-\x71\x38\x60\x49\x87\xbd\x4e\x61\x75\xf9\xca\x58\x4a\x2f\xe6\x9c\
-\x2e\x98\x54\x68\x61\x11\xb8\xec\x90\xce\x6c\xdb\xf2\x84\x26\x04\
-\x4c\x11\x9e\x05\x60\xe1\x1f\x0c\x2e\xe7\xe2\x06\x96\x55\x50\x8c\
-\x96\x90\xa2\xd0\xc6\xa8\xf0\x85\x4f\x7f\x3a\x07\xcf\xde\x19\x24\
-\x2b\x7e\xf2\x93\x70\xf2\xf4\x69\xab\xbc\xbc\xf2\xb3\xae\x68\xbc\
-\x68\x6b\xab\x94\x01\x62\x13\x49\x74\x50\x0c\x74\x89\xa4\x48\x2b\
-\xe1\x03\xa7\xaf\xc4\x3f\x3e\xaf\xb6\x77\x76\xd8\x32\x65\x61\xf3\
-\xf7\x17\xe6\xc6\x10\x40\x66\x3a\x1e\x0c\x44\x9d\x71\x53\x84\x78\
-\x87\x2c\x0c\x49\xfa\x40\xbe\xd0\x44\x55\xd6\xf0\x18\x7b\x57\x50\
-\x1e\x46\x7d\x4a\xe5\x9e\xae\x22\x08\x6a\xdf\x8d\x71\xaf\x58\xcc\
-\xdd\x9f\x26\xa3\xf5\x20\x08\xf4\x8d\xae\x68\x6e\xce\x9e\x6f\x5a\
-\x37\xcc\xcb\xc4\x74\x9b\x5c\x86\x9d\x1d\xbf\xe2\x98\xae\x29\x60\
-\x9b\x9c\x31\xc5\x8b\xde\xfc\x40\xc4\x7b\x94\x89\x7d\x78\x8f\x65\
-\x37\x4d\xdf\x09\x83\xa0\xbd\xa3\xd4\xc2\x92\x75\x3b\x34\x6c\x73\
-\x37\xbd\xb5\xfb\x62\xb0\x1e\x21\xc4\x17\x70\x9d\x5c\xe7\x08\x3e\
-\x6a\x56\x58\x58\x00\x86\xf0\x62\x7c\x82\x74\xef\xa5\x97\xa0\x86\
-\x60\x21\x0f\xcd\xa9\xc3\x6d\x13\x38\xb7\x3e\x43\xa1\x04\x2a\xba\
-\x76\x0d\x0a\x18\xe7\x08\x54\x18\x86\x64\x04\xcf\x41\xc4\x30\x32\
-\xa4\x72\x6a\x1f\x3c\x39\xe5\xb6\xb6\xb5\xa5\xcd\x38\x4d\x39\x8c\
-\x86\x2d\x56\x2a\xdf\xd5\x48\x99\x5a\x33\x89\x24\x01\x02\x9b\x5a\
-\x17\xce\x27\x12\x37\xa4\xe3\x9c\xb3\xc1\x78\xf4\xe6\x0e\xed\xb0\
-\xe5\x8c\xab\xf3\x5c\xdd\x37\x89\x7b\x09\x1e\xf3\x3c\xda\xd2\x67\
-\x3f\x0b\x0f\x62\xf6\x6b\xa0\xeb\x94\x3e\xf4\x21\x28\xe2\x23\x20\
-\x73\xbf\xf3\x3b\x30\xf7\x07\x7f\x00\x1c\x33\x1b\x03\xc8\xb8\x65\
-\x62\xdd\xd3\xb8\x25\x6d\x5b\x73\xfb\xac\xdb\x4e\x59\x8c\x56\x90\
-\x12\x76\x9f\x7b\x0e\x70\xc9\xdc\x56\xb5\x10\xc9\x95\x83\x76\x1b\
-\x7e\xf4\x83\x1f\xbc\xab\x66\x99\x55\xb3\x15\x41\x26\x13\xd3\x6b\
-\x8b\x2d\x4a\x24\x6a\x11\x1c\x2c\xaa\x63\x59\x62\xe6\x06\x0f\x8e\
-\x81\xc3\xe1\xae\x4e\x24\x7e\xa3\x7e\xa9\xc3\x98\x14\x69\x6a\x62\
-\x60\x1c\x67\x46\x1f\xa4\x3c\x72\xd9\x14\xfb\x37\x87\x43\x28\xae\
-\xaf\xc3\xb1\xa7\x9f\x86\x7d\x19\xdd\x04\xf4\x4f\x7c\x02\x1a\xbf\
-\xf9\x9b\x50\xa8\xd5\x2c\x10\x6d\xb1\x6d\x29\x03\x92\x39\xa0\x59\
-\x68\xd3\x30\x2d\x00\x21\x20\x7a\xfe\x79\x18\xff\xd5\x5f\xd1\xfb\
-\x64\x4c\xc3\x44\xaf\xd8\xfa\xed\xdf\x86\x7f\xa2\x3a\x74\x9f\x0b\
-\x4b\xa7\xbc\xcc\xf4\x3e\xb5\x02\x40\x8f\x89\xd5\xf4\x88\x4f\x50\
-\x39\x43\xcf\x25\x9a\x44\xe2\x00\xe6\x33\x31\x1e\x14\x52\xf6\x25\
-\xc5\xbc\x73\xb7\xd3\xe1\xa9\xfd\xa3\xbf\x20\xb0\x33\xca\x66\x2e\
-\x6f\x32\x73\x2c\x10\xde\x8d\x30\x84\xb5\x5f\xfc\xc5\x7b\x3e\x82\
-\x6b\x83\x7a\xf1\x33\x9f\x81\x85\x33\x67\x0c\x3c\xa7\x30\x02\x97\
-\x01\x96\x38\x60\x39\x70\x99\x7d\x54\x03\x26\x09\x8c\xf0\xc1\xa2\
-\xe8\xf7\x7e\x0f\xd8\x1b\x6f\x00\xdf\xdc\x04\x0f\x2d\xc1\x27\xb5\
-\xae\xe2\x23\xc1\xff\xf3\x7b\xdf\x83\xd8\x01\xcb\x55\x04\x76\x51\
-\x2e\x13\x99\x44\xd2\xee\x54\x80\xe9\xfe\x55\x7d\x97\xce\xcb\x8e\
-\x48\x0e\x8a\x81\x09\x31\x94\xe3\x41\xa7\x70\xea\xf8\xe5\xd1\xdb\
-\x97\x59\x17\xe3\x48\x33\x0c\x2d\x3c\xf7\x4d\x61\xbf\x9d\x0b\xa4\
-\xda\xab\xb8\xbc\x9c\x79\x8a\xd4\xc6\x21\x6c\x09\xa6\x51\x07\xaa\
-\x54\xbe\xfc\xb2\x8d\x49\xd6\xb5\xf2\x31\x30\xff\x9c\x8b\x53\xbe\
-\x4d\x02\x13\x90\x57\xe2\x18\xba\xdf\xf9\x0e\xac\xbf\xfe\x3a\x54\
-\x6b\x35\xed\x29\x6f\xe3\x63\x70\xd7\x6d\xed\x67\x5f\xc3\xbd\x8f\
-\x7b\x8d\x19\xc3\xbd\xc1\x9d\xbb\x7e\xc9\x4d\x7a\xa1\xfa\xd4\xe6\
-\x4f\xf4\x07\xd7\xc8\x06\x64\x69\xee\x4d\x0e\x30\xd8\x55\xaa\x52\
-\x27\x70\x13\x50\x2a\x49\xec\xd0\xcc\x3e\x11\xaa\x5f\x50\x45\x91\
-\x2d\x27\x6c\x40\xcf\x64\x45\x8f\xce\xc5\x8c\x18\x51\x8c\xb1\x59\
-\xd6\x99\xbb\xc8\xd9\x4f\x59\xcd\x4c\x28\x5b\x9c\xc3\x9d\x4e\x07\
-\x14\x9a\x9c\x40\x16\x0e\xd6\x8c\x2f\xcb\x2d\x6c\x9f\x12\xc7\x51\
-\xec\x41\x9a\x34\x99\x17\x98\x44\x22\x94\x0e\x7c\x42\xa8\xf9\x21\
-\x83\xbd\x03\x63\x60\x14\x15\xc7\x66\x2d\x06\x28\x15\xaf\x75\xec\
-\x04\xc1\xd4\x48\xc4\xce\xaa\xd8\xc9\x81\x05\x04\xda\xc7\x6c\x8b\
-\x8b\x0d\xe6\xb9\xac\x58\x65\x0c\x06\x6f\xbe\x69\x5c\x16\xc0\xd9\
-\x8c\x58\x27\xf6\xf5\x25\xd9\x84\x92\x3b\x4f\x58\xb3\x05\x33\x9a\
-\x03\x69\x2d\x3f\x9c\xb4\x8b\x9a\x9e\x54\xd0\x71\xb0\xa3\x13\x89\
-\x34\xa2\x38\x42\x5d\x34\x37\x58\x92\xbc\xe6\x00\xce\x18\xd2\x85\
-\xe1\xa8\x4f\x43\xba\x48\xaa\xd7\x76\x38\x4f\xc5\x24\x10\x4b\x33\
-\xb5\x65\x0c\xa1\x89\xc9\x85\xd5\xe8\x4d\xbf\xff\x7d\x88\x5f\x79\
-\x25\x17\xcc\x09\x66\x11\x4d\xe2\xbe\x0b\xe8\xbe\x33\xa1\x31\x96\
-\xef\x57\x2a\xd7\x9f\x01\xe5\xcc\x81\x27\x53\x2a\x93\x38\x32\xa3\
-\x90\xfd\x31\x95\x6c\x5f\xb8\x48\x74\x26\x6e\x07\x8a\x81\xe2\xa0\
-\xf4\x6e\x4f\xb1\x65\xe4\xa0\x75\x94\x07\x98\x9f\x1b\x34\x8f\xd0\
-\xd6\xeb\x97\xef\xf4\x7a\x8c\x4a\x15\x65\xc0\xd9\xa9\x29\x9d\x39\
-\xe3\xc9\x85\x2b\xb4\x39\x84\x3b\xf8\xfd\xdf\x07\xf9\xad\x6f\x01\
-\x8f\x63\x7d\x3e\xa3\x4c\xbc\xb3\x03\x11\x06\xf5\x57\x7e\xf9\x97\
-\xe1\x06\x40\x2e\x89\x38\x60\xd9\x3e\xdb\x0a\xdb\x92\xe5\x40\x66\
-\x14\x9b\x31\x39\x95\x94\x62\x32\xce\x21\x9a\x58\x4c\xe6\xa1\x97\
-\x72\x6e\x5f\x3b\x1f\x2b\xdb\x9d\x80\x51\x71\xc0\x60\x09\xfb\x52\
-\x34\x3c\x95\x27\x00\x4a\xfa\x70\x88\x65\x3c\x96\x5d\xbe\xba\x78\
-\x29\xbd\x76\xcd\xeb\x4f\xfe\xca\x51\x92\x63\xd3\xa8\x03\x0d\xf5\
-\xac\x41\x0a\xf7\xec\xb1\x7e\x18\xb3\xf7\xb5\xaf\x41\x11\x4b\x8b\
-\xf0\xe8\x51\x10\x18\xd4\x6f\x5c\xba\x04\x1b\xe8\xba\xb7\xb2\x8a\
-\xd8\x3f\xee\x75\x0a\xc8\x26\x8b\xd9\xb1\x30\x6b\x59\xb5\xb9\x82\
-\x3c\x57\x40\xcb\xe9\xf3\xad\x8b\x73\x4e\xeb\xc6\x26\x31\x11\x1f\
-\x73\xa9\x14\x89\xbf\x62\x89\x02\xd5\x64\x9c\x5d\x4a\x05\x34\x93\
-\x88\x6d\x1d\x08\xb0\x5e\xaf\x27\x38\xce\x2c\x6a\x26\xeb\x6b\x2f\
-\xc3\x8b\x2f\xa7\xed\xf1\xd8\x5f\xe6\xdc\xc4\x2f\xcf\xa3\xc2\x99\
-\xdc\xc4\x7e\xf0\x4c\xac\x89\xb0\xac\x69\x5f\xbc\x08\x70\xe1\x82\
-\xee\x8f\x67\x67\xdc\xfc\x76\x06\x50\x6e\x3b\x03\xdd\xb9\x64\xe6\
-\xf5\x67\x27\x8d\x7d\x10\x01\x2d\x37\x12\x9a\x9a\xf6\x0a\x4a\xa5\
-\x14\x3b\x02\x05\x6a\x0f\x7b\xc6\x2a\x85\x18\x38\x0c\x30\xa6\x97\
-\x2c\xc0\x03\x13\x49\x10\x40\x85\xf9\xbe\x04\xcf\xbb\x89\x89\xe4\
-\xd8\x3c\xa9\x0d\x2d\x11\x02\x12\x07\x2f\xf3\xed\x0a\x53\x6e\xb8\
-\x62\x35\xab\x0a\xb7\x9d\x07\x97\x03\x9b\x99\x7d\x71\x71\x2c\x0f\
-\x2c\xab\x6a\xdb\x3a\xf8\xd9\xd7\xcb\x28\x0d\x72\x8a\x34\x60\x43\
-\xa5\xa0\x78\xe2\xf8\x5d\xec\x1b\x92\x18\xa5\x82\xbb\x8c\xab\x80\
-\xa5\x22\x02\x26\xd3\x5c\x0c\x9c\x35\x37\x28\x84\x60\xa9\xc7\x5f\
-\xeb\x02\x48\x52\x5d\x4c\xa3\x8f\x6c\xe1\x6b\xe3\x90\xcb\xae\xce\
-\x85\xdc\x71\x6e\xdb\xee\x9f\x19\xc3\xd2\x89\x6a\xc7\xd8\x0e\x39\
-\xd7\x36\xa2\x16\xb7\x47\x68\x63\x32\xce\xad\xb9\xb8\xe6\x5a\x6d\
-\xc9\xc4\xd2\x89\x09\x32\xcf\xd3\xad\xb4\xdb\xbe\x0f\x6a\xf2\x67\
-\x13\x21\x63\xba\x52\xc0\xc9\x93\xf4\xd4\xa7\x3e\x79\x23\xfc\xc8\
-\x87\x37\x10\x6d\x8f\x31\x7a\x59\xb6\xc7\x24\x0c\x30\x29\x96\x18\
-\x2b\x0d\x0e\x15\x03\x39\xef\x0d\x94\x2a\x36\x79\xb5\x7a\x69\xbb\
-\xd7\x17\x89\x94\x5c\x92\xfb\xda\x8c\xec\x14\x97\x2f\x19\x9c\x7b\
-\x38\xa5\xe4\x55\x66\xd4\x6a\x81\x5a\xd0\x2e\x6e\x65\xcf\xcf\xbb\
-\x64\xa6\x85\xe9\x21\x9a\x73\x59\xdd\x5a\x23\xe5\x78\x93\xc7\xf7\
-\x0a\x9c\xab\xf2\xdc\x9c\x28\xae\x2c\xa7\xde\x42\x33\xe5\xad\x56\
-\xec\x35\x1b\x1d\xe5\xfb\x03\xfa\xfe\x14\xa8\x2d\x00\x76\x0d\x4f\
-\xec\x80\x14\x21\x02\xbf\x0d\x32\xdd\x53\xaa\x97\xe6\x01\x66\x7f\
-\xce\x49\x7e\xf9\xcb\x5f\xd6\xeb\x49\xc2\x76\x78\x6b\xfe\x52\x74\
-\xf3\x56\x30\x56\x8a\x3a\xf4\xb7\x98\x9a\x31\xb1\x8b\x45\x33\x40\
-\x89\x7c\xf1\x6b\x54\x68\xa0\x9b\xf5\xbc\x7b\x5a\x97\xcd\x82\x73\
-\xe0\x2d\x18\x07\xcf\x26\x02\xe7\x86\x06\x94\x99\xf6\xa2\x32\x4a\
-\x56\x16\x5a\xa9\xbf\xb4\x98\x7a\xad\x96\xe0\x0b\xcd\x3d\x36\x57\
-\x13\x0c\xc0\xce\x26\x74\x15\xd3\xeb\x94\x65\x29\x71\xbc\x0d\x8c\
-\x0d\x14\x15\xc3\x0c\xda\x82\xa9\x77\x3c\x29\xfa\x11\x3a\x43\x41\
-\x36\x78\x1e\x60\xfe\xfe\x48\x5a\x28\xcc\x03\x9d\x1f\x3c\x70\xff\
-\x95\xf1\x6b\x6f\xa8\x0e\xd2\x9c\x43\x70\xa9\x9d\x8d\xc9\xc7\xa3\
-\x7c\x96\xb5\xee\x69\x6b\xab\x2c\x30\xe3\xce\x59\xd8\x79\x68\x6e\
-\xdb\xc6\x2c\xd7\x67\x4b\x25\xb4\x90\x0c\x37\x4a\xe5\x8a\x28\xad\
-\x2c\x11\x28\xb4\x79\xc1\x17\xe7\x77\x59\x18\x4a\x37\xee\x65\x3b\
-\xd9\x31\xb0\xda\x46\xe2\x66\xb4\xc8\xe0\x2a\x48\x99\x62\x1b\x81\
-\x62\x6d\x05\xf2\x32\x97\xec\x36\x97\xd0\x17\xd2\x63\x81\xdc\xd9\
-\x6b\x77\xfb\x89\x0f\x3f\xc1\x22\x2b\xc5\xeb\x58\x14\x77\x76\x01\
-\x5a\x25\x72\x5f\x29\xb3\x4a\xcb\x83\xb4\xf5\x5c\x06\x12\x9a\x5b\
-\xa7\xd6\x9d\xeb\x80\xe4\xb7\x33\xe6\x4d\xdc\x30\x40\x2b\x92\x0b\
-\x36\x1b\x69\xb8\xbc\x94\x72\x04\x85\xb0\xf6\xf8\x7c\x23\x01\xce\
-\x67\x80\x82\xad\xa9\x60\xcf\x70\xb9\x05\x76\x4e\x50\xd7\x4e\xec\
-\xba\x86\x08\x6c\x0c\x0a\x62\xc5\xc4\x5b\x4c\xc0\x48\x78\x3c\x52\
-\xd2\xdb\x13\x42\xb4\x6b\xb5\x82\x2a\x95\x5a\x07\xbb\xb0\x7d\x00\
-\x3d\x8a\x22\xcc\xc4\x41\x05\x08\x47\x18\xbc\xd9\x1b\xb2\x4f\x2e\
-\x48\xc9\xee\xe5\xa2\x64\xc9\x8c\xe1\x98\x05\x67\x8f\x9f\xa5\x34\
-\xc1\xb9\x39\xc7\xc6\x2b\x02\x46\xa0\xd0\x4a\x85\x82\x2c\x2e\x2e\
-\x90\x0b\x1a\x58\x0b\xf3\xbb\xbc\x5a\x11\x19\x55\x39\x50\x0e\x96\
-\x03\x78\xdb\xdd\x11\xe6\xc0\x19\xdc\xb0\x47\x33\x05\x9b\x66\x8f\
-\x92\x08\x55\x70\xc5\x36\xa9\x6c\x11\xe0\x25\x00\x49\x4f\x25\x7c\
-\xcb\xf7\x23\x5c\x2f\x44\xbb\xbb\x7e\x5a\xaf\x43\xfa\x9e\x0a\xbc\
-\x78\xf1\xa2\x7a\xec\xb1\xc7\x74\x22\xe1\xbc\xd2\x80\x4a\xf9\x42\
-\xbf\x3f\xf8\x69\x01\xe0\xcb\x8c\x9a\xb2\xe0\x64\x36\xd3\x3a\x68\
-\xd9\xe4\xe0\xdc\x19\x4d\x2b\x06\x5b\x0a\xec\x65\x5c\x2f\xd5\xaa\
-\xa2\xb0\xbc\x9c\xf0\x85\x79\x81\x81\x9d\x02\xfc\x2e\xf3\x03\x37\
-\x61\xc2\x00\x61\x31\x3b\x2b\xb4\x9d\x71\x46\xa6\x6e\x31\x60\x66\
-\x17\x1d\x09\x0c\x41\xd9\x85\x51\x27\xc1\x01\x39\x71\x7b\xc9\xe0\
-\xa6\x3e\x4a\x60\x2f\x97\x0a\x04\xdc\x94\x28\x20\x15\xf8\x7a\x90\
-\xc5\x95\xec\x44\x51\x12\x95\xcb\x32\x0d\xc3\xf2\x08\x7f\x2a\x46\
-\xd5\xeb\xff\x0d\xde\x13\xe0\xb9\x73\xe7\x04\x02\x0c\xc6\xe3\x82\
-\x2a\x14\x84\xf2\xea\x8d\x4b\xa3\xbb\xdb\x5e\x62\xe3\x99\x51\x0b\
-\x99\x83\x77\x8f\x2c\x9a\xba\x61\x94\x86\x06\x54\x32\x28\xa5\x3f\
-\x7c\xd9\xf7\x55\xb1\x35\x9f\x06\xda\x05\x09\x56\xb3\xc7\x9b\x0d\
-\x3c\x8c\xa9\xac\x0b\xda\xc9\x4e\xb6\xe5\x58\x69\x90\xb7\x49\xa5\
-\x6e\x51\x37\x94\x86\x64\xce\xc7\x7d\x9b\x08\x83\x69\x74\x12\x6e\
-\x66\x2b\x0c\x76\x5b\x4a\xc9\xdc\xc4\x2f\xdb\xa6\x2a\x59\x79\x4a\
-\x16\x80\x26\x91\x87\x98\x6d\x2b\xa9\x50\x05\xe9\x79\x22\x05\xa8\
-\x47\x04\x8f\x7e\x57\x90\x26\xc1\x0f\x15\x03\xe9\x37\x45\x1f\x7d\
-\xf4\xd1\x42\x1c\xc3\x8e\xb7\x7e\xf4\x6d\xf5\xf6\x25\xd6\xa5\x7b\
-\x0f\x52\xc2\x04\xa4\x73\x3b\x34\x82\x44\x35\x5a\x44\x7d\x68\x36\
-\xc0\xfb\xd8\x57\x2e\x15\x65\x69\x79\x09\x55\xd5\xd2\xaa\x42\x75\
-\xf5\x78\xb9\x94\x1a\x1e\x5a\x4e\x06\x16\xc2\xb3\xca\xa2\x5e\xa7\
-\x1c\x75\xcb\x92\xb3\xaa\xd2\x21\x9f\x53\x03\x9b\x59\x77\xa5\xfd\
-\x29\x70\x45\xe0\x38\x23\x58\x6e\x0e\x5e\xbf\x45\xdb\xe6\x73\xb3\
-\x2d\x76\xa5\x34\x77\xfc\x82\x24\x50\x31\x66\xdf\x7e\x59\xa8\x72\
-\x3f\x55\xd5\x6a\x35\x42\x31\xc1\xd9\xb3\x67\x25\xc2\x53\xb4\x1c\
-\x6a\x3e\xd0\xdd\xe9\x1a\x2a\x29\xeb\xc2\x3f\xb9\xfe\x46\x58\x2c\
-\x5e\xb8\x21\xc4\xfd\xad\x38\xe6\x74\xe5\x63\x54\xd3\x98\x94\xe5\
-\x7b\x2a\x05\xc6\x74\x70\xf7\x3c\x55\xc6\xf2\x80\x54\x85\x71\x0a\
-\x95\xb5\x80\xc0\x1a\xbb\xe0\x07\xf6\xae\x97\x8d\x55\x68\x4c\x11\
-\x28\x96\x8d\xbf\xb7\xb5\x02\x27\x2a\xe6\xa8\x2a\xba\x38\xa3\x4a\
-\x6a\x1d\x2c\xe2\xa3\xd0\xe5\xa6\xcf\x97\x04\x0b\x94\x76\xd0\x04\
-\x41\x61\x03\x62\x02\xde\x97\xf1\xde\xf4\xa3\x30\x52\x16\x86\x00\
-\x0e\xc7\x4e\xe9\x4e\x44\x3a\xad\xd5\x6a\x6a\xa9\xbc\xa4\xce\x5f\
-\x3d\x2f\xf0\xe7\x61\x14\x02\x24\x03\x82\x77\xc8\x9f\x00\x75\x3f\
-\x89\x47\x8f\x31\xe0\xd8\xaf\xee\xfb\x62\x4e\x5c\xbe\x76\x76\xf4\
-\xfc\x0b\x7f\x18\xa5\xe9\xfc\x64\xca\x3e\x0e\x9a\xcd\xbe\xbf\xbc\
-\x20\x35\xa8\xc5\xd6\x90\x37\xea\xf6\x2f\x49\x89\xe7\x0e\x30\x5a\
-\x67\xf6\x4d\xb7\xf7\xbd\xc9\xad\x29\x70\x8c\x5c\x10\xc0\xc1\x12\
-\x52\xdd\xb0\xeb\x00\x5c\xab\xca\xc1\xf3\xee\x58\x15\x18\x57\x94\
-\x6d\x7d\xce\xe4\x31\xb4\x18\x61\x95\x33\x23\x2a\x82\xe5\x96\x12\
-\xc1\xca\x2c\x27\x52\x1d\xba\xe8\xdf\x33\xe7\xc4\xbe\xa4\xaa\xde\
-\xd7\x6f\xa8\x3e\xf5\xd4\x53\x1e\x00\xfd\x5d\xf3\x62\x58\xad\x7a\
-\x0d\xcf\x0b\xe7\x14\x67\x67\x64\x7b\xe7\x34\xf3\xfd\xa2\x57\x9f\
-\x3b\xa6\x18\xcc\x33\x05\xab\x0a\xd8\x90\x01\x84\x0a\x54\x71\x72\
-\x03\xb8\xad\x6f\x08\xd2\x06\xc6\x2a\x07\x89\x16\x0b\xc6\x12\x30\
-\xe0\x80\x3b\x17\x74\x57\x6e\xe2\x95\x43\xa7\x43\x5c\xdb\xae\x87\
-\x68\x12\x61\x65\x41\x75\x11\x50\x41\xbf\xfe\x06\xf4\xe2\x13\x79\
-\x50\x6e\xd0\x00\xcf\xc8\x67\x74\x6b\xfe\x37\xeb\xd7\x7b\xdf\x17\
-\x40\x86\xcb\x17\xbf\xf8\x45\x3f\x8e\x63\x6f\x75\xb5\x5e\x97\x92\
-\xd7\x94\x0a\x0b\x3c\x50\xf7\x31\xa9\x16\x14\xe3\x67\x00\x64\xca\
-\x18\xf6\x03\x2c\xd2\xe8\x08\xb7\xbb\x3a\x7e\x03\x33\x2a\x44\x18\
-\x5c\x5f\xb4\x83\x07\xd2\x0e\xe2\xb1\x93\x65\x83\x3b\x08\x75\x07\
-\x1c\xd9\xb6\x7d\x56\x27\x9e\xa8\x2a\x13\x5e\xc4\x10\x61\x35\x73\
-\xaa\xda\xb0\xa8\x60\x03\x61\x9d\x9d\x86\x95\x81\x33\xf3\xf7\xa2\
-\xdf\x3f\xc0\xd9\x2a\x3c\x7e\xfc\x78\x10\x86\x49\x55\xca\x52\x05\
-\x7c\x38\xc6\x84\x9c\x57\x5c\x47\xf1\x75\xa5\xa0\x86\xac\xc9\x63\
-\x06\x00\xd2\x47\x2a\x21\x43\x70\xa4\x38\x8e\x3b\x24\xb6\x3a\x0b\
-\x7a\xb3\x40\x39\x58\xb4\xd8\xc0\x0e\x39\x17\x24\x48\x43\xa7\xac\
-\x59\xaa\x7a\x26\x03\xea\x40\x55\xfd\x33\x03\x74\xb1\x10\x83\xa9\
-\xd7\xef\xf7\x03\xce\x79\x9d\x94\xe5\xfb\x6a\x09\x95\x57\x4d\x11\
-\x9e\x67\x8e\x2b\x0a\x25\x6a\x48\xcc\x93\x4a\xde\xe5\x92\x7b\x04\
-\x4c\x29\xec\x00\x75\x87\xe2\xd4\x41\xb0\x0e\x13\xab\x36\x08\x95\
-\x86\x75\x0e\x48\x59\xd8\x22\xac\x73\xd2\x50\x3b\x58\x55\xff\x9f\
-\x00\x66\x7f\x26\x94\x7e\x6f\x6b\x69\x69\x29\x10\x78\x95\xc5\xa2\
-\x2c\x28\xe5\xb5\x94\x22\xef\x62\x75\xb4\x50\x4a\xbe\xc7\x58\x1a\
-\x32\x93\x90\xb9\x10\xbc\x03\xa1\x89\x53\x90\x89\x55\x07\xc1\x3a\
-\x61\x51\x51\x57\x4e\x59\x87\x51\xd5\x07\x0b\xa0\x83\xa8\x7f\x2e\
-\xb4\xd9\x6c\xf2\x46\xa3\x51\xec\x97\xfb\xaa\x1e\xd5\x4b\x63\x3e\
-\x0e\x0b\xa2\x10\xa0\xc2\x52\x11\x08\xaf\x84\xc7\x45\x11\xa3\x04\
-\xd9\x03\x1a\x04\xc6\x09\x33\xf1\x2a\x0f\x6b\x56\x60\x87\x7d\xb1\
-\xea\x77\x49\x55\x1f\xb0\xe5\xff\x00\x3d\x7e\x30\x08\xf1\xa5\xcf\
-\xdc\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x22\x2b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x50\x00\x00\x00\x4f\x08\x06\x00\x00\x00\x7c\x91\x42\xe3\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x21\xa8\x49\x44\
-\x41\x54\x78\xda\xed\x7c\x5b\x8c\x1d\xc7\x79\xe6\x5f\xd5\x97\x73\
-\xce\x9c\x99\xe1\x90\x43\x91\xd4\x50\xb6\x24\x5a\x90\xec\x30\x8e\
-\x6f\xb2\x8d\xcd\x06\x01\x1d\xe4\x82\xdd\x38\x70\x10\x58\x8a\x6d\
-\x24\x59\xf8\x45\x59\x04\xd8\x3c\xe4\x21\x97\x97\x88\x4a\x90\x04\
-\xc8\x43\x80\x18\x81\xe1\x20\x70\x2e\x0f\x41\xb0\x11\x62\x20\x41\
-\xbc\x36\xec\x35\x2c\x44\xb1\x15\xc7\x6b\x6b\x0d\x99\x8b\xb5\x6c\
-\xd2\x22\x29\x0e\x87\x1c\xce\x0c\xe7\x76\x4e\xdf\xaa\x6a\xbf\xbf\
-\xfe\x53\xac\x69\x36\xe7\x1c\xcb\xca\xcb\x62\xb7\xc8\x7f\xaa\xba\
-\xbb\xfa\x52\xdf\x7f\xad\xbf\xfa\xb4\x72\xce\xd1\xff\x2f\xdf\x7f\
-\x49\xe9\x75\x16\x85\x42\xed\xe2\xb7\xc1\x18\x4b\xff\x0f\x14\x96\
-\xc0\xd7\x03\x9c\x3a\x7f\xfe\x3c\x5d\xb8\x70\xc1\x83\xb6\x7e\x76\
-\x5d\x9d\xa3\x73\x14\xcb\x73\xf8\xe7\x2b\xba\xef\xbe\xfb\xee\xdc\
-\xe8\xd9\x67\x9f\x7d\x2d\xe0\x2a\x3a\x4f\xf8\x1f\x0b\x6e\x29\x0c\
-\xfa\xbf\x0d\x40\x85\x02\xc0\x14\x03\x76\xf6\x2c\x25\x1b\x1b\xa7\
-\xd4\xf2\xf2\x72\x72\xf3\xe6\x4d\x9d\x24\x89\xde\xdd\xdd\xad\xe8\
-\x21\xc2\x7f\x29\xaf\x84\x3f\x28\x0b\x0b\x0b\xdf\xd3\x8d\x5e\x7a\
-\xe9\x25\x13\xda\xcc\x0b\x61\x48\xa7\x44\x06\x79\x0e\xbd\x1e\x06\
-\x75\x8b\x43\xf9\x37\x04\x30\xaa\xe9\x13\x4f\x3c\xa1\x8f\x1e\x3d\
-\xaa\x87\xc3\x61\xca\x80\x71\xa9\xeb\x3a\xe3\xba\xd7\xeb\x25\x68\
-\xab\x2c\xab\x5b\x2a\x5d\xe7\x99\xa3\x7d\xa2\xa2\x28\x46\x83\xc1\
-\x60\xe6\xcd\xc6\xe3\x71\x3c\x7f\x99\x68\x6e\x3c\x77\x67\x1b\xe7\
-\x97\x91\x35\xf8\xdb\x61\xce\xec\xb2\xb6\xb6\xd6\x84\xf6\xfa\xfa\
-\xba\x92\x56\x9b\x09\x67\xcf\x9e\xf5\x35\x84\xc5\xcd\x00\x74\x36\
-\x80\x0a\x25\x00\xb7\xb8\xb8\x98\xcf\xcf\x97\x00\x6a\x71\xd8\xef\
-\xab\x3e\xf5\x7a\xd9\x7c\x96\xd6\xd7\xae\x6d\x50\x36\xcc\x32\xaa\
-\x08\x92\x68\xee\x3c\x14\x40\x76\x15\xd7\x26\x71\x69\x6a\xd4\x60\
-\x30\x87\xad\x9c\x8c\x19\x61\x3b\x75\x4d\x23\xc2\xb6\x59\xed\xdd\
-\xce\x2b\x01\x3e\x96\x21\x1d\x64\x48\xd3\xe4\x77\x8e\xf3\xb9\x44\
-\x23\xfc\x23\xca\xea\x0c\xed\x99\x0c\x9a\xcd\x2c\x29\x25\x34\xca\
-\xad\xae\xae\xba\x95\x95\x15\x07\x4d\x73\x0c\x26\x03\xc9\xe5\xfb\
-\x02\xf0\xc9\x27\x9f\x4c\x18\xbc\xfc\xb3\x9f\x7d\x37\x86\xf0\x5f\
-\x96\x4f\x9e\x7c\x37\x50\xad\xac\x73\x45\x43\xaa\x50\x79\x56\x42\
-\xfc\xea\x74\x6e\xce\xa6\xbd\x5e\xa3\x7b\x79\xa3\xb3\xac\x4c\xf2\
-\xbc\xce\x92\xf4\xd6\xb5\x4b\x17\xd7\x74\xde\x2b\xf2\xe1\xb0\xcc\
-\x96\x16\xeb\xfe\xc2\x42\x99\x0e\x87\x63\x1a\x0e\x47\x6a\x7e\x38\
-\x76\x4a\x59\xf0\x28\xc9\xb2\x4c\x67\x4a\xe3\x79\xac\x03\x70\x64\
-\x95\x75\x04\x7c\x57\xd7\x6f\xae\xba\xaa\x04\xe8\xc9\x01\xc6\x18\
-\xc7\x35\x98\x63\xa9\x12\x46\xe5\x39\x91\x49\x13\x95\x34\x89\x8b\
-\x0c\x6a\x14\xc8\x69\x6d\x77\xe9\x90\x52\xd7\xc2\x18\xdc\xdf\x55\
-\x79\xe5\xb2\x32\x73\x28\x0d\xc8\x82\x21\x35\xe4\xdc\x5e\xb8\xb0\
-\x5f\x07\xb3\x20\x40\xce\x04\x30\xda\xbb\x8d\x8d\x8d\xcc\xbd\xf0\
-\xc2\xa9\x07\x8f\x1e\xf9\xf6\x4f\xfe\xa7\x8f\xa4\x4b\x10\x3d\xd5\
-\xeb\x11\xc6\x49\x94\x67\x04\x00\xc8\x5a\xb6\xe8\x8a\x8c\xb5\x20\
-\x87\xc1\x36\x64\x6a\xe3\x6a\x63\x54\x83\xc1\x37\x75\xa3\x8c\x31\
-\xe4\xf0\xcf\xd6\x0d\x35\x55\x4d\xab\xff\xeb\x02\xea\x0a\xfd\x6a\
-\xa3\xb5\x6e\xd2\x2c\xaf\x75\x9a\xd5\xa6\xa9\x2b\xf4\x2f\x8d\x05\
-\x83\x9c\x41\x0d\x41\xd3\xba\x72\x8a\x6a\x52\xba\x34\x64\x0b\x52\
-\x49\xa1\x52\x5d\xdd\xba\x7c\xe5\x12\x65\xe9\x58\x25\xc9\x58\xf7\
-\x7b\x65\x0a\x86\xe4\x73\xf3\x45\xd3\xef\x8d\x68\x38\x37\x52\x0b\
-\x0b\x85\xb1\xc6\x29\x9c\x98\x12\xd0\x46\x9b\x7c\x6d\xc9\xe0\x06\
-\xd8\x56\xd6\x36\x9b\x5e\xc2\xc1\x84\x04\x60\x13\xf5\x2c\x4a\x55\
-\xa5\x95\xe9\xdb\x7e\xb1\xbf\xbf\x6f\x60\x9e\xcc\xce\xce\x4e\xb5\
-\xb5\xb5\x65\x19\xc8\x00\xe2\xcc\x30\x46\x9c\xc5\xd9\x64\xf3\xc6\
-\xda\x2f\xbd\xeb\x43\x3f\xa7\xcf\x68\xad\x54\x59\x90\x77\xbf\xbd\
-\x3e\xe9\xbc\xcf\xfa\x44\x2a\x4d\x15\x65\x3d\xd4\x1a\x04\x50\xad\
-\xf5\x2c\xf0\x1d\x8d\xe1\x6d\x06\x5a\xc8\x39\x4f\xf6\xdf\xbd\x97\
-\x4c\xd3\x90\x6b\x20\x32\x4a\x43\xc7\x93\x9e\x30\x03\x88\xad\x5d\
-\x27\x00\x0e\xe0\x6b\x66\x8a\x03\xaa\x54\x97\xb5\xab\x01\x78\x59\
-\x14\x54\x56\x25\xda\xb5\x2a\x8e\x2f\x53\x55\x16\xaa\x84\x2a\x1a\
-\x30\xc6\x02\xed\x66\x6b\x8b\xc0\x03\xda\x59\xbb\xc1\xcc\x71\xb8\
-\x60\xad\x14\x04\x11\x5a\xe3\xea\xa6\x30\x44\x25\xa4\x72\x0c\x11\
-\x1b\x01\x89\x31\x13\x18\x54\x82\x8a\x1a\x44\x69\xb2\x97\x9c\x39\
-\xf3\xdc\xe0\xd1\x87\xbf\x0e\x7b\xc4\xb6\x1d\xbb\xf5\x98\xed\xfe\
-\xd6\xca\x96\x39\x7f\xf6\xbc\x53\x32\x0e\x37\x05\x40\x71\x18\xa8\
-\x92\x6d\xda\xee\x3b\x52\x0f\x2d\x1f\x59\xc0\x6d\x0a\x96\x61\xdc\
-\x2b\xc1\x11\x00\x87\xc1\x2a\x06\xc8\x39\xdf\xa6\x12\x17\x4e\x34\
-\x61\x8b\xd0\x89\xd0\x00\x59\x5f\x43\x3b\x49\xcf\xcf\x73\x43\x3c\
-\x9d\x3f\xee\x18\x40\x22\x8b\x6b\x54\x46\xfa\xdb\x86\xe6\xd1\xcf\
-\x19\x2b\xc7\x9c\xc5\x45\x51\x41\x9a\x9d\x01\x48\x45\xc9\xfb\x41\
-\xdc\x1e\x93\x2b\x21\xc5\x78\xae\xc6\x5a\x06\x8c\x1a\xf4\x61\xdb\
-\x5a\x9f\x5e\x61\x20\x55\x05\x1d\xb5\x8e\xf2\xca\x9a\xb9\x1a\xe0\
-\xd7\x00\x7a\xb4\xbb\x4b\xcc\x8c\xa2\x06\x15\xa5\xad\x9a\x06\xb7\
-\x37\x0e\x7d\x5d\x59\x1a\xb5\xf3\xaf\x5f\x7d\xaa\x78\xf9\xe5\xff\
-\xda\x7f\xff\x7f\xf8\x58\x32\x48\x46\xb5\xad\x37\xfb\x49\x53\x9c\
-\xa5\x53\x25\x84\xaa\x80\x66\xb2\x23\x3a\x1c\x40\x85\x72\xee\xdc\
-\x39\xf5\xd0\x43\x0f\x69\x5b\xd9\x0c\x9b\xf3\x29\x39\xe6\xa3\x07\
-\x06\x2a\x03\x4a\x7d\x4d\x00\x46\x31\x33\x2a\x0c\x8c\x7c\x5b\x00\
-\x53\x8e\xb1\x13\x70\xc4\x97\x91\xdb\xda\x94\xda\x4e\x80\xc3\x00\
-\x60\xf0\x84\x01\xb9\x98\x05\xfc\x11\xf0\xac\x61\x5d\x13\x09\x16\
-\x00\x51\x33\xa8\x35\xc8\x08\x19\xa6\xc6\x33\x82\xdd\x4a\x0a\x3f\
-\x96\xab\x84\x2c\x41\x72\x75\x89\xd3\x45\x5d\xad\x07\xdc\x90\x05\
-\xd8\x96\x25\x55\x11\x19\xa5\xd8\xcc\xb0\xa4\x6b\x53\xd5\xd8\x5f\
-\x07\x8d\xa0\x57\x30\xae\xaf\x6f\xde\xfe\xa0\xdd\xdd\xf9\x94\x5a\
-\x5a\x5c\xef\x59\x55\x6a\x9d\xd1\x46\x59\xc3\x43\x0f\x2b\x38\x99\
-\x04\x98\x38\x2e\xe9\x14\xe9\xd3\xc7\x8f\x1f\x4f\x7a\xca\xa4\xe3\
-\x34\x59\xf4\x12\xa6\x34\xe9\x2c\x67\x80\x01\x1e\x80\xf4\x03\x16\
-\x40\x88\xe1\x63\xc4\x2c\x93\x93\xc1\x3a\xc7\xdb\xbc\x9f\xfb\x44\
-\x80\xb8\x4f\x20\x63\xe5\x1a\x90\x0a\x67\xc3\x39\x46\x6a\x7f\x8e\
-\x15\x32\xdc\x3f\x80\x36\x01\xd0\x0a\x51\xdd\xf8\x7d\x56\xf6\x49\
-\x7b\x5c\x80\x39\x02\x18\x01\x74\x53\x14\x5e\xca\xad\x33\xa2\x21\
-\x29\x86\x9e\xcb\x58\xf8\x9f\x3c\x87\x30\xe7\x7e\x3e\xa7\xd7\x4f\
-\xcd\xf5\xf5\xf7\x65\x4b\x47\x5f\x84\xec\x27\x90\xe0\x6b\xf3\x64\
-\x47\x37\x6f\xce\xc1\x57\x26\x6e\x32\xe3\x72\x87\xaa\xf0\xa9\x53\
-\xa7\x14\xbc\xe1\xbc\x49\xf5\xa0\x9f\x65\x4b\x29\xfa\x27\xb0\x6f\
-\xec\x40\x54\x96\x8b\x2a\x5a\xc3\x83\x8f\x64\x05\x0c\xe5\x64\xe0\
-\xa1\x16\xbb\xe7\x81\x8d\xc0\xc9\x3e\x3e\x1e\x80\x92\x6b\x18\xe9\
-\x1f\x8e\xd3\x04\x48\xd6\x63\xb4\x98\xe4\xde\xda\xa2\x91\x08\x98\
-\xc2\xbe\xc9\x90\xe4\x14\x95\xa5\xde\x4c\xe8\x84\xc1\xcd\x28\xc9\
-\x72\xcf\x04\x1d\xec\x31\x8f\xa7\xa9\x3d\xc0\xf5\xad\x5b\xbe\x76\
-\x25\x4b\x6d\x60\xb6\x25\xd5\xcf\xe7\xd1\x71\x59\x2b\x7b\x0b\xa7\
-\xd4\x9a\xfa\xe3\xc1\x80\xe0\x9b\xc6\x2c\x64\x8d\x42\xe9\x00\x18\
-\x02\x4c\x18\x4d\xb5\xb4\xb2\xa4\xb3\x26\xc3\xbd\xf3\x05\xcd\x83\
-\x17\x6e\x05\xd5\x12\x80\x04\xb0\x08\x90\x6f\x13\xea\x28\x81\x24\
-\x60\xa2\xf2\x46\x2e\x82\x24\xc7\x3b\x14\xf7\x4b\x7f\x6e\xdb\x70\
-\xcc\x88\xad\x0c\xc0\x2b\x86\x96\xcd\x89\xb2\xfc\x7c\x1e\x34\x65\
-\xbc\x63\x23\x07\x3b\x07\x04\xf9\x3c\x06\x52\xc0\x01\x29\x79\x3e\
-\x96\x3e\xa1\xbc\xe7\x89\xd4\xbe\x97\xc0\x6a\xf2\xac\x00\xe1\x94\
-\x53\x6e\x4d\x39\x0d\x0d\x74\xa5\x25\xd3\x33\x3d\x5b\x8d\xc7\x0b\
-\xf5\xa5\xa3\x5f\xd1\xe7\xcf\x4f\x91\x40\xc4\x7e\x2a\x83\x87\xb4\
-\xa9\xcd\x60\x5b\x86\x29\x1e\x48\x0f\x86\x3c\x38\x19\x84\x16\x55\
-\x41\x89\x83\x8e\x12\x13\x40\x10\x20\x5b\xdb\xb1\x1d\x41\x0c\x36\
-\x2f\xf6\x11\x3b\x68\x5b\x2a\xef\xf7\x39\x26\xef\xdd\xc5\x9b\xa3\
-\x0e\xf7\xc0\xf3\x84\x7e\xd2\x66\x30\xf9\x12\x1a\xc4\x76\x5b\xfe\
-\x4d\xcc\x02\x8b\xab\x90\xd8\xd6\xc6\x9b\x00\x8b\xba\x22\x89\x06\
-\x74\x9e\xf7\x01\xf6\x03\xe8\x73\xcb\x42\x02\x12\x4a\xd6\xfa\xd6\
-\x35\x3b\x83\xdd\xdd\x33\x97\xce\x28\x5a\xf9\x99\x7b\x3b\x91\x47\
-\x1f\x7d\x54\x21\xfe\x51\x83\xa3\x03\xdd\x4f\x12\xb5\x70\xe2\xbe\
-\x05\x4d\xca\x7b\x5e\xb2\x46\xec\x05\xd5\x24\x23\xa1\x08\x1a\x4d\
-\x54\x91\x04\x00\xd1\xad\x20\x7d\x11\x5c\xd7\xb6\x95\x51\xf2\x3c\
-\x9e\x41\x85\x4c\xdb\x06\xba\x89\xbd\x94\xed\xc0\x00\x71\x22\x1e\
-\xe7\x20\xa5\x0e\x64\xe4\x9c\x00\x72\x74\x4a\x68\xcb\xb5\x05\xe4\
-\x86\x0c\xa4\xb4\xd9\xdb\xa7\x66\x34\x12\x0f\x8f\x73\x4a\xa5\xc9\
-\x97\x5e\xc6\x51\xf6\xae\x75\x6e\xc0\xb3\x55\x1c\xcb\x4c\x8a\x59\
-\xec\x46\xc3\xd3\x59\xcd\x61\x9e\xee\x7a\xe0\xb8\x0f\x52\xc7\x02\
-\x9e\x62\x9a\x90\x27\x68\x61\x87\x0c\xd4\x7b\xd0\xda\xd7\x0e\x35\
-\x88\x3d\xaa\xa8\x0c\x7b\xc9\x12\xf5\x9d\x7d\x35\x28\x6c\xa3\xdd\
-\x84\xba\x61\x92\x76\x2d\x6d\x17\xfb\x4b\x1d\xbc\xf4\xa4\x8f\x45\
-\x6d\xf9\x1c\x90\x6c\x07\x8f\x1c\xae\x81\xe3\x4c\x93\x73\x6c\xb8\
-\x56\x5d\xa1\x2d\x12\x26\xf7\x11\x49\x33\x65\xed\x41\xb3\xe3\x31\
-\x19\x10\x83\xd8\x80\x01\x15\x49\x81\x5a\xf3\xdc\x70\x81\x40\x60\
-\x08\xc7\x60\xf0\x2c\x36\x99\x9b\x9b\xf3\x02\xc6\xd9\xa7\x43\x55\
-\x78\x71\x71\xac\x52\x33\xa7\x32\x9d\x51\xd6\xef\x67\x29\xdb\x89\
-\xb9\x39\x72\x45\x21\x20\x29\xdd\x92\x40\x77\x40\x2d\x6f\x5d\x5f\
-\xa3\xe7\xfe\xdb\x67\xe9\xd6\x95\xab\xd4\x6c\x6c\xd2\xc9\x37\xbe\
-\x91\x1e\x7e\xf4\x11\x7a\xeb\xfb\x7e\x14\x42\x9c\x46\x87\x11\x0c\
-\x36\xc5\xb6\x48\x20\x53\x74\x40\x21\x18\x17\xaf\x4b\x5c\xc7\xe3\
-\x77\x24\x31\xd4\xc6\x93\x75\x51\xd2\xac\x0f\x8d\x9c\xb4\x6d\xc3\
-\xe7\x7a\xe0\xea\x02\xc0\xed\xed\x51\xb9\xb9\xc5\x21\x8e\x7f\x26\
-\x0e\xf0\x4a\xad\xbd\xa3\xe1\x80\x97\x05\x88\x14\xb4\x97\xb8\xed\
-\xb4\x31\x3e\xac\xd3\x6c\xe2\x9e\x3d\xff\xac\x9d\x32\x13\x39\x09\
-\x62\xc3\x6b\x94\xce\xb2\x54\x27\xa9\x68\xa4\x63\x09\x04\x39\x23\
-\x03\x77\x81\x64\x60\x5f\xf9\xe7\x2f\xd3\x3f\x7d\xfa\xb3\xf4\xd0\
-\x87\x3e\x44\x8f\x3c\xf5\x9f\x29\x3f\x71\x82\xca\xef\x7c\x87\xd6\
-\x3e\xfd\x69\xda\xf8\xe3\x8f\xd3\x7b\x3f\xfc\x04\x0d\x8f\x2f\x47\
-\x5b\x45\x71\xf0\x02\x62\x6c\xc7\x7d\x6d\x50\xc5\xf3\x46\x3b\x19\
-\xd4\xf7\xca\xd5\x57\x69\x15\xcc\xdb\x1f\x8d\x69\x01\x5e\xf8\xc4\
-\xd2\x12\x9d\x78\xe0\x34\x69\x52\xe1\x7c\xf4\x13\x80\x0d\x83\xc7\
-\xaa\xbb\xbb\x07\x30\x0b\xaf\xca\x86\x0d\x13\x80\xab\x40\x50\x59\
-\xc7\x3a\x87\x67\xc8\x94\xe6\xe0\xd2\xac\x79\x44\x61\xd2\xc6\xe3\
-\x52\x49\x62\xb2\x13\x48\xcb\xce\xad\x0b\x5b\x0a\x29\xa2\x41\xd3\
-\xa4\x4a\xf7\x32\x9d\xf6\x7b\x49\xc2\x31\x13\x83\x68\x9d\x48\xa0\
-\xb5\xd2\xdf\xc6\x70\xe3\xca\xa5\xef\xd2\xf3\x9f\xf9\x1c\xbd\xe3\
-\x4f\xfe\x84\xfa\xf7\xdf\x4f\xa1\x0c\x7e\xf0\x07\x3d\x55\xff\xf0\
-\x0f\x74\xe1\xd9\x4f\xd1\xe3\x1f\xfd\x25\x31\xe0\xd6\xc4\x90\xa5\
-\x65\xdb\x40\x26\x7a\x76\x80\xd3\x3e\x0e\xf2\x77\xe7\x9a\x27\xcb\
-\x50\xbf\x2f\xbc\xf0\x15\x1a\x1b\xc4\x70\x3f\xfd\xd3\x74\xf4\x81\
-\x07\xc8\x20\x34\x59\xfd\xd2\x97\xe8\xe6\xf3\x5f\xa2\x47\x70\xef\
-\xde\xa0\xcf\x9e\xd5\xab\x39\x07\xce\x15\x4b\x1d\xcf\x5c\x20\x81\
-\x86\x6b\x5c\xab\x99\x00\x58\x4a\xc6\x82\xe3\x0b\xe5\x5d\x10\x40\
-\xb4\x90\x44\x47\x26\x55\xd6\x25\x7d\xe4\x03\x18\xc8\xf3\x00\x2b\
-\xed\xe0\x07\xba\x40\xb1\xa8\xfd\x51\x0e\xb5\x63\x85\x15\xf0\x98\
-\xfb\x55\xe3\xa5\x4d\x54\x37\x3a\x8b\xff\xfe\x8f\x9f\xa1\x47\x7f\
-\xf5\x57\x05\xbc\x58\x98\x9b\xc4\x5e\xbc\xff\xe4\x93\xa4\xbf\xfb\
-\x5d\xda\xf8\xea\xd7\xe8\xd8\xdb\xde\x7a\x27\xb0\xa6\x76\x2c\xc8\
-\xa0\x46\x49\x3c\x4c\x5d\x65\xdb\xcf\x99\x3f\x0f\xa9\xef\x3f\xfe\
-\x38\x3d\xf6\xcb\xbf\xec\xc3\x97\x3b\xe5\xfd\xef\xa7\xea\x73\x9f\
-\xa3\xd5\x3f\xfb\x33\x7a\xc3\x3b\xdf\xc1\x5a\x28\x76\xb4\x2c\xc9\
-\xc0\xde\xd5\x08\xde\xab\x9d\x1d\x49\x82\xb0\xbe\x29\x75\x07\x44\
-\x9d\x26\xd0\x62\xa7\x28\x80\x88\xb3\x95\xd5\x8a\x1d\x7b\x59\x56\
-\x0a\x45\xfc\x44\x37\x81\x40\x8a\x42\xe9\xe3\xac\x1b\x3b\x43\xb6\
-\x7f\xda\x83\xd7\x88\x71\x2f\xc7\x44\x82\x59\xf8\x43\x55\x89\x09\
-\xfc\xea\x75\x7a\xe4\xbd\xef\x3d\xe8\x90\x28\xcf\x73\x4e\x15\x79\
-\x00\xc1\x35\xd2\x1f\xfc\x20\x15\x7f\xfa\x09\xbe\x4e\x4b\xf2\x22\
-\x68\xbc\x4d\x11\x38\xd4\x56\xc2\x1b\x99\x2a\x73\x6d\x62\x78\xf3\
-\xbf\x2f\x5e\x22\xbb\xb0\x40\x67\x7e\xe5\x57\xf8\x86\x1d\xc6\x0d\
-\x21\x91\xea\xfa\x75\x1a\xbd\xf0\x02\xe5\xcb\xcb\x92\x3d\x2a\x0a\
-\x0f\xa0\x61\x20\x9d\xf3\xe0\x59\x8e\x94\x19\x44\x10\xe0\xf1\x60\
-\xa3\x68\xdc\x25\xc5\x56\x02\xe4\x12\xae\x6b\x6d\xb7\x91\xf6\x52\
-\x66\xdb\xa8\xcb\x97\x2f\x1f\xee\x44\xaa\xaa\x52\xbd\x41\x8f\x4e\
-\x9e\x5e\x79\x8b\xda\xd8\x92\x20\xbf\x69\xc4\xab\x15\x15\x6b\x60\
-\x94\x16\x34\x77\x37\x36\x68\x11\x36\x47\x03\xb0\x00\x1e\x44\x9d\
-\x90\xcd\xf0\x20\x06\x00\x93\x87\x1f\x06\x3f\x13\x5c\xa7\x14\x80\
-\x9c\x0b\xb5\x07\x25\x3a\x82\x08\x2a\x49\x18\xe4\x89\x04\xd4\x3b\
-\xf6\xec\xfa\xcd\x75\xba\xff\xc3\x1f\x6e\x81\x87\xfb\x30\xd3\x98\
-\x84\x69\xbf\xf8\x8b\x64\xbf\xfa\x55\xef\x30\x1a\xf1\xb8\x5e\xfa\
-\x9a\xe0\x6c\x94\x12\xfb\x17\x40\x44\x4d\x59\xca\xb7\xdf\x56\x32\
-\x52\x4d\x64\xb4\x51\x1c\x8f\x1b\xd5\x6b\x7a\x4a\xcf\x6f\xaa\xf5\
-\xf5\x29\xd9\x18\x4e\x9c\x38\x74\x76\xb6\xe9\x03\x7d\xbe\x82\xa8\
-\xaf\x84\x2e\x22\x81\xa0\x30\xe8\x05\xce\x36\x6f\x6d\xf9\xc1\xc3\
-\x40\x30\x78\x01\xc0\x00\xa2\xa8\x32\x27\xae\xf3\x8c\x6c\x94\xc0\
-\x08\xa4\x04\xe6\xa8\x1b\x09\x0b\x63\x10\x1e\xec\x60\x94\xca\xc9\
-\xb9\x7b\xdb\xdb\x74\xea\xb1\xc7\x28\x14\x80\x16\xee\x17\x00\xf4\
-\xd1\x83\x86\x59\xd9\x84\x33\x63\xa9\x6b\x98\x38\x8c\xe1\xeb\x0a\
-\x78\x9e\x9a\x09\x78\x15\x6a\x95\x65\xce\x4b\x81\x23\xcd\x2a\xec\
-\x9c\x56\x3e\x6f\x02\xc8\xea\x7c\x0c\x10\x8f\xb3\xd8\x74\x01\x7c\
-\x16\xf4\x04\xc5\xa2\x9b\x66\xa8\xf9\x21\x94\x96\x78\x8e\xe7\x8b\
-\xa8\x7d\x91\x39\x1b\x57\x7e\x8e\x79\x1f\x7b\x5c\xa8\xca\xe2\x8f\
-\xfd\x18\x3f\xbc\x1f\x44\x00\x32\x48\xa1\x86\x14\x28\x06\xa2\x28\
-\x99\xf3\x41\x7d\xdb\xce\x43\xa4\x2d\x00\x1c\x43\x12\x1b\x3d\x76\
-\x98\xda\x2d\x0e\x06\x9c\x88\x08\x71\x6b\x87\x69\x5e\x02\x99\x31\
-\xc3\x21\xd5\x60\xb0\x41\xbb\xb6\x56\x40\xbb\x0b\xbc\x3a\xb4\xfd\
-\xf4\x2e\xe3\x81\x29\xf2\x18\xa2\x76\x4a\x5b\x67\x95\x4d\x9d\x1a\
-\x5a\x40\x37\x1e\x7b\x10\x34\xcd\x2a\x75\xd3\xe7\x8b\x20\xaf\x2f\
-\xc1\x2b\x48\x02\x64\x21\x5b\x54\x0c\x86\x8f\xa3\x1e\x7f\xcf\xbb\
-\xa8\x82\x7d\x4b\x20\x15\x00\x30\x80\xe8\x07\x33\xc0\x40\x87\x18\
-\x4c\xf1\xb1\x8f\x51\x82\xd0\x02\x92\xcc\xe7\x78\x72\x5c\x57\x12\
-\xd4\xca\xbe\x72\x12\x08\x57\xde\x63\x3a\x90\x0d\xd4\x34\x4c\x2c\
-\xad\x1e\xc4\x65\x00\x56\xbd\xf8\x22\x4b\xb7\x80\x26\x4c\xf3\xf7\
-\x43\xc0\x4b\x43\x00\x37\x64\xc0\x6e\xdf\x66\x95\x15\xa9\x6b\x81\
-\x27\x54\x47\x3b\x28\x00\x66\xb9\xf3\x39\x39\xf2\x07\xae\xd1\x21\
-\xa5\x0b\xe0\x59\x72\x58\x9d\xca\xab\x2a\x77\x98\xb5\x30\xeb\x73\
-\x58\x50\xe7\xc1\xaa\x25\xb2\x37\xa5\x1f\x94\x0c\xbe\x0e\x91\x7f\
-\x45\x4b\x47\x8f\xd1\xa3\x8f\x3c\x42\xcd\x6f\xfe\x26\xa5\xdf\xf8\
-\x06\x25\x45\xe1\x6f\x90\xe2\x78\x02\x43\xbe\x03\x0f\x9d\x90\x4c\
-\xad\x6c\x15\x67\x1d\x96\x09\x7d\x05\xa4\x4a\x6a\x9f\x28\x95\x7b\
-\x82\x62\xfe\x2f\x3a\x1d\x4f\x6f\x38\x75\x8a\xea\xbf\xfb\x3b\xd2\
-\x90\xae\xc0\xb0\xc0\x34\x06\x72\x0e\x40\x26\xff\xf2\x2f\xb4\xf1\
-\xf5\xaf\x7b\xc0\x03\x80\x40\x46\x80\x0c\x35\x83\x37\x39\xd6\x80\
-\xd8\x06\x06\x3b\x05\x1c\x9d\x0a\x60\xa2\xec\xcf\x7a\x33\x01\x9c\
-\x73\x28\x84\x31\x61\x20\x75\x4e\x3a\xb1\x54\xd6\x09\x8d\x0b\x9f\
-\xf2\x21\x1e\x18\xb9\xbb\x66\x20\x72\xb7\x15\x38\x89\xa5\x85\x45\
-\xba\xfd\xb1\x3f\x26\x33\x9c\x27\x7b\xec\x18\xed\x61\xe0\x05\xe2\
-\x32\xb5\x72\x8a\x5c\xaf\x27\xb3\x19\x27\x26\xc0\x88\x6a\xca\x35\
-\x94\x12\x7b\x27\x8e\x49\x80\x22\x29\x2e\x86\x37\xad\x63\x39\x40\
-\xbb\xff\xe4\x49\xaa\x7e\xeb\xb7\x48\x3f\xf3\x0c\x25\x6f\x7f\x3b\
-\xab\xad\x57\xe7\x1c\xfd\xd5\x37\xbf\x49\x37\x7e\xfb\xb7\x69\xdb\
-\x18\x01\x2a\x4a\x5f\x1b\xbc\x49\xdd\x80\x2c\x08\xc6\xda\x29\x49\
-\x8c\x79\x49\x54\xde\x6e\x68\xb8\x04\x07\x70\xa7\x03\x08\x07\xb2\
-\xe3\xd6\xd7\x33\x87\xd4\xba\x33\x55\xd9\xe3\x34\xbd\x1d\x8f\xbc\
-\x6a\x35\xeb\xeb\xe2\x28\xee\x78\x4e\x0a\x01\x2f\x9a\x62\xe4\x7b\
-\xf3\x43\x3a\x71\xe6\x8c\x3f\x66\x59\x6a\x72\xdc\xf1\xfe\x53\x68\
-\x3b\x51\xff\x08\x50\x68\xc7\x80\xfa\x10\xc2\x20\x3a\xfb\x82\x7d\
-\x5c\x84\xc7\x2b\x61\x36\xaa\xa7\x9f\xa6\xfe\x9b\xde\x44\x0a\xa1\
-\x54\xb3\xbf\x4f\xdb\x97\x2e\xd1\xda\x67\x3e\x43\x5b\xc6\x44\xc0\
-\x18\x20\xa2\x48\x0c\xa6\x73\x02\x5e\x00\x51\x6b\xea\x8b\x17\x26\
-\xc9\xd5\x29\xc7\x68\xe2\xe8\x8d\x24\x49\x51\xcf\x00\x70\x75\x95\
-\x6d\x6e\xee\x8e\x1f\x5f\x3a\x61\x57\xaf\x65\xbc\x34\x68\x37\x37\
-\xc9\xee\xed\x89\xf1\x6f\x4c\x18\xb4\xaf\x29\x84\x20\x12\xa8\xc5\
-\x41\x07\x90\x0c\x85\x76\xa8\x5b\xe7\xbb\x78\x2c\xee\xeb\x82\xd5\
-\xaa\xad\xac\xe8\xb1\xb7\xf4\x31\x1d\xb1\x57\x85\x1a\x6f\xae\xad\
-\xd1\xf6\x17\xbf\x48\x8d\xcc\x6b\xc3\xf5\xbb\x76\x2f\x80\xe9\x5c\
-\x4b\x32\xfd\x39\x12\x07\x16\xb2\x2e\xe1\xb8\x72\xec\xbc\x8c\xd6\
-\x4e\x9b\x92\xb2\x0a\xc2\xb5\x3c\xef\xb0\x48\x3f\xe3\xe5\x22\xe6\
-\x82\x31\xb9\x26\x15\x0d\xb9\xa4\xcf\xdb\x49\x04\xae\xef\xde\x8e\
-\x12\x13\xfb\xde\x83\x50\xba\xfb\xba\xe0\x86\x63\xc1\x81\xb0\x84\
-\x31\x88\x7e\x2a\x16\xc0\xb4\x20\xf4\xed\x02\xc7\xf5\xbd\x29\x7a\
-\xe0\x36\xb8\x60\x4c\x62\x95\x58\x40\x5c\x12\x95\x07\xcf\x38\xc3\
-\x8b\xfa\xac\xc6\x74\xe1\x70\x09\x84\xe7\x82\xa9\x2a\x5c\x2e\x6b\
-\xbe\xbd\x1c\x6e\xc4\x73\x05\xdc\x76\x5a\xb3\x07\xed\x82\xd6\x96\
-\xa2\xd8\x8e\x75\xec\xc7\x34\x0b\xb8\x28\x79\x01\x34\x99\x82\x05\
-\xa7\xc3\xdb\x45\xc1\x41\xb1\xb4\x83\x73\x69\x81\x17\xc9\x1c\xa2\
-\xba\x02\x62\x04\xd2\x84\xf8\x16\x40\xa1\x84\x05\x44\x0b\x09\x74\
-\x08\xe7\x00\x9e\x76\x3b\xa3\x9d\xd1\xe5\xcb\x41\x85\x67\x14\x67\
-\x4d\xff\x3e\x24\x58\x5d\x10\xed\x24\x09\x52\xd1\x95\xc0\x03\xc0\
-\x90\x50\xc7\xb6\xcd\x54\x57\xf2\x31\x16\xed\x03\x9c\x45\x8e\xe9\
-\xc0\x34\x1b\x42\x9a\x28\x6d\x0c\x9c\x80\x6a\xda\xe6\x24\x50\xd7\
-\xd3\xc6\x36\x28\x82\x17\xa4\x4f\xc8\x03\xeb\x4d\x5f\x9a\xda\x89\
-\xf3\x58\x65\xbe\x70\xbb\xf6\x61\x4b\x49\x53\x6d\xe0\x53\xab\x4f\
-\x25\x34\xe4\xd6\x11\x10\xf1\xc3\xf7\x52\x91\x63\x79\xe0\xb6\x37\
-\x9c\x2d\x81\x51\xea\x3a\x40\x4a\x1d\xed\xe6\x45\x38\xa8\xaf\x5d\
-\xbd\x4a\x39\x3c\xf5\xc2\xf1\xe3\xe4\xc0\xe6\x21\xd8\xff\x20\xb6\
-\xf1\x48\x7c\x7f\x89\x03\xa5\xe6\x73\xa6\x83\x17\xa5\xed\x70\x55\
-\x0e\xe0\x1d\xf0\xc2\x4e\xa6\x34\x56\x39\x61\xbf\x0f\x63\x38\x12\
-\xa9\x6b\x7f\x28\xbe\x05\x76\x48\x3e\x90\xb3\xad\xa8\x54\xc1\x0f\
-\x3a\x1a\xe7\x16\xdb\x50\x11\x59\xb5\x92\xe9\x5c\x94\x40\xa5\xee\
-\x29\x6d\xd4\x95\x36\xa1\x2e\x90\x9e\xfe\x15\xc0\xad\xe2\xba\x67\
-\xff\xe0\x0f\x68\xe1\x2d\x6f\xa1\x50\x4a\x84\x21\x37\x7f\xef\xf7\
-\xe8\x18\xa4\x6e\xae\x2c\xbb\x80\x4d\x24\x89\x02\x70\x53\xec\x5f\
-\x47\xad\x63\xdd\xe9\x47\x69\x66\xb9\x52\x24\xd2\xc7\xe3\xe6\xd2\
-\x20\x36\xe6\x30\x2f\x06\xd2\x53\x0a\x6c\x8e\x41\x78\x90\xdb\x89\
-\xea\xd4\x37\x6f\xb6\xbc\xa1\xe5\x3a\x4a\x45\x9b\xac\x8d\x1e\x53\
-\xa8\x75\x9e\x90\x6c\x5f\x45\x8c\x78\x15\xd3\xb1\xb7\x61\x96\x22\
-\xe0\xc5\xd2\x43\x2e\xef\xd8\x27\x3e\x41\x0d\x7b\x5b\x39\x27\x82\
-\xc0\xed\xb6\xd4\x75\x25\x31\xda\x3e\x3e\x3f\xb6\xef\x96\xcc\x28\
-\x85\x02\x4c\x9e\x58\xc7\xc0\x89\x82\x30\x52\xab\xb3\x67\x22\xb1\
-\x70\x34\x3f\x3f\x1a\x8d\x5c\xbd\xbf\xdf\xb7\x23\x89\x01\x5d\x35\
-\x99\x79\x44\x10\x3d\x51\x6c\xb7\x8d\x7f\xb0\x51\x4c\x02\x6a\xd8\
-\x6e\xf5\xf9\x36\xa6\x59\x6f\x42\x2e\x2f\x45\x5a\x2a\x96\x38\xb7\
-\x1d\xae\xac\xd0\xb1\x5f\xff\x75\x4a\xe6\xe7\x5b\x92\x87\xfa\x30\
-\x8a\x40\x45\xb0\x03\x98\x5d\x0a\x31\x20\x53\xcc\x4a\xb8\x49\x56\
-\xc9\x7d\xdf\xef\x48\x6b\x9d\xf0\xa0\xfb\x49\x54\x4d\xde\x0e\x53\
-\xaa\xae\x93\x90\x3b\xc6\xed\xa8\xca\xa1\xdd\x0e\x47\x40\x5c\xef\
-\x22\x7e\x7b\xe8\x6d\x6f\xa3\x50\xc2\xbc\xb6\x95\x92\x7a\xf7\xbb\
-\xa9\x41\xb2\x62\x1b\x92\x1a\x40\x9a\x09\x60\x04\x2f\x80\xd3\x95\
-\x3e\xa1\x08\x24\x48\x05\x27\x72\x8f\xe2\xc6\x6e\x17\xa0\x4e\x07\
-\x10\x0c\xa7\xdd\xdd\x46\x25\xfd\xa1\x02\x54\x03\x4d\xb2\xae\x2a\
-\xfe\xdc\xf1\xc0\x3b\x8e\x21\xd4\x28\xb1\x6e\x1f\x8b\xd9\x17\x09\
-\x41\xd8\x41\xf9\xf4\x52\x86\xeb\x25\xc3\x61\xc8\xe5\x85\x79\x6c\
-\x3b\x25\x05\xe2\x69\xe1\xd6\xc5\x8b\x44\x53\xc1\xeb\x4a\x5e\x7b\
-\x06\xd2\xee\x17\x55\x37\x1e\x57\x4c\x70\x22\x74\x48\x81\x66\xaa\
-\xd9\x12\xd8\x27\x9e\xf4\xab\xa5\xd3\x0f\x2c\xe8\x60\xcb\xa2\x2a\
-\xb6\x03\x69\xa5\xba\x20\xb6\x43\x1d\x21\x01\x4e\x02\xe0\x9d\x1d\
-\xae\x19\x44\x9f\x92\x6a\xae\x5d\xa3\x1e\xa6\x61\x07\x52\x60\xad\
-\x94\x14\x27\x26\x6e\xf3\x4c\x88\x68\x26\x19\x01\x2e\x80\xd2\x95\
-\xca\x03\xfb\x9b\x6e\x98\x83\x12\xe2\x40\x7b\x53\x29\xed\xd5\xd8\
-\x35\xce\x2f\x34\xa1\xd7\xe1\x36\xf0\x99\x67\x9e\xf1\xdb\x7b\x7b\
-\x63\x95\x19\x03\xcf\xad\x39\x92\xce\x54\x90\x1a\xa6\x68\xff\x42\
-\x3b\x38\x8c\x58\x47\x67\x22\x03\x11\x47\x23\x8b\x37\xfb\xfb\x9e\
-\x4c\x58\x09\xc3\xbe\xe3\x38\x36\xfe\xcb\xbf\xbc\x57\x36\x45\xd2\
-\x60\x90\xce\x1e\xe6\x97\x05\xa4\xcf\x11\xcd\x26\x49\x94\x76\x54\
-\xb9\xbb\xdd\x96\xbc\x20\x89\x41\x02\x19\x38\xf1\x20\x02\x5a\x4d\
-\xad\x62\xa6\x38\x91\x93\x22\x82\xf2\x82\x63\xaa\x8d\x89\x69\xa5\
-\xe0\x71\x45\xaa\xa4\x8e\xe0\xb5\x01\x96\xf3\x7c\x00\x5c\xc3\x51\
-\x54\x00\xa1\xde\xdc\xf4\x89\xcd\x06\x00\x86\x58\x6e\x19\x7d\x35\
-\xc2\x15\xc2\xc4\x3f\x95\x4c\x8a\xa7\x20\x8d\x73\x18\xd4\x0e\x12\
-\x05\xb7\xaa\xea\x7b\x01\xaf\x03\x92\x3b\x44\x7d\x8d\x68\x0e\xd7\
-\x41\xcd\x99\x44\xd2\x94\x8a\x22\xa6\xda\xf9\xc0\x10\xc6\xcc\x74\
-\x22\x36\x49\x38\xfe\xc9\x14\x03\x31\x1e\x77\x00\x6a\xcd\x40\xe2\
-\xda\x05\x8b\xbc\xaf\x49\xa6\x61\xbc\xe2\xcf\x31\xa4\x07\x2d\x38\
-\xa0\xe8\x45\xa5\x1c\xe3\x30\xe9\xcf\xff\x9c\x08\xc1\x73\xf6\xb3\
-\x3f\x4b\x19\xd2\x62\x29\x12\xa2\xcd\xb7\xbe\x45\xb7\x7e\xff\xf7\
-\xe9\xf2\x4b\x2f\x91\x9d\x02\x5c\x78\x16\x73\x2f\x7b\xd8\xb1\x79\
-\xd2\x0e\xe0\x85\xfd\x01\xe8\x44\xeb\x49\x1a\xd0\xff\x97\xb3\x53\
-\x39\x69\xa6\x0d\xdc\xda\x0a\x6b\xc2\x8d\x32\xe3\x22\x31\x4d\xa3\
-\x75\x5d\xb3\xba\x89\x1a\x77\x03\xe6\x18\x2c\x83\x02\xc8\x00\x5c\
-\x6c\x5c\x59\xb2\x04\x86\xf9\xac\x38\x92\x08\x7c\x0b\xc4\x14\x52\
-\xba\xf7\xa9\x4f\x51\x0d\x49\x9c\x43\x8e\xcf\x60\x66\x32\x86\xba\
-\xef\xf2\x7d\xa6\x4b\x5d\x1b\xb0\x48\xdd\x70\x26\xf4\x8f\x5e\xb8\
-\x03\xb0\xd6\xc0\x8d\xf8\xb8\xd3\xa8\x65\x49\xd3\x80\xf0\x8f\x57\
-\xe4\x68\x7c\x88\x0d\xc4\x42\x71\xcb\x89\xd0\xe6\xd6\x80\x9b\x6a\
-\x32\xfb\x30\x20\x00\xd3\x0d\x9c\x43\x70\x2c\x6a\xcb\x9e\x95\xa5\
-\x4e\xec\x1d\xfa\x1b\x89\x1d\xe5\x01\x5b\x83\x8d\x00\x04\xd5\xab\
-\x51\xef\xe2\xdc\x1b\x58\x3f\x5e\x07\xf0\x00\xef\x5e\xb6\x6b\x6a\
-\x3c\x18\xec\x9f\x9b\xd5\x3f\xf6\x8d\x8e\x85\x01\xe4\x9c\x9f\xc8\
-\x1e\x73\x5b\x5b\x63\xb5\x55\x40\xb5\x72\x5b\xf3\x53\xe3\xc0\x0b\
-\x14\x45\xb3\x31\xca\xec\xee\x0e\xf8\x86\x2a\xac\x43\x80\x18\x88\
-\x49\x69\x79\xd7\xa0\xae\x06\xa0\x05\xa9\x73\x02\x6e\xf4\xd2\x5d\
-\xb5\x6b\x6f\x4b\x3d\x65\xdf\x74\xe0\xa8\x6b\xe7\x44\xe2\xbb\xa1\
-\xcb\xb4\x6d\x79\xb7\xd0\xd1\x36\x6b\x33\x46\x2f\x6b\xc2\xd6\xf1\
-\x6f\x28\x14\x52\x03\x6a\x5e\x96\x34\x05\xa7\xc3\xd6\x84\xb3\x2c\
-\xa5\xb9\xc5\x23\x67\xbc\x4d\x93\x78\x8d\xd5\x38\xd8\xc0\x16\x88\
-\x14\xbc\x2c\xaf\xf2\xa3\xef\x0e\xa4\x6e\x17\x35\x8e\xf9\x94\x44\
-\x0f\x44\xb3\x81\x9b\x0d\x5a\xbc\xe7\xf7\x3e\x03\x69\x87\x35\xa1\
-\x5f\x4b\xc5\xdd\x5d\xfd\x75\x96\x86\x25\x4d\x6f\x19\x71\xb2\xb2\
-\x1a\x54\xa5\xaa\xce\xab\xb0\xa4\x39\xc5\x89\xcc\x4f\xae\x5a\x14\
-\x7d\x9f\x91\x15\xe9\x0a\x8b\xdb\x11\x38\xf1\xbc\x22\x75\x70\x10\
-\xdb\x48\xab\x7f\x53\x6b\x2a\x40\x4b\x6f\x7e\x33\xe5\xf0\xa0\xb7\
-\xe0\x04\xe6\x70\xee\xfd\x00\x34\xe5\x73\x66\x01\x37\x6d\xdf\x0c\
-\xe0\x1b\x50\x89\x3e\x5a\xa9\xf6\x39\x9d\x30\xa6\x0b\xb6\x8b\xd2\
-\x0a\x00\x27\x4b\x9a\xe4\x15\x59\x91\x86\x50\xe2\xcf\x38\xad\xd5\
-\x90\xe2\x92\xe6\x4c\x2f\x8c\x9c\x5b\x8f\x01\x4a\xf3\x9c\x25\xb0\
-\x95\x42\xa2\x30\xcf\xe5\xd8\x8e\xf3\x77\xa0\x2f\xa1\xef\xc3\x3f\
-\xff\xf3\xb4\xf2\xe4\x93\xad\x77\x54\x0a\xbc\x9f\x72\xfb\xe3\x1f\
-\xa7\xa5\xaa\xf2\x83\x43\x79\x6d\x12\x38\xc3\x89\x6c\xe2\xbe\x37\
-\xc0\x2c\x57\x14\x3e\x66\x4c\xf0\xac\x73\xbc\x90\x8f\xed\xa8\x9e\
-\x1d\x8a\xf9\x3f\x4f\xd1\x06\x2a\x00\x18\x9d\x84\xbb\x26\x09\x05\
-\xa7\x44\x93\x3c\x84\x34\x1d\xc0\x3d\xe9\xe7\xaa\xba\xc7\x67\x02\
-\x2c\x45\xd1\x49\x84\x35\x09\x7e\x60\x06\xd6\x4b\xe0\x8b\xd8\xf7\
-\x20\x80\x3b\xfd\x91\x8f\x74\x2e\x37\xf8\xa9\x9f\xa2\xfe\xe2\x22\
-\xb9\x3f\xfa\x23\x72\xe8\x3b\x03\xb8\xae\xaa\x4f\xe9\x77\x15\x8c\
-\xda\x43\xb8\xf3\xd8\xaf\xfd\x1a\x1d\x79\xe7\x3b\x3d\xe3\x0c\x34\
-\x61\x8c\x9f\x71\x8e\xff\xe2\x2f\xa8\x04\x83\x47\x51\xba\xba\xd4\
-\xf6\xcc\x9e\x92\x7e\xcf\xd1\x3d\x4a\x09\xea\x4f\x75\x22\x67\xc9\
-\x3d\xb8\xf7\xa0\xfc\x58\xac\x51\x0e\x6a\x99\x25\x40\xad\x29\xcb\
-\xa4\xfd\x96\x80\x95\xcc\xb0\x64\x89\xfd\xb2\x65\x03\x8e\xbf\xe1\
-\x17\x7e\xa1\x75\xb9\xe4\x40\x50\xac\x7f\xe2\x27\x48\x7d\xf9\xcb\
-\xb4\xf7\x85\x2f\x50\x7d\x00\x04\x1b\xdb\x5d\xa9\x9b\x61\x13\x6f\
-\xf3\xab\x1d\x98\xa9\x3c\xfe\xc9\x4f\xf2\x5c\x3a\xde\xf7\xc8\x11\
-\x9a\xff\xc0\x07\x68\x80\xa9\x61\x8d\x00\xfc\x6a\x51\x74\xbd\x78\
-\x8c\x09\x5b\x0e\x27\x4c\xe3\x64\x37\xa7\x54\xd9\x00\x62\xc8\xda\
-\xb1\x17\x71\x64\xf7\x5b\x3f\x8b\xd5\xf7\x4e\x65\x15\x2e\x4d\x1b\
-\x07\xe9\xea\x29\x63\x1c\x83\x85\x76\x5c\xc0\xc1\x03\xd5\x68\x1b\
-\x26\xa8\xf5\x0e\x00\x5c\xfe\x81\x1f\x90\x4c\x4c\x4c\x87\x85\xb7\
-\x03\xee\xd0\x02\x40\xcc\xb4\x0e\x8b\x38\x9e\x9a\x49\x5d\x49\xcd\
-\xe0\x32\x49\x3b\x1c\x6b\x51\xdc\xbf\x81\xeb\xbf\xf9\x37\x7e\x23\
-\x80\xd7\x49\x83\x2d\xbc\xe7\x3d\x74\x0c\x2f\x1e\x9d\xc8\xf3\xe0\
-\x24\xba\xa0\xdd\x65\xff\x48\x79\x2f\x1c\x9a\x7e\x41\x5d\x6b\x90\
-\xa5\x35\x02\x06\xfb\xb3\xd2\x59\xf8\x51\x9d\xe3\x45\x25\x00\xc0\
-\xe1\x48\xce\x00\xb2\x67\xa5\xc9\x9c\x36\xbc\xa1\x60\x50\x07\x89\
-\xd4\x0c\x58\xb4\x79\xe1\xdd\x94\xd6\x4b\x3e\x1a\xc0\x65\x0f\x3e\
-\x48\x5b\xd8\x57\x15\x45\x57\x02\xbb\xea\x3a\x55\x02\x8d\x84\x0b\
-\xb4\xf8\x43\x3f\xd4\x4a\x83\x85\xb9\x34\x40\xf4\xdb\xc9\x8f\xff\
-\x38\x35\xb0\xc1\x97\xae\x5f\x0f\x20\xb6\x13\xac\xed\x84\x83\xc0\
-\x96\x24\x85\x7f\xa4\xc9\x9a\xb0\x5f\x12\x11\x8d\x72\x59\x95\xb8\
-\x92\xca\x36\x80\xdd\x15\xb9\x1e\x50\xd7\x8b\x00\x29\xc7\x43\x3a\
-\x0e\x8a\x95\xd6\xde\xd3\x36\x20\x68\x35\x4b\x9e\x00\x4a\x44\x19\
-\x3f\xc4\xa5\x4b\xe1\xed\xa8\x4e\x46\x25\x00\x48\xc8\x68\x8f\x58\
-\x92\x03\x70\x62\x77\xa2\x04\xcc\xf4\xc8\x61\xbf\x0c\x7e\x90\xe7\
-\xe2\xac\x62\x1a\xac\xf3\x66\x96\xc6\xdb\xaa\xb4\xbc\x4c\x0d\x00\
-\x3c\xb8\x1a\xe7\xb8\x6e\xcd\x46\xe4\x58\x58\xce\x3d\xb8\x26\x4c\
-\xc6\x3a\x59\x13\xe6\x5e\x7c\xb9\x35\xac\x09\x4f\xcd\x48\x6f\x83\
-\x2a\xf6\xba\xb9\x9e\x78\x5b\x03\xd0\x2a\xd4\x35\x80\x2b\x90\xd4\
-\x2c\xb9\xcd\xbd\xd8\xe8\x82\x32\xec\xab\x9e\x7f\xfe\x5e\x19\x15\
-\x79\xc9\x87\xf3\x79\x58\xf0\xde\xf4\x57\xa6\xa8\xc6\x44\x2d\x6a\
-\x98\x3a\xfb\xba\xfb\x2d\x28\xe7\x19\x0e\x33\x57\xa9\x83\x4c\x6b\
-\x99\x8d\x79\x30\x6e\x77\x7b\xbb\xbb\x1a\x17\x28\x7a\xe1\x90\x10\
-\x96\x64\x2a\xfa\xa1\x25\x53\xfc\x03\x6b\xc2\x23\x94\x0b\xb3\x52\
-\xfa\xdb\x13\x71\x85\xaa\xf6\x01\x82\xaa\xf0\xa0\x25\xa8\xe1\xc1\
-\x5b\x1b\x06\x15\x6a\x0f\x48\x8f\xbd\x31\x42\x15\x8d\xb8\x2f\x38\
-\x8e\x00\xe6\x00\x6d\xf7\xf9\xcf\xd3\x37\xf0\x8e\xf4\xd8\xb9\x16\
-\x10\xf7\x68\x8b\x6d\x8c\xd4\xde\x8e\xef\xf1\xf9\xeb\x8f\xfe\xfe\
-\xef\xc3\x7d\x3a\x20\x72\x48\x93\xdf\xb8\x41\x57\x5e\x7d\x35\x02\
-\x36\x63\x85\x8e\x8b\xca\x52\xd1\x6a\x84\x30\xc0\x9f\xfd\x87\x4d\
-\xc2\xef\x89\xb9\x5c\x98\x91\xd2\x3f\x22\xb3\x11\x72\x8d\xe9\x51\
-\xd3\xe8\x26\xcc\x53\xb1\xaf\xae\x6b\xe6\x62\x77\xe1\x06\x34\x86\
-\x53\x29\xf1\x82\xcf\x10\x61\x4b\x06\x4a\x91\x10\x20\x48\xc8\xd6\
-\x5f\xff\x35\xfd\xcf\xbf\xfd\x5b\x5a\x9d\x24\x5f\xed\x74\x2f\xdc\
-\xdd\x3e\xc4\x2b\xb3\x2d\xae\x71\x5d\xfd\xc3\x3f\x4c\x29\x42\x18\
-\x00\xd9\x32\x21\x39\x9e\xf7\xe2\xef\xfe\x2e\x7d\xcb\xda\x00\x5c\
-\x2b\xf3\x62\x98\xee\x72\x26\x2a\xac\xc8\xf1\x82\x92\x9f\x2c\xc8\
-\x2d\x59\x6c\xf4\xac\x35\x11\x24\x13\xf4\x36\x6d\x07\x3f\xca\x73\
-\xd9\x3e\x19\xa3\x59\xea\x08\xac\xa8\x38\x35\x85\x76\x77\xfe\x28\
-\xa5\x06\x5d\x01\xc7\x6f\xfd\xd5\x5f\xd1\x51\x0c\x8c\x1f\x66\x0c\
-\xc9\xbc\xe9\x1c\x55\xd3\x62\x31\xa5\x0e\xb7\x79\xce\x75\xfa\x84\
-\xba\x06\xdd\x04\x88\x4b\xbf\xf3\x3b\xb4\xf0\xd1\x8f\x52\xfa\x23\
-\x3f\x42\x29\xde\x44\xcd\x98\xc9\x78\xbd\xee\x15\xfc\x98\xed\x1f\
-\x91\x06\x83\xb4\x76\x52\xfa\x36\x38\x10\x90\x93\xfa\xa0\x1b\xf7\
-\x6b\xc2\x8a\xbb\x29\xd4\x2c\x3f\x46\x23\x32\x51\x9d\x2f\x83\xa4\
-\xf7\x5a\x13\xee\xf5\x8e\x01\xb7\x06\xfa\x52\xcf\x21\x64\x51\xa5\
-\x73\xcc\xed\xf0\x5a\x6c\x17\x3c\xe7\x5a\x4b\x88\x05\xea\x8d\xa2\
-\x68\xf7\x11\xd0\x67\x4b\x5e\xe8\x7b\x48\x1c\x28\x25\xb6\xb7\x71\
-\xcd\x17\xe1\x9c\x4e\xff\xe1\x1f\xd2\x1b\xff\xe6\x6f\xe8\xc8\xb1\
-\x63\xfe\x7d\xed\xcb\x58\x22\xf8\x56\xcc\xf7\x09\x45\x26\xfa\x76\
-\x73\x8f\xd8\x10\x78\xb1\x0a\xcb\xdd\x15\xb6\x2c\x81\xdc\x2a\x27\
-\x59\x8b\xc2\xb5\x92\xa9\x1d\x00\xf1\x43\x62\xc5\x75\x59\x96\x2a\
-\x19\x24\xe4\xea\x66\xce\xb1\x9a\x10\x49\xb2\xc0\x5a\x51\xdf\x00\
-\x58\x3b\x11\x29\x83\x9a\x92\x05\xa1\x50\x47\xb0\xbb\x73\xe3\x8e\
-\xc4\x75\x81\x63\x8a\x45\x80\xb8\x08\xfa\x0e\x16\xe7\xed\x95\x2b\
-\x9d\x0c\x74\x64\x6e\xdc\x36\x9d\x67\x97\xed\x44\xb2\x31\x86\xee\
-\xa4\xf3\xd5\x6b\xf9\xf4\xd3\xd7\x40\xef\x82\x0d\xb1\xf3\x09\x2e\
-\x55\x5b\x3b\x64\x0f\x5c\x72\xf0\x6c\x8c\xc4\x82\x2d\x2e\x76\xf2\
-\x70\x11\xc4\xee\xfe\xf6\xb1\x2e\x20\x01\xb8\x59\x52\xd7\xad\x45\
-\x72\x62\x5e\xaf\x7b\xdf\xf6\xbe\xae\x0d\xbf\x43\xaa\x3d\x17\xc6\
-\xb6\x5c\xb9\x7e\x6d\xeb\xc2\x6c\xfa\x6a\xce\xcb\x0f\xfc\xab\x64\
-\x22\x79\x72\x93\x29\xe0\xc4\x63\xb3\xe7\x9e\x34\x03\xd0\xd9\xc0\
-\x75\xdb\x28\x11\xc4\xee\xf3\x74\xda\x81\xdc\xdd\x4e\x04\x5e\x38\
-\x82\x27\x25\x03\x95\x4e\xd6\x84\x67\x02\x28\x81\xa9\xe6\x79\xa0\
-\x4f\x67\xd5\x02\x5e\x07\xb8\x43\x40\x8b\xea\xda\x75\x16\x31\x80\
-\xee\x4a\x5c\xac\x67\x82\xd6\xad\x95\xd4\x6d\x29\x9b\xa2\x2d\xe6\
-\x6e\xd5\x0e\x21\x0c\x48\x24\xd0\xdd\x08\xa3\x60\xfb\x57\x93\xbd\
-\xe7\xe7\xa1\xd2\xae\x02\x73\x29\xa8\xf2\x98\xd3\x1c\x85\x9b\xb5\
-\xb9\x1b\xa9\xf5\x80\x9d\xdc\x5a\x3c\x7e\x20\x84\x71\x5d\x55\xef\
-\xda\xbc\x69\x80\x39\x69\xa9\x83\xfb\xef\xf6\xd2\x02\x22\xd7\xdd\
-\x94\x58\x67\x7d\x38\x5e\x43\x73\xbf\x2c\x37\xf2\x56\x74\x78\xf7\
-\xb6\x81\x40\x65\xa8\xed\xe1\x2a\x0c\xd1\xd4\xe7\xce\x9f\x73\xc3\
-\xed\x21\x4e\xcc\x6c\x62\xfc\x9b\x99\x39\xab\x6e\x21\x6e\xbe\xbd\
-\x30\x13\xb7\x23\x57\xbb\xc6\xba\x3d\x55\x9b\xa2\xde\x34\xa3\x1d\
-\x4b\x17\xac\xbb\x44\x23\x02\x3a\x25\xbb\x63\x98\x3a\x6f\x25\x84\
-\x99\x88\xb6\x8c\x5d\x78\x43\x95\x94\x86\x1a\x56\x7c\x30\x84\x30\
-\xcd\xbd\x55\xf8\x39\xd0\x3b\x5e\xa5\xba\x7e\xc0\xe9\xbe\x66\x4f\
-\x54\xed\x6b\x3d\x97\x59\xdb\x92\xb8\x58\xdf\x03\xb8\xb6\xba\x87\
-\x76\xd7\xeb\xb6\x39\x7f\x28\x60\x6e\x86\xcd\x53\xdd\x7d\xd1\x44\
-\xb4\x41\x3f\xb8\x1d\x81\x63\xd2\x3a\x3a\x40\xcd\xa6\x8b\x41\x73\
-\xd6\xf9\x21\xbb\xab\x16\x92\xc4\x0b\xed\xb9\xda\x73\x1b\xbd\xfa\
-\xd0\x30\xc6\xc9\xb2\xe6\xd0\x2d\x2d\x39\x48\x20\xfe\x1d\x3b\xfa\
-\xc5\x0d\x63\x3e\xd0\x40\x3a\x53\x6b\xc3\x60\xdb\x6b\x22\x6d\xa9\
-\x6c\xd9\xc6\xc3\xda\x34\x4b\x0a\xa3\xa1\x9e\xe9\x30\x68\x36\xa0\
-\x31\x39\xdb\xde\x17\x5e\x28\x6f\x91\x96\xa3\x46\x91\x02\x80\x01\
-\xc4\x04\x78\x18\x37\x2e\x72\x47\x1b\x75\x47\x85\x5b\x9f\x7f\xe3\
-\x6f\xc5\x60\x3a\x54\x55\xba\x2a\x06\x3f\xfa\xef\x3f\xa9\x9e\xff\
-\x72\x36\xba\xb5\xf1\x93\xf0\xc4\x79\xc7\x31\x44\xb1\x0f\xb6\xa9\
-\x63\xa7\xac\xd4\x5d\x15\xec\x4e\xd1\xda\x11\xd7\x0c\x9b\xa8\xa6\
-\x03\xd9\x3d\x26\x36\x38\xb4\xa3\x99\x89\x0c\x15\x1b\xa8\xb5\x25\
-\x45\x0d\x8e\x55\xd8\x5b\x69\xa7\x6b\xe3\x6c\x63\x00\x61\xd1\xdb\
-\x77\xb4\x3f\x25\x8c\xe1\x4f\xbd\x61\x61\xc8\x62\xc6\x61\x30\x9f\
-\xac\xed\xb1\xa3\x1b\x83\x9f\xf9\x8f\x7f\x3a\x97\xa8\x7f\x06\x2f\
-\x4e\xba\xba\x7a\x8c\x6a\xb3\x84\xe0\x7a\x9e\x9a\x66\x11\x75\x46\
-\xc6\x2e\x50\x53\xc3\x4d\x19\x85\x5a\x71\x2a\x9b\x40\x08\xc2\x49\
-\xda\xe0\x58\xd5\x70\x2a\x4c\x99\xba\x56\x16\xfb\x6c\x0d\x42\x6d\
-\x8c\x51\x93\xf5\x64\xe5\xba\xb9\xb9\x68\xcb\x66\xa7\xb9\xa4\x5f\
-\x00\xb6\xc3\xb4\x7b\xef\x33\xb2\x4f\xe2\xbf\x90\x07\x78\x60\x85\
-\x21\x6a\xd0\x1f\x83\x51\x35\x27\xe7\xb5\xb5\xe8\xaa\xb6\x7a\x65\
-\xcf\xdd\x5e\xb9\xed\x1f\xb1\x03\xa0\x43\xe1\x18\xe7\xa9\xa7\x9e\
-\x6a\x68\x85\x54\x3e\xca\xe7\x54\xa3\xc6\xf0\x27\x7b\x44\xfa\xb6\
-\xd3\xe8\x9b\xe7\x37\x75\xae\xc7\x8e\xdc\x3c\x6e\x39\x72\xca\x65\
-\x0a\x42\xed\xd0\x81\x94\xbc\x0a\x11\xbd\x22\x39\xfc\x5f\xe4\x0d\
-\xec\xe6\xb6\xa3\x29\xc5\x19\x03\x26\x00\xf0\xaa\xd6\xcc\x10\x00\
-\xac\x89\xb7\x8d\x19\x50\x2d\x8c\xf1\xc7\x9b\x86\x0e\x30\x47\x11\
-\xda\xa6\x28\x95\x45\x1f\x53\x55\xca\x34\xc6\xf7\x35\xd6\xe0\x54\
-\x99\xd2\xda\x2e\x73\x7c\x5b\xfb\x3a\x02\x78\x04\xd2\xd7\x7f\xd7\
-\xdb\xaf\xa0\xf9\x6d\x9c\x76\x1b\xe3\xdc\x76\xca\xec\x73\x9e\xc4\
-\x5a\x67\x0d\x2e\x48\xaf\x4c\x91\x40\x87\xf2\xcc\x33\xef\x73\x1b\
-\x1b\x6f\x35\x26\x37\x95\xeb\xbb\xcd\x94\xd2\x2a\xb5\x2e\x03\x58\
-\x9b\x8a\xf4\x18\x0f\xb3\x40\x9a\x86\x00\xee\xcd\xe4\x28\x73\xc0\
-\x9a\x9f\x45\x39\x0f\x22\x89\x0b\xc1\x96\x00\xb7\x1e\x7f\xd2\xd9\
-\xd6\x34\x1c\x3b\xde\x0e\x3c\x53\xff\x8d\x07\xd7\xef\x29\x46\x3f\
-\x75\x4e\xde\xaf\x90\x8b\x0a\x67\xb0\x27\xfe\x6a\xc8\xf1\x91\x45\
-\x47\xb3\x99\xe3\xbd\x02\x80\x05\x23\x34\x55\xac\x2d\x41\x53\xb8\
-\x36\x3d\x68\x88\xa3\x5e\x5e\xa5\x6f\x7c\xe0\xba\x52\x7a\x1b\x27\
-\xec\x29\xed\xf6\x8c\x75\x23\x65\x39\x15\x90\x54\xa3\x74\xaf\x1e\
-\xf4\x06\x06\x3f\xae\x09\x5a\x7f\xd8\x2f\xd6\xef\x73\x47\x8f\x96\
-\x96\x96\xa9\xea\xed\xf5\xb4\xe9\x19\x8c\x8b\x6e\x93\xcb\x8c\xf3\
-\x3f\x3c\xa4\x3d\x80\x78\xcc\x91\xfa\x1f\x44\x8a\x81\xed\x91\x95\
-\xf7\x46\x9c\xf3\xe0\x9d\x16\x80\x48\xb2\x19\xdc\x04\x71\xdd\xb2\
-\xf2\xce\xad\xb5\x5e\x9f\x95\xdd\xc1\x98\xae\x44\xcc\x48\xcb\x79\
-\x72\x9c\x77\x28\x01\x91\xb5\xfe\xe6\x9d\xc5\x1f\x06\xf4\x10\x06\
-\x49\x68\xa2\x94\x7f\xe3\x60\x6e\x10\xd4\x24\xfa\x12\xa5\x6a\x34\
-\x2b\x5c\xf7\x16\xae\xb3\x83\xf6\x65\x87\x76\x42\x54\x38\x91\xbe\
-\x2a\x1b\x67\xc6\x40\xae\x39\x84\x99\xfa\xfd\x40\x74\xb0\x93\x6f\
-\x87\x16\xab\x3b\xab\x4d\x6f\xb9\xe7\xfa\x94\xae\x42\x39\xfa\x00\
-\x2f\x6d\xc0\x9d\xc4\xa9\xc2\x92\xcd\x71\x63\x4e\xf0\xa0\x26\x80\
-\xc7\x52\xe8\x5b\xaf\x86\xcf\x01\x28\xed\xff\xb2\x91\x63\x3c\xb8\
-\xc7\x69\x1e\xba\x55\x24\x20\xe0\x70\x04\x31\xc0\xae\xb9\x2b\xa7\
-\x0e\xbd\x5f\xe4\x0a\x8d\x49\x76\xc9\x8b\xe4\x69\x59\xab\x88\xce\
-\x3d\x0c\xc8\xb5\xbd\xf1\xf5\xbb\x1d\x97\x5c\x83\x49\x9f\x92\x3e\
-\xce\x03\xe8\xc8\x4f\x34\x2a\x28\xfc\x2d\xc5\x00\x2a\xbd\x81\x01\
-\x6c\xe1\xc6\x17\x0b\x67\x76\xf8\x57\xce\x48\x44\x57\xc1\x71\x4f\
-\x91\xc0\x68\x0b\x11\x54\xdb\x73\x2b\xe7\x1a\x9c\x58\x8c\x8a\xda\
-\x0c\x06\x19\x2c\x53\x7d\x91\xd5\xd9\xa6\x16\x76\x49\xa5\x9c\xa6\
-\x55\x64\x52\x6d\x81\x9d\x76\x2b\x5e\xe8\x54\x12\x53\xdd\x0a\x58\
-\x59\x1e\xa5\x93\xa8\xc5\xb9\xd5\x38\xed\x0a\xc0\x01\x32\xfc\x33\
-\x64\x4f\x6b\xcf\x00\xec\xf0\xa8\xc9\x59\x5c\xe4\x91\x44\x06\x51\
-\x5e\x65\xb6\x08\xf0\xe1\x83\x5d\xe1\x5a\xea\xf4\x54\xaf\x21\x0c\
-\x62\xb6\x5c\x13\x57\x2e\x00\xe2\xd2\xb5\x25\xe2\x79\xee\x08\x07\
-\x87\x9c\x8d\xb3\xd6\x6e\xd7\x4d\xb2\x4f\x19\x8d\x4d\x65\x2a\xfe\
-\x8a\x25\xbe\x30\xec\x50\xa6\x00\xd8\x06\xd1\x30\x88\x73\x73\x37\
-\xf5\xde\xde\x71\x6b\x50\x5c\xee\x9c\xa9\x92\x14\x03\x2e\x4c\x6a\
-\x00\x1e\xa5\x1c\x6e\xa3\x05\x25\x50\x9b\x26\x27\x4a\x8c\xf1\x1a\
-\x52\x81\x12\x4a\x18\x92\x65\x6d\xc9\xb5\x18\x27\xa8\x61\x87\x45\
-\x8f\xd4\x36\x38\x96\x92\xba\xe1\xa7\x7a\x06\x98\x6b\xed\x79\xa1\
-\xad\x55\x46\x3b\xde\x7b\x3f\x76\x4a\xae\x29\x18\x7f\x00\x87\xeb\
-\x5b\x03\xe8\x63\x8c\xec\x56\xc9\x48\xcb\x6a\x3f\x06\xc7\xdb\x5a\
-\x4f\x18\xa4\x28\xb8\x74\x6e\x89\x50\x92\xe6\x90\x05\x64\xf6\xc9\
-\xa5\x63\x8c\x06\x4e\xd2\xae\xc3\x36\x8e\x70\xfb\x8d\xac\xc9\xca\
-\xad\x85\xad\x1a\x9f\x82\x69\x10\xe6\x4d\xf9\x08\xed\xcc\xef\x46\
-\x9f\x4d\xf0\x3d\x55\x98\x91\x54\x23\x5f\x98\xe0\xa7\xb0\xca\xcd\
-\xb9\x61\x56\x65\x0a\x61\x8f\xff\xda\x2e\xa2\x9a\x56\x28\x97\xf9\
-\x49\xf9\xa8\x73\xdd\xf0\xf5\x5d\x08\xf0\xa2\x49\x8c\x8b\x47\x22\
-\x03\x0c\xf3\x27\x8f\xdb\x36\x4d\xd5\x9d\x63\x49\x22\x93\x06\xbf\
-\x46\xa1\x97\xa9\x55\x04\x30\xcb\xb3\xb1\x46\xda\x4d\xd8\x0f\x44\
-\xee\x88\x4d\x13\xfa\x2a\xf6\xd5\xc7\xf1\x67\x8c\xe1\x96\x70\xe3\
-\x25\x51\xb6\x55\x25\x55\x09\xf0\x76\x06\x83\xad\xfa\xb9\xe7\x5e\
-\xae\xf0\x41\x4a\x6f\xda\xa6\x7c\x84\x76\xf6\x37\xa4\xcf\xe2\x5b\
-\x51\xab\xab\x8f\x2a\x7c\x22\x58\x31\x98\xf8\xf0\x36\xbe\x72\x49\
-\x28\x0f\x11\xe2\xc7\x16\x78\xbd\x5e\xd1\xef\xcb\x2b\x12\xf0\x40\
-\xdd\x82\x9d\xe8\x23\xc7\x07\x83\x11\x6a\x29\xf2\x55\xa0\xa3\xac\
-\x05\x43\xde\xae\xc1\x98\x39\xd4\x91\x39\xb1\x80\x69\xae\xcb\x1c\
-\x61\x1c\x37\x92\xc4\x80\x41\x49\x97\x41\xad\xc2\x4b\x1f\xb9\xad\
-\x93\x1a\xff\x13\x83\x52\x80\x9a\x6a\xa9\x6a\x4e\xd0\x7a\x85\xe8\
-\x98\x18\xee\x00\xde\xeb\xfc\x14\xbc\xbc\x88\x1e\x3e\xfd\x0e\x40\
-\x51\x9f\xa3\x4e\x56\x7b\x4a\xe1\x8f\xb9\x86\xf6\x91\x23\x47\x1c\
-\xd1\x2b\xad\x2f\x9e\xc7\x2f\xa1\xcb\xdf\xc8\x98\xd7\xcf\x1c\x61\
-\xd0\x9c\x92\x74\x5d\x39\x17\x3e\x12\x8e\x89\x17\x60\x98\x63\xef\
-\x6a\xf1\x62\x41\xcd\xf6\x0e\x5a\x65\xf9\xa3\xdd\x3c\xb9\x78\xfa\
-\xe9\xa7\xed\xbf\xd1\xb7\xf4\x67\x83\x4b\xaf\xb1\x9c\x8f\x1f\xca\
-\xc7\x07\xaf\xcf\x89\x95\x8b\x4c\x99\xc2\x9c\xe9\x0c\x12\xe6\x08\
-\x7b\x22\x73\x62\x25\x5f\x42\x8f\x5f\x41\x5f\xc3\x62\xf9\xd1\xd5\
-\xa3\x8e\x3f\x75\xcc\xdf\xcd\x7e\x79\xe5\x65\xf7\xdc\xf9\xe7\x24\
-\x3f\x32\x05\xa4\xff\x03\x20\xf8\x93\xb7\xfc\xa2\xd5\x9e\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x53\x13\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x52\xda\x49\x44\x41\x54\x78\xda\xed\x7d\x07\x80\x5c\x55\
-\xf5\xfe\x37\x33\x3b\x75\x67\x67\x7b\x4d\x36\x6d\xd3\x09\x09\x49\
-\x48\x80\x80\x10\xba\x44\x04\x29\x82\x54\x11\x44\x50\x3a\x88\x14\
-\xa5\x29\x08\x22\xed\x0f\x0a\x22\x45\x45\x54\x44\x10\x04\xe9\x86\
-\x26\x2d\x05\xd2\x1b\x09\x69\x9b\x2d\xd9\x3a\x5b\xa6\xb7\xff\xf9\
-\xee\xbc\x3b\x79\x3b\xd9\xdd\xec\x26\x21\x0a\xfe\x2e\xdc\xbc\x99\
-\xd9\x99\x57\xee\xf9\x4e\x3f\xf7\x5e\x0b\xfe\x43\xed\x88\x23\x8e\
-\xb0\x14\x17\x17\x5b\x7c\xf9\xf9\x16\x6f\x6e\xae\x75\xc1\x82\x05\
-\xd6\x2d\x5b\xb6\x58\x37\x6e\xdc\x68\x95\x3f\x5b\x8d\xaf\x59\x4c\
-\x3f\x49\x99\x8e\xe6\xd7\xa8\xae\xae\x4e\x0d\x19\x32\x04\xc9\x64\
-\x32\xc5\x2e\x0d\xfa\x58\x55\x55\x85\x8a\x8a\x0a\x7e\x0e\xa3\xab\
-\xd7\xf1\x78\x5c\xf7\x54\x22\x91\x00\xbb\x7e\x1d\x8b\xc5\x54\x8f\
-\x46\xa3\x29\x7e\x87\xaf\xf5\xf7\xe5\x33\xd4\xd7\xd7\xa7\x06\xf6\
-\x94\xff\xfd\xcd\xb2\xeb\xa7\x18\x7c\x3b\xf8\xe0\x83\x2d\x42\x14\
-\x4b\x61\x61\xa1\x75\xc9\x92\x25\xb6\x8f\x3e\xfa\x28\x47\x3e\xb6\
-\x49\xb7\x8f\x19\x33\xc6\x3d\x6a\xd4\x28\xef\xfa\xf5\xeb\x23\x6b\
-\xd7\xae\x8d\x99\x7e\x96\x1a\x64\xc7\x0e\x3e\x83\x80\x46\x01\x27\
-\x95\x6e\x99\xa3\x06\xcf\xbe\xfb\xee\xab\xc0\x42\x50\x68\xe0\x18\
-\x40\xc9\x80\x85\xaf\xe5\x98\x79\xad\x81\xa3\x41\xa4\x81\xa3\xdf\
-\x6f\xdd\xba\xf5\xbf\x0a\x3c\x7b\x1c\x00\x93\x27\x4f\xb6\x08\xc7\
-\x5a\xcb\xcb\xcb\xad\xaf\xbd\xf6\x5a\x4e\x5d\x5d\x9d\x7d\xc2\x84\
-\x09\xf9\xd7\x5d\x77\xdd\xb9\x27\x9f\x7c\xf2\x29\x4e\xa7\x73\xbc\
-\x0c\xb4\x55\x8d\x52\x2a\x15\x92\x81\xed\x90\x01\xec\x88\x44\x22\
-\x1d\x81\x40\xc0\xdf\xd6\xd6\xd6\xb1\x7a\xf5\x6a\xff\xca\x95\x2b\
-\xf9\xb9\x5f\x06\x95\x7f\xf3\x07\x83\x41\xbf\xb4\xf6\xcf\x3e\xfb\
-\xcc\xbf\x78\xf1\xe2\x80\xfc\x3a\x89\x9e\xc4\xcf\x7e\xbf\x53\xa0\
-\xd1\xc7\x99\x33\x67\xa6\xb2\x81\xa3\x8f\x7d\x01\x47\x4b\x19\x0d\
-\x8a\xbe\x80\x63\x96\x3a\x1a\x38\x8d\x8d\x8d\x9f\x0b\x70\xf6\x28\
-\x00\x4a\x4b\x4b\x2d\xa3\x47\x8f\xb6\x0c\x19\x3a\xd4\xf6\xfe\x7b\
-\xef\xd9\x1b\x1a\x1a\x1c\xb3\x66\xcd\x1a\xff\xc6\x1b\x6f\x3c\x21\
-\x84\x1f\x13\x08\x06\xd5\xc3\x66\x6e\xcc\xb2\xed\xf6\xf8\xca\x62\
-\xb5\xc2\x2a\x9f\xf1\x68\xe1\x51\xba\xd5\x38\x66\xde\x5b\x95\xf6\
-\x88\x69\xe0\xc8\xa0\x76\x18\xe0\xe8\xd8\xbc\x79\xb3\x7f\xe1\xc2\
-\x85\x0a\x30\x1a\x38\xe1\x70\xd8\xdf\xd1\xd1\xe1\x17\xf5\xd3\x2e\
-\x7f\xeb\x94\xf7\x1a\x28\xfd\x01\x08\xa6\xf7\xbd\x81\xa6\x4f\xe0\
-\xec\xb7\xdf\x7e\x0a\x10\xa9\x0c\x7c\xe4\x0f\x86\xc4\xa9\xac\xac\
-\x64\xef\x15\x3c\x72\xbf\xa9\x38\x41\x94\x06\x8e\x02\x8f\x49\x2d\
-\xa5\x4c\x20\xc2\x9a\x35\x6b\x06\x0c\x96\x3d\x0a\x00\xd1\xc7\x56\
-\x11\xf1\x56\xe1\x5e\x7b\x73\x73\xb3\x73\x9f\x7d\xf6\xa9\xfa\xf0\
-\xc3\x0f\x5f\x93\xbb\x1d\x1a\x12\xe2\x9b\x09\xde\xeb\x8d\xee\xe8\
-\xef\xbd\x7c\x47\x01\x47\x03\xc4\x04\x9c\x1e\xa0\x31\x8e\xd2\x12\
-\x32\xe0\x5d\x04\x0e\x01\x12\x0a\x85\x3a\xba\xba\xba\xfc\x02\x54\
-\xbf\xd8\x28\x1d\x44\x11\x3f\x97\x41\x56\xc0\x91\xbf\xb5\x8b\x48\
-\x27\xa8\xfc\xed\xed\xed\x71\x0c\x4e\xda\x0c\x14\x34\x19\x75\x55\
-\x45\x75\x95\x06\x8b\x21\x20\x53\x0a\x20\x54\x63\x32\xb6\x94\x26\
-\x29\x02\x40\xee\x2d\x25\xf7\x9e\x12\xe0\xf3\x08\x51\xb1\x7d\x02\
-\x62\x4f\x02\xc0\x32\x6c\xd8\x30\xab\xdc\x73\x4e\x6d\x6d\xad\x53\
-\xde\xe7\xca\x8d\xdd\x33\x6d\xda\xb4\x6f\x75\x75\x77\x0f\x98\xa0\
-\xdb\xdd\x74\x1f\xa0\x18\xc8\x77\x76\x34\x08\x19\xc0\x00\xbd\x02\
-\xc7\xd4\x49\x88\x00\xa5\x0e\x25\x0e\xd5\x55\x77\x77\xb7\x5f\x40\
-\xee\x17\x1b\xc7\x2f\xcf\x4b\x40\x29\xf0\x10\x38\x54\x65\xad\xad\
-\xad\xfe\x15\x2b\x56\xb4\x8b\xad\x13\xc6\xe0\x55\x55\x5f\xc0\x51\
-\xbf\xdd\x7f\xff\xfd\x93\x94\x0a\xa2\x6e\x93\x72\x1f\x49\x02\xa1\
-\xb3\xb3\x33\xf5\xde\x7b\xef\xa5\x06\xfa\xec\x9f\x47\xb3\x8e\x1c\
-\x39\xd2\xb6\x61\xc3\x06\x87\xbc\x76\x4f\x9c\x38\x71\xc8\xd2\xa5\
-\x4b\x3f\xea\xec\xea\x72\x19\x80\xee\x97\xcb\xcd\x80\xd0\xdf\x97\
-\x17\x64\x59\xe3\x63\x0b\x6c\x36\x9b\x89\xe6\x3b\x00\x8e\xe9\x7c\
-\x3b\x6a\x3b\xfa\x46\x6f\xec\xd5\x9b\x7a\xea\xad\x27\x69\xe7\xc4\
-\xe3\x9d\x86\x9d\x43\x70\x74\x88\x34\xf1\x8b\x18\xef\x10\x80\xf8\
-\x0d\x69\xe4\xd7\x76\x0e\xff\x26\xa0\x69\xa7\x9d\x43\x01\x80\x6d\
-\x84\x37\xf7\x84\x74\x4a\xa4\x84\x30\x58\x62\xaf\xbd\xf6\x4a\x88\
-\xb4\x4a\xca\x6f\x53\x34\x42\xc5\x86\x4a\x0d\xf4\xd9\x76\x5b\x93\
-\x87\xb5\x7a\xbd\x5e\xbb\xdc\x88\x4b\xde\x7a\x2f\xba\xe8\xa2\xaf\
-\xde\x7d\xcf\x3d\x8f\x06\x03\x81\xfe\xb9\xdc\xf8\x9b\x32\xb2\x0c\
-\x7d\x48\x5b\x81\xba\x50\x11\x59\xff\x96\x7f\x37\x8e\x2e\xb7\x1b\
-\x2e\xa7\x13\x39\x39\x39\xea\xef\x03\x56\x1f\x7d\xdf\x7c\x4f\x82\
-\xcb\x35\x2c\xc6\x31\x03\x00\xf3\xeb\xac\xf3\x6a\x30\x66\x40\xd9\
-\x0f\xc8\x35\x30\xa0\x41\xd2\xdb\x67\x7c\x9d\x4a\xf5\xb0\x73\xb4\
-\x2d\x23\x0c\xd6\x26\x9c\xbe\x6e\xd9\xb2\x65\x6f\xbd\xf8\xe2\x8b\
-\x1b\xe4\xe7\x34\xaa\x62\xe2\x76\xc7\xdd\x6e\x77\xa2\xa9\xb9\x39\
-\x59\xb7\x65\x4b\x4a\x6c\x9e\xd4\x9e\x04\x80\x48\x53\xab\xcd\x2e\
-\x4d\x90\xec\x91\xf7\xf9\xd7\x5e\x7b\xed\x79\x37\xdc\x78\xe3\xf5\
-\xf2\xbe\x4f\xa2\x6b\xc2\x52\xcf\x91\xe8\x61\xd1\x67\x14\xcb\x02\
-\x24\xc8\xa9\x14\x87\x91\xeb\x15\x27\x19\x7e\x3e\x01\x12\x0a\x87\
-\xa9\x07\xd5\xdf\x7d\x3e\x1f\x1c\x02\x06\x3d\x98\x03\x21\x70\x36\
-\x51\x32\x84\x4e\x6d\x23\x6f\xca\x78\x6f\xee\xd0\xaf\xcd\x44\x93\
-\x66\x35\x54\x89\x61\xa0\xf6\x04\x44\x6a\xc0\xf6\x5a\x8f\x96\xfd\
-\x2b\xb3\x3d\xc3\x31\x11\xf0\x27\x97\x2f\x5f\xfe\xe2\x39\xe7\x9c\
-\x73\xe3\xa2\x45\x8b\xea\xe5\x2b\x91\x92\x92\x92\xd8\x94\x29\x53\
-\xe2\xf5\xf5\xf5\xc9\x55\xab\x56\x25\x7b\x8c\xf9\xe7\xdc\x2c\x72\
-\x43\x39\x82\x56\xa5\xfb\xa5\x17\xdd\x70\xc3\x0d\x97\x5e\x73\xcd\
-\x35\x17\x6a\xab\xbf\x37\xe3\x8d\x83\x19\x14\xa2\x0b\xb2\xe1\x74\
-\x38\xe0\xcb\xcf\x87\x5d\xb8\x7a\x3b\x8e\x32\x0f\x8c\x31\xa0\x04\
-\x03\xc1\x25\xba\x4f\x7d\xaf\xa8\xa8\x08\x39\x02\x9a\x81\xa8\x86\
-\x54\x2f\xe7\xcb\x10\x19\xca\x6a\xa7\xe8\x56\xef\x93\xb4\xd6\x0d\
-\x90\xf2\xb5\x19\x24\x24\x38\x89\x61\x3e\xea\x6e\x26\xda\x4e\x41\
-\xa0\x1f\xe0\xa4\x8c\x67\x72\xb9\x5c\xf4\x0a\x36\xcd\x9e\x3d\xfb\
-\x34\x31\x62\xd7\xc9\x47\xe1\x51\xa3\x46\x45\xf3\xf3\xf3\xe3\x1b\
-\x37\x6e\x54\x2a\x61\x4f\x01\x40\x9e\xd9\x9a\x23\x83\x44\xf1\x9f\
-\x27\xbd\xe4\xb1\xc7\x1e\xbb\xee\x94\x53\x4e\x39\x95\xae\xcd\x76\
-\x84\x30\x38\x9a\x84\xa7\x77\x50\x50\x50\xa0\x1e\x46\x0f\x98\x8a\
-\xc6\x35\x34\xa0\xbd\xbd\x1b\x81\x48\x52\xdc\x9f\x04\x72\x5d\x56\
-\x78\xdc\x39\x18\x52\x55\x09\x79\x40\x25\x29\x94\x8d\x40\x89\x60\
-\x80\x48\xdc\x50\x88\x18\xec\x09\x02\x93\x8a\x31\x0f\xac\x99\xf0\
-\x86\xdb\x96\x79\xad\x24\x0d\xbb\xe1\x92\x19\x3e\xbd\x52\x39\xbc\
-\x4f\x12\x9b\x9f\xf1\xba\x6c\x76\x01\xaf\x43\xc0\x47\x00\xe6\xc8\
-\xdf\x14\x18\x0c\x7b\xa5\x5f\xc9\xd4\x1f\xfd\x07\x08\x10\x71\xaf\
-\xd1\xd2\xd2\xb2\xa8\xa6\xa6\xe6\x64\xb9\x9f\x4e\xf9\x28\x34\x76\
-\xec\xd8\x18\xbd\x16\x31\x52\xf7\x1c\x00\x38\x0e\xd2\x09\x80\x7c\
-\xe9\x65\x73\xe7\xce\xbd\x75\xc6\x8c\x19\x47\x27\x0d\x23\xce\x2c\
-\x01\xc8\x49\x72\x73\x6a\x50\x0b\x0a\x0b\xd5\xe0\x91\x6b\xda\xfd\
-\x7e\x2c\x5c\xbc\x1e\x6b\x37\xfb\xd1\x19\x71\x08\xe7\x09\x37\xd9\
-\xc9\x59\x16\x24\x04\x04\xa9\x64\x0a\x1e\x7b\x0c\x25\x3e\x60\xfa\
-\x5e\x95\x18\x3b\xa6\x46\xfd\x8e\xe7\x21\x68\x5a\xdb\xda\x50\x5c\
-\x5c\x8c\x7c\x51\x0b\xdb\xc6\x29\xd5\xe3\xb5\x16\xe1\xea\xbe\x0c\
-\x23\xd3\xe4\x97\x2b\xa2\x6b\xff\x9b\x8d\x80\xca\xcd\xcd\x45\x5e\
-\x5e\x1e\x1c\x0e\x47\x16\x0d\x52\x02\xd2\x76\x46\xff\x14\xd1\xf9\
-\x5d\x12\x84\xea\x4b\x4b\x04\xf3\x77\x29\x49\x78\x5e\x3e\x3f\x01\
-\x4c\x40\xd9\xf8\x1d\x43\xb4\x9b\xed\x9d\x81\x02\x84\xbf\xf0\x78\
-\x3c\xb8\xfc\xf2\xcb\x2f\xb9\xff\xfe\xfb\x5f\x90\xb7\x5d\xa2\x42\
-\xc3\xd2\x63\x8d\x8d\x8d\x89\x3d\x05\x00\xc2\x9d\xe1\x5e\xea\xff\
-\x02\xe9\xe5\xe2\x1e\xdd\x33\x62\xe4\xc8\x03\xcc\x04\xe0\xcd\x70\
-\x10\x9a\x9b\x9a\x10\x11\x82\x15\x0a\xf1\xc9\x31\x1c\x8c\x05\x8b\
-\x56\x63\xfe\xf2\x36\x04\xe3\x32\x78\x32\x80\x25\xc5\x79\x18\x33\
-\xaa\x14\xdd\x11\xe1\xf0\x48\x1c\x43\x4a\x3c\xa8\xad\xf7\x63\x53\
-\x6d\x2b\x62\x91\x18\x6c\x96\x24\x86\x15\x27\x70\xe8\xfe\x63\x85\
-\xe8\x45\x3a\x98\x42\x6e\x50\xf9\x01\x0e\x4a\x6f\x7a\x3c\x93\x33\
-\x30\x08\x6e\x8a\xda\xa9\x4e\x0e\xe7\x6f\x69\x87\x68\x69\x62\x96\
-\x12\x19\xc4\x9b\x62\x0e\x04\xdf\xa7\x9f\x7e\xaa\x88\xce\xdf\xf2\
-\x77\x94\x06\x24\xa4\x52\x81\x26\x63\xcf\x6e\x80\x3d\x65\x80\x21\
-\x61\xa8\x15\xfe\x8d\x80\x20\xc8\x34\x70\xfa\x84\x41\x16\x40\xf8\
-\x3b\xb1\x07\x5e\xd9\x77\xdf\x7d\xaf\x94\xb7\x7e\xe9\x01\x91\xaa\
-\x11\xbf\xdf\x1f\xdf\x93\x00\xb0\x1b\x00\x28\x94\x5e\x21\xd6\xea\
-\x6f\x44\x2f\x4f\xd2\xfa\x4a\x3f\x10\x39\xa6\xad\xb5\x15\x62\xb0\
-\xa8\x01\x23\x20\xde\xfe\x70\x35\x96\x6e\x88\xc0\xe1\x72\xa3\xb2\
-\xbc\x00\x11\xc1\xd2\xc8\xe1\x05\x28\x2b\xf4\xa0\xbe\x23\x8a\xee\
-\x70\x02\x63\x2b\xdc\xe8\x0e\xc4\xb0\xb6\xb6\x1d\xee\x64\x02\xf5\
-\x8d\xed\xe8\xea\x0c\xa0\xd8\x9b\xc2\x11\xfb\x31\xc2\x56\x9e\xb1\
-\x0b\x5a\x05\x04\xe2\x92\x66\x88\x90\xe1\xee\x6d\xe1\x5a\xe8\xa8\
-\x1b\x09\xe2\x11\x0e\xf7\x4a\x27\xa7\x6b\xe2\xf4\x46\xf4\x5e\x1f\
-\xdc\xe0\x74\xaa\x03\x21\x42\x06\x38\xfc\x9d\x3a\xb7\x00\x42\x71\
-\xba\x49\x25\x64\xce\x68\x52\x43\x5a\x8a\xf1\xde\x9c\x02\x42\xda\
-\x44\x96\x7e\x8c\xd7\x1e\xde\x88\x7c\x4f\x0c\xe8\xcf\x44\xfa\x9d\
-\x2a\x6f\x5b\xa4\x77\x0a\x90\xc5\x56\x0e\xc7\xf6\x24\x00\x28\x1f\
-\x73\x35\x00\x9a\x9a\x9a\xfe\x28\xe2\x70\xb8\x59\xf4\xc7\xe4\x01\
-\xd7\xad\x5b\xa7\x88\xcf\xc1\xe1\x43\xbc\x33\x7f\x3d\x96\x6d\x08\
-\xc1\x25\x03\x55\x56\x5e\x08\x77\x5e\x2e\x62\x32\x00\x79\x5e\x87\
-\x10\xd0\x8a\x60\x54\x38\x45\x06\xa8\xc0\x49\x51\x9f\x42\x67\x77\
-\x14\x96\x50\x04\xe1\xce\x6e\x74\xb4\x77\xa2\xab\xa3\x13\x3e\x51\
-\x3c\xc7\xcc\xaa\x40\x61\x41\xbe\x22\x9a\xb8\xa2\x6a\x20\x8d\x0c\
-\xa2\x22\xb6\xe2\x36\xe9\x24\x96\x9b\x1c\x4e\xa2\x0b\xb1\x48\x9c\
-\x6c\x09\x31\xd8\xa6\x8d\xc0\xb5\x6b\xd7\xa2\x41\x6c\x17\x02\x89\
-\xaa\x28\x57\xce\xaf\xd4\x1b\x41\x62\xd8\x3d\x09\x43\xfa\x68\x63\
-\xd1\x1c\xdb\xd0\x52\x81\x1e\x0e\x1b\xef\xcf\x6a\xfa\xbb\x19\x34\
-\xd9\x4d\xc0\x53\x27\x12\xf5\x5b\xf2\x72\xab\xf4\x76\xe9\x41\x7e\
-\xbc\x27\x00\x60\xc9\x02\x40\x91\xf4\x4a\xb1\xce\x9f\x4d\xa5\x5f\
-\x67\x2c\x7e\xf1\x4d\x11\x15\x91\x48\x1d\x4d\xd4\x2e\x5f\xd3\x80\
-\x77\x97\xfa\x61\x73\x79\xe0\x2b\x2e\x84\x5d\x3e\xf7\xe6\xbb\xe0\
-\xc8\xcd\xc1\xf0\x42\x01\x80\xe8\xfe\xba\x40\x1c\x81\x58\x12\xe3\
-\xe4\x7d\x3c\x91\xc4\x16\xbf\x00\x40\x8e\x6d\xcd\x41\x74\xb6\xfa\
-\x11\x6a\xf7\x23\x12\xec\x46\x45\x41\x0e\x0e\x9b\x51\xae\xbc\x88\
-\x68\x3a\xb9\x82\xa1\x02\x00\x72\xa3\xd6\xe3\x1c\x50\xea\x68\x36\
-\xcd\xdd\xfa\xd8\x1f\xb7\x0d\xa4\x11\x48\x04\xde\xdb\x6f\xbf\xad\
-\x54\x10\xbd\x12\x2d\x51\x3a\xfd\x9d\x08\xb6\x04\x10\xec\x08\xc0\
-\x42\xa1\x9c\x94\x6e\x95\x6b\xdb\x92\x70\xe5\xc9\xbd\x95\xe5\xa1\
-\xb0\x28\x6d\x08\x6b\x5b\x21\x96\x0e\xf9\x2a\x37\x37\xc7\xe4\x19\
-\xf5\xc0\x82\xe9\xb5\xbf\xbd\x7d\xbd\x00\xfe\x02\x79\x49\x97\xb0\
-\x4d\x3a\xc3\xaf\x91\x3d\x0d\x00\xaf\x01\x80\x2a\x11\xc5\xaf\x48\
-\x4f\x5b\x4d\xd4\x93\x22\x9a\x57\xac\x58\xc1\xdc\xbd\x42\x7d\x28\
-\x1c\xc5\x53\xaf\x6f\x44\xdc\x26\xe2\xce\x57\x80\xbc\xb2\x62\x79\
-\x58\x27\xac\x2e\x1a\x53\x56\x94\x08\x08\x68\xfc\x35\x84\x12\x0a\
-\x00\xa3\xbd\x56\x05\x80\xf6\xa0\x58\xdf\x61\xe1\xe6\x60\x0c\xdd\
-\x5d\x51\xf8\x9b\x5a\x10\x68\x6d\x43\x3c\xd4\x85\x19\xe3\xf2\x31\
-\x62\x48\x5e\xc6\x68\x23\x11\x68\x67\x98\xf5\x78\xb6\x58\xdf\x55\
-\xc2\xeb\xa6\xb9\xf9\x95\x57\x5e\x81\x97\xd7\x96\xeb\xc6\xc2\x31\
-\x04\xea\xbb\x91\x13\x91\xbf\x59\x72\xe0\xce\xf5\xc0\xe1\x14\xe3\
-\x36\x9a\x84\x55\x24\x5a\x4c\xc6\x20\x14\x08\x09\x21\x45\xea\xb8\
-\x2d\xc8\x1b\x96\x8f\xd2\xaa\x52\x45\x70\xad\xb2\x02\x81\x80\xf2\
-\x92\xe8\x69\xf4\x67\x1c\x8a\xdb\xb7\x62\xe2\xc4\x89\x57\xcb\xcb\
-\x3a\xa4\xd5\x40\x97\xf4\xf0\x9e\x04\x80\xd3\x00\x40\xb1\xb8\x63\
-\xc3\x45\x14\xbe\x1c\x34\xdc\x24\xde\x38\x39\xb2\x55\x74\x7f\xa1\
-\x10\x85\x3f\x98\xb7\xac\x09\xcb\x37\x05\x61\xcf\x13\xb1\x4f\xf7\
-\x2d\xcf\x01\x97\x10\xdd\x2e\xc4\xf7\x88\xcb\x67\xcb\x91\x01\x12\
-\xab\xbf\x3b\x41\xb1\x99\x92\xf1\x49\xc1\x2a\xba\x3f\x25\xdc\x1d\
-\x0e\xc5\x10\x0b\x44\x11\xec\x8e\x20\xd8\x15\x12\xab\x33\x8a\x51\
-\xe5\x5e\xec\x35\xba\x02\x35\xc3\xcb\x15\x21\xfa\x22\xf8\xee\x26\
-\xbc\xb9\x51\xad\xcd\x9b\x37\x4f\x3d\x67\xaa\x3b\x09\x67\xd8\x81\
-\x3c\x77\x1e\xbc\x9e\x3c\xb8\x9c\x6e\x14\x56\x17\x28\x1a\x46\x1a\
-\xc3\x70\x55\xba\xe5\x26\x52\xf0\x6f\xf2\x23\x6e\x89\xcb\xb3\x04\
-\xe5\x39\xe3\xc8\x29\xb6\xa3\x6c\x5c\x05\xdc\x86\x34\x88\xd1\xdd\
-\x14\x57\x59\xdb\x4c\xe6\x96\xf1\x04\xe4\x59\x16\x2e\x58\xb0\xe0\
-\x2b\x5f\xf9\xca\xcf\xe4\x6d\xad\x01\x80\xce\xff\x04\x00\x18\x03\
-\x28\x3e\xe0\x80\x03\xf6\x7e\xf7\xdd\x77\xff\xa2\x75\x19\x45\xda\
-\xca\x95\x2b\x95\x61\x43\x31\x97\x10\xa2\x3e\xf5\x46\x2d\x12\x76\
-\x0f\x5c\x65\xe5\x70\xf8\x3c\x42\x78\x9b\xe2\xfe\x5c\x01\x80\xdd\
-\x61\x91\x41\x49\xa9\x60\x77\xdc\x70\xcd\x2c\x09\x79\xc7\xa3\x88\
-\xc6\x3c\xb9\x62\xb1\x9c\x67\x64\x91\x17\xa3\xca\xf2\xe1\x75\x3b\
-\xb6\xb3\xf2\x33\xf9\x87\xec\x00\x54\x3f\xc1\xa5\x5d\x05\x06\x09\
-\x24\xc6\x2f\xe6\xfe\xe3\x5f\x28\xb2\x17\xa2\xac\xa8\x5c\xc5\x26\
-\x3c\x39\xb9\xca\xee\x70\x7a\x9d\xa2\x02\x80\x84\x80\xc3\x9a\x6b\
-\x55\xa3\x46\x20\x13\x00\xd1\x78\x04\x81\x8e\x6e\xf1\x78\x82\xb0\
-\x79\xc5\x0b\xda\x2b\x1d\xd3\x60\xa3\x61\xcb\x67\xa2\x44\xeb\x35\
-\xd0\x25\x9f\xbd\xf0\xc2\x0b\xef\x9c\x72\xca\x29\xf7\x18\x00\x68\
-\xde\x63\x00\x10\xd4\x5b\x98\x01\x34\xa2\x80\x2a\x08\x74\xdc\x71\
-\xc7\x1d\xf0\xcc\x33\xcf\x3c\x4c\x57\x4f\xbb\x42\x0b\x17\x2e\x54\
-\x83\xc1\x41\xda\xda\x16\xc6\xeb\x0b\x5a\xe1\x28\x28\x16\x00\x14\
-\x23\xc7\x2d\x3a\x4e\x44\xa2\xd5\x69\x11\x1d\x6d\x41\xae\x43\x7e\
-\x23\x0f\x1c\x15\xa2\x47\x63\x71\xd8\x52\x49\x8c\x10\x5d\x39\x22\
-\xdf\x83\xe1\xf9\x5e\x14\x79\x5c\x69\x60\x6d\x2b\x03\xdb\x8e\xcb\
-\xfb\x23\xbc\xb6\xba\x95\x4f\x2e\xbf\x25\x50\xbb\xbb\xbb\x15\x07\
-\x53\x75\xd8\x8c\x60\x0e\xdf\x0f\x06\x14\x54\x03\xd1\x48\x14\x8f\
-\xff\xf2\x51\x54\x16\x57\x61\x48\xd9\x50\x14\x79\x8b\x91\xef\xcd\
-\x17\xbb\x46\x6c\x1a\x8f\x3c\x67\xca\x82\x44\x47\x02\xb6\x22\x9b\
-\x62\x9d\x64\x50\x00\x1e\x11\xef\x85\xe1\xed\x68\x08\xc1\x70\x00\
-\xe1\x58\x10\x8e\x22\x17\x8a\xc7\x97\x64\x8c\x54\xde\x1f\xd5\x99\
-\x06\x85\x7a\x0e\xd3\x75\xef\xbb\xf7\xde\x57\xae\xb9\xe6\x9a\xdf\
-\xec\x71\x00\xc8\x80\x59\x64\x10\x73\x44\x57\xe9\x28\x60\xe9\x59\
-\x67\x9d\x75\xe4\xa3\x8f\x3e\xfa\x4b\x9d\x07\x08\xcb\xf1\xc3\x0f\
-\x3e\x50\x56\x39\xdb\xca\x0d\x9d\x58\xba\x31\x0c\x77\x79\x25\xec\
-\x42\x54\xab\x88\x7c\xab\xa8\x38\x0b\x2d\x06\x5b\x0a\x5e\x6b\x12\
-\x95\x1e\x07\x86\xf8\x72\x51\x9d\x9f\x8b\xca\x3c\x4f\xc6\x8a\x4e\
-\xea\xf0\xac\x29\xc0\x94\x9d\x1a\xb6\xf4\x78\x6b\x0a\x40\x19\xc4\
-\x16\x0f\x45\xb9\x6d\x04\x01\xff\xae\xfd\x7e\x02\x95\xa1\xe5\xb8\
-\x91\x88\x22\x08\x28\x7a\x19\x79\xec\xcb\x10\xcb\x06\x19\xbf\xf7\
-\xd7\xdf\xfc\x15\x8e\xa8\x03\xd5\x65\xd5\xc2\xb5\xc5\x22\xa1\xc4\
-\xf8\x2c\x74\x21\xc7\x61\x53\x46\x60\xb2\x53\x24\x40\xbe\x15\x16\
-\xc1\x57\x32\x22\x60\x14\x10\x20\x47\x40\x2f\x6e\x6e\xa0\xbb\x0b\
-\x81\x68\x37\xc2\x89\x10\xf2\x46\xe4\x23\x7f\x68\x81\x3a\x2f\xef\
-\x8d\xe3\x59\x5e\x5e\xde\x23\xc0\xa4\x01\x70\xe3\x8d\x37\x3e\x73\
-\xc7\x1d\x77\x3c\xb1\xc7\x01\x50\x59\x59\x69\x09\x06\x83\xf6\x8e\
-\x8e\x0e\x15\x05\x94\x9b\x29\xbd\xe0\x82\x0b\x4e\xb8\xfb\x9e\x7b\
-\x7e\x42\xbf\x36\x65\xb8\x65\xa2\xa2\x94\x01\x48\x34\x2f\xfb\xac\
-\x13\xeb\xb6\x8a\x05\x5c\x2e\x06\x21\x8d\x3d\x67\x0a\xa5\x32\x40\
-\x35\x62\x0d\x8f\x2c\xf4\x62\x44\x81\xb8\x4f\x39\xdb\xf4\xb8\xf6\
-\xe3\xb7\xb3\xd6\xfb\x21\xb6\xf9\x3d\x7f\x47\x82\x6f\xda\xb4\x49\
-\x0d\x62\x59\x59\x99\x32\x14\x1d\x26\x5f\x5b\x1b\x8a\xba\x69\x77\
-\x8c\x81\x25\xfe\x96\xd5\x3c\x5a\x0f\xf7\x07\x04\x02\x60\xfe\xdc\
-\xf9\xa8\x5f\xd1\x80\xaa\xf2\x2a\x14\x8b\x94\xcb\xf3\xe6\xc1\x5d\
-\xe8\x16\xaf\x46\x40\x14\x93\xfb\x11\xcd\x68\x11\xa3\x8f\x00\xe0\
-\x15\x13\x01\x79\x36\x8b\x80\x5b\x24\x41\x3c\x12\x47\x77\xb0\x13\
-\xdd\xb1\x2e\xe5\x25\x14\x4f\x15\xa3\xd0\x9e\x96\x02\x1c\x47\xde\
-\x3b\xd5\xa8\x6e\xfc\x3d\xa3\x89\x57\x5d\x75\xd5\x1f\xee\xbf\xff\
-\xfe\xbf\xc9\xdb\x2d\x06\x00\x3e\x7f\x23\x70\xda\xb4\x69\xe4\x7e\
-\x6b\x7d\x7d\xbd\x43\x06\xcb\x2d\x04\xcf\x97\xf7\x65\x17\x5f\x7c\
-\xf1\x19\x37\xdd\x7c\xf3\x25\x51\x43\x77\xc9\xdf\xb1\x56\xfc\xff\
-\x02\xe1\x24\x12\x73\xd9\xfa\x6e\x74\xc6\xdd\x98\x34\xa5\x06\x63\
-\xab\x8b\x50\x53\x99\x0f\x9f\xdb\xb9\x8d\xe0\xbd\x24\x5e\x7a\x10\
-\x7b\x10\x5c\xcf\xeb\xd1\x37\xa7\x0b\x4a\x00\xaa\xe8\xa3\xc1\xcd\
-\xec\x3a\x00\xc3\x4e\xe2\x12\x14\x5a\xf4\xeb\xdf\x0b\xc0\xd5\x39\
-\xd8\xc6\x8d\x1b\x97\xc9\x5b\xf4\xd6\x78\x8e\xfa\x8d\xf5\xf8\xe0\
-\xf9\x0f\x51\x55\x5a\x85\x92\x82\x52\xb1\xe2\xf3\xe1\x72\xb8\x60\
-\xb7\xda\xc5\xfb\xb3\x1a\xe9\x6b\x21\x1e\x5f\x30\xa5\x21\xf6\x4e\
-\x52\x3c\x9d\x84\xf4\x64\x5c\x40\x40\x49\x14\xf6\xa3\x3b\xde\x09\
-\xaf\x78\x06\xde\x21\x5e\x75\x6e\x82\x97\xe7\xa7\x2a\xcd\xbe\xe6\
-\xf7\xbe\xf7\xbd\x07\x1f\x7f\xfc\xf1\x7f\x1a\x00\xd0\x5e\xc0\xee\
-\x75\x03\x8f\x3e\xfa\x68\x0b\xfd\x68\x19\x24\x0b\x9b\x10\xcb\x22\
-\xee\x47\x0e\x6b\xff\x84\x58\x1e\xe1\x94\x02\xf9\xac\xe2\xa2\x8b\
-\x2e\x3a\xef\xb2\xcb\x2e\x3b\x93\x37\xcc\x20\x4c\x4b\x73\xb3\x32\
-\x02\xc7\x8c\x19\xa3\x6e\xbe\xb8\xa4\x4c\xdc\xa4\xfc\x34\x01\x34\
-\x87\xf7\x23\xd6\x77\x86\xeb\xd9\x28\x36\x19\x9c\xa1\x2b\x35\x74\
-\xe8\x50\x25\xea\x29\x2e\xf9\xf9\xa2\x4f\x16\x61\xfd\xfb\xeb\xb0\
-\xea\xfd\xe5\x48\x8a\x51\x86\x90\x18\x91\x54\x41\x1e\x60\xc8\xf8\
-\x61\x18\x75\xc8\x68\x4c\x9b\x39\x4d\xdd\x2f\xef\x8b\x00\xf1\xfb\
-\xfd\x2a\xee\x3f\x69\xd2\xa4\x74\x42\xaa\x17\x10\x28\xf1\x2c\xb8\
-\x7d\x5a\x98\xb1\xbc\xa0\x02\x15\x62\x08\x16\x16\x8b\xee\x16\x2f\
-\xc0\x61\x73\xa4\x01\x40\xca\x5b\x0d\x10\x58\x53\x69\x00\x84\x85\
-\xf8\xb1\x6d\x59\xc7\x50\x34\x08\x7f\xa4\x0d\x16\x8f\x15\xf9\x13\
-\x0b\x32\x60\xe5\x98\xf2\x59\x32\xe1\x62\x61\x12\x02\xe0\x5b\xdf\
-\xfa\xd6\x9d\x62\x77\xbd\x89\x6d\x6e\xe0\xee\x89\x03\x1c\x7b\xec\
-\xb1\x16\x31\x3c\x2c\x44\xbd\x1c\xad\x7c\x5d\x57\x57\xa7\x6e\x7f\
-\xf3\xe6\xcd\x36\x19\x18\xbb\x70\x88\x4b\x8e\x5e\xe9\x45\x22\x3a\
-\x2b\x84\xf8\xdf\x3b\xf9\xe4\x93\xbf\xc6\x1b\xa3\xa8\xa5\xe1\x42\
-\x1d\xab\x42\xbf\xa6\x90\x6c\xc2\x14\x75\xeb\x95\xbb\x77\x01\x08\
-\x14\xe1\x8c\x3b\x70\xc0\x18\x98\xe1\xfd\x73\xd0\x16\x7e\xb0\x10\
-\xef\x3e\x34\x17\x91\xe5\x62\x68\x25\x1c\x28\x12\x23\xb4\xb8\xb2\
-\x04\xf1\x8e\x38\xec\x05\x76\x74\xb4\x75\x60\x6b\x6d\x83\x78\x20\
-\x62\x20\x56\x5b\xb0\xd7\xe9\xfb\x60\xf6\xb1\xb3\x33\x36\x02\xc1\
-\x24\xa0\x67\x65\x70\x9f\x20\xa0\x04\x79\xe3\xa9\x37\x44\xd7\xa7\
-\x04\x00\x15\x02\xf8\x62\x78\xbc\xe2\x05\xd8\x9c\x62\xf8\x5b\xd5\
-\x7f\x69\xe2\x1b\x20\xa0\xe4\x0b\xd3\xb6\x49\x66\x3a\x3d\x9f\xf6\
-\x50\x2b\x02\xf1\x6e\x14\x4f\x2b\x85\xc5\x96\x56\x51\xb4\x51\x54\
-\x98\x9b\xc5\x30\x46\xe3\xb8\x1e\x79\xe4\x91\x37\xbd\xf9\xe6\x9b\
-\x1f\x1a\x00\x68\xdd\x69\x00\xcc\x99\x33\x47\x11\x5b\xba\x45\x38\
-\x86\xc4\xb7\x0a\x87\x5b\xe4\xa1\xac\x42\x70\xa6\x7d\x6d\x32\x10\
-\x72\x4d\x1b\x2d\x7f\x65\xfd\x4b\x77\xcb\x67\xbe\x19\x33\x66\x4c\
-\x12\x11\x79\xf0\xa9\xa7\x9e\x7a\xf4\xb0\x61\xc3\x2a\xb4\x05\x9b\
-\x49\xa9\x6a\x3d\x3e\x00\x62\x0f\x18\x08\xbd\xbc\x27\xc8\xc8\xf9\
-\xe4\x56\xb9\x8f\x8c\x25\xfd\x8f\x07\xfe\x8e\xcd\x4f\x7f\x86\x3c\
-\xab\x0f\x65\x62\x7f\xe4\x3b\x0a\x30\xfd\xec\x19\x42\x0e\x1b\xb6\
-\xbc\x5c\x8b\x21\x47\x0e\x81\xc5\x65\xc1\x92\xa7\x3e\x41\x87\x88\
-\xdf\xba\x0d\x9b\xc4\x20\x0b\xc0\x3b\xab\x00\x47\xfd\x70\x8e\x02\
-\x92\x0e\x35\xd7\xd6\xd6\xe2\xa0\x83\x0e\x52\x52\x25\xfb\xfa\x2a\
-\x39\x33\x6f\x39\x36\x7e\xb2\x09\x55\x25\x62\x07\x14\x96\x20\xaf\
-\x30\x57\x3c\x1c\x31\x04\x2d\x39\xdb\x2a\x9d\x2c\x46\x2e\x40\x6c\
-\xe5\x54\x3c\xa5\xb2\x9d\xc9\x38\x73\x14\x04\x40\x02\x5d\x91\x0e\
-\x91\x02\xad\x28\xde\xab\x0c\x70\xa7\x81\xc2\xb4\x37\x01\x60\xce\
-\x4c\x12\x00\x53\xa6\x4c\xb9\x72\xf9\xf2\xe5\x4b\x91\x8e\x04\x6a\
-\x00\xec\x38\x14\x7c\xcc\x31\xc7\x28\xb1\x4e\xce\xd6\x5d\xb8\xc6\
-\x2a\xe2\x8e\x47\x9b\x0c\xa2\x22\x3a\x5d\x3d\xe6\xfc\x79\x44\x3a\
-\xea\x67\x17\x62\x97\x4f\x9d\x3a\xf5\xa0\x03\x0f\x3c\xf0\x80\x89\
-\x13\x27\xce\x94\xc1\x28\xd7\x04\x57\x44\xa7\x1e\xcf\x4a\x07\xef\
-\x12\xa7\xef\x00\x08\x6a\x30\x8d\xa0\xd3\xa2\x45\x8b\x50\x53\x53\
-\xa3\xb8\x91\x83\xf9\xfc\xcf\x9e\x41\xfb\x5b\xcd\xa8\x28\xac\x42\
-\xcd\xde\x63\x91\x67\xc9\x17\xc3\x53\x54\xd1\xb8\x62\x35\x54\xc1\
-\xd5\x21\xb8\x46\x8a\x27\x9b\x6b\x81\x7f\x43\x1b\xba\x52\x9d\x68\
-\x0d\xb6\x60\xc3\x8a\xb5\xa8\x6b\xac\x85\x67\xac\x0f\x5f\xb9\xf1\
-\x50\x0c\x1d\x36\x54\x5d\x83\xc6\x21\x8d\xc4\x59\xb3\x66\xf5\xb0\
-\x19\x34\x41\xda\x9b\xda\xf1\xd6\xd3\x6f\x8b\x2b\x38\x44\xae\x53\
-\x0a\x5f\x9e\x0f\xee\x3c\xb7\x32\xe8\xac\xb6\xb4\x1a\x20\xc1\x59\
-\xd0\x95\x32\xaa\xfc\x52\x89\xb4\x87\x43\x5b\x40\xd5\x39\x44\x02\
-\x68\x0d\x35\xc1\x37\xba\x10\x16\x5f\xfa\x59\x09\x3e\x7a\x53\x94\
-\xac\x66\xc0\x89\x34\x3a\x5f\xfe\xf6\x19\xb6\x85\x82\x03\x7d\x02\
-\xe0\x84\x13\x4e\x50\x44\x27\x97\x4b\x57\x62\x9d\xd3\xb6\xc4\xd7\
-\xb4\x36\x37\x37\xdb\xc8\xf5\x72\x03\x9a\xd8\xec\x76\x19\x6c\x87\
-\x58\xc1\x79\x5f\xf9\xca\x57\x66\xec\xbd\xf7\xde\x07\x48\xdb\x5f\
-\x5c\xc0\xb1\xb4\x05\x34\xb1\x75\x01\xc5\x76\x04\x1f\x28\xf1\xfb\
-\x21\xf0\x40\x02\x3a\x6c\xd4\xd5\x73\xe7\xce\x55\xba\x9b\x62\x9b\
-\xc4\x7a\xfb\xb7\x73\x51\xf7\xcc\x46\x54\xf9\xaa\x31\x6a\xf4\x58\
-\x94\xbb\x87\xa0\x38\xbf\x18\xce\x62\xb1\x67\x2a\xd2\xa5\x67\xe1\
-\xc5\x51\xb8\xa6\x38\x15\xa7\x45\xeb\xa2\x08\x37\x45\xd0\xdc\xbc\
-\x15\x0d\x1d\x75\xa8\x6d\xd8\x80\x3a\xff\x66\x94\xec\x5b\x89\xfd\
-\xaf\x3d\x50\x85\x66\xf9\x9c\x4c\x6c\x09\x03\x28\x9d\x9c\x7d\xaf\
-\x04\xc1\x73\xbf\x79\x1e\x45\xde\x22\x94\x97\x94\xa3\xc0\x57\xa0\
-\x82\x41\xba\xf6\xc1\x62\xb1\x1a\xe5\x9e\x29\x55\xe6\xa9\x41\x90\
-\x96\x00\xe9\x1e\x8e\x84\xd1\x1c\x6a\x84\xaf\xa6\x00\x29\x6f\x5a\
-\x5a\x30\x1e\x40\x63\x96\xea\x47\x37\x91\x4a\x51\xa1\xe3\xf7\xe4\
-\xe5\x46\xe9\x0d\x26\x00\xf4\xcc\x06\x9e\x76\xda\x69\x5a\x9f\x2b\
-\xee\x16\x71\x42\xf1\x4e\x4d\x64\xa3\x38\x27\xa7\x93\xd8\x06\xb7\
-\x3b\x04\x59\xae\xc3\x0f\x3f\x7c\xd2\xd8\xb1\x63\x67\x1d\x76\xd8\
-\x61\xfb\x0b\x00\xa6\xc8\xe7\xce\xec\x0c\x9b\xb2\xd6\xfb\x22\xf8\
-\xe7\x0c\x84\x6c\xee\x27\x51\x98\x96\x25\xf7\x73\xa0\x3f\x7d\x7f\
-\x35\x16\xde\xf6\x01\xaa\x9c\xd5\x18\x59\x3e\x16\xc3\x8b\x6b\xe0\
-\x1b\xe2\x13\x7d\x6c\x87\x6b\x8c\x88\xe4\x42\x51\x0f\x5d\x29\x44\
-\x04\x00\x8e\x49\x76\xd8\x8a\xac\x88\xfb\x85\xfb\x3e\x0d\x23\x99\
-\x2f\x22\x77\xa3\x1f\xeb\x37\x7c\x8a\x0d\x4d\x6b\x51\x1f\xaa\xc5\
-\x98\x33\x26\x61\xfa\x19\xfb\xaa\xeb\xd1\x1e\xa0\x9a\x11\x29\xba\
-\x5d\xb1\x08\xa5\xc2\xbf\x5f\x7a\x0f\xa1\xa6\x20\x2a\x4a\x2b\xc5\
-\xe8\x2d\xca\xb8\x9e\x2a\x85\x8c\x34\x00\x94\xa3\x23\x9c\x9f\x96\
-\x00\x48\xeb\xff\xe8\x36\x00\x34\x05\xeb\x91\x3f\xa1\x08\x49\x47\
-\x22\x63\x03\xf0\xd9\xcc\xae\x20\xcb\xd0\xc5\xbb\xb9\xc4\x00\x40\
-\x23\xb2\xb3\x81\xdf\xf8\xc6\x37\x2c\xf9\x9c\xa4\xe9\xf5\x5a\x44\
-\x6c\xd9\xc4\x88\xb3\xb5\xb7\xb7\xe7\xc8\x8d\xd8\x0d\x0e\x77\x08\
-\x51\xf9\xda\x21\x9c\x3d\x42\xac\xf5\x59\x62\xf1\x1f\x50\x5d\x5d\
-\x3d\x43\x1e\xa4\x40\xa7\x29\x75\x57\xd6\xfa\x00\x09\xbe\x4b\x62\
-\x7e\x00\x22\x3f\x9b\xfb\x5f\x7a\xe9\x25\x95\x8a\x65\x44\x2f\x1e\
-\x8b\xe3\xb5\x2b\x5e\x80\xbb\x21\x17\x35\x05\xe3\x30\xa6\x6a\x22\
-\xbc\x65\x5e\x15\x95\x73\x38\x04\x00\xa3\x9d\xb0\xda\xad\x48\xb5\
-\xc9\xf3\xad\x8f\xc3\x56\x2d\x84\x29\x51\xa5\xdc\x08\xaf\x8b\x20\
-\x61\x4f\x22\xdc\x12\x46\xb0\x2d\x84\x4f\x37\x2f\xc7\xba\xf6\xd5\
-\x08\x39\x02\x38\xf0\xbe\xc3\x90\x5f\x9a\x76\x69\x59\x08\x22\x2a\
-\x50\xd9\x1a\xe6\xfb\xa3\x58\x5e\xbb\x6c\x1d\xd6\xcc\x5b\x8d\xca\
-\x32\x71\x07\x8b\x4a\xd4\x3d\x39\x8d\x6a\x66\xe5\x86\xd2\x1b\x48\
-\xa6\x09\x0f\xda\x00\x89\xb4\x2d\x90\x90\xfb\x8e\xc7\x58\xfc\x1a\
-\x44\x4b\x58\x24\xc0\xe4\x42\xc4\x93\xf1\x8c\x0d\x30\x61\xc2\x84\
-\x1e\x6a\x47\x40\x58\x2f\xb4\xba\xda\x00\x80\x39\x1d\x1c\xb3\xd0\
-\x8a\xe7\x2c\x5d\x01\x80\x4d\xb8\xc3\x26\xba\xcb\x4e\xee\x46\x3a\
-\x76\xef\x12\x62\x97\x4e\x9f\x3e\x7d\x96\x10\x7e\x96\x88\xf6\xfd\
-\x45\x42\x0c\xd5\x7a\x9c\x89\x08\xfa\xa4\xdb\x59\xeb\x83\x25\xf8\
-\x4e\x70\xf7\x40\x45\xbe\xb9\x71\x70\x9e\x7e\xfa\x69\x88\x3d\xa2\
-\x06\x79\xd3\x7b\xeb\xb1\xf2\xff\x2d\xc1\x68\xdf\x44\xec\x55\x36\
-\x55\x15\x9d\x3a\x0b\x9c\xb0\x3b\x72\xe0\x12\xf1\x6f\xb3\xd8\x60\
-\x09\x59\x54\x70\x46\x55\xdb\xd3\x22\xcf\x49\xa9\x9e\x60\x64\x2e\
-\x14\x43\xa4\x33\x22\x3d\x8a\x2e\x7f\x27\x96\x37\x7f\x82\xb5\xfe\
-\x95\x18\x75\xc2\x38\x8c\x3d\x6d\xbc\xba\x26\x0b\x5c\xc8\xd1\x47\
-\x1c\x71\x44\x8f\x08\x9d\x2a\x12\x09\x84\xf0\xea\x93\xaf\xa9\x80\
-\x50\x69\x49\xa9\x12\xdb\xf4\x88\xec\x39\x54\x3b\x86\x0a\x48\x64\
-\x01\x40\x5c\xc1\x78\x34\xae\xc0\xdb\x15\xea\x40\x20\xa7\x1b\xee\
-\x31\x1e\xe5\x81\x90\xf1\x18\x94\x62\x2c\xc2\xec\x05\x88\xc1\xbb\
-\x6e\xaf\xbd\xf6\xba\x41\x5e\x6e\x32\x24\x00\xab\x82\x42\x0a\x00\
-\xe2\x1f\xda\x44\xec\x58\x39\x49\x53\xb8\xdf\x29\x84\x75\x09\x5a\
-\x4a\x4f\x3a\xe9\xa4\xd3\xbe\xfa\xd5\xaf\x7e\xcd\xe7\xf3\x4d\x94\
-\xc1\xb5\x99\x09\x4e\x2e\x37\xd7\x9c\xed\x12\xb7\xef\x22\xf1\x07\
-\x1a\x87\x27\x68\x3f\xfe\xf8\x63\x7c\xf6\xd9\x67\xca\x5a\x57\x19\
-\xb2\xfb\xc5\x2b\xfa\x04\xd8\xa7\x74\x3f\x54\x15\x56\xc3\xe9\x11\
-\x9d\xef\x12\xee\x77\xdb\xe1\x1e\x2a\x6e\x61\x42\x74\xb1\x68\x49\
-\x4b\x14\xe9\xea\x7a\x51\x80\x8c\x05\xa4\xec\x62\x8c\xe5\x90\xfb\
-\xa3\x88\xfa\xa3\x2a\xbe\x1f\x0d\x45\x51\xd7\xbe\x19\x8b\x9b\xe6\
-\x21\x25\x46\xf9\x94\x5b\xa7\x2b\x2e\xa4\x21\xc8\x40\xd7\x29\xa7\
-\x9c\xd2\x43\x2c\xeb\xb0\xf0\x8b\x4f\xfc\x13\x79\xce\x3c\x94\x95\
-\x8a\xc1\x59\x54\x68\xd8\x01\x0e\x05\x00\x25\x01\xe2\x06\x00\x84\
-\xf0\x29\x79\xcd\x80\x90\x02\x80\xf4\xd6\x40\x13\x6c\x43\x6c\x48\
-\xe4\xa5\xf3\x1d\x04\x01\xaf\x39\x62\xc4\x88\x1e\x60\x5b\xb0\x60\
-\xc1\x12\x91\x42\xb7\xc9\xcb\xcd\x48\x4b\x80\x0e\x68\x09\x70\xee\
-\xb9\xe7\xda\xc5\x6f\xb5\x33\x56\x2f\x48\xcd\x15\x5d\x7e\xc0\x4f\
-\x7e\xf2\x93\xfb\x44\x14\x55\xaa\x70\x27\x83\x35\x44\x57\x2f\xb3\
-\x77\xfa\x7b\xad\x01\xa2\x83\x38\x30\xfd\x9d\x46\x55\x8e\x61\xec\
-\x58\x4d\x93\x25\x76\xa7\xbe\xef\x0d\x00\x2f\xbe\xf8\xa2\x02\x2f\
-\xa3\x7d\x1c\xb0\xb7\x2f\x7c\x15\x35\x8e\x09\x98\x5e\x39\x2b\x5d\
-\x0c\x62\x00\xc0\xee\xb2\xc3\x59\x26\xba\x58\x5c\xbe\xf4\xb4\x0a\
-\x8b\xe2\xc0\x4c\x61\x1b\x63\xf4\xa2\x97\x23\x0d\x31\x44\xc3\xd1\
-\x74\x17\x00\x04\xba\x03\xf8\xb8\xfe\x7d\xac\xeb\x5c\x8d\x83\xee\
-\x3b\x1c\xf6\x42\xbb\x7a\xfe\x25\x4b\x96\x30\x12\xa7\x44\xbc\xb9\
-\xa9\xb0\xf0\x5b\x0b\xe0\xaf\x6b\x47\x45\x59\x25\x8a\x4b\x59\x25\
-\x94\xab\xd4\x80\x92\x3e\x49\x03\x00\xb1\x6d\x00\x48\x08\xe1\x63\
-\xd2\xa3\xe1\x08\x5a\xe2\x4d\xf0\x4c\xc8\x55\xb6\x00\x9f\x8f\x36\
-\x87\x30\x6f\xa6\xc6\x41\x8f\xd1\x3f\xff\xf9\xcf\x0f\xc4\xb0\xbf\
-\xc7\x00\x40\x93\x09\x00\x71\xcb\x51\x47\x1d\xe5\x92\x1f\xba\x65\
-\x40\xbc\x33\x67\xce\x9c\x7e\xf7\xdd\x77\x3f\x49\x20\x30\x57\xaf\
-\xcb\x9a\x7b\x1b\xf4\xbe\x88\x4f\xab\x85\x15\x37\x01\xb1\x46\x59\
-\xc5\xab\x8b\x1d\x75\x3a\x56\x23\x93\x80\xe2\xec\x9d\x12\xb1\xc6\
-\x79\xcc\xc4\xd0\x3f\x07\xe2\xb3\x91\x3b\x9e\x79\xe6\x19\x35\xb8\
-\x24\x76\x3c\x1c\xc3\xfc\x4b\xde\xc3\xf4\x92\x59\x18\x57\xbe\x17\
-\x5c\xb9\x6e\xb8\x3c\x2e\x38\x3c\x0e\x55\x94\x61\xf5\x88\xf7\x5f\
-\x66\x49\x3f\x16\xf1\x9b\x34\xa2\x73\x2a\x32\x27\x1f\xb5\xa4\x54\
-\x84\x90\x45\x1d\x24\x7e\x38\x18\x96\x2e\xb6\xc0\xd6\x55\x58\xd8\
-\xf4\x1e\x66\x5c\x7d\x10\x72\xc6\xa6\x0b\x37\x96\x2d\x5b\x86\xb3\
-\xcf\x3e\x5b\xc5\xe9\xcd\xf7\xcd\x67\xae\x5d\x57\x8b\xc5\xef\x2c\
-\x41\x55\xa5\xa8\x81\xb2\x52\xe4\xe5\x7b\xd5\xcc\x26\x1b\x43\x42\
-\x22\x81\x14\x00\xa2\x29\x05\x82\x54\x2c\x9d\x0b\x20\x00\xda\x43\
-\x2d\xb0\x8a\x4d\x12\x71\x44\x32\xc5\xab\x0c\x6a\x89\xa8\xef\xa1\
-\xff\x79\xbd\x07\x1f\x7c\xf0\xf5\xcb\x2e\xbb\xec\x21\xa4\x13\x41\
-\x04\x80\x2a\x0f\x57\x00\x98\x31\x63\x86\x8f\x04\x17\xc2\x14\x09\
-\x52\x9e\x11\xf4\x8c\xe7\xcc\x1a\xc6\xb7\x07\x45\x7c\x21\x28\x6f\
-\xa0\x41\x7c\x6c\xa6\x2e\x39\xc8\xcc\x4f\x9b\x8d\x1a\xdd\x74\x7c\
-\x9d\xd7\xa0\xbf\xcc\x56\x56\x5e\x8e\x42\x71\x9f\x06\x0b\x84\x81\
-\x36\x82\xf9\xc9\x27\x9f\x54\xdc\x41\x51\x1c\x6a\x08\x62\xed\xad\
-\x2b\x31\x6b\xc8\x61\x18\x5a\x3c\x1c\x6e\xaf\x1b\x6e\x01\x01\xa5\
-\x80\xd5\x2d\xe2\xd7\x69\x51\xdd\x5a\x28\x9d\xd6\x10\x89\x4f\xab\
-\x5c\xd4\x41\xb2\x5d\x88\xcf\xd0\x70\x24\x1d\xa2\x8d\x04\x23\x69\
-\x00\x74\x87\x51\xd7\xba\x19\xef\xd5\xbd\x81\xd1\x67\x4d\x84\x7b\
-\xa6\x47\x81\x9e\x91\x41\x71\x8f\x19\x8c\xe9\x71\xef\xaa\x64\x5d\
-\xac\xf9\x7f\x3c\xfa\x02\x2a\xcb\x2b\x55\x26\x2f\xbf\x28\x1f\x1e\
-\x8f\x5b\x2c\x6f\x3b\x2c\x2c\xda\x16\xe9\x43\xbd\x4f\x10\xd0\xfa\
-\x8f\x45\x63\x08\x86\xbb\x11\xf6\x09\xfd\xca\x2d\x4a\xc5\x10\x00\
-\x1c\x4b\xba\x7f\x4c\x4a\x65\xd3\xec\xe6\x9b\x6f\x7e\xee\xb6\xdb\
-\x6e\xfb\x3d\xb2\x32\x81\x0a\x00\x72\x63\xc5\x42\x8c\x82\xe3\x8f\
-\x3f\xfe\xa8\xeb\xae\xbb\xee\x41\x22\xa9\xa3\xb3\x73\x50\xc4\x27\
-\x41\x1b\x1b\x1a\x54\xa5\x0b\x51\x4e\x2b\xdb\x6e\x9a\x85\x93\x4d\
-\xb0\xec\xd9\x36\x14\x5d\xd4\x93\x3c\xcf\xe8\xd1\xa3\x15\x78\x2c\
-\xbd\xa9\x86\x9d\x24\xbe\x06\xc0\x23\x8f\x3c\xa2\xfc\x7f\x35\x63\
-\xa6\x31\x8c\x0d\x77\xae\xc5\xec\xa1\xc7\xa0\xac\xb8\x42\x85\x62\
-\x5d\x79\x2e\x05\x00\x95\x89\x13\xf1\x6f\x51\x29\x68\x4b\x5a\xf4\
-\x13\x00\x34\x04\xe3\x30\x08\x02\x05\x80\x94\x00\x21\x1a\x10\x09\
-\x10\x08\x23\xd4\x15\x42\x53\x5b\x23\xde\xae\x7d\x19\x23\x4e\x1f\
-\x07\xfb\x74\xbb\x7a\x3e\x46\x05\x45\xba\x62\xff\xfd\xf7\xdf\x6e\
-\x4c\xc9\x1c\xaf\xfd\xf9\x75\xd8\x62\x36\x05\x02\x02\x94\xd1\x43\
-\x3b\xf3\x02\x49\xab\x02\x01\xaf\xa7\x45\x7f\x38\x12\x44\xd8\x2b\
-\xc4\xaf\xb2\x28\x9f\x9f\x8d\xcc\x44\x10\x64\x73\xbf\x06\xd9\xd5\
-\x57\x5f\xfd\xe4\xbd\xf7\xde\xfb\x57\x64\x55\x03\x29\x00\x88\x75\
-\x5f\x29\x3f\x2e\xf9\x91\xb4\x13\x4f\x3c\xf1\x4c\x35\x07\x4f\x50\
-\xb5\x23\xa3\x4b\xeb\x79\xda\x07\x34\xac\xf8\xa0\x0c\x78\x98\x6b\
-\xe5\x99\x21\x5b\xf0\xc9\x0a\x6c\x6e\x0c\xa2\xbe\xa9\x13\xc1\x50\
-\x04\x43\x2b\xf2\x51\x21\x16\xf6\xa4\x71\xd5\xca\x5d\xd1\x25\xd2\
-\x3a\xd7\xce\xac\x1c\xfd\x58\x5d\x1c\xb2\xab\x84\xd7\x8d\xcf\xf4\
-\xfb\xdf\xff\x5e\x49\x24\xfa\xdb\xac\xbc\x59\xf7\xe3\x95\x38\x7c\
-\xe8\xd7\x51\x5a\x5c\x0e\x4f\xbe\x47\x81\x20\xc7\x9b\x23\xe2\xdf\
-\xb2\x0d\x04\xf6\x2c\x00\x24\x0c\x91\x4c\xe2\x33\x3e\x1f\x14\xe2\
-\x74\x27\x54\xc9\x56\xb0\x53\x24\x5a\x5b\x13\xfe\xb5\xf9\x45\x8c\
-\xff\xc1\x64\x44\x87\x45\xd5\xb3\xad\x59\xb3\x06\xa7\x9e\x7a\x2a\
-\xc6\x8e\x1d\xdb\x6b\x58\x78\xd1\xbf\x17\xa1\x6e\x79\x03\x86\x94\
-\xa5\xd3\xc3\xb9\x1e\xb1\x47\x68\x08\xca\x85\xe9\xf6\x31\xf8\x43\
-\xb7\x2f\x1c\x0d\x22\x5e\x29\x40\xf0\xc6\x32\xc4\xd7\x33\x9f\x68\
-\xf9\xfb\x8c\x62\xda\x6c\x00\x7c\xff\xfb\xdf\x7f\x58\xc0\xcf\x49\
-\x21\xe6\x4c\x60\x06\x00\xc3\x98\xa1\x7b\xe8\xa1\x87\x6e\x9d\x3a\
-\x75\xea\x91\xcc\x68\xf5\xe9\xc7\x67\x7d\x46\x91\xbf\x6c\xe9\x52\
-\x75\x61\x8a\x2f\x6d\xe5\x2e\x5a\xbc\x0c\xbf\x7d\x7a\x1e\x56\x6c\
-\x8a\xa3\x33\xe2\x54\x06\x9f\xc7\x4b\x3d\x6f\x11\xdb\x20\xa2\x8c\
-\x26\x4f\x4e\x02\x95\xbe\x6e\x9c\x7a\xf4\x18\xcc\x39\xfa\x90\x4c\
-\x32\x85\xa2\x8c\x79\xf9\xe1\xc3\x87\x2b\x83\x46\x4f\xb0\xd8\xd5\
-\xc6\x81\x7a\xe2\x89\x27\xd4\x60\xd1\xdd\x72\x3a\x9c\x58\xf5\xe3\
-\x25\x38\xac\xf4\x58\x54\x96\x56\xc1\x2b\xba\xd7\xe3\x13\x00\xe4\
-\x89\xba\xca\xb5\x6c\x03\x01\x1d\xe2\x1c\x8b\x49\x02\xa4\xd2\xb1\
-\x79\x83\xf8\xa9\x80\x01\x00\x21\x7e\xa0\x33\x80\xc6\x96\x3a\xcc\
-\xad\xfd\x27\x26\xdd\x32\x1d\xdd\xb6\x6e\x35\x96\x34\x02\xaf\xbd\
-\xf6\x5a\x55\x2f\x90\xdd\x08\xf2\xc6\xcd\x8d\x78\xf7\x6f\xff\x56\
-\x79\x81\x92\xfc\x52\xf8\x3c\x79\xe2\x09\xa4\x0d\x41\x55\x31\x95\
-\x88\x23\x59\x28\xbd\x34\x29\xae\x5f\x17\x74\x21\x0d\xa5\x35\xc7\
-\x8b\xb1\x7f\x8e\x7f\x5f\xd9\xc7\x33\xcf\x3c\xf3\x9e\xa7\x9e\x7a\
-\xea\x0d\x03\x00\xad\x06\x00\x22\x0a\x00\xb3\x66\xcd\x1a\x25\x28\
-\xad\xba\xf5\xd6\x5b\x7f\x2c\x1e\xc0\x57\xdb\xda\xdb\xb7\x71\x9d\
-\x99\xf8\xc6\x6b\x7d\x24\xb1\x96\x8b\x71\x43\x8e\xe2\xc5\xb5\xcb\
-\x73\xd7\xc3\x2f\xe1\xb5\x8f\x43\x48\x88\xe2\x74\x8a\x28\x9b\xb2\
-\x77\x35\x66\xef\x37\x12\x6b\x1b\xba\x10\x12\x1d\xb6\x6f\x4d\x31\
-\xe6\x2d\xdd\x82\xf9\x1f\x6f\x40\x57\x87\x0c\x50\x2c\x8a\xbd\xaa\
-\xc2\xb8\xf2\x9c\x03\xc4\x3f\x9f\x90\x59\xe6\x84\x52\x65\xf2\xe4\
-\xc9\xdb\x19\x4e\x3b\xdb\xc8\x89\x34\x02\xd7\xaf\x5f\x9f\x39\x67\
-\xe0\x65\x3f\x46\x6f\x98\x88\xd1\x95\xe3\x91\x9b\x9f\x0b\x6f\x81\
-\x17\x39\x3e\x91\x00\x79\xf2\x9c\x5e\x01\x81\x21\x05\x68\xf5\x5b\
-\xac\xe9\xd8\xbc\x32\xc6\x84\xf8\x29\x83\xf8\xc9\x6e\xf1\xcb\x3b\
-\x85\x10\x1d\x41\x74\xcb\xf3\x6c\x68\xfc\x14\x4b\x63\x8b\x31\xfc\
-\xc7\x23\x95\x44\xe3\xb3\x30\xf1\x74\xe3\x8d\x37\x6e\xe7\x05\x68\
-\x02\xf1\x5e\x9e\xfc\xfd\x9f\x50\xee\x29\x47\x69\x01\x01\xe0\x83\
-\xdb\xe5\x56\x15\x42\x49\x8f\x18\x9a\x4e\x31\xaa\x83\x81\x8c\x51\
-\xce\xc6\x71\xe2\x7b\x32\x0a\xf5\x7e\x76\x41\xa8\x19\x60\x5f\xfb\
-\xda\xd7\x7e\xfa\xea\xab\xaf\xbe\x8f\xac\x54\x30\xf9\x82\x00\x18\
-\x2d\x83\x33\xe4\xb4\xd3\x4e\x3b\xfb\x92\x4b\x2e\x39\x97\x96\x7b\
-\x26\x23\xd7\x87\x14\x20\xaa\x3f\x15\xb1\xc6\x20\x07\x7d\x4e\x5e\
-\xa4\xb3\xb3\x0b\x3f\xb9\xff\x2d\x2c\xd9\x94\x44\x71\x49\x11\x26\
-\x4d\x18\x8a\x96\x44\x0e\x0e\x99\x39\x4c\x90\xed\xc5\xa2\x2d\xf2\
-\x00\x62\xc5\xce\x1c\xee\x45\x5b\x47\x08\xf3\x96\x35\x20\x3f\x19\
-\xc1\xca\xd5\x75\xa8\xdb\xd2\x84\x72\x5f\x12\x57\x9d\x3e\x1a\xfb\
-\xed\x3b\x39\x3d\x1d\xdc\x48\xab\xce\x9e\x3d\x3b\x2d\xb2\x77\x11\
-\x04\x7c\x26\x46\xe5\x1e\x7e\xf8\x61\x25\x8a\x95\xb1\x59\x9b\x84\
-\xe3\x59\x17\x66\x56\x1f\x04\x5f\x91\x0f\xde\x42\x2f\x1c\xf9\x22\
-\x7a\x7d\x16\xd5\x2d\x5e\x6b\x5a\x0a\x38\x09\x80\xb4\x3f\xae\xf5\
-\x3e\x09\xcf\x10\x71\x52\x7a\xac\x43\x44\xb2\xbf\x5b\xf5\xf9\x9b\
-\xde\x45\xec\xc0\x18\x2c\x07\xe4\x64\x6a\x04\x18\xde\xbd\xf0\xc2\
-\x0b\x33\x73\x0e\xb2\x1b\x99\xe7\xd9\x67\x9f\x55\x80\xa1\x94\x60\
-\x2e\xc1\x69\x78\x46\x1c\x8b\xec\xb2\x35\xad\xf3\x69\x2f\xd1\xde\
-\xca\x2e\x01\xcb\x06\x80\xd8\x1f\x3f\xfa\xf8\xe3\x8f\x17\x61\x5b\
-\x2a\x38\x90\x01\x80\xa8\x80\x31\xf2\xa2\x8a\x51\x3e\x19\x9c\x3b\
-\xb8\x5c\x4b\xdc\x98\xaf\xd6\xab\x14\x90\xc6\x1b\xfd\xe0\x83\x0f\
-\x94\xde\xe1\xcd\x53\x24\xfd\xf8\xfe\xf7\xb0\x54\x44\x7e\x51\x79\
-\x29\x46\x8f\x19\x02\xa7\xdc\x98\xa5\x28\x0f\x25\x85\x2e\x78\x5c\
-\x36\x34\x87\xc4\x55\x11\x11\x3a\xd2\x67\x43\x20\x9a\x44\x7d\x8b\
-\x48\x89\xf6\x2e\x74\xd4\x6d\x45\x4b\x7d\x0b\x1a\xeb\x1a\x50\x9a\
-\x0b\xdc\x74\xde\x38\x8c\x19\x3d\x42\x11\x8c\x46\x25\x45\x37\x33\
-\x6a\x7d\x21\x7c\x30\x8d\xf7\xfd\xd3\x9f\xfe\x54\x71\x8c\x9a\x0c\
-\x22\x12\xaa\xe3\xf1\x36\x1c\x68\x39\x5c\x06\x5e\x5c\xb0\xa2\x74\
-\x69\x96\xb5\xc0\x0a\x6b\x3e\x41\x60\x4d\x4b\x03\x82\x80\xd2\x98\
-\x06\x60\x30\x4d\xfc\x64\x57\x12\xc9\x0e\x39\x76\x24\x11\xf6\x87\
-\xd1\xdd\xde\xad\xa6\x9c\xbd\xd3\xf0\x1a\x86\xdf\x58\x83\xfa\xf6\
-\x7a\x45\x24\x1a\x80\x87\x1e\x7a\x28\x8b\x65\xfa\x04\x31\xed\x00\
-\x06\xa9\x58\x16\x47\xcf\x89\x2a\x55\x19\x82\xc6\x24\x52\xcd\x74\
-\x7a\xc5\x30\x12\x9d\xa1\xe5\x81\x30\x06\x7f\x2f\xcf\xfb\xfd\xa6\
-\xa6\xa6\x35\x48\x27\x82\x34\x00\xa2\x1a\x00\x35\x04\x80\x9c\x68\
-\xd4\x2b\xaf\xbc\x72\x9f\xa0\xb5\x20\x64\x94\x6b\xf7\x65\xf1\x93\
-\xf8\xac\x4b\xe7\x8d\xb0\x3d\xf4\xd4\x42\xfc\x73\x5e\x87\x0c\x5e\
-\x09\xca\x46\x88\x21\x28\x2a\xa1\x7c\x68\x9e\x88\x55\x07\xa6\x0e\
-\x75\x8b\x3e\xb3\x89\x6f\x2c\xae\x92\xe8\xcf\x83\x87\xb8\x10\x11\
-\x49\xb0\xa4\x2e\x04\x47\x22\x85\x2d\x9b\x3b\x51\xb7\x6e\x0b\x5a\
-\x6b\xeb\x11\x6e\x6f\xc1\xd8\x4a\x27\x6e\xb9\x60\xef\x74\xac\x5e\
-\x74\x1c\xb9\xf6\x90\x43\x0e\x51\x46\xe1\xae\x4a\x01\x9e\xef\x8f\
-\x7f\xfc\x23\x56\xaf\x5e\x9d\x71\x97\x0a\x23\x3e\x38\xff\xe4\xc6\
-\x3e\x55\x33\xe1\x2b\xf6\x29\x10\xd8\x0b\x45\x0d\x14\x0a\xf1\x0b\
-\x2c\x69\x30\xf8\xd2\xc6\xa0\x72\xfb\x3a\xd3\x44\x57\xc4\xf7\x0b\
-\xa8\xdb\x13\x8a\xf8\x9d\x6d\x9d\x58\xb2\x65\x01\xa2\x87\x47\x11\
-\x18\x1f\x54\xba\x99\x22\x7a\xf3\xe6\xcd\xb8\xe5\x96\x5b\xb6\x2b\
-\xd3\xca\x26\x12\xdd\x61\xde\x9b\x9a\xbd\x9c\x9f\x9f\x01\x80\x26\
-\x3e\xbf\xc3\xcf\x69\x68\x73\x6c\x06\x61\x1b\xc5\x85\xa6\xdf\x45\
-\xcf\x4c\x60\xd0\x00\x40\xdc\x22\xae\xc9\x08\x39\x51\xa5\x70\xdc\
-\xc8\xdb\x6f\xbf\xfd\x32\x71\x0b\x67\x76\x76\x75\xf5\xa9\x02\x28\
-\xf6\xdf\x9c\x3b\x17\xe3\xc7\x8f\x57\x37\xb8\xa9\xae\x1d\x57\xdc\
-\xbf\x04\x36\x6f\x21\xf2\x86\x0e\x43\xc5\xe8\x61\x28\x2d\x13\xfd\
-\x95\xe7\x40\x51\xa1\x1d\xc3\x0a\x1d\xb0\xe7\x58\xb1\xa8\x3d\x86\
-\xb0\x10\xfc\x80\x52\x87\x10\x22\x85\x3a\x7f\x14\x5d\x41\x71\x6b\
-\xda\xa2\x68\x6f\x0b\xa3\x5e\x40\xd0\xb6\x7e\xa3\x70\x53\x2b\x2e\
-\x3a\x71\x14\x8e\x3a\xa0\x3a\x73\x3d\xda\x16\x47\x1e\x79\x64\x8f\
-\xf8\xf6\xce\x34\x4a\x15\x66\xe7\xc4\x2f\x56\xe1\x60\x4a\x01\x8a\
-\xe7\xc2\x8d\x79\xa8\xfe\x60\x34\x86\x55\x8c\x50\xaa\x20\xb7\x28\
-\x17\x39\x85\xb6\x34\x08\x8a\xd2\x20\xb0\x78\xe4\xf7\xa2\x39\x49\
-\x74\xd5\xdb\x53\x2a\x2b\x18\x6c\x0f\xa2\x4b\x24\xd9\x96\xad\x9b\
-\xb1\xae\x6c\x25\x72\x4f\xf3\x29\xa2\x93\x68\xf4\x68\xe8\xfa\x31\
-\x0c\xdc\xdf\xbd\xeb\xf4\x30\xdd\x54\x8a\x7e\x4a\x00\x76\x1a\xc6\
-\x04\x02\x5d\x43\xaa\x05\x9e\x63\xb0\x46\xb1\x80\xb0\x4b\x80\x73\
-\x91\x09\x00\x99\x4c\x20\x0c\x09\xc0\xe4\x4e\xb9\x9c\x74\xc4\xf1\
-\xc7\x1f\xff\x8d\x6b\xae\xb9\xe6\x4c\x26\x4d\x7a\x8b\xf5\xd3\x22\
-\xe5\xcc\x16\xea\x67\x1a\x52\x6c\x77\xff\x71\x19\x16\x6e\x48\xc0\
-\x53\x55\x8d\xfc\xd1\xa3\x50\x50\x2a\xee\x94\x70\xbe\xaf\x88\x0f\
-\xc2\x7a\x7e\x1b\x42\x29\x0b\x84\x69\x54\x6a\x5b\xd4\x2a\x5c\x72\
-\x76\x8b\xb8\x35\x71\x51\x0b\x5d\x6d\x11\x74\x09\x18\xfc\xa2\x12\
-\xda\xd7\x6d\x40\xa0\x76\x13\x4a\x64\xb0\x7f\xf1\xfd\x31\xea\xe1\
-\xf5\xd4\x6a\x0e\xa2\xb9\xc8\x61\x67\x1b\x25\xd8\xdf\xfe\xf6\x37\
-\xbc\xf9\xe6\x9b\xca\xcb\xe0\xa0\x72\xb0\xcb\x3e\x2d\xc6\x90\x85\
-\xa3\x50\x51\x52\xa9\xa4\x80\xa7\x50\x3c\x82\x82\x1c\xc3\x16\x30\
-\x24\x40\xd4\x30\xfc\x44\x0a\xb0\x76\x3f\xe8\x0f\x2a\xee\xdf\xda\
-\xdc\x88\xcf\x8a\x57\xc3\xfb\xed\x3c\xac\x58\xbd\x22\x93\x96\x25\
-\x78\x7f\xfe\xf3\x9f\xf7\x39\x61\xc3\xdc\xc8\x4c\xef\xbf\xff\xbe\
-\x72\xef\x68\x54\xf3\x37\x7a\xae\xa2\xb9\x48\x75\xb0\x4d\xd4\xe8\
-\x56\x91\x76\x57\x61\xfb\x54\x70\x4c\x01\x60\xbf\xfd\xf6\xab\x90\
-\x13\x93\x9a\xd5\x43\x86\x0c\x99\x22\x83\x73\x6b\x30\x14\xb2\x50\
-\xd7\x64\x4b\x01\x86\x78\x5f\x7e\xe9\x25\x65\xa8\x90\x38\x9c\xbf\
-\x77\xe1\x9d\x4b\x85\x5b\xca\x51\x30\x7e\x22\x5c\xe5\x22\x4e\x0b\
-\x84\xe3\xbd\x0e\x94\x97\x3a\xe1\x16\x00\xc4\x72\x6c\x88\x88\x05\
-\x1d\x4b\xa5\xa7\x3d\xab\x9c\x72\x2a\x09\xbb\xf8\xb6\x96\x70\x12\
-\x1b\x1b\xc4\x16\xe8\x8e\x23\xd2\x11\x45\xb8\xa5\x0b\xfe\x95\x2b\
-\x11\x6a\x6a\xc0\x75\x67\x8d\xc3\xa4\x51\xe9\x82\x0d\xce\xa6\x91\
-\xfb\x54\x45\xa3\xbb\xc3\x23\x20\xc0\x45\xda\xa9\xea\x19\x8a\x66\
-\x72\x55\xbe\x2f\x1f\xa3\xa2\x23\x91\xff\x72\x11\xca\xdd\x55\xca\
-\x23\xa0\x5b\xe8\x90\x67\xb1\xb9\x6d\x69\x23\x90\x20\x0e\x27\x10\
-\x0d\xc4\xd2\x6e\x9f\x58\xfd\x8d\xad\x8d\x68\x9f\xd1\x84\xc4\xec\
-\x24\x96\x2d\x5f\xa6\xee\x97\x12\x8b\x06\xac\xf8\xdf\xaa\x2c\xac\
-\x3f\x23\x4d\x37\x12\x99\x9e\x8f\x56\x4f\x1c\x63\x02\x40\xaf\x38\
-\xb2\xb3\xee\xb0\x8c\xdd\x7a\xb1\xd5\x7e\x8c\x74\x26\x90\x89\x20\
-\x7f\x0f\x00\x88\x04\x28\x91\x9b\xa6\x32\x1f\x2a\x17\xa8\x11\x6b\
-\xf4\x66\xd1\x43\x95\xcc\x05\x64\xfb\xfd\x5c\xd1\x8b\x7a\x4a\x0c\
-\x46\x75\x53\x1f\x2e\x6b\xc3\x23\x2f\x6f\x45\xde\xc8\xb1\xf0\x8d\
-\x19\xa1\x66\xab\x38\x28\xf2\xf3\xec\xf0\xc9\xb1\x5c\xc0\xc0\xaa\
-\xc3\xa8\x10\x3f\x9c\x4a\x07\x87\x9c\x56\xd6\x8b\xc9\x51\x7a\x77\
-\x20\x81\xa6\xd6\x08\x62\x9d\xb1\x74\x56\xcd\x2f\xd2\x60\xdd\x66\
-\x74\xac\x5b\x8d\xc3\x27\xe7\xe1\x8c\xa3\xaa\xd4\xf5\xdb\xda\xda\
-\x94\xa8\x16\x77\x66\xb7\xb9\x84\x8c\x3c\xde\x74\xd3\x4d\x69\x15\
-\x20\x22\x96\x03\xcc\xd7\x13\x46\x4e\xc0\xd0\xf5\x22\x19\xde\x73\
-\x8a\xb4\xca\x83\xcb\xed\x42\x8e\x33\x5d\xa6\x45\x37\x90\x59\xb8\
-\x70\x28\x3d\x53\xa8\x6b\x8c\x1f\xc9\xa3\xe3\x58\xe7\x5f\xa7\x8c\
-\xbd\x94\x11\x0e\xa7\x0a\x38\xf1\xc4\x13\x59\x59\xb5\x5d\x21\x48\
-\x5f\x8d\xd7\xe7\x6f\x5f\x7e\xf9\x65\x55\xd2\x45\x60\x52\x32\xa9\
-\xf4\x70\xa6\x4a\x68\xf0\xcf\xbe\x68\xd1\xa2\xe5\xc2\x3c\x3f\x33\
-\x01\x20\x93\x09\x04\x33\x1c\xf2\xc7\x42\x39\x79\xa1\xdc\x7c\xa5\
-\x7c\x30\xf2\x87\x3f\xfc\xe1\xf9\x72\xe3\x07\x93\x3b\xb2\x6d\x00\
-\xbf\x88\x34\xc6\xd3\xe9\x9f\xf3\x86\xfe\xf1\xef\x46\xbc\xba\x34\
-\x8e\xc2\x49\x53\x90\x5b\x5d\x0c\xa7\x88\x7d\x7b\xa1\x13\x0e\x21\
-\x7c\x4e\x6e\x0e\xca\x84\x73\xdc\x32\x70\x3a\x9b\xca\x08\x30\x63\
-\x2a\x0e\x15\x54\x17\x9f\x24\x98\x40\x4c\xec\x80\xa8\x70\x7f\xac\
-\x5d\x00\x20\xea\x20\x58\xdf\x8e\xd6\x25\x8b\x31\xaa\x00\xb8\xfa\
-\xb4\xaa\xcc\x84\x07\x4a\xa4\x93\x4e\x3a\x69\x97\xed\x00\xdd\xa8\
-\xa3\x57\xad\x5a\x85\xbb\xee\xba\x4b\xbd\xa7\xf1\xa5\x2d\x6e\x0e\
-\xfc\xf8\x31\xe3\x51\x91\xa8\x84\x6f\x43\x81\x8a\x99\xd1\xfa\x67\
-\xa5\x63\xca\x29\x44\x2e\x0d\xa1\x6d\x48\x2b\xea\x5a\xea\x54\x85\
-\x91\x9e\x94\xa2\x43\xda\xac\x00\x3a\xfd\xf4\xd3\x07\xa5\xb2\x74\
-\x58\x98\x00\xa0\x74\xd5\x65\x5d\x7c\xad\x57\x05\x19\x88\x24\xc9\
-\x3e\xe7\xeb\xaf\xbf\xfe\x91\x30\x0e\x1f\xb2\xd6\x04\x80\x50\x06\
-\x00\xe2\x62\xf9\xe4\x01\x7c\x72\xf2\x72\x39\x0e\x17\x63\xeb\x68\
-\x71\x95\xbe\x47\x77\x50\xf9\xa0\x06\xf1\x49\x3d\x06\x34\x38\xbf\
-\x9d\xa1\x5a\x9e\xfc\xa9\xb9\xcd\x98\x57\xeb\x40\xf1\xd4\xa9\x70\
-\x57\x88\xbe\x2a\x15\x09\x50\x2c\x20\x10\x1b\xc0\x92\xc3\x54\xaf\
-\x0c\xac\xc3\x0a\x9f\xdd\x9a\x49\x27\xab\xfa\xba\x44\x12\x4d\x91\
-\x94\x9a\xdd\x9b\x92\xd7\x71\x4a\x00\x21\x7e\xa4\x25\x8c\x48\x53\
-\x08\x2d\x9f\x2c\x42\x5e\x22\x80\x5b\xbe\x5d\x9e\x99\xb5\x43\x7f\
-\x9a\x83\x6a\x9e\xfb\xb6\x3b\x40\x50\x57\x57\xa7\x40\x40\x83\x4d\
-\x2f\x22\x65\x1e\x68\xbd\xa2\x07\xbb\x5e\xf8\x89\xdc\xaf\x57\x37\
-\xd3\xd5\x50\x54\x2b\xd4\xfb\xe7\x9c\x73\x0e\x8e\x3a\xea\xa8\x7e\
-\x27\x87\xf4\xd5\xb4\x3b\x48\x8f\x80\x6a\x40\x2d\x22\x91\x9b\x9b\
-\x89\x09\x0c\xd6\x0e\xe0\x77\x1f\x7f\xfc\xf1\xb9\x17\x5c\x70\xc1\
-\xaf\xb1\x2d\x13\xa8\x01\x10\x57\x00\x10\x15\x40\x98\xe6\x31\x1f\
-\x20\x3f\xa8\x96\x07\x9e\x20\xee\xe0\x2f\x62\xf1\x78\x0e\x17\x21\
-\x30\xaf\xe0\x31\x7f\xfe\x7c\x15\xfa\xd5\x45\x8e\xbf\x7b\xb5\x0d\
-\x6b\xba\xf2\x51\xbc\xcf\x64\xb8\x2a\x39\x93\xd7\x25\x20\x70\x1b\
-\x3a\x93\xe1\xd3\xf4\x0d\x0b\x16\xe0\xb6\x5a\x14\x20\xb8\x14\x73\
-\x24\x61\x2c\xb9\x96\x34\x4a\x9d\x23\x09\x21\xbe\x00\xa0\x39\x84\
-\xf0\x56\xe1\xae\xc5\x2b\xc4\x54\x69\xc2\x1d\xe7\x95\x2b\xa3\x8d\
-\x3a\x95\x95\xbc\xe7\x9f\x7f\xbe\xe2\x88\xdd\xd9\x78\x1f\x04\xd7\
-\x73\xcf\x3d\xc7\xbc\xb9\xba\x5f\x73\x20\x46\x0f\x64\xf6\x6f\x74\
-\xfe\x82\x5c\xcf\x78\x05\xf3\x1a\xdf\xfe\xf6\xb7\x55\xb5\x51\x76\
-\x42\x66\xa0\x8d\xd7\x23\x20\x3f\xf9\xe4\x13\xe5\xa5\xe8\xc2\x55\
-\x82\x69\x67\x3c\x00\x7e\xf7\x67\x3f\xfb\xd9\x0b\xc2\xd0\x8f\x63\
-\x5b\x26\x90\x00\x08\x67\x00\x20\x12\xc0\x25\x27\xce\x95\x81\x2e\
-\x66\x44\x50\x3e\x1c\xf5\xc4\x13\x4f\x5c\x3f\x62\xe4\xc8\x51\x99\
-\x7a\x00\xa4\x13\x3f\x2b\x57\xac\xc0\xbf\xfe\xf5\x2f\x15\x7b\xe6\
-\xcd\xbc\x34\x3f\x80\x79\x8d\x05\x22\x01\x26\xc1\x4d\x00\x54\x78\
-\x04\x00\x4e\xb5\x72\x17\x6c\x06\x5a\xad\x46\x4e\xdd\xb4\x12\x50\
-\x7a\x89\xec\x34\xf1\x59\xf0\xc8\xe9\x4e\x51\xb1\x05\xc2\xc2\xfd\
-\xe1\x86\x00\xda\x96\xac\x82\x37\xd0\x82\x6b\x4f\x2d\xc8\xe4\x07\
-\xc8\x5d\xe7\x9e\x7b\xee\x6e\x07\x80\x6e\xbc\x0e\x93\x57\x8c\xc8\
-\x7d\xf8\xe1\x87\xca\x82\xcf\x1e\x7c\x3d\x35\x8d\xba\x9a\xf7\x44\
-\xce\x27\xe1\x8f\x3b\xee\x38\xcc\x98\x31\xa3\x67\x16\x73\x27\x1a\
-\xaf\xc1\xf3\xff\xe3\x1f\xff\x50\x12\x80\x9e\x96\x39\x28\x34\x58\
-\x00\xf0\xfb\xd7\x5e\x7b\xed\x53\x22\xe1\xfe\x84\x6d\x73\x02\x33\
-\x99\x40\x52\x81\x00\x30\x26\x3c\xa1\xc0\xb0\x03\x46\x7c\xf7\xbb\
-\xdf\x3d\xeb\x3b\xdf\xf9\xce\x31\x54\x03\x66\x4f\x80\xb3\x66\x1f\
-\xfc\xf5\xaf\x95\x11\xc8\x93\xbf\xbf\x32\x8a\xb9\xeb\xbd\x28\x9e\
-\x36\x05\x9e\xa1\x22\x2a\xab\x44\x5f\x95\xb8\x60\xcd\x61\xe4\xcc\
-\x9a\x26\x3e\xd9\x5e\xfd\x6f\xd1\xe4\x4f\xe7\xd5\x93\x86\x04\x10\
-\x15\xc0\x7a\xf7\x68\xbb\x00\xa0\x21\x88\x60\x9d\x70\xd4\xa2\xe5\
-\x18\x66\x6b\xc3\xf9\xc7\xf8\x7a\x2c\xf6\x48\xf1\x3a\x50\xa3\x6a\
-\x67\x9a\x16\xe7\xb4\x39\x98\x33\x60\xc0\x8b\xa0\xe0\x7b\xde\x03\
-\xc1\xc0\x20\x0c\x25\x04\xa7\x7f\x71\xf6\x0f\xdd\xb5\x6c\xb5\xb1\
-\xb3\x4d\xdb\x01\x64\x32\x9e\x8f\xee\xa0\x4e\x0f\x53\x22\x0d\xd6\
-\x0e\xe0\x77\x2f\xb9\xe4\x92\x47\x1f\x7a\xe8\xa1\xe7\xd0\x4b\x26\
-\x50\x01\x40\x54\x80\x5a\xbf\x4f\xbe\xec\x93\x87\x2f\x93\xe3\xf0\
-\x99\x33\x67\x1e\x7c\xdf\x7d\xf7\x5d\x41\x94\xab\x3a\x7e\x23\x09\
-\xc4\x00\xd1\xcf\x6f\xbb\x4d\x3d\x3c\x11\xd9\xdc\x65\xc7\x6f\xde\
-\x8c\xa3\x6c\xe6\x7e\xf0\x0c\x13\xdf\x79\xa8\xe8\x2b\x51\x03\x24\
-\x3e\x09\xcf\xe9\x4a\x19\x10\x98\x25\x40\x86\xf8\xe9\xd7\x04\x01\
-\x6d\x80\x50\x9d\x00\xa0\xb6\x0b\x4d\xf3\x3f\xc6\xb1\x7b\xe5\x60\
-\xea\x88\xf4\x14\x6d\xea\x44\x8a\xc3\xb3\xce\x3a\xeb\x73\x59\xb9\
-\xa3\x2f\x30\xb0\xeb\x95\xb9\x74\x4c\x5e\xaf\x0b\xa0\x8d\xd1\xdd\
-\x7d\x3f\x3c\x2f\x2b\x88\xa8\x0a\xb2\xed\x80\xc1\xc6\x03\x08\x00\
-\x61\x9a\xff\x27\x86\xfb\xab\xe8\xb9\x34\x4c\xc4\x0c\x00\x55\xe3\
-\x2f\x0f\x98\x27\x27\xa6\x1a\xa8\x96\x87\x1c\x23\xd6\xe3\x2f\xac\
-\x36\x9b\x87\x03\xa0\xa5\x00\x55\x02\x25\x80\x5e\x50\x89\xc8\xbf\
-\xe3\x99\x2e\xb8\xf7\x3a\x00\xde\xd1\x45\xc8\x1d\xe6\x55\x6a\xc0\
-\x22\x46\x1f\x89\xaf\x80\x60\x33\xaa\x7b\x2c\x69\x45\x92\x32\x26\
-\x3b\xa4\x4c\xdc\x9f\x12\x15\x10\x69\x0a\x23\xb8\xa5\x1b\x81\x8d\
-\x7e\x6c\xfd\xf0\x7d\x5c\x7f\x4a\xa9\xf8\x8f\xad\x6a\xe0\xc9\x8d\
-\xc7\x1f\x7f\xbc\x8a\x05\xec\x29\x00\xfc\xa7\x9a\x0e\x0b\x53\xfa\
-\x10\x00\xda\x1d\xdc\x19\x3b\x80\xe7\x92\x71\xbb\x4d\x6c\x9b\x77\
-\xb1\x2d\x11\xa4\x01\xc0\x42\x37\x05\x00\xab\xe8\x3f\x4e\xf2\x50\
-\x4b\xb8\xd1\x0e\x90\x8b\x8c\xba\xff\xfe\xfb\xaf\x9c\x3a\x75\xea\
-\x24\x15\x0f\xe0\xd9\x58\xe4\x21\xc4\xa0\x8e\x64\x81\x83\x8e\xa5\
-\x7f\xda\x9c\x8f\x7f\xd5\x95\xa1\x70\x72\x0d\x72\x87\x7b\x45\x12\
-\x78\x61\x73\xd9\x94\x17\xa0\xba\xd5\x50\x07\xdb\x04\xc0\x36\xc2\
-\xf3\x28\xc4\xe7\xa2\x48\x21\x11\xfd\x81\xcd\xdd\xf0\x2f\xdf\x88\
-\xaa\xd0\x46\x9c\x73\x84\x5b\x19\x57\x54\x01\xf4\x3e\xc4\x98\x51\
-\xe2\xf0\xcb\xdc\x74\xcd\x24\x3b\x8d\x52\xda\x00\xaa\x4c\x4c\x97\
-\x8b\xeb\x42\xda\x01\xaa\x01\x02\xe0\xa0\x83\x0e\xba\x4e\x6c\x9a\
-\x85\xe8\x39\x27\xb0\x27\x00\x84\x90\x9c\xe6\xe5\x96\x23\xed\x80\
-\x0a\xe9\x23\xbe\xf5\xad\x6f\x7d\xf3\xd2\x4b\x2f\x3d\x29\x60\x2c\
-\xe7\xae\x0d\xc1\xcd\x9b\x36\xe1\x97\xbf\xfc\xa5\xca\x04\x52\x1f\
-\xe7\x7a\xf3\xf1\x9b\xb9\x56\xd8\xc6\x4d\x87\xb7\x26\x1f\xb9\x23\
-\xf3\xc4\x15\x74\xa5\xdd\x40\x05\x02\x4b\x46\x25\xa8\x87\x4c\xf4\
-\xe4\x7c\x35\xdf\xbd\x23\x8a\xc0\x26\xe1\xfe\x0d\x9d\x68\x9e\xbf\
-\x00\x3f\xfc\x7a\x1e\xc2\x1d\x1b\x33\x19\x41\xea\x5d\xd1\x65\x7d\
-\xa6\x53\xbf\xe8\x2d\x7b\xf9\x1a\x8e\xeb\x3b\xef\xbc\xa3\x0c\x53\
-\xbd\x66\x81\x56\x03\x83\x05\x80\x18\xec\x17\x6f\xde\xbc\x79\x15\
-\x7a\x2e\x0f\xa7\xf2\x00\xbc\x34\x93\x41\xa4\x0c\x01\xe0\xa4\x1d\
-\x20\xaf\x4b\xe5\xf5\x70\x21\xf0\x8c\xdf\xff\xfe\xf7\x3f\x61\x66\
-\x50\x2d\x95\xc2\x33\x5a\xd2\xcb\xb9\xfd\xe6\x37\xbf\x51\x62\x8a\
-\xe1\x4a\xb5\xbc\x69\xde\x08\x3c\x3e\xcf\x83\xbc\xbd\xc7\xc1\x2b\
-\x00\xf0\x8c\xf0\x22\xc7\x63\x4f\xab\x82\x0c\x10\xd2\x8b\x37\xab\
-\x12\x27\x83\xf3\xd9\x13\x61\xf1\xad\x6b\x85\xfb\x37\x76\xa1\x7d\
-\xc9\x67\x38\x6a\x44\x27\x26\x94\xb5\x2b\x2b\x5c\xcf\xdf\xbf\xea\
-\xaa\xab\x94\xb5\xfd\x65\x13\xff\xd9\xeb\x14\xeb\x23\x09\x4d\x29\
-\xcb\xd0\xb0\x39\x2c\x3c\x58\x3b\x40\xe8\x99\x94\xdf\x7c\x57\xe8\
-\xc7\x7d\x03\xcc\x73\x02\x55\x26\x50\x91\x94\xff\x08\x08\xb8\x96\
-\xbf\x43\x8c\x9d\x3c\x1d\x16\x96\x5e\xf3\xf2\xcb\x2f\xff\x5c\x2e\
-\x5c\x18\x35\xe2\x01\x5a\x0a\x30\xce\x4d\x63\x90\xc5\x20\x99\xd5\
-\xb1\xdd\x63\xf1\xec\x1a\x31\x58\xc6\x0d\x51\x52\x40\xa9\x02\x2e\
-\xee\x64\xdb\x26\x05\xd2\xd6\x7f\x32\x3d\xd5\x99\xf3\xdc\x49\xfc\
-\xfa\xa0\xe2\xfe\xce\x35\x0d\xd8\x2b\xa7\x01\x73\xf6\x49\xc7\xd1\
-\xa9\xfb\xb9\x60\x34\xc3\xa2\x5f\x36\xee\xef\x8b\xf0\xfa\x48\x51\
-\x4f\xc9\xcb\x49\xac\x3a\x1e\xa0\xed\x80\xc1\xb8\x83\x42\xb7\x80\
-\xd0\xef\x07\xe8\x99\x09\xcc\xd4\x02\xf0\x3b\x1a\x00\x56\xce\xfd\
-\x93\x13\x7b\xe4\xc4\x6a\x25\x4f\xe9\xa3\x6e\xbe\xf9\xe6\x1f\x1c\
-\x71\xc4\x11\xfb\xa9\x78\x80\xa9\x3a\x97\x56\xf1\x5f\x9f\x7e\x1a\
-\xef\xbc\xfd\x76\x66\x7e\x3d\x6f\x2e\xb7\x74\x2f\x3c\xb5\x2c\x1f\
-\xa9\x21\xe5\xca\x2b\x70\x8b\x57\xc0\xa8\x20\xe7\xd7\xa5\xe7\xbb\
-\x23\x6d\x00\x0a\xe7\xc7\xba\x62\x08\x0b\xf1\x69\xf8\x75\xad\x6d\
-\xc0\xd1\xd5\x9d\xd8\x67\x68\x87\xca\xfc\x99\xb3\x69\x2c\xa5\xca\
-\x9e\x57\xf7\x45\x6e\xbd\x11\xdc\x7c\x64\x23\x81\x09\xf8\x17\x5e\
-\x78\x41\xe9\x7f\xda\x01\x74\x3d\x75\xfa\x7a\xa0\x6a\x40\xc6\xaf\
-\x59\x7e\x7b\x05\xb6\x65\x02\xd5\x42\xd1\x30\x12\x41\xfc\x8e\x06\
-\x00\x77\xf4\xb0\x73\x5a\x98\xdc\x08\x17\x72\x62\x86\x70\xf8\xb1\
-\xc7\x1e\x7b\xdc\xf5\xd7\x5f\x7f\x96\x5a\xd0\x51\xdf\xa0\x01\x04\
-\x86\x43\xc5\x50\x54\x05\x9c\x7a\x75\x4f\xf6\x51\x63\x27\x63\x79\
-\x5b\x15\xde\xdb\xea\x41\x4e\x99\x57\x45\x06\xed\x05\xe9\x25\xd0\
-\xf8\xc3\x44\x28\x81\x98\xe8\x7c\x86\x7d\xc3\x8d\xdd\x18\x92\x68\
-\xc5\x89\x53\xc5\x34\x6d\x5a\xa9\xe2\xe8\x6c\x44\x3f\xdd\xa0\xcb\
-\x2f\xbf\x5c\x05\x58\x76\x47\x35\xd0\x7f\xba\x0d\x84\xf0\xe6\xd7\
-\x24\xf6\x47\x1f\x7d\xa4\x62\x10\x54\x03\xb4\x03\xa8\x06\x32\xb3\
-\x87\x07\x00\x80\xda\xda\xda\x4d\x35\x35\x35\xd7\xa1\xe7\x9c\xc0\
-\x4c\x26\x90\xdf\x51\x00\x10\x43\x90\x47\x4e\x01\x77\x8a\x88\xf1\
-\xc9\x8d\xb0\x7c\x75\x98\x58\xa1\x7b\xff\xfd\xef\x7f\xbf\x4d\x74\
-\xb1\xd5\x1c\x0f\xd0\x8d\x76\x00\xf3\xdd\xe4\x54\x5d\x18\xca\xc6\
-\x9b\x1d\x39\x66\x6f\x34\x44\x2b\xb1\xb6\xcd\x8e\xcf\x44\xf0\xb4\
-\x45\xd3\x52\xc0\x91\x8a\xa3\xca\x1d\xc7\x38\xb9\xc2\xc4\xd2\x6e\
-\x24\xba\x37\xab\xf5\x81\xf4\xb2\xe8\x04\x16\x89\xcf\xa0\xcf\x9c\
-\x39\x73\x76\x3a\xac\xfa\xdf\xd2\x76\x24\xee\xfb\x3a\x12\x00\x64\
-\x2e\x2e\x63\x43\x35\xb0\x33\xe9\xe1\xe5\xcb\x97\xaf\x9c\x36\x6d\
-\xda\x2d\x48\x4f\x09\x23\x00\x7a\x64\x02\xf9\x9d\xcc\x19\x04\x04\
-\xe6\x05\x9d\x55\x58\x98\xe9\xe1\xa7\x9f\x7e\xfa\x26\xe1\xf0\x21\
-\x2a\x1e\x90\x35\x59\x83\xb7\xcb\xa5\xdd\x69\x14\x2e\x5e\xbc\x58\
-\x49\x02\xf3\x8e\x1c\x24\x9e\xd6\x61\x2e\x97\x47\x3c\x01\x1b\x12\
-\xf1\x88\x42\x35\x89\x4c\xe0\xe8\x87\xa6\x5a\x61\x4c\x9e\xc1\xa7\
-\x0b\x2e\xb8\x40\xcd\xa4\xf9\x3c\xa3\x7e\x7b\xa2\x0d\x86\xe0\xe6\
-\x23\x1b\x9f\x9d\x76\x10\xf3\x13\x1c\x43\x1d\x16\x1e\x4c\x7a\x58\
-\x3c\x89\x05\x47\x1e\x79\xe4\x9d\xe8\x39\x29\x34\x93\x09\x54\xa4\
-\xd4\x5f\x36\xdc\x41\xbb\x5c\xd4\xcd\xf4\xb0\x70\x64\xa5\x1c\x47\
-\x5e\x76\xd9\x65\xe7\x9d\x72\xca\x29\x87\xd2\x1b\xd0\x5f\xee\xb1\
-\xfb\x95\xc1\xb5\x8c\x5f\x8b\xb4\xc8\xe4\xd7\xcd\x1b\x1b\xf4\x37\
-\x40\x7a\xc1\x63\x1a\x7c\x34\x2a\x7f\xf0\x83\x1f\xa8\x72\xb3\x2f\
-\xba\xd8\xef\x8d\xb8\x03\x11\xff\xfa\xa8\x37\x97\xe0\xe2\xd2\xe4\
-\x7a\x32\x17\xed\x80\x81\xa6\x87\x49\xa3\xbf\xfc\xe5\x2f\xef\x9c\
-\x7d\xf6\xd9\xf7\xa3\xe7\xa4\xd0\x4c\x26\x50\x7d\x4f\xff\x80\x6a\
-\xc0\x58\xf9\x43\xd9\x01\x72\x02\x95\x1e\x3e\xec\xb0\xc3\x8e\xb8\
-\xed\xb6\xdb\xbe\xcf\x8c\x9c\x5e\xe9\x63\xbb\xe9\xde\x48\x73\x30\
-\xb9\xfa\xaf\x7f\xfd\xab\x4a\x19\xd3\x30\xa4\xff\xae\x45\x96\xb9\
-\xba\x55\xef\xde\x41\xc2\x53\x1a\x10\xe1\x2c\xf9\xe2\x42\x0a\xba\
-\xe0\xf1\x8b\xda\x76\x96\xeb\x7b\x5b\xb0\x9a\x22\x9f\x6b\x19\x31\
-\x07\x33\xd8\xf4\x30\x3f\xbf\xe3\x8e\x3b\x5e\xba\xe1\x86\x1b\x1e\
-\x41\x1f\x99\x40\xf5\x3d\xfd\x03\x6d\x07\x60\xdb\xa2\xce\xac\x14\
-\xaa\x16\xc4\x8d\x7b\xf5\xd5\x57\x29\x46\xec\x71\x1d\x0f\x40\xdf\
-\x33\x75\xa9\x2a\x78\xc3\x4c\x1d\xb3\xcc\x99\x7e\x3c\x2d\xfa\xcc\
-\xda\x40\x48\x1b\x38\x14\x69\x4c\x2a\x1d\x7c\xf0\xc1\xaa\xbe\x9d\
-\xe2\xed\x8b\x4c\x78\xb6\xc1\x70\x7d\x7f\x84\xd7\x9f\x91\xdb\x59\
-\xc4\xca\x75\x94\xb5\x1d\xa0\x99\x6a\x47\x61\x61\xfe\x4d\x0c\xf8\
-\xa7\xef\xbc\xf3\xce\x27\xb1\x6d\x4e\xa0\x06\x80\x9a\xef\xcc\xef\
-\xf5\xf8\x35\xed\x00\xaa\x01\xb9\x81\x5c\x23\x1e\xc0\x72\xf1\x9a\
-\xc7\x1e\x7b\xec\x9a\xb1\x63\xc7\x8e\x31\x6f\xf1\xd6\x1f\x10\xf4\
-\x03\x30\x8c\x1b\x36\x02\x49\x04\x01\xdf\xd3\xad\xd1\x0f\x40\x20\
-\xec\x68\x69\xd5\x2f\x4a\xdb\x19\xa2\x67\x13\xbf\xb7\x88\x20\xc7\
-\x89\x61\x61\x4a\x00\x1a\xda\xe6\xf4\xb0\x79\x2f\xc2\xec\xc6\xcf\
-\xc5\x8b\xfa\xdd\xaf\x7e\xf5\xab\x67\x91\xb5\x3c\x2c\x8c\x44\x10\
-\xbf\x97\x0d\x00\x15\x16\x96\xee\x91\x9b\x51\x61\x61\xf9\x78\xa4\
-\x58\xe4\x67\x9c\x7f\xfe\xf9\x5f\xd3\x73\xd2\x7a\x9b\xb9\xbb\x23\
-\x22\xf6\xb5\x3c\xfb\x97\xa1\xed\x88\xe8\x83\x25\xbc\x6e\x56\x63\
-\x93\x4c\xae\x6b\xc4\xd7\xac\x62\x66\xfa\x79\x20\xe9\x61\x7e\x7e\
-\xde\x79\xe7\xfd\xea\x0f\x7f\xf8\xc3\xcb\xc8\x5a\x1e\x16\xfd\x00\
-\x40\x85\x85\x85\xd3\x5d\x82\x3c\x86\x85\xcb\x84\x60\xc3\xa6\x4f\
-\x9f\x7e\xd0\x03\x0f\x3c\xf0\x43\x35\x25\xc9\xb4\x90\x63\x7f\x1b\
-\x38\xfe\x2f\xb4\x9d\x21\xfa\x40\x89\xaf\x3f\xa7\xc8\x67\x7a\x98\
-\x01\x32\x4a\x00\x06\xc5\x28\x05\x76\x14\x16\xa6\x64\x3d\xe9\xa4\
-\x93\xee\x78\xfe\xf9\xe7\xdf\x46\xcf\x49\xa1\x3a\x0c\xdc\xfb\xd6\
-\xb1\x4c\x0f\xcb\x8f\xb9\xb6\xaf\x97\xf1\x00\x31\xda\x98\x1e\xae\
-\x79\xed\xb5\xd7\xee\x94\x8b\xe6\x6a\x5d\xbe\x2b\xab\x75\x7c\x19\
-\x5a\x6f\x84\xd5\xc6\x2d\x9b\x5e\x7a\x5e\xbb\x6c\x6c\x66\xff\xbd\
-\xbf\xdd\xc6\xb2\x03\x42\x54\x9f\x9c\xc7\xa0\x57\x37\x23\x08\xf4\
-\x86\x56\x7d\xd9\x01\xbc\xd6\xa1\x87\x1e\xfa\x93\x77\xdf\x7d\x77\
-\x3e\xb2\x96\x87\x85\x91\x08\xe2\xf7\x7a\x03\x80\x55\x2c\x7a\xa6\
-\x87\x59\x25\x54\xc4\x99\xc3\x72\x1c\x75\xef\xbd\xf7\x5e\x3e\x73\
-\xe6\xcc\x29\xfa\x01\xff\x97\xb9\x3f\x7b\x57\x51\xaa\x46\x06\xc5\
-\x18\xc3\xd0\xc4\xd5\xe1\x5c\x5d\x50\xa2\x7f\xc3\xcf\xf5\x22\x15\
-\xd9\xc4\xeb\x0d\x14\x04\x10\x41\xc0\xc9\x2c\x74\xaf\xb5\x8b\xad\
-\xd7\x62\xe8\x4b\x0d\x10\x00\x13\x26\x4c\xb8\x5c\x24\xc7\x72\xa4\
-\x01\xb0\x5d\x26\x90\xdf\xeb\x0d\x00\x5c\xdc\x93\x2b\x7f\xb2\xfc\
-\x36\x5f\x50\x4d\x3b\x60\xc4\x37\xbf\xf9\xcd\x93\xae\xbc\xf2\xca\
-\x53\xf8\xb0\xff\xcb\xdc\x6f\xde\x9b\x98\x1c\xce\x6a\x62\x12\x5e\
-\x73\x67\x7f\xd5\xc0\x04\x03\x5d\x5f\x16\xb8\xb2\xe9\x25\x5d\x77\
-\x34\x86\x34\x9c\x29\x01\xf8\x5b\xaa\x01\x1d\x0b\xa0\x61\x68\x96\
-\x30\x6c\xfa\x5c\x02\x80\x94\x7c\xef\x7c\xa1\x17\x97\x87\xcd\xce\
-\x04\xf6\x0f\x00\xfe\x9e\xfb\xfc\xca\x49\x54\x7a\x58\x5e\x0f\xab\
-\xa9\xa9\x99\xfe\xe4\x93\x4f\xde\xc4\xa5\xe2\xf4\xfa\xbe\xff\xab\
-\xc4\xa7\xa8\x67\xcc\x83\x84\xa4\x3b\x4b\xc3\x2c\x7b\xfb\x18\x3d\
-\x93\x97\x62\x5a\x5b\xec\xe6\xa8\x27\xe3\x1f\x04\x0f\xb9\x98\x22\
-\xdd\x9e\xb5\xb1\xb5\x59\x1a\x10\x58\x5c\xe7\x79\xe5\xca\xd5\x0a\
-\x34\x7a\x22\x0b\x3f\xd7\x33\x9b\xcc\xd7\x36\xee\x31\x2c\x00\xe0\
-\x36\x71\x1b\xd1\x33\x13\x48\x11\x1e\xd7\xdf\xeb\x95\x82\x74\x07\
-\xe5\xc6\x1d\x72\x12\xda\x01\x0c\x0b\xab\x59\x43\x2f\xbc\xf0\xc2\
-\xad\x72\xf1\x92\xde\xec\x80\x2f\x7b\xd3\x04\xd1\x35\x0a\x24\x20\
-\x17\x67\xd0\x7b\x0c\x70\x4c\x98\xd3\x58\xb5\xe6\x03\xac\x58\xf5\
-\x3e\xba\xba\xdb\x85\x51\xe8\x71\x39\x55\xd1\xcc\xb8\x31\xfb\x61\
-\x6c\xcd\x4c\x4c\x99\xb2\x8f\xb1\x31\x56\x7a\xa1\x2c\x5d\x74\xca\
-\x7a\x07\xf3\x3a\x82\xe6\x46\x90\x04\x43\x01\x3c\xf9\xe4\xe3\x18\
-\x33\x7a\x52\x66\x47\x13\xde\x0b\x3d\x03\xaa\x9a\x6c\x5a\x74\x77\
-\x77\xb7\x95\x94\x94\x5c\x86\x5e\x96\x87\x85\x91\x08\x62\xeb\x0b\
-\x00\x2a\x3d\x6c\xb8\x83\x45\x22\x09\xd4\xec\xe1\x9f\xfc\xe4\x27\
-\xdf\x3f\xe6\x98\x63\x0e\x50\xf3\x06\xff\x87\x88\xcf\xa6\xe7\x01\
-\xd0\x22\x27\x07\x53\x07\x6b\x71\xbf\x68\xf1\x42\xbc\xf2\xfa\xaf\
-\xd1\xde\xb9\x58\x38\x39\xa6\x76\x00\x29\x2a\x2a\x13\x8f\x29\x04\
-\xab\xc5\x83\xd6\xd6\x26\xb4\xfb\x99\xf7\x70\xc1\xe3\x1c\x8f\x43\
-\xbf\xf2\x5d\x1c\x38\xeb\x60\xe8\xbd\x7e\x38\xf5\x8d\x12\x65\xda\
-\xb4\x69\xbd\xaa\x10\x4a\x11\x1a\x7d\x0f\xfd\xe6\x17\x28\x29\xae\
-\x96\x6b\x8f\xcc\x2c\x06\xcd\xef\x53\x2d\x64\x87\xce\x9b\x9a\x9a\
-\xb6\x08\x40\xaf\x41\xcf\x54\x70\x8f\x4c\x20\x5b\x5f\x00\xb0\x18\
-\x79\x01\x97\x74\x95\x1e\x96\x3e\x4c\x88\x7f\xac\x80\xe0\x9c\x4c\
-\x40\xe8\x7f\xa4\x69\x0b\x9f\x13\x37\x49\x2c\x72\xbe\xde\x63\xe0\
-\xe9\x67\x1f\xc0\xaa\xb5\x7f\x85\x37\x2f\x25\x84\x28\x16\x91\x5c\
-\x88\xfd\xf7\x3d\x1d\x09\x21\xfe\xe6\xfa\x37\x51\x33\xec\xeb\x8a\
-\xc8\x1f\xcc\xfb\x03\xba\xbb\x2c\xd8\xb4\x79\xa3\xbc\x77\x60\x58\
-\xe5\xd7\x70\xd2\x37\x2e\x56\x9c\x4c\x7b\x82\xa5\x6f\x3c\x37\x41\
-\x60\x4e\x82\x69\xc9\xc3\x3c\xc0\xab\xaf\xfd\x1d\xb5\x5b\xd6\x63\
-\xf4\xa8\xe9\xca\xe6\xd0\x46\x26\x73\x28\xe6\xa5\xf8\x78\x14\x29\
-\xb5\x66\xf2\xe4\xc9\x37\x61\xfb\x49\xa1\x14\xff\xfd\x03\x80\xf5\
-\x01\x5c\x1e\x96\xe9\x61\x21\x3c\xab\x85\x4b\x39\x6b\x88\x9b\x3d\
-\x8b\x1a\xb8\x5d\x6e\xca\xba\x33\x7b\xe8\x7e\x11\x9b\xf6\xe9\x39\
-\xf9\x93\x22\x7e\xd4\xa8\x51\x4a\x5f\x93\xa8\x7f\xf9\xdb\x4f\xb1\
-\xb5\xe5\x2d\x54\x0d\x29\xc4\xf8\xf1\x53\x90\xeb\x4b\xa0\xb2\x7c\
-\x08\x4a\x8a\xc6\x0a\x00\xda\x11\x08\xad\x42\x9e\x67\x92\x48\x02\
-\x27\x1a\x9b\x96\x21\xd0\xe5\x40\xd3\xd6\x56\xac\x59\xb3\x1c\x8d\
-\x0d\x7e\x54\x55\x1c\x82\xaf\x1d\x75\x55\x66\xe5\x52\xda\x04\x24\
-\x2a\x97\x7b\xcb\xb6\xec\xa9\xef\xd7\xad\x5b\x89\x97\x5e\x79\x0a\
-\xe3\xc6\xce\x44\x79\xd9\x10\xa5\x7e\x68\x88\x52\x0d\x98\x8d\x49\
-\xfe\x76\xde\xbc\x79\x9f\xcc\x9e\x3d\xfb\x0e\x6c\xcb\x04\x66\xd6\
-\x07\x86\x11\x06\x66\xeb\x53\x8e\xb3\x4c\xcc\x58\x34\x5a\x87\x85\
-\x87\xc8\xb1\xe6\xa9\xa7\x9e\xba\x41\x2e\x58\x6d\x8e\xed\x7f\x59\
-\x9b\xe6\x3e\x56\x44\xb1\x3c\x4b\x5b\xed\x24\xd6\x4b\xaf\x3d\x80\
-\x0d\xb5\xff\xc0\xb0\xe1\xf9\x18\x3b\x76\x1c\xca\xab\x3c\x28\x2e\
-\xca\x85\xdb\x55\x02\xa7\x9d\xc3\x95\x40\x38\xb6\x46\x44\xfe\x54\
-\x65\x6f\x87\xa2\xe2\x2d\x84\xfc\xa2\xf3\xb7\xa2\xb1\xbe\x1b\x9f\
-\x7d\x56\xab\x56\x47\x19\x3f\xf6\x44\x1c\x7a\xd0\xf9\x4a\x94\x13\
-\x54\x9c\xb0\xca\x45\x25\xc8\xf1\xe6\xd0\x7a\xda\x6d\xb4\xe0\x81\
-\x5f\xdd\x82\xa1\xd5\xa3\x51\x3d\x64\xbc\x02\x05\xbf\x43\xd0\xf0\
-\xde\x4c\x1e\x00\xab\x89\xfe\x7d\xea\xa9\xa7\xde\x87\xed\x27\x85\
-\x66\x12\x41\x6c\xfd\x01\x80\x3b\x81\xa8\xf4\x30\xd2\x3b\x7e\xab\
-\x59\x43\x17\x5f\x7c\xf1\x77\x4e\x3f\xfd\xf4\x23\xa8\x07\xbf\xcc\
-\xcd\xec\xee\x91\x28\x9c\x9b\xa0\x17\x61\x5e\xbc\xf4\x5f\x78\x7f\
-\xc1\x9d\x42\x7c\x0f\x46\x8f\xab\xc4\x88\x91\x45\x28\xf0\x55\xc2\
-\xe9\xb0\x23\xd7\x35\x01\xf6\x9c\x7c\x24\x92\xcd\x02\x80\x15\xf0\
-\x38\xf6\x15\xc2\x78\x11\x8d\x35\x22\x18\xa9\x15\x55\xe2\x41\x73\
-\xcb\x5a\x7c\xba\x66\x23\xd6\x7f\xd6\x26\x92\x20\x82\x83\xf6\xbb\
-\x12\x53\x26\x1d\x9d\xa9\x82\xa6\x51\xc8\x7a\x08\xb3\x14\xd0\x4b\
-\xc4\xfc\xe1\x8f\xf7\x0b\x50\xa2\x18\x35\x62\x5a\x66\xe3\x68\x7e\
-\x8f\x6a\x49\xe7\x55\x78\x7c\xe0\x81\x07\x5e\xfd\xd1\x8f\x7e\xf4\
-\x30\x7a\x59\x1e\x16\x03\x04\x80\x0a\x0b\xcb\x09\x5d\xd2\xf3\xe5\
-\xe6\xca\x58\x2d\x7c\xc8\x21\x87\x1c\x7e\xc7\x1d\x77\x5c\x64\x0e\
-\x6e\x7c\x19\x9b\x16\xfd\x14\xb1\xcc\xc9\x33\x1f\xaf\x57\x2c\x79\
-\xea\xb9\xef\x23\xbf\xb0\x1d\x63\xc7\x17\x62\xdc\x84\x21\xf0\xe5\
-\x96\xc3\xe5\xcc\x85\x23\xc7\x21\x12\x60\x34\x6c\xd6\x1c\x05\x80\
-\x78\x62\xa3\x10\x68\x0c\x6c\x96\x02\x79\x1d\x46\x48\x5c\xf2\x44\
-\xc2\x89\x60\xb8\x19\xfe\xae\x66\x2c\x5f\xba\x09\x6b\xd7\xf8\xe5\
-\x3b\x55\x38\xea\xe0\x3b\x91\xeb\xc9\x55\x06\x26\x37\xb4\xe0\x0c\
-\x63\x12\xd8\x3c\xc6\x74\x37\xdf\xfd\xf7\xab\x58\xb1\x72\x21\x46\
-\x0e\xdf\x37\x33\x89\x95\x20\xe5\x8c\x6d\x6d\x07\xf0\xf8\xd3\x9f\
-\xfe\xf4\xd9\xdb\x6f\xbf\x7d\xbb\x8d\x22\x31\x50\x00\x98\xd3\xc3\
-\x82\x30\x2f\x67\x0f\xcb\xeb\x6a\xb9\xe0\x58\x86\x85\x05\x65\xce\
-\x2f\xab\x1d\x60\x8e\xe5\x33\xc2\xc7\xaa\x1c\xba\x69\xe4\xb4\xe5\
-\xab\x5e\xc3\x8a\x35\xbf\xc5\xf8\x49\x05\x98\x34\xa5\x0c\x05\xf9\
-\x05\xc2\xe5\x85\x70\xd9\x1d\x42\x8c\x42\x21\x3e\x67\x46\x73\x71\
-\x8d\x08\xf4\x26\x03\xdc\x59\x47\xec\x69\x50\x6b\x46\x63\x41\x84\
-\xa3\x5d\x22\x0d\x3a\x44\x12\xb4\x61\xe9\xa2\xad\x58\xb3\xaa\x13\
-\x07\xee\x7f\x11\x46\x55\x1f\xae\xae\xcb\x74\x3a\xad\xfe\xe9\xd3\
-\xa7\xf7\x50\x03\x14\xf9\x8d\x8d\xb5\x78\xf6\xf9\xdf\xa1\x66\xc4\
-\xcc\x4c\xa1\x28\x41\xa3\x57\x6c\x53\x65\xfa\x72\xbc\xe6\x9a\x6b\
-\x9e\xb8\xff\xfe\xfb\x9f\x46\x3f\x99\xc0\x7e\x01\xc0\xc6\x78\x80\
-\xe8\x25\x39\x9f\x9d\x65\x62\x6a\xdb\x77\xe9\x35\x0f\x3f\xfc\xf0\
-\x8f\xc4\x50\x19\xf7\x65\xb4\x03\xb2\xc3\xbc\xff\xfe\xf7\xbf\x55\
-\xe9\x9a\x5e\xa5\xec\xf5\xb7\x6f\x85\xd3\xb3\x16\xd3\xf6\x2b\xc7\
-\x50\x31\xfe\xdc\x0e\xb7\xea\x2e\x87\x57\xa4\x80\xb8\x63\xd6\xb8\
-\x00\x45\xc6\x58\x00\x90\x4a\x71\x8b\xd9\x1c\xb5\xc9\x00\x37\x5c\
-\x49\x24\x6d\x22\x05\x9a\x04\x00\x9d\xd2\xc3\x02\x82\x30\x3e\x5b\
-\xd7\x82\x4f\xe6\x37\x09\xf7\x4f\xc6\xac\xe9\x57\x29\x90\xb1\xc2\
-\x8a\x1e\x01\x97\x96\x33\x2f\x88\x91\xde\x9a\xcf\x85\x07\x7e\xfd\
-\x53\x0c\xa9\xdc\x3b\x53\x21\xc4\x7b\x65\x15\x95\xde\xe9\x94\xc7\
-\x8b\x2e\xba\xe8\xa1\xc7\x1e\x7b\xec\x45\xf4\x93\x09\x64\xdb\x11\
-\x00\x54\x7a\x58\x6e\xca\x2d\xc4\x2e\xe0\x6a\x62\x32\x28\x23\xce\
-\x3e\xfb\xec\xd3\x2e\xbc\xf0\xc2\xe3\x76\xb7\x1d\x60\xde\x42\x4e\
-\xbf\x37\xbb\x36\x1a\xe1\x9f\x57\x0c\x22\x3b\x9b\x47\xa3\x8c\xa5\
-\xd9\x7a\x56\x70\x3c\x1e\xc3\x3f\x5e\xfd\x2e\x26\xed\x93\x87\xe9\
-\xfb\x55\xc1\xe7\xf1\x8a\x91\x47\x00\xb8\x44\x02\x08\x08\x9c\x15\
-\x72\xa3\x24\x58\x0c\x29\x8b\x8e\xb7\x88\x44\x50\x3b\x4e\x8a\xdb\
-\x98\xe4\x7a\xbf\x0d\x62\x1b\x84\x11\x8e\x84\x10\x8c\x86\xd0\xde\
-\xd1\x85\x8f\xde\xab\x13\x2f\x23\x8a\xa3\x0f\x79\x50\xec\x07\xa7\
-\x7a\x7e\xda\x1d\xac\x92\xd2\x6b\x29\xb3\x51\xb7\x53\x0d\x3c\xf3\
-\xec\x13\x88\x84\x6d\x19\x00\x70\x5c\xb4\x04\x20\x80\x78\xbf\x67\
-\x9c\x71\xc6\x2f\x9f\x79\xe6\x99\xb9\xd8\x7e\x75\xd0\x81\x03\xc0\
-\x70\x07\x55\x7a\x58\x4e\xce\x49\x23\x5c\x4c\x6a\xf8\x3e\xfb\xec\
-\x73\xc0\x43\x0f\x3d\x74\xcd\xee\xb0\x03\xf4\x94\x6c\xbd\x0f\xaf\
-\x5e\x05\xd3\x4c\x10\xb3\x7b\xa3\x97\xa1\xd7\xe5\xd1\xbb\x1b\x00\
-\x66\x10\xd0\xfa\xe7\x16\x33\xac\xc4\xe1\xa0\x76\x05\x1a\xf1\xc1\
-\xc7\x3f\xc6\x01\x5f\xa9\x10\xcb\xbf\x54\x6d\xfa\xec\x75\x7a\xd4\
-\xae\x9f\x2e\xbb\x58\xe9\x16\x11\x94\x96\x52\xa4\xf7\xfb\x4b\x8f\
-\x73\x4a\x4d\x8c\x17\x10\x80\x73\xff\x9b\xa4\x07\x14\x00\x42\x42\
-\xfc\x40\x38\x88\xee\x50\x00\x8b\x17\x37\x60\xc1\x87\x4d\x98\x73\
-\xc4\x5d\x62\x2f\x14\xab\xe7\x67\x91\x2d\x67\x43\xeb\x65\x66\xf4\
-\x7d\xd1\xff\x5f\xbc\xf8\x13\xe9\x4b\x33\xb5\x01\xfc\x0e\x25\x80\
-\xb6\x01\x08\x9a\x39\x73\xe6\xdc\x24\x9e\xcb\x76\x1b\x45\xc2\x94\
-\x07\x18\x10\x00\x38\xee\x72\x62\x6e\x25\xe3\x95\x93\x33\x3d\xac\
-\xc2\xc2\x62\x07\xfc\x42\x2e\x9e\xb7\xb3\x76\x80\xe6\x76\x8a\x3a\
-\xc6\xd4\x75\x96\xcc\x5c\xf5\x9a\x4d\x18\x26\xa2\x28\x1e\x69\x29\
-\xf3\x3b\xda\xff\xdd\x1d\xa5\x64\xd9\xdc\xaf\xd7\xfc\xe1\x0a\xe3\
-\x8c\xd5\x13\x70\x8d\xcd\x4b\xb0\xbe\xf6\x61\x1c\x72\x54\x35\x86\
-\x56\x16\x21\x8f\x00\x70\xe5\x8a\x14\xf0\x88\xe8\x77\xc9\x60\x32\
-\x24\x2b\x4e\x93\x18\x7d\x16\x16\x58\x67\x56\xd7\xe3\xda\xf2\x8c\
-\x04\x86\x64\xe4\x23\xca\x20\x0c\x46\x84\xf8\xe1\x00\xba\x04\x00\
-\xeb\xd6\x35\xe1\x9d\xb9\x75\xf8\xca\x01\x3f\x82\xc3\x3a\x2a\xb3\
-\xc9\x04\x25\x00\xc1\x97\x9d\x17\xe0\x7d\x89\x3b\xae\xc6\x8b\x46\
-\x20\x93\x42\x8c\x4f\x68\x8f\x80\xa0\x10\xfb\xe1\x4a\x39\xc7\x76\
-\x1b\x45\x0e\x0a\x00\x06\x08\x18\xf4\x71\x08\xb7\xa9\xf4\xb0\x74\
-\x86\x85\x47\xfd\xf2\x97\xbf\xbc\xf4\xc0\x03\x0f\x9c\xb6\x33\x6a\
-\x40\x0f\x2e\x8b\x1c\xc8\xc5\x7a\xd1\x46\x73\x7a\x54\x27\x4f\xcc\
-\x46\x90\xee\x04\x8e\x2e\x2d\xa7\xa5\x3c\xd2\xd8\x29\x73\x57\x54\
-\x43\x36\xf7\xeb\x39\x0a\x0f\x3e\xf8\xa0\xaa\x59\x54\x00\x68\x5a\
-\x84\xfa\xd6\x27\x70\xc4\x31\xc3\x50\x5e\x52\x04\x9f\x00\x80\x20\
-\x70\x39\x72\x65\x20\x59\x0e\xcf\x58\xbe\xa8\x29\xe8\xcd\xd6\x28\
-\xa1\xe2\xaa\xa7\x54\xfc\x85\xcb\xc7\x87\x55\x88\x98\x4b\xbf\x77\
-\x85\xbb\xd1\x19\xec\xc6\xc6\xda\x66\xcc\x7d\xa5\x16\xfb\xed\x7b\
-\x29\x72\x52\xa3\x15\x00\x38\x37\x90\x8b\x4d\xe9\x59\x51\xfa\xde\
-\x28\x89\xf8\xcc\xbf\xfd\xed\x6f\x33\x05\xb7\x34\x16\x75\x42\x4a\
-\x4b\x49\x91\x14\xdf\xeb\xec\xec\x5c\x87\xac\x8d\x22\x77\x06\x00\
-\x6a\xd6\x10\xd3\xc3\xac\x16\x66\x7a\x98\x8b\x48\x9c\x70\xc2\x09\
-\x27\x5e\x7d\xf5\xd5\xdf\x1a\x6c\x58\x58\x87\x3d\xf9\x80\x0c\x5e\
-\xe8\x15\x30\xf9\x90\x2c\x7c\x58\xbc\xf4\x13\xac\xad\x5f\x84\xad\
-\xad\x9b\xd0\xd2\xbe\x55\x7c\x6b\x17\xca\x8a\xab\x51\xe9\x1b\x8d\
-\xc9\x13\xf6\x55\x6b\x05\xf2\xfb\x7a\xd1\x64\x16\x4d\x92\x50\x2c\
-\x30\xed\x6d\x9b\xd6\x81\x12\x3f\x1b\x64\x6c\x3c\x2f\x07\x9a\x1c\
-\xc6\xc1\x0e\x86\x1b\xb0\xae\xf6\x1e\x7c\xf5\xeb\x23\x51\x5a\x54\
-\x88\x7c\x8f\x4f\xd9\x01\x76\x9b\x57\x06\xd2\xa3\x00\x60\x81\xcb\
-\x00\x80\xcd\x18\xde\xa4\x8c\x36\x41\x10\x53\xdc\x9f\x96\x02\x41\
-\x44\xe2\xc2\xfd\x42\xfc\x8e\x60\x27\x6a\xeb\x5b\xf0\xca\x0b\x9b\
-\x70\xd0\xcc\x1b\x10\x8f\x14\x64\x96\x98\x3f\xef\xbc\xf3\x14\x61\
-\xcd\x12\x80\xcf\xc7\x64\x10\xcb\xc4\x18\x9d\x64\x6c\x80\xe1\x63\
-\x82\x42\xaf\x2d\x2c\xcc\x14\x95\xde\xeb\x46\x91\x30\x65\x02\x07\
-\x04\x00\xa3\x5c\x9c\x61\x61\x97\x88\x1b\x8a\x7c\x2e\x7a\x3b\x4c\
-\xc4\xef\x54\x11\x43\xb7\x08\x20\x2c\x03\xb5\x03\xf8\x3d\x86\x3b\
-\x19\x54\x61\xe0\x82\xe2\x9b\x37\x4d\x35\xf0\xcf\xb7\xfe\x8c\x0f\
-\xd7\x3c\x8f\xb0\x63\x2b\xac\x32\x7e\x79\xde\x7c\xf9\x5b\x8e\xda\
-\x43\xbd\xb3\xab\x43\xcd\x4a\xb6\x27\x7d\x28\xb6\x8e\xc3\x9c\xfd\
-\xcf\xc5\x01\xfb\xcd\x52\xe7\x24\x00\xb9\x42\x17\xcf\xcb\x05\x24\
-\x76\x66\x9d\x9e\x6c\xc2\xeb\xd7\xb4\x01\x7e\xf7\xbb\xdf\x65\xf4\
-\x6c\x4e\x8e\x05\x0b\x97\x5f\x8b\x39\x27\x0c\x47\x55\x59\x31\x0a\
-\x72\xf3\x05\x04\xf9\xc8\xb1\xf2\x9a\xb9\x69\x10\x80\x52\xc0\x91\
-\xb6\xfe\x35\x00\x52\x71\x45\x7c\x7a\x61\x24\x7e\x2a\x15\x40\x34\
-\x41\xee\xef\x84\x3f\xd0\x89\xf5\x1b\xb7\x62\xee\x6b\x75\x38\x70\
-\xfa\x2f\x11\x0a\xa6\xf7\x5e\xa4\x0a\xb8\xf4\xd2\x4b\xb7\xb3\x01\
-\xd8\x68\x07\xd0\x48\x7c\xe3\x8d\x37\x14\x43\x70\xf5\x73\xf3\xec\
-\x61\x69\x1d\x02\x9c\x8b\xb1\x83\x4c\xe0\x80\x00\x60\x80\x40\xcd\
-\x1a\x32\xca\xc4\x8a\x45\x02\x70\x31\xa9\x9a\xe7\x9e\x7b\xee\x67\
-\xa2\x87\xca\x06\xe2\x0e\xea\x28\x17\x57\xc0\xa2\xbe\x22\x47\xf1\
-\x86\x17\x2e\xf9\x00\x4f\xbe\x79\x2b\x42\x8e\x06\xf8\x0a\x7c\x60\
-\x1d\xd2\x51\xfb\x9e\x89\xb2\x82\xa1\xf8\x70\xd3\xdf\x31\xa1\xfc\
-\x20\x78\x72\xf2\x31\x77\xf1\x53\xf0\xb7\xfa\xd1\xda\xdc\x0c\x6b\
-\xc2\x85\xd1\xb9\x87\xe3\xdb\xc7\x5f\xae\x74\x22\xaf\xcf\x59\x45\
-\x9c\x5c\xc2\x95\xc5\xfb\x4a\xab\xf6\x75\x5f\x7d\x81\x80\x84\xe0\
-\xba\x88\x54\x37\xe4\x44\x0e\xee\x3a\xb1\x01\x66\x1e\x1c\xc7\xa8\
-\x61\xe5\x28\x14\x90\xe6\xe7\x16\xc0\x6e\x65\x48\x56\x3a\x0c\x10\
-\x70\x7d\x79\xa5\x0a\xb8\x3a\x2a\x6d\xa4\x98\x12\xfd\x8a\xf8\xa2\
-\x8a\x53\xa9\x6e\x01\x40\x97\x10\xbf\x03\xfe\xee\x0e\x2c\x5b\x51\
-\x8f\x4f\x57\xba\x30\x71\xe4\x15\xea\x5a\x34\x88\x39\x2d\x8c\x93\
-\x64\xb4\x9b\x67\xbe\x5f\x3e\x33\xa5\x84\x18\xe2\x8a\xfb\xf5\x9a\
-\x82\xba\xda\x3a\x18\x0c\xf6\xb9\x51\xe4\xce\x02\x20\x33\x7b\x58\
-\x6e\x80\x0b\x4b\xaa\xf4\xf0\xb5\xd7\x5e\x7b\xc1\xd7\xbf\xfe\xf5\
-\x83\x06\x62\x07\xb0\x6a\x86\x55\x2d\xd4\x69\x7c\x00\x8a\xaa\xb7\
-\x3e\x7a\x11\x2f\x2d\xbb\x0f\xb6\xbc\x38\x46\x8e\x18\x87\xfc\x12\
-\x71\x6b\xf2\x6d\x98\x32\xf4\x08\x88\xcc\xc1\x0a\xff\x1b\x18\xea\
-\xd9\x1b\x79\xb6\x52\x6c\x6e\x5d\x89\x4e\x7f\x37\xba\xda\xc5\x68\
-\xda\xb0\x12\xfe\x96\x76\x0c\xf7\x1e\x80\xd3\x0e\xb9\x5a\x6d\xba\
-\x98\x32\x36\x85\x26\xf7\x73\x42\xe9\x40\x17\x94\xec\x8b\xfb\x75\
-\xe7\xfa\xbd\xcc\x03\x50\x62\x29\x1f\x3d\xbc\x14\xf9\xe5\x6f\x63\
-\xfa\xbe\xd5\x28\xce\x2b\x44\x91\xb7\x10\x8e\x1c\x6e\x13\xef\x93\
-\xc1\xcc\x53\x9e\x80\x45\xad\xb9\xe5\x30\x86\x37\x61\x12\xfd\x42\
-\x7c\x71\xc7\x93\xa9\x2e\x44\x62\x1d\x68\x0f\x08\xa0\x3b\xdb\xf1\
-\xf6\x9b\x1b\xe0\x75\x1c\x23\xc0\xde\x5b\x81\x8e\x12\x91\xc4\x3c\
-\xed\xb4\xd3\x32\x9e\x4e\xf6\xfa\x01\x94\x02\x7f\xf9\xcb\x5f\x54\
-\x22\x89\x2a\x41\x07\x85\xf8\xb7\x86\x86\x86\x75\x93\x26\x4d\xea\
-\x75\xa3\xc8\x9d\x02\x80\xb6\x03\x98\x1e\x96\xb7\x5c\x54\xb2\x82\
-\xb3\x86\xbe\xfa\xd5\xaf\x1e\x73\xd3\x4d\x37\x9d\xb7\x23\x3b\x80\
-\x68\xe5\x24\x11\xea\x6c\xde\x2c\x07\x72\xd9\xa7\xf3\xf0\xe7\xf9\
-\x37\xc0\x59\x68\xc1\x88\x91\x35\x28\xae\x2c\x46\x5e\x89\x43\x6d\
-\x9c\x98\x67\x97\x41\x15\x9b\xb3\x21\xba\x0a\xc5\xf6\xe1\x70\x5a\
-\xbc\xe8\x8e\xb5\x8a\xd1\xd4\x8e\xd6\x26\x3f\x3a\x9b\x42\xd8\xb2\
-\x79\x33\x3a\x1a\x3a\x31\xbe\xfc\x50\x9c\xb4\xdf\x15\x4a\x04\xea\
-\x0d\x9b\xc9\x15\x7a\x73\xc8\x9d\xe5\x7e\xdd\x29\xb5\x38\x01\x56\
-\x1b\x82\xde\x3c\x37\x36\x35\xdd\x8d\x23\xe7\x94\xa3\xbc\xb0\x18\
-\x45\x02\x82\x5c\x67\xa1\x10\x9e\x96\x7f\xbe\x1c\x09\x04\xaf\xf2\
-\x08\xd2\x76\x00\x75\x7f\x48\x88\x4e\xe2\x77\xaa\x9e\x4c\x75\x88\
-\xfb\x27\xc4\xef\x6e\x47\x7d\x53\x0b\xe6\xbe\xbe\x15\x53\xc6\xdc\
-\x82\x86\xfa\xe6\xcc\x9a\x48\x32\xb6\xca\xb8\xcb\xbe\x4f\x45\x34\
-\x79\x2e\x72\x3d\x67\x0f\x53\xea\xe9\xd5\xc4\xa8\x2e\x08\x9c\xd5\
-\xab\x57\x2f\x39\xe8\xa0\x83\x7a\xdd\x28\x12\xa6\x30\xf0\x60\x24\
-\xc0\x76\xb3\x86\x58\x26\x26\xa8\x9b\x20\xc6\xc8\x2f\x90\x2e\x21\
-\xeb\xf3\xf7\x14\xcf\xaf\xbf\xfe\xba\xd2\x55\x4a\xe7\xfb\x9b\xf1\
-\xdb\x37\x2f\x45\x22\xaf\x0b\xa5\xc3\x8a\x50\x3a\xc2\x27\x22\xb6\
-\x18\x5e\x31\xaa\x4a\x9c\xc3\x51\x64\x1f\x8a\x84\x25\x86\x75\xe1\
-\x77\x50\x61\x9f\x80\x42\xdb\x30\x04\x13\x1d\xa8\x0d\x2d\x81\x2b\
-\x59\x24\xd2\x60\x0d\xea\xd7\x37\xa2\xb9\xb6\x0d\x81\xa6\x08\x0e\
-\x1e\x75\x1e\x0e\x9f\xfa\x4d\x35\x30\x14\xa1\x8c\x27\x30\x96\xbe\
-\xa3\xc9\xa5\xfd\x71\xbe\xfe\x8c\xae\x27\x77\x19\xa1\x81\x4a\xae\
-\x53\x01\x29\x77\x1d\x0a\x87\xfe\x0b\x7b\x4f\xac\x42\x89\xaf\x58\
-\x54\x81\xa8\x07\x6b\x1a\x04\x56\x30\x8b\x57\xa0\xa4\x01\xed\x80\
-\xb4\xe8\x4f\x13\x3d\x25\x74\x48\xa6\xfc\x88\x25\xda\xd1\x26\xc4\
-\x6f\xed\x6c\xc3\x87\x1f\x6e\x16\x59\x71\x1c\x22\x5d\xc3\x94\xe8\
-\xa7\xa4\xa4\x71\x27\x06\x76\x8f\x5c\x40\xb6\x1a\xa0\x7b\x48\x89\
-\xc7\x19\x58\x04\x83\xae\x49\xa4\xca\x78\xf7\xdd\x77\x3f\x3c\xf1\
-\xc4\x13\xef\x46\x2f\x1b\x45\xee\x14\x00\x0c\x29\xa0\xf6\xcd\x14\
-\x91\xe4\x15\x4e\x2b\x92\x81\x50\xe9\xe1\x3f\xfd\xe9\x4f\x3f\x1e\
-\x21\xad\x2f\x3b\x80\xc0\x90\x1b\x52\xc6\x9a\xde\x34\xe9\x85\xf9\
-\xbf\xc2\xca\x8e\x7f\xa1\x60\xb8\x07\x55\xe3\x8a\x51\x56\x54\x09\
-\x37\x93\x29\x02\x8e\x32\x67\x0d\x5c\x62\x55\xc7\xc4\x60\xda\x12\
-\xff\x18\x45\xd6\xe1\x28\x10\x00\x24\x92\x71\xd4\x87\x57\xc0\x2a\
-\x42\xa8\x33\xdc\x8a\x8e\xee\x36\x6c\x5a\x53\x87\xd6\x0d\x9d\xc8\
-\x89\xe5\xe2\x9c\x19\xf7\xa1\x30\xbf\x24\x23\x05\xa8\x06\xe8\x1e\
-\xf6\x25\x05\x06\xc2\xfd\xfa\xfe\x79\xbe\x7b\xef\xbd\x77\x9b\x14\
-\x10\x69\x13\xb5\xbe\x83\xbd\xa6\xd7\xa2\xba\xa2\x0c\x25\x79\x8c\
-\x09\x14\xc1\x66\x29\x12\x10\x14\x2a\x00\x58\x51\xa8\x0c\xc2\xb4\
-\xc8\x6f\x97\x51\xe7\x56\x3c\x7e\x24\xa4\x77\x04\x85\xf8\x5d\x6d\
-\x58\xbb\xb1\x11\x1b\xd7\x54\xa1\xd4\x7b\x8a\x22\x3a\xaf\x45\xdd\
-\x4f\x63\x96\x12\x80\xe2\xdf\x7c\x2f\xe6\xfb\xd6\xab\xb4\xb1\x5a\
-\x98\x00\xe0\xd8\xd2\x0e\x20\x08\xc4\x6e\x79\xe3\xf2\xcb\x2f\x7f\
-\xc8\x04\x80\x5e\x33\x81\x83\x02\x40\xd6\xec\xe1\x02\x39\x56\xca\
-\xfb\x91\x17\x5e\x78\xe1\xb7\xcf\x3a\xeb\xac\xa3\xfa\xb2\x03\x68\
-\x49\x3f\xff\xfc\xf3\xaa\x84\x8a\xfa\xa9\xad\xb3\x11\x8f\x7d\x70\
-\x29\xf2\xaa\xed\xa8\x9c\x98\x8f\x82\x32\x1f\xbc\xce\x02\x45\x7c\
-\x9f\xab\x18\xce\x9c\x5c\xe1\xfe\x10\xa2\x62\x29\xc7\x2d\x61\x15\
-\x41\xb3\xa7\xdc\xb0\xa5\x5c\x6a\x93\x6a\xa6\x42\x03\x91\x2e\x04\
-\x62\x9d\x62\x13\xf8\x51\xbf\x42\x44\xe9\xfa\x00\x66\x0c\xfb\x06\
-\x66\x8f\x3d\x33\xb3\xf4\x2b\x07\x93\xb1\xf4\xbe\x82\x44\x03\xe1\
-\x7e\xfd\x9a\xaa\x8b\xee\xa0\x5e\x0c\x83\xe7\x2c\x29\x15\xae\xcf\
-\x7d\x07\x35\x7b\xd5\xa1\xb2\xb8\x04\xc5\x3e\x01\x81\xab\x50\x65\
-\xfe\x2c\x19\x35\x90\x93\xd6\xff\xca\xf0\xeb\x40\x3c\xd9\x89\xae\
-\x10\x89\xdf\x8e\xda\xc6\x66\x7c\xba\xa2\x00\x55\x05\xdf\xc1\xca\
-\x95\x6b\x32\xab\xa2\xf0\xde\xc9\xfd\xd4\xe9\xfd\x4d\x2e\x21\x10\
-\xa9\x4e\x99\xa9\x64\xd3\xd3\xc6\xf8\xbb\x7b\xee\xb9\xe7\xf9\xdb\
-\x6f\xbf\xfd\xf7\x06\x00\xfa\xcc\x04\x0e\x56\x02\x64\xd2\xc3\x5c\
-\x4c\x4a\x38\x8d\x9b\x4c\x0c\x13\xab\xfb\xd0\xbb\xee\xba\xeb\xd2\
-\xde\xc2\xc2\x7c\xcf\xa2\x47\xae\x80\xcd\x58\x35\x07\xee\xc3\x4f\
-\x9f\xc3\xc7\x6d\xcf\xa0\x7c\xa2\x0f\xe5\x63\xf2\xe1\x70\xda\xd5\
-\x16\x6e\x54\x0d\x65\xee\x11\x48\x59\xe5\x3c\xd6\xa8\x58\x2a\x51\
-\x24\x2d\x71\x05\x00\x6b\x8a\x9b\x28\xb2\xdb\xc5\x16\x10\x1b\x20\
-\xdc\x22\x40\x88\x2b\xc2\xb4\xd7\x77\xa3\x6e\x89\x1f\x6e\x51\x0d\
-\xa7\x4e\xfc\x85\x02\x99\x5e\xb2\x9d\x7b\xf5\xf5\xb5\xb8\x74\x7f\
-\x44\xef\x6d\xc0\x29\x6e\xb9\xc7\x00\xf5\xac\x2e\xd6\x28\x17\xee\
-\x2f\x28\x5b\x87\xe2\xa1\xf3\x50\x59\x5a\x20\xaa\xa0\x40\xc5\x06\
-\x1c\x39\x5e\x91\x04\x2e\x75\xef\x29\x79\x92\xa4\xa8\x81\x70\x2c\
-\xed\xf6\xd1\xf0\xdb\x5c\xd7\x02\x7f\xe3\x54\x91\x0f\x47\x60\xc5\
-\x8a\x95\x19\x97\x93\xfb\x22\x70\x39\xdc\xa9\x53\xa7\x6e\x37\xcf\
-\x32\xfb\xc8\xb1\xa4\x9d\xc3\x0d\x3c\x18\x0b\xd1\x76\x00\xbb\xd8\
-\x2c\x7f\xba\xef\xbe\xfb\xfe\x82\x6d\x93\x42\x7b\xcd\x04\x0e\x56\
-\x02\x28\x3b\x40\x2f\x2a\x29\xaf\x55\x7a\x58\x08\x37\x86\xe9\x61\
-\x39\xba\xb2\xed\x00\xde\xec\x5b\x6f\xbd\x95\x59\xe9\x93\xed\x99\
-\x4f\x6e\x41\x20\xbf\x0e\xc3\xf7\x2d\x82\xb7\x30\xbd\xe6\x0d\x41\
-\x40\x09\x50\xe0\xa8\x84\xd3\xe6\x16\x09\x60\x00\x00\x31\x15\x47\
-\xb7\x89\x96\x64\x47\xd2\x86\xb6\x68\x2d\xc2\xd1\x50\x7a\x7b\xb9\
-\x48\x54\xfc\xe6\x28\x6a\x17\xb5\xa2\x65\x5d\x37\x4e\xdf\xf7\x76\
-\x14\xb9\x86\x66\x42\xa9\x67\x9e\x79\x66\x66\x5f\xa3\xec\xfb\x1a\
-\x28\x08\xf4\x67\x3c\x27\x4b\xc2\xa8\x0a\xc8\x79\x3a\xde\x40\xae\
-\x1b\x33\xb6\x14\xb9\xe5\x0b\xe0\xf2\x2e\x47\x81\x37\x0f\xb9\x2e\
-\xb1\xc6\x73\xd2\x73\xf7\x12\x49\x79\x12\x91\x5a\xdd\xe1\xa0\xb8\
-\x7c\xdd\x68\x6f\xae\x82\x2b\x75\x2c\x6a\x37\x84\x94\x44\x61\x23\
-\x60\xb9\x30\xd6\xb1\xc7\x1e\xab\x6c\x17\xed\xc1\xf4\x27\x01\xf8\
-\x1d\x06\xa8\x18\x30\xa2\x8a\xe2\x6b\xba\xaa\x54\x05\xe2\x9d\x3d\
-\xf8\xf8\xe3\x8f\xbf\x20\xdf\xd3\x53\xc2\x7a\x4d\x04\x0d\x0a\x00\
-\x86\x14\x50\xb3\x86\xb8\xd7\x30\x17\x93\x92\xae\x66\x0d\x3d\xf8\
-\xe0\x83\x3f\x9c\x3c\x79\xf2\xc4\x6c\x3b\x80\x37\xca\x85\x23\xc8\
-\xa9\x6a\x91\x47\xb9\xda\xa3\x1f\x5e\x88\xa2\x09\x4e\x54\x4f\xe1\
-\x1a\xbb\xc6\x76\xed\x04\x81\xc3\x2e\xfe\xb4\x5b\x0c\xbe\xa1\x69\
-\xef\xd9\x12\x37\x7c\x68\xe1\xa3\x94\x8d\x8a\x00\x81\x54\x1b\xba\
-\x13\xad\xe9\x9a\x7b\x39\x67\x24\x12\x43\x24\x1c\xc1\xd6\xcf\x3a\
-\xb0\xe5\xe3\x76\x1c\x3e\xfe\x3c\x8c\xf4\x1c\xa0\x88\xa5\xf7\xeb\
-\xed\x6d\x79\xb9\xc1\x88\x7f\xf3\xc0\xf3\xf9\xe8\x16\xca\xe0\x2a\
-\x29\x40\x9d\xab\x55\x0c\xb9\x71\xe4\xc8\x4a\x94\x0c\x6d\x47\x8e\
-\x73\x8b\xf2\xf9\x63\xc9\x56\xb9\x6f\x71\x0d\xe1\x43\x2c\x5c\x84\
-\x40\xfb\x48\x6c\x6d\xe8\x52\x51\x50\xbd\x24\x0e\x39\x9f\xfa\xff\
-\x88\x23\x8e\x50\xab\xa1\xea\xec\xdf\x8e\xe6\x16\x12\x80\x1c\x53\
-\x4a\x00\x4a\x3b\x0d\x00\xde\xc7\x71\xc7\x1d\x77\xdd\x7b\xef\xbd\
-\x37\x5f\xbe\xdb\xeb\xda\x80\xbb\x04\x00\x69\x39\xb4\x03\xb8\xa8\
-\xa4\x7c\xa4\x16\x95\x3c\xe3\x8c\x33\x4e\xbd\xf8\xe2\x8b\x4f\xc8\
-\x76\x07\xf9\x90\xcc\xa6\x69\x4e\x49\xa6\xe2\x78\x62\xc9\xa5\xa8\
-\x9e\x99\x8f\xb2\x9a\x74\xe0\xc2\xe5\x72\xaa\xdd\xba\xed\x39\x76\
-\xd1\x9f\x22\x09\x2c\x6e\xe4\x59\xcb\x45\xd7\xd0\xe1\xd0\x05\x15\
-\x29\x21\x7e\x2b\x82\x49\x1a\x51\x31\xd1\xa5\x51\x01\x55\x9a\xf8\
-\x61\xe9\x1d\x5b\xbb\xf1\xd9\xfb\x2d\x98\x5e\xf6\x0d\x4c\x28\x38\
-\x32\x23\xb2\xa9\x76\xb8\xe8\x44\x5f\x00\x18\xa8\xf8\x37\x37\xaa\
-\x3a\x4a\x82\x07\x1e\x78\x40\x01\x4d\x67\x26\xf5\x35\xc8\x99\xda\
-\x25\x23\x91\x68\xd9\x33\xa4\xcc\x68\xa5\x79\xe3\x47\xbd\xc7\x00\
-\x7d\x7e\xaa\x2a\x6e\x2d\xd7\x5b\x35\x70\x5f\x13\x4e\x29\xf2\xa9\
-\xee\x68\x5f\xe9\x05\x25\xd9\xe5\x9e\x1a\x27\x4d\x9a\xf4\x43\x39\
-\x6e\xe4\x6b\x6c\xab\x06\x8e\x1a\x03\xba\x4b\x00\xc8\x5e\x54\x92\
-\x65\x62\xc3\xe4\x82\xfb\x3d\xf2\xc8\x23\xd7\x67\xdb\x01\x7c\x78\
-\xf1\x12\x14\xa1\x95\x9f\x9e\x8a\xe2\xaf\xab\x7f\x88\x11\x07\x16\
-\xa3\x64\x98\x4f\x15\x37\x10\x00\x2a\x84\x69\x15\x31\x6f\x71\x28\
-\x10\x70\xcf\x5c\x02\x20\x47\xbc\xce\xa4\x48\xad\x18\x13\x28\x72\
-\x24\xf1\x15\x00\xe4\x3c\xd1\x98\x10\x3f\x94\x06\x00\x83\x43\x6b\
-\xdf\x6e\xc2\x24\xdf\x9c\x0c\x00\xa8\x17\x59\xc3\x47\x91\xda\xdb\
-\x8c\x9b\x1d\x05\x80\xb2\xbf\x6f\x7e\x4f\xc2\xd3\xb6\x61\x20\x86\
-\x4b\xcb\x53\x1a\xd0\xfa\xd6\x40\xe8\xcd\xf3\xd0\xe7\xd5\xdb\xbd\
-\x52\x2d\x32\xb8\x44\xe2\x73\x8f\x01\x73\xc0\x67\x47\xdc\x4f\x29\
-\x41\x51\x4f\x83\x91\xe3\x4b\xc2\x93\xf3\x79\xbe\x1b\x6e\xb8\xe1\
-\xf1\x27\x9e\x78\xe2\x9f\x72\x8f\x9b\xa5\x6b\x03\x70\xbb\x6a\xe0\
-\x9d\x02\x80\x01\x82\xcc\xa2\x92\x72\x81\x62\x79\x58\xb5\xa8\xe4\
-\xab\xaf\xbe\x7a\x87\x10\x39\xdf\x6c\x07\xf0\x61\x79\x83\x3c\xaa\
-\x02\x46\xbb\x0d\x4f\xad\xfa\x21\x46\xcd\x2e\x44\x71\x95\x00\xc0\
-\xe3\x52\xdd\x69\x77\xa5\x09\x6e\xd1\x20\xb0\xa5\x73\xe8\xcc\x82\
-\xa9\x05\xa6\x93\x72\xe7\x89\x0c\xf1\xe3\xc9\x08\xa2\x89\xb0\x02\
-\x40\x88\xfb\xf7\x74\x04\xb1\xe6\xcd\x46\xcc\x28\x3f\x19\x55\x98\
-\xa1\x06\x8a\x4b\xce\xd1\x98\xe2\x0a\x24\xd9\x00\xd8\x19\xf1\xdf\
-\x1b\x80\xf4\xb6\xb0\x74\xc5\x96\x2e\x5d\xaa\x88\xa8\x63\xf2\xba\
-\x40\x53\x03\x46\x2f\x89\x43\xe2\x13\x98\x5c\x01\x8d\xae\xaa\x79\
-\xff\x83\xfe\x08\xaf\x5f\xf3\xdc\xda\x9e\xa2\x74\x25\x08\x98\x16\
-\xe7\x39\xc5\xdd\xfe\xe8\x8a\x2b\xae\x78\x4c\x24\xef\x46\xe9\xf5\
-\x72\x5d\x25\xfe\xe5\x3e\x22\xf2\xfb\xcc\xaa\x20\xbb\x0a\x80\x4c\
-\x58\x58\x1e\xb2\x48\x5e\xd3\x0e\x18\x79\xdb\x6d\xb7\x5d\x32\x7b\
-\xf6\xec\x7d\xcd\xee\x20\x6f\xfa\xcf\x7f\xfe\xb3\x2a\xa9\xd2\xb1\
-\xf4\x17\x37\xdc\x82\xaa\x59\xf2\x10\x22\x01\x3c\xb9\x9e\x34\x00\
-\x72\xdc\xa2\xff\xcd\x20\x48\x4b\x01\x0d\x80\x64\x2a\xa1\xd4\x47\
-\x5c\x01\x20\xa2\x24\x42\x8c\x45\x96\x21\x06\x4e\x42\xe8\x14\x09\
-\xb0\xe6\xf5\x06\x1c\x56\x73\x21\x3c\x81\x61\xea\xba\x5c\x66\x95\
-\x3a\x95\xfb\x1b\xf5\x06\x80\x1d\x81\xa0\x3f\xe2\x67\x9f\x8b\x46\
-\x1c\x9f\x91\x06\x19\xd7\xf4\x21\x51\xd8\x19\x94\x22\xb7\x6a\xff\
-\x9c\x81\x30\x12\x5d\xd7\x3d\xf4\x66\xe9\xf7\x67\xf5\x53\xad\x90\
-\x91\xd8\xe8\x59\x11\x7c\x74\xaf\x45\x1d\xc4\x5f\x7a\xe9\xa5\xf7\
-\xc4\x16\x7b\x51\x40\xb9\x41\x68\x52\x27\x80\x53\x6b\x02\xc9\x35\
-\x42\x72\x0e\x1d\x02\xde\x2e\x6b\xb7\x33\x00\xc8\x2c\x2a\x29\x04\
-\x55\xe9\x61\x63\xcf\xc1\xe3\xaf\xb9\xe6\x9a\x33\xcc\x76\x00\x6f\
-\xfe\xc5\x17\x5f\x54\x3a\x93\x62\x8a\x0f\xbc\x3e\x32\x17\x9d\xc3\
-\x17\xa3\x72\x5c\x91\x3c\x90\x5b\x40\x20\x16\xb3\xdd\xa3\x74\xbf\
-\x19\x04\x56\xe4\x6c\xe3\x20\xc5\xfd\x51\xc5\xfd\x8a\xf8\xc9\x90\
-\x48\x80\x90\xd2\xa9\xc1\x40\x08\xad\x0d\x9d\xd8\xf0\x5e\x1b\x4e\
-\x1c\x79\xbb\x48\x83\xf4\x1e\x03\xac\xac\xfd\xd1\x8f\x7e\xb4\xdd\
-\xae\xda\xbb\xa2\xff\xfb\x7b\x6f\x16\xf1\x1c\x03\xad\x0e\xd9\x49\
-\x3c\x3d\x49\xb4\xb7\xdf\xf7\x75\x6d\xaa\x14\x72\x3c\xbb\xb6\x0f\
-\xe4\xb9\xa2\xcf\x3c\xf3\x4c\x58\x00\xc7\x75\x80\x83\x4d\x4d\x4d\
-\xf5\x1f\x7d\xf4\xd1\x22\x39\x7e\x26\xd7\xdc\x2c\xd7\xae\x93\xdf\
-\x36\x09\x10\x54\x02\x48\xae\x1d\x11\x40\x68\xeb\x7f\xf7\x00\x00\
-\xe9\x45\x25\x55\x99\x98\xbc\x56\xe9\x61\xd1\x41\x93\xb9\xe7\xa0\
-\x39\x3d\xcc\x23\xad\x71\x1a\x4c\x34\xc8\x28\x16\x03\xd6\x2d\x58\
-\xee\xf8\x0b\x46\xed\x5f\x0a\x6f\x5e\x6e\x3a\x7e\xed\x24\x00\xa4\
-\x8b\x17\x40\x20\x68\x29\xa0\x01\x90\x40\x3c\x4d\xfc\xa4\x10\x3f\
-\x25\xc4\x4f\x32\x9f\x1e\x54\xdc\x1f\xe8\x0e\xa2\x6e\x55\x1b\x52\
-\x1b\x2a\x70\x60\xc9\x77\x33\xc6\x16\x63\xe4\x04\x00\x45\x72\x5f\
-\x03\xbe\x33\xfa\x7f\xb0\x80\xe8\x0d\x50\x7d\x11\x9e\x20\xd1\x44\
-\xd7\x4b\xc1\x75\x76\x76\x26\x3e\xfe\xf8\xe3\xf0\x07\x1f\x7c\x10\
-\x10\x7b\xa3\x4b\x5c\xc7\x6e\x19\x7b\xf6\x4e\x21\x72\xab\x10\xbc\
-\x49\x7a\xbd\xf4\x06\xf9\xac\x41\xc6\xbf\x59\x8e\x7e\x7e\x47\xc6\
-\x2f\x2c\x3d\x2e\x00\xe8\x95\xfb\x77\x0a\x00\x06\x08\x54\x7a\x58\
-\x4e\xce\xf4\x30\xab\x84\x32\x7b\x0e\x0a\xc7\x55\x9a\xdd\x41\x5a\
-\xc0\xbf\xf8\xc5\x2f\x32\x05\x8c\x24\xf8\xbc\xee\xdf\xa2\xf4\xc0\
-\x18\xf2\x4b\xbc\x42\xa0\x5c\x78\xdc\xb9\x70\x5a\x73\x05\x00\xec\
-\x9e\x0c\x08\x2c\x96\xf4\x3e\x3d\x9a\xf3\x49\x78\xd5\x53\x01\x84\
-\xa2\x01\x45\xfc\xee\xae\x20\xd6\xbe\xd3\x88\x43\x4a\x2e\x46\xb8\
-\xd1\x95\xd9\x61\x84\x46\xd1\x77\xbe\xf3\x9d\x1e\x75\x83\x7d\x11\
-\x7c\xb0\xfa\x7f\x57\x00\x60\x7e\xad\xf7\x2a\xd4\x9d\xf7\x2a\x84\
-\x4c\x09\x97\x07\x85\xab\xbb\xe6\xcf\x9f\xdf\xb5\x6c\xd9\xb2\x6e\
-\x79\x26\x72\x31\x7b\x58\x5e\x07\xa4\x77\x92\xc8\xf2\xdd\x36\x8a\
-\x7a\x82\x40\x3e\x6b\x91\x63\xab\x7c\xa7\x43\x18\x20\x40\xe2\xcb\
-\xf9\x14\xf1\xa5\xf7\xca\xfd\x3b\x0d\x00\x86\x85\xe5\x01\xb8\x9a\
-\x98\x87\x8b\x4a\xea\xb0\x30\xf7\x1c\x3c\xf1\xc4\x13\x0f\x36\xdb\
-\x01\x24\x08\xed\x00\x2e\x79\xaa\x37\x99\xb0\x15\x74\x61\x95\xef\
-\xcf\x18\x3a\x99\x09\x8c\x5c\x05\x02\x97\x5d\x8c\x27\xab\x17\x2e\
-\x8b\xd7\x00\x82\x5b\xa4\x40\x8e\x88\xfe\x44\x5a\xe4\x0b\xd1\x23\
-\xe4\xfc\x64\x37\xc2\x09\x1a\x53\x01\x01\x57\x00\xcd\x1b\xfd\x88\
-\xae\x2a\xc3\x4c\xdf\x39\xaa\x9e\x5e\x6f\x38\xcd\x5d\x3b\xfb\xd2\
-\xff\xbd\x81\x60\xb0\x00\xc8\xfe\x5b\x36\xa1\x7b\x3b\xb2\x69\x2e\
-\xd7\x2b\x80\xc9\xdf\x52\x1b\x36\x6c\x08\x8b\x3f\xdf\xb1\x60\xc1\
-\x02\xff\xc2\x85\x0b\xfd\x42\x40\xea\x6d\x1a\x6e\x8a\xe8\x72\x0c\
-\xf3\x28\x3d\x28\xcf\x47\x00\x74\xc9\xb1\xc3\x00\x41\xbb\x74\xbf\
-\x7c\xd6\x61\x48\x86\xa0\xbc\x8f\xc8\xb9\x63\xc9\x6d\xad\xcf\x8a\
-\x9d\x9d\x95\x00\xca\x1d\x64\xb9\x78\x6f\x7b\x0e\x66\xdb\x01\xf4\
-\xc9\xb9\x6d\x3b\x4b\xc0\x68\xfc\xd0\x2d\xec\xcc\x5f\x8a\xae\x31\
-\x0b\x51\x5c\x99\x0f\xaf\x4f\x54\x01\x6b\xeb\x6c\xe9\xee\xe4\x8e\
-\x9d\x02\x06\xbb\xc5\x25\x9c\x1f\x51\x44\x4f\xf7\x00\xc2\x72\x0c\
-\x45\xba\x15\xe7\x77\xb6\x77\xa1\x7e\x5e\x18\x5f\xad\xb8\x1e\x9f\
-\xad\x4a\x27\x53\xe8\x57\x53\xd2\x5c\x79\xe5\x95\xdb\xed\x30\x36\
-\x18\x00\xec\x2a\xf7\xeb\x23\x89\xac\x89\xae\x4b\xdf\x44\x42\x45\
-\x49\x6c\xe9\xed\xc2\xe5\xf2\xb6\x85\x81\x1a\x12\x98\x84\x0f\x9b\
-\x5f\x4b\x0f\x19\xc4\xe7\x31\x28\x84\xd6\x20\xe8\x96\x71\x26\xc1\
-\x03\x5c\x16\x5e\xde\xf3\xef\x11\xf1\x32\xa2\xa2\x9a\x55\xcc\x5f\
-\x3e\x4b\xc6\xb9\x53\x77\x3f\x6d\x57\x00\xc0\x35\x05\x55\x7a\x38\
-\x95\x5e\x5c\xba\x5a\x2c\xdd\xf1\x62\x9d\xde\xc9\x52\xf2\x6c\x77\
-\x90\x2e\x0b\x27\x59\xd0\x65\xa1\xe8\x2b\x2c\x2c\x40\x6b\xf1\x07\
-\x88\x8c\x5e\x25\xaa\xc0\x97\x56\x05\x9e\x5c\x45\x78\xa7\xa1\x0a\
-\xd2\x12\x20\xae\x74\x7f\x84\x65\x54\x02\x80\x50\x84\x9c\x1f\x44\
-\x57\x67\x37\x1a\x96\x06\x70\x98\xef\x0a\x6c\x5c\xde\xaa\x5c\x32\
-\x5a\xe3\xb4\xfe\xc5\x18\x55\xbe\x75\x7f\x01\xa0\xfe\x40\xb0\x2b\
-\x00\x30\x1b\x7c\x7a\x1e\x83\x10\x25\x21\x1e\x42\x87\x88\xf5\x36\
-\xd1\xe7\xcd\x72\x8f\xed\x06\xa1\x43\x46\x0f\x92\xd0\xfa\x68\xea\
-\x9a\xf3\xd9\x23\x32\x8e\x61\x43\x0d\xa8\xd7\xf2\xbc\xea\xb5\xf4\
-\xa8\xf4\x98\x7c\x16\x97\xeb\x25\x48\x78\x72\xbd\xfc\x7d\x87\xb5\
-\x7a\x3b\x5d\x46\x4b\x3b\x40\x2f\x2a\x29\x6f\xd5\xec\x61\x18\x7b\
-\x0e\xd6\xd4\xd4\x8c\x32\xdb\x01\x1c\x1c\xba\x49\xb7\xdc\x72\x8b\
-\x7a\xaf\xf3\xea\xe5\xe5\x65\x88\x56\xae\x45\x63\xd5\x3b\xc8\x2f\
-\x16\x29\xe0\xf5\x08\x08\xdc\xca\x2d\xcc\xb1\xb2\xc4\xda\xa6\x62\
-\x00\xf4\x00\xa2\xf1\xf4\x64\x8a\x80\x58\xfd\xdd\x1d\x02\x82\x4f\
-\x9d\x38\xc8\xfb\x03\xac\x5d\xba\x45\xf9\xd7\x04\x19\x43\xaa\xa2\
-\x9e\x70\xf6\xd9\x67\xf7\xba\xc1\xc4\xe7\xe1\x01\xe8\xb9\x78\x9a\
-\xe8\x04\x00\xb9\x6e\xcd\x9a\x35\x5d\x22\xd6\x49\xf0\x96\xa5\x4b\
-\x97\xb6\x90\x73\x35\x91\x8d\xce\xd7\x01\xf9\x2c\x48\x57\x8d\xdc\
-\x6d\xfc\x9d\x9d\x9c\x4f\xc2\x46\xe8\xc3\xcb\xdf\xa2\x24\xae\x71\
-\x54\x84\x96\xef\xc4\x44\x53\xc4\xe5\x7b\x71\x01\xbf\xf2\xf1\xa9\
-\xef\xa5\xa5\x38\xf6\x02\xba\x01\x15\x6a\xee\x34\x00\x74\x7a\xd8\
-\xa8\x16\xce\x2c\x2a\xa9\xf7\x1c\xcc\x4e\x0f\x73\xc0\x58\xe9\xc2\
-\xcd\x9f\xe8\x17\xd3\x9f\xe5\xe0\xd1\x3f\x1e\x39\xa9\x14\xf5\x85\
-\x6f\xc3\xef\x5b\x0d\x77\x2e\x67\xd8\x38\x60\x77\xa4\x6b\xdc\xa9\
-\xbd\x78\x2e\x26\x7e\x18\xf8\x09\x34\xc5\x31\x26\x7a\x0c\x0a\xbb\
-\xa7\x60\xc9\xa2\xa5\xea\x6f\x7c\x60\x46\xfe\x98\xa4\xb9\xf6\xda\
-\x6b\x33\xd3\xa6\x3f\x2f\x00\x90\xd8\x7a\xfb\x38\x9d\xb3\xdf\xb2\
-\x65\x4b\x50\x08\xde\x4e\x82\x4b\x6f\xea\xea\xea\xa2\x21\xa6\x09\
-\x4d\xe2\xea\xf7\x7c\xad\x8e\x24\xbc\xf1\x77\xc5\xf1\x24\x36\xb9\
-\xd9\x38\x72\x00\xc9\xd9\xe4\x6a\xb5\xa8\x83\x70\x34\x09\xae\xd8\
-\x5b\x40\x4f\x11\x9b\x11\xf3\xe4\x78\x51\x25\x83\x9e\xa5\xb3\x2b\
-\x12\x40\xcd\x1a\x12\xf4\xa9\x45\x25\xb9\x05\x3d\xcb\xc5\x67\xcc\
-\x98\xa1\xf6\x1c\xec\x2d\x3d\x4c\x42\xb1\x34\x4c\xfe\xae\x00\xa0\
-\x17\x3b\x62\x63\xad\x60\x55\x4d\x21\xe2\x95\xb5\x68\xb3\x6c\x40\
-\xc0\xb2\x15\x5d\x96\x46\x95\x06\xf6\xc6\x2b\xe0\x43\x15\x0a\xc2\
-\x63\x91\xd3\x56\x81\x55\xcb\xd7\x64\x96\x9a\xa7\xbd\x41\xe2\x93\
-\xe8\xdc\x0d\x3c\xdb\xef\xcf\x26\xe0\xce\x00\x40\x8b\x75\x4d\x78\
-\x9e\x5f\xae\x1f\x15\x42\x53\x87\xb7\xca\x33\x35\xcb\x3d\xe8\xf9\
-\xf7\x41\x83\x98\x81\x3e\x08\xaf\x08\x4e\x2b\x9d\x22\xde\x88\xd2\
-\x91\xd3\x63\x72\x24\xf1\xe3\xb4\xde\x49\x78\x72\x34\xf7\xfd\xa1\
-\x0a\x11\x1b\x82\xc7\x94\xc1\xe1\x49\x03\xf8\xa9\xcd\x9b\x37\xef\
-\xd2\xd4\xac\x5d\x91\x00\xca\x0e\xe0\xa2\x92\x72\x23\x6a\xcf\x41\
-\x2e\x2a\x29\x5c\x31\x9a\xe9\x61\xb9\x61\x4f\x6f\x65\x62\x04\x01\
-\x4b\x9a\xef\xbe\xfb\x6e\xa5\xb7\xb3\x93\x29\x14\xdd\x74\xe1\x08\
-\x90\x5c\xb1\x0b\xb8\xc1\x14\x5d\x49\x12\x9c\xc6\xa4\x56\x2d\x3c\
-\x37\xfd\x7d\x7e\xc6\x8d\x2c\x2f\xbe\xf8\x62\x25\x01\x76\xb5\x02\
-\x88\x47\x2d\xd6\x49\x6c\x6d\xb8\x85\xc3\xe1\x84\xb8\x64\x9d\xc2\
-\xe5\xe4\xf0\x16\x11\xf1\x6d\x9a\xa0\x24\xb0\x21\xca\x15\xd1\x35\
-\xb1\x35\xe1\x0d\xa2\x87\x8d\xae\x5c\x3a\xf9\x1b\x93\x33\x51\x06\
-\x69\xe4\x3a\xb4\xd8\x13\x24\x7c\x8a\x3a\x8f\x1b\xea\x52\xb6\x8b\
-\xd4\xe7\x51\x5b\xf2\x46\x80\x6b\xb7\xce\xc9\xdf\xa5\x59\x96\xe6\
-\x45\x25\x8d\x78\x00\x17\x97\xe6\x9e\x83\x57\x4d\x9b\x36\x6d\x52\
-\x7f\x65\x62\x24\xdc\x23\x8f\x3c\xa2\x0a\x1b\x75\x3d\xdb\x8e\x76\
-\xc4\xca\x0e\xbd\x12\x40\x27\x9c\x70\x82\xda\x56\x7e\x47\xf3\x01\
-\x76\x04\x00\xbd\xa4\xbd\x5e\xcd\x93\xdc\xb5\x6e\xdd\xba\x6e\xad\
-\xc7\x17\x2f\x5e\x4c\x7f\x5b\x13\x57\x71\x3a\x09\x9e\x45\xe8\x00\
-\xad\x75\x8a\x76\x23\x04\xab\x08\x6e\x44\xe3\xa2\x06\xd1\xd5\xe4\
-\x0c\x12\x9d\x06\x1b\x81\x25\xcf\x9d\x34\x08\xaf\x08\x9e\xbe\xad\
-\xcc\x91\x52\xf3\x73\x5b\x88\x61\x97\x01\x60\x49\xcf\x80\x60\x7a\
-\x98\x89\x20\xbd\xe7\xe0\x29\x97\x5d\x76\xd9\x49\xfd\x55\x0b\x6b\
-\x42\x32\x3e\x20\x86\xa3\x3a\xd2\x6d\xeb\x6d\x5f\x1c\x02\x89\x9d\
-\x1c\xcf\xf8\x3a\xdb\xec\xd9\xb3\x21\xd7\x51\xd2\xc2\xbc\x40\xd2\
-\x40\x01\xa0\x57\xda\xd6\x9d\xef\xeb\xeb\xeb\x43\x22\xd2\x95\x1e\
-\xa7\x58\xef\xe8\xe8\xe0\xc5\x42\x26\x02\x67\x38\xdd\xa4\xc7\x33\
-\x62\x9d\x04\x27\xb1\xb9\x46\x1f\x89\x2d\xaf\xc9\xe1\x24\xb4\x32\
-\xd6\x74\x54\x4e\x9e\x8f\xfa\x3c\x29\xf7\x9d\x32\x08\x6f\x26\x3a\
-\x99\x62\x8f\xad\xbc\xb1\xab\x00\xc8\x2c\x2a\xc9\xf4\x30\x17\x93\
-\x62\xb5\xb0\xb1\xe7\xe0\x0d\x03\x99\x3d\x9c\x32\x8a\x22\x98\xbd\
-\xe3\x76\xa9\x4c\xa6\x30\xd5\xaa\x97\x97\x27\x61\x08\x0c\x1a\x8e\
-\x4c\x77\xd2\xca\x67\xd9\x37\xa5\x46\xf6\xe2\x8a\x3b\x7c\x58\x83\
-\xe8\x5a\xca\x08\x81\x63\x72\x3d\xbf\x70\x79\xeb\xc2\x85\x0b\x9b\
-\xea\xea\xea\x74\xf5\xac\xd6\xe5\x41\x93\x2e\x57\xc4\x66\xd7\x5c\
-\xce\xef\x51\x9c\x0b\x21\xe9\x9e\x45\x53\x6a\x16\x28\x94\x1e\x97\
-\xeb\x28\xa2\xd3\x68\x93\xd7\x9a\xe0\x49\xf9\x1b\x07\x44\x71\xba\
-\xf1\x9a\x29\xe5\xff\xd8\x52\x2b\xbb\x3c\xd1\x5e\x2f\x2a\x29\xc4\
-\xf6\x1a\xf1\x00\xba\x83\xa3\xb9\xe7\xa0\xe8\xf1\xc2\x81\xce\x1e\
-\xd6\x9c\xc9\x1a\x02\x4a\x0e\xbd\xf0\xb2\x36\xc0\xf4\xbc\xf7\xc1\
-\x4c\x02\xcd\x26\xb8\xa8\x8c\xa4\xe8\x50\xea\xf1\x56\x72\xb9\xd8\
-\x22\x0c\x9d\x9a\x2d\xf2\x6c\xa3\x2d\x80\x2c\x6b\xdd\x70\xcb\x94\
-\x9b\x26\xe7\xa6\xee\x26\xa7\x2b\xb1\xce\x26\x92\x2b\x41\xd1\x4e\
-\xc2\x93\xc0\xe4\x70\x4d\x74\x18\xe1\xd8\xff\x24\xc1\xb7\x1b\xa3\
-\x5d\x3d\x81\x79\x51\x49\x19\x08\x2e\x2e\xcd\xc5\xa4\x46\xde\x7c\
-\xf3\xcd\x17\x1d\x79\xe4\x91\xfb\xed\xc9\xc5\xa4\x34\xa1\x35\xd1\
-\x69\x38\x89\xeb\x19\xd0\x7a\x5c\xb8\xbd\x59\x38\x31\x5b\x9c\x2b\
-\xdd\x8d\x6d\xfe\x79\xd0\x30\xea\xb4\x3f\xae\x88\x2e\xaf\x95\xe1\
-\x66\x70\xb9\x9e\x64\x49\x4e\xa7\xef\x9d\x10\xe3\x95\xfa\x3c\xc9\
-\x35\x7a\xb5\x58\xd7\x7a\x9c\xf7\xf2\xdf\x44\xf4\x1e\x63\xb6\xab\
-\x27\x30\xcf\x1a\x4a\xa5\xf7\x1c\x2c\x97\x8f\x47\x1c\x7b\xec\xb1\
-\x5f\xbf\xfe\xfa\xeb\xcf\xfe\x3c\x17\x95\xd4\x04\x37\xef\x9c\x21\
-\xee\x58\x98\x21\x56\x11\xe9\x74\xcf\x9a\xc4\x58\x54\x7a\x5c\x13\
-\x3b\x5b\xac\xc3\x14\x98\x31\x38\x5d\x59\xeb\x86\x6b\xa6\x08\x2e\
-\x44\x55\xd6\x3a\x5d\x33\x8a\x76\x83\xe0\x49\x79\xb6\x84\x99\xe0\
-\xa6\xfe\x5f\x4b\xf0\xed\xc6\x70\x57\x4f\xa0\xc3\xc2\xa9\x74\x99\
-\x98\x9e\x3d\x5c\x5d\x51\x51\x31\xe9\xef\x7f\xff\xfb\x6e\x5f\x54\
-\xd2\x2c\xd2\xd9\xc5\x45\x8c\x8b\x85\xae\xf5\x78\xf3\xc6\x8d\x1b\
-\xdb\xb5\x38\x47\x9a\xf0\x01\x13\xe1\x15\xb7\x9b\x38\x5c\xc7\xdb\
-\x99\x39\x8b\x18\x09\x18\x12\x3d\x46\xb1\x6e\x10\x3b\x2e\xb6\x06\
-\x83\x2f\x89\x2c\x4b\xdd\x4c\xf4\x2f\x0c\xc1\xb3\xdb\x6e\x59\x6c\
-\x47\xcf\x1a\xe2\x16\xf4\x2c\x13\x33\xaa\x84\x46\x3d\xfa\xe8\xa3\
-\xd7\x4c\x9c\x38\x71\xec\xae\xa8\x81\x6c\x3d\x2e\x5c\x97\x14\xdd\
-\xdd\x25\x96\x72\xeb\x27\x9f\x7c\xd2\x22\x3a\xbd\xc5\x48\x9c\x98\
-\xad\xf2\xde\x38\x3d\xa3\xc7\xe5\x7c\x61\xc3\x17\xa7\x68\x8f\x1a\
-\x9d\x81\x18\x45\x70\xea\x71\x43\x87\x27\x19\x88\xe9\x85\xc3\x53\
-\x5f\x54\x82\x6f\x37\xbe\xbb\xe3\x24\x7a\x51\x49\x19\x3c\xb7\x0c\
-\x1e\xdd\x41\xaa\x81\xe1\xb3\x66\xcd\x9a\x7d\xd7\x5d\x77\x7d\x9f\
-\xd7\xd1\x65\xd0\x3b\xbc\xa1\x2c\x3d\x4e\x6e\xdb\xb4\x69\x13\xf3\
-\xe3\x6d\x42\x70\x1a\x6f\xcd\xe2\x35\x30\x7b\x96\x89\xab\xf7\x66\
-\xad\x63\x9b\x04\x50\x62\xdd\x20\xb6\x72\xcf\xe8\x9a\x21\x4d\x70\
-\xc5\xe5\xfd\xe9\x71\x7c\x09\xb8\xbc\xdf\xf1\xde\x1d\x27\xd1\xe9\
-\x61\x19\x43\xce\x19\x50\x93\x46\x38\x77\x90\xa5\x62\x57\x5c\x71\
-\xc5\xe9\x27\x9f\x7c\xf2\xc1\xfc\x1e\x55\x01\xbb\x19\x08\x66\x71\
-\xae\x7b\x4b\x4b\x4b\x44\xc4\x79\xbb\xe8\x70\xa5\xc7\xe5\x3d\xf5\
-\x78\x86\x93\x7b\x21\x76\xc0\xc4\xe5\xf4\xc5\x95\x7b\x06\x83\xe0\
-\x46\x88\x95\xfe\xb8\x4a\xa4\x50\xa4\x8b\x31\xa8\xfc\x71\x86\x55\
-\xe5\x9e\x55\xa8\xcd\xb0\xd6\xbf\xd4\x04\xcf\x6e\xbb\x13\x00\x2a\
-\x39\x24\x03\x4a\x6f\x80\x73\x06\xca\x8d\x8a\xe1\xe1\xe7\x9e\x7b\
-\xee\x9c\x6f\x7f\xfb\xdb\x07\xcb\xc0\xab\xf2\x1c\x73\x26\x8d\x2d\
-\x18\x0c\xc6\x99\x2e\xd5\x7a\x9c\xe9\x52\x93\x5b\xd6\xab\xf1\x66\
-\xf8\xe4\x99\x44\x8a\x61\xb4\x85\x0d\x62\x47\x0d\x5d\xae\xc3\xac\
-\x8a\xcb\x0d\xf7\xac\x57\x3d\xce\xb7\x7b\x32\x00\xf3\xdf\xd2\x76\
-\xdb\x82\x7b\x54\x03\x5c\x61\x5c\x06\x92\x53\xc4\xbc\x74\x09\x8d\
-\x42\x11\x4a\x82\xa1\xe5\xe5\xe5\xa3\xe6\xcc\x99\xb3\xcf\xb4\x69\
-\xd3\x86\xe4\xe5\xe5\x39\xdb\xda\xda\x62\x2b\x57\xae\xec\xa4\x58\
-\x17\xe2\xb7\x1a\x7a\x5c\x67\xc5\xb6\x73\xcd\x4c\x16\xbb\xb6\xd6\
-\x23\x3a\xf2\x66\x0a\xb3\x32\xd2\xc6\x95\x2d\x15\xc1\x45\x55\x24\
-\x8c\xe0\x8b\xd2\xe3\x26\xb7\xec\x4b\xa5\xc7\x77\xa5\xed\x4e\x00\
-\x28\x29\xc0\x65\x45\x69\x0b\x70\xfe\x20\xa7\x8f\xc9\x67\xa5\x32\
-\xee\x94\x06\x9c\x44\xc2\xe9\x64\xac\x6b\xe6\x42\x13\x94\x06\x24\
-\x0a\x2d\x44\x55\x1c\x61\x0e\xb9\x9a\x7a\xd8\x88\xab\xeb\x20\x4c\
-\xc4\x08\xb1\x2a\xb1\x6e\xb8\x66\x31\xad\xc7\x29\xd6\x19\xf0\xe9\
-\x4d\x8f\xff\xaf\x72\x79\x7f\x6d\xb7\x2e\xb9\x49\x29\x20\x07\x9b\
-\xd0\x81\xf5\xcf\x34\x08\xf3\x8c\x1c\x01\x81\x50\xc8\xd7\x72\x64\
-\x99\x2e\x0b\x4a\x15\x00\x90\x36\xc6\xd2\x2b\x28\x99\x2c\xf5\xfe\
-\xd2\xa5\x46\xbd\x5b\xc2\xc8\xa0\xa9\x30\xab\xe0\x2e\xf9\xbf\x62\
-\xb8\xed\xce\xb6\xbb\x01\xa0\xa4\x80\x34\x86\x87\xed\x22\x82\x99\
-\x23\xf0\x18\x8b\x4d\xe7\x71\x52\x29\x55\x84\x74\x16\xb9\x13\x2c\
-\x24\x58\xdc\xd0\xd9\x3a\xda\x16\x31\x5e\xf7\x99\x2e\xa5\x2e\x47\
-\x9a\xa3\x35\xc1\xff\x2b\xc3\xac\x5f\x84\xb6\xdb\x17\xdd\x35\x83\
-\x40\x7c\xf6\x1c\x71\xad\x98\x27\xe0\x0e\x64\xb4\x0d\x58\xa7\x45\
-\xe2\xb3\x9c\x4c\x05\xca\x53\xe9\x29\x4b\x04\x41\x7a\x25\xc5\x74\
-\x88\x35\x46\x62\x67\xa7\x4b\xa9\xcb\x91\xe5\x8f\xf3\x9a\xff\x47\
-\xf4\x9d\x6f\x9f\xcb\xaa\xcb\x1a\x04\xec\xac\x18\x11\x00\x70\x61\
-\x09\xd5\x85\x90\x3c\xb2\xac\x5c\xf9\xfa\x24\x2c\xf5\x37\x39\xdc\
-\x28\x68\xec\x57\x8f\xf3\xfc\xff\x47\xf0\xdd\xd7\x3e\xb7\xad\xbf\
-\x0c\x10\x58\x0c\x4e\x67\x38\xd8\xea\x72\xb9\xac\x42\x58\x76\x75\
-\x5d\x63\x69\xf3\x14\xf5\x37\xf5\xb8\x41\xf0\x2f\x4d\x98\xf5\x8b\
-\xd0\x3e\xf7\xbd\xdf\x8c\x9a\x01\x72\xba\xc5\xb8\x5e\x66\xef\x69\
-\x6c\x9b\xad\x92\x32\x05\x61\xfe\x8f\xe0\x7b\xb0\xfd\x7f\xf3\xb7\
-\xe2\x1c\xd4\x76\x18\x80\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x20\x67\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x50\x00\x00\x00\x4f\x08\x06\x00\x00\x00\x7c\x91\x42\xe3\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x1f\xe4\x49\x44\
-\x41\x54\x78\xda\xd5\x7c\x5b\xac\x65\xc9\x59\x5e\x5d\xd6\x65\xef\
-\x7d\xce\x3e\xb7\x9e\x9e\x6e\xf7\xd8\xd3\x3d\xf1\x78\x46\x76\x63\
-\x6c\x85\xc1\x01\x07\xa2\x46\x11\x91\x70\x64\xcc\x43\x6c\xa4\x3c\
-\x20\x24\x84\x2c\x24\xc8\x0b\x8a\xc4\x03\xd2\x8c\x85\x9c\x17\x90\
-\x0c\x8a\xc4\x83\x25\x5b\x24\x01\x19\xc5\x28\x20\x5e\x26\x52\x1c\
-\x66\x84\x42\x2c\x22\x07\x23\x86\x31\x9e\x89\x71\xe6\xda\x33\xdd\
-\x7d\x4e\x9f\xeb\xbe\xad\x55\x97\x7c\x7f\xfd\xbb\x4e\xed\xb5\xd6\
-\xd9\x7b\x77\xc7\x12\x88\x35\xf3\x77\xd5\xaa\x55\xab\x76\xd5\xf7\
-\x5f\xeb\x5f\xeb\x2c\xe9\xbd\x17\xff\xbf\x87\xc4\x11\xeb\x1e\xc7\
-\x43\xf4\x4f\xf7\xfc\x03\x3f\x56\x00\xb8\x1e\x88\xe7\x9e\x7b\x2e\
-\x94\x2f\xbf\xfc\x72\x28\x6f\xde\xbc\x99\x00\xe2\xeb\x4e\x3c\x87\
-\x92\xcf\x1e\x78\xfc\x67\x9f\x7d\xd6\xfd\xc3\x60\x06\x03\xf8\x50\
-\xc0\x7d\xfa\xd3\x9f\x56\x04\xd4\xc1\xc1\x81\xbe\x74\xe9\x92\xbd\
-\x7d\xfb\xb6\x2c\xcb\x52\xd1\xf5\xd3\x4b\xa7\xf2\xc6\x85\x77\xde\
-\x10\xc7\xc7\xc7\x32\x9e\x8d\x46\x23\x23\x56\x1c\xd7\xae\x5d\xf3\
-\x54\xfe\xdd\x30\x23\xad\xcd\xe3\xf8\x1e\x01\x5c\x2f\x71\x00\x4c\
-\x13\x60\xc0\x2e\x9f\x4c\x86\x1a\x97\x94\x31\x26\x2f\x8a\x5a\xa2\
-\x67\x00\xd2\xda\x72\xdc\x1e\x63\x36\x9b\x31\x80\x3b\x42\xf4\xa6\
-\xf3\xba\xd8\x5e\xbc\x3e\x6d\xdf\xb3\xbd\xbd\xed\xb9\xf6\x5a\x83\
-\x19\x38\x98\x21\xdf\x03\x33\xb8\x8c\xcc\xe8\x5c\xf7\x0d\xc9\xfe\
-\x5e\x01\xfc\xcc\x67\x3e\xa3\xa3\xd4\x0d\x06\x83\x1e\xee\x71\x76\
-\x60\x21\x76\x2a\xd3\x53\xdd\xb3\x99\xd5\xe8\xa6\x4a\x21\x33\xea\
-\x5f\x14\xa5\xd2\x5a\x8b\x78\xf0\x82\xc7\x87\x75\x5e\xcb\xc1\xfc\
-\xbc\xae\x73\x29\x56\x1c\xe8\xeb\xf3\x3a\xf7\x60\xd0\x68\x19\x33\
-\x76\xc0\x8c\xe9\xb4\xd7\x19\xe7\xfe\xfd\xfb\xb3\x8d\x8d\x0d\xff\
-\xb0\xcc\x40\x9f\x9a\xca\x17\xf1\xdf\xe5\x97\x2f\x7b\xac\xd9\x33\
-\x98\x09\xc8\x87\x06\x50\xe2\xc0\x20\xfa\xe0\x8d\x37\x32\xf9\xdf\
-\xbf\xf6\xd9\xad\xcd\xcd\x9f\x19\x6c\x0d\x2f\xe3\xca\xc4\x7a\x3f\
-\xb2\x5a\x4f\x9c\x94\x13\x9d\xe7\xc7\xa7\x47\x47\x27\x2a\xcb\xc6\
-\xbd\x9d\xed\x2a\x1f\x0c\xa6\xb2\x28\x47\xaa\x28\xc6\x72\xa3\x37\
-\x29\x37\xb7\x26\xe5\xde\xee\x2c\xdb\xdb\x9b\x41\xe7\xeb\x30\x21\
-\x6b\xe4\x5b\x77\xdf\x7d\x4d\x5b\xdb\x00\xa1\x12\xc2\x41\xac\x3d\
-\x98\x20\x8b\x62\x13\xc4\x97\xad\xb5\x9e\x28\x31\x63\x81\x11\x38\
-\x31\xb5\x69\x8c\x93\xd5\x99\x5f\xce\x8c\x2e\x43\xa0\x59\xe8\x7f\
-\x28\xc6\xe3\xd2\xa3\x6e\x71\xb8\xb7\xde\x7a\xab\x8a\x40\xd2\xf1\
-\x10\x00\x26\x9b\xb7\xbb\xbb\x5b\xf6\x9e\x7f\xfe\x33\x1f\xff\x57\
-\x9f\xfa\xd2\x0f\xfe\xd3\x1f\x56\x39\x69\xb4\xd6\x81\xbc\xce\x84\
-\xf5\x4e\xd8\xda\xf8\xaa\xae\x41\x46\x58\x27\x64\x6d\x6a\x2c\xa8\
-\x16\xfb\x6f\xbd\x29\xcd\x74\x26\x9c\xb5\x34\xa2\xf0\xce\xa3\xbd\
-\x72\x6e\x56\x1b\x6b\x4d\xe5\x8c\xa9\x30\xd1\xa9\x31\x76\x3a\xb3\
-\x76\x04\x66\x8c\x95\x90\xf7\xef\xbc\xfe\xda\xbe\x00\x33\x36\x76\
-\x77\xab\x6c\xd0\x9f\xca\x3c\x1f\x09\x9d\x8d\x44\x2f\x1f\xa9\xb2\
-\x3f\x52\x9b\x9b\x53\x7d\x69\x77\x82\xb6\xda\x63\x50\x8b\xb1\x4f\
-\x0e\xf7\x6f\x5b\xab\x03\x18\x5a\x33\xd8\x60\xb0\x27\x66\x50\x1b\
-\xd5\x0b\x94\x91\x19\x5c\xea\x93\x73\xc0\xb3\xcc\xd7\x45\xed\xb3\
-\x59\x46\x93\x75\x65\x39\xb1\x67\x67\x59\x4d\x40\x92\x74\xc2\x59\
-\x42\x2a\xbf\xea\x9f\x7d\xd6\xbb\xf3\x7b\xd6\x48\x1e\x4d\x86\x54\
-\x37\xdb\xdb\xdd\xf9\xb7\xcf\x7c\xec\x07\xd4\x95\xd9\x0c\x77\x69\
-\x21\x15\x14\x98\x4c\x1e\x00\x44\x05\x86\x6d\x20\xa5\xc7\x6d\x8a\
-\xee\x00\xb0\x74\x27\xfa\xf8\xa7\x3e\x80\x8a\x17\x5e\x65\x00\x5b\
-\x07\x72\xde\xab\xd9\xd1\xfd\xc2\x39\x57\x38\xa0\x6d\x30\x1f\x67\
-\xac\xa8\x2d\xc0\xc7\x62\x67\x55\x25\x66\x93\xa9\xa8\xaa\x99\xaf\
-\x8d\x13\x60\x0c\x9d\xcb\xfb\xb7\xdf\x96\x66\x56\x89\xfa\xe4\x4c\
-\xf8\xbb\x77\x84\x7d\x05\xfd\xeb\x8a\x90\x02\xf7\x4c\xb5\x69\xcc\
-\xd4\x39\x3b\x31\xde\x4f\x00\xcf\x19\x7e\x75\x2c\x9d\x3f\x98\x9c\
-\x9d\x1d\x0b\xad\xc6\x0a\x1a\x31\xcd\xf4\x58\xe6\x60\x44\x96\x8f\
-\x7c\xaf\x18\xf9\xb2\x3f\x96\xc3\xcd\x91\xda\xd9\x41\xfb\x60\x56\
-\xd4\xb8\x43\x12\x53\xd5\xfe\x71\x2d\x6d\x2f\x9f\x4c\xb5\xae\xcd\
-\x6b\xaf\x1d\x7a\x08\x92\x85\x85\xb4\x8b\x0e\x27\x5b\xa5\xbd\xb0\
-\x06\xea\xec\xec\x99\x32\xc3\xd1\xdf\xdd\x7e\xac\x57\x57\x42\x5a\
-\x80\xef\x32\x01\xf8\x82\xcf\x50\x45\x4e\x80\x31\x88\x51\x98\xbd\
-\x8b\x48\xa2\x44\xe1\xb0\x14\x48\xa4\x20\x29\xe4\x73\xb2\x93\xa1\
-\x8c\x1a\xc0\x75\x8b\x5b\x9d\x84\x61\x03\xfb\x7b\x02\xe2\x2c\x85\
-\x43\x9b\x05\x01\x44\xf7\xc8\x25\x48\xb7\x65\xf2\x18\x8e\xa4\xd9\
-\x59\x3d\x3d\x3a\xd2\x95\xa9\x4b\x88\xf4\xb0\xae\x0d\x18\x01\x22\
-\xd0\x8d\x25\x66\xf8\xe9\x74\xe6\xa7\x54\xa2\xad\xaa\x2a\x39\xc5\
-\xb8\x93\xfd\x7d\x65\x0d\x31\xac\x06\x59\x41\x8c\x9c\x81\xa3\x98\
-\xc4\xcc\xc3\x8c\xda\x4b\x97\xfe\x73\xff\xc7\xfe\xd9\x57\x44\xd9\
-\x1b\x49\x59\x4c\xdf\xf3\x9e\x4b\xc7\xd3\xe9\x74\x0c\x29\x74\x10\
-\x2c\x12\xb0\x60\x17\x97\x02\x48\x9d\x28\x44\xd9\xd8\xb0\x65\x9e\
-\xe7\x03\xa5\x74\x5f\x41\xfa\x24\x80\x93\x58\xbc\x24\x90\xca\x1e\
-\xe3\x4c\x75\xc7\x20\x30\x7e\x9e\xfe\x89\x5e\x0c\xa0\x1b\xaa\xb0\
-\x0a\x7b\x06\xd8\x5b\xc7\x92\x49\xfd\x1c\x88\x6e\xb1\x86\x81\xac\
-\x2a\x06\xcd\x1a\xbe\xa6\xb2\x70\x3f\x89\xb8\x06\x78\x0a\x0b\xcf\
-\x1d\x4b\xad\x43\x7d\x40\x5a\x40\x0b\xc2\x24\xac\x54\xb8\x0f\xe4\
-\xc2\x50\x12\x12\x2f\x49\xab\x9d\x52\x81\x7c\xa6\x99\x01\xc3\x81\
-\xa8\x70\x7f\x35\x99\x88\x19\x81\x5d\xd5\xa2\xf6\x52\xc1\xb8\xf4\
-\xa1\xd3\x8f\xbd\x72\x74\xf8\x6f\x26\x5f\x7b\x61\xb3\xfc\xe4\x27\
-\x7e\xc7\x79\x37\x96\xc6\x56\x4a\x29\xf9\xde\xf7\xbe\x97\x70\x31\
-\x30\x6d\xb4\x00\xbb\x04\x40\x0e\x8e\x6f\xde\x84\xfa\xce\x4a\xad\
-\xa7\xa2\x50\x45\x96\x43\x92\x49\xb2\x48\xae\x18\xc4\xbc\x20\x4e\
-\xd0\xe2\x12\x68\xa1\x04\x39\x17\x4b\x14\xb1\xcd\x32\x40\xce\x51\
-\x1d\xe5\xfc\x3a\xb7\x27\x00\xad\xe5\xfb\x71\xee\xc3\xf9\x14\x75\
-\x8b\x26\x4b\x52\xc9\xfd\x2c\x00\x44\xc9\x63\x51\x7d\x3e\x8e\x71\
-\x20\xc3\x75\x4b\x00\xa3\xa4\xa5\x92\x69\x24\x60\x3d\x47\x5b\x12\
-\x94\x4b\x87\x66\x29\xc8\xd5\x0c\xd0\x97\x24\xd2\xa1\xbc\x6c\x50\
-\xcf\x32\xfd\xad\xe3\x93\x9f\x54\xd2\x7f\x1d\x5a\xf7\x57\xae\xd0\
-\x1b\xba\xd2\x42\x6b\x0d\xa1\xae\xc8\x43\x07\x55\x56\x4b\xec\x5f\
-\x08\x96\x8f\x61\x39\x32\x95\x15\xea\xf8\x60\x2f\x2b\x4b\xa9\xc1\
-\x29\xe9\x5c\xd0\x56\x45\x36\x30\x4c\xd2\x2c\x90\x03\x59\x92\x38\
-\x10\xae\x25\xe2\x45\x35\xda\x1c\xf7\x39\x07\x6f\x01\xfc\xc0\x8b\
-\x78\xee\x40\xa9\x3d\x84\x9a\x4a\x0b\x1f\x6c\x43\x20\x96\xd0\x2c\
-\x07\x48\x05\x4b\xbd\x4c\xe6\x44\xa1\x0e\x07\x24\xa4\xce\xd1\xad\
-\x10\xaa\xd7\x0f\x9a\xa3\xfa\x03\xa1\x06\x1b\x42\x0d\xb7\x70\x4d\
-\xd3\x98\x7c\xaf\xb1\xe1\xb7\x7b\x3c\xb7\x4d\x0c\x76\x59\x66\xfa\
-\x3a\x98\x70\x4d\x29\x73\x39\xcb\x66\x83\x2b\x57\xae\x94\x14\x0f\
-\xaf\xb4\x81\xe8\x80\x59\xec\xca\xdd\xc2\xe9\xea\xe4\x74\x0b\x61\
-\x4a\xe0\x14\xbc\x5f\x70\x20\xe1\x20\x89\x24\x35\xe4\xc5\x25\x09\
-\x14\x0e\xd5\xa8\x9e\x2d\x69\x0c\x75\x22\xc1\xe7\x54\x0f\xe0\x31\
-\xf9\xa8\xde\xde\xb3\xba\x53\xb5\x6b\x9c\xd1\xc6\x91\x00\xce\x58\
-\xbd\x03\x5a\x21\x08\x05\x93\x2d\x01\xca\x12\x4c\xe5\xac\x22\x8e\
-\xa3\xab\xc1\x35\x0d\xc0\x50\xb7\x6c\x0a\xe0\x7a\x45\x81\xb5\xd5\
-\x87\x47\xc2\x9d\x9c\x08\x3f\x99\x06\x10\x2b\x8f\xee\x3d\x6d\xb1\
-\xb6\x47\x94\xf7\xfb\x5a\x49\xe3\xa4\x24\xf3\x5a\x2a\x20\x89\x00\
-\x3d\x44\x28\x4b\x01\x3c\x3c\x3c\x94\x57\x9f\xbc\xba\x21\xe1\x3e\
-\xd5\x68\xb4\x95\x6d\x0f\x85\x0e\xd2\x85\x91\x41\x04\x1e\x6f\x3c\
-\x7c\x92\x9c\x40\x09\x2c\x89\x82\xc1\x20\x60\x22\xc0\x4c\xac\xf6\
-\xae\x01\x22\x26\x1b\xeb\x3c\x86\xbd\x48\xcd\xd1\xc6\xbf\xc1\xe7\
-\x89\x31\x89\xe8\xfe\x58\x12\x10\x5a\xb3\xa9\x91\x2a\x8c\xad\x94\
-\x0e\xfd\x9c\xac\xd0\x44\x01\x10\x4b\x35\xc6\x62\xbb\x8a\xdf\x98\
-\x52\xff\xbc\x90\x90\xe0\x7f\x84\x0e\x63\x0c\x54\x2a\xa7\x0e\xbd\
-\x54\x85\x31\xa6\x2a\xcb\x77\xa0\xa5\xf7\xdc\x85\x00\x02\x59\x0e\
-\x2c\x6b\xf8\x71\xd9\x93\x70\x65\x5b\x1a\x9c\xd5\x51\x6b\x5c\x50\
-\x55\xf6\xac\x4e\x50\x43\x03\x44\xdf\x01\x28\xb5\xa7\x85\xc7\x05\
-\x27\xc0\x45\x13\x50\x5e\x64\x00\xd0\xa6\xfb\x23\x38\xd1\x86\xda\
-\x54\x77\xa1\x74\x51\x0d\x19\x10\x9a\x67\x9c\x2f\xd9\xcd\x00\xec\
-\xfc\xfa\x5c\x7a\xcd\xe8\x4c\x58\x38\x2e\x47\xf6\x95\x3c\x33\xfa\
-\x4d\x01\x28\x44\x93\xd8\xbe\x89\x2e\x43\x20\x7c\x26\xa5\xef\x79\
-\x2f\x87\xbe\xf4\xf6\xae\x18\x9c\xe9\x83\x0f\x2f\xf7\xc2\x57\xaf\
-\x5e\x95\x80\x10\x5a\x62\x64\x56\xf6\xb6\x35\x54\x41\x1b\xe6\xaa\
-\x94\x96\xd5\xa7\xaa\x79\x61\xa0\x68\xaf\xf0\x6f\x68\xfb\xeb\xff\
-\xf5\x0d\xf1\xe6\xb7\x5f\x11\x47\xf7\xf6\x83\xe4\x5e\x7f\xff\x13\
-\xe2\xfa\x87\x3e\x28\x1e\x79\xfc\x7d\x09\xac\x78\x1f\x2d\x9c\x01\
-\x8a\x0b\x4f\x12\x14\x81\x66\xe9\x6b\x38\x20\xd7\xec\x93\xc0\xa4\
-\x72\x11\xa8\xc8\x8c\x08\xa2\x8f\x63\x59\x61\xb1\x06\x37\x99\x82\
-\x26\xc2\x72\xc0\x1f\x00\x0c\x7b\xba\x5e\x4f\x79\x29\xf6\xa4\x97\
-\x7b\xf8\xb5\x63\xdc\x56\x4a\x48\xa0\x9c\xc9\x89\x3e\xd6\xea\xf4\
-\xf4\x54\x66\x4b\x76\x1f\xa1\x4e\x09\x82\x1a\xfd\x7b\x45\x7e\xbd\
-\x57\x16\x1e\xaa\x20\x31\x3a\x1b\x5b\x15\x22\xe5\xa4\xb6\x73\x00\
-\xee\xbd\xf3\x8e\xf8\xe3\xdf\xfd\x7d\x71\xf0\xf6\x6d\x71\xe5\x47\
-\x7e\x44\x0c\xfe\xc9\x0f\x09\xb2\x54\xaf\xbf\xf4\x92\xf8\xce\xd7\
-\x7e\x5b\x3c\xf5\xb1\x67\xc4\xf7\xff\xcb\x9f\x80\xc6\x28\x06\xc5\
-\xd9\x58\x46\xc9\x64\xaf\xca\xa1\x4d\x04\x22\x86\x3e\xd1\xb9\x44\
-\xa0\xd2\xfd\xe1\x7a\x02\xcd\x25\xc0\xe3\x18\x0c\xb8\x41\x39\xef\
-\xeb\x66\x15\x00\x9c\x89\xfa\xf8\x44\x58\x00\x68\xce\xce\x42\x1f\
-\x43\xdb\x3b\x0a\x8b\xca\x82\xb6\x6a\x27\x00\xa5\xf0\x4e\x6e\x09\
-\xe5\x37\x84\x15\x90\x44\x99\x61\xaf\xad\x11\x1e\x03\xc0\x35\x87\
-\xb5\x56\x2a\xe7\x7a\x88\xa6\x89\x71\x3a\xd8\x35\x63\x22\xdc\xc9\
-\x1e\xe1\x18\x9d\x9c\x8a\xdf\xf9\xc2\xbf\x17\xbb\x1f\xf9\xa8\x78\
-\xe6\xf3\xff\x4e\xe4\xdb\xdb\x69\xa0\x9f\xfe\x69\x61\x5e\x7f\x5d\
-\xdc\xfb\xfc\xe7\xc5\x37\xbe\xfc\x1f\xc4\x33\x3f\xf3\xaf\x43\x33\
-\xdb\xbe\x05\x55\x8f\x60\x26\x70\x13\x08\xdc\x37\xb5\x31\x88\x49\
-\x1a\x93\x84\x32\x60\x36\x02\x9b\x54\x1a\x00\x72\xdf\xba\x26\xe9\
-\x63\xe0\xc6\x63\xa8\xf1\x28\xf4\xb1\xe4\x1b\x01\x5e\x45\x76\xb3\
-\x28\x48\xcb\x33\x30\x12\x2e\x1c\x58\x19\x91\x39\x65\x81\x81\x56\
-\xb4\x7f\xa6\x4c\xd0\x5a\x00\xb5\xd1\x5e\xc1\x0e\x64\x8a\xfe\xdd\
-\x3c\x5f\x6c\x3c\x92\x43\xf0\xe2\x0f\xff\xe3\xef\x8a\xe1\x7b\xdf\
-\x27\x9e\xfa\x95\x5f\x61\x4f\xdd\x3a\xb2\xeb\xd7\xc5\xd6\x6f\xfe\
-\xa6\xa8\x7f\xe1\x17\xc4\xfe\xff\xfe\xa6\xb8\xf4\x7d\x37\x93\xb3\
-\xf0\x9e\x29\xd4\x05\x83\x88\x8a\x8b\x52\x07\x6a\x4a\x53\x8c\x31\
-\x63\x7b\x92\x4a\x56\x53\xd4\x0d\xca\x39\xd0\x2e\x82\x6f\xf8\xfe\
-\x7a\x3c\x12\x76\x34\xe6\x7b\x67\x33\x12\x0a\x06\x0f\x64\xa4\x24\
-\x10\xbd\x2c\x72\x41\xe0\xd1\xd4\xa1\x2f\x77\x00\xa2\x16\x8a\x52\
-\x1c\x06\xcb\xab\x00\xe0\x8a\x30\xa6\xdf\xef\x17\xa3\xd1\x8c\xa2\
-\x02\xa1\x9c\xef\xf7\xa8\x92\x65\xec\x7d\x6b\x8a\xeb\x6c\x88\xb7\
-\xa2\xe4\x1c\xed\xdf\x17\x6f\xfe\xf5\xb7\xc4\xc7\x7e\xef\xf7\x3a\
-\xe0\x29\x9c\x67\xb8\x97\x52\x5c\x6a\x63\x43\xc8\x5f\xfe\x65\x71\
-\x07\x40\xee\x3d\xfd\x54\xf4\xb2\x49\x05\x93\xf3\xe1\x72\xde\x8e\
-\x03\x65\xc3\x59\x30\x68\x49\xda\x52\x3d\x49\x5b\x1c\x8f\xdb\x78\
-\xf7\x12\xc0\xf2\x73\xbb\x57\x03\x05\x83\xd2\xd0\x7d\x73\xe9\xab\
-\xa9\x54\x94\xac\xcb\x29\xee\x96\xc2\x85\xe8\x1b\x35\x2a\x89\xdf\
-\xb9\x84\x56\x23\x52\xf9\xce\x72\x15\x1e\x0c\xce\xf0\x7b\x03\xaf\
-\xb5\xf1\x98\x54\x3f\x27\x7d\x65\x1b\x83\xd1\xab\x18\x7e\x9d\x7b\
-\xde\x37\x5e\xf9\xb6\xb8\xf4\xc4\x13\xa2\xb8\x7c\xb9\x31\x0e\xb6\
-\x81\x44\x04\x60\x20\x45\xe0\x7e\xfc\xe3\x42\x7e\xf9\xcb\xc2\x1c\
-\x1d\x51\x60\xcb\x0b\x0f\x00\x25\x5b\xba\x8c\xa2\x27\x15\xb1\x2e\
-\x7c\xc7\x61\x30\x80\x0c\x96\x88\x80\x5b\xc7\x3b\x0d\x10\xb0\x20\
-\xd5\x0d\x54\xc3\xee\x59\xdc\x6b\x48\xda\xd1\x6e\x40\x24\x89\xd4\
-\xab\x84\xdd\x8f\x7e\xc1\x11\x94\x10\x19\xef\xa9\x97\x0e\x7b\xea\
-\x95\x81\xf4\xdd\xbb\x94\x60\x9c\xf9\xed\xed\x2b\x57\x30\x78\x4f\
-\x9f\x7b\x4c\xc7\x36\x30\x05\xcf\xa1\x7a\x0c\x6f\xbb\x71\xe3\xc6\
-\xa2\x33\x82\xf4\x16\x44\x11\xc4\x04\x60\xbf\x2f\xf4\xd3\x4f\x0b\
-\x0b\xa9\x95\x57\x1e\x65\x00\xbd\x4f\xf1\x9b\x4f\x36\x8d\xc3\x4c\
-\xaa\x27\x89\x6b\x80\xe9\x9b\x0e\x05\xa0\xb1\x73\x67\xfb\x99\xc6\
-\xf2\xbc\xc7\xb6\x48\x54\x58\xa8\x6c\x7d\x78\x18\x4a\xc7\xaa\xcb\
-\xe0\xa1\xac\x99\x42\xbd\xd4\xba\x93\x59\x07\x92\x40\x66\x8a\x75\
-\xf5\x3d\x03\xb8\xe6\xf0\x3a\xc8\x6f\x3f\x77\x42\x71\x88\x22\xc2\
-\x7e\x94\x81\x4b\x5b\xac\xdd\xe1\xa6\x78\xfb\x6f\x53\xb6\x37\x82\
-\x87\xc4\x64\x04\x31\xaa\x31\x66\x88\xfb\xe7\x81\xad\xc3\xa2\x92\
-\xd4\x45\x1b\x18\x01\xf2\x11\xdc\xb4\xd7\x3d\x07\x24\xa9\x34\x40\
-\x60\xf5\x4c\x66\x80\xef\x89\x65\x55\x51\x1f\x2e\xc7\xe3\x08\x62\
-\x50\xdb\x08\x9e\x4b\xc0\x9d\x4b\x21\x6c\xa0\x5b\x10\x88\xb9\xbe\
-\xa5\x03\xe9\x2d\xbf\x12\xc0\x33\xd0\x23\xaa\xa4\x2c\xc6\x70\x07\
-\xd2\xc5\x19\x0f\xc5\x13\x37\x86\xb4\xf8\xdc\x0b\xef\x6d\x6d\x0b\
-\xff\xc6\x1b\xc2\xc1\xa6\x14\xf0\xbe\x00\xac\x01\x60\x04\x91\x00\
-\x94\x58\xc4\xf4\x3e\xa4\xef\xc6\xe3\x02\x41\x7a\xf2\x90\x36\x96\
-\x86\xa6\xcc\x12\x75\x0e\x2c\x95\x51\x3d\x1b\x4e\x83\xe3\x3b\xe6\
-\x6d\x04\x6f\x31\x90\x66\x49\x03\xd5\x30\x19\xa8\x13\x80\xa4\xb2\
-\x01\x24\xcb\x60\x11\x25\x09\x8c\x59\xa4\xbc\xc0\xe2\x58\x71\x59\
-\xac\x25\xed\x62\x3c\x81\x39\x9b\xbd\x35\x85\x5c\x2d\x95\x40\xbd\
-\xe0\x00\x28\x56\x19\x28\x02\x2f\x2f\x84\x27\x27\x42\x3b\x10\x94\
-\xb4\x98\x18\xca\x3c\x02\xdb\xb7\xb7\xb7\x27\x66\x5f\xf9\x8a\x18\
-\xfc\xe2\x2f\x92\xb4\x05\xc0\x22\x90\xbd\x5e\x8f\xa5\x50\xeb\x00\
-\x74\x75\x72\x42\x92\xc8\xa0\xb0\xd7\x4d\xce\x83\xd5\x35\x49\x55\
-\x04\xd1\x47\x07\xd2\x00\xa9\x41\x8e\xdb\x59\xda\x30\x7e\x7d\x7a\
-\x4a\x41\x3f\xd9\x3b\x02\x8e\x55\x96\xfa\xb5\xc0\x8b\xe1\x8b\x03\
-\x55\x20\x3a\x64\x99\xdb\x50\x7a\x71\x3b\xe4\xd2\x00\x24\x81\x5b\
-\x2c\x46\x16\xa0\xf5\x07\xbc\x89\xf6\xe2\xdc\xb3\xd9\x0a\x20\xb2\
-\xea\xa5\x5d\x03\xfe\xfb\x28\x82\xe4\xbf\x7a\xfe\x79\x21\x3f\xf4\
-\x21\xa1\x3f\xf9\x49\x92\xb6\x40\x51\x7d\x4b\x00\x99\xe1\xbe\xfd\
-\x5f\xfb\x35\xa1\x9e\xb8\x21\x2c\x4b\xdf\xdc\xd0\x43\x0d\x83\xd4\
-\x2d\x7a\xe3\x18\xd2\xb8\x26\x58\x42\x74\xce\x19\xdc\x14\xe6\x00\
-\x30\x96\x36\x68\x84\x65\x15\x66\x4a\xe0\x51\xc9\xf5\x58\xb2\x07\
-\x4e\x00\x16\x85\x93\xf4\x13\x92\xfe\x3d\xdf\x67\x51\xbe\x57\x9c\
-\x9e\x3e\x80\x0d\x2c\xe0\x85\x90\x56\x77\xe6\xe4\xa4\xf0\x74\x17\
-\x3c\xa6\xbd\x7b\x8f\xb2\x1b\xec\xcd\x9c\x6d\x80\xb8\x0d\xd5\xfd\
-\xf0\xc7\x7f\x48\xbc\xf9\xa5\x2f\x89\x6c\x7f\x5f\xe4\xb7\x6e\x09\
-\xfd\xe4\x93\x82\xd2\x60\x19\xc0\x33\x7f\xf9\x97\xe2\xf8\x37\x7e\
-\x43\x88\xe1\x26\x3f\x23\x61\x86\xb4\xa5\x2c\xda\xd6\x0e\x40\xa0\
-\xae\x8a\x72\x78\x43\x75\x96\x30\xca\x5c\x47\xe7\x80\x73\x00\x49\
-\xbf\x15\xc8\x27\x69\x6b\x83\xc7\xb1\x9f\xf7\x0c\x22\x03\xc8\x2a\
-\x1c\x63\x5d\x19\x1c\xc8\x6d\x85\x49\xaa\xcc\xfa\x07\x92\x40\x69\
-\xe4\x10\x5c\xf5\xf5\xac\x2a\x55\x3d\x97\x10\x53\x53\x14\xcf\x59\
-\xe3\x56\xd2\x94\x68\xb8\xbb\x27\x3e\xf0\x03\xff\x58\x9c\xbc\xf0\
-\x27\xa2\xfa\xd3\x3f\x15\x72\x67\x27\xa4\x92\xa6\x58\x88\xc6\xb6\
-\x49\x5c\x7b\x8c\x01\x9a\x55\x09\x08\x29\x3b\x12\x25\xba\x60\x31\
-\x90\xa9\x9e\x9c\x04\xdb\x64\x06\x0b\xe0\xd1\x96\x2c\x3a\x0e\x9b\
-\xec\x63\x02\xae\xa5\xba\x2e\x82\xb7\xe0\x89\x25\x7b\x42\xeb\x25\
-\xdd\x2a\x3d\x9b\x7f\x76\x24\x34\xe6\x03\x01\xd8\x13\x52\xe1\x20\
-\xf9\xed\xe5\x45\x29\xd4\xa5\x3d\x21\x5e\xf5\x9c\xb5\x98\x02\x8c\
-\xb8\xd8\xa0\x6a\xa9\x54\xa0\x9d\xf7\x3f\xc9\x13\x37\x86\x9f\xde\
-\x6d\x6e\x32\xe0\x2d\x50\xc4\x12\x5b\x46\x0e\x8b\x6d\xac\x68\x4b\
-\x1e\x83\xc1\x09\xda\x86\xd4\xd5\x64\x57\xb5\xa6\x36\xba\x46\x00\
-\xf3\xfd\x0c\x5c\x72\x1a\xe9\x9c\xc1\x24\xf0\x58\x0a\xcf\x25\x50\
-\x82\x60\x77\xe6\xd9\xdd\xf9\x4c\x1d\xca\x5c\x7b\x7a\xee\xf4\xc0\
-\x36\x50\x15\xa5\xba\xf2\xd4\xd3\x39\xc5\x6f\xbe\xec\x31\x39\xc7\
-\x52\x98\x26\xc8\x40\x34\x17\xcc\x6d\x52\x46\x15\x63\x69\x6d\x02\
-\xc1\x94\xce\xd3\xbd\xd6\xc6\xf3\x86\x7d\x13\x2c\xad\x0c\x1a\xc5\
-\x75\x14\x08\x73\x9d\xdb\xe6\xe0\xf9\x04\x5c\x92\xbe\x44\xe9\x3c\
-\x81\xd7\x20\xa5\xc9\xdb\x86\x05\xbc\x4b\x52\x18\x25\x90\xec\x69\
-\x21\xa7\x67\xf4\xe0\x1e\x26\xab\x1b\xc6\x50\x96\x35\xd6\x91\xfa\
-\x56\xfe\xfe\xfd\x0d\xca\xc2\x68\x7e\x0e\x9c\x54\x26\x81\x91\x24\
-\x91\x41\x48\xaa\x2d\x65\x02\xa4\xa9\x86\xf1\xde\x2e\x09\xd1\xad\
-\xc7\xbd\x72\x74\x04\x00\xca\xc0\xbb\x42\xea\x62\x12\x80\xc1\x4a\
-\xbf\xc1\xe7\x4b\x55\x37\x9d\x47\xa7\x62\x5a\xde\x18\xba\xe7\x63\
-\x08\x83\x33\x1a\x36\x68\x33\x70\xc0\xcf\xad\xf1\xc2\x37\x6f\xf2\
-\x4e\xc4\xd0\xe3\xd6\xfb\x87\x03\x45\xde\x94\x7e\xec\xde\x3d\x96\
-\x3c\x36\xca\x04\x50\x03\xc4\x4e\xd9\x4e\xae\xb6\x63\xb5\x76\xdf\
-\x44\x0d\xcf\x0b\xc0\x88\x79\x2c\x71\x20\x38\xb5\x24\x71\x29\x11\
-\xd1\x05\x2f\xd5\x93\xea\x32\x25\xd5\x4d\x4e\x24\x82\xc8\x12\x98\
-\x67\x68\xee\x1e\x15\x68\x04\xea\xcd\xdf\xb1\xb9\x10\xc0\x83\x83\
-\xab\x32\xcf\xd5\x06\x79\xde\xfa\xe4\xb4\x2f\x98\x07\xcc\x7d\x0e\
-\x13\x3a\x59\x66\x1c\x49\xc5\xd2\xb5\x0b\x01\x12\x4b\x42\x11\x10\
-\x5f\x5f\x0c\x47\x22\x50\x20\x84\x24\x24\x75\xec\x2c\x92\x3a\xa7\
-\x30\x46\xe0\x68\x81\x67\x17\xce\x5d\xa2\x08\x5e\x37\x1e\x44\x9d\
-\x28\xcb\x73\xde\x07\x73\x0c\x23\x9d\x77\xb7\xb5\x50\xa2\x98\x4b\
-\xdd\xec\x41\x6c\xa0\xb5\x99\xb4\x27\x27\x03\x3f\xdc\x16\x8a\x16\
-\x41\xea\x12\x41\x64\xd0\xba\x52\x97\x24\xae\x09\x14\x0f\xd9\x76\
-\x06\x4d\x70\x53\xe2\x93\x80\x22\x23\x7e\x1e\xcf\x39\x22\xaa\xd3\
-\x75\x1e\x3b\x3a\x89\x50\xa2\xd6\xa5\x96\xea\xba\x16\xe1\x7a\x52\
-\xdf\x16\x90\x45\x91\x63\xd8\x20\x0d\x10\x47\x29\xe9\x1f\x27\x95\
-\x34\xce\xa9\x4c\x6c\x8b\xd1\xe8\xfe\xea\x64\x02\xb2\x4e\xa2\x56\
-\x42\x3c\xfa\xd8\x63\xef\x11\x78\x95\x42\x59\x4b\x6a\xc3\x04\xc9\
-\x64\x70\xba\xce\x43\x74\x6d\x5c\xaa\xb7\xaf\x49\x99\xd4\x9c\x25\
-\x3c\xda\x39\x92\x36\x96\xba\xf1\x98\xcb\xaa\xe2\xfb\xdb\x60\xad\
-\x03\xaf\x4b\x5d\x2f\xcc\xe0\x35\x48\xf6\xfa\x98\x1e\xa7\xb1\x3c\
-\x40\x54\x38\x73\xd6\x28\xed\xf5\xd1\xac\x9a\xc9\x88\x93\x5a\xf6\
-\xd6\x67\x5d\xd7\x32\xb3\x56\x5a\xeb\xde\x93\x61\x0c\x67\x6d\xb2\
-\x7f\x8b\xf9\xb5\xd6\xc3\x1b\x94\xa9\x4f\xf4\xa0\x4c\xc9\xa6\x31\
-\xa5\xbe\xac\x96\xc1\xb6\x55\x87\x87\xb4\x67\x25\xe7\x40\xc4\xd2\
-\x57\xd7\x5d\x55\x4f\xe7\x4b\xc9\x76\x3d\x6e\xd7\x89\x24\xf0\x1a\
-\x00\xab\xb2\x70\xf4\x8a\x87\x27\x10\xbd\xd7\x28\xb5\xc8\x24\x64\
-\x71\xa6\xaa\x5e\x25\xaf\x5d\x23\x23\xb8\x3e\x8c\xa1\xc5\xf5\x00\
-\xa0\xc3\xe2\xb5\xe7\x70\x21\x86\x09\xd1\xf6\x75\x3d\x71\xab\x2e\
-\x16\x3d\xea\xa2\xed\x9a\xab\xaa\xe7\x4c\x09\x01\x46\x25\x81\x19\
-\xe3\xb8\x34\xd6\x7a\xa9\x4b\xd4\x72\x16\x3e\x25\x0e\x96\x49\x24\
-\x53\xec\x4f\x29\xb7\x45\x1b\xa8\xc2\x7c\xe7\xb9\xc0\x9e\xd8\x12\
-\x7d\xbc\xb9\xf1\x1d\x23\x6e\xae\x00\x10\xfb\x57\xd6\x48\x63\x7a\
-\x99\xce\xc2\x03\x75\x73\x70\x10\xf7\x93\xdc\xa9\x69\xc7\x62\xd9\
-\x8e\x05\x3b\x80\xc6\x00\x18\x0c\xa1\x38\x8e\xa5\x6c\xae\xa2\x8e\
-\x03\xe4\xe5\x12\xc6\x6d\x6b\xc9\x76\x9c\x45\x22\xcf\x40\xb5\x3d\
-\x34\x97\x3c\xbe\x97\xbc\x7e\x29\x39\x5d\xf2\x36\x25\x51\x2d\x2b\
-\x2c\x27\x53\xa3\x13\x59\x9d\xce\xd7\xde\xd5\xa6\xa7\x95\x8e\xb6\
-\x8f\xa4\xa5\xed\x59\x1b\x92\x98\x6c\x5c\xab\x0d\x47\x54\x71\x01\
-\x82\x6d\x63\xd5\x65\xc7\xc4\x36\x2e\x81\xf6\x30\x52\xb7\xde\xfe\
-\xad\xb3\x89\x6d\x89\x05\x01\x40\xc6\x98\x6f\x8c\x8a\x0d\x79\x32\
-\x52\xac\xcf\xc6\xec\x43\x02\xf7\x7c\x59\x92\x44\xd4\xa5\xce\x32\
-\x56\xb5\xba\x26\xfb\xd4\x00\xa9\x13\x4c\x77\xdb\x93\xad\x9c\x4c\
-\x38\x8e\x3b\x3e\x66\x89\xab\x6b\x5e\x70\xf4\xac\xcb\x00\x89\x63\
-\x3f\x0c\x78\x9c\xa2\x6f\x02\xd3\x05\x8f\xd5\xba\x65\x17\x71\x48\
-\x7e\xa8\x9e\x0e\x9e\x9d\x41\x60\x90\x63\xda\xf5\x6a\x00\xcf\x06\
-\x3d\x3f\x80\x6a\x6d\x6d\x3d\xfe\x28\x16\x5a\xd2\xce\x10\xaa\xc6\
-\x01\xad\x73\x4d\xaf\xdb\x0d\x49\xda\x6f\x25\xb0\xca\x43\xca\x4c\
-\xcc\xc9\x11\xc5\x70\x68\x09\x70\x62\x9d\xd4\xa5\x85\xb5\xc1\x65\
-\xdb\xb9\x44\xf2\x3c\x11\x81\x96\x54\x9d\x9f\x87\x28\xd5\xe8\x03\
-\xa4\xc6\x09\xb8\x6e\x3a\x7f\xb5\x04\xa2\x5b\xbe\x0d\x1b\xa0\xb5\
-\x87\x7a\xf5\x81\xba\x8a\xbb\x8f\xb8\xfd\x89\xe0\x48\x3e\xef\x84\
-\x2f\x82\xa5\x8a\x1d\xc2\x3c\xfc\x41\x4c\x99\x76\x0f\x8c\x10\x95\
-\xeb\x54\xb6\x0b\xf0\x2a\x49\x6d\xc7\x74\x5d\x67\xd1\xdd\xca\x29\
-\xd5\xe8\xc7\x39\x80\xdc\x45\x16\xb1\xf0\xca\x76\x3a\x9f\x71\x5e\
-\x95\xce\xdf\x73\xce\xdb\xaa\x1e\xec\x7e\xe0\xa9\xe8\x11\x13\x17\
-\x13\x50\x1d\xc9\x23\x8a\x7b\xd7\x68\xeb\x1c\xc7\x73\x04\xea\x3a\
-\xe0\x56\x81\xb6\x4e\xcd\x2f\xde\xca\x25\x89\x6b\xf6\x69\x7b\x67\
-\x2a\xd3\x43\x1d\x1b\x9f\x85\x70\xca\x4e\x84\x74\x3e\xcd\xbf\xae\
-\x39\x9d\xbf\x0c\x40\xdd\x38\x33\x66\x43\xd6\x75\xda\xc2\xa5\xb2\
-\x6b\xeb\xac\x0d\x14\xa5\x2e\xe6\xe6\x3c\xdf\xcf\x00\x2c\x77\x12\
-\xcb\x55\x79\x05\x89\x0e\x70\xa0\x6e\x3d\x51\x94\x3a\x94\xbe\x6d\
-\x1b\x63\x10\x9d\x1e\x28\x75\xd2\xf9\x0e\x5a\x39\x44\x90\x4d\x99\
-\xb3\xe7\x1e\x24\x0e\xf4\x75\xd5\x13\xfc\xe6\x66\x4c\x61\x25\x30\
-\x5b\x6f\xa0\x3a\x02\x4e\x29\x7a\x55\x22\xaa\x2d\x4b\x5d\xec\xb3\
-\x1e\xb8\x87\x93\x3e\xef\x97\x87\x2f\xcb\x3c\x72\xbc\xa7\xa9\xd6\
-\x09\xc8\x56\x3a\x9f\x0f\xbe\xa6\xb4\xf2\x6e\xec\xc4\xed\x7b\x3c\
-\x97\x67\xbd\x77\x2b\x01\xc4\xfb\x1f\x6e\x76\x7a\xd6\x73\xf0\xbc\
-\xae\xd7\x13\xf5\xfe\x3e\x7b\xd4\xb6\xa7\xa5\x36\x8e\xed\x02\x39\
-\x48\x5d\x7c\xd4\xd8\x06\x48\xac\x07\x6e\x3d\x90\xab\x9d\x4b\x02\
-\x63\x1d\x25\x87\xd2\x20\x05\x92\xf9\xe2\x23\x4d\xd2\x75\x7f\xdb\
-\xdb\x5a\x64\x0b\xe9\xfc\xd5\x7b\x61\x9f\x0d\x8d\xa9\x5d\x3d\x9d\
-\xf6\x04\xd9\xb0\x2c\x23\x90\x92\x13\x88\xb6\x8f\x03\x60\x8a\xe7\
-\x38\x4b\xc2\x19\xe2\x64\x23\x97\x78\x55\xf1\xa0\xc0\x75\x81\xbf\
-\xf0\xda\x01\xda\xa7\x20\x9a\x67\x06\xc6\x95\x6c\xbf\xe2\x4e\x24\
-\xaa\x6f\xb3\x04\xd9\x36\x90\x28\x35\x3f\x10\xb2\x8e\xc7\x08\xb7\
-\xab\x6e\x3a\x7f\x7d\x36\xc6\x29\x27\x21\x45\xa5\x4c\xdb\xaa\x40\
-\x2e\x82\x37\x7f\xe6\xea\xe7\xe9\x74\xcf\xe0\xc6\x1d\x4a\x02\xef\
-\xc1\x81\x7b\x68\xaf\x7c\x8a\xf6\xd7\xb5\x26\xa3\x2f\x1e\xf9\xc8\
-\x47\xc4\x10\x2f\x30\xf9\x3b\x77\xc4\xec\x9b\xdf\x14\x19\x98\x8a\
-\xb9\x47\xc0\xba\x76\x71\x89\x14\x66\x9c\xce\xe7\x8c\xf4\x3c\x27\
-\xe3\xac\xc7\xa1\x7d\x9d\xb9\xf5\x12\x98\x8e\x5c\x0c\xf6\xf6\x0a\
-\x4d\x9e\x93\xb9\xd9\xc8\x98\xa0\x2d\xe5\xe7\xaa\x2a\x79\xd8\x2e\
-\x68\xa9\x5c\x53\x5f\x6f\x23\x13\x9d\xe1\xda\x2b\xa0\xeb\x9f\xf8\
-\x84\x78\xfc\x67\x7f\x56\xe8\xc1\xa0\x31\xfb\xf1\x1f\xfd\x91\x98\
-\xe2\x09\xe1\x04\x20\x9e\x2e\x78\x58\xbf\x22\x3e\x24\x52\x4a\x35\
-\xd2\xf9\x51\x02\xad\xad\x44\x61\x53\x3a\x9f\x01\x6c\xa7\xf3\x6f\
-\x72\x1c\x68\x33\xf0\xe1\xf0\xb0\x17\x52\x39\x24\x81\xd1\xc3\x3a\
-\x47\xe0\xf1\xae\xe4\xf8\x38\xee\x50\x18\x50\xef\xd7\x00\xc6\x87\
-\x5b\x15\x18\xaf\xb1\x73\x72\x5e\x1a\xd0\x77\x21\x79\xd7\x3f\xf5\
-\x29\xf1\xc4\xcf\xff\xfc\xc5\x2f\x48\xfd\xd4\x4f\x89\x12\x0f\xfc\
-\x87\xbf\xfe\xeb\x62\x8c\x39\x9a\x65\xdb\x3a\x29\x1b\x20\x6a\x9d\
-\xd2\xf9\xe4\x7e\x25\x5d\xf2\xed\x74\x3e\x1f\xaa\x93\xce\xe7\x22\
-\xec\xf9\xc6\xf7\xee\x6d\x12\x70\x92\x7e\x9c\xb7\x61\x0c\x22\xc0\
-\x32\x41\xf2\xb8\xcd\xa6\x07\xd6\x8d\x67\xaf\x66\x81\xea\x39\x55\
-\x4c\x7c\x2e\x65\x83\x2a\x10\xf7\x6f\x5e\x33\x0b\x54\xcd\xe9\x3e\
-\x7e\xaf\x87\x47\xa6\x37\x7e\xee\xe7\x3a\xc0\x41\x82\xce\xdf\x86\
-\x18\xfe\xf8\x8f\x8b\x2d\xd0\xd5\x3c\x17\xf6\x22\x67\x03\x6a\x7b\
-\x66\x9d\xe5\x9e\x4f\x1a\xe6\xcc\xd3\xbc\x21\x33\xe1\x78\x4e\x3c\
-\xe7\x96\xa8\xf0\x4d\x7a\xb5\x6d\x90\x09\x8b\x18\x6e\x34\x20\xc8\
-\x25\x4b\x18\x11\x01\x16\x62\xbb\x98\x29\xa6\xeb\xe9\xc7\xbb\x13\
-\x14\xed\xb6\x38\xa1\x15\x01\xb4\xbb\x48\xad\x5b\x6d\x13\x80\xf4\
-\xe8\x8f\xfe\x68\x7a\x17\x91\x0d\x7e\xe7\x4d\x30\x22\x0d\x49\x14\
-\xdf\xf8\x86\xf8\xce\xbd\x7b\xcd\x84\x6a\x64\x7a\x5b\x85\xc9\x03\
-\x4b\x8c\x47\x23\x86\xbe\xee\x6d\xe5\x94\x2c\x50\xcb\xb6\x29\x3a\
-\x59\x61\x03\xf1\x87\x85\x52\x0d\x95\x94\x75\x21\xdd\x68\x3c\x0c\
-\x4e\x81\xa4\xad\xd7\x63\x10\xa3\xf4\x91\x54\x2e\x72\x2e\x19\xea\
-\x2e\x60\xcb\xc1\x4b\xdb\x40\x29\x57\x79\xe0\x2e\x90\x50\xdf\xe1\
-\x93\x4f\xb6\xa5\xae\xfd\x26\x18\x83\x08\xc7\x92\xed\xee\x0a\xb3\
-\xbf\xcf\xc0\xb1\x67\x0e\xa5\xe1\xb9\x27\x35\x4e\xdb\xb8\xb8\x3d\
-\x55\xc0\x51\x91\x43\x35\x4e\x84\x74\x3e\x00\x59\xed\x44\x36\x40\
-\x75\x29\x44\x99\x65\x43\x47\x12\x58\x55\xe1\x25\x9d\x9a\xde\xaa\
-\xba\x7b\x97\xf7\xb5\xd6\x46\x0f\xd6\x94\xc0\x55\x94\xfa\xa6\x87\
-\x40\x68\x5b\xef\x58\xba\x52\x58\x80\x2c\xbc\x6d\x94\xbc\x25\x6f\
-\x82\x31\x80\x60\xfe\x38\xcf\x1b\x99\x69\x2a\xcd\x1c\x38\xdb\x9a\
-\xbb\x2a\x4b\x4c\x2f\xbe\x91\x0a\xf4\xbc\xa3\x2c\xab\xd4\x76\x86\
-\x74\xbe\xa5\x77\xa3\xa5\xd8\x5e\x01\x60\x0d\xe9\x43\xc0\x28\x9d\
-\x75\xd7\xb4\x73\xb6\x36\x46\x0b\x02\x11\x92\x57\x71\x16\x85\x27\
-\xd1\x35\xfe\x11\x94\x76\xa8\xd0\xcd\xae\xac\x03\x6b\x8d\x04\x6a\
-\xd2\x84\xbf\xf9\x9b\xc6\x5b\xb0\x6d\x10\xa3\x1a\x6b\x30\xfb\xf5\
-\xb7\xde\x62\xdb\xdc\x62\xb6\x6d\xc5\x80\xa8\x13\xe0\x0e\xe0\x1d\
-\xa2\x51\xd1\xa9\xf7\x4a\x53\x69\x4c\x06\xe0\x9c\xb8\xb6\x7d\x81\
-\x13\x91\x38\xba\xe9\xfc\xaa\xe7\xe7\x7f\xbf\x3b\x45\x4c\x35\x85\
-\x04\x52\x2e\xac\xa2\x0d\xb5\xf7\x6c\xec\xbb\x06\x9f\xdb\x98\xf8\
-\x3d\x3c\x10\xfa\xa7\xb6\xd8\x2f\x96\xa9\xde\xbc\xd6\xbe\x9e\x1c\
-\x12\x27\x00\xfe\xe2\x2f\x84\x7b\xf5\xd5\xf4\x2a\x1d\x13\x81\x48\
-\x0e\x84\x12\xc3\xa2\x8f\x73\xf1\x67\x7f\x26\xfe\xef\xc9\x49\x7a\
-\x88\xc4\x14\xc6\x71\x09\x44\xf6\xf2\x44\x31\x9d\xaf\x82\xaa\x4b\
-\x42\xc9\x29\x8f\x66\x2b\x7b\xb3\x9e\x7c\xf9\xe5\x43\xd3\x00\xb0\
-\x7b\x8c\xb8\xa8\xab\x81\x72\xd6\x5b\xda\xdf\x52\xd8\x02\xae\x57\
-\x04\x1c\xa8\x05\x58\x02\x93\x88\xfb\x70\x5b\x17\x9c\x04\x24\xa8\
-\x55\x5f\x0a\x9c\x05\xb5\xbd\xf1\x0c\xf3\xaa\x7e\xeb\xb7\x84\x82\
-\x59\x89\xaf\xd2\x11\x98\x11\xd0\x1e\x49\x21\xfe\x6e\xe5\x95\x2f\
-\x7c\x41\xbc\x1a\x81\x6b\x6c\xe3\xba\xe7\x44\x32\x26\x53\xbd\x90\
-\xf8\xff\x6d\x02\xd1\x3b\x07\x6c\x7b\x29\x9d\x9f\x00\xec\xa6\xf3\
-\x2b\x70\x00\x5a\xeb\x6d\x35\x2b\xe9\x75\xde\x19\x24\x6f\x86\x2d\
-\x5a\x65\x6d\x04\x85\xca\x44\x0c\x5a\xac\xa7\xc5\x53\x7b\xa2\x26\
-\x28\xcb\x24\xae\x2b\xbd\x69\xdc\x16\xd8\xfb\xa0\x43\xa8\xa6\xf9\
-\xd5\x5f\x15\xd9\xd7\xbf\x2e\x32\x78\x59\x05\x26\x6b\xcc\x35\x83\
-\xcd\x9e\xfe\xc1\x1f\x88\x57\xe1\x81\xff\xdb\xf1\x71\xfb\xc1\x39\
-\x4b\x5e\x3b\x9c\x49\x12\xe8\x12\x40\xab\x8f\xec\xc2\x74\x7e\xb1\
-\xe7\xb5\x33\xde\xcc\xea\x12\x12\x28\x2b\xc7\xdb\xb7\x6a\x32\xe9\
-\x66\x7d\xbb\xfb\xcb\xe4\x6d\xb9\x6d\x19\x45\xef\xdb\x6d\x5b\xe1\
-\x99\x65\xab\xef\x6b\xe8\x7b\xf6\xdd\xef\x8a\xf7\x23\xb7\x44\x7f\
-\x0c\x9d\x81\x26\xb0\xd5\xfb\x90\xca\x3f\xff\xf6\xb7\xc5\x2b\x4b\
-\xb2\xd3\x3e\x4a\x64\x6b\xce\x12\xb4\x98\xce\x77\xeb\x01\xec\xa6\
-\xf3\xb7\x67\x39\xfd\xec\xae\xab\xab\x3e\xf4\x56\xd6\xbc\x03\x61\
-\x8a\x4e\x02\xd4\x00\x6b\x19\x88\x17\x79\xe0\x65\xd9\x99\xc4\x8c\
-\xd8\xbe\xa2\x4c\xf5\x3b\xb8\xf7\x0e\x25\xe8\xbe\xf5\x2d\xd1\x07\
-\x8d\x52\xac\xd7\x9d\xe7\x22\x98\x4b\x98\x2c\x33\x3d\xe6\xbe\x8e\
-\x7c\x30\x37\x5b\x4e\xe7\x0b\xa1\xd7\x48\xe0\x5d\xd0\x36\xd2\x51\
-\x3a\xc3\x4d\xb6\x2f\xa0\xcb\x48\x6b\x75\x26\xe3\x13\x30\x5d\xb0\
-\x62\xdf\x56\xbb\x58\x1a\x48\xaf\x0f\x67\x52\xd9\x6d\x93\x0b\xe7\
-\xc7\x3c\xa7\x65\x09\x83\xf4\x46\xc4\x92\x64\xab\x24\x2a\x0a\x97\
-\xb2\xd1\xac\xd8\x29\x51\x5d\xf8\x90\xce\x7f\x8e\x12\x82\x2d\x00\
-\xe9\xfb\x28\x67\x67\x67\xbe\x82\xa7\x80\x0d\xf6\x00\x6f\x53\xce\
-\x1d\x82\x5b\x02\x9c\xef\x82\xd6\x94\xc2\xee\xce\x24\x05\xcf\x5d\
-\xe9\xec\x02\xc4\x94\x8e\x8e\xaa\x27\xf0\xe5\x92\x4c\x8b\x4f\xc0\
-\x75\x72\x85\xb1\x2d\x9a\x0c\x45\x63\xb6\xfe\xbc\xc1\x5b\x48\xb4\
-\xd2\xbe\x48\x6f\xe7\x27\x09\x6c\x7d\x27\x21\xbb\x8e\xa8\x9d\x0f\
-\x40\x6f\x2d\x03\xb8\x28\xf6\xed\x04\xe4\xfa\x54\x51\x87\xcb\xa0\
-\x35\xc1\x72\xb7\x2d\x49\x59\x4a\x34\x74\x23\xaf\xae\x74\xbb\x25\
-\xb6\xb6\x9d\x44\x70\x4a\xa5\x30\xa6\x28\xd2\xdb\xf9\x9e\xfa\x79\
-\xdf\x7a\xb9\xbc\x0b\xa0\xc7\xf1\xd9\xcf\x7e\xd6\xc3\xa2\x40\x4c\
-\xb7\x28\x0d\xe8\xbc\x75\x1b\x96\x6e\x4c\x11\x7b\x0a\x3e\x53\x08\
-\xd0\x05\x70\xb9\x7d\xec\x4a\xdd\x2a\x89\x5b\x26\x7d\x69\xd2\x0d\
-\x60\x79\x9d\x29\x98\x5f\x3e\x36\x6b\x41\x8c\x00\x6c\x8b\x51\x32\
-\x2f\xd8\x47\x4a\x4e\xa2\x2a\x11\xb4\xd1\x2b\x4a\x32\x24\xbc\x38\
-\x99\xd0\xfe\x50\x17\xbe\x23\xe5\xcc\xa6\xb7\xfd\x99\xac\xa5\x52\
-\xa7\x13\xfc\x00\xa8\x21\x71\xb1\xbc\xd0\x18\x2f\x3c\xd0\x16\x4d\
-\x8f\x1c\xcb\xb5\x3b\x0e\x91\xa4\x66\x09\x70\x1d\xd5\xed\xf6\x4b\
-\x69\xb1\x6e\x5b\x0c\xa8\x13\xd1\x79\xfa\xbd\xbc\x68\x68\xba\x97\
-\xee\x6d\xab\x69\x43\x57\xfb\x95\x5e\xf8\xc5\x17\x5f\x14\x37\x6e\
-\xdc\xf0\x3b\xfd\x9d\xbe\xb5\xda\xaa\xbd\xdd\xe7\x4f\x66\xb3\x0f\
-\xe3\x07\x54\xce\xc9\x52\x52\x9b\xb4\x80\xae\xe4\x35\x55\x7a\x99\
-\xd4\x35\x17\xb2\x12\xc4\x2e\x28\x0c\xdc\xda\x23\x49\xca\xd2\x71\
-\x4c\x44\xa9\xa5\x0d\xb2\x2c\xea\xd0\x0c\x72\x18\x40\xe1\x3f\x6d\
-\x6b\xef\x6a\x29\x38\x99\xfa\x4d\x7f\x21\x80\x97\x2f\x5f\xf6\xd8\
-\x28\xbb\x0d\xbf\x51\x95\xb2\x9c\x14\xff\xfc\xd6\x7f\xd9\xfc\x1f\
-\xff\xf3\xf1\xea\xed\xdb\x3f\x39\x31\x76\x83\x22\xf2\x24\x75\x0d\
-\x60\x2e\x7a\x53\xab\x29\x1d\x5d\xe9\x49\x5e\x94\xfa\xaf\x92\xba\
-\xd4\x9e\xce\x57\x7f\x92\xae\x2b\xb1\xed\x79\x26\xcd\xe1\xf6\x79\
-\xa9\x38\x8c\xe1\xcd\x94\x70\x35\x6d\x76\x3c\xed\x1f\xe0\x99\x33\
-\x3f\xf6\x75\x9d\x41\xd0\xe8\xbb\x84\x17\x00\xf8\xd5\xaf\x7e\xd5\
-\xd3\x7b\xbf\x93\xc9\xc4\x68\x3d\xab\x4d\xd6\x93\xbd\x7f\xf1\x63\
-\xff\xa9\xef\xe5\x7f\xc5\xd8\x37\x5d\x55\x5f\x91\x55\xfd\x51\x8c\
-\x32\x74\x55\x78\xdc\xd9\xf7\x55\xad\x45\x5d\x4b\x22\xd4\x95\xaf\
-\x2b\xe1\xe9\xbc\x32\xd2\x4d\xa7\x0a\x39\x43\xb4\x57\xca\xd6\x46\
-\x39\x53\x4b\x6b\xc9\x37\x59\xc9\xc9\x88\x4e\x98\xd1\x95\xcc\xf4\
-\x40\xa8\x01\xd0\xe2\xb1\x54\x1e\x13\x90\xed\xfe\x9c\xce\x4a\xcc\
-\x21\xe2\xac\x8e\x52\x8e\x85\x53\xbe\x89\x3e\x46\x08\x15\xd2\x27\
-\x12\xf5\xa3\xa3\xd9\x69\x55\x9d\xae\x7c\x26\xe2\xe1\x89\xfd\xe5\
-\x9b\x97\x6d\xff\xb4\x5f\x97\xa5\x1b\x43\xf1\x4b\xa7\x5c\x29\x9d\
-\x3a\x84\x71\xa5\x97\x87\x5f\x55\x52\x6e\xe0\x27\x07\xe8\x8f\x12\
-\x4c\x63\xda\xf5\xfc\x36\x5d\x64\xb7\x5f\x94\x1f\x11\x98\xcf\x7e\
-\x93\xba\xf9\xda\x11\xd8\x5b\xa2\x02\xf0\x01\xfc\x2a\x94\x02\x0c\
-\x40\x9b\x70\xa8\xf3\x35\x2e\x2d\x98\xe1\xc0\x0c\x33\x03\x33\x8c\
-\x01\xd5\xd2\xd9\x10\xdc\x77\xb4\xc2\xad\x8f\x29\x53\x28\x95\x34\
-\x22\x2c\xe2\xd2\xf7\x7d\xf0\x6e\x78\xdc\xe2\xdc\x29\xe6\x7c\x8a\
-\x7e\x90\x39\x6f\x0c\x42\xe1\x9d\x9d\x1d\x12\x2e\x4f\x9a\x7a\x21\
-\x80\xde\x87\x25\xfa\x5f\xba\xfa\x4b\xb5\x2c\xa5\x9f\x48\x8b\x87\
-\x22\xb2\x22\x13\x88\x8b\x07\x80\xc4\x01\x8a\x01\xf8\xba\x81\x99\
-\xec\xe2\x17\x47\x28\x35\x01\x88\x11\xef\x49\x9a\x57\x80\x4e\x52\
-\x41\x5c\x7d\x34\xf2\x5c\x62\xe8\x50\xf0\xb9\x12\xb9\x16\x2a\xef\
-\x1d\xfa\x41\x8f\x78\x1f\x25\x6b\x8e\x83\xdc\x11\xfc\x6a\x59\x43\
-\xd6\xe4\x32\x66\x18\xa7\x90\x6b\x83\x56\x18\x28\x1c\x33\x43\x18\
-\x68\x42\x15\x34\x01\xcc\xa8\xa2\x86\x44\x66\x80\x11\x33\x65\xc0\
-\x14\x03\xcd\x30\xc6\x84\x4f\xdf\xed\x7c\xf0\xe9\x93\xe2\xa3\xdf\
-\xff\x26\x06\x1d\x61\x86\x63\xe7\xfc\x04\x42\x71\x62\xe0\x47\xb5\
-\x52\x33\x6b\x6f\xbb\x77\xdf\x9d\x7a\x68\xea\xf2\xcf\xdf\x41\x85\
-\xa9\xb0\xaf\x89\xd7\xe4\xa5\xd3\x4b\x33\xab\xb5\xcc\xa4\x3f\xc2\
-\x4a\xfe\x0f\xd6\x33\x14\x4a\xde\x87\xfe\x0d\x9c\x92\x5b\xe0\x58\
-\x8e\x1f\x7b\x5f\x00\x90\x17\xe8\x68\xd1\x81\x15\x1c\x02\xdc\x9e\
-\x03\x43\x27\x92\xeb\xa1\x7c\x0c\x30\x44\xb7\xc7\xf8\x2d\x98\x26\
-\xf4\xbe\x8b\x9a\x23\xbc\xa3\xbe\xa2\xf6\x28\x63\xc6\xdd\x51\x0b\
-\x63\x86\xf1\x32\x2d\xa5\xee\x1f\xea\x1e\xc1\x8b\x23\x8a\x95\xa4\
-\xf9\xc8\x9d\x38\xb7\x06\x33\xa8\x13\xb1\x9a\x13\x56\x15\x5a\x40\
-\x9e\xf6\x6a\xef\xb0\x80\xfa\x33\xc1\x1f\x6c\x7c\x23\x77\xbe\xb2\
-\x50\x61\x6b\x1f\x71\xbb\xbb\x23\xbf\xf2\x03\x8c\x12\x07\x15\xf4\
-\xf1\x1d\x6c\xce\x61\x12\xd4\x86\xea\xab\x5d\x55\xdb\x01\xea\x03\
-\xa1\xe5\x25\x5c\xee\xa1\xcf\x50\x58\x99\x91\x83\x92\xb4\x64\x25\
-\xe7\xda\x13\x26\x75\xad\xf3\xf4\x4a\x05\x1c\xf9\x32\x4e\x63\x9d\
-\xa6\x8f\xd3\xa8\x45\xd7\x08\x38\x2f\x42\xa3\x45\x97\x86\x0c\x32\
-\x6a\x74\x29\x02\x15\x64\xf1\x31\x14\xc1\x8a\x51\x99\xa4\x15\x37\
-\x46\x8d\x00\xa1\xc5\xf9\x26\x33\x3c\x63\x18\x54\x65\x26\x00\x22\
-\x69\x19\xe8\x04\xf5\x43\xe9\xf5\x2b\x56\x9a\x03\xe3\xfc\xdf\x6a\
-\xab\x4f\x90\x07\x1d\x43\x52\x47\x2f\xbd\xf4\x92\x7d\xe1\x85\x17\
-\x4c\x53\x02\xbb\x6a\x4c\xdb\x3a\xda\x99\x58\x94\x67\xd3\xe9\x1d\
-\x0b\x27\x9c\xdb\x5c\xe0\x9f\xec\xc0\x29\x77\x55\x4a\x77\xa6\xc0\
-\x77\xfc\x98\xa6\x64\xa3\x72\x98\x96\xe6\x8f\x62\x59\xfa\xab\xc6\
-\x00\x68\x3a\x2c\x44\x16\x20\x5e\xc3\x22\x15\xff\x04\x4b\x4f\xf8\
-\x2f\xd9\xa5\x37\x23\x13\x84\x0b\x8f\xb2\x19\x54\x00\x1c\x84\xdb\
-\xd1\xda\x99\x19\xc2\x83\x98\x19\xef\xd0\x09\x35\xa3\x83\x8c\x7d\
-\xf1\x33\x81\x19\xb4\xa2\xf4\x18\x24\x8a\x3a\x34\xc3\xd1\x08\x81\
-\x5d\x54\xce\x70\x95\xa4\xb0\x90\x4a\x9e\x82\xf9\xc7\x18\xeb\x08\
-\xcb\x3a\xc1\x0a\x27\xae\x76\xd5\xf6\xf6\xe1\x58\x88\x1b\xf6\xd6\
-\xad\x17\xdd\x03\x7d\x02\xf4\x73\x9f\xfb\x9c\x02\x80\x12\x1b\x67\
-\x85\x00\x3b\xa7\xaf\x58\x6e\x6e\x6e\x96\x52\x4e\x32\x63\x0a\xad\
-\x54\x5d\xd0\xa4\xe9\xf9\x71\x29\xf8\x49\x55\x51\xc8\xdd\x3a\x34\
-\x5a\xaf\xb5\xf6\xed\xef\xcf\x50\x89\x76\xe9\x9c\x93\x16\x08\x6b\
-\x94\x5e\x89\xab\xe9\xb5\xb0\xd0\xe2\x49\x54\x68\x69\x4a\x39\x70\
-\xa3\xfb\xde\x98\x8b\xcc\x60\x44\xd4\x5c\x03\xa4\xa2\x73\xa5\xa8\
-\x03\xb8\x90\x34\x02\x3f\xee\xd8\xa4\xc8\xc7\xa2\x93\x0b\xea\x2b\
-\xa3\xcd\x55\x95\xf3\xae\xc6\x10\x47\xfc\xd5\x4b\xf1\xae\xf7\xf6\
-\xcc\x66\xfa\x2c\xb3\xe3\xfb\x98\x91\xeb\xf5\xf6\x47\x2f\xbf\x2c\
-\x2c\xd9\x3f\x8f\x63\x25\x80\xed\x34\x7f\xfc\x76\xf4\x78\x3c\xee\
-\xa3\x49\xe1\xc8\xe0\xa8\x54\x5d\x97\xb2\x00\x6a\x31\x8b\x3d\x0a\
-\x41\x7c\x8e\x04\xdd\xe2\x8b\xea\x7e\x18\x00\xcc\x6c\x00\xda\x18\
-\x2d\xa9\x9e\x31\xa0\x38\xca\x00\x2e\x03\x3e\x13\x06\xa5\x36\x54\
-\xaf\x77\xa9\xad\xa6\x71\x40\x5c\x26\x66\x60\x70\x82\xbb\xc1\x0c\
-\xa1\xd5\x15\x2c\x96\xa6\xc8\xc0\x6b\x40\x09\x76\x60\x44\xe7\xc1\
-\x0c\xbe\x79\xfe\x98\x88\xce\x0d\xe9\xa0\x36\xa8\x3e\x8a\x91\x6a\
-\xf2\xba\x64\x07\x7d\xad\x0f\xf2\xdc\x8d\x47\xde\x4c\xf3\x3a\x3f\
-\x19\x0c\xee\xe2\xfb\xa9\xa3\xba\x01\x5e\x17\xc0\xf5\xdf\x90\xc6\
-\x4e\x45\xdd\xba\x75\x8b\xd2\x0e\x0a\xb9\x9b\xf0\x08\x34\x20\xc0\
-\x99\x6c\x7f\xc1\xa7\x53\x1a\x6d\xe3\xf1\xa6\x5c\xf8\xe0\xeb\x00\
-\x76\x45\x76\xff\x3a\xa0\xf2\xfc\x26\x7c\xee\x23\x13\xe2\xb5\x2e\
-\x33\x8c\xb4\x36\x93\x34\x83\x45\x86\xd0\xd1\x66\x06\xb5\x44\x86\
-\x88\xb9\x96\x40\x10\x70\xce\xdf\x48\xc2\x35\x9b\x7b\x37\x9d\x78\
-\x67\x0a\x57\xc1\xde\xf5\xb4\x84\x13\xc1\x1c\x0d\x7d\xa1\xe8\x8b\
-\x5f\xfc\xa2\x99\xcf\xe1\x61\xde\x8d\x49\x37\xcc\x71\xb4\x00\x50\
-\x42\x94\x3d\x40\x8c\x5d\xcc\xbd\x7b\xf7\x24\xc5\x46\xad\x8f\x97\
-\x65\x93\x09\xeb\x1c\xbe\x78\xee\x19\xec\x49\xfb\xef\xf6\x04\x7d\
-\xc0\x2b\x36\x0c\x87\xc3\x42\x4a\x66\x84\x52\x73\x38\xca\x63\x9c\
-\x3f\xca\x89\x4a\x0c\xd0\x64\x46\x1e\xdc\x46\xe6\xc0\x0c\x13\x6d\
-\xa9\x39\xd7\xf7\x5c\x82\x19\x2a\x30\xe3\x24\x5c\x31\xee\x9c\x21\
-\x5e\xd4\xc3\x4a\x49\x5f\x7a\x20\x66\x32\xaf\x85\xae\x9d\x98\xba\
-\xc2\x0f\x8c\xb5\xba\x3a\x3e\x3e\xb2\x24\xf8\xf8\x0c\xa0\xa3\x0d\
-\x06\x1d\x6b\x33\xd2\xeb\x81\xe4\x6a\x92\xcc\x95\x47\xb5\xfc\x4f\
-\x69\xf9\x00\xf0\xed\x31\x4c\x9b\x11\xcc\x0c\x9d\x01\x90\xc0\x08\
-\x3a\x5f\xc6\x8c\xc8\x90\x65\xcc\x48\xdf\x8a\xbe\x2b\x90\xf1\x9f\
-\xcc\xd5\xc4\x6f\x6e\xf6\x29\x89\xe2\x01\xb0\x2b\xcb\x3a\x43\x02\
-\x39\x64\xf0\x60\xfb\x2d\x24\x6f\xfd\x97\xcc\xff\xbe\x8f\xf5\xcc\
-\xc0\xf1\xf0\xcc\x10\x5d\x66\xb0\x66\x04\x46\xa4\x1c\x68\x78\x61\
-\x1c\x60\x79\xfa\x82\xf9\x2d\x71\xcb\xc5\xcf\xc1\xfb\x07\x00\xe7\
-\xff\x01\x38\xdf\x7d\x1c\x31\x55\x08\x3e\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0e\x9a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x50\x00\x00\x00\x50\x08\x03\x00\x00\x00\xb9\xcf\x02\x9f\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x03\x00\x50\x4c\x54\x45\x00\x00\x00\x09\x09\x09\x00\x00\
-\x00\x20\x20\x20\x12\x12\x12\x18\x18\x18\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x1c\x1c\x1c\x1e\x1e\x1e\x23\x23\x23\x0d\x0d\x0d\x00\
-\x00\x00\x00\x00\x00\x14\x14\x14\x20\x20\x20\x00\x00\x00\x1f\x1f\
-\x1f\x11\x11\x11\x16\x16\x16\x0f\x0f\x0f\x00\x00\x00\x09\x09\x09\
-\x07\x07\x07\x1a\x1a\x1a\x14\x14\x14\x09\x09\x09\x1d\x1d\x1d\x18\
-\x18\x18\x18\x18\x18\x21\x21\x21\x02\x02\x02\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x08\x08\x08\x0d\x0d\x0d\x08\x08\x08\x15\x15\x15\
-\x0e\x0e\x0e\x1e\x1e\x1e\x00\x00\x00\x08\x08\x08\x00\x00\x00\x00\
-\x00\x00\x1c\x1c\x1c\x17\x17\x17\x22\x22\x22\x00\x00\x00\x18\x18\
-\x18\x08\x08\x08\x00\x00\x00\x00\x00\x00\x09\x09\x09\x08\x08\x08\
-\x0a\x0a\x0a\x20\x20\x20\x00\x00\x00\x0b\x0b\x0b\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x18\x18\x18\x00\x00\x00\x0f\x0f\
-\x0f\x00\x00\x00\x00\x00\x00\x07\x07\x07\x00\x00\x00\x00\x00\x00\
-\xfc\xfb\xfa\xf0\xf0\xf1\xf8\xf9\xfa\xa3\xa4\xa4\xb9\xb9\xb9\xf9\
-\xf8\xf8\x90\x92\x94\x36\x35\x35\x92\x92\x92\x17\x17\x17\x65\x66\
-\x66\x38\x38\x38\xca\xca\xca\xcf\xcf\xcf\x97\x97\x98\xaf\xb4\xb7\
-\x6f\x70\x71\x58\x58\x58\x60\x63\x65\x95\x95\x95\xbd\xbf\xc0\xf1\
-\xf3\xf4\xb2\xb6\xb9\xcf\xd0\xd1\x9f\xa3\xa6\xbd\xc1\xc4\x77\x77\
-\x78\x63\x63\x63\x91\x95\x99\x3b\x3c\x3c\xe8\xea\xeb\x50\x50\x50\
-\x1d\x1d\x1d\x5a\x5b\x5b\x98\x9d\xa1\x89\x89\x89\xce\xd0\xd2\xe3\
-\xe4\xe5\xc2\xc6\xca\xb8\xbc\xc0\x4b\x4c\x4d\xef\xf1\xf3\x8a\x8d\
-\x90\xbf\xc3\xc7\x8f\x94\x98\x81\x81\x81\x14\x14\x14\x49\x49\x49\
-\xfe\xff\xff\xf6\xf7\xf9\xae\xae\xae\xa9\xac\xae\xc6\xc7\xc7\x6d\
-\x6e\x6f\x8c\x8c\x8c\xc0\xc0\xc1\xcd\xce\xcf\xb8\xbc\xbf\xab\xaf\
-\xb2\x0e\x10\x13\xd9\xd9\xd9\x93\x97\x9b\x5f\x5f\x5f\x73\x74\x74\
-\xa6\xa6\xa6\x86\x87\x88\xb3\xb3\xb3\x71\x72\x74\xba\xbf\xc3\x9a\
-\x9a\x9a\xe5\xe7\xe9\x3e\x3e\x3e\x9c\x9c\x9c\xb9\xbb\xbc\xb1\xb1\
-\xb1\xd3\xd6\xd8\xed\xef\xf1\x7d\x7f\x81\xb6\xba\xbd\x84\x85\x85\
-\x9b\x9f\xa1\x52\x52\x52\x6a\x6b\x6b\xad\xb0\xb3\xa1\xa1\xa1\xe2\
-\xe3\xe4\xf5\xf6\xf7\xab\xae\xb0\xa3\xa7\xab\xcc\xcc\xcc\x7b\x7c\
-\x7e\xdc\xdd\xde\xc5\xc8\xca\xcd\xcf\xd0\x4e\x4e\x4e\x41\x41\x41\
-\x47\x47\x47\x25\x25\x25\x12\x12\x12\x8f\x8f\x90\xe4\xe5\xe6\xec\
-\xee\xef\x19\x19\x19\xa7\xac\xae\xd8\xda\xdb\x95\x9a\x9d\xe1\xe1\
-\xe2\xc2\xc3\xc4\x97\x9c\x9f\xc3\xc4\xc6\xf2\xf4\xf6\x55\x55\x54\
-\x0f\x0f\x0f\xbc\xbd\xbe\xd2\xd4\xd6\xd8\xd8\xd9\x32\x32\x32\x79\
-\x7a\x7b\xaa\xab\xab\x29\x29\x29\xb5\xb7\xba\xa2\xa6\xa9\x75\x75\
-\x75\x08\x08\x08\x21\x21\x21\xc9\xcb\xcd\xca\xcd\xce\xb2\xb5\xb7\
-\xd5\xd5\xd5\xdf\xe0\xe1\xc7\xca\xcc\xff\xfe\xfe\xf0\xf0\xef\xb6\
-\xb8\xb9\x2d\x2d\x2d\x02\x02\x02\xdd\xde\xdf\xd4\xd5\xd6\xe4\xe4\
-\xe4\xe7\xe7\xe7\x0b\x0b\x0c\x9e\xa2\xa5\xb1\xb3\xb5\xf6\xf6\xf6\
-\xe5\xe5\xe6\xa1\xa5\xa8\xd5\xd7\xd8\xa6\xaa\xad\xd0\xd2\xd4\xfc\
-\xfc\xfd\xd2\xd3\xd4\xf8\xf7\xf8\x9c\xa0\xa4\xfb\xfb\xfb\xf2\xf2\
-\xf2\xcb\xce\xcf\xe9\xe9\xe9\xda\xdb\xdc\xb5\xb6\xb8\xd6\xd8\xd9\
-\x04\x04\x04\xfa\xfa\xfb\xcf\xd1\xd2\xee\xee\xee\xea\xea\xea\xeb\
-\xeb\xeb\xfa\xf9\xf9\xe8\xe8\xe8\xfd\xfd\xfd\xf5\xf4\xf4\xf7\xf6\
-\xf6\xef\xef\xef\xf5\xf5\xf6\xe2\xe2\xe3\xed\xed\xec\xa4\xa8\xab\
-\xf4\xf3\xf3\xa0\xa4\xa7\xf2\xf1\xf1\xe6\xe6\xe6\xff\xff\xff\xb7\
-\xb9\xbb\xa5\xa9\xac\x00\x00\x00\xc5\xf3\x4a\x64\x00\x00\x00\x48\
-\x74\x52\x4e\x53\x7d\xa8\x58\x66\xd4\xa4\x65\xf7\x5f\xa0\x6c\x4e\
-\xdc\x6d\xfc\x98\x3e\x80\x60\xcb\x8a\xc0\x36\x1c\xef\xb0\x97\xf5\
-\x78\xbd\x86\x45\xad\x9a\x86\x42\xe4\xb8\xea\x90\xc6\x8d\x51\xc7\
-\x76\xf1\x98\x81\x5a\x73\x34\x1f\x89\x14\xd7\xde\xd2\x74\x05\x17\
-\x24\xa1\x83\x0b\x2a\x8c\x10\x90\x77\xcd\x94\x00\xb0\x9c\x79\xae\
-\x00\x00\x0a\xf1\x49\x44\x41\x54\x58\xc3\xed\xd8\x77\x54\x53\xc9\
-\x1e\x07\xf0\x7d\x6f\x7b\xef\xbb\xb6\xb5\xad\xba\xae\xbd\x3e\x2b\
-\x1d\x65\xbb\x6b\xd7\xb5\xf7\xde\x7b\x6f\x8b\x20\xd2\x04\x94\x2a\
-\x45\x7a\x2f\x22\xd2\x3b\x48\x4f\x20\x20\x24\x40\x42\x7a\x20\x90\
-\x9e\x10\xc2\x8f\xcc\x9b\x9b\x00\x06\xe5\x9d\x05\xdf\x9e\xf3\xde\
-\x1f\x7e\x8f\x7f\xdc\x6b\x4e\x3e\xcc\xdc\x99\xf9\x4d\xee\xbc\x66\
-\xf5\x37\xe7\xb5\x57\xe0\x2b\xf0\x15\xf8\x7f\x0d\x9a\x8e\xf8\xee\
-\xe3\x8f\x87\x0d\x1b\xf6\xf1\xb0\xef\x70\xbe\xf8\xe2\x8b\x91\xd3\
-\x47\x4e\x9f\x3e\xc3\xe4\x25\xc1\xf7\x3f\x40\x11\x59\x15\xfa\x64\
-\xe1\x84\x87\x87\xe7\xe3\xec\xcd\x43\xe3\x3f\x79\x19\x70\x28\x5a\
-\x79\xeb\x0e\xed\x4f\x5d\xd2\x8a\x70\xe8\x5b\xe8\xab\x03\x02\x02\
-\xae\xfe\xbc\xae\x02\x7d\x63\x3e\x68\x70\xa8\x60\x7b\x33\x80\x44\
-\xaa\x96\x2a\x6a\x6b\x6b\x65\x38\x0c\x06\x43\xd4\x5c\x0a\x38\x6d\
-\xa7\xaa\x87\x9b\x0e\x12\x9c\x81\x32\x40\xa2\xd2\x68\x58\xad\x72\
-\x86\x54\x23\x01\x8d\xb2\xb3\xb3\x53\xa9\x02\x48\x58\xf5\x27\x13\
-\x20\x25\xf9\x83\x85\x83\x02\xcd\x87\x38\x81\x3c\xdb\x8f\xad\x61\
-\x01\xe3\x6a\x8a\x83\x8d\x7b\x91\xa2\xaa\xb3\x4e\xd5\x7c\x39\x3d\
-\x19\x55\x57\x78\xb5\x82\x2d\x9a\x36\x28\x70\x1a\xba\x02\x1e\x27\
-\xad\xad\x69\x10\xe8\x6e\x73\xd7\xdd\xc6\x73\x7b\x5d\x99\xb2\x0e\
-\x6e\x22\x7d\xd2\xa5\xb0\x02\xbd\x3f\x08\x70\x16\xda\x07\xde\x3b\
-\xa9\xd4\xf8\x58\xd1\xf6\x90\x8c\x53\x07\xd6\x9c\x8f\x74\x01\x96\
-\x06\x9c\xba\xc1\x08\x32\xa8\xc2\xe7\x0d\x02\xfc\x7c\x39\xa7\xf8\
-\x64\x47\x47\x07\xd5\x3a\xd8\x79\xd7\x63\xaf\xdc\x8c\xdc\xdc\x55\
-\xc0\x10\x81\xea\x80\x53\x35\xf6\xf6\x5e\x91\x28\x81\x47\x9a\x36\
-\x60\xf0\x75\xf4\x3b\xd4\xec\xa7\x62\xb1\xa9\x46\xf8\x4b\xee\x8e\
-\x15\xb7\x23\x03\x40\x21\x95\x2a\x24\x78\x84\x5d\x1c\x78\x0c\x28\
-\x56\x76\xc2\x25\x34\x6a\x80\xa0\xc9\x84\x5d\x50\xb2\x93\xf0\x3a\
-\xa8\x3b\xaf\x41\x33\xb7\x88\xdc\x0c\x6a\x8d\x5a\x2d\x95\xca\x74\
-\xd3\x46\x22\x95\xb7\xd6\xc9\x3a\xf3\xe7\x2d\xfc\x4b\xd0\xc4\xd4\
-\xd4\xdc\x6a\x5a\xf5\xaa\x46\xeb\xa6\x0e\x5d\xb6\x5a\x57\x4a\x98\
-\xa5\x4c\x96\xbc\x4c\xa3\x13\x15\xb5\x32\x86\x88\x29\x29\x95\x88\
-\x58\x90\x89\xde\xfd\x0b\x70\xc6\x97\x6f\x23\xf4\xf6\xc4\xa9\x0f\
-\x60\xb3\x35\x55\x0f\x52\xe3\xfd\x34\x72\x95\x50\xa5\x61\x34\x37\
-\xd7\xb2\x30\xa9\xc0\xf3\xbc\x19\xf4\xd9\xd7\xdd\xe9\xfe\xc1\x85\
-\xef\x8d\x43\x4e\xb9\x07\x22\x4f\x85\xa1\x65\x0e\x5a\x7b\xff\x1a\
-\xbd\xd8\xb1\x93\xfd\x2b\x47\x08\xc0\x6a\x55\x35\x83\x48\x83\x1b\
-\x29\xc5\x37\x14\x71\x59\x23\x00\x27\x7f\xfe\x7f\x06\x17\x4c\x45\
-\x4e\x3f\x2b\x88\xbf\xcb\xcc\x0c\x47\xf9\x77\xef\x1d\xe9\xc8\xb1\
-\xf7\x6b\xea\xa0\x26\x52\xdb\x34\xb0\x2a\xf7\xe6\x4d\xaf\x8c\x4c\
-\xa9\xa4\x4c\xad\x96\xd4\xf1\x32\x33\xed\x52\x56\x55\x01\xee\xf4\
-\xf7\xfd\x83\xe6\x23\xa6\x0a\xc2\x7c\x18\xa0\xa9\xeb\xec\xac\x92\
-\x83\xfa\xf2\x5e\x94\x7e\xfc\xc8\x66\x9b\x9a\xeb\x35\x1d\xd4\x93\
-\x17\xc1\xe7\xf4\xde\x95\xa1\x61\x61\xa1\xb9\x6d\x4c\x0d\xb3\xf5\
-\xd6\x2d\x67\xdb\xf3\x76\x3c\x17\x32\xe0\x99\xfe\x49\x3f\xa0\xf9\
-\xf7\x1f\x09\x42\x5c\x00\xe4\xc4\x7a\x25\x96\x2c\x0b\x58\x97\x93\
-\x91\xe7\x3e\x94\x9e\x9d\xd3\xd1\xe1\xd1\x81\xbf\x97\xbe\x2b\x34\
-\x6c\x4f\x68\xfa\x16\x28\x63\xc8\x0f\x5c\xba\xb5\xc1\xd9\xc7\xc7\
-\x36\x01\xaf\xec\x98\x0f\x5e\x00\x17\x4d\x43\xa4\x3d\xbf\x00\xa8\
-\xaa\x3a\x7b\x53\xa5\x06\xe5\x25\x12\x22\xa1\xf8\x13\xb8\x89\x3b\
-\xe9\xaa\x3d\xd5\xd5\x11\x31\xf9\xa1\xe7\x25\x65\x72\x61\xb3\xca\
-\x65\xc3\x06\x07\xdb\x5f\x94\xa5\x78\xaa\x3b\x10\x9d\x36\x04\x4d\
-\xdf\x45\xc9\xfb\x5c\x4a\xa1\xcd\x80\xc3\xa9\xab\x12\xc1\x55\xaf\
-\x08\x14\xea\x6d\xdf\x5e\xe3\xb1\x9f\x05\xbc\xc8\x03\x91\xb6\xc5\
-\x50\xa6\x12\xca\x55\x22\x50\xa8\x54\x2c\x09\xe0\xe1\x66\xc2\xcd\
-\xe1\x9f\x18\x80\xb3\xbf\x41\xd5\x3b\xae\xe2\xd6\x29\x89\x54\xd5\
-\xc9\x45\x20\x51\x73\xea\x74\x64\x67\x29\x3c\xf4\x44\xd5\x19\x47\
-\xd6\xd6\x9c\x7c\xf8\x83\x6e\x9a\x88\xda\xda\x54\x2a\xb9\x5c\xae\
-\x51\x88\x98\xa2\x5a\xfd\x04\x5a\x83\x3e\x7b\x06\xce\x4a\x4e\xde\
-\x11\xa0\x9b\xfa\xcc\x5a\x96\xbc\x53\x03\xea\xa2\x8b\x01\x14\x90\
-\x74\xea\xc8\x2a\x31\x1e\xc6\x7c\xb4\xb2\x3e\xfb\xe4\x35\x8d\xb8\
-\x55\xd5\x86\xd3\xda\x93\x36\xdd\x1d\xa5\x0c\x9c\xf3\x16\xf4\x82\
-\x5f\x0f\xcf\xda\x42\x70\xa5\xa5\xfa\x79\x5a\x9a\xbb\x5c\x80\x2b\
-\xc9\xae\x2b\x40\xc6\xad\xd5\x17\x54\x85\x3b\x5a\x4e\xcd\xd9\x28\
-\x13\x2a\x03\xc9\xc5\x09\xf8\xbf\xeb\x28\x14\xb1\x98\xa3\xfb\x27\
-\xe6\xb4\x89\x21\x33\x6f\x7a\x2f\x38\x34\x2f\x05\x2b\x8d\xdd\x01\
-\x08\xeb\x2e\x4e\xc8\x0e\xda\x38\x75\xba\x87\xa0\x94\xc2\x79\xb4\
-\x6b\x6d\x9c\xb4\xa0\x9c\x97\xdd\xd5\x75\x27\x65\xe3\xc6\x2b\x57\
-\x1e\x12\x79\x84\xf3\xb0\x80\x63\x08\xce\x42\xeb\x40\x04\xcc\xe6\
-\xee\x80\x34\xa2\x07\x3c\x00\x8d\x4c\x99\x94\x25\x6c\xe3\x50\xaa\
-\xea\x20\x03\x79\xc0\xc5\x0b\xbc\xf2\xec\x6c\x1e\xef\x09\x91\xa7\
-\xbd\xb9\x70\x11\x6c\xf3\x46\xf4\x80\x23\x63\xe8\x20\xfc\xa1\x94\
-\x29\xd2\x87\x09\x91\xdd\x5e\x05\x0b\x44\xcd\xcc\x46\x49\x23\x53\
-\xc4\x50\xb0\x40\x53\x1d\xa2\xf6\xee\xea\x37\xd9\xd7\x61\x03\x9a\
-\xd1\x03\x8e\x0f\x95\x35\x64\x3f\xa2\x40\x23\x83\xd8\xd3\x64\xb5\
-\x22\x08\x58\xb1\x32\x26\xdc\xd3\xb9\x14\x74\xbb\x1c\xb1\xd1\x31\
-\x25\x92\x32\x38\x85\xda\x0f\x3f\x43\xca\xb3\x1f\xb9\xf2\xf9\x25\
-\xe5\xe5\xf8\x09\x78\x17\xc0\x99\x79\xa6\x3d\xe0\x92\x3d\xdc\xfd\
-\x89\x89\xda\x02\x8d\x44\x86\xa7\x80\x42\x21\x95\x11\x0b\x19\xd7\
-\x50\xa6\x54\xa1\x8f\x8c\x21\x13\x16\x93\xe1\x22\xf2\x72\x7d\xe6\
-\x95\xa7\x3e\xb9\x6b\x93\x91\xe3\xba\x31\xbb\x8b\xf7\x14\x7e\x47\
-\x0b\x7a\x27\xf6\x7c\x4f\x76\x53\xec\x61\xfb\x44\x3f\xee\xaf\x32\
-\x85\x54\xad\x8b\x08\x1a\xbb\xaf\x88\x42\xa5\x56\x57\x35\x94\xd0\
-\x25\x74\xc1\xcd\xca\x67\xe0\xc1\x48\x62\x17\x20\x79\x95\xdc\xe9\
-\xba\xf0\xe3\x6a\xc1\x97\xcf\x96\xde\xbf\x1e\xd3\xfd\xaf\xad\xbb\
-\x7d\xaf\xa9\xe9\x91\xf0\x57\x96\x5a\xd3\x27\xb8\xf4\x69\x38\x32\
-\x32\xd9\x31\x88\x2f\xb9\x88\x2e\xa5\xf6\x82\x41\xb1\x02\x74\xe3\
-\xc6\x0d\x01\x72\xaf\xc4\x1d\x0e\xfd\x68\xb6\x21\x98\x6a\xff\x07\
-\x42\x97\x0e\x53\x13\xbd\xb9\x32\x4d\x59\x99\xbc\x37\x65\xf8\x46\
-\x9c\xe6\xf6\x5b\xde\x69\x5b\xb7\x28\x45\x0a\xca\x35\x00\x2f\xe4\
-\x11\x20\x09\xdd\x3a\xc8\xc3\x4f\x77\x86\x95\x21\x58\x5c\x93\x8c\
-\xb7\xb0\xb5\xd7\xeb\x3d\x9a\x82\x84\x2c\x95\x5c\xa8\x8f\x1c\x5f\
-\x88\xb9\x2d\xe4\x87\x78\x9a\x9f\x4e\x38\xc7\xb2\x43\x0f\x1a\x0c\
-\xbb\x7c\x03\x77\x59\x70\xa9\xc0\xef\xa7\x87\xe8\x4d\xab\x3e\xa0\
-\xdb\x6d\x62\x96\x1c\x3f\xa2\xad\xa7\x26\x3e\x49\x90\xaa\xba\xd3\
-\xa6\xa2\x70\xe9\x85\xec\xa4\xbb\xc4\xa7\xe7\xc1\xf7\x3c\x3a\x65\
-\x00\x96\x37\xdc\xb9\xeb\x95\x7b\xc1\xf5\x69\xa5\x34\x6b\xc8\xdc\
-\xbe\x60\xd2\x1f\xc4\x57\xb6\x9f\xd0\xe2\xec\xef\x08\xd6\x08\x5b\
-\x75\xcb\x55\x1c\xd8\x50\x18\xdc\xd2\x70\x6c\x0f\xf1\x69\x06\x9c\
-\xb3\xc5\xdd\xeb\x33\x6d\x2a\xf9\xb4\x92\x27\x5d\xb8\x4a\xbe\x6f\
-\xd5\x1f\x98\xb1\x8d\x00\xeb\xb7\x26\x5e\x6b\x13\x72\xf0\xba\x57\
-\xd2\xd9\x0d\x0d\x2d\x18\x3c\x4a\x7c\x7a\x1b\x9a\x7d\x50\xe4\xc1\
-\x17\xe6\xf4\x05\x89\x5d\xef\xcf\x9b\x9e\x69\xf3\xd8\xed\x01\xf1\
-\x95\xdf\xee\x69\x75\x62\x7b\xfc\x53\x95\x4a\xdc\xaa\x2c\x68\x70\
-\x8b\x3e\x96\xca\x6e\x49\xd2\x3d\x10\x1f\x68\x74\x46\x1e\xd1\x29\
-\xbc\x3e\xdc\x1d\xbf\x40\x55\xf7\x0e\xd5\x67\x50\x62\x63\x10\xca\
-\xba\x17\xab\xd5\xa7\x3e\x3e\x45\xc3\xa1\x34\x34\x44\xaf\x8b\xc9\
-\x88\x4e\x6d\x71\xec\xc2\x5e\x35\xf7\xdc\x59\x07\x14\xfe\xa0\xe4\
-\x5a\x1f\xf0\xe9\x46\x58\x8f\x66\x3d\x07\xce\xf7\xe4\x6f\xc3\x8d\
-\xb8\x7b\xa2\xbd\x1b\xd4\xfa\xef\xaf\x54\x17\x17\x26\x11\xed\x76\
-\xf7\x0d\x6e\x71\x5b\x87\xd0\x1a\x88\x82\x35\x79\x24\x74\x3b\xd5\
-\xd0\x2b\xf7\x03\x1f\xfd\x86\x67\x08\x2e\xf1\x8c\xcb\xb9\x77\xfc\
-\xf8\xbd\x5e\x4f\x5b\xef\xf1\x44\x53\xcc\x6f\xc0\xcd\x46\xf9\xfc\
-\xb8\x60\xfa\xb1\x8b\xab\xcf\x3a\x1e\x82\xdf\x05\xa7\x51\x98\xeb\
-\x1d\xc3\x0e\x1f\x4a\x4b\xfe\xfc\x85\xdf\x87\x78\x2d\x53\xb5\xf6\
-\xf6\xda\x67\xa0\x36\x27\x47\x59\x75\x9f\xa7\x2b\x39\xe5\x51\x5b\
-\xd8\xca\xb3\x3f\x1d\x3a\x14\x45\x54\x21\xd2\x4e\xb6\x41\x03\xaf\
-\x6f\x83\x33\xc8\xf4\x05\x70\x72\x08\xd7\xdf\x00\x23\xd2\x5e\xc3\
-\xa5\x74\x83\x5d\x51\x6c\xda\x21\xe5\xfd\xfb\x51\x51\xe0\x8e\x3c\
-\x2f\x14\x3e\xe5\xf1\x70\x3d\xc4\x05\xf1\xa9\xb7\x77\x83\xbe\x26\
-\xf4\x03\xb6\x3f\x0f\x6e\xe5\x52\x68\x95\x7b\xb1\x17\xce\xe5\xb7\
-\x90\x95\x09\x84\x08\x36\xd5\xbb\xa3\x4b\x70\x82\x4a\x4a\x0a\xd8\
-\x0d\xdc\x68\xe9\x9f\xa7\x22\x86\xf6\xf3\x16\xf0\xe5\xd1\x7e\xc0\
-\x38\x4a\xa1\x6f\x86\x6e\x50\x0a\xf9\x09\xe4\xfb\xbe\xbb\x8b\xef\
-\xc3\xa5\xe4\xd5\xdc\x22\x7a\x4b\x11\x8d\x5f\x59\x54\x14\x70\xc5\
-\xd9\x2b\x9c\xb4\x7c\x52\x3f\xe0\xfc\x90\x38\xed\x0b\x5d\x4e\xa3\
-\x14\xba\x3a\xda\x64\x3d\xd8\x4d\x6f\x21\x93\x95\xd2\xe0\x68\x55\
-\xf1\xd9\xed\xa4\x8a\x74\x9c\x65\x2b\x97\x2d\x4b\x4f\xcf\x8a\x21\
-\x4d\x5d\xf2\x0f\x4b\x8b\xaf\x9e\x07\x17\x5b\x0e\x09\x89\xab\x37\
-\x18\xe1\x6e\x50\xcc\x66\xbb\x6e\xda\x94\x94\x5a\xc0\x2f\xe6\xc2\
-\x5d\x74\xe6\x9c\xe3\xd9\x8c\x8f\x26\x4f\x5e\xd2\x93\xc9\xa3\xc7\
-\x18\x7f\x38\xd3\x78\xe9\x52\xf3\x3e\xe0\xc2\x77\x8c\xcc\xe6\x85\
-\xa4\xf5\x82\x39\xd7\x4b\x4e\x68\xfd\x31\xc8\x17\xb3\xf1\xaa\xa3\
-\xb7\x1c\xa4\x07\x06\xfe\x58\x80\xcb\x4d\x26\x48\x72\xa7\xce\xfc\
-\x70\xca\x94\x29\x96\xba\x4c\xb1\xfc\x74\x8e\x85\x85\x85\xd1\x98\
-\xb9\x86\xe0\x57\x96\xa3\xe7\x4c\x99\x77\x86\x16\xdb\x0d\xb6\x7b\
-\x6f\x3e\xba\xc2\x9e\x68\x21\x8d\x00\x71\x82\x69\x81\x5c\xb8\x85\
-\x1f\xe6\x0e\xf8\x69\xc7\xd4\xa5\x4b\xc7\x2c\xd5\xc7\xc2\xcc\x6c\
-\xce\x1c\x63\xe3\xb1\x33\xbf\xee\xd3\xe5\x49\x66\x16\xc6\xaf\x8d\
-\xf3\x8c\xeb\x19\x94\xf6\xc3\xeb\x11\x7a\x70\xa2\x5d\x07\x06\x6f\
-\x89\x3e\x1b\x75\x35\x2d\x8e\x0b\x36\x18\x3c\x03\x8a\x90\xc9\x73\
-\x17\x9b\x2e\xc6\x99\x3d\x7b\xf6\xd7\x8b\x16\xcd\x35\x37\x31\x59\
-\xf8\xdc\xcb\xe3\xe2\xb7\x8c\x8c\x3f\x9d\xb0\x5e\x99\xd3\x0d\xae\
-\xa5\xe2\x7d\xa2\xe2\x48\x6c\x7b\x13\xd1\x42\x37\x87\x10\x5e\x52\
-\x25\x3f\x0e\x88\x35\xf8\x18\xd2\xc2\x47\xfc\xf5\xfb\xf2\x62\x23\
-\xb3\x99\xf3\x43\xc9\xd7\xfd\xf5\xe0\x36\xa2\x96\x92\x12\x37\xb7\
-\x37\x55\x8a\x0b\x92\x7e\xc3\x37\x29\x9b\x68\x69\x49\x76\xf8\xe2\
-\x32\x5e\xb5\xa3\x06\xf0\x02\xfe\xcf\xd1\x53\xc6\x27\xf3\x02\xe3\
-\x75\x83\xab\x0d\xd2\x15\xc6\xe3\xd7\x08\x90\xc6\xcf\xc7\xd7\x47\
-\xcf\xa5\xf1\xb9\xbe\x61\x28\x26\x01\x1e\xcf\x1b\xd0\x1b\xfd\xa4\
-\x31\x16\xc3\x9d\x84\xf7\x12\xeb\x9f\x07\x1d\x33\x89\xeb\xea\x02\
-\x47\x3e\x4d\x4c\xbe\xf5\x08\x5c\x04\xdf\x0f\xec\x88\xe0\x5b\xb3\
-\xf1\x82\x7d\x8c\xc2\xf8\x1c\x4c\x6e\x23\x9e\x16\x29\x7e\xb3\xb6\
-\x29\x95\xe3\x76\x59\xbf\x96\xa3\xf9\xfc\xd4\xfb\x67\x41\x5e\x31\
-\xc4\x7c\x80\x67\x0e\x5f\x8d\x7d\x23\xef\x0c\x6d\xb7\xff\xfe\x7a\
-\xed\x93\xa6\x3c\xa2\xd2\xfa\x11\xe0\x6e\x1f\xc2\x13\x3c\x72\xa4\
-\xf1\xe9\xc5\xc0\x0f\x15\xcc\x18\xf0\x21\xc6\x22\xcb\x89\x79\x31\
-\xce\x92\x20\xeb\x9c\xfa\xc3\x78\xff\xb8\x7d\xb8\x5d\xdb\x44\xe7\
-\xc4\xb1\x89\x5f\x61\xbb\xa2\xd3\x2a\x5b\x7c\x4b\x2f\x47\x08\x3e\
-\x1b\xc4\xa9\x88\xc9\x87\xa3\x27\xa0\x1d\xad\xc7\xfc\xe3\xd7\x5e\
-\x77\xda\x77\x04\x6f\x05\x18\x2c\x4c\xda\x8e\xc1\x9f\x15\x57\x03\
-\xa1\xe8\x0c\x7a\x63\xd1\xa0\x8e\x59\x4c\xde\x59\xfa\x39\xca\xca\
-\x64\x14\x9e\x8c\x2d\x39\x11\xeb\xaf\x07\x69\xbb\x73\x2b\xd6\x1c\
-\x0b\xf0\x6d\xde\x70\xba\x4f\xd5\x1b\xd8\xb9\xcd\xa4\x39\x46\x13\
-\xd0\xfa\x4e\x5f\x6d\xa2\x6e\xfe\x78\xb4\x70\xd8\xec\xca\x4d\xe7\
-\x38\x7c\x58\x1d\x86\x26\x2e\xb2\x1a\x34\x88\x07\x7b\xec\x44\x52\
-\xfe\x79\x70\x8d\x6f\xc2\xc3\xed\x51\x29\x2e\x6c\x69\x61\x5f\x3d\
-\x07\x97\xab\x07\xd8\xbc\x17\x5e\x7c\x66\x99\x19\x2f\x9d\x20\x58\
-\x5f\xd4\xf8\xc4\x3a\x67\x6b\xbd\x98\x12\x5c\x10\x14\x05\x57\xc2\
-\xd0\x37\x8b\xac\x5e\x0e\xb4\x9a\x6b\x6c\x61\x39\x11\x9d\x76\x80\
-\x43\x35\x27\x0b\x35\x94\xe2\x04\xd0\xe4\x0a\x48\x9f\x59\x59\xbd\
-\x2c\x68\xb5\xf0\x2d\xa3\x99\x16\xe3\xd0\xd1\x22\xc9\x26\xdd\x4b\
-\x8b\xcb\xf3\x27\x47\x83\x3f\x4c\xfb\xd6\x68\xce\xcc\xf1\x82\x64\
-\x2f\xbb\x94\x14\x3b\x77\x27\xc1\xb8\x59\xff\xf5\xe9\xdc\xec\x4f\
-\x8d\xcc\xc6\xbe\x99\x27\x88\x38\x5d\x8d\xe6\xbd\xf7\x77\x1c\xf7\
-\x99\x7c\x3b\x69\xae\x95\xe9\xeb\xd3\x47\x2e\x18\xb5\xf0\xd5\x91\
-\xe9\xff\x00\xfc\x37\x13\x22\x00\xc8\xc4\x1e\xff\x45\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x09\xa8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x03\x00\x00\x00\xf4\xe0\x91\xf9\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x02\x8b\
-\x50\x4c\x54\x45\x00\x00\x00\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\
-\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\
-\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\
-\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\xbf\xff\x00\x00\x00\x31\
-\x0e\x28\x2e\x00\x00\x00\xd7\x74\x52\x4e\x53\x00\x16\x0d\x77\x67\
-\x01\xdb\xcd\x43\x33\xa8\x99\x15\xf9\xf3\x0c\x74\x65\xd9\xcb\x40\
-\x31\xa5\x97\x13\xf8\xf2\x0b\x71\x63\xd6\xc9\x3d\x2f\xa3\x95\x11\
-\xf7\xf0\x0a\x6e\x61\xd4\xc7\x3a\x2d\xa0\x93\x0f\xf6\xef\x09\x6b\
-\x5f\xd1\xc5\x37\x2b\x9d\x91\x0e\xf4\xee\x08\x68\x5d\xce\xc3\x34\
-\x29\x9a\x8f\xed\x5b\xc1\x28\x8d\xf1\xec\x07\x59\xc8\xbf\x2e\x26\
-\x94\x8b\xeb\x06\x60\x57\xbd\xfe\x24\x02\x22\x44\x55\x76\x87\xc4\
-\x54\x32\x21\x04\x14\x25\x36\x47\x79\x8a\x9b\xac\xde\xbc\xab\x46\
-\x35\x17\x39\x4a\x5a\x7c\x9e\xaf\xc0\xd0\xe1\x49\xa1\xb2\xd3\xe4\
-\xf5\xb9\x96\x70\xfd\x6f\x4c\x4b\xe3\xe2\x19\xca\x18\xad\x89\x85\
-\x62\xfa\x5e\x41\xd8\x23\x05\x7a\x4f\xe8\x1e\xd2\x1a\xb6\x03\x92\
-\x6c\xfc\x2c\xe0\xa9\x9f\x84\x53\xe6\x1d\xbe\xb3\x82\x56\x9c\x8c\
-\xdd\x1f\x50\xa6\xe7\xd7\x6a\x3e\xdc\x80\xfb\xc2\x30\xb0\x73\x8e\
-\x98\xb5\x3b\xd5\x7d\xe5\x20\x27\x78\x58\xba\xaa\xea\x3c\x6d\xae\
-\x72\xb8\x67\x85\x97\xd3\x00\x00\x00\x01\x62\x4b\x47\x44\x00\x88\
-\x05\x1d\x48\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\
-\x00\x0d\xd7\x01\x42\x28\x9b\x78\x00\x00\x00\x07\x74\x49\x4d\x45\
-\x07\xe2\x06\x03\x17\x23\x0a\x4d\xb8\x61\xed\x00\x00\x04\xfd\x49\
-\x44\x41\x54\x78\xda\xed\x9b\xfb\x5b\x54\x45\x18\xc7\x07\x75\x59\
-\x35\x41\x57\x12\x10\x33\x51\x37\xb7\x52\x11\x10\xf3\x92\x5c\x94\
-\x34\x04\x24\x45\x4a\x84\x05\x45\xd4\x50\x84\x0d\x41\x14\x25\x10\
-\xc5\x0b\xe4\x25\x2d\x11\xa2\xcc\x5b\xa8\x95\x86\x95\x96\x77\xcb\
-\x7b\x37\x4d\xad\xf9\x77\x64\x59\x60\xf7\xec\xce\x99\x73\xce\xbc\
-\x73\x66\x9e\xa7\xa7\xef\xcf\xe7\x9d\xcf\xe7\x81\xb3\xf3\x9e\x33\
-\x33\x07\xa1\xff\x03\x4b\x50\x3f\xc9\x02\xfd\x07\xc8\xe5\x5b\x82\
-\xad\x72\x05\x06\x62\x3c\x48\xaa\xc0\x60\x8c\x5f\x90\xc9\x1f\x12\
-\x82\x71\xe8\x50\x89\x02\xc3\x70\x57\x6c\x12\x05\x86\xbb\x05\xc2\
-\xe4\xf1\x5f\xc4\xdd\x19\x21\x4d\x20\xdc\x23\x10\x21\x8b\x1f\x39\
-\xd2\x23\x10\x35\x4a\x92\xc0\x4b\xb8\x27\xa3\x25\x09\xbc\xdc\x2b\
-\x30\x46\x0e\x3f\x1a\xf7\x65\xac\x14\x81\x71\x5e\x81\xf1\x32\xf8\
-\xf6\x57\xbc\x02\x13\x1c\x12\x04\x5e\xc5\x3e\x79\x4d\x82\xc0\xeb\
-\xbe\x02\x13\xc5\xf3\x27\x61\x45\x26\x0b\x17\x88\x51\x0a\x4c\x11\
-\xcd\x8f\x8d\x53\x0a\xc4\x4f\x15\x2c\x90\x80\xfd\x32\x4d\xb0\xc0\
-\x1b\xfe\x02\xd3\xc5\xf2\x67\xe0\x80\xcc\x14\x2a\x30\x2b\x50\xe0\
-\x4d\x91\xfc\xd9\x89\x81\x02\x49\xc9\x02\x05\x52\x30\x21\x73\x04\
-\x0a\xcc\x25\x09\xa4\x8a\xe3\xbf\x85\x89\x99\x27\x4c\x60\x3e\x59\
-\xe0\x6d\x51\xfc\xa1\xa1\x64\x81\x34\x51\xb7\xa1\x0d\xab\x64\x81\
-\x20\x81\x30\x35\x81\x74\x31\xfc\x11\x58\x35\x19\x42\x04\x22\xd4\
-\x05\x32\x45\xf0\x47\x2d\x54\x17\xc8\x7a\x47\x80\xc0\x68\x4c\xc9\
-\x22\x01\x02\x8b\x69\x02\xd9\xe6\xf3\x97\x60\x6a\x72\x4c\x17\x78\
-\x97\x2e\xf0\x9e\xd9\x7c\xc7\x04\xba\xc0\xd2\x5c\x93\x05\x96\x61\
-\x8d\xe4\x99\x2c\x30\x5d\x4b\x20\xdf\x5c\xfe\x4c\x2d\x3e\x76\x16\
-\x98\xc1\x2d\xb4\x2f\x1f\xb4\xa2\xc8\xb6\xb2\x78\x95\xa6\x00\x4e\
-\x2f\x5e\x69\x5b\x3d\x70\xcd\xfb\xf6\x42\x08\xb1\x64\xed\xba\xd2\
-\xf5\x79\x29\x65\xe5\xae\x0f\xf2\xe7\x56\xc4\x3b\xb5\xb9\x84\xbf\
-\x45\x7c\x85\x75\x43\xa5\xab\xbc\x2c\x25\xaf\x6a\xe3\xba\xb5\x25\
-\x74\x62\x6e\x75\xc6\xa6\xcd\x35\x09\x5b\x32\xb7\xd6\x7e\x58\x57\
-\x1f\xc5\x02\xd4\x4a\x54\x7d\x5d\x76\xed\xd6\xcc\x2d\x09\x35\xdb\
-\x36\x65\x54\xf7\xfd\x5a\x6c\x0d\xdb\x53\x77\x34\xee\x34\x83\x48\
-\xcf\xce\xc6\x1d\xa9\xdb\x1b\x6c\x28\x76\x97\x78\xb6\x37\xbb\x62\
-\xbb\xfe\xdd\x11\xf2\xf8\xbb\x3d\x37\xc6\x9e\x26\x39\xf8\xa6\xe6\
-\xde\xfb\xe0\xa3\x50\xf8\x68\xc6\x13\xba\xd7\xfb\x1b\x18\xbb\x4f\
-\x3c\x7f\xff\x12\xdf\x5f\xe1\x81\x30\xf8\x88\xc6\xf2\xf1\x41\xe5\
-\x3c\xe0\x38\x24\x96\x5f\x19\xb0\xa2\x62\xf9\x44\x24\xff\x53\x0b\
-\x61\x32\x3c\xdc\x22\x0a\x1f\x72\x84\x3c\x1d\xb7\x26\x89\xe1\x67\
-\x45\xab\x35\x84\x9c\x60\x11\xfc\xb6\xcf\xd4\x5b\x52\x64\xba\xf9\
-\xfc\x7c\x3b\xb5\x29\xc6\xc0\x09\xf4\xb8\xda\x35\x9e\x04\x3e\x67\
-\xea\xfd\x7a\xd3\x34\x0c\x69\xa6\x28\x0e\xce\x51\x4b\xe2\x17\xda\
-\x7c\x84\x4a\x8f\x9a\xc5\x6f\xd4\xb9\xc1\xf7\xe5\x31\x73\xf8\xd6\
-\xe3\xfa\xf8\x08\xf5\x3b\x61\x06\xbf\xd6\xc0\xb6\xca\xc9\x53\xfc\
-\xf9\xe5\xc6\x9e\x92\xbf\xea\xe0\x8b\x6f\x31\xbc\xb7\xb8\x8d\xeb\
-\x93\x71\x52\xab\x51\x3e\x42\xa7\xcf\xf0\xe3\x07\x33\xbd\xb5\x57\
-\x2f\x86\x93\x3d\x49\x8f\x64\xe1\x23\x94\x7c\x96\x0f\xff\x6b\xe6\
-\x57\x76\xcb\x37\x1c\xf0\xce\x32\x56\xbc\x3b\x47\x42\xa0\xfc\xb8\
-\x6f\x21\x7c\x84\xa2\xb3\x60\xfc\x73\x1b\x61\x7c\x84\x0a\xda\x20\
-\xfc\xba\xf3\x50\x3e\x42\xf6\xef\xd8\xf9\x9d\x5c\x8e\xf8\xb4\x57\
-\xb2\xf2\x67\x81\xd6\x28\xbc\x61\x6e\x0c\x17\xf8\xf0\x95\xfb\xe4\
-\x46\xb2\x8a\x0f\x3f\x88\xf9\x16\x68\xe1\x73\xbc\xe6\x7b\x66\x01\
-\x5c\xc5\x45\x20\x82\x5d\xa0\x98\x8b\xc0\x70\x76\x01\x2e\xe7\x7b\
-\x8e\xb3\xf3\x71\xc7\x6c\x0e\x02\x0b\x00\x02\x78\x2f\x9c\x8f\x7e\
-\x80\x08\xfc\xc8\x41\xe0\x22\x44\x80\xc3\x91\xd7\x4b\x10\x3e\x6e\
-\xb2\x83\x05\x34\x37\x08\xe8\xf9\x09\x2c\xd0\x00\x13\x80\x9f\xab\
-\xd8\x0f\x13\x38\x06\xe5\x17\xc0\xf8\xd8\x39\x04\x28\x60\x03\x0a\
-\xe0\x22\xa0\xc0\xcf\x50\x81\xdd\x40\x81\xcb\x50\x81\x2b\x30\x7e\
-\x06\x94\x8f\xf1\x01\x90\xc0\x55\xb8\x40\x0d\x48\x40\xeb\x79\xd4\
-\xe9\x0a\xd7\x12\x70\x41\xf8\x96\xa5\xf4\xc1\xdb\xae\x21\xb4\xbe\
-\x82\x7e\xcd\x75\x88\xc0\x64\xea\xd0\x21\x37\xba\xcf\x2b\x38\xca\
-\x6f\x52\x2f\x83\xbc\x9b\x34\xd3\x06\xbe\xd5\x77\x70\xe9\x17\xea\
-\x6e\x03\xe4\xa4\xe1\xaf\xea\xc3\xc6\xdb\x7c\x56\xdc\x0b\x9b\x29\
-\x9b\x3e\x31\xec\xfc\x42\xf5\xe5\xf3\xb3\x7e\x1b\x1e\xe7\x3b\x55\
-\x2f\xad\x67\x17\x58\xa3\x36\xe6\x99\xcd\x81\x17\xaf\x3e\xa7\x76\
-\xf5\x72\x66\x81\xdb\xe4\x01\x3b\xee\x10\x5f\x38\x62\xef\xaa\x2c\
-\x33\xb3\x1f\xbe\xbf\x47\x1c\xcf\xaa\xfa\x61\xcf\xfd\x07\xc4\x82\
-\x70\x56\x7e\x09\x69\xa5\x2e\xf1\xf6\x49\xf5\x8a\xdc\x87\x23\x09\
-\x25\xbf\xb1\x0a\x10\x4e\xae\xe2\x13\xbf\xd3\x6b\x72\xb2\x09\x45\
-\x7f\x30\x0a\xfc\x19\x30\xd2\xd1\xbf\xb4\xab\x0e\xa7\x05\x94\xa5\
-\x30\x0a\x3c\xf2\x1b\xc7\xe9\xd2\xf5\x8c\x1b\x14\xd0\x1e\x1e\xb3\
-\xf1\xdb\xfd\x0e\x15\x5c\xb9\xa6\xb7\xd2\xbf\x3d\xfc\x6d\xd1\x5b\
-\xa9\xc8\x13\xc5\x20\x3d\x13\xbf\xbe\xf8\xb7\x87\xd3\x4c\x02\x0f\
-\x7d\x87\xb8\x65\xf0\xa8\xa0\xb2\x3d\x3c\x65\x12\xf0\x59\x1d\x53\
-\x4c\xfc\xfa\xa2\x68\x0f\xcf\x58\xf8\xc9\xde\x6f\x48\x06\x1f\x64\
-\x19\xc0\xa7\x3d\xa4\xb1\x2c\x97\xb5\xf6\x56\x93\x26\x7e\x7d\xf1\
-\xb6\x07\x96\xcf\xd1\x2e\x78\x4a\x3b\x32\x01\x2b\x4d\x7d\xed\xe1\
-\x1f\x86\xe2\xd4\xee\x4a\x2b\xf0\x8b\xce\x9e\xf6\xd0\x69\xbc\xd2\
-\xd1\xa2\x35\xf1\xeb\x8b\xa7\x3d\x2c\x34\x3e\x4e\x95\x7b\xe2\xbf\
-\x04\xc5\xbb\xd3\xdd\x1e\x4a\x0d\x97\x15\xeb\x9a\xf8\xf5\xa5\xab\
-\x3d\xf4\x37\x5c\x34\x51\xdf\xc4\xaf\x2f\x41\xe1\xff\x1a\x2d\xb1\
-\x4c\xe2\x87\x77\xe7\x3e\xdf\xe1\xfe\x4b\x79\x0e\x4f\x97\x62\x18\
-\x3a\x28\x58\xce\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
-\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x38\x2d\x30\x36\x2d\
-\x30\x33\x54\x32\x33\x3a\x33\x35\x3a\x31\x30\x2b\x30\x32\x3a\x30\
-\x30\x32\xe2\x0b\x1d\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x38\x2d\x30\x36\
-\x2d\x30\x33\x54\x32\x33\x3a\x33\x35\x3a\x31\x30\x2b\x30\x32\x3a\
-\x30\x30\x43\xbf\xb3\xa1\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\
-\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x09\xa8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x03\x00\x00\x00\xf4\xe0\x91\xf9\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x02\x8b\
-\x50\x4c\x54\x45\x00\x00\x00\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\
-\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\
-\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\
-\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x55\x6b\x2f\x00\x00\x00\xcd\
-\x55\xca\xe2\x00\x00\x00\xd7\x74\x52\x4e\x53\x00\x16\x0d\x77\x67\
-\x01\xdb\xcd\x43\x33\xa8\x99\x15\xf9\xf3\x0c\x74\x65\xd9\xcb\x40\
-\x31\xa5\x97\x13\xf8\xf2\x0b\x71\x63\xd6\xc9\x3d\x2f\xa3\x95\x11\
-\xf7\xf0\x0a\x6e\x61\xd4\xc7\x3a\x2d\xa0\x93\x0f\xf6\xef\x09\x6b\
-\x5f\xd1\xc5\x37\x2b\x9d\x91\x0e\xf4\xee\x08\x68\x5d\xce\xc3\x34\
-\x29\x9a\x8f\xed\x5b\xc1\x28\x8d\xf1\xec\x07\x59\xc8\xbf\x2e\x26\
-\x94\x8b\xeb\x06\x60\x57\xbd\xfe\x24\x02\x22\x44\x55\x76\x87\xc4\
-\x54\x32\x21\x04\x14\x25\x36\x47\x79\x8a\x9b\xac\xde\xbc\xab\x46\
-\x35\x17\x39\x4a\x5a\x7c\x9e\xaf\xc0\xd0\xe1\x49\xa1\xb2\xd3\xe4\
-\xf5\xb9\x96\x70\xfd\x6f\x4c\x4b\xe3\xe2\x19\xca\x18\xad\x89\x85\
-\x62\xfa\x5e\x41\xd8\x23\x05\x7a\x4f\xe8\x1e\xd2\x1a\xb6\x03\x92\
-\x6c\xfc\x2c\xe0\xa9\x9f\x84\x53\xe6\x1d\xbe\xb3\x82\x56\x9c\x8c\
-\xdd\x1f\x50\xa6\xe7\xd7\x6a\x3e\xdc\x80\xfb\xc2\x30\xb0\x73\x8e\
-\x98\xb5\x3b\xd5\x7d\xe5\x20\x27\x78\x58\xba\xaa\xea\x3c\x6d\xae\
-\x72\xb8\x67\x85\x97\xd3\x00\x00\x00\x01\x62\x4b\x47\x44\x00\x88\
-\x05\x1d\x48\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\
-\x00\x0d\xd7\x01\x42\x28\x9b\x78\x00\x00\x00\x07\x74\x49\x4d\x45\
-\x07\xe2\x06\x03\x17\x21\x10\x82\xec\xfa\x15\x00\x00\x04\xfd\x49\
-\x44\x41\x54\x78\xda\xed\x9b\xfb\x5b\x54\x45\x18\xc7\x07\x75\x59\
-\x35\x41\x57\x12\x10\x33\x51\x37\xb7\x52\x11\x10\xf3\x92\x5c\x94\
-\x34\x04\x24\x45\x4a\x84\x05\x45\xd4\x50\x84\x0d\x41\x14\x25\x10\
-\xc5\x0b\xe4\x25\x2d\x11\xa2\xcc\x5b\xa8\x95\x86\x95\x96\x77\xcb\
-\x7b\x37\x4d\xad\xf9\x77\x64\x59\x60\xf7\xec\xce\x99\x73\xce\xbc\
-\x73\x66\x9e\xa7\xa7\xef\xcf\xe7\x9d\xcf\xe7\x81\xb3\xf3\x9e\x33\
-\x33\x07\xa1\xff\x03\x4b\x50\x3f\xc9\x02\xfd\x07\xc8\xe5\x5b\x82\
-\xad\x72\x05\x06\x62\x3c\x48\xaa\xc0\x60\x8c\x5f\x90\xc9\x1f\x12\
-\x82\x71\xe8\x50\x89\x02\xc3\x70\x57\x6c\x12\x05\x86\xbb\x05\xc2\
-\xe4\xf1\x5f\xc4\xdd\x19\x21\x4d\x20\xdc\x23\x10\x21\x8b\x1f\x39\
-\xd2\x23\x10\x35\x4a\x92\xc0\x4b\xb8\x27\xa3\x25\x09\xbc\xdc\x2b\
-\x30\x46\x0e\x3f\x1a\xf7\x65\xac\x14\x81\x71\x5e\x81\xf1\x32\xf8\
-\xf6\x57\xbc\x02\x13\x1c\x12\x04\x5e\xc5\x3e\x79\x4d\x82\xc0\xeb\
-\xbe\x02\x13\xc5\xf3\x27\x61\x45\x26\x0b\x17\x88\x51\x0a\x4c\x11\
-\xcd\x8f\x8d\x53\x0a\xc4\x4f\x15\x2c\x90\x80\xfd\x32\x4d\xb0\xc0\
-\x1b\xfe\x02\xd3\xc5\xf2\x67\xe0\x80\xcc\x14\x2a\x30\x2b\x50\xe0\
-\x4d\x91\xfc\xd9\x89\x81\x02\x49\xc9\x02\x05\x52\x30\x21\x73\x04\
-\x0a\xcc\x25\x09\xa4\x8a\xe3\xbf\x85\x89\x99\x27\x4c\x60\x3e\x59\
-\xe0\x6d\x51\xfc\xa1\xa1\x64\x81\x34\x51\xb7\xa1\x0d\xab\x64\x81\
-\x20\x81\x30\x35\x81\x74\x31\xfc\x11\x58\x35\x19\x42\x04\x22\xd4\
-\x05\x32\x45\xf0\x47\x2d\x54\x17\xc8\x7a\x47\x80\xc0\x68\x4c\xc9\
-\x22\x01\x02\x8b\x69\x02\xd9\xe6\xf3\x97\x60\x6a\x72\x4c\x17\x78\
-\x97\x2e\xf0\x9e\xd9\x7c\xc7\x04\xba\xc0\xd2\x5c\x93\x05\x96\x61\
-\x8d\xe4\x99\x2c\x30\x5d\x4b\x20\xdf\x5c\xfe\x4c\x2d\x3e\x76\x16\
-\x98\xc1\x2d\xb4\x2f\x1f\xb4\xa2\xc8\xb6\xb2\x78\x95\xa6\x00\x4e\
-\x2f\x5e\x69\x5b\x3d\x70\xcd\xfb\xf6\x42\x08\xb1\x64\xed\xba\xd2\
-\xf5\x79\x29\x65\xe5\xae\x0f\xf2\xe7\x56\xc4\x3b\xb5\xb9\x84\xbf\
-\x45\x7c\x85\x75\x43\xa5\xab\xbc\x2c\x25\xaf\x6a\xe3\xba\xb5\x25\
-\x74\x62\x6e\x75\xc6\xa6\xcd\x35\x09\x5b\x32\xb7\xd6\x7e\x58\x57\
-\x1f\xc5\x02\xd4\x4a\x54\x7d\x5d\x76\xed\xd6\xcc\x2d\x09\x35\xdb\
-\x36\x65\x54\xf7\xfd\x5a\x6c\x0d\xdb\x53\x77\x34\xee\x34\x83\x48\
-\xcf\xce\xc6\x1d\xa9\xdb\x1b\x6c\x28\x76\x97\x78\xb6\x37\xbb\x62\
-\xbb\xfe\xdd\x11\xf2\xf8\xbb\x3d\x37\xc6\x9e\x26\x39\xf8\xa6\xe6\
-\xde\xfb\xe0\xa3\x50\xf8\x68\xc6\x13\xba\xd7\xfb\x1b\x18\xbb\x4f\
-\x3c\x7f\xff\x12\xdf\x5f\xe1\x81\x30\xf8\x88\xc6\xf2\xf1\x41\xe5\
-\x3c\xe0\x38\x24\x96\x5f\x19\xb0\xa2\x62\xf9\x44\x24\xff\x53\x0b\
-\x61\x32\x3c\xdc\x22\x0a\x1f\x72\x84\x3c\x1d\xb7\x26\x89\xe1\x67\
-\x45\xab\x35\x84\x9c\x60\x11\xfc\xb6\xcf\xd4\x5b\x52\x64\xba\xf9\
-\xfc\x7c\x3b\xb5\x29\xc6\xc0\x09\xf4\xb8\xda\x35\x9e\x04\x3e\x67\
-\xea\xfd\x7a\xd3\x34\x0c\x69\xa6\x28\x0e\xce\x51\x4b\xe2\x17\xda\
-\x7c\x84\x4a\x8f\x9a\xc5\x6f\xd4\xb9\xc1\xf7\xe5\x31\x73\xf8\xd6\
-\xe3\xfa\xf8\x08\xf5\x3b\x61\x06\xbf\xd6\xc0\xb6\xca\xc9\x53\xfc\
-\xf9\xe5\xc6\x9e\x92\xbf\xea\xe0\x8b\x6f\x31\xbc\xb7\xb8\x8d\xeb\
-\x93\x71\x52\xab\x51\x3e\x42\xa7\xcf\xf0\xe3\x07\x33\xbd\xb5\x57\
-\x2f\x86\x93\x3d\x49\x8f\x64\xe1\x23\x94\x7c\x96\x0f\xff\x6b\xe6\
-\x57\x76\xcb\x37\x1c\xf0\xce\x32\x56\xbc\x3b\x47\x42\xa0\xfc\xb8\
-\x6f\x21\x7c\x84\xa2\xb3\x60\xfc\x73\x1b\x61\x7c\x84\x0a\xda\x20\
-\xfc\xba\xf3\x50\x3e\x42\xf6\xef\xd8\xf9\x9d\x5c\x8e\xf8\xb4\x57\
-\xb2\xf2\x67\x81\xd6\x28\xbc\x61\x6e\x0c\x17\xf8\xf0\x95\xfb\xe4\
-\x46\xb2\x8a\x0f\x3f\x88\xf9\x16\x68\xe1\x73\xbc\xe6\x7b\x66\x01\
-\x5c\xc5\x45\x20\x82\x5d\xa0\x98\x8b\xc0\x70\x76\x01\x2e\xe7\x7b\
-\x8e\xb3\xf3\x71\xc7\x6c\x0e\x02\x0b\x00\x02\x78\x2f\x9c\x8f\x7e\
-\x80\x08\xfc\xc8\x41\xe0\x22\x44\x80\xc3\x91\xd7\x4b\x10\x3e\x6e\
-\xb2\x83\x05\x34\x37\x08\xe8\xf9\x09\x2c\xd0\x00\x13\x80\x9f\xab\
-\xd8\x0f\x13\x38\x06\xe5\x17\xc0\xf8\xd8\x39\x04\x28\x60\x03\x0a\
-\xe0\x22\xa0\xc0\xcf\x50\x81\xdd\x40\x81\xcb\x50\x81\x2b\x30\x7e\
-\x06\x94\x8f\xf1\x01\x90\xc0\x55\xb8\x40\x0d\x48\x40\xeb\x79\xd4\
-\xe9\x0a\xd7\x12\x70\x41\xf8\x96\xa5\xf4\xc1\xdb\xae\x21\xb4\xbe\
-\x82\x7e\xcd\x75\x88\xc0\x64\xea\xd0\x21\x37\xba\xcf\x2b\x38\xca\
-\x6f\x52\x2f\x83\xbc\x9b\x34\xd3\x06\xbe\xd5\x77\x70\xe9\x17\xea\
-\x6e\x03\xe4\xa4\xe1\xaf\xea\xc3\xc6\xdb\x7c\x56\xdc\x0b\x9b\x29\
-\x9b\x3e\x31\xec\xfc\x42\xf5\xe5\xf3\xb3\x7e\x1b\x1e\xe7\x3b\x55\
-\x2f\xad\x67\x17\x58\xa3\x36\xe6\x99\xcd\x81\x17\xaf\x3e\xa7\x76\
-\xf5\x72\x66\x81\xdb\xe4\x01\x3b\xee\x10\x5f\x38\x62\xef\xaa\x2c\
-\x33\xb3\x1f\xbe\xbf\x47\x1c\xcf\xaa\xfa\x61\xcf\xfd\x07\xc4\x82\
-\x70\x56\x7e\x09\x69\xa5\x2e\xf1\xf6\x49\xf5\x8a\xdc\x87\x23\x09\
-\x25\xbf\xb1\x0a\x10\x4e\xae\xe2\x13\xbf\xd3\x6b\x72\xb2\x09\x45\
-\x7f\x30\x0a\xfc\x19\x30\xd2\xd1\xbf\xb4\xab\x0e\xa7\x05\x94\xa5\
-\x30\x0a\x3c\xf2\x1b\xc7\xe9\xd2\xf5\x8c\x1b\x14\xd0\x1e\x1e\xb3\
-\xf1\xdb\xfd\x0e\x15\x5c\xb9\xa6\xb7\xd2\xbf\x3d\xfc\x6d\xd1\x5b\
-\xa9\xc8\x13\xc5\x20\x3d\x13\xbf\xbe\xf8\xb7\x87\xd3\x4c\x02\x0f\
-\x7d\x87\xb8\x65\xf0\xa8\xa0\xb2\x3d\x3c\x65\x12\xf0\x59\x1d\x53\
-\x4c\xfc\xfa\xa2\x68\x0f\xcf\x58\xf8\xc9\xde\x6f\x48\x06\x1f\x64\
-\x19\xc0\xa7\x3d\xa4\xb1\x2c\x97\xb5\xf6\x56\x93\x26\x7e\x7d\xf1\
-\xb6\x07\x96\xcf\xd1\x2e\x78\x4a\x3b\x32\x01\x2b\x4d\x7d\xed\xe1\
-\x1f\x86\xe2\xd4\xee\x4a\x2b\xf0\x8b\xce\x9e\xf6\xd0\x69\xbc\xd2\
-\xd1\xa2\x35\xf1\xeb\x8b\xa7\x3d\x2c\x34\x3e\x4e\x95\x7b\xe2\xbf\
-\x04\xc5\xbb\xd3\xdd\x1e\x4a\x0d\x97\x15\xeb\x9a\xf8\xf5\xa5\xab\
-\x3d\xf4\x37\x5c\x34\x51\xdf\xc4\xaf\x2f\x41\xe1\xff\x1a\x2d\xb1\
-\x4c\xe2\x87\x77\xe7\x3e\xdf\xe1\xfe\x4b\x79\x0e\x4f\x97\x62\x18\
-\x3a\x28\x58\xce\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
-\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x38\x2d\x30\x36\x2d\
-\x30\x33\x54\x32\x33\x3a\x33\x33\x3a\x31\x36\x2b\x30\x32\x3a\x30\
-\x30\x5c\x2c\x4e\x60\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x38\x2d\x30\x36\
-\x2d\x30\x33\x54\x32\x33\x3a\x33\x33\x3a\x31\x36\x2b\x30\x32\x3a\
-\x30\x30\x2d\x71\xf6\xdc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\
-\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x20\x54\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x50\x00\x00\x00\x4f\x08\x06\x00\x00\x00\x7c\x91\x42\xe3\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x1f\xd1\x49\x44\
-\x41\x54\x78\xda\xdd\x7c\xdb\x8f\x1d\xc9\x79\x5f\x55\xf5\xed\x5c\
-\x67\xce\x70\x38\x17\x0e\x77\x97\xbb\x0b\xed\x1a\x2b\x5a\x89\x17\
-\x09\x64\x2b\x12\x02\x3e\x05\x90\x0d\xd8\x4f\x12\xfc\xe0\x07\x3d\
-\xc9\x4f\x46\x0c\x04\x30\x10\x40\x86\x28\x03\x46\x9e\x9c\x57\x03\
-\xfe\x07\x0c\x7b\x1f\xf2\x28\xc4\x41\x80\x35\x62\x04\x06\x1c\x28\
-\x88\x57\x94\x76\x65\x69\x45\x2e\xc9\xe1\x0c\x87\x73\x39\xd7\x39\
-\x7d\xa9\xaa\xfc\xbe\xaa\xae\xad\xbe\x9c\x33\x43\xc6\x4e\x8c\xb8\
-\xa5\x6f\xbf\xaa\xea\xea\xe6\xd4\xef\xfc\xbe\x4b\x7d\xdd\xe7\x70\
-\xad\x35\xfb\xa7\x72\x7c\xef\x7b\xdf\x13\x2b\x86\x5b\x63\x0f\x1e\
-\x3c\xd0\xfb\xfb\xfb\xe1\xd1\xf6\x91\xbe\xcb\xee\x2a\xea\xdf\xbd\
-\x7b\x57\x43\xf3\x0f\x3e\xf8\x40\xe9\x57\x00\x85\x00\xfc\xa7\x05\
-\x90\x3f\xc2\xe6\xc0\xe5\xe5\x65\x42\x1a\x6b\x56\xbd\xde\x4c\xcf\
-\x66\x3d\x3d\x18\xbc\x90\xcf\x9f\xf7\xc2\x20\x08\xf2\x34\x4d\xd5\
-\x4f\x7e\xf2\x13\xfd\xe1\x87\x1f\xca\x72\x9e\xfe\xff\x0a\x40\x0f\
-\x50\x1b\xa4\x97\x01\x68\x3c\x1e\xd3\x7a\x12\x1c\xb5\x45\x61\xac\
-\xff\xf9\x45\x61\xa6\xf3\x3c\xd2\x61\xb8\x94\x59\x16\xf7\x84\x10\
-\xa9\x52\xaa\x90\x52\x16\x9c\xf3\x14\x40\x8a\xc9\x64\x92\x9d\x9f\
-\x9f\xab\x97\x61\x63\xf8\x8f\x0f\xd2\x7d\x92\xb5\x2c\x7a\x15\x80\
-\xa2\x28\x72\x7d\x77\x6a\xd3\xfc\x37\x2e\x7b\x19\x63\x92\x27\x5b\
-\x3c\xd6\x4a\x9d\xcc\xc3\xb0\xb8\x90\xd1\xc1\xad\x8b\x4b\xcd\x16\
-\x5d\x25\x12\xce\xe5\x58\xa9\x24\x0b\xc3\x90\x6f\x6d\x6d\xa5\xf7\
-\xef\xdf\xe7\x38\x24\x81\xf8\xff\x84\x81\x6d\x80\xee\x3b\xfd\xca\
-\x66\x46\x47\x0b\xa4\xc6\xd1\xed\x76\x6f\x80\x39\x5a\x06\x10\x29\
-\x3d\x6a\xdd\xc1\x5e\xba\x5c\x8a\xcb\x8f\x3f\xd9\x91\x27\x27\x07\
-\x6a\x3c\xd9\xe7\x52\xbe\x83\x9b\xef\x07\x45\x71\x9b\x29\x79\x13\
-\x4b\xef\x69\x83\x0c\x7f\x24\xde\xff\xe7\xbf\x1f\xbe\xf7\xee\x27\
-\x5a\x87\x8b\x20\x48\xcf\x0c\xd6\x59\x38\x81\x49\x17\x47\x47\x47\
-\x85\x63\xe2\x3f\x08\x03\x39\x0e\x52\xf7\xef\xfb\xb1\xf5\x20\xdd\
-\xf7\xf7\x6f\x81\x74\x3d\x40\xbb\xbb\xbb\x61\x51\x14\x1b\x98\xcf\
-\x1c\x48\x30\x31\x7e\x6b\x7b\xf7\x35\x49\xf7\x79\xf8\x68\xb4\x78\
-\xf4\xd9\xbe\x7a\xfe\x7c\x77\xb3\xdb\xbb\x93\x5f\x2e\xde\x0c\xf2\
-\x6c\x5f\x65\xf9\x8e\x50\x72\xd8\x57\x8a\xc7\xdd\x8e\x4e\xba\xb1\
-\xec\xa4\x29\xef\xb0\x24\xe8\x64\x9c\x75\xa4\x60\x9d\x2c\x63\x12\
-\xe7\x1f\x44\xd1\xeb\xcf\x3f\xfa\xe1\x77\xe2\xbb\x5f\xfc\xb7\x5a\
-\xab\x3d\x29\x45\xc8\xb9\x9e\x72\xfc\x07\x00\x4e\x10\x6c\x18\x8e\
-\x1c\xf2\x2a\x00\xb6\x41\xfb\xc6\x37\xbe\x61\x00\xba\x77\xef\x1e\
-\x87\x94\x67\x1e\xe2\xfa\x37\xff\x8f\x01\x82\xa9\xe8\xed\xed\x8d\
-\x1d\xa5\x94\x1e\x5f\x2e\x14\x8d\x11\x40\x6f\x1c\xbc\xf1\xa6\x08\
-\x84\xc8\xcf\xce\xbb\xf3\xc7\x4f\x77\xb3\xc7\x8f\xb7\x8b\x17\xa7\
-\x7b\x3b\x07\x07\x77\x45\x96\xed\x2a\xfd\xd1\x0e\xd0\xdc\xe8\x80\
-\x32\x7b\xfb\x7b\x2c\xdc\x1c\xa8\x7e\x10\xe8\xae\x56\x22\xce\x73\
-\x1e\x2d\x53\xd6\x15\x82\x85\x97\x0b\x26\x26\x53\xae\x97\x69\x28\
-\x79\xc6\x34\x67\xac\xd0\x8a\xc9\x3c\x67\xb2\x28\x18\x3c\x1f\xfb\
-\x85\x3c\x0f\x8e\x83\xf0\x17\xd4\xf8\xec\x5f\xe8\xcd\xd1\x13\x11\
-\x05\x8c\x2b\xfd\x10\xd8\x46\xbd\x83\xde\x92\x8f\x79\xfa\xed\x6f\
-\x7f\x3b\x20\x40\xe9\x78\x05\x00\x3d\x70\xe4\x0b\x1e\xb0\x07\x02\
-\x21\x9f\x9d\x9e\x9e\x72\xc6\x4e\x93\xcb\xcb\x1e\xf4\x1e\xc1\x75\
-\x25\x48\x3b\x3b\xa3\x6d\x62\x4e\x96\x65\x1a\x4b\x30\x00\x05\x32\
-\x60\x5f\x78\xf7\x0b\xef\xb0\x22\x8f\x26\x3f\xfd\xbb\xed\xc5\xe1\
-\xb3\xdd\xe8\xd1\xe3\x1b\x07\xef\xbc\xf3\x4b\xf8\xd8\xb7\xc3\x47\
-\x87\xbb\x00\x70\x83\xe5\x79\xb2\x1d\x85\xec\xbd\x5f\xfe\xb2\xee\
-\x04\x42\x21\x56\x8a\x44\x6b\x0e\x5a\xb2\x5e\xaf\xcf\xf8\xf8\x82\
-\x85\x00\x8b\xa5\xa9\xd0\x4a\x31\x12\x09\xb6\x6a\x18\x49\x31\x5f\
-\x30\xc5\x38\xd3\x9d\x2e\x93\x61\x04\x3f\x18\x31\xb9\x58\x32\x11\
-\x44\x0c\x17\x31\x35\x9e\x32\xad\x71\x1f\x80\xc8\x82\x90\xfa\xef\
-\x07\xa3\xad\x85\x52\x7a\x18\x30\x31\xe7\xbc\x38\xeb\x2c\xd9\x08\
-\x76\xfc\x02\x3e\x57\x11\x1c\x90\x36\x80\x57\x01\x77\xef\xfe\x3d\
-\x0e\xd0\x04\x98\x26\xee\xcc\xee\x04\x69\x74\xda\x4b\xb6\x13\x3e\
-\x67\x1c\x1f\x54\x4a\x37\xa4\x85\x08\xa5\xc4\x88\x40\x02\xfd\xc9\
-\x1f\x71\x02\xe9\xce\x6b\x77\xde\x0c\xf0\x97\xa4\x4f\x0e\x47\x97\
-\x8f\x9f\xdc\xca\x0f\x8f\x76\xde\xfe\xc2\x17\xde\x67\x59\xbe\xdd\
-\x09\x82\xdd\xe4\x6f\x17\x5b\xb8\x41\x07\xfe\x9c\xdf\xfa\xea\x57\
-\x75\x72\x2f\xd2\xfd\x24\xe6\x49\x18\xf0\x50\xc3\xbf\x0d\x37\x70\
-\xf1\x92\xb1\xc9\x84\x05\x60\x95\x06\xf6\x0c\xff\x51\x59\xca\xd4\
-\x62\xc1\xf4\x7c\xce\x24\x16\xaf\x69\x4c\x42\xcb\x82\xe9\xbc\x00\
-\xc5\x72\xa6\xa0\x69\x9c\xc7\x09\x56\x18\xb3\x40\x49\xc6\xf3\x2e\
-\xe3\xfd\x82\xc5\x00\x33\x3b\x3d\x65\xd9\x78\xc2\x34\xae\x8f\xa4\
-\x24\x64\xb4\x9a\x2f\xde\x11\x5a\x3f\x15\x5c\x1c\x69\xae\xdf\xc4\
-\xc7\x34\x67\x05\xef\x6f\x6c\x74\xc6\x67\x67\x67\x0a\x2c\x54\xab\
-\x58\x18\xae\x02\x8f\x18\x77\x78\x78\x28\xf6\x4f\xf7\xc5\x73\xf9\
-\x3c\xea\xf7\x77\x06\x3a\x51\x89\x96\x61\x80\xe8\x2f\x54\x18\x05\
-\xa3\xd1\xee\x3e\xe7\x22\xd0\x17\x17\x83\xf4\xb3\x47\xb7\xe4\x8b\
-\x93\x7d\x39\x99\xee\xed\xbf\xf9\xd6\x3f\x8b\x39\xdb\x8b\x3e\x7b\
-\xb6\x13\xf7\xba\xc3\x41\x27\x11\x07\x5f\xfe\x32\xeb\x0c\xfa\x7a\
-\xd0\xeb\xe9\x7e\x7f\x20\x62\x44\xcb\x08\x8c\x88\xbb\x20\x2c\x99\
-\xd9\xe5\x02\x54\x81\x81\x61\x71\x1a\x7d\x5d\x00\x80\xc9\x18\x40\
-\x64\x06\x10\x8d\x45\xca\x8b\x0b\x4c\x51\x0c\xac\x34\x2c\x53\x19\
-\xf8\x9c\x42\x5c\xd4\xa5\x06\xb9\xe7\x28\x61\x61\x6f\xc0\x78\x96\
-\x03\xd0\xcc\x02\x8c\x73\x61\xa7\x63\x80\x2e\xce\xce\xc9\x4f\xb0\
-\x60\x30\x64\xf9\xcc\x7e\x08\x89\x54\xd4\x1e\x01\xbc\xb7\x19\xd7\
-\x33\x22\x32\x58\xb1\x81\xcf\x2c\xcd\x83\x7c\x03\xc7\x8b\x47\x8f\
-\x1e\xf1\x6b\x7c\xa0\x07\x0f\x4d\xd1\xef\xf7\x43\x21\x44\x5f\x67\
-\xd3\x4d\xf9\xb7\x3f\x78\x93\x9d\x4f\xde\xce\xf3\xfc\xad\xde\xc6\
-\xe6\xdd\x44\xf0\xdb\x49\xbf\x77\xbb\x33\x1c\xdc\x88\xfa\x83\x78\
-\xef\x17\xdf\x63\x83\xd1\xbf\xd2\x9b\x1b\x43\x3d\x18\x0e\x78\xb7\
-\xd3\xe1\x91\x08\x58\x67\x38\x64\x22\x2f\x2c\x03\xc0\x4a\x1e\x46\
-\x9c\x11\x08\x4a\x43\x41\x9f\x9d\x01\x1c\x0b\x50\x01\x56\xe0\xa4\
-\x05\x0f\x20\xa9\x14\x4c\x9b\xcd\x18\x33\xd8\xd0\x7c\x6d\xe6\x31\
-\xba\x17\x80\xe6\x52\xd9\xf4\xa4\x04\x8f\xf7\x42\x73\x5f\xb0\xc8\
-\xf8\x36\x01\x90\x34\x3e\x24\x2d\x04\x13\xca\xb2\x94\x49\x45\x0b\
-\x63\xf2\xb3\xcf\xec\xfd\x89\xc1\xb8\x5f\xb7\x28\x78\x3a\x9f\xf7\
-\xc1\xbc\x1b\xb8\xd3\x0d\xce\xd5\x52\x0b\xfe\x86\x2e\xf4\x85\xc8\
-\x44\xcc\x81\x2c\x82\x89\x8b\x03\xf2\x4a\x06\xc2\xc7\x45\xe2\xaf\
-\xff\x7a\x3f\x78\x71\xf2\x87\x7b\x6f\xde\xf9\xb5\xce\x68\x73\x73\
-\xe3\x8d\x3b\x7c\xf4\x95\x03\xb6\xb3\xb7\xab\x36\x6f\x8c\x18\xc0\
-\xa5\xbb\xb2\x4e\xb7\xcb\x42\xad\x8d\x08\x0d\xfc\xa3\x88\xf3\x20\
-\x74\xee\x02\x6c\xba\x84\x52\xd4\xb4\x8c\x82\x46\xcb\x9a\x1a\x99\
-\x1d\x99\x1b\x4c\xd1\x8c\x4a\x65\x19\x06\xad\x14\x34\x2d\x58\x08\
-\xd3\x77\x07\x8f\xe3\x12\x44\xcd\xf0\x6f\xd9\xf3\x1c\x62\xfd\x9f\
-\x05\xba\x64\x22\xc7\xb8\xa6\xe5\xba\xfb\x2a\x6d\x40\x2b\x26\x53\
-\x26\xc9\xfc\x2f\x97\x66\x9e\xc4\x78\xa7\x28\xe0\x4f\x27\x7d\x0c\
-\xe0\x23\xd1\x77\xc0\xa3\x17\x9c\x23\x26\x45\xe8\x73\x18\xc8\xf8\
-\x92\x4f\xa7\xd3\xab\x19\x88\xfc\x8d\x7c\x9e\x48\x66\x49\x38\x90\
-\xd9\x7f\xff\x37\xff\xfe\xdf\xed\xbf\xbe\xbd\x2d\xf0\x27\xb3\x24\
-\x84\xc9\x99\xbf\x4b\x08\x8e\x36\x16\x42\x6c\xb5\xc0\x68\x6d\xff\
-\x60\x9b\x3c\xa1\x9f\x62\xb0\x64\x18\x04\x66\x04\x6d\x26\xda\xc5\
-\x28\x09\xb1\x00\x01\x34\x3b\xae\x4a\xcd\xa0\x04\xee\x45\xd3\x39\
-\xb4\x20\x10\x10\x15\xe9\x3c\xb7\xd7\x59\x73\x55\xce\x64\xca\x7b\
-\x41\xa0\x8d\x1f\x2c\xd9\xad\x4c\x5f\xd9\x76\x51\x90\x36\x26\x2f\
-\x17\x70\x6d\xd3\x19\x82\xcc\xdc\x30\xbd\xc0\x6d\x12\x9a\x33\x9b\
-\x47\x06\x0f\xad\x3b\x4a\xf3\x0e\x07\x15\xd0\x17\x58\x93\x40\xb6\
-\x30\x44\xb2\x71\x7a\xf2\xe1\x09\x5f\x0b\x20\x6d\xa4\x77\xd8\x8e\
-\x58\xfe\xe0\x3f\xbd\xf7\xde\xbd\xaf\x1d\xbc\x07\xf3\x8b\xc8\x89\
-\x93\x09\x48\xcd\x78\x92\x58\xa7\x1c\x60\x41\x5a\xf9\x35\x40\x98\
-\x03\x05\xda\xf8\x22\xeb\x98\xcd\x18\xb7\x0b\xb2\x73\xac\xc3\x72\
-\x80\x7a\x61\xdc\x98\xaf\xa2\x71\x49\xf3\xec\xc2\xed\x3c\x07\x04\
-\x8d\x97\xe7\x1d\x4b\x8d\x58\xb3\x47\xdf\xce\x91\x16\x64\x77\x8d\
-\xd3\x64\xae\x05\xfc\x6b\x76\x72\x62\xef\x4d\xd7\xd0\x9f\xca\x39\
-\x4b\x30\x3f\x5f\x2e\xc3\xae\x52\x86\x71\xe6\x7f\x30\x2a\xce\xd4\
-\x6d\xc6\xf9\x79\xaf\x47\xdb\xa0\x2d\xfe\x90\x3d\x34\x6e\xae\x1a\
-\x48\x84\xf3\x7d\x1f\xdc\xfd\x40\xdf\xb9\x73\x27\x42\x18\xdc\x4d\
-\xba\x1d\x16\x22\xda\xf1\x94\x24\x67\xdc\x9a\x8f\xd5\xa5\x49\x0a\
-\x21\xec\xc5\x25\x23\xb8\xd1\xfe\xbc\x61\x97\x03\x95\xc4\x80\x53\
-\x40\xca\xbe\x2c\x45\x29\x1a\xb7\xa6\x59\x14\x15\xc9\x2d\xa3\xd0\
-\x76\x1a\x01\x04\xda\xcf\x35\xbe\x12\xe2\xe7\x01\x28\x3b\x5e\x9e\
-\xa3\x71\x80\x08\x2d\x11\x30\xd4\xb2\x34\xe1\xe5\x92\x49\xf2\x95\
-\x10\x49\x2c\x72\xed\xe9\x34\x2a\x77\x0a\xaf\x93\x6f\xd0\x14\xd8\
-\xb0\xee\x3c\x2f\xcc\x16\xb2\x4c\x7f\xf9\x2a\x06\xf2\x7b\xec\x9e\
-\x98\x04\x93\xb0\xbf\x77\x70\x38\x79\xfe\x82\x65\xf8\x43\xba\x9a\
-\x7c\x4d\xcc\x04\xdd\x12\x7d\x62\x21\x23\x66\x6b\x07\x0c\x69\xcc\
-\x29\x7d\x90\xd3\x8c\xda\x86\x05\xd2\xce\x95\x68\x1b\x0d\xb1\x63\
-\xc6\xd4\xdc\x3d\x34\xc4\xfb\x40\xd2\x65\xbf\x70\x6c\x6c\x48\x01\
-\x06\xda\x6b\xdd\x07\x65\x83\x84\x0d\x34\xb5\xb9\x60\x1e\x8d\x19\
-\xbf\x57\x8c\xc7\x30\xdf\x29\x2b\x66\x33\xcb\x3e\x88\xc2\xda\x22\
-\x9a\x4b\x28\x4c\x67\x5b\x7c\x73\xe3\x59\x19\xd9\xb9\x01\x26\x97\
-\x3b\xe8\x8f\xaf\x2c\x26\x20\xba\x70\xf6\x80\x89\x8d\x3b\x1b\x05\
-\x7f\xff\x8b\xb3\xf9\xff\xfa\x91\xcc\x8b\x22\xe8\x91\x1f\x82\x19\
-\xf3\x6e\x8f\x22\x1f\xdd\xce\xb2\xc5\x99\x1e\x99\xaa\xf3\x4b\x1e\
-\xbc\x12\x04\xb3\x20\xef\xdf\x8a\x82\xb4\x5b\x98\x5b\xbc\x6d\x7b\
-\xb1\x80\x95\x8b\xd6\x55\x13\xd6\x65\x84\xb6\x7d\x17\xc9\xed\x98\
-\x72\x20\x3a\xf0\xc1\xa8\xd2\xac\x95\xcd\x0f\x0d\x68\xe9\xe1\xa1\
-\x09\x24\x52\x29\x62\xa0\x4d\xb8\x6d\x76\x6c\x48\xa2\x26\xd3\x4a\
-\x50\xe5\xb7\xc1\xc5\x27\x18\xd6\xbe\x98\xf1\x3e\x40\xf8\x30\x6d\
-\x95\x89\x68\xb3\xdc\xbf\xdb\x17\x48\x80\xc3\x30\xe9\x84\xe9\x74\
-\x76\x7a\x09\x9a\x73\x4d\xbe\xaf\x63\xc1\x93\x92\x4c\x88\x80\xb0\
-\x3a\x33\x39\x9a\x97\x3c\xa3\x31\x6b\x66\x66\x4c\x5a\x53\xc2\x18\
-\xc4\x9a\x5c\x29\xcc\x8c\xe1\x9c\x9d\x0b\x5d\x58\x9d\x95\x52\x99\
-\xab\xdc\xbc\x2c\x25\x50\xa0\xdd\x78\x46\x62\xaf\x85\x28\xa3\xed\
-\x7d\x15\xe9\xc2\xde\x07\x7d\xe3\xf7\x24\x00\x2c\x90\x80\x17\x64\
-\xda\x1e\x3c\xcb\xc4\x92\x85\x6a\x3a\x0d\x80\xd6\xcd\x76\x6e\x1c\
-\x6e\xda\xd6\x93\xd5\x0c\x74\x89\x73\xd6\xcf\x02\xde\xe3\xf3\x30\
-\xcb\x8e\x52\x2e\x76\x45\x94\x50\x44\x34\xc9\x2e\x03\x0b\xad\xbf\
-\x73\x26\x4b\x6d\xc7\x9c\x3a\x93\x78\xc9\x06\x0c\x3a\xd6\x39\x1f\
-\xe8\x4c\xd7\x68\x6d\xe7\x78\xb3\xf3\xf7\x2d\x7d\x9a\xed\x7b\xd6\
-\xd9\x71\xa5\x5d\x5e\x58\x06\x0f\x1f\x58\x68\xbc\xd4\xca\xfa\x3a\
-\xa4\x52\xf9\xf9\x39\x31\xd0\xf6\x09\xc0\x12\x38\x5d\x9a\x71\x01\
-\x89\x70\x5f\x69\x18\xc8\xed\xdf\x6a\xec\x4d\xdc\x46\xe7\xa8\x56\
-\x1e\x41\xa6\x02\xa5\x5c\x5f\x70\x1c\xd4\x40\x01\xb1\xe8\x74\x8a\
-\x20\x96\x3a\x4a\x45\xf0\x74\x9e\xa6\x8a\x51\x14\x76\x40\xe5\xb9\
-\x13\xc7\x38\xcb\x2e\xea\x57\x44\x5b\x71\xc1\x00\x6d\xc3\x38\x88\
-\x9b\x4b\xda\x39\xfa\xcc\x6a\x3b\xcf\x6a\xcc\x23\x33\x73\x4c\x73\
-\x2c\x56\x10\xa3\x4b\x66\x2b\x12\xcb\x58\x62\x1f\x8d\x5b\x70\x2b\
-\x7f\x83\x24\xc6\x4d\x26\x06\xc0\xec\xf9\x73\x56\x64\x99\x0d\x1e\
-\x9c\x13\x70\x46\x34\x89\x0b\x24\x17\xe3\xa8\x0c\xaa\xfb\xcd\x12\
-\x6e\xbf\xcf\x91\x27\xbe\xd6\xae\xf4\x6a\x1c\x94\xc2\xe0\x99\x00\
-\xed\xdd\x79\x8a\xb1\xbc\xc8\x7e\x7a\x3e\x5f\x50\x6a\x6c\x59\x97\
-\x17\x0e\x20\x6f\x7e\x0e\xc8\x72\x81\x5e\xfb\x73\x3a\x75\x20\x17\
-\xde\x54\x1d\x98\x7e\xae\x37\xf5\xd4\x81\x4b\x60\x78\xe0\x3c\xc8\
-\xd0\x0e\x38\x02\xb9\x30\x40\x7a\x93\xc6\xb5\xce\x2f\x4a\x02\x0b\
-\x01\x23\x7d\xf2\xc4\xb2\x8f\x22\xb4\x05\xaf\xc6\x3e\x59\x9a\x72\
-\xa8\x14\xe6\xcd\xc3\xaa\x6f\x03\x34\xc0\x52\xdc\x92\x32\xe0\xa8\
-\x62\x1b\xa2\x7d\x08\xa1\xc1\x66\x14\x36\x55\x96\xe1\x50\xf0\x5c\
-\xc4\x9c\x6d\x6c\x1c\x5d\x8c\xa7\x1c\x05\x39\xbb\x29\x2f\xc8\x4c\
-\xe0\x13\x8d\x47\x25\x53\x84\xf8\x88\xe9\xcc\xb7\x1d\x24\x94\xf6\
-\x6d\x29\x8d\xe0\x30\xda\xcd\xf5\xe6\x5b\xe9\xbb\x04\x58\x51\xdb\
-\x9b\x30\xce\x61\x8c\xfa\x65\xd4\x75\x51\xd6\x57\x83\xcc\x75\xf9\
-\xd9\x19\x25\xca\x04\x9c\xad\xce\x58\xbf\xe7\x80\xf3\x11\x18\xe2\
-\x40\x05\x10\xe4\x1f\x39\xc0\x17\x76\x37\xc5\x6e\x43\x9e\xba\x8a\
-\x36\xa1\xbc\x4c\x96\x1d\xb4\xf2\xb5\x5b\xb9\xa2\x48\x16\x61\x50\
-\x6c\xb2\xed\x1b\xcf\x66\xd3\x99\x28\xcc\x8d\x01\x9a\xb4\xb1\x4a\
-\x53\x5b\x6b\x9f\xc0\xba\xfc\xce\x8c\x79\x20\x6c\x34\x75\x7e\xcf\
-\x8d\xdb\xbe\x05\xc5\x01\x4c\xe2\x13\x5f\xe3\xd3\xaa\xa0\x2b\x9f\
-\xca\xf8\x08\x8b\x76\x09\x1c\xf3\xc0\x91\x18\x93\x95\x69\x4a\x62\
-\xfd\x1e\xc0\x33\x4c\xb4\x49\x33\x01\xe5\x80\x73\x7d\xab\x2d\x03\
-\xad\x49\x4f\xa6\x37\xd8\xd6\xd6\x49\x0d\x24\xc1\x6e\x62\xce\x85\
-\xeb\xaf\x8c\xc2\x65\x21\x94\x0b\x11\xf0\xf8\xce\x1b\xc7\xe7\x08\
-\xf9\x29\xe7\x36\x31\xce\xeb\xe6\xe7\xfc\x1f\xab\x99\x64\x0e\x5d\
-\xf1\x83\x69\xc5\xfc\x9c\xa4\xa9\xf3\x99\xce\xfc\x6c\xba\x81\xb9\
-\xce\x04\x9d\x7b\xc0\x98\x15\x6a\x57\x22\xad\x72\x66\xae\x94\x17\
-\xba\x16\x60\xd1\xdc\xe2\xe2\xc2\x82\x37\x9d\x92\xff\x23\xa6\xd6\
-\x82\x86\x76\x6d\xce\x1d\x2b\x8d\xf0\x52\xa3\xfc\x1f\x54\x01\x92\
-\x04\x6b\x61\xd0\xa9\x0e\xeb\x75\xc5\x04\xc2\x62\x3c\x78\xfd\xd6\
-\x42\x7f\xfc\x93\x74\x29\x82\xa4\x5f\x86\x7c\x96\x66\xd6\xec\xb4\
-\xcf\xcd\x2a\x95\x95\x7a\xa4\xd4\x9e\x45\xca\x27\xbb\xde\x54\xab\
-\x91\x57\xba\xf9\xd4\x37\xf9\x9b\x37\x67\xea\x57\xf7\xb8\x8e\x6d\
-\xe5\x0e\x48\xf9\x7f\x8b\x52\x14\x63\xae\x4b\xf8\x3c\x45\xac\x73\
-\xf7\xf7\x09\xb3\xd5\x15\x61\x9e\x89\x66\x9e\xf1\xf8\xd3\x69\xa8\
-\xb9\xd6\xc6\xe0\x04\x72\x41\x6d\x73\xc1\x28\x0a\x75\x12\x05\xfa\
-\x7d\xe4\x82\x1f\xb2\x0f\x65\x0b\x40\x7a\x78\x82\x92\x4d\x82\x92\
-\x95\x29\x88\xc2\x0f\x5c\xcc\x2e\x2e\xf6\xb6\xf7\xf6\x61\xfc\xc4\
-\x1c\x03\xa0\xf7\x6d\x25\x78\x2e\xc1\x35\x07\xc0\x40\xaf\xb2\x3b\
-\x70\xc9\xb0\xd5\x90\xda\x86\xdf\x8b\x9d\xeb\xcd\x1c\x5a\x9a\x31\
-\x07\x58\x0d\x3c\x1a\x67\x0e\xc4\x32\x80\x64\x14\x2c\x88\x85\x69\
-\x6a\xcf\xbb\xb9\x90\xa6\x06\x60\x2d\x9f\x48\x22\x94\xe2\x94\x0b\
-\x62\xf0\x26\x41\xe2\xa8\x59\xd0\xb9\x22\x1e\xb1\x79\x3a\x67\xfc\
-\xc9\x15\x15\xe9\x6d\xc6\x7a\xc0\xe9\xe4\xf4\xfc\x68\x47\x88\xe3\
-\x4b\xad\xf7\x4c\xc9\xc8\xfa\x22\x6b\x7a\x6e\xff\xdb\xcc\xdb\xca\
-\x3e\x26\xd4\x77\x0c\x5a\x5b\xbf\xe6\x9c\x7e\x95\x85\xb5\x1c\x4e\
-\xbb\xf3\x04\x8a\xc5\xa7\x2a\x52\xd6\x40\x74\xff\x5e\x76\x74\x64\
-\xd3\x95\xd9\x8c\x80\xa4\xf3\x56\xea\x80\xf9\xb6\x1f\x6f\x9d\x13\
-\xe4\x07\xc7\x93\xc8\x27\xd0\x14\x86\x83\x03\x98\xb1\xcf\x05\x91\
-\xca\xa0\x6a\x45\x66\x5e\xd4\x00\x3c\x39\x39\xe1\xfd\x87\xfd\x6c\
-\x78\x30\xea\x9b\x8b\xbb\xdd\xe3\xf1\x32\x55\xd8\x80\x0b\xb0\xc1\
-\x6d\xe4\x3d\x70\x16\x44\x0f\x9a\x63\x10\x01\x26\x95\x6b\x5b\x30\
-\x7d\xbd\xaf\xca\x42\x1f\x65\x9b\x01\xc5\x3b\x1a\xcb\x4e\x8d\x56\
-\x03\x3c\xec\x6b\x4d\x62\x9c\x43\x2b\x68\x80\x4e\xc1\xc3\xfb\xba\
-\x36\xf3\xbc\x38\x76\x36\x80\x0c\x30\xae\xce\xc7\xa1\x31\x65\xce\
-\xf6\x99\xa6\x28\x2c\x6b\xb9\x20\x3e\xab\xf6\x56\xae\x5a\x9e\x59\
-\xd8\x27\x63\xec\xfc\xf8\xf8\xc1\x78\x71\xa9\x91\x4c\xbb\x4a\x07\
-\x05\x01\x88\x0d\x18\x4e\x5c\xe2\xeb\x9c\xbf\x4b\x78\xdd\x38\x16\
-\x56\xe6\x77\xa6\x6f\x25\x73\xb9\x5c\x79\x7d\x0e\x6d\xcd\xd5\x89\
-\x35\x5f\x88\x03\xd5\xf9\x3a\x6c\xc9\x28\x50\x10\x80\x46\x6b\x8a\
-\xb8\x93\x09\x81\xe7\x80\x6f\x81\x27\xd7\x00\xa9\x1b\xcc\x0c\x34\
-\x2d\x77\x19\xd4\x9f\x26\x0a\x1e\x08\xb6\xbf\xe6\xf1\xae\x67\xe0\
-\xce\xce\x8e\x26\x2d\x63\x39\x8f\x82\x68\x14\xdc\xb8\x71\x3c\x59\
-\x2c\x84\x42\xe5\x96\xa3\x20\xa6\x4e\x4f\x6d\xd4\x75\xfe\xc7\xfa\
-\x37\xb7\x40\xe7\x8f\xda\x3e\xaf\x34\x7f\xfc\xd7\xfa\xb5\x4a\xfe\
-\xc7\x2a\x0b\x63\x55\xd3\xac\x8c\x39\xa6\x4b\x0b\xa8\xdf\x92\xc1\
-\xdf\x61\x8f\x6b\xfd\x65\xdd\x6c\x5f\xda\x7c\x75\x03\x48\xa1\x35\
-\xfd\x3b\x1c\x95\xf4\x80\xf5\xba\x3e\x17\xb4\x87\x2d\x6b\x6d\x06\
-\x09\x35\x6b\x0c\xf4\xa9\x4c\x39\x58\x08\x16\xed\xed\x3e\x7b\xf2\
-\xe3\x1f\xf3\x65\xb9\x43\x60\x86\x51\x25\xb3\x68\x01\xe5\xa6\x5d\
-\xd9\x3e\xe4\xd2\xce\x33\x63\x2e\x0d\x49\xad\xb6\x85\x02\x5f\xab\
-\x23\xad\xb5\x07\xd3\xf9\xc6\x36\x0b\xad\x69\x92\xce\x32\xf2\x75\
-\xd4\x37\x7e\x2f\x7b\xf1\xc2\x5e\xb3\x02\x3c\x56\x05\xc9\xc9\x9a\
-\x3e\xab\xb4\x45\xe9\xd8\x14\xe5\x82\x8d\x43\x08\x75\xf3\xe5\x1e\
-\xac\x83\x68\x8b\xed\xc5\xf9\xf0\xad\xb7\x8e\xf2\x4f\x3e\xd1\x0b\
-\xa9\x78\x6c\x3e\xf1\x65\x59\xe4\xac\x54\x8a\x0b\x6f\x62\xb5\xc0\
-\xe0\x93\x5e\xb7\x20\xcf\x2c\xad\xbd\x86\x54\xc7\x52\x80\xfb\x18\
-\x7b\xd6\xe7\xc8\xe3\x3a\xe8\x77\xa2\x88\x8d\x06\x03\xe4\xb5\x5b\
-\xce\x6c\x2d\xfb\xb2\xac\x09\x5e\x4b\x54\x5d\xfc\x36\xce\x33\xb3\
-\x05\x2c\x73\xf9\x21\x52\x19\xb1\xbf\xeb\x46\x3e\x67\x21\xa5\x32\
-\xd9\x85\x66\xef\x73\x9b\xca\xb4\x00\x9c\xcf\xe7\xf9\x70\x38\x8c\
-\xa9\x1d\xf4\x7b\x05\x8b\xe3\x39\x72\xc1\x01\xd8\x63\x2a\xd2\x6a\
-\xbe\x20\x96\x58\x71\x45\x51\x1f\x38\xfc\x58\x13\x28\x3b\xe0\xda\
-\xb4\xf8\xda\x1c\xea\xfd\x8f\x9f\xfd\x8c\x7d\xf2\xe8\x11\xeb\xf6\
-\xfb\xec\xe6\xaf\xfc\x8a\x39\xb7\x84\xdb\x38\xfb\xd1\x8f\x58\x1f\
-\x40\xee\x75\xbb\x2c\x2a\x8b\x08\x6c\x3d\x70\xed\x64\x79\x2d\xfb\
-\xfc\x1c\x3a\xfc\xe3\x51\x1c\xa8\xca\x70\xcd\xb6\xd1\x3b\xb2\xec\
-\x13\x3a\x57\x8a\x85\x4a\xa0\xac\x25\xe7\x57\x33\x70\x9b\xac\x30\
-\xe7\xb0\x1b\x84\xa5\xf0\xf4\xf4\xc9\xe3\xc1\xee\xcd\x5d\x9b\x6f\
-\xd1\xbe\xd2\x3d\x0f\x71\x4f\xc1\x0a\xd9\x8c\x9c\x3e\x42\x57\xfa\
-\xba\xc1\x42\x37\x57\xa2\xfd\x97\x00\xe9\x09\x18\xf6\xc5\xef\x7c\
-\x87\x6d\x7d\xe5\x2b\x8c\x07\xde\x8f\x93\xef\x5d\xfe\xe9\x9f\xb2\
-\xf3\xef\x7f\x9f\x6d\x52\xa4\xf4\x60\xbc\x1c\x88\x2e\xea\x3a\xf6\
-\xad\x9b\xeb\x2a\xa7\x26\x17\x9c\x05\xf5\xd7\xbf\x14\xb1\xf0\xd8\
-\x0f\x3c\xa9\x47\xe1\x6a\x2a\xb3\x5d\xb6\x8f\xcf\x5f\x3c\xd5\x49\
-\x72\x3c\xbe\x5c\x6a\xfb\xd4\xbf\xdc\x12\xf9\xc8\xe9\xab\x1f\xed\
-\xc8\x69\x4d\xc6\x07\x8c\xd5\xfe\x0d\xf2\x3f\x3f\xfd\x94\x3d\x41\
-\x14\xfd\xa5\x3f\xfa\x23\x76\xe3\x6b\x5f\x2b\xc1\xf3\x47\x70\xf3\
-\x26\xdb\xf8\xdd\xdf\x65\xc3\xdf\xfe\x6d\xa6\xfb\x7d\xbb\xc8\xf5\
-\xe0\xb5\x83\x44\x73\x5e\x3d\xfa\xd6\x02\x96\xd3\xc5\xf9\x85\x2d\
-\xbd\xf0\x7a\xf4\x6d\xd4\x05\x83\x95\x2f\x2e\x3e\x7c\x38\xcd\xa0\
-\x6c\xd4\x8b\xe2\xe7\xe7\x59\x2e\xc9\x74\x95\x8b\xba\xd0\xd5\x2d\
-\x94\xf2\xc0\x55\xaa\x31\xbe\x04\x8f\x73\x6e\x6e\x0b\x4c\xf2\x79\
-\x3f\xc2\x9e\xfb\xcd\xdf\xfc\x4d\x36\x78\xe7\x1d\xb6\xe2\xe5\x23\
-\x86\xf7\x52\x58\xa7\xd3\x61\xfd\xdf\xfa\x2d\xb6\xf9\xeb\xbf\xce\
-\x42\x98\xb3\x7a\x15\xe6\x79\x40\x57\xfa\x3c\x55\xfd\x30\x38\x37\
-\x91\x38\x87\x0f\x5c\x15\x2c\x94\x02\x4f\x91\x0b\xb6\xf2\xc0\x6a\
-\x2e\x08\x1f\x68\x74\xcc\x62\x7d\x71\xfa\xe2\x87\x53\x98\xb2\xcf\
-\xf0\x3d\xab\x14\x49\x83\x59\xca\x47\x4e\x92\x5a\xfe\xa6\xac\x78\
-\xd0\xa1\x7f\x76\x7c\x6c\x72\xce\x5b\xbf\xf1\x1b\xcd\x1c\x0b\xee\
-\x37\x76\xe0\x79\xfd\xab\xbf\xca\x06\x07\x07\x8c\xad\x02\xac\x2e\
-\x2f\x15\x99\x95\xad\x77\x3a\x46\x1a\x11\x90\x2c\xcd\x82\xfa\x2b\
-\x30\x01\xd3\x65\x2e\xd8\xb3\xbb\x11\xf7\x77\x0a\x03\x60\x2b\x17\
-\x9c\xca\x39\x3e\x7d\x9e\xec\xee\x1c\x2d\xf2\x3c\x90\x00\x83\x77\
-\x3a\x6e\x3b\x55\x05\xce\x83\xd2\x4e\x7c\x1d\xc8\xe5\x1c\x0f\x9e\
-\x9b\x97\x22\xcd\xd9\x78\xed\x35\x16\x20\x40\x54\x0f\x07\x1e\xc4\
-\x81\x67\x24\xfe\xd2\x97\xd8\xe0\xdd\x77\x59\x64\x17\xbc\x5e\xb4\
-\x76\x3e\xed\xca\x20\xe2\x21\xf2\xe3\x9c\x4c\x18\x02\x3f\xe8\xb6\
-\x74\xb7\x2b\x7f\x99\x23\x5b\xd2\x62\xa0\xcf\x05\x2b\xd3\x6f\xdd\
-\x7a\x76\x8a\xc8\x38\x73\xf9\x98\xdf\x31\xb4\xfd\x9b\x03\x8b\xc6\
-\x3d\x48\x4e\xfc\x98\x1f\x37\x0f\x78\x3a\x5b\x5b\x2d\xf0\xa2\x28\
-\x22\xdd\x02\x90\xda\xf1\x60\xe0\xc1\xb8\xce\x84\xbd\xcf\xbb\x86\
-\xa5\x1e\x44\x41\x00\x42\xa3\x2a\xb3\x45\x70\x5e\x93\x0b\xb6\x7d\
-\xa0\x7b\x07\x64\xb1\x58\x9c\x27\x77\xde\x38\x13\x41\x20\x17\x42\
-\x50\xd0\xa0\x1d\x89\x07\x8f\xc0\x5a\x03\xa6\x03\xd2\x81\x29\xab\
-\x73\x31\xcf\x95\x9f\xba\xd0\xea\xa9\x4b\xf4\xed\x16\x12\xcc\x5f\
-\x0b\x62\x17\xe7\x31\xa7\x59\x2c\x68\xb3\xef\x25\x4c\x9c\x79\xed\
-\xdb\x1e\x70\x53\xd6\xf2\xee\x4d\xbd\xd6\x7e\xa1\x7d\x27\xf2\x00\
-\x36\x72\x41\xd2\x54\xd6\xc2\x8d\x54\x14\xc7\xe3\x73\x64\xfd\xee\
-\xe6\x60\xa2\x07\xcf\x07\x86\x3a\xfb\x3c\xa0\x1e\x38\x67\xd2\x59\
-\x66\xb7\x63\x00\x70\x07\x60\xc9\x67\xcf\x58\x86\x48\xec\x82\x86\
-\x13\x07\x20\xc4\x03\x88\x7b\x65\x0f\x1e\xb0\xec\x7a\xf0\xd6\xb1\
-\xd4\x17\x52\x1b\x2c\xe4\x0e\x44\xce\x69\x8c\xab\xc9\x2c\x44\xe3\
-\xa6\x67\x9f\xd0\x05\x34\x96\x3f\xa2\xfe\xe6\x66\x5f\x3b\x00\xd7\
-\x1e\x67\xe3\xb3\x43\x9e\x24\xcf\x11\x48\x3c\xcb\x82\xa0\xc6\x26\
-\x48\x3d\x58\x38\x30\xbd\x3f\xf4\x0f\x7a\x68\xcb\x57\xa6\x40\x12\
-\x20\x46\xd8\x59\x6c\x00\xa0\xf1\x9f\xfc\x09\x99\x0e\xb1\xcb\x09\
-\x81\x68\xb4\x03\xb2\x03\x51\x7f\xf5\x57\xec\xe4\xc7\x3f\xb6\xc1\
-\xe0\xba\xa0\xd1\x66\xa0\xcf\x41\xaf\x66\xa0\x05\x78\x32\xa9\x47\
-\x62\xcd\x6f\xaf\x48\x65\x5c\x10\x69\x99\x71\x46\xe1\x26\xcb\x32\
-\x2e\xe3\xe8\x78\x0a\x0e\xeb\x3c\x6f\x9b\xaf\x8f\xae\xae\xef\xc5\
-\x47\x65\x12\x17\x95\xa9\xe8\x49\xfb\x58\xda\x9a\x19\xd3\xbe\x43\
-\xf7\xfb\xe1\x0f\xd9\xf2\x8f\xff\x98\x09\xf4\x85\x10\x4e\x08\x40\
-\xab\x31\x07\xdf\x80\x61\x67\x7f\xf0\x07\xec\x4c\xeb\x6b\xc1\xd3\
-\xeb\xc1\x5b\x1d\x44\x30\x5e\x39\x6c\x2a\x73\x7e\x11\xb2\x32\x17\
-\x24\x46\x92\x38\x44\xab\xa9\x8c\x07\xb0\x51\xd6\xea\x95\x31\x27\
-\x88\x93\x9f\x8f\x01\xa0\x61\x8f\xab\xba\x40\x1a\x00\x79\x20\x9d\
-\x9f\x93\xd2\x97\xc1\x20\x60\x9d\x79\x56\x91\x9f\x9e\x9a\xbd\xac\
-\x63\x74\x08\xbd\x07\x91\x7f\xf1\x17\x2c\xfd\xbd\xdf\x63\xfc\x6f\
-\xfe\x86\x09\x00\xcc\x61\xe2\x1c\x0c\x0d\xf0\x32\x64\xf6\x67\x7f\
-\xc6\x1e\x7f\xfd\xeb\xec\xef\x1e\x3f\x66\xb2\x0d\xde\xd5\xbe\xee\
-\x1a\x90\xf9\xaa\x48\x0c\xc9\xe6\x8b\x08\x0d\x5e\x81\xa9\x96\xca\
-\x8c\xc7\x73\x7e\xed\x4b\xe6\xc4\x80\xf9\xf2\xf2\x61\xa2\x99\xf8\
-\x3c\xfa\xd2\x09\x5f\x56\x6f\x3c\x52\x6c\x15\x0f\x2c\xa8\x60\x9d\
-\xb4\x15\xe3\xfa\xfb\x7a\xe5\xf5\x31\x3d\xfd\x23\x13\xff\xc1\x0f\
-\xd8\x02\x41\x45\xec\xec\x30\x81\x1d\x08\xc7\xf8\xf9\xc7\x1f\xb3\
-\x19\xaa\x2f\xe7\x57\x30\x4f\x5d\x13\x91\x59\x1b\x3c\x0f\xda\xea\
-\x2f\xcf\xd0\xcb\x55\x9c\xe5\x90\x28\xa4\xca\xf4\x01\x6b\xd4\xf2\
-\xb5\xbe\x9d\x60\xef\x96\xaf\x05\x50\xc2\xcb\xc7\x71\x6f\x4b\x6c\
-\xdf\x38\xca\x8f\x4f\xc4\x52\x4a\x72\xe6\x16\x04\x0b\x66\x0d\x2c\
-\xf4\x9b\x75\x3c\x5f\xea\x22\x9f\xe7\x2a\xc6\x68\x57\xaf\x55\x95\
-\x0f\x80\x43\x2f\x91\x5c\xa7\x10\x5e\x9e\x2b\xd6\xe7\x7a\x2f\x97\
-\xce\x94\x89\xb2\x3b\xd6\x03\xe9\x4d\x99\xbb\xf7\x66\xa6\xd3\x1b\
-\xe2\x86\x7f\xc4\x59\xad\x0b\x32\xb3\x2b\xbf\x67\xb9\xb9\x2e\x17\
-\x04\x7b\x74\x74\xfb\xe0\x70\x8c\x05\x51\x2e\x08\x33\x76\xc9\x74\
-\xdb\x7c\x7d\xb0\x70\xe5\x75\x6b\xaa\x74\x9d\x67\xa0\x07\xfa\x8a\
-\xfd\xaa\x84\xe4\x7f\x0f\xf0\x58\x9b\x79\x6d\x69\xb2\xae\x4e\x2f\
-\x26\x6d\x5d\x30\x6c\xd7\x05\xc3\x9b\x54\xd6\xf2\x3e\xf0\x8a\xa3\
-\x28\x96\x17\xe1\xce\xcd\x59\x20\x44\x3a\x77\x65\xa8\x4e\x87\x74\
-\x6b\x27\x02\xe0\xea\x01\x83\x34\x95\xdb\xa9\x8e\x47\xef\x24\x2b\
-\xb5\xca\x04\x1d\xa0\xd7\x89\xaf\xe9\xbd\x0a\xf3\x1a\xac\x93\xed\
-\x79\x1e\x68\x88\x3f\xca\xea\x4c\x1d\xc0\xdb\x2b\xbe\xdc\x18\x19\
-\x00\xdb\x05\x85\x87\x85\x37\x65\xc9\x82\x24\x3e\x3b\x07\x10\x06\
-\x94\x7a\xaa\xe2\x80\xf3\x0c\x84\xa6\x3c\x2f\xa7\x67\x16\x10\x98\
-\xac\x5f\x50\xa3\xc0\x09\xfd\xb2\xb2\xbe\x64\xef\xdf\xb0\xf2\xa2\
-\xb5\x1f\x73\xe7\xfd\x5c\x2f\xd5\xfb\x37\xac\x81\x34\x95\xb5\xa8\
-\x2e\xd8\x26\x56\x3c\x5a\x5b\x0f\x6c\x27\xd6\xd3\xa3\x30\x8e\x9f\
-\xcd\xb5\xbe\xa5\x1d\x48\x42\x18\x73\x64\x8d\x52\x90\x24\x13\x75\
-\xdf\xe3\x80\xae\xe4\x89\xcd\x32\xd4\xab\x48\x95\x75\x6d\xdd\x2c\
-\x9a\x12\x78\x9c\x93\x78\x10\xa9\xed\x2b\xd1\x4e\xbb\x97\x2c\x6b\
-\x62\x0e\x77\x9f\x8b\x0b\xb2\x55\x6e\xfb\xe4\x1a\xfd\xeb\x6e\xd7\
-\x9a\xf0\xf1\x71\x96\x92\x5e\x2a\xa5\x75\xa7\x73\x3c\x01\x3e\x0e\
-\x14\x67\xba\x12\x62\x34\xf9\x39\xfb\x80\xdb\x06\x0a\x8c\x15\x8d\
-\x80\xa1\x5b\xac\x5b\x6f\x7e\xb2\xc2\x9a\x1c\xd7\x38\x10\x72\x08\
-\xe9\x8c\xda\x4e\xea\xcc\xf3\x6d\xef\x47\x5b\x4c\x95\x76\xae\x1d\
-\x83\x5e\xb7\x37\x4e\xc7\x93\x98\xad\xa9\x0b\xc6\xb1\x1c\xb4\x00\
-\x5c\xf7\x2d\xed\xcb\xd9\xec\xe3\x89\x94\x1a\x0c\x73\xf9\x9f\xfb\
-\x8a\x81\x4f\xa8\xcb\x17\x78\xf2\xf9\xdc\x30\x50\x7b\xb0\xd6\xfa\
-\x3a\x55\x05\x0a\x92\x91\x26\x21\x90\x5c\xdf\x01\xe6\xce\xf9\xf9\
-\x90\x06\x58\x25\xc0\x12\x62\x80\xf2\x6d\x37\x5e\x7d\x37\xda\x8b\
-\xf3\x81\x8d\xe0\x92\x5d\x2e\x45\x95\x6a\x98\xc3\x4d\x2e\x18\x5f\
-\xc9\x40\x5f\xd6\x9a\xc6\x72\x2e\x84\xe0\xc1\xc6\xf0\xd9\x42\xca\
-\xc0\x04\x87\x28\xfa\xfc\x49\x99\xf6\x6c\x34\x7e\xaf\x98\x4e\xc9\
-\x4f\xfa\x4f\x95\xf4\x1a\x5f\x27\xdb\x0b\x77\x2c\xf3\xac\xab\x03\
-\xe6\x59\xd8\x94\x06\x90\xf9\x1a\x3f\xa7\x1c\x23\xeb\xe2\xcc\xb7\
-\x9a\x52\x59\x00\x95\xe2\x1a\xcf\x89\xd1\xa5\x19\xb7\xcb\x73\x9c\
-\xb9\x79\x9b\x3a\xf1\x00\x5e\x51\xd6\x8a\x76\x76\x9e\xcd\xce\xce\
-\xf8\xcc\xf9\x37\x00\xe8\x52\x17\xb0\x92\xc6\xac\xce\xf3\x7a\xd1\
-\xb4\xe1\xb3\x3c\xd3\x20\x8e\x59\x4d\x76\x59\xf0\xec\xb8\x07\xb5\
-\x05\x94\x74\xd7\x68\xed\xcd\xd9\x31\x70\x8d\x38\xf0\x30\xa7\xed\
-\x4a\x2a\xfe\xd0\x25\xd3\x2e\x17\x6c\xe2\x43\x6f\xee\x93\x1e\x79\
-\x06\xae\x3f\x72\x9d\x5f\x04\x6f\xbc\x6e\x5e\xfd\x9f\x95\x0f\xcf\
-\x9d\xe9\x4a\x08\xf5\x8b\xcf\x5f\xb9\xcd\x2c\xb0\x75\x13\xf5\xe6\
-\x78\x0d\x6b\x20\xab\x41\x35\xba\x3d\xaf\x70\xec\x6d\xf8\xcd\x76\
-\x04\xf6\x91\x59\x56\xfd\xac\x37\x6b\x1f\x40\x2a\x01\x4f\xda\x54\
-\x26\x80\xc2\x90\x7d\x5b\xeb\x8a\xe7\xc2\xed\xb2\x56\x7c\x18\x27\
-\xbd\x9b\x3d\x26\xfa\xbd\x3c\x0c\x82\xe9\x42\xeb\xa1\xab\xc8\x68\
-\xf2\x87\x36\x78\x58\x56\x4a\xb9\x32\xbd\xd0\x9c\xd7\xfb\x4e\x7b\
-\xf3\x69\x07\x97\xa6\x79\xb5\xd9\xe2\xab\xce\xeb\x83\x91\xf7\x79\
-\xfe\x99\xf0\x4a\x61\x4d\x16\xfa\x76\x99\x4c\xfb\xb7\xb5\x38\xe7\
-\x96\xa8\x49\x6f\xf3\x82\xa5\xb3\xeb\xd2\x18\xbf\xcd\x0a\xc3\x93\
-\x8b\xc5\x62\x78\x3b\x49\xec\x82\xdd\xce\xc4\x9b\xb3\x03\xc9\xa7\
-\x0b\x4d\x30\x9b\xe7\x6c\x40\xba\x1e\xb0\xf6\xb3\x8c\xeb\xde\x36\
-\x70\xf7\xf7\x01\xa3\xf9\xef\xfb\x0f\x78\x75\x91\xd5\x05\x17\x5f\
-\x58\xad\xbf\xb9\x4f\x26\x95\xbe\xe4\x57\xfe\x97\xcb\xc5\x73\xd5\
-\xe9\x1c\xce\x16\x8b\xb7\xc0\x40\x6e\xcc\xb5\x34\x67\x09\x29\xca\
-\x44\x5a\xba\xc5\x37\x5e\xe8\x91\x75\x40\xeb\x11\xba\x09\x76\x9d\
-\x9d\xed\x24\xb7\x7e\xfe\xfa\xdd\x8b\x97\xda\xdf\xa7\xab\xed\x8a\
-\xb0\x86\x29\x67\xa7\xe7\x51\x52\x22\x4b\x97\xf8\x2d\x5d\xa1\xd7\
-\x99\xb0\x7f\xdd\xad\xdf\x4f\x7b\xac\xd7\x33\xd7\xc7\xf1\xd1\x78\
-\x36\x93\xc5\x72\x19\xba\x32\x7d\xe6\xde\x86\x5f\x6f\x1e\xfe\xd3\
-\xf6\x20\xf8\xf1\x35\xec\x52\xab\x1f\x8c\xaf\x7f\xb6\xc1\xf9\xfa\
-\x12\x97\x4f\xa2\x3d\xa8\x6d\x17\xe2\xef\xa3\x75\x0d\xc4\xe5\x74\
-\x16\x0e\xb5\xcd\x05\xd1\x7f\xaa\xe9\x10\x4a\x0b\x6b\xce\x7d\x13\
-\x44\xae\xcb\x05\x33\x48\x21\x8b\x4f\xe6\xb8\x86\x18\x97\x2b\x65\
-\x9e\xe9\x16\x3e\x72\xd6\xf3\x32\x1f\x15\xbd\x33\xf7\x09\x31\x89\
-\x75\xe2\xbe\xdf\x4e\x8c\x7d\xb0\xf1\xda\xb2\xc8\x4b\x33\x20\x35\
-\xaf\xf5\x01\xa6\x95\xff\xc9\x66\xf2\xdd\xce\x0f\xad\xf5\xe5\xb9\
-\x28\x3f\x11\xf3\x4e\xb3\x10\x42\xc1\x8c\xf7\x32\xfb\x3b\x35\xfa\
-\x5a\x13\x5e\xa0\xac\x35\x8a\x46\x1b\x0a\x5f\xc2\x5b\x9e\x9e\x05\
-\x97\x00\x8e\x07\x81\xd9\x85\x64\x36\xe7\xab\xb3\xad\x69\xba\xce\
-\xd9\x57\x59\xba\x8e\x69\x55\xb3\xf2\xd7\xb5\xfd\xdc\x6a\xe6\xd5\
-\x9e\xf1\x32\x0f\x9a\x07\x66\x0d\x23\x75\xf5\x83\x6a\xac\x21\xa7\
-\xf6\x1c\xe9\xf0\x60\x80\x4b\x05\x55\xa7\x1f\xe3\x4c\x81\x5a\xa9\
-\x0c\x79\xa6\xd7\xa6\x31\xf6\xf7\xa3\xfc\xa1\x77\x76\x9e\xe6\x08\
-\x1a\x53\xc3\x46\x6b\xbe\xa4\x1d\x2b\x0a\x92\xd5\x5b\xb0\x7a\xc2\
-\xbc\x9e\x81\x35\x26\xd8\x39\xbe\x2f\xab\xd7\x36\x59\x54\x5a\x49\
-\x2a\x04\x5b\x62\xfc\x12\x32\x87\x2c\x20\x4b\x12\x21\xbc\xa0\x9f\
-\x39\x41\x3f\x2f\xa5\x80\x78\x57\xe4\xd3\x9a\x02\x5a\x8f\xcd\x23\
-\x4e\xa9\x99\x4e\x61\xb7\x29\x57\x82\x00\xd8\xca\xf3\xab\x19\xe8\
-\x4d\x78\x96\x4d\x92\xb7\xee\x9c\x16\x7f\xf9\xdf\xe4\x58\xa9\x20\
-\xcc\x73\xbb\xe8\x66\x00\xf0\x8c\x6b\xbf\x4a\xb6\x9a\x7d\x6d\xbf\
-\xb4\x26\x48\x28\x0f\x64\x33\x92\x7b\x76\x57\xe7\xaf\x8b\xd6\x2b\
-\x02\x09\x23\xdd\x60\x2a\xaf\xb0\x18\xbb\x91\x02\xec\x5e\x60\x1e\
-\x95\xd4\x29\x89\x7e\x1c\x86\xc1\x32\x4d\x55\xe1\x01\x5c\x53\xd6\
-\xfa\xe5\xbd\x77\x93\xd4\x66\xdc\x4a\x84\xc1\xf9\x64\x99\xde\xdc\
-\x20\x76\x51\x11\xc1\x55\x34\x5c\xba\x70\x3d\x70\xbe\xdf\x34\xdd\
-\x46\x70\x29\x6a\xfe\x6a\x7d\x6e\xa9\x85\x58\x0d\x8e\x4b\x45\x7c\
-\x7d\xaf\x15\x78\x58\x15\xc4\x46\x24\x56\x10\x56\x7e\x9b\x3d\x38\
-\xd8\xbb\x00\xa2\x43\x8c\xfc\x5c\x31\x7e\xa1\x85\x9c\x31\x11\xc2\
-\xc8\x64\xf7\x5a\x06\xfa\x40\xa2\x4e\x59\x18\x3e\x9b\xb3\xf4\x66\
-\x4e\xbe\xcf\xf9\x3f\x88\x5b\xe4\x2b\x01\xc7\x79\xbd\x2a\x22\x44\
-\xcb\x5f\xc9\xd5\xf9\x5b\xd3\x2f\x7a\x70\xa0\x9b\x00\xe1\x5c\x13\
-\x9c\x56\xdb\x01\xa9\x2a\xd5\x69\x01\xe9\x73\xae\x6f\xfd\xcb\xf7\
-\xcf\x78\xaf\x37\xc1\x8c\x63\xad\xf9\x73\xf2\x0e\x5a\xf1\xa1\x28\
-\xf2\xa3\x3c\xcf\x97\x1e\xc0\x35\x45\x05\x2a\x6b\x8d\x46\x36\x95\
-\x51\x49\xe7\x70\x3e\x99\xde\xc5\x85\xa2\x91\xa4\x3a\x59\xcb\x40\
-\xd9\xd8\x3e\x01\x38\xef\xcb\xda\x6c\xa3\x73\xf5\x1c\xb1\x0d\x50\
-\x9d\x79\x5e\xd7\x99\xe5\xcf\x19\xe1\x1e\x20\x23\x91\xd6\x2c\x14\
-\x82\x25\x71\xac\xba\xa3\xcd\x22\xd8\xda\x2c\xc4\x70\x58\xf0\x8d\
-\x61\x11\xec\xed\x8d\x45\xa7\xf3\x14\x57\x3f\x61\x1a\xcc\x63\xac\
-\x0b\x4b\x99\x69\x2e\x4e\x64\x21\x66\x45\x71\xb9\xde\x84\x35\x8e\
-\x6f\x7e\xf3\x9b\xd5\x27\x74\x5a\xf6\x3a\xc7\xf3\x20\x50\x52\x29\
-\x61\x80\x70\xd1\xb6\xc5\x32\x17\x04\xbc\x96\x4e\x6b\x6d\x1d\xb3\
-\x1f\x5f\x0d\xbc\x1f\x6b\xfb\xad\xb6\x76\x11\xdb\x33\x08\xed\xd0\
-\xbe\x79\x4f\x1a\x00\x45\x3a\x01\x30\xf1\x8d\x2d\x29\x86\x03\xc9\
-\x87\x1b\x0a\x20\x29\x80\x35\xe6\xdd\x8e\x22\x27\x52\x32\x55\xe3\
-\xfa\x17\xf8\x8f\x44\x67\x46\x89\x88\xe5\x0a\x3f\x53\x5a\xfd\x4c\
-\x68\x76\xa8\xb8\x5a\xe8\x48\x47\xc3\x61\x3a\xbd\x92\x81\xee\x75\
-\x37\xca\x77\x58\x96\x12\x8a\x9f\x20\xda\x89\x32\xaf\xf3\xcc\xf0\
-\xf9\x9b\x37\x45\xd7\x77\x63\x1e\x1c\x37\xd6\x60\xae\x07\x55\x37\
-\x41\xf4\xbe\xd5\xb3\x08\xda\x30\x08\x12\x40\x62\x7c\xc0\x71\xbf\
-\x27\x3b\x04\xd0\xc6\x10\x00\x01\x1c\x92\x8d\xc1\x94\x0f\x86\x39\
-\x31\xb1\x7a\xe0\xee\x17\xa4\x75\xd9\x29\x99\x7b\xcc\x35\xd7\xf8\
-\xbf\x84\x96\xd0\x39\x78\x74\x8e\x09\x3f\xd5\x4c\x3f\x05\x78\x63\
-\xac\x49\x84\x4a\x2e\xf0\x91\x4c\xe6\x97\xfd\xec\x25\xb7\x72\xcb\
-\x45\xa7\xc3\x87\xc1\xe6\xe6\x13\xcd\x1e\x8b\x25\x2d\xa2\x64\x92\
-\xb4\xe0\x79\xb6\x55\x19\xe8\xfb\x55\x53\x6d\x9a\xa8\xbf\xce\x00\
-\xdd\x06\x29\x86\x18\x33\xeb\x76\x64\xb2\xb9\x21\xc3\xad\x11\x01\
-\x44\xa2\x09\x2c\x62\x11\xfc\xb3\xae\x3f\x61\x03\x40\xde\x9c\x75\
-\x75\x93\xe5\x06\x4b\xec\xe8\x7f\x87\x4c\x9b\x8e\xa2\x5e\x99\x34\
-\xe7\x1c\x71\x54\x2b\x3d\x61\x82\x2d\x28\x16\x2b\x21\xce\x02\x99\
-\x1d\xa5\x29\xbb\x48\xd3\x49\x8e\x9f\xe7\x93\x57\xfe\x00\x23\xc7\
-\xf1\xf5\xdf\xf9\x7a\xfc\xa5\xee\xad\x58\xc7\xdb\xbb\xec\xf1\xe1\
-\x9d\xe9\xf7\xff\xcb\x7f\x7d\x7d\xb1\xa0\xe8\x54\xcf\xd1\xac\x6e\
-\xf9\x3b\xd5\xac\xe9\x39\x90\x04\x45\x39\x61\xdf\x89\x21\x80\x70\
-\x2e\x4a\x12\x1d\x6f\x0c\x8a\x68\x0b\x2c\x02\x40\x64\x62\xc4\xa4\
-\x80\x00\x82\x99\xad\x62\xd0\x0a\x90\x4e\x88\x43\xe5\x2c\xa7\x50\
-\x8e\xf3\x6f\x11\x51\x7d\x54\xd8\xab\x9e\x5a\x77\xc5\x71\xb9\x33\
-\x61\xfe\x18\x98\x58\xa3\xc2\x12\x81\xe5\x0c\xd3\x2f\x35\x17\x4f\
-\x11\x49\xc7\x01\xb2\x97\x8b\x8b\x7c\x8e\xb7\xd7\x0a\xaa\x58\x5d\
-\xcb\xc0\xc1\xf6\x40\xcf\x9e\x77\x34\x2e\x9c\xf4\xf6\xf7\x4e\x51\
-\xd6\x3a\x79\x11\x45\x37\x77\xb2\x8c\x1b\xe6\xb8\xf2\xbb\x10\xb5\
-\x22\xa9\x44\x5f\x93\x94\xce\x3a\x28\xbf\x26\xd0\x1f\x0c\x64\x0c\
-\x06\x01\x1c\xe3\x87\x84\x05\x69\x22\x06\xfd\xc2\x9b\x59\x9b\x45\
-\x68\x3b\x90\x4e\xca\x2e\x37\xb3\x7c\x87\x40\xf2\x4f\xc6\x1d\x40\
-\x1e\x61\x6d\xb5\x1d\x57\xe6\x6f\x72\xa7\x98\x96\x5a\x1d\x0a\x2e\
-\xb4\xc0\x4d\x94\xa5\x55\x21\x60\xc6\x2a\x08\x8e\x78\x9e\x5d\x16\
-\x81\x40\xf2\x4b\x4c\xec\x80\x79\x5b\x19\xbe\xe5\x2f\xa9\xf0\x7c\
-\x2d\x80\xf8\xf9\xbb\xe2\xb0\x38\x0c\xf5\x86\x2e\x98\x0e\x8b\xe8\
-\xad\x37\xfe\xe3\xe2\xa7\x3f\xff\x0f\x3f\x8f\x22\xaa\xe7\x13\xa3\
-\xb0\x2c\x6b\x0f\x11\xfc\x50\x04\x33\xeb\x8c\x46\x32\x18\x6d\x48\
-\x31\x80\x0f\xda\x1c\x00\xa0\x4d\x65\xcd\x2c\xd0\xab\x59\xe4\x7d\
-\x91\x63\x91\xd6\xd5\x90\xa0\xa1\xf8\x33\x68\x5d\x35\x0f\x33\x87\
-\xb3\x27\xee\x0e\x0e\x24\x05\x80\x08\x1c\x4b\x2c\xae\xad\x5f\x95\
-\x9f\x83\x29\x94\xe0\x84\x9e\xa1\xb4\x54\xc7\xa4\xb4\x00\x74\x5c\
-\x69\x25\xd1\xd6\xe1\x69\x18\x4a\x5d\x28\x41\x6f\x05\x28\x11\xb0\
-\x34\x56\x9d\x62\xa9\x96\x0b\xfa\x6d\x89\x4f\x3f\xfd\x54\xb9\xaa\
-\xfd\x95\x00\x6a\x1c\xf6\x17\xdd\xbe\xa5\x0e\x2f\x63\x95\x06\xfa\
-\xac\xf3\xaf\xbf\xfa\x9f\xc5\xce\xcd\x17\xfa\xe4\xf4\xd7\x10\x54\
-\x46\x7c\x6b\xc4\x82\x9d\xed\x4d\xb1\x39\x5a\xf0\x5e\x77\x80\x25\
-\x44\xda\xdc\x57\x87\x58\xfa\x45\xed\x3d\xec\x0a\x40\xac\x61\x66\
-\xdc\x98\x19\xa7\xcf\xdf\x0c\x19\x68\xcc\x1c\xf5\x94\xb0\xaa\x02\
-\x44\x0e\x1d\xc2\x04\x9d\xa7\x19\x76\x9c\x30\x31\x20\x29\x05\x28\
-\x82\xf2\x13\x51\xea\x98\xd3\x39\x02\xa8\x3c\x14\x53\x1c\xc0\x9d\
-\x22\x10\xd8\x50\x67\xdf\xcf\x01\x78\xf1\x84\xf1\x39\x5b\xf0\x9c\
-\x45\xcb\x08\xab\xcf\x95\x1a\x0a\xc5\xc6\xec\x72\x73\x33\x91\xf8\
-\x59\x04\x0d\x00\xd5\x5d\xfc\xca\xd3\x9f\xff\xb9\xfd\x30\x0d\x59\
-\x5f\xe6\x57\x2c\xf1\x6d\xa1\x04\xe5\xad\x8e\xe8\x88\xfd\x50\x84\
-\x23\xc1\xf5\x4d\x2c\xf0\x17\xb1\x86\x00\x93\xde\x06\x4a\x43\xf3\
-\xe2\x12\x87\xd6\xea\x1c\x60\x44\x64\x63\x00\xc2\x30\xb4\x64\xd8\
-\xa1\x83\x90\xaf\x30\x33\x33\xcd\xb5\x2b\x2c\x62\xca\x04\x1b\x8d\
-\x7f\xa8\x04\xa8\x04\x9f\x26\x54\x58\x24\x4a\x90\x94\x52\x38\x1f\
-\x9d\xfa\x55\xa4\x95\x87\xe2\xc1\x64\x55\x90\x6c\xfc\xb8\xad\x26\
-\xdd\xeb\xf5\x52\xfc\x1c\x8c\x69\x5b\xe0\xee\x6a\xfc\x44\x8c\xf6\
-\xd5\x2a\x0f\xe0\x75\x20\x8a\x6f\x7d\xeb\x5b\x31\x7d\x8b\x49\x0c\
-\x45\xb7\xab\x82\x03\x15\x84\xf0\x68\xea\x6d\xc5\xc5\x0d\xd0\x60\
-\x84\x15\xbf\x06\x80\xc6\xdc\x00\xa8\x89\x85\x81\x65\x38\x07\x83\
-\x34\x37\xfb\xcb\x06\x40\x50\x96\x45\xac\x0d\x90\x05\xe7\x6a\x80\
-\xa4\x94\x9c\xf2\x53\x07\xd2\xd5\x00\xb5\xbf\x50\x34\xc5\x57\x3a\
-\x5c\xaa\x56\xfd\xe2\x79\x75\x1a\x81\x46\xfa\xbb\xdf\xfd\xae\x7a\
-\xc5\x9f\x41\x6e\xb3\x10\x0c\x8c\x10\xba\x23\x74\xb7\x84\x28\x06\
-\x52\xe8\x8d\x50\x47\x6f\x00\xb4\x14\x4b\xda\x05\x70\x5d\xfb\x1b\
-\x7c\xaa\x07\x06\x1e\x61\x5e\xa0\x0d\x40\xfe\xd0\x00\x29\xf4\x20\
-\xad\x04\xe8\x2a\x90\x1c\x40\x2d\x90\xfa\x00\xe9\xd4\x83\xc3\x98\
-\x07\xa8\x09\xd2\x47\x1f\x7d\x24\xd9\x3d\x57\x76\xf2\xd5\xa7\xeb\
-\x6a\xa3\xaf\x08\x60\x1b\x44\xfc\x8e\x68\x08\x10\xc3\x18\x47\x18\
-\x16\xa3\xe5\x12\x8b\x4e\xc4\xb6\xe0\xa2\x17\x00\x3c\xc5\xf5\x48\
-\x68\x7e\x86\x7b\x26\x00\x87\xb6\x7b\x81\x75\xd8\x7f\x7f\x33\xf3\
-\x00\xb5\x19\x54\x05\xa9\x05\x90\xc3\xe9\xfe\xab\x02\xe4\x8f\x7f\
-\x30\x00\x49\xd1\x7b\xc1\xa7\xa7\x5f\x0a\xe0\x1f\x3a\x42\x2c\xe2\
-\x22\xe8\x6c\x88\x5c\x74\x38\xcf\x2e\x75\x14\x77\x59\x96\x87\x38\
-\xa2\x9c\xac\x93\xeb\xf3\x50\x4a\xc7\xc0\x57\x05\xc8\xb3\xe8\x7a\
-\x80\x80\x90\x63\xd1\xab\x03\xf4\x7f\x1f\xc0\xf6\x2f\x95\x0b\x38\
-\xd7\x18\x2f\x5c\x86\x10\x29\x07\x32\x09\x66\x41\x08\x76\xc5\x32\
-\x92\x01\x8b\xd8\x9c\x33\x2e\xe2\x2c\xe7\x79\x1e\xf3\xb5\xbe\x68\
-\xfb\x0a\x33\xdb\x06\x48\xd7\x03\xe4\x41\xfa\x47\x3a\xfe\x37\x07\
-\x9a\x54\x7e\x43\xb2\x59\x99\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x09\xa8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x03\x00\x00\x00\xf4\xe0\x91\xf9\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x02\x8b\
-\x50\x4c\x54\x45\x00\x00\x00\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\
-\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\
-\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\
-\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\xcd\x5c\x5c\x00\x00\x00\xc2\
-\x04\x4b\x89\x00\x00\x00\xd7\x74\x52\x4e\x53\x00\x16\x0d\x77\x67\
-\x01\xdb\xcd\x43\x33\xa8\x99\x15\xf9\xf3\x0c\x74\x65\xd9\xcb\x40\
-\x31\xa5\x97\x13\xf8\xf2\x0b\x71\x63\xd6\xc9\x3d\x2f\xa3\x95\x11\
-\xf7\xf0\x0a\x6e\x61\xd4\xc7\x3a\x2d\xa0\x93\x0f\xf6\xef\x09\x6b\
-\x5f\xd1\xc5\x37\x2b\x9d\x91\x0e\xf4\xee\x08\x68\x5d\xce\xc3\x34\
-\x29\x9a\x8f\xed\x5b\xc1\x28\x8d\xf1\xec\x07\x59\xc8\xbf\x2e\x26\
-\x94\x8b\xeb\x06\x60\x57\xbd\xfe\x24\x02\x22\x44\x55\x76\x87\xc4\
-\x54\x32\x21\x04\x14\x25\x36\x47\x79\x8a\x9b\xac\xde\xbc\xab\x46\
-\x35\x17\x39\x4a\x5a\x7c\x9e\xaf\xc0\xd0\xe1\x49\xa1\xb2\xd3\xe4\
-\xf5\xb9\x96\x70\xfd\x6f\x4c\x4b\xe3\xe2\x19\xca\x18\xad\x89\x85\
-\x62\xfa\x5e\x41\xd8\x23\x05\x7a\x4f\xe8\x1e\xd2\x1a\xb6\x03\x92\
-\x6c\xfc\x2c\xe0\xa9\x9f\x84\x53\xe6\x1d\xbe\xb3\x82\x56\x9c\x8c\
-\xdd\x1f\x50\xa6\xe7\xd7\x6a\x3e\xdc\x80\xfb\xc2\x30\xb0\x73\x8e\
-\x98\xb5\x3b\xd5\x7d\xe5\x20\x27\x78\x58\xba\xaa\xea\x3c\x6d\xae\
-\x72\xb8\x67\x85\x97\xd3\x00\x00\x00\x01\x62\x4b\x47\x44\x00\x88\
-\x05\x1d\x48\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\
-\x00\x0d\xd7\x01\x42\x28\x9b\x78\x00\x00\x00\x07\x74\x49\x4d\x45\
-\x07\xe2\x06\x03\x17\x20\x05\xf6\x2a\x2f\xbf\x00\x00\x04\xfd\x49\
-\x44\x41\x54\x78\xda\xed\x9b\xfb\x5b\x54\x45\x18\xc7\x07\x75\x59\
-\x35\x41\x57\x12\x10\x33\x51\x37\xb7\x52\x11\x10\xf3\x92\x5c\x94\
-\x34\x04\x24\x45\x4a\x84\x05\x45\xd4\x50\x84\x0d\x41\x14\x25\x10\
-\xc5\x0b\xe4\x25\x2d\x11\xa2\xcc\x5b\xa8\x95\x86\x95\x96\x77\xcb\
-\x7b\x37\x4d\xad\xf9\x77\x64\x59\x60\xf7\xec\xce\x99\x73\xce\xbc\
-\x73\x66\x9e\xa7\xa7\xef\xcf\xe7\x9d\xcf\xe7\x81\xb3\xf3\x9e\x33\
-\x33\x07\xa1\xff\x03\x4b\x50\x3f\xc9\x02\xfd\x07\xc8\xe5\x5b\x82\
-\xad\x72\x05\x06\x62\x3c\x48\xaa\xc0\x60\x8c\x5f\x90\xc9\x1f\x12\
-\x82\x71\xe8\x50\x89\x02\xc3\x70\x57\x6c\x12\x05\x86\xbb\x05\xc2\
-\xe4\xf1\x5f\xc4\xdd\x19\x21\x4d\x20\xdc\x23\x10\x21\x8b\x1f\x39\
-\xd2\x23\x10\x35\x4a\x92\xc0\x4b\xb8\x27\xa3\x25\x09\xbc\xdc\x2b\
-\x30\x46\x0e\x3f\x1a\xf7\x65\xac\x14\x81\x71\x5e\x81\xf1\x32\xf8\
-\xf6\x57\xbc\x02\x13\x1c\x12\x04\x5e\xc5\x3e\x79\x4d\x82\xc0\xeb\
-\xbe\x02\x13\xc5\xf3\x27\x61\x45\x26\x0b\x17\x88\x51\x0a\x4c\x11\
-\xcd\x8f\x8d\x53\x0a\xc4\x4f\x15\x2c\x90\x80\xfd\x32\x4d\xb0\xc0\
-\x1b\xfe\x02\xd3\xc5\xf2\x67\xe0\x80\xcc\x14\x2a\x30\x2b\x50\xe0\
-\x4d\x91\xfc\xd9\x89\x81\x02\x49\xc9\x02\x05\x52\x30\x21\x73\x04\
-\x0a\xcc\x25\x09\xa4\x8a\xe3\xbf\x85\x89\x99\x27\x4c\x60\x3e\x59\
-\xe0\x6d\x51\xfc\xa1\xa1\x64\x81\x34\x51\xb7\xa1\x0d\xab\x64\x81\
-\x20\x81\x30\x35\x81\x74\x31\xfc\x11\x58\x35\x19\x42\x04\x22\xd4\
-\x05\x32\x45\xf0\x47\x2d\x54\x17\xc8\x7a\x47\x80\xc0\x68\x4c\xc9\
-\x22\x01\x02\x8b\x69\x02\xd9\xe6\xf3\x97\x60\x6a\x72\x4c\x17\x78\
-\x97\x2e\xf0\x9e\xd9\x7c\xc7\x04\xba\xc0\xd2\x5c\x93\x05\x96\x61\
-\x8d\xe4\x99\x2c\x30\x5d\x4b\x20\xdf\x5c\xfe\x4c\x2d\x3e\x76\x16\
-\x98\xc1\x2d\xb4\x2f\x1f\xb4\xa2\xc8\xb6\xb2\x78\x95\xa6\x00\x4e\
-\x2f\x5e\x69\x5b\x3d\x70\xcd\xfb\xf6\x42\x08\xb1\x64\xed\xba\xd2\
-\xf5\x79\x29\x65\xe5\xae\x0f\xf2\xe7\x56\xc4\x3b\xb5\xb9\x84\xbf\
-\x45\x7c\x85\x75\x43\xa5\xab\xbc\x2c\x25\xaf\x6a\xe3\xba\xb5\x25\
-\x74\x62\x6e\x75\xc6\xa6\xcd\x35\x09\x5b\x32\xb7\xd6\x7e\x58\x57\
-\x1f\xc5\x02\xd4\x4a\x54\x7d\x5d\x76\xed\xd6\xcc\x2d\x09\x35\xdb\
-\x36\x65\x54\xf7\xfd\x5a\x6c\x0d\xdb\x53\x77\x34\xee\x34\x83\x48\
-\xcf\xce\xc6\x1d\xa9\xdb\x1b\x6c\x28\x76\x97\x78\xb6\x37\xbb\x62\
-\xbb\xfe\xdd\x11\xf2\xf8\xbb\x3d\x37\xc6\x9e\x26\x39\xf8\xa6\xe6\
-\xde\xfb\xe0\xa3\x50\xf8\x68\xc6\x13\xba\xd7\xfb\x1b\x18\xbb\x4f\
-\x3c\x7f\xff\x12\xdf\x5f\xe1\x81\x30\xf8\x88\xc6\xf2\xf1\x41\xe5\
-\x3c\xe0\x38\x24\x96\x5f\x19\xb0\xa2\x62\xf9\x44\x24\xff\x53\x0b\
-\x61\x32\x3c\xdc\x22\x0a\x1f\x72\x84\x3c\x1d\xb7\x26\x89\xe1\x67\
-\x45\xab\x35\x84\x9c\x60\x11\xfc\xb6\xcf\xd4\x5b\x52\x64\xba\xf9\
-\xfc\x7c\x3b\xb5\x29\xc6\xc0\x09\xf4\xb8\xda\x35\x9e\x04\x3e\x67\
-\xea\xfd\x7a\xd3\x34\x0c\x69\xa6\x28\x0e\xce\x51\x4b\xe2\x17\xda\
-\x7c\x84\x4a\x8f\x9a\xc5\x6f\xd4\xb9\xc1\xf7\xe5\x31\x73\xf8\xd6\
-\xe3\xfa\xf8\x08\xf5\x3b\x61\x06\xbf\xd6\xc0\xb6\xca\xc9\x53\xfc\
-\xf9\xe5\xc6\x9e\x92\xbf\xea\xe0\x8b\x6f\x31\xbc\xb7\xb8\x8d\xeb\
-\x93\x71\x52\xab\x51\x3e\x42\xa7\xcf\xf0\xe3\x07\x33\xbd\xb5\x57\
-\x2f\x86\x93\x3d\x49\x8f\x64\xe1\x23\x94\x7c\x96\x0f\xff\x6b\xe6\
-\x57\x76\xcb\x37\x1c\xf0\xce\x32\x56\xbc\x3b\x47\x42\xa0\xfc\xb8\
-\x6f\x21\x7c\x84\xa2\xb3\x60\xfc\x73\x1b\x61\x7c\x84\x0a\xda\x20\
-\xfc\xba\xf3\x50\x3e\x42\xf6\xef\xd8\xf9\x9d\x5c\x8e\xf8\xb4\x57\
-\xb2\xf2\x67\x81\xd6\x28\xbc\x61\x6e\x0c\x17\xf8\xf0\x95\xfb\xe4\
-\x46\xb2\x8a\x0f\x3f\x88\xf9\x16\x68\xe1\x73\xbc\xe6\x7b\x66\x01\
-\x5c\xc5\x45\x20\x82\x5d\xa0\x98\x8b\xc0\x70\x76\x01\x2e\xe7\x7b\
-\x8e\xb3\xf3\x71\xc7\x6c\x0e\x02\x0b\x00\x02\x78\x2f\x9c\x8f\x7e\
-\x80\x08\xfc\xc8\x41\xe0\x22\x44\x80\xc3\x91\xd7\x4b\x10\x3e\x6e\
-\xb2\x83\x05\x34\x37\x08\xe8\xf9\x09\x2c\xd0\x00\x13\x80\x9f\xab\
-\xd8\x0f\x13\x38\x06\xe5\x17\xc0\xf8\xd8\x39\x04\x28\x60\x03\x0a\
-\xe0\x22\xa0\xc0\xcf\x50\x81\xdd\x40\x81\xcb\x50\x81\x2b\x30\x7e\
-\x06\x94\x8f\xf1\x01\x90\xc0\x55\xb8\x40\x0d\x48\x40\xeb\x79\xd4\
-\xe9\x0a\xd7\x12\x70\x41\xf8\x96\xa5\xf4\xc1\xdb\xae\x21\xb4\xbe\
-\x82\x7e\xcd\x75\x88\xc0\x64\xea\xd0\x21\x37\xba\xcf\x2b\x38\xca\
-\x6f\x52\x2f\x83\xbc\x9b\x34\xd3\x06\xbe\xd5\x77\x70\xe9\x17\xea\
-\x6e\x03\xe4\xa4\xe1\xaf\xea\xc3\xc6\xdb\x7c\x56\xdc\x0b\x9b\x29\
-\x9b\x3e\x31\xec\xfc\x42\xf5\xe5\xf3\xb3\x7e\x1b\x1e\xe7\x3b\x55\
-\x2f\xad\x67\x17\x58\xa3\x36\xe6\x99\xcd\x81\x17\xaf\x3e\xa7\x76\
-\xf5\x72\x66\x81\xdb\xe4\x01\x3b\xee\x10\x5f\x38\x62\xef\xaa\x2c\
-\x33\xb3\x1f\xbe\xbf\x47\x1c\xcf\xaa\xfa\x61\xcf\xfd\x07\xc4\x82\
-\x70\x56\x7e\x09\x69\xa5\x2e\xf1\xf6\x49\xf5\x8a\xdc\x87\x23\x09\
-\x25\xbf\xb1\x0a\x10\x4e\xae\xe2\x13\xbf\xd3\x6b\x72\xb2\x09\x45\
-\x7f\x30\x0a\xfc\x19\x30\xd2\xd1\xbf\xb4\xab\x0e\xa7\x05\x94\xa5\
-\x30\x0a\x3c\xf2\x1b\xc7\xe9\xd2\xf5\x8c\x1b\x14\xd0\x1e\x1e\xb3\
-\xf1\xdb\xfd\x0e\x15\x5c\xb9\xa6\xb7\xd2\xbf\x3d\xfc\x6d\xd1\x5b\
-\xa9\xc8\x13\xc5\x20\x3d\x13\xbf\xbe\xf8\xb7\x87\xd3\x4c\x02\x0f\
-\x7d\x87\xb8\x65\xf0\xa8\xa0\xb2\x3d\x3c\x65\x12\xf0\x59\x1d\x53\
-\x4c\xfc\xfa\xa2\x68\x0f\xcf\x58\xf8\xc9\xde\x6f\x48\x06\x1f\x64\
-\x19\xc0\xa7\x3d\xa4\xb1\x2c\x97\xb5\xf6\x56\x93\x26\x7e\x7d\xf1\
-\xb6\x07\x96\xcf\xd1\x2e\x78\x4a\x3b\x32\x01\x2b\x4d\x7d\xed\xe1\
-\x1f\x86\xe2\xd4\xee\x4a\x2b\xf0\x8b\xce\x9e\xf6\xd0\x69\xbc\xd2\
-\xd1\xa2\x35\xf1\xeb\x8b\xa7\x3d\x2c\x34\x3e\x4e\x95\x7b\xe2\xbf\
-\x04\xc5\xbb\xd3\xdd\x1e\x4a\x0d\x97\x15\xeb\x9a\xf8\xf5\xa5\xab\
-\x3d\xf4\x37\x5c\x34\x51\xdf\xc4\xaf\x2f\x41\xe1\xff\x1a\x2d\xb1\
-\x4c\xe2\x87\x77\xe7\x3e\xdf\xe1\xfe\x4b\x79\x0e\x4f\x97\x62\x18\
-\x3a\x28\x58\xce\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
-\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x38\x2d\x30\x36\x2d\
-\x30\x33\x54\x32\x33\x3a\x33\x32\x3a\x30\x35\x2b\x30\x32\x3a\x30\
-\x30\x4e\xac\x3f\x5d\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x38\x2d\x30\x36\
-\x2d\x30\x33\x54\x32\x33\x3a\x33\x32\x3a\x30\x35\x2b\x30\x32\x3a\
-\x30\x30\x3f\xf1\x87\xe1\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\
-\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x30\xff\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x24\xe9\x00\x00\x24\xe9\
-\x01\x50\x24\xe7\xf8\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\x9d\x79\x9c\x1d\x47\x75\xef\xbf\xd5\xdd\x77\
-\x9f\x7d\xd7\xbe\xcb\xb2\xe5\x1d\x8c\x17\x01\x36\x31\x3c\x88\x6d\
-\xc2\x23\x80\x43\x70\x82\x8c\xc3\x23\x24\x84\x80\x09\xe4\x85\x2d\
-\x60\x20\x04\x4c\x02\x0e\x09\x4b\x78\x01\x2c\x03\x71\x1e\x36\x79\
-\x1f\xcc\x92\x18\x8c\x63\x1b\x8f\xf7\xdd\xb2\x65\xcb\xb2\xd6\xd1\
-\x48\x9a\x7d\xe6\xae\xbd\x54\xd5\xfb\xa3\xfa\xf6\xbd\x33\x73\x67\
-\xd1\x8c\x46\x92\xc9\xfc\xf4\x69\x4d\x6f\xb7\x97\x3a\xbf\x3e\xe7\
-\xd4\xa9\x53\x55\x42\x6b\xcd\x22\xfe\xfb\xc2\x3a\xd1\x0f\xb0\x88\
-\x13\x0b\xe7\x58\x5f\xf0\xab\x57\x89\x0d\x4a\xdb\x17\x83\x6e\x47\
-\x8b\x17\x84\x90\x3b\x53\x39\x76\xbd\xe7\x36\x5d\x38\xd6\xf7\x5a\
-\xc4\xfc\x21\x8e\x85\x09\xf8\xea\x3b\xc4\x2b\x35\xd6\xfb\x34\x5c\
-\x0c\x2c\xa9\x71\x8a\x06\x9e\xd1\x88\xcf\x5e\x7b\xb3\xbc\x85\x45\
-\xbb\x73\xd2\x60\x5e\x04\xb8\xee\x3a\x61\x35\xee\xb4\xfe\x1a\xcd\
-\x27\x00\x7b\x96\x3f\x7b\x42\x09\xf1\xf1\x0f\xfd\x20\xf8\xf9\x9c\
-\x6f\xbc\x88\x63\x86\x79\x11\xe0\x86\x77\xd8\x9f\x03\x3e\x5e\xde\
-\x4e\x26\x62\x74\x2e\x5f\x4d\xe7\xb2\x8d\xd4\xb5\x2c\xc7\x73\x5d\
-\x0a\xb9\x11\x72\x63\xc3\xec\xdb\xf9\x38\x6e\x71\x2c\xfa\xad\x16\
-\x7c\xf5\xda\x1f\xc8\x0f\xcc\xeb\xe9\x17\x31\x6f\xcc\x99\x00\x37\
-\xbc\xdd\xf9\x6d\x2c\xfd\x33\x40\xd8\x42\xb0\x71\xd3\x06\xd6\x9e\
-\xfd\xdb\x08\xab\xb6\x5b\xe1\x79\x3e\xbb\xb6\x77\xb3\xfb\xb9\xc7\
-\x20\xbc\xa7\x10\xfc\xd5\x07\x7e\x20\xbf\x38\xd7\x87\x5f\xc4\xfc\
-\x31\x77\x02\xbc\xc3\xfa\x25\x88\xd7\x02\x9c\x79\xd6\xd9\xac\xdc\
-\xfc\x1a\x10\x16\xc5\xdc\x28\x3d\x7b\x77\x30\x3a\xd8\x8b\x65\xd9\
-\x74\x2e\xdf\xc0\xd2\xd5\xa7\x22\x84\x00\x60\xb4\xff\x20\xdd\xbf\
-\xba\x05\x25\x25\x80\x16\x42\x5c\xfd\x81\x1f\x04\x37\x1d\xab\x17\
-\x5a\xc4\xd1\x61\x4e\x04\xf8\xd2\x95\xa2\x2b\xe6\x58\x3d\x80\xbd\
-\x7c\xed\x19\x9c\x7d\xe1\xff\x00\xa0\x77\xdf\xf3\x3c\x71\xdf\xcf\
-\x51\x4a\x8d\x3b\x3f\x93\xce\x70\xe1\xeb\xdf\x41\x32\xdd\x00\xc0\
-\xe1\xbd\x4f\xf1\x68\xf7\x2f\x09\xef\xec\x2b\xad\xd6\x7d\xe8\x66\
-\x7d\x60\x5e\x6f\xb2\x88\x39\x61\x4e\x71\x80\x98\x63\xbd\x9d\xd0\
-\xe9\x5b\x75\xca\xb9\x00\x8c\x0e\x1d\xe6\xb1\xee\x9f\x55\x84\x1f\
-\x7e\xf1\x00\xf9\x42\x9e\x07\x6e\xbf\x09\xe5\xbb\x00\x74\xad\x3e\
-\x93\x53\x4e\x3d\x23\xba\x9c\x10\xd6\xfb\xe7\xf6\xf8\x8b\x98\x2f\
-\xe6\x18\x08\x12\xbf\x0f\x90\x6e\x68\xa3\xb1\xa9\x0d\x80\x1d\x8f\
-\xfe\x2a\xb2\xed\xaf\x7a\xc7\x17\x79\xff\x8d\x79\xae\xfe\xf2\x73\
-\x74\xad\x7b\x05\x00\xb9\x82\xcb\xfe\x27\x7f\x0a\xe1\x77\xbf\xf6\
-\xcc\xd7\x90\x4c\xa6\xcc\xd5\xe0\x7f\xfd\xdd\x3b\x45\x66\x3e\x2f\
-\xb2\x88\xb9\x61\x8e\x04\xd0\xab\x00\x3a\x96\x6f\xc4\x0a\xaf\x30\
-\x36\x3c\x00\x40\xfb\xaa\xb3\x78\xd9\x15\x1f\xc6\x8e\x25\x68\xea\
-\xda\xc0\x25\x5b\x6f\x88\x7e\x35\xd8\x7f\x88\xdc\xa1\xa7\xcc\x8d\
-\x9d\x18\x6b\x37\x9d\x59\x3e\xd4\xe4\xf8\xd6\xd5\x73\x7b\x96\x45\
-\xcc\x07\x73\x0d\x05\x5b\x00\xb6\x1d\x8b\x76\x48\x69\x54\xbf\xe5\
-\xc4\xc7\x9d\xa8\xa9\xf8\x18\x02\x0c\x01\xb4\x04\x60\xc5\xba\xb3\
-\xb1\x2d\xbb\x7c\xf0\xcf\x23\x4f\x71\x11\xc7\x0d\xf3\x22\x40\xe0\
-\x55\xa2\xbb\x75\x99\x24\x00\x47\x76\x3f\xc2\x8e\x5f\x7f\x0f\x00\
-\xaf\x94\xe5\x81\x5b\x3f\x1d\x9d\x93\x4a\xd8\x28\xbf\x44\x61\xe0\
-\x45\x00\x62\xc9\x3a\x56\xac\xdd\x58\x3e\xbc\xf1\x1f\xae\xb2\x2f\
-\x9f\xe3\xf3\x2c\x62\x8e\x98\x27\x01\xf2\xd1\x8e\x65\x4b\xc2\x08\
-\xb0\xd6\xdc\xfe\x8d\xab\xf9\xd6\x7b\x97\xf0\xad\x3f\xee\x62\xdf\
-\x53\xbf\x04\x20\x19\xb7\x69\xc8\x98\x18\x41\xfe\xf0\xd3\xe1\xaf\
-\x34\xab\x37\x9e\x1d\x5d\x43\x69\xf5\xc1\x39\x3e\xcf\x22\xe6\x88\
-\xb9\x12\x60\x00\x60\x74\xb0\xbf\xec\xd3\xb1\x74\xfd\x39\x2c\x6b\
-\x4b\x46\x27\x14\xc6\xfa\x08\xfc\x12\x00\xf1\x98\xc5\xda\xae\x24\
-\x65\xfd\xee\x17\x86\x70\x47\x7b\xd0\x4a\x92\xae\x6f\xa5\xa3\xd3\
-\x90\x47\x68\x71\xe9\x57\xfe\x40\x9c\xc1\x22\x8e\x1b\xe6\x46\x00\
-\xcd\xbf\x03\xe4\xc6\xfa\x19\x19\x3c\x04\x40\xb2\x79\x25\x4b\x3b\
-\x5b\xd8\xb4\x22\x43\x6b\x43\x8c\xba\xa4\x43\x5d\xca\x61\x59\x5b\
-\x92\x4d\xcb\x33\x24\xe3\xe3\x9b\x0a\x72\x87\x9e\x46\x2b\x09\x4a\
-\xb2\x7a\x63\x45\xe6\x42\x59\x8b\x5a\xe0\x38\x62\x4e\x04\xd0\xa8\
-\x5b\xcb\xeb\x3d\x2f\x3e\x19\xae\x09\xea\x96\x9c\x45\x3a\x61\xb3\
-\xaa\x23\xc5\xc6\xe5\x69\x36\x2e\x4b\xd3\xd9\x14\xc7\xb1\x27\xfb\
-\x76\xee\x68\x0f\x41\x61\x08\xad\x02\x5a\xda\x96\x51\x57\x57\x5f\
-\x3e\x74\xd5\xdf\xbd\x53\x74\xcc\xe5\xb9\x16\x71\xf4\x98\x13\x01\
-\xae\xbd\x59\x3f\x02\xec\x05\xd8\xbf\xe7\x39\xdc\xa2\xf1\x05\x32\
-\x9d\xa7\x91\x68\x5c\x3e\xeb\xeb\xe4\xfb\x9e\x43\xab\x00\xad\x35\
-\xab\xd7\x6f\x2a\xef\x4e\xc4\x02\xeb\xbd\x73\x79\xae\x45\x1c\x3d\
-\xe6\x9c\x11\xa4\x35\x5f\x05\x50\x52\xf2\xe4\x03\xbf\x88\x7c\x81\
-\xe6\x75\x97\x60\xc5\x92\xd3\xfd\x34\x42\x69\x78\x0f\x32\x28\xa1\
-\x55\x40\xe7\x92\xd5\xc4\x62\xa6\x5a\xa9\xe1\x4f\xaf\xbb\x52\xc4\
-\x67\xf8\xf9\x22\x8e\x01\xe6\x4c\x80\x6b\xff\x4d\xdd\x00\xfa\x4e\
-\x80\xbe\xde\xdd\xec\xdd\xf9\xb8\xb9\x60\x2c\x45\xd3\x9a\x57\xcf\
-\xea\x1a\x5a\x49\x4a\x83\xbb\xd1\x2a\xc0\xb2\x04\x2b\x56\xad\x2e\
-\x1f\xea\x6c\x70\xec\xdf\x9f\xeb\xb3\x2d\x62\xf6\x98\x7b\x4e\xa0\
-\xd6\x5a\x07\xfa\x9d\xc0\x30\xc0\x33\x8f\xdd\x4d\x76\x64\x10\x80\
-\x64\xf3\x2a\x32\x1d\xa7\xce\xea\x32\xc5\x21\x43\x00\xad\x02\x96\
-\x2e\x5f\x13\xed\x17\xe8\x45\x67\xf0\x38\x60\x5e\x49\xa1\xd7\xfe\
-\x50\x1f\x44\x8b\xf7\x80\xf9\x9a\x1f\xbb\xf7\x67\x28\x69\x84\x59\
-\xbf\xfc\x65\x38\xc9\xc6\x19\xaf\xa1\x02\x17\x77\xac\x17\xad\x24\
-\xf1\x58\x9c\xae\xae\xae\xf2\xa1\xb3\x6f\xf8\xfd\xd8\x25\xf3\x79\
-\xbe\x45\xcc\x8c\x79\x67\x05\x7f\xf0\xe6\xe0\x56\x34\x37\x02\x64\
-\x47\xfb\xd9\xf1\xd8\xdd\xa6\x7a\xa7\x35\x8d\xab\x2f\x42\x58\x33\
-\x67\x8a\x15\x87\xf6\xa2\x54\x80\x54\x01\x4b\x97\xae\xac\x1c\x10\
-\xf2\xda\xf9\x3e\xdf\x22\xa6\xc7\x31\x49\x0b\xf7\xd2\xea\xcf\x81\
-\xdd\x00\x7b\x76\x3e\x41\xff\xa1\xbd\x68\x2d\xb1\xe3\x75\x64\x3a\
-\x37\x4f\xfb\x5b\xad\x35\x41\x29\x8b\x97\x1f\x42\x49\x49\xaa\xae\
-\x9e\xfa\x86\x86\xf0\xa8\xb8\xe2\x2b\x7f\x28\xd6\x1f\x8b\x67\x5c\
-\x44\x6d\x1c\x13\x02\xfc\xe5\xb7\x75\x56\x59\xea\x2a\x40\x02\x3c\
-\xf9\xe0\x9d\x94\x8a\x39\xb4\x92\x24\x5b\xd6\x10\xcb\xb4\x4f\xfa\
-\x8d\xd6\x1a\xa5\x34\x4a\x83\xd2\x50\x1c\xe9\x45\xc9\x00\x25\x03\
-\x96\x74\x2e\x8d\x9e\x4f\x48\xeb\xcf\x8f\xc5\x33\x2e\xa2\x36\x8e\
-\x59\xc7\x90\x0f\x7d\x5f\x3f\x80\xe6\xb3\x00\x9e\x5b\xe0\xe9\x47\
-\xef\x89\x22\x7d\x75\x4b\xce\x44\xd8\xa6\x56\xa7\xb5\x46\xe9\x8a\
-\xe0\xcb\x8b\x5b\x18\x26\xf0\x8a\x28\x19\xd0\xd0\xdc\x48\x3c\x1e\
-\xd5\x02\xdf\xf5\xc5\x2b\xc5\xcc\xce\xc4\x22\xe6\x84\x63\xda\x33\
-\x68\x99\x54\x9f\x03\x71\x3f\xc0\xc0\xe1\x1e\xf6\xef\xde\x81\xd6\
-\x12\x61\xd9\xa4\x3b\x36\x55\x04\xaf\xaa\x84\x5f\x5e\x57\x9a\xe2\
-\xd8\x11\xa4\x0a\x50\x52\xd1\xde\xde\x56\xbe\x6c\x5d\xdc\xb1\xde\
-\x7d\x2c\x9f\x73\x11\x15\x1c\x53\x02\xbc\xed\x87\x5a\x22\xe4\x1f\
-\x00\x59\x80\x9d\xcf\x3e\x4e\x76\x74\x10\x2d\x03\x9c\x54\x0b\xb1\
-\xfa\x25\x93\xbe\xfc\xca\xa2\x71\xf3\x43\xc8\xc0\x47\xc9\x80\xe6\
-\xa6\x66\x84\x65\x42\xc8\x02\xde\x7f\xcb\x95\x62\xb6\xfd\x0e\x16\
-\x71\x14\x38\xe6\x7d\x03\x3f\xf8\x03\xbd\x5b\x23\xde\x0f\xa0\x94\
-\xe4\xe9\xc7\x1f\xc6\x0f\x3c\x94\x0c\x48\x36\xad\xc2\x72\x52\x68\
-\x0d\x5a\x55\x04\x5f\xf6\x05\xa4\x94\x94\x72\x43\x48\x25\xd1\x40\
-\x73\x43\x53\xf9\xb2\xab\x0e\xda\xf6\x9b\x67\xba\xf7\xa3\xdf\x12\
-\xb1\x7b\x6f\x12\x7f\xda\x7d\xa3\xf8\x9b\x07\x7f\x20\x1a\x66\x3a\
-\x7f\x11\x0b\xd4\x39\xf4\xda\x7f\x0d\xb6\x01\xb7\x00\xe4\x73\xa3\
-\xbc\xb8\xf3\x19\xa4\x0c\x50\x4a\x93\x6c\x59\x8b\x42\xa0\xb4\x46\
-\x6b\x6d\xc8\x50\xa5\x09\xbc\xc2\x28\x32\xf0\x91\x32\xa0\xb1\xb9\
-\xbe\xfa\xb2\xd3\x06\x86\xee\xbd\x51\xbc\xb1\x94\x60\xbb\xd0\x7c\
-\x0d\xc1\xc7\x02\xc9\x27\x16\xe2\xdd\x7e\xd3\xb0\x60\xbd\x83\x13\
-\x42\xfd\x31\xd0\x03\x70\xf0\xc0\x3e\x06\x07\xfa\x91\x52\x82\x15\
-\x23\x5e\xdf\x35\xc9\x17\xd0\xca\x10\x21\x08\x7c\xbc\x52\x0e\x29\
-\x03\x6c\xcb\x26\x9d\x36\x89\xa3\x08\xbd\xe5\x1f\xde\x2e\xce\x9b\
-\x78\x9f\xee\x6d\x62\x73\xf7\x36\xf1\x0b\x21\xb8\x0d\x88\xd2\x8b\
-\xd0\x4c\x3a\x77\x11\x93\xb1\x60\x04\xf8\x93\x1f\xe8\x61\x25\xac\
-\x77\x02\x0a\x60\xd7\xf3\xcf\xe0\x96\x0a\x48\x19\xe0\xa4\x9a\xb1\
-\xe2\x99\x9a\xbe\x80\xd6\x1a\xbf\x98\x43\x49\x49\x20\x03\xea\x32\
-\x55\xc9\xc2\x76\x25\x57\xe0\xa1\x9b\x44\xeb\x7d\x37\x8a\xaf\x01\
-\x4f\x02\xaf\x2b\xef\x17\x56\xf4\x4a\x15\x32\x2c\x62\x4a\x1c\x93\
-\xde\xc1\xd3\xe1\x2b\xef\xb0\xaf\x17\xf0\x11\x80\xc6\xc6\x16\xd6\
-\xae\x5f\x8f\x56\x0a\x29\x3d\xf2\x83\xfb\x50\xd2\xd8\xfb\xc8\x1c\
-\x60\x34\x81\x93\xa8\x47\x0b\x0b\x25\x25\x47\xfa\x06\xf1\x83\x00\
-\xc0\x4f\x25\xd4\x86\xd3\x2f\xe6\xcd\x08\x3e\x05\x44\x4e\x42\x7d\
-\xcb\x4a\xd6\x9c\x75\x15\x07\x77\xfe\x94\xc1\x83\x26\xe5\xcc\x4f\
-\x53\x7f\xc9\xdb\x74\x6e\x41\x5f\xf0\x25\x8e\x63\x3e\x3e\xc0\x44\
-\x8c\x05\xea\x13\x4d\x8e\xf5\x5a\x0d\xe7\x8c\x8e\x0e\xd1\x77\xf8\
-\x10\x2d\xad\xad\x28\x0d\x4e\xba\x95\xd2\xd8\x91\x48\xe8\xd5\x04\
-\xf0\xbd\x12\xc2\x89\xa3\xa4\x22\x9d\x8c\x33\x9a\x0b\x68\x6a\xd3\
-\xb1\x35\x67\xf2\x08\x82\xa8\x8e\x18\x4f\x36\xb0\xfa\x8c\xb7\xd1\
-\xba\xe2\x42\x10\x16\xe9\xfa\xa5\x0c\x62\x08\x10\xcf\xb3\x1e\x78\
-\x62\xa1\xdf\xf1\xa5\x8c\x05\x27\xc0\xa7\x7e\xa8\xbd\x1b\xde\x2e\
-\xae\xc2\xb2\x1e\x05\x52\x07\x7b\x7b\x48\xa6\x92\xc4\x62\x0e\x58\
-\x31\xac\x58\x1a\xdf\x2d\x4c\x26\x41\xe0\x23\xb4\x40\xa3\x49\x37\
-\x08\x3a\x4f\xd1\x34\xb6\x69\xc0\x08\x5f\x58\x0e\xcb\x4f\xfd\x6d\
-\x96\xae\x7f\x03\x96\x93\x8a\xee\x17\x4f\x35\x47\xeb\xca\xaa\x10\
-\x65\x11\xb5\x71\x5c\x86\x88\xf9\xe0\xbf\xe9\x1d\x1a\x3e\x0c\x80\
-\xd6\x1c\xec\x39\x80\x0c\x02\xb4\x92\x88\x78\x06\x2d\xec\x9a\x71\
-\x01\x8d\x47\xf3\xb2\x1c\xcb\x4f\xcf\x96\x85\x0f\x40\xfb\xca\x57\
-\x70\xee\x1b\xfe\x96\xe5\x9b\xde\x3c\x4e\xf8\x00\x4e\xa2\xaa\xf6\
-\xa7\x68\x66\x11\xd3\xe2\xb8\x8d\x11\x74\xed\xbf\xca\xaf\x83\xfe\
-\x19\x40\xa9\x54\xa2\xaf\xaf\x8f\x20\x08\x50\x52\x62\xc7\xd2\x55\
-\x35\x02\x13\x2a\x6e\xe8\xf4\x59\x71\x66\x8e\x86\x4e\x8f\x72\x3a\
-\x71\x7d\xcb\x6a\xce\x7c\xcd\xc7\x58\x7f\xde\x7b\x89\xa7\x5a\xc3\
-\x2b\x6b\x50\xa3\xd1\x7d\x9c\x78\x15\x01\xc4\x22\x01\x66\xc2\x82\
-\x9b\x80\x6a\x04\x8e\xbe\xc6\x09\xc4\xd3\x40\xc7\xe8\xe8\x28\xf1\
-\x44\x9c\x64\x3c\x86\xd2\x1a\x61\xc7\x50\x81\x47\xb2\x41\xd2\xba\
-\xca\x25\x9e\xaa\xf4\x30\x8e\xa7\x1a\x59\x7d\xc6\x5b\x69\x5d\x76\
-\x01\x54\x37\x2f\xeb\x3c\xa8\x61\xd0\x01\x58\x75\x80\x8d\x1d\xaf\
-\xd4\x1a\x84\x58\x34\x01\x33\xe1\xb8\x8e\x12\xf6\xe1\x9b\x74\x1f\
-\x5a\x5c\x53\xde\x1e\x1c\x18\xc4\xf3\x3c\x82\x20\xc0\x49\x28\x3a\
-\x37\x96\x58\xb2\xa9\x18\x09\x5f\xd8\x31\x56\x6e\xbe\x82\x73\x5e\
-\xf7\x19\x5a\x97\xbf\xc2\x68\x02\xad\x40\xbb\x20\x0f\x81\xec\x37\
-\xc2\x07\xd0\x3e\x00\x89\x54\x45\xe6\x5a\x73\xce\xf1\x7b\xbb\x97\
-\x26\x16\xbc\x1a\x58\x0b\x37\x5c\x65\xff\x13\x9a\xf7\x01\xa4\x32\
-\x31\x56\x6c\x14\x34\xb6\x97\x22\x55\x0f\xd0\xbe\xf2\x3c\x56\x9e\
-\xf6\x3b\xa1\xaa\x17\x20\x2c\x40\x82\x1c\x01\x5d\x1c\xd7\xfd\x1c\
-\x00\xab\x2d\xd4\x02\xf0\xf8\x7f\xfe\x25\xa5\xfc\x00\x23\x3d\x1c\
-\xf9\xe9\x27\xb8\x4d\xc0\x26\x60\x9d\x86\xfb\x3c\xb8\xe6\xdb\x5a\
-\x67\x8f\xcf\x9b\x9e\xfc\x38\x21\x04\xf8\xca\x95\x22\x65\xc5\xad\
-\x47\xda\x97\xeb\xd3\x96\xad\xd7\x38\x95\x3e\xa6\xd4\xb7\xac\x62\
-\xcd\x99\xbf\x4b\xa6\x79\x0d\x86\x11\xa1\x92\x52\xa3\xa0\xb3\x95\
-\x7d\x62\x82\xf2\xb2\x1a\xc1\x32\x26\xff\xd9\xbb\xbe\xc9\x9d\x5f\
-\x7d\x88\xe7\xef\x8c\xfa\xa1\x56\x63\x27\xf0\x3b\x5f\xd7\xfa\xf9\
-\x05\x78\xb5\x97\x1c\x8e\xab\x0f\x50\xc6\xf9\x97\xf3\x2a\xa5\x54\
-\xbc\x5a\x86\xf1\x64\x03\x2b\x37\x5f\x41\xfb\x8a\x97\x81\xb0\x89\
-\xf2\xcc\xf5\xa8\xf9\xea\xd1\xa1\xd0\x2d\xb3\xae\xf5\x78\x2d\xa0\
-\x5d\x94\x54\x74\x7f\xf7\x6e\x6e\xbb\xee\x49\x8a\x23\x95\x43\x09\
-\xcb\x02\xad\x71\x0d\xd9\x37\x02\x37\x09\x21\x2e\xd0\x8b\xc3\xd5\
-\x1d\x5f\x0d\xd0\xfd\x1d\x71\x0a\x36\x7f\x0f\x44\xbd\x80\x2d\xcb\
-\xa1\x6b\xdd\x85\x74\xae\xdd\x42\x2c\x96\xc1\xb2\x13\x08\x2b\x06\
-\xaa\x08\x6a\x08\x08\x30\x42\x0f\x17\x31\x71\xdd\x60\xe7\x3d\x7b\
-\xb9\xf5\x63\x77\xd2\xfb\x4c\x4f\xb4\xaf\xce\x71\x38\xaf\xb9\x99\
-\x95\xb1\x18\x85\x52\x89\x7b\x46\x47\x39\x22\x23\x95\x70\xf5\xd7\
-\xb5\xde\xb6\xe0\x2f\x7d\x92\xe3\xb8\x10\xe0\xae\x1b\x45\x53\xcc\
-\x84\x6e\xdf\x07\x44\x0a\xbf\xb9\x6b\x23\x9d\x6b\xcf\x27\x91\x6e\
-\xc5\xb2\x13\xd8\x76\x12\xcb\x12\x58\x64\x11\x14\xa9\x29\xf4\x68\
-\xdb\x06\x2c\x06\xf7\x8f\xf2\xef\x9f\xfc\x25\x4f\xfe\x64\x47\x74\
-\x3f\xc7\xb2\x38\xaf\xbd\x9d\xb3\x9a\x9a\x50\xbe\x8f\xef\x79\xf8\
-\x9e\xc7\x70\xa9\xc4\x7f\x8c\x8d\x11\xd6\x2f\x0e\xbb\xb0\xf1\xbf\
-\xbb\x3f\xb0\xa0\x26\xe0\x96\x5b\x84\xbd\xac\xc0\x7b\x62\x82\xcf\
-\x40\xa5\x4a\x96\xaa\x6f\xa7\x7d\xcd\x39\xa4\x1b\x3a\xb1\xed\x24\
-\x4a\xf9\x20\x34\xc8\x3e\xb4\x70\xc1\x49\x61\xdb\x71\xc2\x98\x60\
-\xa8\xee\x75\x65\x1b\x8d\x9b\x2f\x71\xfb\x97\xef\xe7\xce\xaf\x3f\
-\x48\xe0\x56\x0c\xfd\xe6\xf6\x76\x2e\x5e\xb1\x82\x14\xe0\xbb\x2e\
-\xbe\x52\x28\xdb\x46\xda\x36\x0d\xb1\x18\xeb\xe3\x71\x76\x7a\x1e\
-\x40\x57\x12\xfe\x02\xf8\xf4\x42\x96\xc1\xc9\x8e\x05\x23\xc0\xbd\
-\x37\x89\xd7\x2e\xd5\x7c\x45\xc3\xe9\xd1\xcd\x12\x69\x9a\x97\xae\
-\xa7\xbe\x75\x39\x96\x93\x30\x1d\x42\x2c\x17\xe9\x0d\x20\xf5\x08\
-\x8e\x93\x04\x27\x8d\x50\x36\x96\x65\x87\x03\x86\x8c\x17\xbc\xd6\
-\x9a\x87\xff\xef\x76\x7e\x7c\xdd\xdd\x8c\x1e\xa9\xb4\xf3\x2c\x6b\
-\x6c\xe4\xf2\x53\x4e\x61\x49\x26\x63\xbe\x78\xd7\xc5\xb2\xed\x68\
-\xb1\x6d\x1b\x65\x59\x9c\x9e\x4c\xf2\xa2\xe7\x21\xcd\x15\x5f\xb1\
-\x50\xef\xff\x52\xc1\x82\x10\xa0\xfb\x46\xf1\xbb\x42\xf0\xa3\xf2\
-\xb6\xb0\x63\x34\x75\xad\xa1\xbe\x6d\x29\xc2\x12\x68\x1d\xa0\x95\
-\x4d\x10\x1c\x26\x28\x0e\x18\x01\x39\x69\x94\xb0\x11\xc2\xc3\x12\
-\x0e\x4a\x38\xd8\x4e\xd9\x19\x34\x5a\x60\xcf\xa3\xbd\xfc\xe8\xa3\
-\x77\xb1\xf7\xb1\xc3\xd1\xbd\x1a\x92\x49\x2e\x3f\xe3\x0c\xce\x5d\
-\xba\x94\x20\x54\xf7\xca\xb2\x90\x55\xc2\xb7\x6c\x1b\xcb\xb2\xb0\
-\x6c\x9b\x84\xe3\x90\x10\x82\x82\x31\x7d\xff\xed\x53\xce\x17\x46\
-\x03\x58\x6c\xaa\x1a\x1a\x88\x86\xb6\x76\x1a\x3a\x96\x50\xae\xe8\
-\x2b\xe5\x13\x78\xbd\x68\xd9\x8f\xe3\xa4\x40\xa4\x11\xca\x41\x29\
-\x27\xfc\xeb\x21\xc2\x75\xcb\x8a\x31\x72\x28\xc7\x8f\x3f\x73\x3f\
-\x8f\xdc\xfa\x5c\x79\x20\x32\x1c\xcb\xe2\xd5\xeb\xd7\xf3\xdb\x67\
-\x9c\x41\x32\x1e\x37\x82\x57\x2a\x12\xb4\x6d\xdb\xa8\xf2\x12\x12\
-\x42\xd8\x36\x3b\x5c\xb7\x2c\x7c\x84\x20\x58\x90\xf7\x7f\x09\x61\
-\x41\x08\xe0\x2b\xbe\x1e\xb3\xd8\x82\xe6\x32\x80\xd1\x23\xbd\x78\
-\xc5\x31\xda\x56\x9d\x86\xe5\x98\x50\xad\x1d\xeb\x42\x5b\x49\x94\
-\xec\x43\x48\x0f\x21\x1c\x94\xe5\x54\x11\xc1\x23\x28\x0a\xee\xf9\
-\xe7\x27\xb9\xfd\x86\xc7\xf1\x0a\x7e\x74\xfd\x53\xdb\xda\x78\xe3\
-\xe6\xcd\x74\x36\x35\xe1\x58\x16\x96\x65\x45\x2a\x7e\xaa\x2f\x7f\
-\xd0\xf7\xb9\x77\x60\x80\x3e\xd7\x8c\x55\x68\xc7\xe1\xf5\x9f\x64\
-\x7d\xf7\x36\x71\x37\xf0\x0d\xe0\x96\x2d\x5b\x6b\x44\x0d\x7e\xc3\
-\xb1\x80\xb5\x00\x21\xee\xdb\xc6\x47\x34\xfc\x0d\x21\xd1\x84\x25\
-\x68\x5d\xb1\x8e\x4c\xcb\x0a\x00\x2c\x2b\x8e\x25\x40\x05\x3d\x58\
-\x42\x61\x3b\x29\x6c\x27\x8d\xe3\xa4\x79\xf6\x17\x23\xfc\xf4\xf3\
-\xcf\x30\x74\xa0\x32\x0e\x51\x5b\x2a\xc5\x1b\xd6\xac\xe1\x94\x8e\
-\x0e\x9c\x78\x1c\x27\x1e\x27\x16\xfe\xd5\x10\x79\xfb\xbe\xe7\xe1\
-\x85\x7e\xc0\x70\x3e\xcf\xdd\x07\x0e\xf0\xdc\xf0\x70\xa4\x94\x2c\
-\x1b\x2e\xf8\x23\x58\x73\xd1\xb8\x07\xde\x03\x7c\x11\xf8\xd6\x96\
-\xad\xff\x7d\xe2\x03\x0b\x5e\x0d\xbc\xef\x26\x71\xa1\xd6\xfc\x1b\
-\x10\x75\xfa\x4b\xd6\x37\xd3\xba\xf2\x54\x62\x89\x14\x96\x9d\xc0\
-\xb2\x13\x10\x1c\x06\x9d\xa3\x7f\x97\xe6\x3f\xbf\xd0\xc3\xee\x07\
-\x2b\x91\x9c\xa4\x6d\xf3\xca\xf6\x76\x5e\xd6\xd5\x45\x22\x91\x88\
-\x84\x1f\x2d\x89\x04\x76\x2c\x36\x8e\x00\xa5\x62\x91\x7b\xf6\xec\
-\xa1\xbb\xa7\x07\xbf\x52\xf7\xe7\xd4\x4b\x37\x70\xd9\xc7\xb7\x90\
-\x68\xe8\x61\xf8\xd0\x53\x8c\x0d\xf6\x4d\x7c\xe4\xbb\x80\xab\xb7\
-\x6c\xd5\xfb\x16\xb4\x60\x4e\x12\x1c\x97\x38\x40\xf7\x77\x44\x3d\
-\x36\x9f\x01\xde\x4f\x38\xc4\xac\xb0\x1c\xda\x56\x9f\x42\x5d\xf3\
-\x32\x2c\x3b\x81\x3b\x26\xb8\xf3\x2b\x8f\xf1\xc8\x2d\x3d\xe8\xf2\
-\x68\xb3\xc0\xe9\x99\x0c\x5b\xda\xda\xa8\x4b\xa5\x6a\x0a\xbe\x7a\
-\x5b\x69\x8d\xef\xba\x3c\xbe\x7f\x3f\x3f\x7b\xf6\x59\x86\x8b\xc5\
-\xe8\x19\x3a\x37\x74\xf1\x96\x2f\xbc\x95\xd3\x2e\xdd\x84\xd2\x12\
-\xad\x24\x52\x49\xdc\x7c\x0f\x83\x3d\x4f\x70\x64\xef\x7d\xa8\x20\
-\x32\x33\x63\xc0\x07\xb6\x6c\xd5\x37\x2e\x78\xe1\x9c\x60\x1c\xd7\
-\x48\xe0\x7d\x37\x8a\xb3\xb5\xe0\x1b\xc0\x05\xe5\x7d\x0d\xed\x4b\
-\xd9\x75\x4f\x03\xbf\xfe\xfa\x8b\x94\xb2\x15\x3b\xbf\xd4\xb6\xd9\
-\x52\x57\x47\x7b\x2a\x35\x49\xd0\xb5\x84\xef\xc4\xe3\x1c\xce\xe5\
-\xf8\xe1\xc3\x0f\xb3\xab\xbf\x3f\xba\x4e\xaa\x31\xcd\x65\x7f\xf5\
-\x26\x2e\x7e\xcf\x6b\xb0\xed\x22\x50\x40\xe9\x94\x49\x38\x51\x0a\
-\xa5\x24\x4a\x49\xbc\x62\x3f\xfb\x9f\xf9\x77\xb2\x03\x7b\xab\x1f\
-\xf9\xc7\xc0\x7b\xb6\x6c\xd5\x93\xd4\xc4\x6f\x0a\x4e\x40\x63\x90\
-\x10\xf7\x6e\xe3\x43\x02\xae\xef\x7d\x0a\xeb\xb1\x9b\x61\xf4\x50\
-\xe5\x68\x3d\xf0\x32\xcb\x62\x75\x59\xc0\x13\x05\x5d\x43\xf0\x2e\
-\xf0\x8b\x17\x5e\xe0\xfe\x3d\x7b\x50\x65\x0f\xdf\x12\xbc\xf2\x5d\
-\xaf\xe5\x8a\x4f\xbe\x85\xba\xa6\x21\xb4\xf7\x2c\xc8\xc3\xa6\xcd\
-\x40\x0b\xa4\x58\x02\xd6\x32\xb4\xdd\x89\x56\x1a\xa5\x14\x4a\x07\
-\x0c\xf5\xdc\x4f\xef\xf3\xbf\x44\xc9\xa8\x82\xd0\x0f\xbc\x7b\xcb\
-\x56\x7d\xdb\xf1\x2d\xa7\xe3\x83\x13\xd2\x1a\x78\x9d\x10\x56\xa1\
-\x83\x7b\xb2\x7d\x6c\x29\xef\x8b\x61\x22\x46\x1b\x31\x36\x62\x36\
-\x5f\xbd\x88\xc5\x78\xb4\xaf\x8f\x3b\x76\xef\xa6\xe4\x57\xb4\xc7\
-\x86\x57\x9d\xce\x5b\xbf\xf4\x47\x2c\xdf\xdc\x82\xf6\x9e\x80\xe0\
-\x20\xe8\x92\xc9\x23\xd0\x2e\x5a\xbb\x48\xe9\x23\x03\x9f\x40\x59\
-\x58\xc9\xf3\x10\xce\x1a\xa3\x0d\xb4\xc4\xcd\x0f\x70\x70\xc7\x8f\
-\xc9\x0f\xef\x2f\x5f\x52\x03\x9f\xd8\xb2\x55\x7f\xfe\xf8\x95\xd2\
-\xf1\xc1\x09\x21\xc0\xfb\x84\xf8\xb4\x86\x4f\x81\xb1\xf3\x6b\x80\
-\xb3\x81\xea\xa1\xa5\x2c\xc7\xa9\x29\xfc\xb2\xd7\xbf\xb7\x58\xe4\
-\x8e\x03\x07\xe8\xaf\xb2\xf3\xad\xab\xba\x78\xf3\xe7\xdf\xcd\x39\
-\xff\xf3\x02\xb4\xbf\x0b\xfc\xe7\x4d\xee\x80\x2e\x01\x6e\x44\x00\
-\x74\xc9\x10\xa0\x4c\x02\xe9\x81\xbd\x0c\x3b\x75\x11\x9a\x04\x4a\
-\x2b\x94\x0c\xe8\xdf\xf7\x5f\xf4\xef\xee\xae\x7e\xf4\x7f\x01\xfe\
-\x64\xcb\x56\xfd\x1b\x13\x3f\x38\xee\x04\xf8\x33\x21\xce\x57\x70\
-\x1f\x60\xc5\x80\xdf\x02\x5a\x6b\x9c\x27\x84\xa8\xf9\xd5\x8f\x01\
-\xf7\x0c\x0e\xf2\x62\xb6\xd2\x86\x13\xcf\x24\x79\xfd\x87\x7f\x9f\
-\x4b\x3f\x70\x25\xb1\x78\x1e\xed\x3f\x1b\xa6\x8a\x55\x04\x5e\x59\
-\x37\xdb\x4a\x79\x21\x09\xbc\x90\x04\x3e\x4a\x59\xd8\xa9\x0b\xb1\
-\xe2\xeb\x50\x5a\xa2\xa4\x24\x3b\xf0\x24\xbd\xcf\x8e\x9b\x04\xe3\
-\x76\xe0\x6d\x5b\xb6\xfe\x66\x34\x22\x9d\x08\x02\xbc\x5a\xc1\xdd\
-\x00\x9b\x81\xb3\xa6\x39\xd7\x8e\xc5\x2a\x1e\x7e\x2c\xc6\xa3\xc5\
-\x22\x4f\xe5\x72\x15\x3b\x2f\x04\xe7\xfd\xde\xc5\xbc\xe9\xb3\xd7\
-\xd0\xb4\xb4\x05\x2d\xf7\xa3\xbd\x43\x08\x2b\x00\xed\x4d\x10\xfa\
-\x04\x22\xe0\x12\x04\xde\x04\x4d\x60\xd6\x85\xb3\x86\x78\xdd\x25\
-\x61\xf7\x35\x49\x29\xbb\x8f\x9e\xed\xff\x4e\xe0\x95\xca\x8f\xf6\
-\x14\x70\xf9\x96\xad\xba\x67\x8a\x47\x7f\xc9\xe0\xb8\x13\xe0\x8f\
-\x85\x58\x69\xc3\x3e\x30\xaa\xff\xc2\x69\xce\x15\x96\x85\x1d\x8f\
-\xf3\x22\xf0\xa8\xe7\x51\xaa\x9a\x8a\x66\xf5\xcb\xd7\xf3\xd6\xeb\
-\xaf\x61\xcd\xf9\xa7\x82\xec\x47\x07\xc6\x5e\x4b\xe9\x83\x96\xd8\
-\x36\xe3\x49\x40\x85\x04\x5a\x95\x40\x7b\x55\x5a\xc0\x27\xf0\x7d\
-\xa4\xaa\x90\x01\xab\x95\x78\xe3\x1b\x80\x04\x4a\x29\x02\x77\x98\
-\x9e\xed\x3f\xc4\xcd\x0f\x97\x1f\xe1\x20\x86\x04\x4f\xf2\x12\xc6\
-\x71\x27\xc0\x75\x42\x58\x47\x4c\xa7\xd1\x25\x02\xb8\x0c\x98\x6a\
-\xf8\x8f\x23\xc0\x63\x42\x30\x5c\xf5\x8c\x8d\x5d\x8d\xbc\xe9\xba\
-\xdf\xe3\x15\xef\xb8\x18\xa1\x5d\xb4\xff\x02\xe8\x1c\x88\x38\x5a\
-\xd9\x28\x25\x91\xd2\x45\x08\x4d\x2c\x66\x1b\x12\xe0\x46\x64\x50\
-\xb2\x80\x96\x25\x04\x2e\x08\x69\x84\x1f\x6a\x82\xc0\xf7\xcc\x00\
-\x15\xca\x90\x40\x93\x22\xd1\x74\x39\xc2\x6a\x36\x23\x9b\x48\x97\
-\x43\xcf\xdf\x46\x2e\x1c\xee\x1e\x33\x0e\xc2\x5b\xb6\x6c\xd5\xbf\
-\x5c\xb8\x12\x5b\x58\x9c\x28\x27\xf0\x6a\x0d\xdf\x05\x58\x86\x99\
-\x6e\xb4\x1a\x79\xe0\x31\xa0\x7a\x16\x29\x27\xe1\x70\xe9\x9f\xbd\
-\x96\xd7\x7f\xf8\x8d\x24\x32\x29\x74\xb0\x1b\x82\xfd\x20\x62\x68\
-\x1c\x84\x48\xa0\x71\x90\x41\x10\x0e\x32\x51\xc2\xb6\x6d\xe2\xc9\
-\xd8\x38\x4d\x20\x83\x02\x4a\x16\x41\xba\x58\x4e\x80\xd6\x92\x40\
-\x7a\x04\xbe\x47\xe0\xf9\xf8\xd2\x43\x6b\x89\x56\x01\x52\xfa\x28\
-\x25\x48\x34\xbe\x01\x3b\x6e\x02\x99\x96\xdd\xc0\xe1\x9d\x3f\x62\
-\xf8\xe0\xa3\xe5\x47\xf3\x81\xad\x5b\xb6\xea\x9b\x17\xb4\xd0\x16\
-\x08\x27\x84\x00\x42\x08\xf1\xa7\xf0\x90\x86\x97\x03\x6c\x01\x56\
-\x61\x46\x98\xda\x0e\x3c\x17\xae\x97\x71\xd6\x15\x67\xf0\xe6\xcf\
-\xbd\x85\xf6\xb5\x9d\x20\x07\xd1\xfe\x53\xa0\x7d\xb4\x4e\x00\x0e\
-\x9a\x18\x58\x71\x2c\x2b\x89\xd6\x66\x8c\x22\x19\xb8\xc8\xa0\x44\
-\x32\x95\x26\x16\x0f\x35\x81\xf6\xd0\xb2\x84\xef\x67\x8d\x19\x50\
-\x1e\xb6\x23\x50\x3a\x20\x08\x3c\xbc\x92\x4b\x20\x7d\x82\xc0\x47\
-\xe8\x00\x45\xa8\x21\xa4\x24\x51\xff\x2a\x12\x99\xb3\x01\x41\x2c\
-\xb9\x92\xfe\x3d\xb7\x72\xe4\x85\x5f\x95\x1f\x51\x03\xd7\x6e\xd9\
-\xaa\xff\xe1\xb8\x15\xe2\x31\xc2\x09\x21\x00\xc0\x9f\x08\xb1\x45\
-\xc0\xbd\xe5\xed\x66\x20\x87\xf9\x9c\xca\x68\x5a\x0e\x97\x7d\xec\
-\x4c\xce\x7f\xfb\xbb\xb0\x84\x8d\x90\xcf\x83\xf7\x0c\x88\x84\x51\
-\xf9\x24\xd0\x58\x68\xe9\xa0\x71\x70\xe2\x19\x10\x31\x64\x20\x29\
-\x15\x46\x50\x81\x8b\xd6\x1e\x75\x4d\x2d\x58\x42\x45\xe6\x40\xfa\
-\x05\x7c\x37\x87\x56\xc6\x0c\x38\x31\x81\x94\x26\x97\xc0\x73\x4b\
-\x04\x81\x21\x01\x48\x10\xd2\x38\x87\x81\x4f\xa2\xee\x5c\x52\x8d\
-\x97\x20\xac\x24\xb1\xe4\x1a\x86\x7b\x7e\x42\xcf\xf6\x1f\x55\xbf\
-\xd6\x17\xb6\x6c\xd5\x1f\x3d\x2e\x05\x78\x8c\x70\xc2\xa6\x8f\xff\
-\x86\xd6\xdd\x1a\x3e\x4a\x38\x7e\xc0\x30\x15\xe1\x5b\x0e\xd9\xf3\
-\xde\x09\x97\x7d\x06\x36\xbc\x7a\x53\xd8\x75\x5c\xa3\xdc\xe7\x30\
-\x49\xa2\x66\x11\x04\x08\x14\x4a\x7b\x28\xe5\xe2\x7b\x79\x20\xc0\
-\x76\x04\xb1\x78\x1c\x8d\x44\xc9\x80\xec\xd0\x91\xaa\x3b\x0b\x2c\
-\x3b\x06\xc2\x32\xc3\xd4\x04\x01\x32\x50\x08\x4c\x93\xb2\x13\x8b\
-\x01\x02\x81\x40\x05\x20\x03\x10\xc2\x42\x08\x8b\x52\xf6\x11\xf2\
-\x43\x3f\x45\xab\x02\xd2\xeb\xa3\x79\xf9\x9b\x58\x7d\xee\xbb\xab\
-\xc7\x24\xf8\xab\xee\x6d\xe2\x3b\xdd\xdb\xc4\x09\xc9\xb6\x9e\x0b\
-\x4e\x18\x01\x00\xbe\xa1\xf5\x17\x80\xd7\x03\x7d\xc0\x61\x8c\x46\
-\xf8\xd2\xe5\x9f\xe3\xaf\x37\xfe\x96\xc9\xfd\x74\x9c\x38\x68\x8d\
-\x46\xa1\x54\x01\xad\x03\xd3\x1b\x48\x87\x24\x10\x0a\x74\x80\x56\
-\x3e\xd2\x2f\xa0\x82\x22\xe8\x80\x58\x22\x89\xed\x38\x68\xad\x08\
-\xfc\x12\xb9\xd1\xc1\x30\x8d\x5c\x20\x84\x20\x91\x48\x86\xc3\xd4\
-\x08\x4a\x45\x0f\xa5\x01\x21\xb0\x6c\x8b\x78\xc2\x90\x00\x01\x2a\
-\xd0\x48\x5f\x53\x4e\x66\xf1\x0a\xcf\x91\xed\xff\x11\x81\x7f\x18\
-\x25\xc7\xa8\xef\xb8\x98\xb5\xaf\xf8\x50\xf5\x64\x59\xef\x02\xfe\
-\x5f\xf7\x36\x31\xbe\xd7\xea\x49\x8a\x13\x66\x02\xc6\x3d\x84\x10\
-\xa2\x3a\x47\xbf\x7b\x9b\x78\x1f\xf0\x4f\x00\x9b\x2e\xbc\x9a\x4c\
-\xcb\x66\x2c\xcb\x46\x65\xbf\x8f\x6d\x3b\xe1\x6c\x65\x71\x10\x66\
-\x51\xda\xc6\x2b\x05\x68\x6d\x61\x39\x09\x12\xa9\x46\xc0\x42\x29\
-\xc9\xd8\x40\x0f\x81\x5f\x42\x49\x8f\xc6\xb6\x0e\x12\x49\x27\xf4\
-\x07\x7c\xdc\xe2\x18\x6e\x29\x8b\x0c\x7c\x2c\x1b\xe2\x49\x27\xac\
-\x06\x06\xf8\xbe\x4f\xa9\x28\x09\xbc\x1c\x52\x05\xa0\x25\xc2\x91\
-\xe8\xb0\xa9\xd2\x8e\x75\x50\xdf\x7e\x25\xf1\xcc\x19\x08\x91\xc0\
-\xcb\xef\x66\xf7\x43\x5f\xc2\x77\xa3\x3c\xc5\xfb\x80\x2b\xb6\x6c\
-\xd5\xc3\x9c\xc4\x38\xa1\x1a\xa0\x8c\x1a\x1d\x34\x22\x57\x40\x63\
-\x1b\x13\xa0\x7c\x94\x0a\xc2\xd6\xbb\x8a\x19\x80\x00\x4b\x68\x10\
-\x12\xa5\x7d\x02\xb7\x80\x96\x9e\xd9\x6f\x41\xba\xb1\x19\xad\x15\
-\x5a\x4b\x46\xfa\x0e\x86\x73\x16\x9b\xaf\x39\x91\x4a\x62\x09\x0b\
-\x34\xf8\x5e\x40\xe0\x06\x08\x2c\x84\x10\xd8\xb6\x20\x91\x4a\x61\
-\xc5\x5a\x40\x0b\x64\x00\xbe\x4b\xd4\x5f\x45\xfa\x7d\x8c\xf5\x7d\
-\x0f\x2f\xff\x34\xa0\x88\x67\xd6\xb2\xfe\xa2\x4f\x93\xa8\x8b\x46\
-\x45\xbd\x08\xb8\xb7\x7b\x9b\x98\xfd\x0c\x1a\x27\x00\x27\x05\x01\
-\x6a\xa0\x42\x00\x4d\x24\xc0\x72\xd3\xad\x52\x6a\x82\x29\xf0\x71\
-\x6c\x81\x96\x3e\x4a\x79\x78\x6e\x36\x3a\x16\x8f\x27\x48\x66\xea\
-\xcc\x98\xc4\x81\xc7\x48\xff\xe1\xaa\xdb\x08\x52\x99\x4c\x48\x30\
-\x4d\xb1\x50\x32\x51\x46\x21\x40\x08\x84\x28\x92\x4c\xd7\x63\x27\
-\x3a\x11\x42\xa0\x25\xf8\xae\x8e\x48\xa0\x82\x51\x46\x0f\x7f\x1b\
-\x37\x67\x06\x21\x71\x12\x9d\xac\xbb\xe0\x53\x64\x5a\xa2\x61\xef\
-\x4f\x03\xee\xeb\xde\x26\x66\x37\x76\xfe\x09\xc0\xc9\x4a\x00\xaf\
-\xbc\xa2\x82\x42\xe8\x03\xd8\xa6\x63\xb0\x32\xc9\x1c\x4a\x49\xa0\
-\x42\x02\xdb\xc1\x54\x0d\x95\x51\xed\x46\x3b\x48\x40\x52\xd7\xd8\
-\x1c\x65\x18\xe7\x46\x87\x29\x15\x2a\xe9\xe4\xb6\x63\x93\x48\x25\
-\xd1\x4a\x23\xa5\xa6\x94\x2f\x21\x84\xa0\xfc\x0f\xd5\x47\xba\x7e\
-\x09\x4e\xc2\x24\xb5\xca\x40\xe0\x16\x75\x94\x9c\xaa\x55\x91\xd1\
-\x43\xdf\xc0\x2b\x3c\x15\x5e\xaf\x91\x35\x2f\xff\x28\x8d\x5d\xd1\
-\xac\xa8\x2b\x30\x9a\x20\xca\x81\x38\x99\x70\xb2\x12\x20\xd2\x00\
-\x52\x16\x8d\x06\x50\x1a\x2d\x1c\xd3\x48\x13\x69\x82\x20\x3c\x35\
-\x40\x20\x89\xc5\x6d\x63\x2a\x02\x17\xaf\x58\xd1\x02\x02\x45\x43\
-\x4b\x1b\x5a\x99\xb1\xe8\x06\x0e\xf5\x52\x6d\x75\xd2\x75\x29\x6c\
-\xc7\x98\x1a\xb7\xe0\xe1\xb9\x81\x21\x41\xb8\x28\x6f\x27\x99\x96\
-\x8d\xc4\x53\xcb\x11\x80\x0a\xc0\xcd\xeb\x28\x73\x49\x6b\x9f\xe1\
-\x9e\xaf\xe2\x17\x9f\x05\x40\x58\x29\x56\x9c\x75\x2d\xad\xab\xa2\
-\x99\x53\x5a\x80\x5f\x75\x6f\x13\x97\x1d\x8f\xc2\x3b\x1a\x9c\xac\
-\x04\x88\x34\x80\x0c\x0a\x46\x45\xa3\x50\x3a\x16\xb5\xd9\x97\x49\
-\x60\x4c\x81\x21\x41\x2c\x66\x45\x35\x82\x62\x61\x94\x6a\x2d\x90\
-\x48\x26\x49\xd7\xd5\xa1\x51\x78\x6e\x91\x91\xaa\xac\x21\x80\x74\
-\x7d\x26\xd4\x34\x50\x18\x33\x63\x16\x19\x53\x00\x08\x4d\x50\x7c\
-\x9c\xba\xb6\x33\x89\x67\x56\x01\x66\x8c\xc3\x52\x4e\xa3\xa2\x88\
-\x55\xc0\xf0\xc1\x7f\xc4\x2b\x3e\x83\xf9\xa9\xc3\xd2\x53\xdf\x4d\
-\xd7\xa6\xdf\x89\x6e\x01\xfc\xb8\x7b\x9b\xd8\xba\x30\x45\x36\x37\
-\x9c\xac\x04\x88\x52\xb0\x7c\x37\x17\xfa\x00\x1a\x4d\xac\x22\x78\
-\x35\x99\x04\x96\xad\xb1\x6c\x81\x56\x01\x81\x9b\x47\xfa\x25\xaa\
-\x49\xd0\xd8\x6a\x1c\x34\xad\x15\x83\x47\x0e\xe3\x7b\x11\xcf\x88\
-\xc5\x1d\x92\xe9\x24\x68\x8d\x94\x8a\xfc\x68\x11\x51\xf5\x0f\xed\
-\xe1\x17\x1e\xa3\xb1\xfd\x65\xa4\xea\xd6\x98\x91\x69\x42\x12\x94\
-\x93\x87\xb4\x2a\x32\x76\xe4\x26\xdc\xfc\x93\x18\x47\x41\xd0\xbe\
-\xfa\x6d\xac\x3c\xfb\x8f\x08\x1d\x4f\x07\xf8\x6e\xf7\x36\xf1\x91\
-\xe3\x52\x8a\xb3\xc0\xc9\x4a\x80\x28\x23\x37\x70\xf3\x46\x5d\x6b\
-\x85\x26\x1e\x36\xf6\x48\xa4\x0c\xc2\x86\x9b\xf1\xfe\x40\x3c\x61\
-\xcc\x80\x56\x01\x6e\x29\x6b\x06\x08\x08\x17\xdb\x11\x34\xb7\xb7\
-\x81\x36\x29\x60\x47\xf6\x8f\x6f\xcd\xcd\x34\x64\x10\x96\x85\x96\
-\x1a\x37\xef\xe1\xbb\x41\xe4\x10\x22\x04\x4a\x0e\xe3\x95\x9e\x25\
-\xd3\x7e\x0e\xe9\x86\x75\xa6\xc3\x92\xd2\xb8\x39\x45\x39\x9f\x54\
-\x7a\x47\xc8\x0f\xfd\x14\x37\xf7\x30\xe5\x80\x76\x63\xd7\x25\xac\
-\xbb\xf0\x13\xe5\xf1\x8b\x04\x70\x7d\xf7\x36\xf1\x0f\x27\x43\xc0\
-\xe8\x64\x25\xc0\x21\x42\x3f\xc0\x2b\x56\x34\x40\xb9\x69\x56\xc9\
-\xc0\x8c\x3d\x1c\x04\x55\xfe\x80\x04\x7c\xe2\x09\x0b\xa5\xcd\xc4\
-\x13\x6e\x3e\x4b\xa5\xba\x68\xb4\x40\x43\x53\x13\xf1\x78\x02\xad\
-\x15\xd9\xd1\x51\xb2\x23\xa3\x91\x43\x27\x84\xa0\xbe\xa5\xc9\xe4\
-\x01\xa0\xc9\x0e\x17\x40\x85\x56\x20\xfc\x17\x94\x76\x23\xbd\x1e\
-\xea\xda\xce\x24\xd3\xb2\xd1\x8c\x73\xac\xa0\x38\xa6\x08\x5c\x73\
-\x21\xbf\xf8\x02\x85\xd1\xbb\x29\x8e\xdd\x5f\x7e\x0d\xd2\x8d\x1b\
-\x59\x7f\xd1\x67\x48\xd6\x47\x35\x84\x3f\x07\xfe\xab\x7b\x9b\x88\
-\x66\xc7\x38\x11\x38\x29\x09\xb0\x65\xab\x56\x84\x8d\x81\xa5\x7c\
-\x5f\x38\xc9\x84\x02\xab\xc9\x68\x00\x65\x34\x80\xef\x87\x44\x08\
-\x1d\x42\xa5\x24\x42\x48\x62\x31\x0b\x4d\x80\x5b\xca\x23\x03\x37\
-\x74\x06\xa5\x19\x5f\x48\x28\xda\x96\x76\x52\xee\x68\xda\xbb\xef\
-\x60\x48\x1e\x00\x4d\x3c\x6e\x53\xd7\xb4\x04\xad\x35\x32\x50\xe4\
-\x46\x4b\x94\xa3\x82\x65\x4d\xe0\x15\x9e\x44\xc9\x51\xea\x5a\x36\
-\x53\xdf\x76\x5a\xd4\x7d\xb1\x94\xd5\x78\x45\x43\x02\x2f\xff\x0c\
-\x6e\xee\x51\x8a\xa3\xbf\x46\x2b\xd3\xb9\x25\x96\x6c\x65\xed\xf9\
-\x1f\xa7\xa9\x2b\x4a\x85\x7c\x25\xf0\x78\xf7\x36\xf1\x9a\xe3\x56\
-\xb8\x13\x70\x52\x12\x20\xc4\x3e\x00\xbf\x98\x35\x6d\xf8\x5a\x23\
-\xac\xa6\xa8\x1a\x28\x03\x89\x96\x01\x81\x3f\x5e\x0b\x28\x25\x49\
-\xa4\x9c\x70\x2a\x3a\x49\xa9\x90\xc5\x7c\xfd\x65\x4d\xa0\x48\x65\
-\x92\x34\x36\x37\xa1\xd1\xf8\x25\x8f\xbe\x9e\xd0\xe5\xd0\xe6\xbf\
-\xba\xe6\x66\x9c\x58\x06\xa5\x35\xc5\x9c\x8b\xef\x05\x13\xfc\x01\
-\x45\x29\xfb\x10\x5a\xfb\x64\x9a\x37\x51\xdf\x69\xe6\x3e\xd6\xda\
-\xf8\x04\x6e\xce\x90\xc0\xcd\x3d\x81\x57\x78\x9e\xc2\xe8\xdd\xa8\
-\xc0\x38\x9d\xb6\x93\x60\xc5\x59\x7f\x4c\xd7\xc6\xab\x08\xfd\x82\
-\x0e\xe0\x97\xdd\xdb\xc4\x47\xbb\xb7\x4d\x1c\xf8\x68\xe1\x71\xd2\
-\x13\x40\x29\xf0\xdd\x7e\xb4\x52\x08\xbb\x29\x74\xfa\x14\x52\x05\
-\x04\x41\x40\xe0\xfb\x46\xf0\xb2\x42\x00\x27\x1e\x43\x4a\xe3\x1c\
-\x16\xb3\x63\x15\x0d\x80\x8c\x34\x41\xfb\xd2\x0e\x6c\x61\xa1\xb4\
-\xa2\xaf\xb7\x9f\x52\xbe\x14\xc6\x77\x34\xc8\x01\x9a\x97\x9c\x1d\
-\xd6\x0a\x34\x63\x03\x45\x53\xe5\x0b\xb5\x80\x10\xa0\x64\x9e\x52\
-\xce\xe4\x04\x64\x1a\x37\xd0\xb4\xf4\xec\x70\x14\x33\x70\x0b\x9a\
-\xe2\x98\xe9\xd1\x5c\xca\x3d\x82\xf4\x7a\x29\x8e\xde\x47\x50\xda\
-\x65\xde\x4c\x08\xda\xd7\xbe\x81\xd5\x2f\xff\x4b\x2c\x27\x0d\x26\
-\x11\xfa\xf3\xc0\x6d\xdd\xdb\xc4\x71\x1d\xdb\xf0\x64\x26\x40\x94\
-\x93\xed\x16\xfa\x4d\x0c\x5e\x24\x8d\x23\xa8\x0d\x09\x94\x92\x04\
-\x81\x8f\x94\xe3\x35\x80\x10\x8a\x58\xcc\x46\x2a\x49\xa9\x90\x47\
-\x29\x13\x1a\x8e\x48\x80\xc4\x76\xa0\x73\x45\x47\x38\x79\x85\xe2\
-\xe0\xee\x1e\xa2\x10\x9f\x56\x38\x4e\x81\x86\xb6\x4d\xa0\x08\x4d\
-\x81\x5b\xfe\xfe\x29\x87\x92\xa5\x77\x18\xaf\xf8\x1c\x00\xa9\xfa\
-\xb5\xb4\x2c\x7f\x85\x71\x22\x35\x78\x05\x4d\x7e\x44\x83\x92\x94\
-\xc6\x1e\x40\xca\x61\xdc\xfc\x76\xdc\xdc\xa3\x94\x9d\xc3\xfa\xb6\
-\xd3\xd9\xb0\xe5\xb3\x24\xea\xa2\x68\xf1\x15\xc0\xa3\xdd\xdb\xc4\
-\xcb\x16\xba\x70\xcb\x38\x99\x09\x10\xe5\xda\xb9\xa1\x1f\xa0\xb5\
-\x02\xab\xd9\x4c\x46\x85\x42\x06\xe6\xcb\x0f\x02\x6f\x9c\x1f\xa0\
-\x94\x24\x91\x8c\xa1\xa5\xa9\x31\x14\xb2\x39\x2a\x66\xc0\x10\x40\
-\x6b\x45\x63\x4b\x13\xe9\xba\x14\x5a\x6b\xc6\x46\x73\x0c\xf5\x8d\
-\x18\xcf\x1e\x8d\xf2\x7b\x69\xe8\x38\x15\x3b\x5e\x8f\xd6\x9a\x62\
-\xd6\xc3\x2d\x04\x44\x2e\xa1\xa8\xb4\x0e\x06\xbe\x09\x2f\x27\x32\
-\xcb\x69\x5b\xfd\x2a\xac\x70\x82\x2c\xbf\xa4\xc9\x0e\x28\xa4\x0c\
-\x28\x8d\xdd\x8f\x52\x39\x02\xf7\x40\xe8\x17\x98\x74\xf6\x78\xaa\
-\x83\xf5\x17\xfe\x35\x8d\x5d\xe7\x97\x5f\x77\x0d\xd0\xdd\xbd\x4d\
-\x1c\x97\x09\xb4\x4f\x66\x02\x3c\x58\x5e\x29\x65\xfb\x01\x85\xd6\
-\x55\x66\x00\x15\x55\x09\x03\xcf\x1f\x17\x1d\x54\x4a\x12\x4b\xc6\
-\x4c\x8d\x41\x29\x72\x63\xd9\xaa\x36\x84\xf2\x5f\x85\x46\xb1\x64\
-\x55\x38\x53\xa9\x86\xde\xdd\xbd\x04\x41\x39\xe5\x3f\x40\xfb\x07\
-\xe8\x58\x75\x11\x5a\x0b\x50\x90\x1d\x72\x51\x4a\x87\x83\x93\x55\
-\xcc\xb5\x9b\x7d\x14\x55\x76\xf4\x12\xad\x74\xac\xbd\x04\x2b\x9e\
-\x31\x13\x60\xf8\x30\xd6\xa7\xf0\xdd\x12\xc5\xd1\xfb\xd0\xaa\x84\
-\x0a\x46\x28\x8e\xde\x8d\x0a\xcc\x54\xbb\x96\x9d\x62\xe5\xd9\xef\
-\x63\xd9\xe6\x77\x21\x4c\xcd\x30\x01\x7c\xa3\x7b\x9b\xb8\xa7\x7b\
-\x9b\x98\x2e\x71\x7a\xde\x38\x69\x09\xb0\x65\xab\x3e\x08\xf4\x02\
-\x14\xb3\x03\x61\xa3\x90\xc6\x72\xda\x22\x3f\xa0\x9c\xbb\xef\x8f\
-\x23\x80\x59\x2c\x0b\x6c\xc7\x34\x09\xe7\xb3\x79\x82\x20\x18\x2f\
-\xfc\x70\x49\xa4\x12\xb4\x76\x9a\xa4\x4f\xdf\x0b\x38\xbc\xbf\x8f\
-\xf2\x90\xe5\xd2\x3b\x80\x93\xac\xa7\x65\xe9\xe9\x28\x4c\x5b\x41\
-\x76\xc0\x8b\x2c\x45\x19\x5a\xfb\x94\xc6\x1e\x44\x87\xaa\xdd\x8e\
-\xd5\xd1\xb9\xf6\x12\x12\xe9\x66\x53\x4d\x0c\x20\xdb\xa7\x29\x65\
-\xf3\x14\xc7\xee\x43\x6b\x1f\xad\x4a\x14\xc7\xba\x09\xdc\xbd\xe1\
-\x55\x04\x2d\x2b\x7e\x8b\x0d\x5b\x3e\x47\xb2\x2e\xea\x48\xfd\x2a\
-\x8c\x49\xf8\x5a\xf7\x36\xd1\xb2\x10\xe5\x7c\xd2\x12\x20\xc4\x43\
-\x00\x7e\x31\x8f\x0a\xc6\x0c\x01\x62\xcb\xab\x22\x80\xda\x04\x85\
-\x02\xe3\x10\x4e\x24\x41\x3c\x69\xe6\x1b\x50\x81\xa4\x90\xcd\x87\
-\x1a\xa1\x1c\x45\xac\x90\xa0\x63\xe5\x7a\x9c\xb8\x83\x46\x33\xd8\
-\x3b\x4c\xa9\xe8\x62\xdc\xbf\x00\xe9\xed\xa3\xa1\xfd\x74\x92\x99\
-\x56\x13\xf4\x29\x4a\xf2\x63\x95\x26\xe5\x32\x94\x1c\xc3\xcd\x3d\
-\x1e\x6d\x5b\x76\x82\xf6\xb5\xaf\x26\xd3\xb2\x24\x8c\x1a\x6a\x72\
-\x83\x8a\xec\xc0\x28\xc5\xb1\xfb\x0d\x59\xb4\xc2\xcd\x3d\x81\x9b\
-\x7b\x28\x4c\x57\x83\x44\xdd\x32\xd6\x5f\xf4\x69\x3a\xd6\xbd\xb1\
-\x7c\x0f\x1b\xf8\x53\x60\x67\xf7\x36\xf1\xde\xee\x6d\x13\x47\xc8\
-\x9c\x1f\x4e\x76\x02\x44\x66\xa0\x98\x35\xc1\x41\x61\x65\xc0\x6a\
-\x08\xbf\x72\x65\xe6\x1c\x9e\x64\x06\x42\x3f\x20\x13\x0b\x7b\x00\
-\x2b\x72\xa3\xd9\x2a\xcd\x31\x5e\x0b\x58\x76\x9c\xe5\xeb\x4f\x8f\
-\xec\xff\xe1\xbd\x95\x76\x02\xe9\xed\x05\x24\xed\xab\x2f\xc4\xb6\
-\x1c\xd0\x50\x18\x09\x08\xbc\xc9\x89\x34\x81\xdb\x83\x5f\xf6\xf4\
-\x01\x21\x6c\x5a\x97\x5f\x40\xe3\xd2\x70\x28\x22\x01\xc5\xac\x62\
-\xf8\xe0\x00\x85\xe1\x07\x4c\x08\x1b\x08\xdc\x5e\x0a\x23\x77\x22\
-\xfd\x23\xe1\x3b\xc6\xe8\xdc\x70\x25\xeb\x2f\xfa\x38\x89\x4c\xf4\
-\xe1\xb7\x62\x46\x32\x79\xa4\x7b\x9b\x88\x02\x09\xf3\xc5\xc9\x4e\
-\x80\x87\xca\x2b\xc5\xb1\xbd\xd1\x4e\x3b\xb6\xcc\x08\x53\x98\xb8\
-\xbd\x96\x12\xaf\xe4\x8d\xab\x0a\x2a\x25\xb1\x6d\x81\xe5\x58\x68\
-\x14\xb9\xb1\xbc\x99\x9a\x56\x49\xb4\x52\x11\x31\xb4\x56\x28\x39\
-\x44\x63\xd7\xb9\x64\x1a\xcc\x58\xc3\xd9\x91\x3c\xb9\x91\x3c\x65\
-\xfd\x2d\xbd\xbd\xd8\xf1\x7a\x5a\x57\x9d\x13\x4d\x6d\x93\x1d\x08\
-\xa8\xea\xa7\x12\xc1\xcd\x3f\x83\x0c\x06\xaa\xf6\x08\x1a\x3b\xce\
-\xa4\x7d\xcd\x59\x80\x00\x0d\x5e\x49\x33\xb0\xff\x08\xb9\x81\xbb\
-\x51\xaa\x00\x80\x56\x25\x4a\x63\xf7\xe3\x15\x9e\x84\x70\xe8\xa2\
-\x54\xc3\x29\x6c\xd8\xf2\xb7\x74\xae\x7f\x4d\xf5\xa0\xa8\xe7\x60\
-\x9a\x97\xbf\xd7\xbd\x4d\x2c\x99\x6f\x01\x9f\xb4\x04\x10\x42\x88\
-\x23\x83\x3c\x46\x98\x34\x9a\x1f\xaa\x0c\xd8\x61\x27\x56\x84\x5f\
-\xb3\xa9\xf2\x49\xa5\xf0\x6a\x68\x00\xa5\x24\xa9\x4c\x02\x29\x15\
-\x4a\x4a\x72\x63\x66\x3e\x63\xa5\x65\x54\x95\xd4\x4a\x47\x6d\x07\
-\xcb\x37\x55\xfa\x29\x1d\xde\x37\x88\x2a\x1b\x02\x77\x0f\x68\x49\
-\xa6\x79\x3d\xf5\xad\xe5\x28\x21\xe4\x86\x6a\x30\x00\x4d\x29\xfb\
-\x30\x4a\x15\xc7\xed\x4d\x37\xae\x67\xc9\x29\x17\xe0\xc4\x8c\x16\
-\x51\xbe\x66\x70\xff\x08\xc3\x3d\xff\x85\x0c\x9d\x41\x00\xbf\xb8\
-\x87\xe2\xc8\x5d\xa8\xc0\x64\x92\x09\x2b\x4d\xc7\xfa\x6b\x58\xbf\
-\xe5\xa3\xd4\xb5\x74\x54\x5f\xf2\x0f\x80\xe7\xbb\xb7\x89\x0f\xcf\
-\xa7\x9c\x4f\x0a\x02\x84\xed\xee\x56\xb8\x38\x42\x88\x18\x10\x7b\
-\xcb\x5f\x50\x54\x9a\x47\x00\xdc\x5c\x0e\xe9\x99\x2f\x2b\x96\x58\
-\x11\xda\xf1\x00\x44\xd8\xb7\xbf\xec\x0c\xca\xf1\x41\xa1\x54\x5d\
-\x22\xfa\xda\xb3\xc3\x39\xd3\xf3\xb7\x5a\x0b\x94\x89\x20\x87\x49\
-\x37\xae\xa7\xb9\xcb\x84\xe6\xbd\x92\xcf\xe8\x91\xb1\xb0\xc1\xc7\
-\x27\x70\x0d\x01\x5b\x57\x9c\x4f\x2c\x9e\x04\x05\x5e\x5e\x53\xcc\
-\x4e\x36\x05\x5a\xb9\xb8\xd9\x87\xd1\x8c\x27\x48\x3c\xb5\x94\x25\
-\x9b\x5e\x45\xb2\x2e\x19\xb5\x21\x8c\x1e\x29\x71\x64\xd7\xaf\xf1\
-\x4b\x51\xd8\x03\x25\x73\x14\x47\xef\xc1\x2f\x3e\x47\xd9\xe3\x4c\
-\xd6\x9d\xc6\xea\x97\x7f\x8e\xd6\x55\xe3\xba\xd1\x64\x30\xa3\x99\
-\xcc\x19\x27\x84\x00\x55\x02\xb7\x85\xa9\xf7\xc4\x30\x4d\xa5\xb1\
-\xaa\x75\x07\x70\x4a\x2e\xb7\x81\xd1\xc6\x85\xd1\xbd\xe6\xf7\x56\
-\x1a\x3b\xd6\x6e\xd4\x7c\xbc\x01\x25\x43\x2d\xe0\xfa\xe3\x73\x05\
-\x94\x44\xd8\x16\x89\x4c\x4b\x58\x1d\x2c\x10\x04\x7e\x24\xf8\xc8\
-\x17\x50\x0a\x15\x0c\xa3\xb5\x60\xe9\xfa\x2d\xd1\x94\xb5\x03\xbd\
-\x63\x26\xe4\x8c\x46\x96\x5e\x34\x89\xa1\x76\x92\x8e\x75\xe7\x95\
-\xa3\xc6\xfa\xdd\x3a\xd7\x00\x00\x10\x70\x49\x44\x41\x54\xe4\x87\
-\x14\xd2\x9f\xf8\x86\x20\x83\xa1\x30\x5f\x70\x3c\xec\x58\x0b\x5d\
-\x1b\x2e\xa5\xa9\xb3\xf2\x35\x97\xb2\x92\xde\xe7\x1e\xa6\x30\xb2\
-\x3d\xaa\x49\x20\x40\x88\x38\xd5\xce\x66\x61\xe4\x20\x23\x87\xa2\
-\xf0\x88\x07\xbc\x7d\xcb\x56\xfd\xad\x39\x8a\x01\x38\x8e\x04\x10\
-\x06\x96\x10\xc2\x66\xbc\x90\x6b\x09\xbf\xbc\x1e\x7b\x72\x27\xff\
-\x59\xbe\x46\x6e\x68\x6f\x74\xbd\x58\xd2\x24\x66\x38\xf1\x7a\x34\
-\x71\xb4\x52\xf8\x6e\x30\xc9\x0f\x50\xca\x23\xd3\xbc\x3c\x54\xf5\
-\x65\x2d\x10\xd6\x02\x42\x4d\xa0\xb4\x42\x05\x43\x68\x34\x4e\xa2\
-\x95\xae\x35\x66\x70\x53\x29\x15\x83\x87\xb2\x61\xf3\xb1\x8b\xef\
-\xee\x03\x0d\xf1\xf4\x12\x5a\x57\x6c\x40\x63\xbe\xe2\x91\xc3\x2a\
-\x6a\x51\xac\x86\x5f\xda\x83\xef\xee\x9f\xb4\x5f\x58\x49\x5a\x56\
-\xbe\x92\xce\x0d\xa7\x62\x3b\x61\x54\xd1\x87\xc3\xbb\x9e\x67\x60\
-\xef\x1d\x28\x39\x42\xaa\xe1\x95\x38\xc9\xb5\xe1\x2f\x34\x43\x3d\
-\x77\xb3\xe7\xe1\xbf\x41\x7a\x23\x60\x7a\xcf\xbd\x71\xcb\x56\x7d\
-\xcb\x5c\xe5\x51\xc6\x82\x12\x60\x82\xd0\x27\x0a\xdc\xa9\xb1\x2f\
-\x36\x71\xf9\xc8\x97\x39\x10\x48\x9e\x03\xc8\x0d\xee\x47\x87\x43\
-\xf9\xc5\x52\xa7\x00\x84\xde\xfe\x52\x94\x52\x04\x5e\x30\x29\x2c\
-\xac\x94\x24\x5d\xd7\x81\x49\x13\xd7\x64\x87\xf3\x91\xf0\x55\x55\
-\x8d\x40\xc9\x3c\x5a\x16\xd1\x5a\xd3\xba\xe2\x5c\xe2\x49\x93\xd6\
-\x3f\x36\x90\xc7\x2d\x85\xde\x7a\x69\x17\x51\x18\xb7\xe3\x0c\x52\
-\x0d\x4d\x26\x5e\xe0\x9b\x2a\x5e\x2d\xb8\xf9\x27\x91\x72\xa4\xc6\
-\x11\x41\xa6\xe9\x34\x96\x6d\x7e\x25\xc9\x86\x70\x68\x0c\x0d\xd9\
-\xfe\x1c\x7d\xbb\x9f\xc7\x2b\xf5\xa1\xb5\x87\x56\x2e\x87\x9f\xff\
-\x3e\x07\xb7\x7f\xbb\x5c\x6b\x18\x06\x5e\xb7\x65\xab\xfe\xc5\xdc\
-\xa4\x32\x1e\x0b\x42\x80\x59\x0a\x7d\xa2\xe0\xa7\x3a\x1e\x1b\xcd\
-\x19\x2d\xa0\x02\x8f\xe2\xa8\xa9\x66\x39\xf1\xa5\xd8\xb1\x56\xb4\
-\xf6\x89\xa7\x96\x86\x49\x9d\x0a\xaf\x54\x76\x06\xab\x92\x45\x44\
-\x40\xa6\x69\x05\x5a\x2b\x8a\xb9\x12\x7e\xc9\x33\x82\x8f\x7c\x01\
-\x59\xa5\x05\x14\x42\xc4\x59\xba\xc1\xe4\x70\x6a\x60\xa8\x37\x67\
-\x9a\xa4\x55\x09\xdf\x2d\x77\x59\x15\xb4\xaf\x39\x1f\x3b\x66\xe6\
-\x30\x2a\x8e\x69\xdc\x7c\x0d\x35\xa0\x25\xa5\xb1\x87\xd0\xda\x9b\
-\x7c\x0c\x70\xe2\x1d\x2c\xd9\x70\x29\xad\x2b\x57\x63\x85\x3d\x8c\
-\x0a\x23\x3d\xec\x7e\xf0\x06\x06\xf6\xfd\x5f\xf6\x3e\xfa\x79\xfa\
-\xf7\xfc\x22\x7c\x12\x0e\x05\x92\x4b\xb6\x6c\xd5\xf7\xcf\x4d\x32\
-\x93\x71\xcc\x08\x50\x65\xd7\x1d\xc2\x61\x7e\x6a\xfc\xad\x25\xfc\
-\xf2\xf1\x5a\x5a\xc0\x01\x9c\xc7\x76\x10\x75\xbf\xce\xf6\x55\xec\
-\x6a\x3c\x7d\x06\x28\x0f\x27\xd5\x82\x10\x29\xb4\x56\xb8\xc5\xc9\
-\xb5\x01\x29\x73\x64\x5a\xd6\x86\x66\x40\x33\x32\x90\x8d\x82\x41\
-\x91\x2f\xa0\x94\xf1\xc6\x95\x69\x73\xc8\xb4\xae\xa1\xae\xc5\xd4\
-\xb2\x8a\x39\x8f\x62\xd6\x03\xad\xf1\x8b\x2f\x50\xce\x06\xb5\x9d\
-\x3a\xda\xd7\x9d\x13\x99\xe9\x6c\x7f\x6d\x7f\x40\xab\x02\xa5\xec\
-\x23\x4c\x0a\x21\x96\xcb\xce\xce\xd0\xb1\xfe\x3d\x6c\x7c\xf5\xf5\
-\xd4\xb5\x9a\x0c\x72\xe9\x17\x38\xfc\xdc\x2f\xc8\x0d\xee\x36\xd7\
-\xd0\xec\xe9\xed\xe7\x35\x97\xfc\x11\x3b\x42\xdf\xe9\x98\xc8\x6e\
-\xde\x17\x29\x0b\x9e\x8a\x20\x67\x12\x7e\xad\xfd\x53\x69\x00\x07\
-\x88\x5d\xf7\x4d\x5e\x08\xa4\x99\x88\x7a\x6c\xe0\x45\x94\x34\x69\
-\xdd\x89\xcc\x66\x94\xcc\x61\x09\x4d\xa2\x6e\x05\x4a\x69\x7c\xd7\
-\x44\x06\xc7\x91\x20\xc8\x91\xaa\xef\xc0\x8e\x9b\xfe\x01\xa3\x43\
-\x79\x02\x3f\xac\x0a\x46\xb5\x01\x43\x00\x1d\x26\x8a\xa0\x34\x5d\
-\x6b\xcf\x8f\x26\xa5\x18\x3e\x52\x08\x47\x13\xcb\x13\x78\x95\x54\
-\xb2\x74\xfd\x2a\x9a\xba\x4c\xe8\xd6\x78\xf5\xb5\xfd\x01\xe9\xf7\
-\xe1\x15\x76\x4c\xda\x6f\x39\xcd\xa4\x1a\x2f\xc6\x89\xaf\x20\x96\
-\xec\x64\xcd\xcb\x3f\x4c\x43\xc7\xf8\x69\x8f\x95\xe2\x99\x07\xb7\
-\xf3\xba\x2b\x3f\xc2\x81\xea\xf2\x3b\x16\x44\x98\xd7\x8f\xc3\x9b\
-\xdb\x4c\x16\x7c\x2d\x21\xdb\xd4\xd6\x04\x53\x69\x88\x71\xc4\xe8\
-\x1f\xe2\x3f\xc0\xf4\xd5\xcb\x0d\x6c\x37\xf7\xb7\xd2\x38\xc9\x55\
-\x28\x99\x25\x59\xbf\x3c\xca\xd1\xf3\x4a\x15\x02\x98\xe4\x91\x31\
-\x34\x8a\xe6\xce\xf5\x66\x5e\x42\xa9\x18\x1d\xca\x55\xc6\x09\xd4\
-\x26\xa6\xa0\xfc\x31\x94\x72\xa3\x3c\x80\x58\xaa\x91\xd6\x65\x9b\
-\x01\xf0\x5d\x45\x6e\xd8\xb4\x03\x78\x85\x9d\x54\x4b\xb9\x79\xd9\
-\x39\x24\xeb\x4d\x10\x29\xf0\x34\x63\x7d\xaa\xe6\xc7\xee\x15\x77\
-\x12\x78\xbd\x61\xe1\xd9\x24\x32\xa7\x93\x6a\x7c\x35\x96\x6d\xe6\
-\x3a\x54\xc1\x30\x3d\xdb\xaf\x67\xac\x6f\x67\xf4\x1b\x25\x79\xfa\
-\x5f\xff\x83\x2b\x3e\xfc\xf7\x0c\x4c\x28\xeb\x68\x09\x89\x30\xa7\
-\x64\x92\x39\x11\x20\x74\xee\x6a\x3d\xcc\x74\x84\x98\x48\x86\xe9\
-\x04\x3f\x89\x08\xdf\xff\x19\xb7\xea\xd0\x03\x1b\xee\xad\x98\x81\
-\x44\xe6\x74\x64\x30\x82\x93\x6c\xc0\x8e\x99\xb1\x46\xbc\x92\xaa\
-\xd2\x00\x01\x81\x37\x88\xd6\x8a\xba\xd6\xd5\xa6\xbd\x5e\x69\x46\
-\xfb\xf3\xc6\x61\x0c\xd5\x7f\xb9\x6a\x28\xbd\xde\x8a\x16\xd0\x9a\
-\x96\x65\x9b\x71\xe2\x46\xb8\x63\x03\x9e\x69\x5b\x90\xd9\x71\x5a\
-\x40\x08\x87\x8e\x75\xaf\xc0\x8e\x9b\xe2\x74\xf3\x7a\x8a\x20\x11\
-\xb8\xb9\xc7\xb0\xec\x3a\xd2\x4d\x97\xe2\x24\xd7\x53\xb6\x1f\xc5\
-\xb1\xc7\xd9\x75\xff\xc7\x19\x3e\x18\xcd\x65\xa5\x47\x73\xdc\xf0\
-\x7b\xff\x9b\xff\xf1\xcd\x5b\xc8\x4e\x53\xa6\xd5\x44\xb0\x8e\x96\
-\x07\x47\x4d\x80\x09\x5f\xfd\x44\x81\x4f\x24\x43\xf5\xf1\x5a\x0f\
-\x3e\x93\x69\x88\x8e\xfd\xf8\x2e\x06\x87\x46\xf8\x15\x40\x29\x3b\
-\x88\x9b\x37\x02\x88\x25\xd7\x82\x76\xb1\x04\x24\x33\x2b\xd0\xca\
-\x7c\x85\x4a\xaa\x2a\x1f\xa0\x84\x0c\xc6\x10\x56\x82\xe6\xae\x53\
-\x40\x43\xe0\x2b\x72\x23\xc5\x2a\x5f\xc0\x90\x20\x70\x7b\x22\xe1\
-\x6b\x34\x96\xe3\xd0\xbe\xfa\x5c\xc0\x34\xe8\x8c\x0d\xf8\x68\xad\
-\x8d\x16\xa8\x82\x13\x6b\xa6\x6b\xfd\x39\x94\x7b\x8a\x17\x46\x27\
-\x07\x89\x84\x95\x24\xdd\xfc\x3a\x9c\xe4\x6a\x84\x95\x0c\xaf\x99\
-\x63\x60\xcf\x37\x79\xf1\x81\x2f\x87\x49\xac\xa0\x14\x83\xdb\x77\
-\xf1\x07\x97\xff\x19\x5f\x3a\x64\x62\x5f\x53\x0a\xbd\x96\x0c\x8e\
-\x46\x1b\xcc\x9a\x00\x55\xb6\xbe\x7a\xb1\x6b\x6c\x4f\x45\x8c\xd9\
-\x90\x61\x2a\x12\xc4\x00\xe7\x8e\x07\xf9\x61\xf9\x79\x46\x0e\x95\
-\xb5\x80\x85\x15\x33\x41\x95\x64\xc3\x32\xc0\xf8\x68\x5e\x51\x47\
-\x59\x43\x4a\x49\x02\x6f\x00\xa5\x15\x0d\x1d\xa7\x82\x15\x33\xbe\
-\x40\x7f\x21\xca\x11\xd0\x61\xbb\x40\xe0\x0f\xa2\x64\x71\x9c\x16\
-\xa8\x6b\x5d\x4e\xb2\xde\x38\x84\x85\x51\x89\x57\x50\x28\x39\x46\
-\xe0\x55\x0d\x71\x0a\x24\x32\xab\x69\x5b\x53\xb1\xdf\xd9\x01\x85\
-\x57\x32\x24\x88\xa7\x36\xd2\xd8\x75\x0d\xf1\xf4\xe9\x68\xe5\x12\
-\xb8\x3d\xb8\xb9\x27\xd8\xff\xe8\x47\x39\xf4\x7c\x77\xd4\xcb\xa8\
-\xe4\xf2\xe0\x3f\xdf\xca\x65\xef\xfd\x1c\xdd\x35\xca\x68\xba\xb2\
-\x1d\x27\x83\xd9\xfa\x06\xb3\x3a\x29\x64\xd4\x44\xe1\x4f\x14\x7a\
-\xad\xaf\x7e\xba\x7d\x53\x31\x7a\x4a\x53\xf1\x8f\x37\xf3\x7c\xb6\
-\xc0\xb3\x00\xa3\x87\x77\x98\x8c\x5f\x20\x91\x39\x03\x25\x73\x38\
-\xc9\x0c\x76\xdc\xb4\x9e\xb9\x05\xd3\xa6\x6f\xaa\x6f\x12\xe9\x0f\
-\x86\x91\x41\x87\xa6\xae\x53\xc3\x46\x19\xc9\xd8\x50\x31\x6a\x26\
-\x2e\xfb\x0c\x81\x7b\xc0\x64\x1f\x85\x03\x53\x80\xa6\x7d\xcd\x39\
-\x18\xab\x07\x63\x03\xd2\xa4\x7d\x15\x27\x4f\x3d\x58\xd7\x72\x3a\
-\xcd\xcb\xc2\x4c\x6f\x0d\xa3\x87\x14\x96\x7d\x01\x99\xd6\x37\x99\
-\x96\x4c\x8c\xad\x1f\xdc\xf7\x2d\x76\x3f\xf4\xf7\x64\x07\xa3\x18\
-\x81\x3a\xd4\xcf\xd7\xde\xf2\x17\x5c\xfd\x83\x9f\x33\xc8\xe4\x0f\
-\x6a\xaa\x8f\x6e\xca\x65\x36\x24\x98\xf1\x04\x51\x49\x7f\x99\xe9\
-\x86\x53\x9d\x33\x1b\x06\xcf\x64\xdf\x22\x12\x3c\xf2\x8c\x99\x8a\
-\x46\x2b\x8f\xd1\xde\xfb\xc3\x67\x4c\x60\xc7\xdb\xb1\x04\xa4\x9b\
-\x56\x86\x23\x7f\x84\x3d\x79\x01\xd0\xf8\xee\x91\x28\xe8\xd3\xd8\
-\xb9\x01\x3b\x96\x06\x60\xa4\xaf\x84\xef\x07\xe3\x9a\x87\x7d\xef\
-\xa0\xa9\x32\xea\xb0\x39\x48\x2b\x12\xa9\x3a\x9a\x96\x98\xe0\x93\
-\xf4\xa1\x30\xac\x50\xc1\x08\x81\x5f\x3d\xfa\x88\x29\xaa\xa6\x25\
-\xe7\x51\xdf\x6a\xfc\x11\xad\xe1\xc8\x0b\xf7\x33\xd6\xf7\x0c\xa0\
-\x28\x8e\x3e\x44\xcf\xf6\xef\xd0\xb7\x7b\x1f\x41\x18\x1a\x90\x92\
-\xc1\xbb\x1f\xe5\x3d\x6f\xfb\x08\x5f\x1b\xcd\xa1\xa9\x2d\xf8\xd9\
-\x0a\x7f\x9c\x1c\x66\x22\xc1\x6c\x34\xc0\x6c\xd8\x56\x7d\xd3\xa9\
-\x1e\x7e\xba\x97\x98\xad\x66\xb0\xbf\xf0\x1d\xee\x73\x7d\x06\x00\
-\x06\x0f\x3c\x82\x0a\x4c\x5b\x88\x93\x58\x8e\xb0\x53\xa4\x1b\x97\
-\x81\x16\x68\xcd\xb8\xc0\x8c\x92\x39\xa4\x3f\x64\xda\xff\x1d\x41\
-\xeb\x0a\x13\xee\xd5\x52\x33\x72\xb8\x54\xe5\x34\x2a\xa4\x37\x88\
-\x52\xf9\x70\x04\x11\x15\xf9\x03\x4d\x4b\x4f\xc1\x89\x1b\xe2\xe4\
-\x47\x34\x81\xab\xf1\x0b\x93\xb5\x80\xed\x34\xb1\xe2\xac\xbf\xa2\
-\x75\xb5\x69\xb8\xd1\x28\x0e\x3d\xf7\x13\x0e\x3c\xf5\x4d\x7a\x9e\
-\xbe\x93\xe2\x58\x25\x58\x30\x38\xc2\xcf\x3f\xf5\x0d\xde\xfa\xf1\
-\x7f\xe4\xe1\x59\x94\xdd\x6c\x3e\xc4\xf2\x79\xd1\x32\x9d\x4f\x30\
-\x2d\x01\xc2\x1f\xce\x66\xa9\x75\xf3\xe9\x1e\x6e\xb6\x0c\x9f\x44\
-\x80\x7c\x11\x9e\x7d\x91\x9f\x00\x28\x19\x30\x78\xe0\xd7\x84\xa5\
-\x6c\xa2\x83\x4e\x82\x64\x43\x7b\xa8\xe2\x19\x17\x98\x09\xdc\x03\
-\x46\x98\x4a\x51\xd7\xba\x82\x78\xa6\x09\x80\x62\x36\xa0\x98\xf3\
-\x29\x8f\x43\xa0\xb5\x32\x11\xbf\x2a\xe1\x6b\xad\x11\xc2\xa2\x6d\
-\xf5\xd9\xd1\xf5\xb2\x03\x9a\x20\x18\x42\xfa\x26\x81\x44\xd8\x69\
-\x12\xf5\xe7\x92\x6a\xba\x14\x3b\xbe\x9c\x25\x1b\xdf\x41\xe7\xba\
-\x4b\xa3\xf3\x0b\x23\x63\x51\x0e\x81\xeb\xb1\xef\xe7\xf7\xf2\x27\
-\x6f\xfa\x20\x7f\x7d\xd7\x23\x8c\xce\x50\x66\x53\x91\x60\xa6\xb2\
-\xae\xd6\x04\x35\x49\x30\x25\x01\xaa\x54\x7f\xad\x1b\x4e\xb7\xaf\
-\x16\x39\xa6\xda\x9e\xc9\x64\xd4\xd4\x12\x5f\xfc\x2e\x3f\x77\x3d\
-\x06\x01\x86\x7a\xb6\xe3\x15\x8d\x1a\xb6\xec\x46\x2c\xa7\x99\xfa\
-\xb6\x8d\x51\x6b\x5d\x71\xac\x52\x1d\x0b\xdc\x9e\x71\x4d\xb4\xed\
-\xab\xcf\xa1\x5c\x0d\x1b\x3d\xe2\x23\x03\x15\x25\x92\xfa\xc5\xfd\
-\x26\x3b\xb8\xdc\x2d\x2d\xac\xf7\xa7\x1b\x97\x90\x69\x36\x89\xa4\
-\xbe\xab\x29\x8e\x6a\x02\xef\x20\x89\xba\xb3\x48\x37\xbd\x16\x27\
-\xbe\x32\xba\x66\xe0\xf5\x51\xca\xef\x1c\x97\x3d\xa6\x35\xfe\xce\
-\x7d\xfc\x9f\x2b\xff\x92\x77\x7e\xfe\x5f\x78\x9c\xa9\x85\x3b\xd3\
-\xbe\xa9\x64\x30\xdd\x32\x09\xd3\x69\x80\x5a\x3f\xac\x75\xc1\xe9\
-\x04\x6d\xd5\xf8\xdd\x6c\x48\x32\x2d\x41\x7a\x8e\xe0\xdf\xf1\x20\
-\x37\x96\x4b\xb4\x7f\xf7\x5d\x80\x51\xf3\xf1\xf4\x29\x24\x32\x1d\
-\x24\xd2\xad\x68\x34\x5e\x41\x47\xbe\x80\xd6\x1e\xd2\xab\xd8\xec\
-\x44\xba\x85\xa6\x65\xa7\x01\x20\x03\x4d\x6e\xc8\x8f\x34\x80\x0c\
-\x46\x08\xdc\x23\x61\x82\xe8\xf8\xea\x5c\xdb\xaa\xb3\xa3\x91\xc1\
-\xf2\xc3\x82\x44\xe6\xb7\xb0\x63\x9d\xd1\xeb\x4a\xbf\x9f\xbe\x5d\
-\xff\x87\xe7\xef\xf9\x24\xa3\x87\x0f\x44\x41\xa1\xb1\x3c\xdb\xaf\
-\xbf\x91\xad\xd7\x7c\x8a\xef\x0d\x8e\x20\xa7\x78\xbf\xd9\x96\xcd\
-\x51\x2f\xb5\x94\xc0\x6c\x09\x30\x15\x9b\xa6\x23\xc9\x6c\xaf\x33\
-\x91\x24\xb3\xd2\x2c\x7f\xfb\x6d\xee\x1b\x18\x66\x3b\x40\x6e\x70\
-\x0f\x85\xd1\x3d\x80\x46\x88\x18\x4e\x62\x19\x4d\x4b\x37\x83\xd1\
-\xe0\xe4\x87\x2b\x02\x0c\xa2\xc6\x1c\x83\xa6\x25\xa7\x10\x4f\x9b\
-\x49\x4d\xf3\x23\x8a\x62\xb6\xec\x0c\xea\x9a\x5e\x3e\x80\x93\xec\
-\xa0\x63\xdd\x6b\x01\xd0\x4a\x72\x64\xd7\x2f\x91\x7e\x3f\x2a\x18\
-\x61\x60\xcf\xf7\xd9\x71\xd7\x47\x38\xb2\xeb\x9e\xa8\x6a\xe7\xf9\
-\x0c\xde\xf1\x00\x9f\xbd\xec\x7d\x7c\xe0\x27\x77\x73\x68\x16\x65\
-\x32\x9b\xb2\x9e\xaa\xec\xa7\xc3\xa4\xe3\x73\xed\x9e\x3c\x9d\xd0\
-\x8f\xe5\xcb\x4c\x7b\xdd\x7f\xbe\x95\xef\x7c\xec\xdd\x7c\x49\x08\
-\xec\xbe\x5d\xff\xc5\xaa\x73\x57\x23\x83\x21\x12\x75\x67\xa3\x64\
-\x96\x54\xd3\x73\x14\x87\x8f\x10\xb8\x9a\x52\x4e\x93\xac\x13\x04\
-\xde\x61\xb4\xf6\xc2\x64\x0b\xb0\x84\xa0\x63\xed\x79\xf4\x3e\x7b\
-\x07\x4a\xf9\x8c\xf5\x2b\x33\x54\x5c\x4a\x20\xfd\x01\x64\x30\x84\
-\xed\xb4\x00\x02\x3b\xd1\x45\x2c\xb1\x06\x3b\xd6\x4e\xba\x51\x93\
-\xed\xdf\x45\x61\x64\x37\xf9\xe1\xbd\x1c\x78\xfa\xdb\x14\x46\x7a\
-\xaa\xe7\x1d\xc2\x0f\x18\xdb\xbe\x8b\x5b\x3f\xff\x2f\xfc\xf8\xd0\
-\x00\x85\x29\xca\x6e\xb6\xe5\xad\x67\xd8\x2e\xef\x9b\x4d\xd9\x46\
-\xa8\xa9\x01\x6a\xa8\x8a\xe9\x1e\xf8\x68\x18\x38\x57\xd4\x24\xc6\
-\x7f\x74\xd3\xf3\xcc\x8b\xa6\x8d\xc0\xcd\xf7\x31\xdc\x73\x0f\x5a\
-\x79\xa8\x20\x47\xb2\xfe\x02\x5a\x96\x9b\x08\x9e\xd6\xa6\xda\x66\
-\x8a\x4c\x4d\xd2\x02\xf1\x54\x9a\xf6\x75\x61\x6f\x2c\x6d\x1a\x74\
-\xca\x5d\xbd\x03\xf7\x20\xf1\xf4\x26\xd2\xcd\xaf\x27\x59\x77\x3e\
-\x76\xac\xc3\xdc\x5e\x58\x74\x6d\xfc\x9f\x94\xb3\x35\x73\x03\x7b\
-\x22\xe1\xfb\x01\xd9\xc7\x76\x70\xd3\x1f\x7e\x9c\x6b\xde\xff\x05\
-\x6e\x3d\x34\x80\xcb\x64\x21\x4c\x57\x6e\xc7\xaa\x1c\x67\xbc\xce\
-\x94\xe3\x04\xd6\x88\xfa\xd5\x72\xd6\xc4\x14\xdb\xd5\x0e\x9c\x60\
-\xfa\xaa\xcd\xbc\x96\x25\x6d\xa4\xbf\xf7\x79\xbe\x9c\x8c\xd3\x82\
-\x80\x95\x67\xfe\x0e\xe9\xa6\xb3\x88\xa5\xd6\xa3\x82\x61\x7a\x9f\
-\xfd\x7b\x46\x0e\x1d\x40\x03\xe9\x46\x41\x5d\x8b\x85\xb0\x12\xa4\
-\x9b\x2e\x8d\xb4\x40\x19\x23\xbd\x4f\x33\x74\xd0\x84\x78\x6d\x27\
-\xc6\xb2\xcd\x6f\x20\xd5\x78\x2a\xb1\xd4\x06\x84\xa8\xcc\x67\x52\
-\xca\xbe\xc0\xe0\xfe\xdb\x19\xee\x79\x98\xf2\xb8\x81\x00\x41\x40\
-\xfe\xa9\x17\xf8\xf1\x97\xb6\x71\xdb\x81\xc3\xe4\x31\x09\xad\x1a\
-\xd3\x86\xa1\x8e\xf3\x22\xab\xee\x1f\x6d\x4f\x1c\x92\x6f\x3e\x04\
-\x38\x59\x16\xf1\x91\xab\xd9\xf2\xa6\x4b\xf8\x80\x11\x9c\xc3\xaa\
-\x73\xaf\x22\xd5\x70\x0e\x96\xd3\x8a\x5f\x7c\x91\x5d\x0f\x7c\x81\
-\xc0\x2d\x81\x80\xa6\x2e\xa3\xde\x63\xc9\xd5\xe1\xe0\xcf\x80\xb0\
-\xb1\xe3\x1d\x38\xb1\x0e\xfa\x5e\xbc\x93\xc1\xfd\x77\x01\x10\x4f\
-\xb7\xb2\xf2\xec\x3f\x24\x96\xec\xc4\x76\xda\xc8\xf6\x3f\x42\xff\
-\x9e\x5f\x50\x18\xd9\x33\xae\xac\x7c\x49\xee\x99\x17\xf8\xf9\xf5\
-\xdb\xb8\x6d\xff\x21\x72\x55\x42\xa8\x25\xfc\x89\xfb\xc6\x09\xe8\
-\x28\x7f\x77\xb4\xc4\x92\x13\xe5\x3d\x1d\x01\xaa\xbf\xee\x13\x26\
-\xdc\xd9\x9e\xf7\xdd\xcf\xf0\xbf\x36\xac\xe4\x75\x46\x70\xf5\xac\
-\x3e\xf7\x5d\x24\xea\x5e\x06\x58\x64\x07\xba\xd9\xf7\xd8\x77\xb0\
-\x63\xf5\xc4\x92\x0d\x34\x2f\x6b\x26\x96\x68\x20\xd9\x70\x11\x4e\
-\xac\x13\xcb\x69\xa2\x62\x0d\x25\x07\x9e\xfc\x26\x23\x87\x1e\x00\
-\x20\xd5\xb8\x82\x64\x5d\x0b\xa3\x47\x76\xa0\x82\xf1\x59\x3d\x23\
-\x59\x76\x3d\xb4\x9d\xdb\xff\xe9\x66\xee\x1d\x1a\xc3\xad\x21\xb0\
-\xb9\x7c\xb9\x53\x09\xbf\x16\x49\xa6\xfc\xd2\x6b\xed\xd3\xd5\xea\
-\xaa\x2c\xe7\xe9\x86\x8a\x5d\x60\x2d\x30\x6b\xe1\xce\x62\x9f\x48\
-\x25\x88\xdd\xfc\x45\x3e\xd9\xd6\xc4\x66\x80\xba\xd6\x25\xac\x3c\
-\xeb\x5a\xec\xb8\x69\xc4\x29\xe5\xfa\x28\x8c\x84\xf1\x02\x47\x90\
-\x6e\x10\x08\x2b\x61\x5a\x13\x23\xe1\x83\x52\x25\x0a\x23\xbb\xe8\
-\x79\xea\x5b\xf8\xa5\xc9\xa3\xbc\x4a\x85\xbb\xb7\x97\xee\xdb\xee\
-\xe2\xf6\x1f\xdd\xc1\x6e\xa6\x17\xfa\x4c\x24\x38\xae\x24\xa9\x31\
-\x22\xeb\x8c\x04\x38\x1a\x21\x4d\xb4\xfb\xf3\x21\xc1\x24\x01\x4f\
-\x73\x4e\xf4\x77\xc3\x2a\x1a\xbe\xf6\x51\xbe\x98\x4e\xd2\x05\xd0\
-\xb2\xf2\x74\x96\x9e\x7a\x6d\x64\xeb\xf3\x83\x7b\x71\x8b\xa6\xc9\
-\x35\x16\x17\x24\xea\x04\x88\x38\x5a\xda\xe4\x47\x9e\x27\xd7\xff\
-\x34\x63\xfd\xcf\xa3\xd5\xe4\xfc\xbd\x5c\x81\x9e\x27\x77\x72\xc7\
-\x37\x6f\xe1\xae\x3d\x07\x23\x35\xaf\xa7\xf8\x3b\xdd\xfa\xd1\x12\
-\x60\xae\x24\x19\xb7\xd4\xfa\xfa\x61\x06\x02\xc0\xbc\x4c\xc1\x4c\
-\xbf\x9b\xe9\xcb\x9e\xea\x78\xad\x73\xa2\xfd\x97\xbf\x8a\x15\x1f\
-\xb9\x9a\xeb\x1d\x9b\x34\xc0\xb2\xcd\x97\x51\xdf\x71\x09\x2a\xc8\
-\x13\x78\x23\xf4\xef\xbe\x17\xbf\x38\x44\xe0\x8f\xa1\xd4\x18\xca\
-\xaf\x91\xc4\x67\xa0\x47\xb2\xec\x7a\x61\x3f\x0f\xfd\x67\x37\x0f\
-\xdd\x7e\x1f\xe5\x11\x24\xca\xcb\x44\xc1\x4f\x47\x82\x99\xc8\x70\
-\xac\x08\x32\xd1\x1c\x28\x8c\xdd\xaf\x29\x7c\x98\x05\x01\xa0\xa6\
-\x29\x38\xa6\xea\x7b\x16\xc7\x6a\x05\x88\x6a\x12\x00\xe0\x43\x7f\
-\xc8\x79\xbf\x7b\x29\x9f\xe2\x28\xab\x53\x4a\x13\x0c\x8e\xb0\x7d\
-\xc7\x6e\x1e\xbc\xf5\x0e\x1e\x7c\x6c\x07\xc3\x8c\x17\xfa\x54\xcb\
-\xd1\x90\x61\xae\x84\x38\x1a\xe2\x54\x7f\xf9\xd5\x93\xaf\x4c\xc2\
-\xac\x87\x8b\x3f\x0a\x12\xcc\x46\xe8\xd3\x09\xbe\x96\x70\xa7\xfa\
-\x5b\xbd\x8c\xdb\xf7\xd5\xff\xcd\x5b\xcf\x3d\x95\x77\x4f\xf7\x4e\
-\x52\x51\x38\xd4\xcf\x43\xbd\xfd\xec\xda\xb1\x9b\x5d\x3f\xfb\x35\
-\x2f\xf6\xf6\x53\xa2\x12\x64\xa9\xfe\x3b\x71\xbd\x5a\xd8\xb3\x21\
-\xc3\x6c\xb4\xc3\x7c\xb4\x45\xad\x63\x93\xbc\xfe\x89\x38\xaa\xf9\
-\x02\xa6\x30\x07\xc7\x4a\xe0\x53\x7d\xd1\xb3\x16\xfa\xc4\xe5\xdb\
-\x9f\xe6\x5d\xe9\x14\x2d\x25\x97\x5c\xc9\x23\x57\x28\x92\xcf\x17\
-\xc9\x1d\x1e\x64\xf0\xce\x87\xd9\xf3\xdc\x6e\x2a\xa3\x46\x8f\xc7\
-\x54\x04\xa8\x45\x84\xe9\x08\x31\x9d\x9f\x30\x5f\x32\x4c\x47\x8e\
-\x69\xd5\x7e\x35\x8e\x7a\xc2\x88\x30\x4a\x58\x76\xf8\x66\x63\xb3\
-\x67\x52\xe7\x33\xa9\xf6\x5a\xc7\x8e\x66\xa1\xc6\xdf\xd9\x62\x3a\
-\x0d\x30\x1b\x93\x30\xd3\xfa\x74\x5a\x62\xae\x64\x90\xb5\xbc\xfd\
-\xa9\x70\xd4\x6d\x01\xe1\xb5\xa5\x10\x42\x63\x04\x52\x7e\x81\xea\
-\xf5\xf2\x52\x8e\x4f\xab\xaa\xe3\x13\xf7\x95\xff\x8a\xaa\xed\x99\
-\xd4\xfd\x74\x84\x60\xc2\xdf\x5a\xc2\x9f\x89\x08\x7a\xc2\xfa\x4c\
-\x1a\x61\x2e\x64\x98\x4a\xe8\x73\x25\xc3\xac\xbf\xfa\x6a\xcc\x6b\
-\xca\x98\x50\x1b\x4c\xf5\xd5\x1f\xad\x5d\x3f\x2a\x1b\x5f\x63\x61\
-\x9a\x6d\x98\x3d\x01\x26\x0a\x7f\xaa\xbf\x73\x31\x09\xd3\x99\x83\
-\xf9\x98\x8a\x9a\x75\xfc\xd9\xe0\x98\xcc\x19\x54\x83\x08\x33\x91\
-\x60\x4e\x8e\xdd\x2c\x16\x6a\xac\x57\xff\x9d\xb8\x3e\x1d\x26\x0a\
-\x7d\xe2\xbe\xf9\x9a\x05\x98\x3d\x19\x6a\x69\x87\x59\x39\x79\x33\
-\xe1\x98\x4e\x1a\x35\x81\x08\xb3\xb5\xef\x4c\x71\xce\x6c\x54\x3e\
-\xb3\x5c\x67\x9a\xf5\x5a\x38\x5a\x2d\x30\x71\x7b\xbe\x66\x61\x3a\
-\x52\x94\xa3\x7a\x33\xbc\xc2\xec\xb0\x60\xb3\x86\x4d\xa8\x31\xd4\
-\x12\xde\x4c\x36\x7e\xaa\xfd\x4c\xb1\x7f\x3a\xfb\xcf\x84\x63\xb3\
-\xc1\xc4\x82\x99\x8a\x00\xd5\xeb\x53\x91\x62\x2a\x73\x70\x34\x64\
-\x38\x2a\xe7\x6e\xb6\x58\xf0\x69\xe3\x6a\xa4\x95\xcf\x45\xe8\x73\
-\x55\xf9\xc7\xc2\x04\x54\xaf\xcf\xc7\x27\x98\xc9\x47\xa8\xb5\x2d\
-\x81\x85\x90\x7b\x84\xe3\x3e\x6f\x60\x95\x66\x98\x8b\xc0\x8f\xd6\
-\xe1\xab\x45\x80\x5a\xdb\x13\x51\x4b\xf8\xd5\xeb\x33\x69\x81\x89\
-\xdb\xb3\x25\xc3\xbc\x1c\xba\xb9\xe0\x84\x4e\x1c\x39\x41\x3b\xcc\
-\x64\xe3\x67\x4b\x02\x26\xac\xcf\xd5\x0c\xcc\x44\x82\xf2\xfa\x7c\
-\x08\x50\x76\xe6\x16\xf6\x33\x9f\x06\x27\xc5\xcc\xa1\xd5\x98\xd0\
-\x17\xa1\x9a\x10\x1c\xc5\x7a\xf5\xdf\xe9\xd6\xa7\xc2\x54\xf6\xbf\
-\x7a\x7d\xa2\xb0\x6b\xed\x9b\x52\xc5\x9f\x2c\xe5\x7e\xd2\x11\xa0\
-\x16\x26\xf4\x51\x98\xad\x1f\x40\x8d\xed\xa3\x71\x02\x61\xea\x2f\
-\xbf\xbc\x3d\x91\x00\xb5\x9c\x3d\x4e\xe6\x32\x7e\x49\x10\x60\x3a\
-\x54\x25\xb0\xce\xd6\x14\x1c\xad\x06\x98\xe9\x2b\x3f\xa9\x05\x3c\
-\x13\x5e\xf2\x04\x58\xc4\xfc\xf0\xff\x01\x2d\xef\xe5\x5d\x30\x5e\
-\x26\x51\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x2b\xc0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1b\xaf\x00\x00\x1b\xaf\
-\x01\x5e\x1a\x91\x1c\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xd7\x0c\
-\x1b\x16\x02\x38\x83\x98\xbe\x76\x00\x00\x00\x06\x62\x4b\x47\x44\
-\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\x2b\x4d\x49\x44\
-\x41\x54\x78\xda\xec\x7d\x0b\x98\x1d\x47\x75\xe6\xa9\xee\x7b\xef\
-\xbc\x47\xa3\xd1\x73\x34\x92\x2c\x4b\xb2\x34\x7a\x58\x96\x25\x5b\
-\xd8\x18\x6c\x24\x1b\x1c\xb2\x21\x60\x20\x76\x78\x85\x04\xb0\x9c\
-\x00\xbb\xd9\x0d\x21\x6c\xbe\xdd\x4d\x80\x04\x16\xf2\x65\x13\x76\
-\x93\xfd\x92\xdd\x95\x8d\xf1\x02\x1f\xb6\xc3\xe2\xe5\x65\xcb\x18\
-\x59\x0f\x83\xf1\xfb\x25\x8d\xde\xb2\x2c\xcf\x68\x46\xf3\x7e\xdc\
-\xb9\x73\x5f\xdd\xb5\xe7\xd4\xdc\xfa\xaa\x7b\xce\xed\xee\x7b\xaf\
-\xee\x05\x99\x9d\x63\x97\xba\xbb\xba\xfb\x76\x57\xfd\x7f\x9d\x73\
-\xea\x54\x75\x0d\xcc\xc9\x9c\xcc\xc9\x9c\xcc\xc9\x9c\xcc\xc9\xff\
-\x97\x22\xa0\x42\x91\xe0\x97\xdb\x01\xac\x4d\xb8\xfd\x1d\x4c\x1b\
-\x61\x4e\x6a\x21\xdd\x98\x1e\xc4\x74\x04\xd3\x03\x00\x6e\x35\x80\
-\x14\x95\x00\xdf\x8d\x60\xb7\xe2\xb6\x1e\x40\xa4\x30\xad\xc4\xfd\
-\x53\x85\x7d\x98\x93\x9a\x4b\x23\x80\x5c\x8b\xe9\x5c\x61\x3f\x8d\
-\x69\x62\xa6\xe1\xb9\xa2\x46\x04\x20\xc6\x89\xab\x31\x0d\xcf\xb4\
-\x74\x11\x03\xb0\x53\xcd\xcd\x96\xed\xba\x56\x46\x4a\xcb\xb1\x6d\
-\x01\xb1\x98\x88\x03\x40\x0c\xe6\xa4\x16\x92\xc7\x94\x53\x3b\x79\
-\x69\x3b\x8e\xac\x13\xc2\x75\x2c\xcb\x6d\x4c\x26\x5d\x3c\xe7\xa0\
-\x66\x90\x0b\x00\xdc\x17\x70\x7b\x3b\xa6\xaa\x10\x40\x16\xae\xeb\
-\x9b\x69\xe1\xb1\xb6\x44\x22\xe6\xda\x76\x5c\xc6\x62\x71\xe9\x38\
-\x71\xb7\xae\x2e\x1e\x6b\x6c\x8c\xdb\xf1\x78\x42\x02\x08\x1b\xe6\
-\xd4\x40\xad\x84\xb0\x70\x80\x2a\xd9\x96\xd0\xd9\x29\x1d\x29\x73\
-\xd0\xd3\x93\x96\x43\x43\x19\x91\xcf\xe7\x2c\xc7\xc9\x8d\x65\xb3\
-\xf9\x46\xa4\x48\x07\x5d\x8e\x29\x0a\x8b\x58\x89\x24\xb1\xd2\x00\
-\xf1\xfa\x96\x96\x44\x5e\xca\x7a\xb9\x78\xf1\xfc\x6c\x47\xc7\x6d\
-\xd0\xd0\xf0\x0e\x29\xe5\x95\xe9\x54\xaa\x35\x3b\x3a\x9a\x00\x29\
-\x6b\x5f\x09\xbf\xa4\x6b\x64\x85\xef\x23\xab\xfe\x5e\x3c\xdf\x8a\
-\xc7\xa1\xb1\xb5\x35\x6b\x37\x37\x4f\xd9\xab\x57\x77\xdb\x00\xfb\
-\x12\xbd\xbd\x0f\xe4\x7f\xf1\x8b\x81\xfa\xba\xba\x74\x7a\x72\x32\
-\x5b\x50\x16\x2e\xdd\x5a\xb1\x06\x90\x05\xf0\x2f\x20\xf8\xf9\xe6\
-\xe6\x86\x78\x22\xd1\x94\xbb\xf6\xda\x0f\xda\x1d\x1d\x9f\xb1\x5b\
-\x5a\x16\xbb\xb9\x1c\xb8\x53\x53\x90\xbd\x70\x01\xd2\xe7\xd0\x22\
-\x49\x79\xd1\xe0\x8a\xda\x00\x5e\x39\x38\x95\x83\x6e\xce\x57\xf9\
-\x9c\x55\x57\x07\x2d\x9b\x36\x41\x7c\xfe\x7c\x88\x35\x35\xa9\x63\
-\x37\x9d\x1e\xce\xf7\xf5\xfd\x5d\xe2\xa7\x3f\xfd\xdf\xb9\x64\x32\
-\x19\x4b\x26\xa7\x97\x14\x48\x20\x42\x1e\x13\x8b\x00\x9f\x54\x7f\
-\x5c\x36\x35\x35\xc4\xda\xdb\xe7\xbb\x37\xdd\xf4\x37\xcd\x5d\x5d\
-\xef\xb3\x12\x09\xc8\xa7\x52\xe0\x4c\x4e\x82\x10\x02\xc4\xd0\x50\
-\xe5\xa0\xd7\xa6\xa5\x44\x4b\xad\x00\xaf\xdd\xbb\x9b\x6b\x84\x00\
-\xbb\xb1\x51\x81\x6f\x53\x6a\x6e\x86\x78\x73\xf3\x02\x67\xf9\xf2\
-\x2f\x4d\xc6\xe3\xdb\xe2\x0f\x3f\xfc\x59\x47\x4a\xe8\xc3\xc6\xd9\
-\x01\x90\xa5\x7b\x82\x48\x10\x0b\xb3\xfb\x83\x74\xbe\xa5\xa5\x4e\
-\xc4\x62\x2d\xf2\xad\x6f\xfd\x6a\xeb\xce\x9d\x0a\x7c\x27\x99\x84\
-\x98\x10\x9e\x1b\x24\xb8\x8e\x53\x53\x15\x2f\xab\x0f\x30\xff\xcd\
-\x1a\x3c\x5b\xd6\x80\xd4\x42\x4a\xb0\x1a\x1a\x08\x78\x22\x00\x11\
-\x41\x11\x22\xbe\x60\x01\x42\x21\xdf\x37\xd4\xdf\x9f\x6d\x3a\x70\
-\xe0\x73\x88\x9d\x3b\x38\x39\xe9\x2e\x02\xc8\xcb\x00\x7f\x20\x16\
-\x66\xf7\xf1\x64\x3c\xe5\x38\x8d\xd6\xb6\x6d\x77\xb4\x5e\x79\xe5\
-\xfb\xe9\x21\x22\x1e\x57\x0c\x74\xf1\xe1\x6e\x26\x03\xae\x65\x41\
-\x6c\xf5\x6a\x58\xb8\x70\x21\xc4\x17\x2f\x06\xc0\xe3\x2a\x48\x6d\
-\x5b\x74\x6d\x9f\x5f\xf3\x86\xe0\x26\x93\x4a\xed\x03\x99\xe0\x54\
-\x8a\x9c\x42\x10\xd9\xac\xc2\x83\x30\xaa\x5f\xb5\xea\x03\x63\xe7\
-\xce\x3d\xdd\x74\xf6\xec\xfd\xf5\x08\xbe\xc7\x17\x90\x25\x11\x80\
-\xfa\xf4\x6d\x08\xe5\x74\x53\x53\xa2\xae\xb5\xb5\x4d\xae\x5c\xf9\
-\x19\xab\xbe\x1e\x1c\x54\x29\x62\xd9\x32\x80\xae\x2e\x10\xf8\xb0\
-\x26\xb4\x41\xa2\xb5\x15\x26\x7b\x7b\x21\x33\x36\x06\xd3\xd9\x2c\
-\x31\x10\xe6\xa4\xb6\x42\x58\xc4\x10\xe8\xe6\x8e\x0e\xa8\x9f\x37\
-\x0f\xb2\x23\x23\x90\x41\x3f\x4c\x9e\x3a\x05\x12\xc9\x11\xc7\xc6\
-\x28\xdb\xdb\xff\x2c\xd6\xd3\xf3\x48\xb2\xa9\x29\x8d\xb8\xe5\xc6\
-\x02\x1c\xc2\x58\x10\xf3\x86\xe8\x9c\x94\x75\xa9\x85\x0b\xdf\xd3\
-\xd2\xd6\xb6\x84\x98\x96\x6f\x6b\x03\x81\xaa\x87\xfa\xfa\x75\xd8\
-\xea\x47\x4e\x9e\x84\xd1\x27\x9f\x04\xe9\xba\x30\x27\xbf\x7c\x19\
-\x43\xc0\x9b\xb1\x41\x2e\xbd\xf6\x5a\xc8\x0c\x0f\xc3\x94\x6d\x2b\
-\x73\x1c\x43\xcd\x60\xcf\x9b\xd7\x31\xd4\xde\xfe\xdb\xed\x03\x03\
-\xf7\x01\x40\x66\xed\x8c\x19\x00\x51\x8a\x06\x18\xa3\xd6\xdf\xd8\
-\x68\xa3\x9d\x4f\xe4\x5b\x5b\x6f\x26\x80\x53\xd8\xba\x01\x53\x0c\
-\x1f\xd4\xb0\x66\x0d\xf4\x3d\xfb\x2c\x24\xcf\x9f\x87\x39\xf9\xd5\
-\xca\x64\x4f\x0f\xd8\x68\x0e\x16\x6c\xd8\x00\xe3\x2f\xbf\x0c\xd3\
-\xa8\xa5\xed\xe9\x69\x40\xbf\x0d\x9c\xfa\xfa\x9b\x11\xc3\xef\x10\
-\x96\x63\xa9\x94\xd5\x06\xe0\x46\x6a\x80\x2f\x00\x88\xdd\x98\xb2\
-\xae\x6b\xa3\x6d\x49\xb8\x20\xb7\x60\x3f\x1f\x72\xe4\xf8\x0d\x0d\
-\x29\x3b\x3f\x8e\xc0\xd3\x83\xe7\xe4\xd2\x90\xf1\xd3\xa7\xa1\x65\
-\xc5\x0a\xb2\xfd\x30\xf6\xfc\xf3\x90\x45\x73\x9c\x48\xa7\xc1\x11\
-\xe2\x2a\x07\x20\x41\x58\x4e\x03\x88\xff\x8a\x89\x94\x7c\x28\x01\
-\xfe\x92\xbc\x7f\x4c\xf5\x96\x65\xb9\x52\xc6\x9c\x74\xa6\x75\xa2\
-\xfb\x08\x40\x43\xa3\xf2\x3a\x1b\xd7\xaf\x87\xe1\xe3\xc7\x01\xe6\
-\xd4\xfe\x25\x23\x2e\x62\x31\x7e\xe6\x0c\x24\xd0\x1f\x38\xbf\x77\
-\xaf\x72\x0e\x85\xe3\xc0\xc2\xa6\xa6\x36\x89\x18\x12\x96\x08\xb4\
-\x20\x6c\x3f\x1f\x42\x00\xc3\x28\x00\xd1\x68\xdb\x16\xe4\xf3\xb1\
-\xa9\xfe\xbe\xba\xb1\xbe\x7e\xd0\x32\xff\xfd\xef\x07\x27\x9f\x87\
-\x39\xb9\xb4\x84\x9c\xf0\x66\xd4\x02\xd3\x14\x9f\x29\x98\xe6\xfa\
-\x65\xcb\xea\x00\x09\x80\xe6\xc0\x22\x4c\x17\x95\xda\x0d\x14\x98\
-\xf2\x52\x0a\x89\xbb\xd3\x93\x49\xc5\x30\x2d\x0e\xc0\x9c\xd3\x77\
-\x09\x4a\x1e\x55\x3e\x8e\xc7\x80\x40\x7f\x40\xcb\x54\x12\xb1\x53\
-\x61\x03\x29\x44\x39\x91\xc0\x76\x00\x31\x4e\x37\x49\x69\xe5\xd2\
-\x69\x7f\x1f\x34\x93\x99\xeb\xea\x5d\x82\x22\x1d\x07\x74\x84\x30\
-\x57\xc8\xcb\x12\x76\x33\xa6\x5c\x10\xa6\x65\x85\x82\x5d\x50\x77\
-\x88\x3c\xaa\x7b\x39\xeb\x41\x73\xf0\x5f\x72\x62\x1a\xa5\x10\xa0\
-\xf1\x21\xec\xdc\x44\x42\x70\xbc\xa2\x7d\x00\x05\x3e\x25\xaf\xfa\
-\x87\x39\xf5\x7f\xe9\x4a\x11\x5c\x1c\xcc\x23\x0c\x01\x13\x61\x3a\
-\xbf\x14\x02\x9c\xc2\x34\x8d\xa9\xb1\x40\x00\x1f\xf8\x05\x02\xcc\
-\x51\xe0\x52\x13\xd3\x30\xa5\xd1\x00\x6a\xab\x7c\x00\x4c\x29\xc2\
-\xb6\x14\x02\xf4\x60\x5a\x50\x30\x01\x16\xfe\x2f\x01\x6a\xaa\x01\
-\x1c\x4c\x8f\x9f\x3d\x0b\xcf\xbe\xf6\x1a\x4c\x62\x00\xe3\xf2\x25\
-\x4b\xe0\xb7\x37\x6e\x84\xc5\xe8\xcc\xfc\x3a\x49\x3f\xda\xe3\x1f\
-\x76\x77\xc3\x99\x81\x01\x68\x45\x3b\xbd\x03\xfb\xec\x37\xad\x5c\
-\x09\x76\x55\x09\xc0\x3a\xfa\xb4\x6f\xb9\x1a\xdb\x52\x4d\xc0\x3c\
-\x4c\x79\x63\x57\x8c\x54\x59\x03\xd0\x33\xee\x7b\xe9\x25\xe8\xc5\
-\x2e\x4c\x4b\x4b\x0b\x2c\xc6\x71\x85\x21\x24\xc1\x3f\xfd\xec\x67\
-\xf0\xc1\xed\xdb\x61\x0d\xe6\xfd\x3a\xc8\x71\x2c\xdf\xfd\x2f\xbc\
-\x00\xf5\x18\x46\x5f\x82\x04\x77\x1c\x07\x0e\x61\xf0\xe6\x2c\xc6\
-\xf0\x3f\xbc\x65\x0b\xc4\xaa\xe4\x03\x88\x82\x06\x30\xe0\xab\x13\
-\x60\x17\x30\x1d\x2e\x95\x00\x59\x00\xea\x01\x08\x04\xda\x62\xa3\
-\x53\x55\xd2\x00\x39\x4c\xf7\x1f\x3b\x06\x79\x6c\xe9\xef\x7c\xe7\
-\x3b\xe1\x8a\x2b\xae\x80\x3a\xdc\xef\xef\xef\x87\x17\xb0\xb2\x1e\
-\x3a\x7a\x14\x6e\x43\x4d\xb0\x1a\x5b\xcb\x1b\x59\x4e\x4e\x4e\xc2\
-\x0f\x4f\x9c\x80\x2d\x57\x5d\x05\xdb\xb6\x6d\x83\xc5\x18\x49\x4d\
-\xa3\x36\x38\x81\x79\xcf\x63\xd4\xee\x7e\x2c\xe7\x1d\x38\xb8\x16\
-\x93\xf2\x62\x09\xa0\x31\xf2\x6d\x09\x43\x0b\xb1\x24\x4c\xa1\x0c\
-\x02\x40\xbc\xe0\x3c\x14\x33\x01\xb2\x0a\xe0\x7f\x17\x07\x32\x00\
-\x23\x8b\xef\xba\xf9\x66\xb8\x0a\x2b\xa7\x09\xc7\xb4\x85\x10\x8a\
-\x08\xab\x71\xa0\x69\xdf\xbe\x7d\xf0\x23\x8c\x6d\xff\xd6\xda\xb5\
-\xb0\x0a\x47\xbf\xde\x88\x72\x1a\xe3\xf2\x8f\xbc\xfa\x2a\x5c\xbb\
-\x63\x07\xec\xda\xb5\x0b\x96\xe1\xc0\x4d\x2c\x16\x23\xb0\x54\x39\
-\x97\x2f\x5f\x0e\x8f\x3d\xf6\x18\x7c\x17\x07\xd5\xde\xbb\x66\xcd\
-\xc5\x91\x80\x1c\xbe\xe2\x43\xc9\xc2\xc5\x94\x2b\x77\x46\x90\xf0\
-\x6c\x64\x15\x09\x90\x47\x90\x1f\x42\x7b\x4f\xc3\xc8\xb7\x16\xc0\
-\x6f\x34\xad\x5c\x69\x81\xcb\x2e\xbb\x0c\x6e\xbd\xf5\x56\x55\x59\
-\x7b\x5f\x79\x05\x7e\x03\x8f\x57\x26\x12\xf0\x46\x92\x33\x68\xca\
-\x7e\xf2\xfa\xeb\xb0\xfd\x9a\x6b\x14\xf8\x1d\x38\x74\x6b\xdb\xb6\
-\x31\xb3\x18\xb6\xdd\x8e\x66\x8e\xca\x48\x24\xf8\x3e\xfa\x41\xef\
-\x5a\xb9\x92\x48\x50\xb9\x0f\x20\x44\xb1\x29\x76\xa2\x82\x49\xa1\
-\xc6\x7b\x94\x55\x24\x00\x81\xff\x23\x1c\x44\xb2\x10\xfc\x5d\x6f\
-\x7b\x1b\x6c\x41\xfb\x67\xc0\x37\x42\x15\x45\xad\xe5\x96\x5b\x6e\
-\x51\xfb\x8f\x1d\x3e\x0c\xb7\x74\x76\xc2\x0a\xac\xac\x37\x82\x9c\
-\xcd\x64\x60\x3f\x9a\xb2\x6d\x08\xf0\xdb\xb0\x9c\x4b\x97\x2e\x35\
-\xe0\x1b\x51\x5a\x6f\xeb\xd6\xad\x40\xb2\x7f\xff\x7e\xf8\x71\x6f\
-\x2f\xfc\x26\x96\xdb\x76\xdd\xaa\xf5\x02\x1c\xde\x9b\x8b\x26\x40\
-\xbd\x0e\xf9\x56\xd1\x04\x10\xf8\x7b\xd1\x03\x16\xc8\xfc\x5d\x37\
-\xdd\x04\x9b\x37\x6f\xf6\x83\xcf\x49\xa0\x5a\xcd\xce\x9d\x3b\xd5\
-\xfe\x7e\xf4\xa0\x77\xa2\xfd\xec\xb4\x2c\xb8\x94\xe5\x5c\x2e\x07\
-\x87\x70\xc8\x7c\xeb\xd5\x57\xc3\x8d\x37\xde\x48\x4e\x9f\x01\x9f\
-\x0b\xd5\x81\x22\x81\x85\xe5\x3a\x78\xf0\x20\xec\xc5\x89\x1d\xef\
-\x58\xb4\xa8\x6c\x12\x18\x87\x9d\x9b\x00\x41\x98\x96\x4a\x80\x55\
-\x05\x27\x50\x31\x47\xca\x62\x26\xa0\x22\xf0\x1f\x43\x8f\xd7\x42\
-\xf0\x6f\x7a\xeb\x5b\x61\xe3\xc6\x8d\x0c\xfc\x30\x12\x50\x45\xd2\
-\xfe\x21\x74\x98\x6e\xc4\x59\x48\xcb\x84\x80\x4b\x51\x5e\x77\x1c\
-\xf8\xf9\xf8\xb8\x32\x6b\x37\xdc\x70\x03\x03\x3f\x8c\x04\xa4\x0d\
-\x89\x04\x87\x0e\x1d\x82\x7d\xa3\xa3\xb0\x0b\xeb\xaa\x2c\x12\xe8\
-\x6b\x85\xf0\x3b\x82\x88\x61\xbe\xa0\xcd\x57\x95\x4a\x80\x13\x98\
-\x5c\xea\x3e\x04\x98\x80\x72\x28\x40\x2a\xe9\x20\x4d\x52\x40\xe0\
-\xa8\x52\xba\xba\xba\x18\xf8\xa5\x90\xe0\xad\x48\x1c\xaa\xa0\x27\
-\x71\x28\xfa\x7a\xec\x1e\x2e\xbd\xc4\xc6\x23\xce\x4b\x09\x4f\x25\
-\x93\x70\xe5\x95\x57\xc2\xf5\xd7\x5f\xcf\xc1\x8f\x26\x01\x69\x45\
-\xe5\x08\x3f\x89\xb3\xac\x0e\xa5\x52\x70\x63\x7d\x3d\x01\x5b\x96\
-\x06\x90\x7c\x22\xaa\x28\x60\x09\xe1\x04\xe0\x27\x84\x53\x85\x40\
-\xd0\x6b\x58\x08\x0b\xc1\xbf\xfe\x4d\x6f\x52\xe0\x37\x60\x5f\xb8\
-\x5c\x21\xe0\xa9\xfb\x44\x04\xa2\x4a\x7d\x06\xbb\x50\x3b\xa8\x4f\
-\xed\x38\x97\x06\xf8\x98\x9e\x45\xbb\xbf\x09\x01\x7c\x13\x96\x13\
-\xdf\x95\xde\x99\x40\x21\x40\xcb\x22\xc1\xa6\x4d\x9b\xd4\xbd\x4f\
-\x3f\xfd\x34\xf4\xe0\x76\x39\x36\x9e\x70\xe1\xb8\x48\xbf\x2f\x67\
-\x11\x96\x65\x3b\x81\xf9\x5c\x4e\x3b\x0f\x17\xa5\x01\x12\xe8\xc1\
-\x5f\x8f\xdd\x9d\x75\xeb\xd6\x55\x00\xbe\x61\x36\x01\xbf\x08\x6d\
-\xe3\x75\xd7\x5d\xa7\x2a\xe8\x39\xec\x46\x5e\x83\x4e\xe1\xc2\x5f\
-\xf1\xdc\x84\x0b\xf8\x2e\x2f\x22\x11\x37\xa0\x59\xbb\xf6\xda\x6b\
-\xe9\x1d\xbd\xe0\x57\x44\x82\x0d\x1b\x36\xa8\xf2\x8e\xe0\xb8\xbe\
-\xdb\xdd\x5d\x1e\x01\x78\xdc\x46\xe4\x31\xc5\xcb\x21\x00\x71\xae\
-\x0e\x13\xeb\x05\x54\x10\x08\xba\x12\x9d\xa1\x79\xed\xed\x50\x5f\
-\x5f\x5f\x09\xf8\x8c\x04\x34\xfd\x7c\xc7\x8e\x1d\x6a\xff\x45\x24\
-\xc1\x56\x22\x41\x36\x0b\xbf\x0a\x19\xc0\x67\xbf\x8c\xdb\xf5\x5d\
-\x5d\xd4\xa5\x53\xef\xa6\x41\xd7\x5b\x2d\xe5\x92\x60\x3d\xce\xbc\
-\x9a\x44\x32\x0d\x60\x0f\xa8\x24\xd1\x44\xe3\x66\x40\xe5\x4e\x95\
-\xab\x01\x94\x13\x58\x85\x5e\x40\x13\x82\x43\x61\x5e\x0a\x7f\xba\
-\xae\x5b\x21\xf8\x26\x4f\x93\x80\x2a\x9c\x5a\xda\x61\x9c\x0a\xb5\
-\x39\x91\x80\x05\xe9\x34\xfc\x32\x65\x10\x9f\x79\x04\x09\xb0\x7e\
-\xed\x5a\xe5\xc5\x2f\x58\xb0\x80\xde\x87\xbd\xb3\x21\x82\xda\x2f\
-\xd9\xe4\xb5\x62\x57\xd9\xe9\xef\xa7\xfa\x2e\x2b\x0e\x60\x86\x83\
-\x0d\x01\xdc\x72\x4d\x40\x4b\x61\x44\x50\x56\x21\x10\xd4\x8f\x11\
-\xbd\xc5\xd8\x42\xe2\xf1\x38\x85\x40\x89\x04\x65\x82\xcf\x49\x40\
-\x15\x44\x24\xb8\x1a\xb5\x0b\xed\x1f\xc3\x20\xca\x06\x1a\xee\x44\
-\xc7\xe9\x97\x21\x43\xa8\xcd\x8e\x63\xba\x62\xf5\x6a\xe5\xbd\xb7\
-\xb7\xb7\x33\xa0\x3d\x5a\x80\x9d\x8b\x02\x5f\x69\x4b\xbc\xbe\x1f\
-\x63\x03\xb2\x02\x27\xd0\x6c\x0d\x86\x2d\xe5\x10\x20\x57\xe8\x36\
-\x08\x29\x2f\x3a\x10\x34\x85\x76\xec\xd4\x77\xbf\x0b\x5d\x1f\xf8\
-\x00\x15\x4c\x93\xa0\x62\xf0\x49\x74\xa5\x52\xab\xa3\x2e\x17\x55\
-\xda\x49\xfc\x38\x75\x1d\xe6\xcf\x43\xa7\xa9\x96\x32\x82\x7e\xcc\
-\x29\x0c\x61\xaf\x59\xb5\x4a\x79\xed\xf3\xe9\xe3\x18\x21\x02\x5b\
-\x7e\xb4\x26\xe0\xe0\x53\x74\xf0\xd8\xfd\xf7\xc3\x54\x6f\x6f\x45\
-\xdd\x40\x1f\x66\x84\x21\x3e\x30\x57\xce\x58\x40\x0a\x93\x4d\xa9\
-\x4a\x81\xa0\x81\xe7\x9e\x03\x81\x85\x5b\x7f\xc7\x1d\x8c\x04\x0c\
-\xfc\x32\x49\x40\xad\x8f\xba\x5e\x64\x1a\xce\x60\xe8\x75\x35\xe6\
-\xb5\x4e\x4c\x40\x2d\x64\x0c\x23\x77\xaf\xb6\xb5\xc1\x6a\x74\x6c\
-\x29\x96\xd1\x86\xfb\x1e\xf0\xc3\x81\xe7\xfb\x81\xe0\x9f\x78\xf0\
-\x41\x18\x78\xe6\x99\xca\x22\x81\xc5\xc7\x02\x20\x55\xae\x06\x88\
-\x11\xf8\xbc\x1b\x48\xc0\x55\xe6\x2d\x3f\xf5\x94\x52\x6b\xeb\x7f\
-\xf7\x77\x19\x09\xca\x04\x9f\x55\x30\xb5\x42\xdd\x7d\x3a\x87\xa1\
-\xe6\xcb\xf0\x7c\x0b\x06\x64\xaa\x29\xe3\xe8\xc7\x9c\x43\xb3\xb3\
-\x6a\xc5\x0a\xea\xce\x52\x2c\x3f\x08\x7c\xb6\x0d\x21\x01\x07\xff\
-\x81\x07\xa0\xff\x17\xbf\xa8\x7c\x3e\x00\x37\x01\x16\xe6\x95\xae\
-\x01\x9e\xf3\x38\x81\x76\xb1\xd0\xe2\x45\xcc\x07\xe8\xc3\x82\xd1\
-\x8b\x76\x7d\xf0\x83\x5e\x12\x54\x02\x3e\xab\x78\x02\x84\xba\x4f\
-\x54\x99\xbd\x58\x91\x9d\x78\xae\x09\xc7\xe1\xab\x21\x49\xfc\xed\
-\x5e\x8c\xe7\xaf\xec\xec\xa4\xee\x2c\x39\x68\xc1\x2d\xdd\x2f\x91\
-\x24\x20\xcd\xa5\xc1\x3f\x8e\x6a\xbf\x0f\x83\x40\x15\x89\x94\x5e\
-\xf5\xcf\xc6\x03\x14\xb6\xa5\x6a\x80\x44\x81\x49\x6e\x0d\x66\x04\
-\x11\xbb\xa9\xf0\x1b\x3e\xf4\x21\x4d\x02\xea\x21\x50\x5e\xe5\x7e\
-\x81\xf1\x9c\x09\x20\x55\xa9\xfd\x58\xa1\x1d\xd4\xa5\x1a\x1d\x29\
-\x7f\x55\x24\xe9\x05\xbf\x0d\xfa\x11\xf8\xe5\x38\x48\xb3\x76\xed\
-\x5a\x0d\x3e\x7b\x7e\x08\xe0\x81\xe6\x80\xde\x99\x46\x3f\x95\xcd\
-\xff\xce\x77\xa0\xff\xe7\x3f\xbf\xb8\x09\x21\xbc\x17\xa0\x30\x14\
-\x05\x4c\x65\x39\x04\xc8\x62\xb2\x00\x44\x2d\x66\x04\x11\xcb\xe9\
-\x85\x37\x7e\xf8\xc3\x8a\x04\xd3\xd3\xd3\x44\x02\x06\x72\x69\xe0\
-\x73\x12\xac\x59\xb3\x46\xed\x5f\x40\x22\x2c\x01\x09\x8d\x23\xc3\
-\x15\x7d\xef\x3d\x35\xbf\x1d\x06\x2f\x5b\x05\x9d\x18\x8a\x5e\x85\
-\x4e\x5f\x73\x73\x73\x31\x13\xa4\xf3\x4a\x36\x01\x24\x1a\x7c\xea\
-\x1d\x1d\xfb\xf6\xb7\xe1\x7c\x28\xf8\x95\x47\x02\x89\x12\x6e\x01\
-\xd3\x4c\x39\x1f\x86\xc8\x7c\x5e\xb8\xb6\x2d\xcc\x8f\x56\x77\x4e\
-\xa0\x62\x3b\x91\xe0\x23\x1f\x51\x11\xc2\x54\x2a\x45\x24\xa8\x10\
-\x7c\x4e\x82\xcb\x2f\xbf\x5c\xed\x0f\xc6\x6c\xd5\x04\xea\x87\x06\
-\x43\x14\x00\xe7\xc7\x74\xfb\x42\x18\x5e\xb3\x16\x3a\x16\x2f\xa6\
-\xf9\x09\x14\xcb\xa0\xdf\x63\xcf\x2f\xc7\x04\xe8\xfb\xb4\xcd\x4f\
-\x24\x12\x70\xf4\x5b\xdf\x82\x3e\x9c\x02\x77\xb1\x22\x03\x06\x83\
-\x30\x57\x10\x96\xa2\xfc\x09\x21\x7a\x46\x10\x27\x80\x84\xea\x88\
-\x2a\x38\xfe\xde\xc6\x8f\x7e\x94\x48\x40\x9a\x80\xe6\xb2\x57\x02\
-\x3e\x53\x85\x04\x18\x01\x47\x95\x3d\x1c\x8b\x43\x3b\x48\xa8\x1f\
-\x1c\x28\x69\x45\xac\xd4\xc2\x45\x30\x72\xc5\x7a\x58\x82\x91\xb8\
-\x15\x2b\x56\x44\xb5\xfc\xb2\x6d\x3e\x45\xfa\x08\xfc\xee\x6f\x7e\
-\x13\xfa\x9e\x78\x02\xb8\x54\xee\x03\x60\x81\xfd\xf8\x54\x32\x1f\
-\x80\x20\x70\x30\x05\x47\x02\xab\x27\xe7\x91\x04\x54\x39\x9b\x7e\
-\xff\xf7\x69\x4b\x9a\x40\xf7\x0e\xe8\xf8\xa2\xe2\x04\x04\x1c\x01\
-\x48\x24\x18\xb5\x49\x13\x1c\x81\xc4\x40\x1f\x84\x49\x7a\xe1\x12\
-\x98\xdc\xb0\x19\x96\x2c\x5c\x48\x93\x52\xf4\x54\xb5\xa0\xf7\x29\
-\xcb\xfb\xa7\xf7\xa0\xdf\x53\xe0\xdf\x77\x1f\x9c\x2f\x1b\xfc\xe8\
-\x48\xa0\xe0\x3e\x80\xc2\x30\x5f\x0e\x01\xd2\xd4\x0d\x2c\x74\x21\
-\x58\x24\x50\x4a\x95\xaa\x29\x54\x11\xf4\x9b\x9b\xff\xe0\x0f\xe8\
-\xd0\x6b\x0e\x2a\xf6\x0b\x48\x34\x09\x68\xee\x1d\xb5\xbc\x51\x34\
-\x07\xf3\x0e\x4b\x88\xf7\x9f\x2f\xba\x1c\x59\x66\x49\x07\x24\x37\
-\x5d\x05\x8b\x10\x7c\x9c\xc5\x43\x2d\x95\xa9\xf6\x88\xae\x5f\x10\
-\x29\xe8\xf9\x06\xfc\x6f\x7c\x03\x7a\x71\xdc\xbf\xaa\xe2\x71\x02\
-\x67\x61\x66\x59\x1a\xd3\x72\x34\x80\x35\x6b\x2c\x80\xb6\xc2\xb6\
-\x6b\xf6\x75\xd0\x79\xaa\x10\x22\xc1\xc7\x3e\x06\x24\x53\x53\x53\
-\x44\x82\xca\x9d\x42\x23\x64\x5e\x68\x4e\x81\x6a\x81\xe3\x57\x6d\
-\x87\x16\x2a\x78\x7f\x0f\x78\x25\xbb\x64\x19\xa4\xf0\xdc\xc2\xf6\
-\x76\x1a\xce\xa5\x7b\x82\x5a\x3d\x03\x39\x2a\x8f\xbc\x7c\x02\x9f\
-\x9c\xbe\x23\xf7\xde\x0b\xbd\x07\x0f\xd6\xe4\x13\x71\x45\x6a\x4b\
-\x14\x9d\x14\x4a\x98\xc6\xca\x5d\x26\xae\x90\xfc\x5c\x92\xb2\x66\
-\x9f\x87\x51\xc5\xd0\x6f\x5f\xf9\x89\x4f\x00\x49\x32\x99\xac\x0a\
-\x09\x08\xf8\x86\xc2\x9c\x7c\xda\x9f\xd8\xbe\x03\x1a\x9f\x93\x10\
-\xeb\x7b\x1d\x48\x72\x1d\xcb\x21\xbd\xed\x3a\x68\x6f\x6b\xa3\x31\
-\x06\x72\xd0\x02\xc2\xb5\xac\xe5\x47\x9a\x00\x7a\x1e\x69\x21\xfa\
-\xcd\xc3\xf7\xdc\x53\x0b\xf0\x8d\x0f\x00\x82\x22\xae\xcc\x04\x40\
-\xb9\x3e\x40\x63\x61\xea\xf6\xec\xf9\x00\xc2\x12\x35\xd3\x00\x46\
-\x13\x60\x05\x49\x24\xc1\x9d\xbb\xa9\xd5\x68\x12\x54\x25\x58\x44\
-\x20\xe8\xf1\xfa\xe4\x8e\x1b\xc0\x7a\x86\x4c\x0f\x96\x75\xc7\x5b\
-\xa0\xad\xb5\x95\xc2\xca\x1a\xfc\x30\x7b\x1f\x40\x04\x76\x1d\xa9\
-\x7d\x72\x46\x0b\xe0\xdf\x0d\xbd\x07\x0e\x18\xac\xaa\xaf\x02\x48\
-\x65\xb3\x38\x80\xd6\xe2\x84\xa9\x5b\xb2\x09\xf0\x3b\x10\x26\xc6\
-\x2c\x2c\x70\x69\xaf\x16\x04\x10\x66\xd3\x87\x24\xa0\xed\x66\x24\
-\x81\xd6\x04\xd8\x3b\xa8\x64\xf8\x98\x81\x45\x6a\x98\x06\x91\x08\
-\x9c\xa9\xeb\xdf\xa6\xce\xb5\x22\x48\x14\xd7\xa7\x73\xfa\xfa\x08\
-\x89\xd4\x02\xa4\xf6\x09\x7c\xd2\x3c\x47\xee\xd9\x03\xe7\x0f\xec\
-\x57\x95\x29\x4d\xc0\xbe\xaa\x22\x75\x2f\x40\x58\x6c\x76\xb7\xd0\
-\x66\xbd\x64\x02\x18\xb5\x61\xf9\xd8\x64\x59\x98\x49\x0c\xab\xbe\
-\x28\x7b\xe3\x21\x41\xff\x13\x48\x02\xcc\xdc\xf4\x89\xbb\xa8\x70\
-\x86\x04\x95\x3b\x85\xb4\xaf\x49\x40\x80\xeb\x7e\x3d\xc5\x0d\xc8\
-\x39\x2b\x65\xbc\xbe\xa4\x70\x2f\x05\x77\x14\xf8\xd8\xf2\xbb\x11\
-\xfc\xbe\x83\x08\xbe\x67\x29\xdc\x2a\x73\xc0\x94\x8d\x7e\xdd\xe2\
-\x91\x40\x28\xe0\x99\xa8\x20\x0e\xa0\x44\x7a\x08\x20\xab\x6c\x02\
-\x84\x4e\x9e\x07\x8a\x42\x6d\xf5\x1f\x3a\x00\x82\x82\x45\x77\xfe\
-\x21\x90\x4c\x4e\x4e\x96\x4a\x82\xa8\x3c\x02\x9c\x48\xa0\x5b\x6b\
-\x98\xe9\x88\x32\x03\xcc\xe1\x23\x42\x35\x62\xcb\xef\xfe\xfa\xff\
-\x82\x7e\x6c\xf9\xde\x89\x15\x52\xfa\x9d\x2c\xb7\x7a\x0c\xf0\x38\
-\x81\x5c\xb1\xca\x72\x7c\x00\x07\x93\xad\x76\x1c\xcb\x37\xb0\xa0\
-\x7c\x00\xb7\x6a\x04\x10\x5e\x06\x48\x93\x67\x9a\x0a\x91\x80\x2a\
-\x10\x83\x45\xbb\x3f\x09\x9a\x04\xb9\x5c\xae\x1c\xf0\xc3\xc0\x8a\
-\xea\xda\xb2\xfc\x20\x22\x68\x9b\x4f\xa4\x22\xf0\x8f\xde\xf3\x3f\
-\x14\xf8\x24\x42\xdb\x7d\x93\xfc\x6a\xa0\x0a\xda\x60\xe9\x8e\x1d\
-\x45\x71\x91\x88\xa1\x82\xb2\x1c\x02\x64\x30\xd5\x53\xf9\x8a\xf6\
-\x02\x70\x7b\x91\xc1\x20\x31\x7b\x47\xf2\x7d\x01\x26\x0d\x3c\xb1\
-\x5f\x9d\xd0\x24\x98\x98\x98\x20\x4d\x50\x69\xb0\x28\x1a\x5c\x1e\
-\x4f\x08\x23\x85\x0f\xfc\x06\x02\xff\xee\x7f\x86\x0b\x07\x1f\x07\
-\x0d\xbc\xb6\xfd\xc2\x0f\xbe\x39\x57\x21\x09\x68\x95\xd0\x25\xf8\
-\xe9\xd9\xe2\xed\xd8\xb5\x5d\xb9\x12\x06\xf0\x63\xd3\xe1\xee\x6e\
-\x36\x25\x8c\x12\x61\xda\x50\x0a\x01\x86\x0b\x01\x03\xcb\x74\x21\
-\x40\x9a\x82\x56\xcd\x04\x08\x13\x6b\xe6\xea\xdf\xf7\xd0\x99\xfd\
-\xc1\x27\x1e\x87\x63\xb8\xd3\x75\xe7\xa7\xc8\x68\xc3\xf8\xf8\xb8\
-\x26\x41\xa5\x26\x21\x8a\x08\xa1\xa3\x7a\xfa\xbc\xd6\x24\x34\x27\
-\x81\x02\x47\xc7\xef\xfe\x27\x18\x38\xb8\x8f\xa9\x7d\x55\x8c\x60\
-\x0d\x50\xb2\x2d\xa0\x25\x62\x17\xe1\x2c\xa8\x25\x08\x7a\x1b\x8e\
-\x4e\x66\xb0\x1e\xce\x3e\xfc\x30\x9c\x7a\xe8\x21\x98\xec\x39\x07\
-\x52\xba\x8c\x00\xda\x09\x20\x6c\x23\x09\x30\x4e\xea\xc4\x4c\x0a\
-\xf5\x93\xd6\xb6\x2a\x0e\x07\xfb\xb4\xbd\xd0\x15\xe2\x71\x5a\xa5\
-\x87\x04\xbe\x44\xa2\x35\xc1\x3e\xaa\x29\x24\xc1\xbf\x06\x69\x48\
-\x70\x31\x4e\x61\x49\x24\x08\x13\x72\xf8\x34\xf8\x27\xef\xfe\xef\
-\x04\xbe\x51\x66\xd2\xef\xe4\x72\x6d\x30\x8b\x20\x6e\x71\xe7\xb0\
-\x19\xa3\x92\xed\x1b\x37\xaa\xd5\x40\x5b\x71\x90\xcb\xc1\x31\x93\
-\xd7\xb1\x4b\xf9\xf4\x57\xbe\x02\x3d\x38\x6f\xd0\xc9\x66\x89\x94\
-\xa8\x05\x3a\x71\x6b\xb1\x55\xdf\x09\xcb\x78\xa9\xeb\x03\x4c\x62\
-\x5a\x55\x98\x14\x6a\x15\x31\x01\x12\x2e\x32\x10\xa4\xc0\xd7\xd4\
-\x64\xc0\x1b\x8f\xc5\xf2\x94\x40\x18\x5d\x36\x84\x24\x38\x8e\x07\
-\xeb\xee\xfc\x37\x80\x42\x24\x20\x9f\xa0\x1a\x24\x88\x52\xf3\xec\
-\x1c\x82\x4f\xb1\x03\x8a\x57\x20\xf8\xff\x88\xe0\xff\xd4\x00\x6d\
-\xd4\xbf\x12\x03\xbe\x1f\x78\x90\x5c\x13\x24\x30\x70\xd4\x8a\xc3\
-\xcf\xf3\xb0\x85\x2f\xe8\xea\x82\x3a\x24\x58\xb2\xb7\x17\x7a\x10\
-\xf4\xd7\xbf\xf8\x45\xe8\x7f\xea\x29\x02\x9d\xd7\x2b\x35\x50\xab\
-\xe8\xac\x60\x68\x20\x6c\x4b\x21\xc0\x94\xf1\xcd\x84\x89\x03\x98\
-\x40\x50\x85\x91\x40\xfd\xa3\xfe\x0c\xc9\x7d\x00\xf3\x70\x6e\x26\
-\x34\x11\x86\x0e\x61\x45\xe3\xce\x15\x77\xfe\xb1\x02\x43\x93\x00\
-\xa5\x9a\x66\x80\xf2\x42\x5b\x3e\xc5\x13\x9a\x54\xcb\xff\x07\x18\
-\x3a\xf0\x98\x26\x76\x20\xe0\x9a\x1c\xca\xbc\x7a\xce\x37\x2e\x5a\
-\x0c\xcd\x38\xef\xa0\x79\xf9\x4a\x65\xcb\xeb\x90\x54\xf9\xa9\x14\
-\x0c\xe0\xea\x29\xaf\xec\xd9\x03\x3d\x07\x0f\xd2\xc2\xd0\x25\x4d\
-\x27\x77\x59\x24\x50\x57\xa3\xc1\x36\xda\x09\x2c\xd4\x3f\x9b\x10\
-\x62\x19\x13\x50\xbe\xcd\xe7\x4e\xa0\x06\xd7\xa8\x1a\xa6\x1d\xfc\
-\x64\x11\x05\x32\x00\x91\xe0\x31\x2a\x1e\x92\xe0\xdf\x01\xc9\xd8\
-\xd8\x98\x21\x01\x97\xaa\x3a\x85\xd4\x85\xd4\xe0\x9f\xbe\xe7\x1f\
-\x60\xf8\xe0\x4f\xfc\x3a\x37\xc0\xd6\x2b\xf0\xd1\x5f\x68\xec\xe8\
-\x84\xc6\xce\x15\xd0\xd4\xb9\x12\x9a\x68\xa0\xaa\xa1\x11\x01\x9f\
-\x82\x21\x5c\x0b\xe1\xd8\x37\xef\x83\x0b\xcf\x3d\x0f\x43\x47\xba\
-\xc1\xc9\xe5\xcb\x6a\x62\x82\xf0\xb1\x3c\x9a\xca\xd3\x96\x32\xa5\
-\xce\x09\x5c\xab\xb1\x36\x41\x04\x1f\x8a\x13\x27\x4f\xc0\xe4\x44\
-\x12\x12\x2d\xad\xf4\x67\x4a\xe8\xa1\xd1\xcc\xd4\xff\x30\x80\xf5\
-\x83\xf4\x89\x59\x2a\xdf\x00\x8e\xfb\x9a\xce\x26\x7f\x04\x49\x70\
-\x0a\x24\xac\xbd\xf3\x4f\x40\x93\x20\x9b\xcd\x46\x9b\x82\xca\xcd\
-\x80\x69\xf9\x4d\x4d\x08\xfe\x7f\xc3\x96\xff\xa8\x47\x4d\x6a\xa0\
-\xb5\xc3\xd6\x04\x89\xb6\x76\x88\xcf\x9b\x0f\x89\xf6\x85\xd0\xb0\
-\x74\x19\x34\x2c\xe9\x50\xc5\x4e\x9e\x7b\x0d\x46\xbb\x5f\x86\x33\
-\xdf\x7b\x10\x46\x8f\x1d\x85\xb1\xd3\xa7\x11\x70\x47\xdd\xeb\x4a\
-\x5d\xd6\xb2\xc2\xc6\x84\x05\x25\x16\x08\xb2\x34\xb6\xa5\xc7\x01\
-\x8c\xc8\x59\x04\x98\x1e\x1c\x84\xd1\xd7\x7a\xe8\x41\x8a\xcd\x89\
-\xd6\x19\x22\xc4\x1a\x1a\x54\x8a\x37\x35\xd1\x39\x3f\xf8\x62\x96\
-\x6a\xd4\xa0\x5b\xb3\x54\x3d\x8b\x0e\xfa\x23\x52\x8a\xdc\xd2\x1f\
-\xe4\x1e\x3d\xf4\x13\x38\x8d\x99\xab\x3f\xf1\x27\xaa\x1b\x36\x3c\
-\x3c\x5c\xc9\xcc\xa2\x48\xb3\xa0\xbd\x7d\x0d\xfe\xab\xf7\x7c\x0d\
-\x46\x0e\x3e\x0a\x16\x16\x26\x86\xf3\x06\x63\xd8\x20\x62\x04\xf4\
-\xbc\x76\x88\xb5\xb6\x41\xbc\x0d\xc3\xcd\x75\xf5\x90\x1d\x1b\x81\
-\x14\x0e\x3f\xa7\xce\xbf\x0e\x43\xcf\x3c\x09\x13\x67\x4e\xc1\xf8\
-\xa9\x93\x90\x9b\x4e\x83\x06\xdb\x55\xb6\x96\x90\x2a\xec\x6b\x65\
-\x8b\xfb\xae\x7a\x8f\x92\x09\xc0\xc6\x02\x58\x07\xa3\x34\x02\x98\
-\x86\x66\x88\x60\x9c\x40\x17\x55\xad\x36\x03\x39\x54\x5d\x56\x22\
-\x41\xeb\xd4\x12\x21\xd4\x90\x71\x1c\x55\xa3\x4d\x33\x5d\xeb\xeb\
-\x20\x86\xf9\x76\x5d\x0c\x62\x78\x4d\xac\x2e\x41\x8e\x8a\x69\xc9\
-\x8a\x04\x5c\xbd\xeb\x64\xc0\x37\x26\x82\x69\x05\x20\x12\x3c\x0a\
-\xa7\x9d\x3c\x74\x7c\xe4\xd3\x64\x07\xd9\xb8\x41\x25\x91\x42\x2e\
-\x66\x52\xc7\xe0\xc1\xbd\x60\xe5\x73\xb0\xf4\xd6\xf7\x40\xbc\xa5\
-\x0d\xa4\xeb\x40\x7a\xf0\x02\xa4\x07\xfa\x61\xe2\xe8\x4b\x0a\xf0\
-\xe9\xf3\xbd\x90\xea\xeb\x85\x5c\x2a\x05\xb2\x00\xb2\xda\x16\x12\
-\x91\x59\x17\x1f\xd4\xbe\x2e\x93\xc7\x47\xf0\x38\xcc\xa5\x70\x80\
-\xea\xd6\x34\x3e\xe3\x7a\xa8\x54\xee\x22\x51\xf5\x1a\x13\x1f\x01\
-\x04\x3d\x84\xcd\x44\x71\xd2\x69\x95\xb4\xa4\xf1\x25\x6c\x04\x3c\
-\x5e\x8f\xa0\x63\x8a\xd7\xd5\x11\x19\x30\x0f\x35\x46\x43\x03\x6e\
-\x91\x14\x34\x57\x8f\x92\x25\x0a\x6c\x93\xba\x99\x63\x1e\x6d\x0a\
-\x36\xad\x50\x28\xa3\x25\x78\x22\x79\xf5\xf4\x29\x18\x39\xfc\x0a\
-\x2c\x5c\x64\x3e\xcd\x8e\x50\xef\x6c\x1b\x65\x02\xc8\xbc\x9c\xc5\
-\xcf\xd0\xd2\xdd\xaf\x80\xf5\xdc\x01\xc8\x10\xe8\x17\xfa\x20\x33\
-\x3c\x00\x6e\xde\x2d\xc4\x48\x66\xc0\x93\x3e\xa0\x4d\xeb\xd6\xb5\
-\xe7\x6a\xa0\x3d\xa0\x83\x97\x0c\x5a\x3b\x16\xf2\xa4\x2c\x85\x00\
-\x7c\x4a\x98\xe6\x50\xa6\xc2\x3f\x1b\x07\x6c\x30\xc8\xb6\x4b\x9a\
-\x9e\xe4\x66\xd3\xe8\x94\x21\x31\x92\x00\x39\x4b\x4f\x57\xa3\x24\
-\x66\x88\x81\xa4\x20\x22\xc4\x28\xd1\x71\xa2\x40\x12\xcc\x07\xcc\
-\x13\x71\xd2\x26\x44\x06\x4c\xb1\x19\x73\x63\x53\x9e\x65\x63\x52\
-\xf9\xb4\x55\xfd\xde\x13\x4e\x0c\x1e\x1e\x71\xe0\x86\xee\xa3\xb8\
-\x38\x43\x1b\xfb\x12\xb9\x72\x7f\x80\x9f\x1b\x18\x18\x80\x47\x5f\
-\x1b\x82\xf5\x27\x4f\xc3\x8a\xf3\x27\x11\x2c\xa3\xbe\x15\xe8\x54\
-\x46\x0d\xbe\x6b\x5a\x39\x23\x81\x4f\xdd\x9b\x7d\x61\xd1\x7d\xfe\
-\x9e\x91\x6b\xe2\x26\x11\x26\x80\x4f\x09\xd3\x5a\xa0\xf2\xbf\x1c\
-\xea\xd7\x00\x94\x4a\x8f\xf2\xd1\x56\x83\xaf\x13\x48\x24\x47\x06\
-\xf2\xb9\x8c\xaa\x2c\x07\xf3\xb2\x9a\x1c\x82\x92\x21\x8b\x28\x76\
-\x4c\xe0\xdb\x4a\x7b\xa8\xd4\xdb\xd9\x05\x7b\xdb\xd7\xc1\x65\xab\
-\x96\xc1\xca\x95\x2b\xc9\x4e\x33\x60\xab\xe5\x14\xea\x91\xc3\xf5\
-\x5d\x1b\xe0\xe9\xb1\x71\x55\xc6\xe5\x7d\x27\x75\x25\x6b\xb0\x8d\
-\xf3\x5f\x38\x90\xae\xb6\xc5\x41\x76\xde\xdf\xe5\x05\xe1\xd1\x00\
-\xa5\x9b\x82\x42\x2f\x20\xc0\x7f\xab\x94\x00\xd2\xbb\x15\x56\xa4\
-\xd7\x2f\xc0\x03\xb6\x21\x02\x4f\xe6\x9c\xb9\xd6\x80\xed\xcf\xb7\
-\xcc\x79\x22\x90\x70\xf3\x00\xb9\x3c\xbc\xbe\x78\x3d\xfc\x74\x61\
-\x17\x5c\xbe\xea\x72\x5a\x42\xc6\x10\x80\x83\x59\x09\xf8\x81\xd3\
-\xcb\xe8\xa3\x50\xca\x7f\xa6\xa0\x85\x96\x9f\x3f\x81\xc7\x1a\x6c\
-\x4d\x04\xcf\x56\xb7\x6a\x9f\xca\xf7\x01\x6f\xda\x15\x11\xc4\x00\
-\xef\x23\x82\x14\xe1\xa8\x8a\x42\x85\xc9\x2a\x13\xc0\x48\xa1\xc0\
-\x21\xc2\xe2\xb9\x82\x27\x43\x10\x03\xac\xaf\xb5\x73\xf0\xb9\x36\
-\xe8\x5d\xb6\x1e\xf6\x5f\xb6\x03\xc1\x5f\x45\xe0\xd3\x14\x70\x05\
-\x7e\x49\x12\x3d\x88\x14\xda\x15\xd4\x24\x20\x5f\xe3\x19\x61\x29\
-\x30\x3b\x91\x04\xbe\x56\x8f\x09\xbc\x64\x50\x40\x87\x38\x7d\xfe\
-\x16\xcf\x4d\x01\x5d\xa4\xfd\x8b\xd0\x6e\xa0\x60\xe7\x2b\x25\x00\
-\x27\x01\x21\x60\x8b\xa8\xd6\x6f\xd4\xb9\x3e\xd6\xc9\xa7\x0d\xb8\
-\x99\x10\x5e\x52\x30\xf0\x8d\x66\x38\x8f\x6a\xff\xe0\xe5\xd7\xc1\
-\x2a\x04\xfd\x2d\x6f\x79\x8b\x06\x9f\xc0\x8a\x02\x31\x0a\xf4\x92\
-\x9d\x47\x8a\xfd\xd3\x17\xc2\x24\xcf\x14\x5e\xba\xb3\xe7\xb8\x01\
-\xdc\xa7\xe2\x0d\xa0\x66\xdf\xeb\xf4\x05\xb4\x78\x03\x3c\x0b\x8a\
-\x71\xd1\xa1\x60\xab\x76\x26\x40\x68\x14\x22\xc7\x79\x3d\xac\x15\
-\xde\xe3\x00\xff\x00\x8a\x98\x81\x00\xf0\xfb\x96\x77\xc1\xa1\xd5\
-\x6f\x26\xd0\xd5\xa2\x51\x5a\xed\x33\x09\x56\xff\x17\xed\x0f\x08\
-\x21\x7c\x8b\x3a\xd1\xf1\x73\x85\xd9\x52\xcb\x7a\x8e\x15\x23\x81\
-\x71\xe6\xfc\xf1\x0d\xbf\x29\xf4\x86\xc5\x85\x0f\x80\x68\x2d\xa0\
-\xf1\x11\x35\x34\x01\x52\x77\xcd\x4a\x6d\xfd\x2c\x8f\x1d\x73\x0d\
-\x60\xb4\x03\x07\x7f\xc5\x06\x78\x62\xcd\x0d\x1a\x7c\xfa\xe8\xc3\
-\xd8\xfc\xf2\xa5\xe2\x6f\x0d\xf4\xb1\x36\x07\x9a\x04\xcf\x2b\x12\
-\x00\x74\xf8\x49\x60\xc0\xf5\xd9\x79\x4e\x00\x69\xae\x31\x2d\x3d\
-\x4c\x0b\x70\x62\x62\xaa\xad\x09\xa0\x54\x6e\xeb\x37\x79\x22\x42\
-\x23\x50\x0a\xf0\x0f\xfa\x57\x6c\x84\x27\xd7\xa1\xad\xc7\x16\xff\
-\xe6\x37\xbf\x59\x83\xcf\x00\xaa\x50\xca\x74\x0a\x0d\x11\xf4\x6c\
-\x63\x32\x07\xe4\x13\xbc\x50\x88\x59\x2c\x7d\x9d\x48\x60\x1a\x86\
-\x0b\xdc\xb3\x37\x51\xd2\x50\xe0\xa3\xb5\x80\x19\x0d\xc4\x24\xaa\
-\x6e\x02\xcc\xf3\x4d\x20\xa8\xe2\xd6\x6f\x12\xbf\x46\x27\x31\xcb\
-\x14\x5c\x58\xb9\x11\x9e\xea\x7a\x1b\x81\x4f\xcb\xc4\x69\xf0\xc3\
-\xa6\x66\xd7\x8a\x10\x0c\x7c\xaf\x26\xa0\xf5\x09\x68\xff\x45\x7c\
-\xe9\xad\xb8\x5d\x7a\xee\x28\x40\x80\x83\x47\xc7\x92\x01\x1d\x05\
-\x3c\xd7\x02\x3c\x0e\x50\xd3\x5e\x80\x55\x5a\x2f\x40\x04\x6b\x04\
-\xde\x2d\xe4\xf7\x99\x73\x04\xfe\x26\x78\x7a\xe3\x4e\xb2\xf5\xb4\
-\x08\x63\x90\xda\xaf\x84\x08\x7a\x25\xcf\xc0\xd0\x71\x34\x09\xf8\
-\xc7\x27\x7a\x91\x8a\x97\xed\x19\x9f\x60\xf1\xb9\x6e\x05\xbc\x15\
-\x06\x74\xb4\xdd\x37\x79\xfe\x09\x35\xdc\x07\xa8\x75\x2f\x40\x3d\
-\xc4\xcf\x01\x63\xc3\x81\xf5\xed\x99\x46\x60\x3d\x00\x11\xac\x21\
-\x06\x57\x6d\x86\xe7\x36\xef\x82\x95\x2b\x56\xd2\xda\x80\x04\xbe\
-\x06\x4d\x4b\xc5\x24\xa0\x51\x3d\xfa\x0a\x88\xae\x1d\x1c\x1c\xf4\
-\x8e\x22\x86\x80\x1f\x3d\x63\x98\x1c\x43\x5a\x42\x86\x48\xf0\x8a\
-\x6d\xab\xf2\x2d\x7c\xad\x1b\x64\x40\xdf\xde\x37\xe8\x22\x42\xc8\
-\xa0\xcf\x7b\xef\x9d\x7d\xda\x56\xf8\x98\xdb\xaa\x6a\x02\x8c\xae\
-\x0f\x9a\xd6\x6d\x52\xa8\x36\x30\x89\xf7\x08\xcc\xf1\xd0\xe5\x9b\
-\xe1\xf9\x2d\x6f\x87\x15\xcb\x57\x10\xf8\xf4\x81\x27\xeb\xea\x45\
-\x11\xc1\x80\xc5\xc1\xa7\x2f\x84\x5a\x70\x14\x53\x16\xae\xbd\x70\
-\xe1\x02\x91\x20\xda\x0c\x18\x92\x15\x33\x05\x6c\xb5\xcf\x97\x2d\
-\x1b\x36\x82\x80\x85\x67\x8f\x78\x4c\x01\x77\x00\x95\x96\x28\xe6\
-\x04\xd2\xc6\x4f\x1a\x23\xb3\x46\x47\xad\x82\x2d\x95\x55\x26\x80\
-\xdf\xc6\x84\x76\x03\x4d\x52\x9b\x08\xff\xc0\x10\xc6\x4f\x84\xa1\
-\xd5\x57\xc2\x4b\x5b\x6f\xc5\x96\xbf\x42\x2d\xbf\xda\xd9\xd9\x49\
-\x95\x59\x0a\xc0\x25\xb7\x7c\x02\x7f\xf0\x6f\x77\x83\xeb\xe4\x61\
-\xf1\xe7\xee\x01\x12\x22\x41\x26\x93\x29\xc5\x2f\x60\xa0\x17\x09\
-\x16\x19\x4d\x10\xb3\x55\x09\x17\xbc\x7a\xd8\x4f\xf8\x52\xec\xfc\
-\x6c\xd2\x80\x31\x27\x52\xfb\x11\x26\x0e\x50\x0b\x13\xc0\x23\x4d\
-\x3e\xf1\xab\x7f\x03\xae\xc9\x8f\xe8\x1d\xf8\xaf\x1d\x59\xbd\x05\
-\x0e\x6f\x7f\x27\x81\x4f\xab\x81\x12\xf8\xe1\x2d\xdf\x80\x10\x79\
-\x9e\x7e\x87\xc0\x6f\xc6\xf1\xfc\xa1\xff\xb2\x1b\xd2\x8f\xcc\x00\
-\x3f\x44\x6a\xfa\xcf\xd4\x3e\xfd\xcd\x22\xa5\x09\xa2\x47\x07\x03\
-\xbb\x61\x8c\x04\x44\xde\x57\x2c\x5b\xe5\xcd\x3f\xf3\x8a\x0f\x50\
-\xab\x08\xf0\xd2\x37\x36\x10\xd0\xdb\xf2\x10\x42\xb2\xe7\x57\x47\
-\x03\x70\x4d\x20\x8c\x0f\xe0\xc3\x53\x14\x52\xb4\x46\xe0\x3e\x82\
-\x27\x6f\x74\xed\x16\xe8\xde\xf1\xaf\x48\xed\x13\xf8\xfa\x6f\xec\
-\x44\x7d\x9f\x1f\x74\xde\xb7\xaf\x67\xf2\x10\xf8\xc3\x7f\xb7\x1b\
-\x32\x7b\xef\x01\xad\xcc\xb2\x8f\xdd\x07\xc3\x02\x60\xc1\x67\x0d\
-\x09\x50\x13\x04\x3d\x8b\x01\xad\x53\x10\x09\x68\xdd\x5f\x22\xc1\
-\xe1\x98\xad\x1c\xc3\x79\xa7\x5e\x06\xe1\x03\x9e\x35\x08\x3f\x49\
-\x7c\x66\x20\x24\x12\x68\xd5\xc6\x07\x30\x5b\x0b\x13\xef\x06\xf2\
-\xd6\x3d\x5b\xfd\xcf\x56\xf5\x45\xfc\x83\xb1\xb5\x57\xc1\xb1\xeb\
-\xde\x45\xb6\x9e\xfe\xba\x16\x03\x3f\x70\x35\x4e\x7e\x3e\x74\x02\
-\xe7\x08\x82\x9f\x7d\x54\x83\x6f\x24\xf7\xd3\xfb\x60\x44\x00\xb4\
-\xff\xa9\x8f\x04\x4c\xcd\xe3\x7e\x58\xf2\x4d\x1c\xa1\xad\x26\x01\
-\xad\x5e\x46\x79\x47\x90\x08\x2b\x05\x92\xe0\xe4\x4b\x60\xcd\x6e\
-\xf1\x8c\x10\xbe\x06\xe4\x27\x04\x80\x8f\x44\xea\xbc\x6d\x42\xcb\
-\x4a\x6a\x31\x18\x14\xe9\x02\x68\xc0\x21\x4a\xfd\x9b\xeb\x27\xd6\
-\x6d\x85\x53\x6f\x79\x37\xac\xe8\x5c\x4e\xeb\xff\x12\xf8\xd4\x62\
-\x18\x98\x95\x68\x01\x3d\x75\x9b\xc0\x1f\xfd\xda\x6e\xc8\xfd\x44\
-\x83\xcf\x25\x8f\x24\x18\xc5\xed\xfc\x70\x12\x30\x90\xa3\xb4\x01\
-\x25\x72\x0c\x35\x09\xba\xed\x98\xd2\x04\xcd\xc7\x5f\xf4\x3a\xc3\
-\xc6\x11\x34\x00\x07\xf7\xf9\x85\xf9\x7a\xd7\xf1\xcf\x09\xac\x9d\
-\x09\x50\x05\xb3\x2d\xf3\x3e\x82\x63\x2b\x7c\x19\x41\x04\x31\xa7\
-\x27\xd7\x5d\x0d\x67\x6e\xbc\x8d\x6c\x3d\x81\xaf\xff\xba\x56\xb1\
-\x96\x5d\xa6\x16\x30\x1f\x6d\x10\xf8\x63\x5f\x2b\xb4\x7c\xaf\x59\
-\x62\x6b\xeb\x23\x09\xf6\xdd\x07\x63\x78\xa2\xed\x33\x45\x1d\xc3\
-\x62\xe0\x6a\x32\x44\x68\x03\x43\x02\xd2\x6c\xa4\x09\x3a\xc0\x82\
-\xc6\xe3\xcf\x73\x80\x85\x1f\x60\xa9\xb2\x82\x9d\x45\x61\xba\xe3\
-\x74\xae\x96\x26\x40\x18\x56\x82\x6f\xec\x9e\x89\x29\x48\x30\x41\
-\x92\x5d\x57\xc3\xb9\x5d\xef\xc7\x45\x18\x3b\x69\xc9\x75\x5a\x97\
-\x47\x83\x5f\xb1\xad\xd7\xe7\xcc\xe7\x5a\x0d\x08\xfe\x5d\xa0\xd5\
-\xbe\x65\x2a\xcb\x47\x00\x75\xab\x45\xfb\x05\x12\x80\x8f\x04\xfa\
-\xe3\x13\x06\x2e\x07\x9f\x93\x02\xc5\xab\x09\xe8\x6f\x06\x16\x34\
-\x81\x0d\x8b\x01\xa0\xe1\xe8\xf3\x5e\x80\xcd\x56\x72\x73\x2a\x03\
-\xd1\x15\x3a\x12\xa8\x4d\x40\x4d\xbb\x81\x06\x4c\x73\x10\x16\x1f\
-\x60\x92\xea\xda\x06\x3d\xb7\xdc\x4e\xea\x9e\xc0\x67\x7f\x63\x27\
-\xa0\x55\x47\x02\x4f\xa2\x3f\xd4\xd4\xe0\xe7\x1e\xbd\xdb\x37\xc9\
-\x04\x66\xbf\x97\xd4\x0b\x60\x60\x92\x9c\x04\x42\x08\x4d\x02\x03\
-\x66\x78\x0a\xd5\x14\xda\x27\x20\x92\x76\x63\x6a\xa7\xf1\x84\xc3\
-\xcf\x85\x03\xac\xdf\xdb\x78\xff\x4c\x84\x1e\xae\x57\xe5\xa8\xb2\
-\x09\x30\xf3\x01\x60\xd6\xe3\x39\x09\x44\x04\x41\xa6\x37\x6e\x87\
-\xfe\x5b\xef\x80\xce\x65\x9d\xb4\xde\x3e\x81\x6f\xba\x7a\xd1\xea\
-\x3d\x8c\x14\xf4\x3b\x85\xaf\x74\xeb\x35\xf8\x1a\x78\x43\x80\xd9\
-\xa3\x73\x1a\x7c\xda\x9a\x4f\xb6\x98\x26\xc0\x88\x21\x27\x01\x07\
-\x38\xd2\x2c\x68\x12\xd0\xd2\xb3\xb4\x7f\xcc\xfe\x84\x7a\x99\xc4\
-\xe1\x67\x41\xfb\x01\xb2\x68\xd7\x2f\xa0\x7e\x2d\xef\x58\x00\xd4\
-\x28\x10\x24\x30\x15\x0a\x15\x20\xa6\xa2\x43\x7a\x09\x99\xcd\xdb\
-\x61\xe0\x37\x3e\x00\xcb\x3a\x0d\xf8\x1e\x9b\x1f\x01\x76\xb4\xcd\
-\xd7\x8b\x33\x8c\xfe\x3d\xd9\x7c\x6a\xf9\x6c\x76\x91\x26\x80\x11\
-\x2f\xf8\xe0\x9d\xae\xcd\x35\xc1\xd0\xd0\x10\x91\x80\x01\xca\xc9\
-\x10\x4d\x10\x4d\x02\x2a\x7f\xb7\x75\x27\x34\x4b\x2c\xc3\x2b\xcf\
-\xfa\x4c\xbd\x34\xe0\x07\x38\xdd\xe6\x9c\x65\xcf\x4c\x92\x95\xb5\
-\xeb\x05\xa8\xc4\xc5\x6f\xdf\x03\x25\xbb\xe9\x1a\x18\xf9\xad\x0f\
-\xc1\xb2\x8e\x65\xb4\xc6\x3f\x2d\xc7\x46\x2d\xb6\xdc\x56\x5e\x74\
-\x5f\xaf\xc9\xa3\xc1\xcf\x20\xf8\xbe\x68\x23\x9f\x7e\xe6\x11\x43\
-\x00\x57\xf2\x99\x3b\xd4\x3b\x18\x93\x48\x82\x3f\x55\x24\xa0\x8f\
-\x4f\xf4\x00\x52\x04\xc8\xfc\x18\x85\x99\x03\xfa\x5b\xc9\x74\x7c\
-\xcc\xba\x4b\x55\xa0\xfd\xd2\x33\x7c\xb9\x56\x2e\xfc\xbc\x25\xaa\
-\xee\x04\xfa\xbf\xdd\x0c\x09\x05\x0b\xff\x01\x93\xfc\xe6\x6b\x61\
-\xec\xdd\x1f\x46\x47\xaf\x83\xe6\xd3\x19\x9b\x1f\x0d\x6e\xc8\x39\
-\xa3\xf6\xf5\x9a\x3c\x23\x7f\x7f\x17\x64\x1e\xf1\xb5\x7c\xd3\x2d\
-\xf5\x6b\x02\x23\xa6\xf5\xb3\xe1\x5b\xdd\xdb\xc9\xee\x9b\xe9\x22\
-\xb6\x7f\xf6\xeb\x40\x32\x3a\x3a\x4a\x24\xf0\x69\x01\xae\x0d\xa2\
-\xc9\xa1\x27\x9a\xd2\xda\xc6\x74\x7c\xdc\xfa\x43\x48\x48\xbc\xee\
-\xa5\xa7\x59\xc4\x8f\x89\xd0\xe7\xd9\x68\x60\x0d\x7a\x01\x9a\xb9\
-\x45\xf0\x17\x11\x19\x72\xeb\x0e\x98\x78\xcf\xef\x91\x97\x4f\x13\
-\x27\x0c\xf8\xd1\x7d\xfb\x28\x82\x98\xa5\xd8\xea\xea\x30\xc2\x87\
-\xe0\xef\xdd\xc3\xcd\x10\x9f\x75\x44\xc9\x77\x91\x99\xcd\xeb\x8f\
-\xc5\x4b\x4f\xf4\x2d\x43\x11\x43\x10\x14\x31\xa4\x67\xd3\xb7\x88\
-\x9a\x04\xd1\x80\xf3\x7d\x36\xdb\x98\x56\x24\x57\x24\xf8\xd0\x1f\
-\x41\x9c\x32\x5f\x7c\x3a\xb4\x8e\xfd\x28\xeb\x6f\x25\xa0\xc6\x26\
-\xc0\x16\x21\x04\xe0\x99\x89\x35\xeb\x21\xfd\xe1\x3f\x82\xa5\xad\
-\xea\x0f\x3a\x90\xda\x0f\x1a\xd2\x0d\x6f\xf1\x7c\xdf\xb7\x08\xe3\
-\xd0\xdf\x52\x6c\x1f\xc1\xb7\xc2\xa2\x92\x7c\xd2\xa9\xd0\xaa\xbf\
-\xe8\x24\x0d\x1e\x7d\x4b\x3f\xfa\x0d\x18\xc2\xed\x42\x43\x02\xbd\
-\xb6\x31\x03\x3a\x2c\x69\x09\x22\xc1\xa9\x8f\x7e\x1a\xec\xb1\xbf\
-\x02\xf7\xcc\x49\x53\x3f\xa1\x04\x90\x54\x9e\xb2\xc7\x02\xac\x52\
-\x4d\x80\xf1\x32\x4d\x14\x25\x4c\xf4\xf9\xe5\x9f\xfc\x0c\x2c\x5d\
-\xd6\x49\x2d\xdf\x80\x1f\x2e\x61\xb1\x75\x9f\xcd\xd7\xe0\xd3\xa8\
-\x5e\xea\xc7\x7b\x82\x6d\x24\x14\xd5\x08\x7c\x7e\xa2\x61\x4b\x68\
-\xa4\x73\x1a\x49\x30\xf8\xd5\x8f\x91\xbf\x41\xb1\x06\x72\x3e\x09\
-\x74\x9d\x18\xd8\xc5\xf2\x83\x84\xca\x43\x73\x1e\xd7\x75\x6d\x80\
-\xf6\x8f\x7d\xaa\xbc\x85\x37\x74\x41\x6a\xa1\x01\xa4\x7e\x88\x2d\
-\xca\x7a\xa9\x55\x3b\xdf\x0e\x59\x10\xa4\xa6\x4b\x05\x3f\xb2\xf5\
-\xeb\x25\xd7\x69\xbd\xbf\x81\xbf\x51\xe0\x13\x90\xbf\x54\x49\x21\
-\x09\x06\x24\xc0\xe2\x7f\xaf\x34\x81\x5a\xbd\xcc\x71\x9c\x52\x23\
-\x84\x24\xa1\x24\xa0\x19\x50\x4b\xda\xe6\xc1\xc0\x7f\xfc\xb7\x50\
-\xa2\x18\xdf\xa6\x96\x26\x40\x78\xbf\x51\x12\xd1\x37\x36\x23\x48\
-\x56\x4b\x2b\x9b\x76\x55\x3a\x09\xf8\x2a\x18\x7a\xbd\xfd\xfe\xaf\
-\xee\x86\xa9\x1f\xed\x01\x3b\x08\x7c\xe9\xe9\xdf\xcf\xce\x77\x31\
-\x59\xa6\xdf\xef\x42\xc4\x2a\x9e\xfa\x94\xe7\x7c\x72\xef\x37\xc0\
-\x95\x02\x96\xfe\xf9\xdd\x7a\x81\x6b\x32\x07\xd1\xaa\x3f\x5a\x94\
-\x76\x6b\x70\x1d\x28\x5d\x8c\x13\xa8\xa4\x26\x26\x80\x0a\x61\x63\
-\x62\xe7\x83\x6f\xea\xfd\xc1\xbf\x90\x6d\x53\x6a\xb2\x0c\x61\x95\
-\xa6\xc3\xbb\x1a\xfc\xbe\xaf\xec\x86\x89\x1f\xec\xd1\x78\x31\x80\
-\x0d\xa2\xe6\xbc\x4b\x40\x7b\xbe\xde\x75\x5c\xef\x31\x25\x7e\xbf\
-\x64\x3f\xe7\x7f\x60\xf2\x91\x7b\xe1\xfc\x97\x3f\x8e\xad\xb6\x8e\
-\xb4\x1c\xbd\x63\x90\x16\x28\x6b\xd2\x0a\x69\x81\xbe\x87\x1f\x62\
-\x55\x1a\x56\xe9\x0a\x9b\x6a\x13\x80\x87\x82\x8b\x78\xf9\x21\x37\
-\xbd\xf8\xf9\xcf\xc1\xf8\xd1\x57\xa8\x40\x9a\x04\x95\x10\xc1\xf7\
-\x67\x56\xce\xff\xe7\xdd\x30\xfe\x7d\x63\xf3\x0d\x48\x06\x48\xde\
-\x74\x3d\x81\x1e\xa9\xc9\x60\x48\xe0\xfb\x7e\x1f\x54\xe2\xc4\xe0\
-\xbf\xa9\x36\x13\x0f\xe3\x12\xf0\x7f\xfd\x71\x7c\xb7\x38\x2d\x1e\
-\x41\x24\xf0\xf9\x04\x28\x65\x83\x3f\x71\xfc\x08\xbc\xf8\x97\x9f\
-\x8d\xaa\x63\x23\x9a\x70\x16\x54\x99\x00\x26\xd1\xd5\x2c\x0e\x10\
-\xc5\x4e\x27\x3d\x0d\xfb\x6e\xdb\x75\x51\x24\x20\x9b\x4f\x5a\x84\
-\xc0\xef\xf9\xf2\x6e\x18\xfd\xbf\x1a\x7c\xd6\xea\x0d\xc8\x1a\x68\
-\x93\xcc\x42\x0d\x06\x74\x93\xcc\x35\xfe\xa9\x56\xd2\x9f\xcc\xae\
-\xb9\x9e\x64\xfc\xc7\xf7\x42\x4f\x81\x04\xa8\xa5\xe8\x9d\x09\x90\
-\x8a\xc0\x9f\x3c\xde\x0d\x8f\xbf\xf7\x66\x70\x52\x53\x10\x6a\x95\
-\xa4\x67\x23\x4d\x57\xb7\xda\x26\x80\x4f\x5a\x10\x01\x44\x09\x50\
-\x4d\xd9\xd1\x11\xd8\xff\xbe\x9b\x61\xe2\xd8\xe1\xb2\x49\x40\x2d\
-\x48\xdf\x73\xee\x4b\xbb\x61\xe4\xa1\x3d\x06\x60\x7f\xec\x9e\xdb\
-\x7f\x7f\x32\x24\xa0\xe4\x86\x24\x43\x16\xad\x11\xfc\x04\x01\x4a\
-\xdc\x5c\x8c\xfd\xf0\x5e\x38\xf7\xc5\x8f\xd3\xbb\x12\x61\xe9\xdd\
-\xcb\x07\xff\x44\x37\xd6\xd5\x2e\xc8\x0e\x0d\x9a\x32\x84\x80\x22\
-\xa5\xd7\x41\x87\xaa\x9a\x00\x2e\xda\x04\xc8\xa2\x0f\x31\x95\x0c\
-\xc5\x48\x30\x0c\x07\xb0\x60\x13\xc7\x03\x48\x10\xf1\xb7\x74\x5f\
-\xfb\x6b\x04\xff\x7b\x7b\x02\x41\x56\x20\x71\x3b\xcf\x01\xf7\xd9\
-\x7e\x76\x8f\x01\x9f\x11\x28\xcc\xbf\x30\x84\x19\xf9\xc1\xbd\x70\
-\xf6\x0b\x1f\xa7\x77\xa6\x77\xa7\x32\x94\x05\xfe\x41\x02\x7f\x78\
-\xd0\x3c\xa6\x14\xa7\xd4\xd7\x4d\xaf\xa1\x09\x30\xc3\x8d\xc1\x17\
-\x9a\x5d\xde\x4a\xb2\x23\xc3\x70\xe8\xfd\x37\xa3\x8a\x3b\xc2\x48\
-\x10\x06\xfe\xab\x5f\xdc\x0d\x83\xff\xc7\x38\x7c\x46\x4d\x7b\x9e\
-\xe1\xcf\xe3\xad\x9e\x11\x41\x1f\xb3\x7c\x63\x26\x98\x06\x61\xa4\
-\x29\xaa\x11\x46\xbe\xff\x75\x78\xf5\xf3\x8c\x04\xe1\xe0\x9f\xec\
-\x86\x27\x7e\x67\x17\x64\x46\x06\x99\xca\xd7\x19\x81\x59\xae\x26\
-\x00\xd4\xd8\x07\x10\x04\x8c\x30\xf9\x51\x2f\xc8\x9c\x32\x22\xc1\
-\x10\x15\xd4\x4b\x82\xd0\x3f\xa4\x7c\xe6\x0b\x33\xe0\x03\x03\xbe\
-\x90\x0c\x88\x8c\x1c\xae\xda\xf7\x6d\x8d\x16\x30\xa0\x17\x27\x81\
-\x49\x06\x68\x93\x02\xc8\x68\xf2\x86\x1e\xfa\x3a\x9c\xfe\x8b\x30\
-\x12\x18\xf0\x93\x08\xfe\xcf\xb0\x4e\xd2\x43\x83\x86\xd4\x21\x4e\
-\x27\x9f\x17\xea\x25\x80\xa0\xbd\x5a\x98\x00\xe1\x5f\xcd\x88\x39\
-\x42\xe1\x36\xca\x35\x65\x50\x24\xf8\xd9\x1d\x48\x82\x13\x47\xc8\
-\x56\xea\x3f\x9f\x4a\x8e\x13\x39\x7a\x94\xa7\x8e\x4f\x7d\x7e\x37\
-\x5c\xf8\xee\x9e\xd2\x2a\xde\x0b\x32\xb3\xf7\xe1\x76\xdf\xa1\xc4\
-\xae\xd5\xe4\xe2\x26\x81\x83\x5e\x9c\x1c\x83\x48\x82\x93\xff\x49\
-\x91\x40\x3b\xb1\x54\x46\x4d\x0a\x95\xa7\xc0\xbf\x1d\x5b\xfe\xf0\
-\x60\x70\x63\x8a\xa8\x6b\x6e\x02\x64\x2d\x02\x41\x52\x39\x19\x86\
-\xc8\x66\xe0\x5c\x9a\x15\x2f\x8c\x23\xe8\xb2\x79\x81\xa6\xc5\x12\
-\x09\x86\x87\xe0\x49\x24\xc1\x9b\xef\xdf\x07\xad\x5d\x57\xaa\xca\
-\xf1\xca\x89\xbf\xd8\x0d\x03\x08\xbe\x65\x79\x2a\x58\x78\x2b\x99\
-\x1f\xbb\xc4\x4f\xbd\xef\x9a\x90\xaf\x59\x7b\x98\xcd\xab\xe7\x9f\
-\xc0\xbb\xdc\x84\x98\x7d\x9d\x82\x48\xc8\x89\x30\xf0\xbd\xaf\xab\
-\x6b\xd6\x7d\xe9\x6e\x02\xdf\xd7\xbd\x25\x7f\x88\xea\x80\x6c\xbe\
-\x4f\xbc\x5a\x0c\x02\x9d\x4e\x26\x96\xed\xa9\x73\x59\x0b\x1f\x40\
-\x84\xda\x18\x03\xb0\x2c\x2d\x38\x93\x21\x4d\xf0\xee\xeb\xe1\xb5\
-\x6f\xff\x4f\xea\xf2\xa8\x52\x27\x4f\x1d\x85\x17\x3e\x7a\x33\xf4\
-\x3d\x68\x5a\x3e\xab\xdc\x20\x50\x4c\x6b\x35\x5b\xae\xde\xfd\x2d\
-\x9f\xf5\x00\xb8\x16\xe0\xa6\x40\xef\x47\x13\x81\x8e\xfb\x91\x04\
-\x2f\xfc\xde\x4e\x98\x3a\xd5\xad\x2e\x74\xa6\x53\x70\xee\x3b\x7b\
-\xb0\xec\xd7\x11\xf8\xe6\x5a\x6f\x35\x85\x3b\x80\x3c\x82\xa9\xf1\
-\x11\xa2\x7a\xa1\x60\x3e\xa3\x27\xa8\x9b\xc1\x5b\xbd\x29\x8c\x69\
-\x6d\x52\x70\xbf\x21\x8f\xc0\x1f\xfe\xf3\xbb\xa0\xfb\x3f\xdc\xe5\
-\x1f\xc3\xb7\xbc\xd3\xb4\xb8\x16\x30\x1e\xb0\x09\xeb\xba\x66\x6d\
-\x54\xad\x91\xf8\xa4\x06\x37\x8a\xf0\x5c\x0b\x70\x52\x71\xf3\xe2\
-\xbf\x9e\x13\x63\xec\xe9\x03\xf0\x8b\xdf\xdc\x3c\x73\x8f\xe3\xf1\
-\x43\x98\x49\x0b\xa8\xd7\x52\x08\x42\x15\x57\xd3\xb1\x00\x41\x89\
-\xbf\x9b\x99\x38\x11\x4c\x0a\xe9\x25\x85\xf4\x83\x22\xbc\x15\xa0\
-\xaf\xe5\x79\xba\xe5\xf9\x26\xcf\x5b\xe6\x37\xf5\x08\xae\x77\x4d\
-\x61\x36\x1c\x28\x65\x58\x1d\x19\xc2\xf2\xde\x44\xb8\x4f\x60\x52\
-\x38\x11\x4c\x9e\x46\x32\x3c\x6a\x29\xa3\xa2\x92\x92\xed\xd7\x86\
-\x00\x82\x92\x25\xf8\x68\xa0\x07\x20\x57\x5f\xeb\x03\x2e\x58\x4b\
-\x28\x89\x04\xde\x7f\x0c\x3e\x0d\x60\x9e\x69\xb9\x85\x31\xfd\x62\
-\x5c\x95\x26\x83\x4f\x56\xf5\x1b\x59\xd7\xa7\x62\x03\x7d\x01\x9e\
-\xe7\x4d\xe5\xf5\x18\x8c\xc9\xe1\x60\x73\x33\xca\xbb\xdb\x46\x44\
-\xd5\x09\xa0\x2b\x48\xbf\xac\x8c\x78\x86\xbe\x96\xb5\x78\x1f\xf0\
-\x02\xbc\x05\x0c\x03\x5e\x83\x6c\xde\xc3\xd2\xe7\xe9\x27\x8d\xba\
-\x57\x22\xe8\x58\x14\x88\x20\xbd\x1a\xc0\xcf\x66\x8b\x03\x6f\x5a\
-\x9d\x8f\x00\x51\xa6\x80\xfb\x1f\x26\x85\x82\x6e\x12\x03\x37\x5c\
-\xfd\x4b\x5f\x0c\x22\x2a\x32\x44\xc7\x15\x10\xc0\x2e\x68\x6d\xfd\
-\x97\xc2\x74\x48\x2a\x3d\x99\xa1\x85\x9f\xd5\xd2\xad\x4e\xd6\xfb\
-\xde\xbc\x95\x9a\x93\x9c\x9d\x52\x46\x79\xf6\x41\x76\xde\x6f\x42\
-\x2c\x2f\x09\xf4\xb1\x21\x82\xe9\x91\xd0\xbe\xf0\xbc\xd6\x0c\x41\
-\x98\xb8\xb3\x5b\x17\x07\xd4\x98\x80\x60\x6d\xc0\xbb\x9f\xa5\xf5\
-\x18\xfc\xf7\x82\x49\x3e\x82\x05\xa8\x7f\xc2\x84\xb0\xc9\x20\x46\
-\x54\x58\xa1\xca\x2c\xf5\x8c\x26\x49\x98\xe6\x4b\x21\xc0\x08\xa6\
-\x25\xfa\x7d\x2c\xcb\x8d\xcf\x6b\x81\x78\xbc\x1e\xa4\xe3\xc0\xf4\
-\x68\x16\x1a\x97\xb4\x42\x5d\x6b\x3d\xe4\x52\x59\xd0\xe2\x6b\xb5\
-\xc6\x8e\x46\xdb\x79\xc9\xc9\x60\xfc\x03\xaf\x9d\x37\xe7\x8c\xba\
-\xf7\x93\x40\xa8\x8b\x02\xbb\x7d\x85\x8a\x30\x8e\xa0\x60\x3c\xf5\
-\x1f\xb8\xe1\xdd\x42\xee\x17\x84\x98\x00\x28\xa3\xc7\x20\x43\xba\
-\x7a\x7c\x50\xca\x48\x7d\x5b\x23\x34\x75\xb4\xc1\xd4\xf0\x49\x48\
-\xe0\x88\xa4\x93\xcb\x41\x3e\x9f\x51\x45\x29\xf0\x5f\x8e\x94\x42\
-\x80\x2e\xbc\x61\x74\xe6\xb7\x1d\x21\x65\x3e\x5e\x5f\x97\x6d\x68\
-\x5f\x94\xb0\x68\xfa\xb6\x68\x05\x22\xc4\xa2\x2d\x9d\x90\xec\x9f\
-\x00\x23\x65\xda\x79\x19\xa0\x05\x14\x90\xdc\xf3\x37\xde\xbd\xfe\
-\x79\x3f\x09\x84\x3e\x36\x7f\x6a\xc6\x20\xa8\x89\xc1\xfe\x22\x59\
-\x88\xb8\xcc\x17\x30\x2b\x81\x1b\x52\x98\xae\x60\x48\x57\x54\xb2\
-\xf1\x06\x16\x4a\x2e\xcb\x3f\x30\x04\xf3\xaf\xdb\xb0\xec\xba\xb5\
-\x10\x6f\x6e\x80\xf1\xa1\x8c\xfa\x9b\x0d\x6e\x72\x12\x2c\x07\xa8\
-\x95\xe6\x08\x4b\x4c\x92\xb0\x8d\x8c\x03\xd0\x1d\x85\x5e\x4a\x1e\
-\xa4\x4c\x0b\xd7\x4d\x5a\x75\x31\xb5\xfc\x7b\x76\x1a\x60\xf0\xf8\
-\x38\x74\xdd\x7e\x0d\x34\x2d\x6e\xf1\x63\x1e\xf0\xb2\x41\xf6\xcf\
-\x0d\xa9\x18\xa9\x13\xef\x7b\x73\x1b\xec\x7a\xce\x05\x6c\x29\x39\
-\xe6\x38\x32\x39\x32\x38\x44\x2c\xdd\x90\x56\xaf\xaf\x09\xf2\x0f\
-\xd8\xe8\x65\xb4\xcf\xc0\x63\x28\x9c\xc4\xad\xcb\xdb\x61\xfd\x7b\
-\xf1\x3b\xcb\x67\x7b\x21\x39\x9a\x51\x84\x90\xe0\x92\x29\x9f\x14\
-\x00\x19\xc2\x92\x30\xcd\x96\x12\x08\x1a\x9b\x51\x0b\x6e\xe1\xc6\
-\x29\x3b\x9d\x7e\x55\xda\x16\x58\xf5\x09\x32\x34\xd0\xfb\xc2\x38\
-\xc4\xdb\xe6\xc3\x35\x9f\xde\xe9\x21\x41\xa8\xf3\xc2\x0b\xc6\xae\
-\xe1\x5d\x25\x37\x58\xdd\x9a\xfd\xc0\xf0\xad\xc9\x73\xf8\x7e\x74\
-\x92\x0c\x78\xbe\x0d\x18\x6b\x08\x78\x77\x5e\xbe\xa0\x14\x40\x04\
-\x17\xf8\x35\x24\x2d\x08\xfe\x35\x7f\x7c\x0b\x1e\x0b\x38\xf2\xd8\
-\x19\x52\xa7\x0a\x55\xc7\xc9\x43\x03\xc0\x19\xc2\x90\xb0\x24\x4c\
-\xc7\x4a\x31\x01\x49\x00\xd9\x86\x8c\x71\xf1\x26\x01\x30\xd1\x94\
-\x4a\x3f\x3b\x95\x4c\x6e\xaf\x6f\x6b\x43\xfc\x51\x0b\x4c\xb9\x70\
-\xf2\x27\x03\xb0\xf6\xed\xab\xe0\xa6\x2f\xdf\x06\x47\x1f\x78\x16\
-\x06\x5f\xee\x81\xcc\x44\x9a\x6a\xc7\xf7\x19\x16\x25\xf3\x65\x0e\
-\xdf\x82\xa0\xc4\xaf\x05\xb3\xef\xbb\x06\x84\x3f\x49\x75\x9d\xc7\
-\xc9\xa3\x2d\x1d\x7a\x8f\x85\xdf\x21\xf6\xaf\x4f\x10\xc0\x5f\x9f\
-\x23\x68\x48\xaa\xb6\x96\xc9\x53\x5b\xcb\xe4\x7b\x3b\xee\xa2\x70\
-\x9d\xa0\xe4\x9a\x7b\xa0\x70\x2c\x3c\x5b\xcb\xf5\x37\x08\x97\xf2\
-\xcd\xbd\x2a\x59\x9e\xdf\xb6\x6d\x0b\x12\xf3\x1a\x60\xc9\xd6\xcb\
-\x60\xe3\x07\x76\x60\x46\x0c\x9e\xfc\xc6\x4b\x30\x35\x92\x06\x2b\
-\x6e\xa3\x7f\x96\xc6\xdf\xc8\xc3\x02\x17\x9e\x05\xc4\x90\xb0\xc4\
-\x94\x27\x6c\x23\x09\x40\xc1\xca\x9b\x94\xba\x50\xac\x19\x5f\x99\
-\xcd\xef\x7f\xb1\xbf\xff\x7d\xce\xd2\xa5\x0b\xe3\x4d\xcd\xca\x10\
-\x8f\xf5\x26\xe1\xe5\x7f\x49\xc1\xf2\x6d\xf3\x61\xeb\x27\x77\x81\
-\x33\x91\x84\xa9\x0b\x13\xe0\x64\xf2\x58\x70\xbe\x02\x16\x89\x65\
-\xec\xb5\xb9\xc6\xf7\xa1\xa6\xf7\x3e\xbe\x8a\x18\x04\x5d\xe3\xcd\
-\x9f\x0d\x30\xe5\x57\xd2\x4f\x96\x45\xc2\xae\xc5\x8e\x8b\x13\xc5\
-\x10\x28\xe0\x58\x93\xc7\xdc\x17\x14\x80\x2a\xfe\xdb\x76\x22\x06\
-\xcd\xd8\xf2\xed\x86\x7a\xe8\x79\xbe\x0f\xba\x1f\x3f\x3b\xa3\xfa\
-\xd1\x54\x3b\xa9\x0c\x64\x93\x49\x48\xb8\x30\xb8\xd6\x85\x83\x2e\
-\x62\x98\x47\x2c\x13\x00\x2e\x61\x5b\xd2\x37\x1d\x8f\xcf\x60\x52\
-\x87\xff\xb4\xbb\x00\xab\x5f\xb5\xc5\xed\x23\x9d\x1d\x9f\x5a\xb2\
-\x65\x8b\xb0\x62\x71\x70\xe8\x0f\x3e\x64\x90\x22\xa8\x66\x62\x09\
-\x89\x0c\x1e\x85\x96\xc5\x4d\x50\xd7\x5c\x07\x42\xd7\x7a\xd4\x57\
-\x43\xc2\x6c\xf8\xb5\xfc\xbc\x14\x81\xd7\x46\x03\x2c\xa0\x72\x99\
-\x0d\x7e\x68\xd4\x8d\x5f\xc3\xaf\x8f\xf8\x3d\x19\x1e\xdc\x73\x5d\
-\x09\xf9\xb4\x03\x99\x14\xc0\x70\x4f\x12\x52\x63\x69\xd5\x55\x27\
-\x27\x9d\x3c\xff\x89\xbe\xf3\xa8\xa5\xa7\xe4\x5a\x07\xfe\xf1\x0a\
-\x17\x1e\xb4\xd0\x0c\xb8\x33\x9d\xbb\xcc\x4e\xbc\xbd\xa4\x38\xc0\
-\x01\x00\xf9\x0e\x80\x9c\x03\x90\xc4\x3b\x2e\xac\x72\xe4\x23\xc9\
-\xbe\xfe\x2b\xfa\xa4\x7b\x6b\xfb\xe5\xab\xc1\xaa\xab\x43\xec\x73\
-\xea\xaf\x57\xa6\xc6\xd3\x30\xf6\x1a\x9a\x80\xe4\x44\x54\x43\x0a\
-\x3e\x5f\x85\xeb\x64\xc5\xe7\xde\x78\x42\x7f\x94\xab\xbe\x15\x4d\
-\xb2\x6d\xab\x24\x10\xfc\x5c\x12\xc9\x80\x83\x6b\xd9\x54\x0a\x16\
-\xb9\xf0\x28\xb6\xfe\xbd\x80\xd8\x59\x88\x61\x1c\xb1\x7c\x34\xa0\
-\xa8\x76\xb1\xcc\xfd\x98\xde\x87\xa9\x19\x40\x4e\x93\x43\x88\x69\
-\xb1\x2b\xcf\x0c\xa7\xa6\xe6\x0f\x8f\x0c\xaf\x71\x73\x39\xd5\x1e\
-\x5d\xc7\x51\x29\x37\x9d\xc2\x34\xcd\x67\xab\x5c\xe2\x04\x90\xf0\
-\xc6\x14\x9b\xbe\xb5\x88\xc7\x40\xd2\x7f\xf9\x3c\x06\xe8\x26\x20\
-\x35\x3a\x8c\x9a\x21\x23\x09\xfc\x6d\x0e\xfc\x33\x00\x9c\xcd\x03\
-\x0c\x36\x02\x9e\x02\x70\xee\x0c\x27\x00\x97\x2b\x00\xe4\x22\xdc\
-\x92\xed\x90\x33\x7d\xc9\xec\x52\x17\x8e\xa1\x9a\x19\x1d\x9e\x18\
-\x5f\x3d\x35\x3e\xd6\x48\xb6\x26\x8b\xe0\xe7\x33\x19\x70\xf3\xb9\
-\x80\x0a\xad\x7d\xe5\x4b\xf8\x75\x17\x3e\xfd\x1b\x1b\x21\x3a\x7b\
-\xd3\xa8\x79\x27\x21\x97\x9e\x86\x78\xde\x1d\xbc\xdc\x85\x7b\x36\
-\xbb\xf0\x2d\x02\x9f\x5a\x7f\x0c\x20\x99\x42\xec\x9e\x42\x0c\xf7\
-\x57\x62\x1d\x1f\xc7\xf3\x13\x00\x56\x2b\xf2\x40\x02\x34\x09\x80\
-\x76\x0a\x14\x3a\x00\x9d\x67\x2c\xb8\x69\xd4\x82\x6b\xa6\x01\x56\
-\x3b\x02\x9a\x5d\xbc\xa6\x56\xa0\xc9\xaa\x9f\x7f\xe3\x13\xc7\x02\
-\xc8\xfe\xbf\xf6\xce\x20\x25\x62\x18\x0c\xa3\x2f\x49\xe9\x8c\x8c\
-\xcc\x0c\x1e\xc1\xa5\xa7\xd0\x8d\x9e\xc0\x03\x78\x12\xeb\x49\xbc\
-\x95\xcb\xd9\xb9\xb4\x38\x48\x61\x6c\x9b\xc4\x2f\x18\x41\x17\xe2\
-\x14\x1d\x57\x79\xf0\xb6\x25\xe1\x0b\xfc\xc9\x1f\x48\x2b\x78\x39\
-\x8a\x6c\xd2\x6e\x3f\x6d\xf8\x1c\x3c\xa6\xe0\x23\xb4\x06\x3a\x65\
-\xd7\x2f\x21\x5c\x7c\x3f\xd5\xbd\xee\x76\x8c\xea\x87\x5d\x41\x35\
-\xc0\x7c\x84\x14\xf6\xca\x4a\x60\x69\x60\x11\x61\x06\x54\xd2\x51\
-\xf8\x0f\xbc\x1c\x3f\x7a\x35\xf9\xa8\xb7\xb5\xb2\x7a\xaf\xf9\xbb\
-\x2d\x8c\x97\xb9\x0d\xfc\xab\xdb\x40\x03\xf1\x1a\xc2\x0d\x0c\x6b\
-\xf0\x23\xf4\x40\x67\xe1\x29\x05\x9f\x34\x39\xfc\xf0\xe9\xb7\xbf\
-\x14\xfe\x1c\xf3\xf5\x31\x33\x1f\xf3\x22\x48\x06\x89\x74\x30\xb4\
-\x10\xee\x21\x5e\xc9\x9f\xbf\x39\x81\x06\xcc\xad\x54\x3d\xb1\x1d\
-\xb8\xb9\xac\xc1\xbe\x4a\x97\x7b\x35\x1e\x4c\x4f\xe1\x10\xd4\xd2\
-\x41\x0c\x80\x87\x38\x83\xd0\xcb\x1d\xf8\x85\x3c\x87\x70\x07\xb1\
-\x91\x13\x16\xd5\x74\x1a\x79\x06\xe6\x58\xae\xf3\xc0\x36\x29\x78\
-\x79\x42\xe1\x90\xb4\xb2\x86\x78\x2a\x7b\xe0\x39\x77\x6f\x1f\x64\
-\x43\xa1\x50\x28\x14\x0a\x85\xc2\x7e\xbc\x01\xc5\xf3\xa3\x21\xeb\
-\x0d\x36\x3a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x19\x37\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x50\x00\x00\x00\x4f\x08\x06\x00\x00\x00\x7c\x91\x42\xe3\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
-\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x18\xb4\x49\x44\
-\x41\x54\x78\xda\xed\x9c\x6b\xac\x24\x47\x75\xc7\x4f\x55\x77\xcf\
-\xcc\xde\xd7\xee\xdd\xeb\xdd\xf5\xae\xd6\xc4\x80\xb1\x71\x36\xe6\
-\x21\xf1\x0a\x12\x62\x1d\x01\x12\x7c\x48\x44\xc0\x08\xa4\x3c\x48\
-\x3e\xf0\x50\xf8\x80\xc4\x43\xe2\xbd\xc0\x17\x02\x82\x48\x18\x29\
-\x92\xc5\x07\x44\x3e\x84\xe0\x28\x32\x24\x8a\x04\x22\x68\x31\x46\
-\xb1\x42\x2c\x10\xd8\x12\x46\x18\xdb\xac\x77\xd9\x87\x2f\xf7\xee\
-\x7d\xcd\x74\x77\x55\x9d\x9c\x53\x67\xea\x1e\x77\xf7\xcc\xee\x8d\
-\x99\x0f\x4b\xe2\xf2\x2d\x57\x75\x75\xcf\xdd\x9a\xdf\xfc\xcf\xa3\
-\xaa\xe7\x76\x8e\x88\xf0\x4c\x79\xfa\x25\x87\x67\xca\x33\x00\x9f\
-\x01\xf8\xff\x11\xa0\xa1\xf2\x7f\x15\x0a\x52\x99\x21\xc0\x2e\xb4\
-\x53\xa7\x4e\x99\x3b\xee\xb8\x23\xf6\x4f\x9c\xb8\x44\xed\x49\xe0\
-\x72\xee\xdc\xb9\xdf\x49\xa8\xc7\x8e\x1d\x8b\xc0\x1e\x7a\xe8\xa1\
-\xd8\x7e\xf2\x93\x9f\x44\x7a\x8f\x89\x25\xfe\x96\x00\x15\x1c\x41\
-\xb3\x27\x4e\x9c\x30\xf4\x0f\xd9\xeb\xaf\xbf\xde\xe4\x79\x6e\xcf\
-\xc1\xb2\x59\xda\xda\x8a\xe7\xe9\x58\x00\x1e\x06\x2d\x72\x78\x4d\
-\x94\x8b\x53\x06\xb6\xb6\xb6\x70\x61\x61\x01\x8f\x1f\x3f\x8e\xfb\
-\xf7\xaf\x31\xb0\xf0\x8e\x77\xbc\x03\xd7\xd6\xd6\xc2\x18\xe6\x54\
-\x90\xf9\x5e\xe0\xb1\xe2\xa8\x6b\x57\x57\x57\x33\x52\x59\xf6\xec\
-\x67\x3f\x3b\x9b\x9b\xab\xb2\xb2\x1c\x64\xd9\x56\x96\xf5\x7a\x3d\
-\x3a\xbf\x63\xa9\x05\x80\x39\x70\x3b\xae\xa1\xc4\x9d\x6b\x04\xe0\
-\x42\xfb\xcd\x1f\xc8\x91\x67\x57\xd7\x06\xab\x6a\x0d\x07\x83\x10\
-\x2e\xc3\xb2\xef\x0d\x87\x9e\xc4\xe0\x49\x2c\x8e\xde\xaf\x27\xe1\
-\x04\xc2\x10\x26\x41\xcc\xf7\x02\x8f\xa1\xcd\xcf\xcf\xf3\xb5\xc5\
-\xe2\xe2\x62\x8f\x18\xf5\x9c\x5b\xe8\x67\x59\x45\xcc\x8a\xc2\x18\
-\xb0\x04\xce\x22\x75\x83\x0f\x66\xce\x32\x50\x29\x59\x66\x63\xdf\
-\xda\xec\x69\x9b\x77\x08\xbe\x31\x71\xef\x03\x36\xce\xe9\xf8\xc4\
-\xd7\xe8\xf9\xd6\xef\xc9\xe8\xb8\xb2\x50\x14\x88\x3e\x1b\x78\xeb\
-\x9c\x9f\x77\xb6\xae\x01\x6a\x7a\xbf\xd5\x68\x34\x2a\x09\x64\x4d\
-\xd6\x56\x9f\x3c\x79\xd2\x8f\x21\x86\x06\xc0\x3d\xc1\xbb\xff\xde\
-\xe7\x84\xf5\x9d\x77\xad\x2c\x1f\xb8\x3d\x27\x60\x59\xd1\xcb\x2c\
-\x99\xaf\x2d\xf2\xcc\x64\x39\x58\x2e\x59\x06\x26\xcb\x8c\xb1\xc6\
-\x70\x3f\xa3\x0a\x86\x0b\xb1\x25\x86\xfc\x9f\xfc\x8f\x4a\x6a\x30\
-\x50\xe5\x1f\x9e\x16\x8a\xf3\xa6\xd6\xc7\x71\x8c\x15\x43\xe0\x2a\
-\xa7\xa8\x9f\xc6\x02\xc1\xc0\xdd\x7e\x7c\x5f\x98\xf1\xb1\xf7\x32\
-\xc6\xaf\x91\x16\xe2\xef\x66\xa0\xf1\x7c\x90\xf3\x74\x1c\x9c\x07\
-\x1a\x01\x0f\xb1\x01\x07\xe8\xdc\xdc\xfc\x0f\xfa\x2f\xba\xed\x9f\
-\xf3\xdf\x3b\xfe\x04\x62\xb6\x33\x37\x37\xb7\x53\x96\xe5\xe8\xc6\
-\x1b\x6f\xac\x4e\x9e\x3a\xe9\x8c\x31\xc8\x65\x2f\x0a\x8c\xf0\xb2\
-\x87\x1f\x5e\x3a\xb4\x70\xe0\x87\xb7\xbf\xe7\x6f\xe6\xaf\xbf\xee\
-\x3a\x46\x05\x26\x2f\x80\xe0\x01\x91\xa2\x6a\x63\x0b\xdc\xb6\x2a\
-\x18\xae\x0c\x2a\xc9\x02\x65\xa6\x02\x85\xab\xbc\x61\x0c\x3c\x75\
-\xea\x47\x30\xb1\x1f\x82\xa3\xd6\xc7\xf3\x81\xcf\x91\x2e\x3c\x8f\
-\xc7\x31\x6e\xeb\x78\x3e\x54\x15\xf8\xaa\xe6\x63\xa9\xb5\x07\x5f\
-\x57\x54\x6b\x3e\x47\xc7\x2e\x1d\xd3\x75\x32\xe6\xca\x12\xdc\x68\
-\x44\xb5\xe4\x73\xf1\xf7\xf8\x10\xc0\x51\x3d\x53\x0e\x6f\xde\xbe\
-\xf7\x07\x7f\x9c\xff\xf9\xdb\xfe\xcc\x66\x61\xdd\xe7\xe6\xf2\xc0\
-\x0c\x2c\x50\xb9\x6d\xf5\x36\x3c\x74\xc7\x21\x54\x73\x56\x80\x1d\
-\xf5\x71\x94\xa5\xe8\x94\xad\x7e\xeb\x5b\x6f\xfe\xfd\xbf\x7c\xdb\
-\xfc\x89\xa5\x45\x4b\x4e\x0f\x48\xef\x60\xc8\xd7\xd9\x9c\x5a\xaa\
-\x90\xe5\xd4\xe6\x02\x90\x55\xc7\x30\x33\x0b\xc8\x8a\x04\x6a\x93\
-\xe1\x46\x70\x0a\x0f\xbc\x1f\xf7\xbd\xf4\x05\x96\xf4\xfd\x18\x54\
-\xe6\x22\x4c\xb0\xd4\xda\x0c\x82\xad\xa9\xcf\x40\x0d\xa0\xa1\x0a\
-\x04\x84\x55\x25\xea\x86\x60\x2c\x1d\x57\x3c\x26\xe0\xf9\x35\x59\
-\x00\xef\x6c\x14\xb4\xb7\x06\x02\xc8\x34\x9c\xf7\x04\x94\x00\x96\
-\x04\x97\xaf\x1d\x7f\x38\x37\x10\x93\xef\x14\xbd\xc3\xe5\x4f\x1f\
-\x7c\x6d\xfe\xc2\x17\xdc\x97\xfb\x50\x40\x1e\xcc\xe2\xa2\xc5\xf5\
-\x5e\x1d\x60\x05\xf0\xd4\x89\x53\x0c\x6f\x0a\x40\xb5\xb1\x6c\x67\
-\x67\xa7\xa0\xf6\x59\x87\x0f\x2e\xa3\x1d\x8d\x98\x6c\x34\x3b\x93\
-\x89\xfa\xa2\x4d\xc6\xc9\xba\xd8\xc7\x04\x0a\x13\x32\xee\x0b\x34\
-\xe0\x1f\xf4\xd2\xf7\x63\x88\x02\x32\x41\xdc\x05\x1b\x22\x50\x27\
-\xea\xdc\x6d\xe5\x3a\x4c\xca\x8b\xe3\xe3\x73\x35\x8f\x85\x74\x8e\
-\xc6\x58\x89\x4e\x14\xe8\xe4\x7c\xf0\x81\xa9\xc9\xbc\x32\x1b\x45\
-\x60\x90\x3f\xef\x02\x70\x34\x8c\xd7\x71\x19\x38\x07\x79\xd1\x43\
-\x52\xe7\x2d\x06\xf0\x51\x12\x83\xf1\x68\xbd\xf5\xe8\x4c\x69\xdc\
-\xf1\xd1\x71\x7f\xfa\x47\xa7\x43\x8a\xcc\xf9\x34\xf5\x91\x13\x25\
-\x6f\x5a\x17\x26\xcf\x0a\x96\xbe\xa5\x0a\xd1\x7c\x19\x9e\x8d\x4a\
-\x4b\x66\x69\xd0\x27\xdf\xc4\xad\x54\x86\x12\x0f\xfd\x18\x18\x8f\
-\x53\x8b\x49\x7d\xc9\x1f\x79\x1d\x13\xb0\x32\xc6\x7d\x85\x3a\x36\
-\x73\x3e\x27\x50\x19\xbe\xf1\x38\xfe\xbc\x78\x3e\x28\x73\xca\xad\
-\x7c\xd0\x26\x8b\x1f\xb2\x65\x70\x7d\x0f\x86\xa1\x07\x6e\xa5\xb2\
-\xb9\x5b\x86\x4c\x66\x0c\x1b\xeb\x50\x57\x35\xf7\x45\xb9\xfc\x9e\
-\x8a\xe2\xa0\x35\x70\x8c\xfa\x2e\x07\x5b\xfa\xa2\x37\x9c\x2f\x8b\
-\x11\x14\x50\x1d\x3a\x74\x88\x69\x07\xaa\x38\x51\x81\x9c\xeb\x51\
-\x6e\x94\x11\xcb\x1e\x99\x41\x11\x78\xc2\x06\xa3\x89\xda\x5e\x1f\
-\x4c\xd1\x03\x0e\x0e\x18\x41\xb9\x5d\x95\x99\x08\x0f\x12\x48\x9e\
-\x4c\x84\xa6\x2a\x4c\xfd\x04\x5b\xc0\x9b\x20\x63\x21\x29\x18\x4c\
-\xfa\x30\xe3\x87\x16\x8b\x67\xb3\x45\xf1\xaf\x64\x01\xc1\x10\x4c\
-\xf6\xb1\x0c\x85\xaf\xf1\xec\x3a\x04\x3a\x78\x0b\x96\x41\x14\x45\
-\xfc\x50\x6c\x90\x71\x43\xad\x27\x78\x36\xc2\x77\x60\x6a\x17\x5d\
-\x0d\x6e\x6f\xef\xce\x3b\x44\xd0\xc1\xd0\x7b\x5d\x0a\x08\x47\x8c\
-\x81\x1d\x1a\xdd\xb4\x0e\x37\xea\x1e\x6c\xe5\x2e\x1f\x92\xb8\x6a\
-\x16\xd9\x14\x13\x96\x15\x45\xbf\xdf\xcf\x0a\x2a\x26\xe7\xd9\x7a\
-\xb0\x26\x07\x8a\xbc\xe2\xf3\xa2\x29\xd3\x58\xe4\x81\x63\x75\x8d\
-\x55\x95\x60\xed\xb6\x3c\x79\x94\xb6\x01\x31\x34\x40\xcb\xb9\xc6\
-\x35\xd2\xe7\xc0\x82\xd2\x1a\x39\xaf\xd7\x44\x30\xe3\x6b\xd3\xf5\
-\x71\x2e\x22\x0f\x08\xa0\x1f\x18\x0f\x53\x2b\xa4\xb8\x1a\xea\x19\
-\xf9\xb7\xab\x4a\xcc\x9c\x80\x3a\x2f\x01\x25\xcf\xec\xbc\x05\xb3\
-\x0c\x06\xd6\x4c\xc0\x45\x30\x76\xae\xf0\x9e\xd4\xb3\x9d\x53\xee\
-\x66\xb7\x09\xba\xa1\x32\x09\x20\x07\x0f\xb3\xbe\xbe\x6e\xed\x9c\
-\xcd\xb1\xc8\x0b\x88\xd6\x31\x36\x5f\x30\xe9\xd3\x1c\xc3\x4a\x13\
-\x12\x58\x26\x08\x50\xc4\xf4\x26\xc7\xe7\x9a\x60\xba\x7d\x1d\x63\
-\x28\x2d\xa0\x0c\x18\xc5\x3f\xea\xb8\xf6\x7d\x32\x7b\xa4\xd6\xc9\
-\xb5\xe3\xb1\x10\xdb\xe4\x0e\xb4\x1f\xb8\x96\x15\x84\x9d\x21\x38\
-\x82\xe1\xa3\xf9\x3a\xf0\x01\x93\x2f\xeb\x07\x80\x05\x03\x86\x2a\
-\xce\xd3\xc0\xa0\x26\x8b\x74\xa4\x20\x2a\xf6\x12\x2f\x61\xef\x9e\
-\xa2\x40\x5a\x71\x18\xbe\x88\xe4\x9e\xd9\x2c\xcf\x24\xa4\xe4\xd1\
-\xaf\x60\x72\xf0\x34\xa4\xfe\x4e\xd5\x46\xbd\x8e\xd2\xb8\x26\x95\
-\xa2\xaa\x54\x03\x0a\x08\x34\xbd\xd6\xab\x0b\x08\xd8\x80\x99\xc6\
-\x42\x82\x9a\x20\xa1\x80\x24\xc8\x0a\x37\xe5\x7c\x32\xa6\x7d\x7e\
-\x3d\xa7\x35\x04\xaf\xde\xd8\x04\xbf\xb5\x45\x30\xcb\x98\x88\x3b\
-\x13\x23\x35\xe7\xb3\x05\x81\x1b\x00\x9a\x01\x1a\xdb\x47\xf0\x3d\
-\x83\x26\x9f\xa7\x33\x1b\x0b\x23\x73\xf3\xb9\x9b\xcd\x69\x38\x3d\
-\x19\xe0\xe6\xe6\xa6\x39\x7a\x74\xde\x94\xd0\xb7\x59\xbf\x97\xc5\
-\xe0\x51\xe4\x22\x7f\xef\xf4\x42\x4c\x30\x70\xba\xaf\xc3\xa0\x00\
-\x14\x76\x53\xa1\x0c\x2c\xa9\x56\xa1\x49\x45\x81\x8f\x0a\x21\xa9\
-\x2b\x8d\xcb\x3c\x54\x65\x11\xa8\x8c\x6b\x5f\xa0\xea\x31\x2b\xce\
-\x6f\x6e\x42\xb5\xbe\x0e\x8e\x40\xf2\x39\x07\xc0\x55\xe6\x29\x61\
-\xa9\xb0\x06\x8a\x10\xb0\x20\xa4\x79\x16\x42\x36\xcc\x8c\x9d\x1f\
-\x32\x9b\xf2\xca\x89\x74\x55\xd5\x26\xdf\x37\x1f\x95\x18\x97\x61\
-\x79\x4f\xa0\x70\x34\x0e\x54\x01\x1a\xfe\x2e\xf5\x93\x2f\xba\xf4\
-\xc4\x59\xb8\xf8\xab\x5f\x41\x66\x0c\x1c\x39\x7e\x1c\xf6\x5f\xb7\
-\x22\xaf\x69\xf8\x3e\xaa\xe8\x15\xa2\x80\xd3\xba\x6b\xce\x0a\x4f\
-\x8e\xb5\xc2\x2e\x18\xaf\x8a\x53\x95\x26\x70\x92\xa4\x27\xb3\x2e\
-\x2b\x36\x5b\x86\xc7\xea\x13\x35\x22\x82\xb3\x56\x00\x1a\x03\x51\
-\x84\x60\x2c\x22\x66\x5c\x69\xc8\x1a\x1a\x2a\x5c\x6e\xb6\xca\x2d\
-\xb3\xd7\xcd\x04\x6b\xf3\x22\x8b\xc1\xa3\xe8\x13\x3c\xa2\xce\x39\
-\x97\x69\x29\x10\x15\xde\xf9\x33\x67\xe0\x9e\x7f\xf8\x5a\xcc\xf4\
-\x0f\xde\x7a\x2b\xe4\xce\xc1\x8f\xff\xf5\xdf\x61\x65\x65\x05\x5e\
-\xf1\xa6\x3f\x81\x7d\xfb\x0f\x80\xa6\x39\x01\x54\x79\x0a\x5f\xe1\
-\xf9\x04\x2d\x42\x50\x13\x17\xf0\x09\xa6\xb6\x4d\x73\x0e\x0d\xe0\
-\x5e\x22\x2c\xab\x6f\x67\x07\xdc\xe5\xcb\xe0\x36\x36\x64\x45\x82\
-\x08\xde\x18\x55\xa0\x54\x8e\xf3\xd6\x1a\x2e\x60\x80\xfa\xde\x07\
-\xe3\xbd\xbc\xfb\xbd\x02\x64\x97\x69\x0c\xfb\xbf\x7e\x2f\x9a\x2f\
-\x72\x4d\x4b\x41\x0d\x22\x71\x82\x67\x7e\xf9\x28\xfc\xe3\x97\xbf\
-\x02\x37\xbd\xf3\x9d\x70\xf8\x75\xaf\x6b\x98\xfa\xf0\x9e\x7b\xe0\
-\xfe\xbf\xff\x32\xfc\xe1\x5f\xff\x05\xf4\x19\x62\xf0\x0a\x2a\xc2\
-\x52\xb3\x0e\xda\xd7\x08\x8d\xa0\x40\xe5\x9a\xa6\x5a\x19\x0e\x26\
-\xf5\xf1\x4b\x9b\xe6\x9c\x54\xea\x19\x18\x99\x6e\xcd\xea\x23\x15\
-\x72\x8a\x96\x92\x3a\xcf\x20\xc7\x56\xa2\x53\x8f\xc0\xcc\xde\xf7\
-\x03\x4f\x51\x7d\x4c\x0f\x6d\x04\x98\xc5\xdc\x8f\x30\xe8\x72\x2b\
-\x2a\x4f\xcd\xd8\x39\x07\xdf\xf8\xda\xdd\x70\xcb\x7b\xdf\x0b\x2b\
-\xaf\x7a\x55\x3b\x3b\x87\xf9\x37\xbd\x09\xcc\xd2\x22\x3c\xf2\x8d\
-\x6f\xc2\xad\x77\xbc\x11\x50\xd5\x07\x0a\x02\x93\x5a\xf4\xbc\x8c\
-\xcb\xfa\xb7\x6d\xe2\xd1\x4c\x5d\x57\x89\x0a\x98\xce\x6b\x1b\x08\
-\x1e\x9b\xac\x5b\x5b\x03\x47\x6d\x5d\xd7\x02\x6c\x0c\xb0\x46\x84\
-\x3a\xcb\xc4\x84\xf7\x58\xf2\x2e\xbf\x53\xc4\x4f\x09\x66\x71\x87\
-\xc5\xf2\x6e\xa9\x44\xde\xda\x89\x19\x03\x17\x0d\x22\x67\x7e\xf1\
-\x0b\xe8\x2f\x2d\x75\xe0\xe5\xf4\x3a\x4a\x27\x63\x6b\xdf\xf8\xa7\
-\x90\xfd\xe7\xfd\x50\xfe\xfa\x3c\x14\xcb\xcb\xc9\xc9\xeb\x2a\x65\
-\x37\x98\x28\x0c\x0d\x14\xc9\x24\x31\xf9\xbd\x6e\x64\x0d\x5e\x4c\
-\x57\x5e\xaf\xea\x66\xe5\x95\x65\x52\x5e\x6c\x5d\x55\x25\xc5\x45\
-\x78\x4e\x7d\xe0\xd3\x05\xa8\xcb\x38\xda\x99\x35\x00\x56\xc6\x08\
-\x20\x20\xff\x58\x51\x9d\x23\x78\x95\x06\x11\x00\xf1\x5f\xe7\x1f\
-\x7d\x1c\x96\xfe\xe0\x36\x78\x6a\xa1\x64\x1c\x28\xe9\xe4\x2a\x00\
-\xad\x85\xfc\xf6\xdb\xa1\xfe\xaf\xfb\x21\x9f\x9f\x6f\xfa\x35\x48\
-\x26\x8a\x0a\x45\x13\x6e\xad\x02\x46\x01\x3a\xaf\x2a\xd3\xa5\x64\
-\x82\x27\x01\xa2\x2c\xa3\xbf\xab\xa9\xc6\x9c\xaf\xaa\xe2\xb5\xde\
-\x18\x01\xc8\xca\xb3\x36\xf6\x7d\x72\x4d\x57\x29\x6b\xc7\xd6\xe2\
-\x76\xdf\x54\x1f\xd8\xeb\x55\x26\xeb\xed\xb7\xbc\x21\xaa\x51\xd3\
-\x31\x3c\xaa\x55\xf4\x0a\xfa\x06\x91\x55\xc9\x4a\x6b\xc0\x1b\x0c\
-\x06\x09\x22\x9f\x8b\x00\x8b\x1b\x6e\x00\x7b\xdf\xbd\x31\xf3\x57\
-\x38\x6a\x9a\x80\x09\x4a\x52\x65\x82\x03\xbb\x0a\xf5\xc1\x27\xb3\
-\x56\xe0\x48\x2d\x40\x53\x75\xec\xdf\x86\x43\x36\x57\x0e\x1a\x12\
-\x3c\x78\xc5\x21\x41\x23\x5e\x9f\xfa\xb5\xc0\x93\x3c\x90\xc6\x80\
-\x25\x24\x4a\x94\x90\xcc\xd1\x24\x43\x63\x6d\x6e\xaa\xb9\xca\x9c\
-\x80\x13\x7b\xde\xd2\x4f\xfb\x75\xb2\xac\x72\x4e\x54\xd8\x5a\xf7\
-\x1e\x3d\x74\x08\xce\xfd\xec\x67\x40\x85\x61\x31\xb8\x04\x91\x2b\
-\x8f\xc9\x26\xeb\xc5\x8b\x00\x07\x96\x63\x2a\x21\x80\x54\x4d\xd0\
-\x4e\x55\x10\x5b\x80\x9b\x7e\x4d\x95\x96\xe0\xa9\x7a\x03\xab\x8e\
-\x80\x31\x3c\x36\x59\x56\x21\xcf\x9d\xe1\x30\xa4\x14\x34\x82\x82\
-\x64\x13\x8e\x63\xc8\x61\x17\xf9\x07\x26\x1a\xf3\x01\x38\xb0\xf7\
-\x28\x0c\x84\x1e\x3d\x8e\xe1\x79\x51\x60\x59\x01\x17\x01\x20\x26\
-\x73\xe4\xd0\x75\x60\xbe\xf3\x5d\xa8\x1f\x7c\x10\xe6\x5e\xf6\x32\
-\x06\xc6\xca\x6b\x28\x31\x2f\x4b\xd8\xbc\xef\x3e\xc8\xae\x3b\x18\
-\x7f\x8f\x40\x6a\x01\xf3\x32\x16\xd4\xff\x69\x32\x8d\x28\x4a\x6b\
-\x55\x2a\x0a\xb6\xae\x25\xd2\x92\xa9\x32\x38\x86\x18\x58\x75\x63\
-\x95\x86\x04\x0f\xa0\xd1\x77\xe3\xea\x9f\xbe\x0f\x9c\x5e\xd2\x2e\
-\x31\x50\xc5\x9a\xda\x2a\x29\x30\x8c\x5b\x91\xfb\x4b\x5e\xf9\x0a\
-\xf8\xf9\xdf\x7d\x01\xec\x67\xfe\x16\xb2\x13\x27\x52\x00\x89\x75\
-\x60\x2d\x8c\xbe\xfa\x55\xb0\x0c\x27\xc2\x4b\x50\x14\x9c\x8c\xb5\
-\x82\x80\xc0\x11\x48\xea\xdf\xba\xd5\xc9\xfe\x1f\x03\xe3\x48\xcb\
-\x2d\x9b\xaf\x4f\xab\x10\x80\x66\x45\x4c\x3e\x50\x5b\x86\x68\xc5\
-\xd7\xcf\x14\xa0\x63\x70\xae\xe6\x08\xcc\xfe\x8f\x6b\x23\x89\x4e\
-\x0a\x39\x74\xe4\x08\xe4\xb7\x3a\xf8\xf5\xc7\x3f\x0e\xd9\x1b\xde\
-\x00\x05\x45\xe4\xfc\x20\xa9\xed\xd2\x25\x58\xff\xa7\xaf\x81\xd9\
-\xda\x86\x70\x60\x3f\xab\xaf\x61\xb2\x5e\x37\x16\x92\x29\x6a\x55\
-\x70\x93\x15\x28\xbb\xc9\xaa\x3a\x82\x47\xe0\x18\xa6\xde\x43\x49\
-\x91\xd6\x18\x85\x97\xfa\xd4\x26\xb3\x4e\x63\x38\x23\x80\xea\x03\
-\x9d\x43\xaa\x10\xea\x6a\x37\x88\x60\xe3\xa6\x8f\xee\xb8\xec\x5f\
-\xb9\x0e\x16\x16\x97\x60\xf8\xe3\x1f\x83\x27\x73\x1d\x01\x42\xb1\
-\xb0\x00\x66\xf9\x20\x84\xf9\x79\x79\xad\xfa\x34\x05\x24\x6d\x17\
-\x9e\x5e\xa3\x7d\xf5\x75\x0c\x8a\x83\x03\xc3\xe3\x9a\x7c\x9d\x5e\
-\xcb\xb5\xa5\x3e\xf1\x7b\x9a\x3c\x3b\x55\xa1\x00\xb4\x76\x76\x00\
-\x11\x91\xa3\x99\x80\x1b\xdf\xa0\xc1\xb2\x16\x60\x0c\x0e\x04\xa0\
-\x3a\x75\x88\xed\x80\x96\x6e\x78\x70\x39\xed\x11\x6a\x5a\xd2\x85\
-\x91\x6a\x17\xa2\x1e\x8b\x9a\x00\x52\x00\x11\x85\x95\xa5\x40\xe3\
-\xca\x49\xb2\xf8\xba\x36\x3c\x01\xd3\x0a\x1c\x5e\x81\x0a\x3c\xaa\
-\x4e\x54\x3a\x7b\x13\x0e\x95\xe3\xc0\x21\x91\x73\xc4\x00\xcb\x34\
-\x49\x5d\x07\x37\xfd\x54\x1b\xce\xd5\x7d\x18\x40\x3b\xaa\x4a\x3a\
-\x21\xf0\x54\x75\x04\x29\xa9\xce\x27\x3f\xc7\xc7\xce\x35\xc1\x37\
-\xd5\x97\x80\xb5\x4d\xb7\x69\xda\x29\x0a\xcf\xdc\x07\xd6\xb5\x40\
-\x93\x5b\x8b\xdc\x36\x37\x13\x26\x03\xd0\x63\x91\x4e\xea\x5f\x59\
-\x7d\x7a\x8d\xb6\x9a\x9a\xb0\xd2\x58\x71\x02\x8e\xe7\xc4\xfe\xaf\
-\xad\xda\x29\xea\x0b\xaa\xbe\x04\x4f\x95\xa9\xd7\xce\x38\x0a\x63\
-\xc0\xb4\xd3\x41\x75\xaa\xda\x60\x32\x0c\x1d\xef\x28\x73\x7a\xa0\
-\xd8\x20\x38\x97\x29\x18\x0c\xf2\x1c\x16\x29\x05\x32\x0c\x8f\xc1\
-\xb1\xaf\xa3\x4a\x20\x35\x35\xd1\xd7\x77\x95\xa7\x10\x15\x96\x8e\
-\xab\x09\x4b\x10\x89\xad\xb7\x96\xcf\xcd\x54\x81\x8d\xcd\x4a\xf5\
-\x31\x7a\x8e\xca\x34\x78\x4d\x55\xb6\xaf\x6f\x01\x3d\x4f\xab\x85\
-\x1f\x3c\xf6\x18\xe4\x59\x06\x4b\xcf\x7a\x16\x64\xb4\xf4\x42\x5a\
-\x63\x1f\xa3\x35\xf6\x61\x00\x01\x57\x55\x29\x6a\x27\x10\x5d\x78\
-\x5a\x23\x18\x54\xf5\x69\x2b\xe6\xac\xd7\x08\x68\x85\x37\xcb\x20\
-\x82\x7a\x7f\x56\x26\xae\x60\xba\x6a\x93\x81\x2e\xd8\x36\xb0\xd6\
-\xf1\x23\x94\xea\x3c\x70\xe1\x02\x3c\xff\x03\x1f\x80\xe5\x97\xbf\
-\x5c\xfd\x2f\x29\x71\xe7\x8b\x5f\x84\x0b\x0f\x3c\x00\x07\xea\x5a\
-\xd7\xcd\x7b\x81\xa7\x2a\x53\x78\x0a\x4b\x5b\x63\xb4\x45\x9c\x9d\
-\x02\xbd\xf7\xc8\x25\xaa\xce\x39\xf1\x43\x62\xca\xaa\x40\x85\x73\
-\x35\x9f\xc8\xed\xc4\xb1\x6d\x52\xd6\x7f\xd3\x46\xec\x8b\xbe\xf0\
-\x05\x98\x7b\xce\x73\x9a\x3b\xba\x94\x02\x2d\x7d\xf4\xa3\x10\x3e\
-\xfd\x69\xf0\x3f\xfc\x21\xd8\x10\xf6\x04\x2f\x68\xab\xfe\xae\x05\
-\x2d\x48\xdb\x8c\xcc\xd6\xce\x42\x81\xba\x95\x95\x52\x90\x94\x5b\
-\x05\xae\x53\xd4\x06\xd3\x83\x82\x2a\xa7\x6d\xce\xd4\xff\xe5\xf9\
-\xf3\x70\xf4\xd5\xaf\xee\xc0\x93\x95\x8c\xac\xa1\xed\x87\x3e\x04\
-\xe6\xdd\xef\x86\xe1\xd9\xb3\x93\xc1\x69\x6d\x2f\xd5\xa4\x4e\xf3\
-\x8b\x1a\x9d\x67\xad\x40\x2d\x28\x0a\x54\x88\x04\xd4\x4c\x09\x22\
-\x1a\x28\xba\xc7\x30\x65\x15\xb1\x4e\x0a\xdc\xff\x82\x17\x3c\x35\
-\x79\x6f\xec\xe2\x30\x48\x43\x4a\xcc\xe9\x16\x41\xf9\xc4\x13\xe0\
-\xda\x4a\xeb\x56\x85\x86\xa8\xd0\x26\x01\x55\xd8\xa9\x9d\x2d\x40\
-\x0c\x08\x3e\xc1\xe3\x36\x04\x85\xa3\x41\x61\x3a\x2c\x85\xab\x35\
-\x84\xb4\x76\x8d\x69\x09\x50\xbf\xd8\xb7\x6f\xca\x56\x98\xee\x25\
-\x1a\x56\x28\x43\xb8\xba\x02\xa5\x7d\x2a\x3c\x69\x55\x6d\xd2\xca\
-\x35\x59\x96\x76\x61\xd2\x27\x38\x4b\x80\x1e\x83\x24\xb0\xcd\x5b\
-\x8b\x4f\x85\x38\x2d\xa8\x74\x97\x62\xa2\xba\xba\x96\xb4\x64\x38\
-\x8c\xa9\xc9\x32\xf5\x1d\x45\x5b\x78\xe5\x2b\xd3\x0e\x4e\x03\x22\
-\xab\xd0\x22\x82\x7f\xf2\x49\xa8\x15\xde\x95\x21\xb6\x2a\x08\xc4\
-\x49\x40\x55\xc5\xb3\x4d\x63\xf4\x1b\x9d\x48\x2d\x8a\x02\x05\x80\
-\x00\x9c\x0e\xaf\xab\xc6\xb4\xa3\xc3\xc9\xaf\x2c\xf6\x09\x1c\x43\
-\x64\x98\xcb\x74\xee\xdc\x37\xbf\x09\xe6\xcd\x6f\x86\x62\x7e\x9e\
-\x81\x35\xf6\x12\x19\x6a\x46\x51\xfa\x3c\xad\xaf\xc3\xd5\xe1\x69\
-\xb4\x6d\xfa\xb8\xa6\x42\xf5\xbc\xcc\x99\xd5\xc8\x75\xc6\x69\x0c\
-\xc3\x42\x9f\x54\xc3\xad\x28\x49\x7d\x9f\xb6\x5d\x78\xba\x09\xaa\
-\xaa\xdb\xde\xd6\xdd\x92\x71\x62\x3e\x00\x80\x83\x74\x5c\x7f\xee\
-\x73\x90\x7f\xea\x53\x90\x2f\x2e\xb2\xd9\x72\x8d\xf0\xe6\xa8\x5d\
-\xff\xfc\xe7\xe1\xec\x23\x8f\x00\xaa\xa2\xb4\x9f\x5a\x8d\xb6\xd3\
-\xab\x98\xa7\x82\xb6\x56\x03\xce\x78\x7c\xf6\x6b\x61\x55\x5e\x6a\
-\xe5\x44\x37\xc2\x2a\x48\xbd\xb7\x2b\x09\x30\x41\x73\xa2\x3a\x86\
-\xd7\x59\x7a\x2d\xd0\xf5\xf5\x8f\x7e\x04\xee\x7d\xef\x83\xfc\xad\
-\x6f\x85\xfc\xc5\x2f\x86\x82\x40\x06\xda\xc1\xbe\xf0\xa5\x2f\xc1\
-\xe3\xf7\xde\x0b\xd5\x95\x94\x87\xd8\x4e\x5f\xb4\x3f\x39\xb8\x74\
-\xa2\x31\x0a\xc8\x59\xfb\x40\x4c\x0a\xd2\x20\x22\xc0\xda\xa6\x2b\
-\x20\x15\xa0\x80\x57\x5f\x27\x20\x9d\x6b\x80\x03\x6d\xe3\x4d\xf8\
-\xea\xa1\x87\x60\xf5\x63\x1f\x83\x21\xed\x2d\xae\xf2\xad\x47\x7a\
-\xdd\x26\x2b\x65\x0f\xf0\xb8\x82\x9a\xab\x82\xd1\xca\x45\x57\x23\
-\xd2\x4f\x89\x74\xf2\x7f\x3c\x3e\xdb\xb5\x70\x10\x13\x4e\x6f\x3e\
-\x29\x50\xd5\xd7\x5e\x6d\xc8\x3e\x5d\x5a\xbf\x46\x80\x28\x6b\x57\
-\x05\xde\xaa\x80\x0a\xa1\xa4\x3a\xba\x70\x61\x2a\x30\x98\x0c\xaf\
-\x63\xde\x30\x29\x37\xec\x5e\xaf\xaa\x13\x98\x33\xf7\x81\x0c\x8f\
-\xab\x80\x91\x48\xdc\xc9\x01\x43\x52\x60\x5a\xf8\x53\x6d\xa8\x4e\
-\xa0\x77\x41\x20\x4e\x87\xb4\x37\xd5\x4d\xdf\xba\xd2\x00\x22\xf3\
-\x15\x58\x1a\x60\xa6\xa4\x3f\x66\xc6\x79\x20\x06\x31\xc7\x86\x2f\
-\xec\x24\xcc\x02\xba\xa9\xba\xaa\x52\xd5\x75\xc1\xed\x1d\x98\x9e\
-\xdf\xfb\x12\xae\xa9\x6e\x55\x9a\x9e\xef\xe6\x94\x0c\x56\x00\xcf\
-\x2e\x8d\xc9\x91\xc0\xa8\x09\x33\x10\x01\x38\x09\xde\x50\xbe\xac\
-\x48\x10\xc5\x64\x45\xa5\xd3\xc0\x71\xd9\xbb\xfa\xae\xf2\xda\x0a\
-\x11\x2e\x1a\x03\x8e\xd2\x1f\x4b\xed\x20\x04\x28\x38\x58\x35\x56\
-\x17\x93\x7d\xa2\xd7\xe3\xd9\x47\x61\xa4\x92\x00\xc6\x3c\xae\x09\
-\x90\x29\x0b\x58\xd9\xab\x13\xe5\x39\xd7\x55\xdd\x15\xde\x3c\xfc\
-\x96\xaa\x5b\x0d\x01\xce\x16\x05\x1c\x7b\xcd\x6b\xe0\xe8\x4b\x5f\
-\x0a\x7d\xba\x91\x55\x51\x62\xce\x5f\x68\xb2\xab\xab\xb0\xcd\x29\
-\x92\x82\x52\x95\x4a\xe0\x50\xb0\x88\x33\xcf\x03\xf5\x96\xa1\x46\
-\xe0\xb6\xf2\xc4\x64\x53\x8a\xa2\xf0\x9e\x0e\x38\x1d\x6b\xa5\x1b\
-\x30\xe5\xfa\x1d\x44\x38\x4b\xaa\x7b\x31\xe5\x89\xf3\x37\xdd\x04\
-\xa9\xec\x7b\xfe\xf3\x61\xff\xeb\x5f\x0f\x23\x4a\x81\x06\xdf\xfb\
-\x1e\x9c\x2b\xcb\x66\x70\xd1\xaa\xa6\x9d\x94\x3a\xdb\x1d\x69\xf9\
-\xd2\x8e\x27\x50\xa0\x5b\x5a\x0a\x96\x95\x37\xbe\xa9\x83\x32\xae\
-\xc1\x65\x0a\x18\x68\x25\xc0\xd8\x3d\x6e\xf8\xa5\xae\x9f\xd3\x72\
-\x86\x12\xed\x9b\xdf\xf5\x2e\x81\xa7\x45\xbe\x87\x43\xe7\x06\xef\
-\x7f\x3f\x04\xda\xed\xd9\xfc\xc9\x4f\x60\x55\x03\x8b\xfe\x9e\xf6\
-\xdc\x66\x6c\xc2\x0c\x0b\xe9\x47\x4c\x58\xcc\x37\x45\x62\x36\xd7\
-\xe9\xca\xeb\x80\x49\x7d\xcd\xfa\x8d\x8e\x5f\x35\xc2\xc2\x94\xa8\
-\xc9\xf3\x3a\xf4\xda\xd7\x02\x68\x49\xbb\x38\xfa\x7d\x9c\xb7\xbf\
-\x1d\x2e\x7f\xe4\x23\x70\xb1\x2c\x1b\x3b\x2e\xbe\xb1\x43\xa3\x1f\
-\xd8\xac\x4d\x18\xbd\x73\x02\x10\x31\x29\x90\xd7\xb4\xa2\xbe\xae\
-\xcf\xeb\x66\xf6\xdd\xe8\xa8\x50\x35\xbd\x48\xe0\x12\xdc\xd4\x9f\
-\x6a\xe6\x25\x22\x2c\x1e\x3e\x2c\x7f\x62\x26\xa5\xb1\x8b\x93\xf6\
-\x12\x33\xda\x06\x3b\x7c\xf4\x28\x3c\x48\xb7\x0b\x10\x51\x6f\x2a\
-\xc9\xfe\x5f\x82\x9a\xea\xec\xb7\xb3\x90\x81\x51\x4d\x01\x83\xe0\
-\xb1\xf2\x24\xd7\x13\x78\x0d\x60\x38\xc1\x4c\x7c\x02\xcc\x93\x6c\
-\x9b\xa8\xe4\x91\x1d\x70\x6a\xbe\xd3\x5d\x81\xb9\x7c\x79\xe2\x36\
-\x58\x82\xc8\x00\x73\xda\x2a\x3b\xc7\xf3\x55\xf5\x0b\x3c\xa9\x3a\
-\xa6\x1b\x0b\xb3\x54\x60\x00\x2f\xc9\x71\x74\xae\x7e\x0c\xb0\x1a\
-\xdf\xe6\x74\xe2\x74\x3b\xa9\x80\x97\x89\x74\x60\x74\xfd\x9d\x42\
-\x05\x3d\x37\xdd\xef\xb5\xcc\xbc\xcf\x6b\x68\xda\x64\xd8\x77\xcb\
-\x2d\x0c\x8c\x6b\x63\x17\x27\x6e\xc6\x92\x8f\xbe\x40\x6b\x6a\x0f\
-\xa0\xf0\xf4\xf7\x08\x40\x6b\x1b\xee\x67\xd6\x69\x0c\x26\x50\x75\
-\x55\x41\x45\xd5\xc9\xfd\xd8\x86\x29\x36\xd4\xa5\x7d\x55\xa6\x4e\
-\xba\x0b\x31\x25\xb6\xd3\x7c\x9f\xce\xa7\xe1\xab\x8c\x73\xb0\xf9\
-\x99\xcf\xc0\xe2\x57\xbe\x92\xfc\xde\x2e\xc8\x7d\xa4\xbc\x3e\x00\
-\x5c\xb8\xf3\x4e\x78\x58\x57\x27\x8d\x1d\x6a\x67\x4c\x03\xec\xec\
-\x7d\xa0\xf7\x11\x96\x93\x37\xcd\xca\x8b\x10\x03\x8f\x33\x40\xdd\
-\xdd\x55\x98\x6d\xc5\xe9\x1b\xd7\x6b\xdb\x6b\xd7\x36\x28\x63\x3a\
-\x90\xcd\xae\xaa\xf5\x35\x35\x1d\x2f\x50\xae\x57\xd1\x3d\x93\x85\
-\x0f\x7f\x18\xb2\xe7\x3d\x4f\x22\x30\x8d\x17\x9b\x9b\x70\xf9\xb3\
-\x9f\x85\x7f\xfb\xf6\xb7\xa1\xea\xaa\x4f\xa1\xb5\xd2\x25\x9c\x79\
-\x22\x4d\x00\xeb\x71\xfe\x57\x33\x40\xef\xf5\xcb\x89\xd3\x7d\x9f\
-\x9e\x6b\xab\x6b\x8a\x4a\x41\xd5\x39\x75\xd3\x41\xaf\xd5\xf6\x6c\
-\x5d\xc3\x88\xb6\xc2\x7a\x1f\xfc\x20\x0c\xe8\x1b\xb0\xfe\xb9\xcf\
-\x85\xe1\xda\x1a\xfc\xf2\xa7\x3f\x85\xef\x92\x79\x6f\xe9\x3d\x62\
-\x0d\x58\x62\x35\xb1\xa2\xfc\x75\xbd\x7e\xe8\x6c\xce\x7c\x48\xdd\
-\xdf\x0a\x60\xe6\x33\x74\xe3\x7b\x22\xe5\x18\x98\x0b\x81\x61\xaa\
-\xd2\x14\x42\x37\x70\x48\x93\xae\x6b\xaa\x4d\x92\xf1\x2e\x50\xaa\
-\xa6\x9b\x4c\x4f\x4a\xa4\x1b\x63\x17\xa8\x9e\x7f\xf4\x51\x28\xb8\
-\x7e\xff\xfb\xb0\x71\xa5\x6f\x23\xe8\x0e\x74\xe7\xbc\x6e\xd3\x8d\
-\x5b\x10\xae\x21\x20\x06\x6b\xb1\x80\x1a\xe9\xef\xa8\xf1\xc0\x81\
-\x03\xd3\x01\xf2\xa3\x3f\x36\x37\x7b\x48\x8e\x24\xee\x48\x3b\x51\
-\x60\x04\xe2\x38\x70\x28\x90\x36\x34\x1d\x6b\x9a\x71\x67\xd1\xee\
-\x19\x54\x2b\x3f\xc4\x86\x39\xe9\x38\xb4\xa2\xb1\x02\xee\x42\x75\
-\xf2\x94\x10\x0d\x12\x93\x00\xca\xf8\xa4\x7b\x22\xa2\x3e\x75\x47\
-\x32\xc7\xd4\xa9\x1d\x8c\xbc\x49\x7f\xd1\x8a\x77\x1d\xbb\x0b\xf2\
-\xb6\xb9\xf2\x73\x52\x1e\xa3\x7c\x69\x65\x45\x4d\x8a\xd7\xbf\x95\
-\x73\xe9\x6f\x29\x74\x32\x5a\xbb\x4a\x43\x94\x48\xac\xca\x6a\x5c\
-\xb3\x87\xcd\x02\x79\x8d\x1e\xeb\x78\xf3\x58\xfb\xd3\xee\xca\x75\
-\x37\x5b\xb5\x76\x97\x71\x7b\x5f\x89\x9c\x02\xec\x28\x90\x9f\xd8\
-\xf3\x76\xca\xdc\x41\x0b\x03\x34\x55\xfa\x76\xbb\xf7\x8d\x49\xf9\
-\xa7\xfa\xb7\x16\x34\xec\xaa\xf1\xca\x51\x76\x72\x3a\xa3\x0a\xec\
-\xc0\x54\xf0\x2d\x21\x48\xa0\x52\x13\xed\x6e\x79\x4d\x80\x3c\xfb\
-\x34\x46\xb7\xb5\x38\xf2\x76\x4d\x41\x9d\x71\x3b\xdf\xeb\xfa\xbd\
-\x49\xab\x13\xc4\x89\x29\x0c\xb4\xc1\x4e\x5f\x17\xab\x89\x0b\xb9\
-\x49\x01\x4a\x57\x39\xea\x22\x1a\xee\xa6\x0d\xd9\xce\x2c\x91\xd6\
-\xb9\x49\x1a\xd3\x0d\xfd\x0d\x68\x5e\xfb\x4d\xff\xa2\x4a\x10\x85\
-\xaa\x13\xd7\xb5\x71\x53\xc9\x93\x81\x69\x3a\xd3\xdd\xba\x4f\xdb\
-\xf2\x0a\x2d\x01\xed\xb8\x03\x54\x77\x02\xb5\xb5\xe0\xd2\x9a\x98\
-\xfa\xa1\xf5\xde\x0d\x18\xe4\x62\xad\x45\x93\x21\x7a\x8f\xff\xab\
-\xef\xc6\xa0\x43\x2a\x00\xcd\xc0\xa1\xe0\x24\x11\xed\x7e\x0f\xaf\
-\xfb\x8d\xa8\xd4\x4a\x15\x13\x6b\xbb\x81\x76\x0e\xd8\xf6\x53\x6d\
-\x60\xad\x74\xc7\x4c\x57\x6c\xeb\xf5\x5a\x12\x3c\xf9\x40\xf5\xfa\
-\xb6\x9b\xa7\x12\x17\x14\x79\xde\xc3\x3d\x01\xec\xf5\x0a\x74\xf2\
-\x27\xe8\xc8\xaa\x19\x59\x9b\x7c\x5c\x5a\x43\x4e\xf9\xbe\x89\xde\
-\xdd\x72\xe3\xa8\xa6\x26\xa5\x4a\xf0\x4d\x25\x34\x94\xd2\xd9\xcd\
-\x69\xfa\xc3\x0e\x24\x23\x20\x15\x6c\xcb\x8f\x76\xa3\xf6\x04\x42\
-\xdd\x5d\x69\x34\xa8\x7f\x42\x62\x82\xf1\xa2\x1d\x0c\xb4\xce\xc6\
-\xb2\x2c\xa7\x03\xa4\xe7\x63\x21\xa2\x0b\x50\x42\x00\x63\x46\x24\
-\x73\x53\xa2\xfc\x36\x9f\x65\xfa\xa7\x52\xad\x2f\x6b\x43\x3a\x56\
-\x60\xe9\xba\xb6\x0f\xec\x46\xc2\xf6\x62\x5e\x41\x29\x44\x8d\xf0\
-\xe9\xb8\x01\x76\x82\x12\xd5\x8c\x27\x99\x7c\xeb\x1b\x0c\x86\xfb\
-\xd6\x82\xe1\x7e\x5e\x54\x08\xa6\xa2\x91\xca\x02\x54\xde\x86\xda\
-\xa2\xf1\xb2\x9b\xe7\x03\x3f\x32\x6f\x2a\xc0\x95\x95\xf3\x38\x1c\
-\x2e\x87\xd0\x0b\xae\xb8\xf9\xa6\xff\x18\x9e\xbf\xf0\x9e\x73\x94\
-\x13\x2e\xf0\x0a\x44\xc1\x68\x24\x9e\x14\x58\x24\xa3\x9f\x18\x3c\
-\x50\x9d\x7a\xd7\x37\x25\xff\xc6\xca\xea\xc2\x53\xb5\xa9\xcf\x93\
-\x71\x19\x6b\x83\xea\x82\x56\xb0\x1a\xc8\x5a\x69\xcc\x1c\x22\x66\
-\x37\xde\xf0\x24\x18\xe4\x0d\xef\x9d\x00\x38\x22\xb8\xa5\x73\xb6\
-\xee\xf5\x4a\x4f\xcf\xd3\xc2\xd3\xa7\x4f\x4f\x55\x20\x9e\x3b\xb7\
-\x4c\x99\xb6\x0b\x59\x9d\xd5\x78\xcb\xf3\x1e\x9f\x3f\xf3\xc4\x97\
-\xaa\x33\x67\xff\xea\x82\xf7\x0b\xbb\x51\x8c\xab\xde\x4f\xd0\x22\
-\x60\x9a\x4a\x10\x60\xd4\xc8\x78\xea\x1b\x6a\xed\x84\x88\x65\x41\
-\x5f\x9b\xab\xaf\xd3\xcb\x54\x9d\xc9\x84\x55\x7d\xd6\xca\x39\x05\
-\xca\xfd\x36\x58\x99\x7b\x23\x08\x4a\x59\x2a\x0a\x7f\xf0\xe5\x2f\
-\x39\x6b\x7a\xc5\x3a\x02\x6e\x18\xb0\x1b\x16\x61\x0b\x3c\x0e\x43\
-\x11\x2a\xc4\x39\xe7\xfd\x28\xd0\xc3\x77\xa6\x2b\xf0\xd8\xb1\x9f\
-\x13\xc4\x9b\xfd\xca\xca\xb0\xf6\x6e\xdf\xb0\xff\x47\x27\xff\xa5\
-\x07\xf8\x00\xae\xae\xbe\xd0\xe4\xf9\x31\xb0\xf6\x30\x18\xbb\x0c\
-\x60\xe6\xc1\x40\x9f\x6a\x0e\x68\x2c\x11\x89\xf6\x6a\x1a\x50\xe0\
-\xda\x2a\x08\xda\x35\x88\x46\xfe\x07\x20\x5e\xa9\x32\x8b\x8b\x1b\
-\x60\x60\x1d\x00\x9e\x34\x48\xd5\x84\xdf\x20\x98\xcb\xde\x9a\xed\
-\xc2\x11\x39\x08\x8e\x4a\xa0\x87\x13\xe1\xd7\xbf\xfe\x75\xec\x00\
-\x44\x2a\x6f\x79\xcb\x5b\xf0\xfa\xeb\xfb\x7e\x38\xcc\xea\x7e\xbf\
-\x1c\x7a\xdb\xdb\xb0\x90\x3d\x99\x1d\x39\xf2\x30\x60\xd8\x36\x60\
-\x36\x89\xcc\x0a\x02\x2e\x11\x9f\x7d\x08\xd0\xe3\xa0\x1d\x71\x25\
-\x7e\x88\xe6\x5a\x64\xa8\xb9\x63\x44\x37\x16\xb1\x91\x60\x11\xb0\
-\x32\x60\xb6\x10\x91\x01\x5e\x02\x30\xbf\xa6\xeb\xa8\x0d\x6b\x59\
-\x08\x5b\x3b\x19\x94\x45\xe5\x1d\x05\x90\xf8\xec\xac\x4f\x7c\xe2\
-\x13\x93\x15\x78\xf7\xdd\x77\x23\x5d\xe0\xe9\xf1\x4f\xb5\xb5\xe5\
-\xd0\x04\xb7\x11\xb2\xa2\x17\x30\xe4\x06\x2c\x02\x60\x69\x0c\x41\
-\x44\x58\x02\x63\xf6\xd1\x71\x0f\x02\xe4\x86\x4a\x34\x60\x89\x02\
-\x70\x0d\x16\x9d\x15\x86\x38\x53\xc1\x88\x11\xa0\xb1\x66\x44\xc3\
-\xdb\x60\xf0\x32\xa2\x79\xd2\x02\x5c\x08\xe8\x2f\x62\x08\xeb\x75\
-\x0d\xdb\x26\x98\xb2\xf4\xa5\xe3\x47\x83\x5e\x21\x8d\xd1\x08\x4f\
-\xcf\x15\xad\x77\x76\xec\x88\x7d\x6a\x6e\x9c\x05\x86\x97\x61\x8d\
-\x68\x48\x85\x61\x8d\x78\x2d\x00\xe0\x3e\x43\x0a\x44\x63\x32\x84\
-\x60\x59\x82\xc0\x18\xf1\x1a\x25\xa8\x7e\x14\x31\x50\x6b\x31\x98\
-\x18\x4b\x4c\x8d\x00\x25\x18\xd8\x31\x08\x1b\x80\x64\xc6\x06\x57\
-\xd1\x64\xbf\xc9\x73\x5c\xb7\x76\xb4\xb3\xba\x5a\x57\x14\x7d\xfd\
-\x9d\x77\xde\x89\x5c\xa6\x02\x44\x44\x96\x35\x3f\x74\xd6\xf3\x83\
-\xb6\x16\x6f\x5c\xdc\x19\x6c\xf3\xbd\x86\xb8\xaf\x50\x02\xe2\x26\
-\x18\xfb\x9b\x60\xc2\x9c\xb5\xb6\x8f\x01\x0b\x83\x21\x0b\x44\x38\
-\x99\xb0\xe2\x93\x94\xea\x5a\x81\xf6\x54\x85\x58\xe6\x06\x71\x2c\
-\xd0\x88\xb3\x80\x95\x03\x3b\x22\xa8\xdb\x01\xcd\x56\x16\xb2\x0d\
-\xa8\xc2\x56\xb0\xbd\xed\xba\x36\xa3\xb5\xb5\x8b\x8e\x00\x6a\xda\
-\xaa\x00\xa7\x42\x64\x53\x76\xbc\x3b\xb3\xef\xf0\x3e\x1c\xe6\xde\
-\x65\x90\x95\xe8\x70\xdb\x1a\x18\xe4\xc1\xf4\x03\xf8\x02\x82\xc9\
-\x91\xe7\x93\x65\xc6\x84\x10\x61\x05\x69\xe5\x5f\x30\xd7\x90\xff\
-\x73\x29\x08\x5b\x94\x67\x1e\x5a\xcc\x10\x83\x03\x17\x20\x98\xda\
-\xe4\xa6\x32\x0e\xcb\x5e\x16\x86\xc1\x54\x23\x63\x06\xa3\xba\xae\
-\xab\xc7\x1f\x7f\xbc\x06\x00\x4f\x3c\xf6\xf0\x08\x50\x85\x18\x58\
-\x50\xf4\x00\x56\x47\xcf\x10\x25\xf2\xe7\x3c\xe5\x87\xb5\xa7\x68\
-\x54\xf4\xeb\x02\x8c\xcd\xb1\xee\x65\x3e\xf7\x59\xe6\x32\xc3\x59\
-\x62\x6e\xe3\xe6\x83\x86\x62\x7f\x6d\x3a\x41\xc4\x10\x97\xaa\x75\
-\xe9\x01\x32\x87\x6c\xc6\x36\xb3\x1e\x42\x49\x07\xc1\x6d\x6f\xdb\
-\xba\x28\x7a\xf5\xdc\xdc\xa0\xe6\x27\xf9\xb2\x26\x28\x36\x04\x85\
-\xd7\x00\x78\x55\x88\xc8\x79\x0f\x85\x6e\xba\x15\xbc\xca\x8f\x08\
-\xae\xd6\x7b\x55\x76\x18\x32\xbb\xbd\x1d\x2c\xdd\x01\x33\xe5\xa0\
-\x34\x83\xb2\x32\xc2\x6b\x09\x7e\x17\x8a\xf7\x1b\x30\x3f\xdf\x43\
-\xbe\x33\xda\xef\x8f\xd0\xb9\x25\x06\x14\xb8\xec\xdf\xbf\xe0\xe9\
-\x79\xd9\xe1\xd2\xa5\x4b\x81\x04\x14\xee\xba\xeb\x2e\x54\x78\x5a\
-\xfe\x07\x89\x4d\xb2\x67\xbc\xfd\x17\xb8\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x09\xa8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x03\x00\x00\x00\xf4\xe0\x91\xf9\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x02\x8b\
-\x50\x4c\x54\x45\x00\x00\x00\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\
-\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\
-\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\
-\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\xda\xa5\x20\x00\x00\x00\x8f\
-\xf6\x6b\xa6\x00\x00\x00\xd7\x74\x52\x4e\x53\x00\x16\x0d\x77\x67\
-\x01\xdb\xcd\x43\x33\xa8\x99\x15\xf9\xf3\x0c\x74\x65\xd9\xcb\x40\
-\x31\xa5\x97\x13\xf8\xf2\x0b\x71\x63\xd6\xc9\x3d\x2f\xa3\x95\x11\
-\xf7\xf0\x0a\x6e\x61\xd4\xc7\x3a\x2d\xa0\x93\x0f\xf6\xef\x09\x6b\
-\x5f\xd1\xc5\x37\x2b\x9d\x91\x0e\xf4\xee\x08\x68\x5d\xce\xc3\x34\
-\x29\x9a\x8f\xed\x5b\xc1\x28\x8d\xf1\xec\x07\x59\xc8\xbf\x2e\x26\
-\x94\x8b\xeb\x06\x60\x57\xbd\xfe\x24\x02\x22\x44\x55\x76\x87\xc4\
-\x54\x32\x21\x04\x14\x25\x36\x47\x79\x8a\x9b\xac\xde\xbc\xab\x46\
-\x35\x17\x39\x4a\x5a\x7c\x9e\xaf\xc0\xd0\xe1\x49\xa1\xb2\xd3\xe4\
-\xf5\xb9\x96\x70\xfd\x6f\x4c\x4b\xe3\xe2\x19\xca\x18\xad\x89\x85\
-\x62\xfa\x5e\x41\xd8\x23\x05\x7a\x4f\xe8\x1e\xd2\x1a\xb6\x03\x92\
-\x6c\xfc\x2c\xe0\xa9\x9f\x84\x53\xe6\x1d\xbe\xb3\x82\x56\x9c\x8c\
-\xdd\x1f\x50\xa6\xe7\xd7\x6a\x3e\xdc\x80\xfb\xc2\x30\xb0\x73\x8e\
-\x98\xb5\x3b\xd5\x7d\xe5\x20\x27\x78\x58\xba\xaa\xea\x3c\x6d\xae\
-\x72\xb8\x67\x85\x97\xd3\x00\x00\x00\x01\x62\x4b\x47\x44\x00\x88\
-\x05\x1d\x48\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\
-\x00\x0d\xd7\x01\x42\x28\x9b\x78\x00\x00\x00\x07\x74\x49\x4d\x45\
-\x07\xe2\x06\x03\x17\x22\x14\xae\xac\x6d\xcf\x00\x00\x04\xfd\x49\
-\x44\x41\x54\x78\xda\xed\x9b\xfb\x5b\x54\x45\x18\xc7\x07\x75\x59\
-\x35\x41\x57\x12\x10\x33\x51\x37\xb7\x52\x11\x10\xf3\x92\x5c\x94\
-\x34\x04\x24\x45\x4a\x84\x05\x45\xd4\x50\x84\x0d\x41\x14\x25\x10\
-\xc5\x0b\xe4\x25\x2d\x11\xa2\xcc\x5b\xa8\x95\x86\x95\x96\x77\xcb\
-\x7b\x37\x4d\xad\xf9\x77\x64\x59\x60\xf7\xec\xce\x99\x73\xce\xbc\
-\x73\x66\x9e\xa7\xa7\xef\xcf\xe7\x9d\xcf\xe7\x81\xb3\xf3\x9e\x33\
-\x33\x07\xa1\xff\x03\x4b\x50\x3f\xc9\x02\xfd\x07\xc8\xe5\x5b\x82\
-\xad\x72\x05\x06\x62\x3c\x48\xaa\xc0\x60\x8c\x5f\x90\xc9\x1f\x12\
-\x82\x71\xe8\x50\x89\x02\xc3\x70\x57\x6c\x12\x05\x86\xbb\x05\xc2\
-\xe4\xf1\x5f\xc4\xdd\x19\x21\x4d\x20\xdc\x23\x10\x21\x8b\x1f\x39\
-\xd2\x23\x10\x35\x4a\x92\xc0\x4b\xb8\x27\xa3\x25\x09\xbc\xdc\x2b\
-\x30\x46\x0e\x3f\x1a\xf7\x65\xac\x14\x81\x71\x5e\x81\xf1\x32\xf8\
-\xf6\x57\xbc\x02\x13\x1c\x12\x04\x5e\xc5\x3e\x79\x4d\x82\xc0\xeb\
-\xbe\x02\x13\xc5\xf3\x27\x61\x45\x26\x0b\x17\x88\x51\x0a\x4c\x11\
-\xcd\x8f\x8d\x53\x0a\xc4\x4f\x15\x2c\x90\x80\xfd\x32\x4d\xb0\xc0\
-\x1b\xfe\x02\xd3\xc5\xf2\x67\xe0\x80\xcc\x14\x2a\x30\x2b\x50\xe0\
-\x4d\x91\xfc\xd9\x89\x81\x02\x49\xc9\x02\x05\x52\x30\x21\x73\x04\
-\x0a\xcc\x25\x09\xa4\x8a\xe3\xbf\x85\x89\x99\x27\x4c\x60\x3e\x59\
-\xe0\x6d\x51\xfc\xa1\xa1\x64\x81\x34\x51\xb7\xa1\x0d\xab\x64\x81\
-\x20\x81\x30\x35\x81\x74\x31\xfc\x11\x58\x35\x19\x42\x04\x22\xd4\
-\x05\x32\x45\xf0\x47\x2d\x54\x17\xc8\x7a\x47\x80\xc0\x68\x4c\xc9\
-\x22\x01\x02\x8b\x69\x02\xd9\xe6\xf3\x97\x60\x6a\x72\x4c\x17\x78\
-\x97\x2e\xf0\x9e\xd9\x7c\xc7\x04\xba\xc0\xd2\x5c\x93\x05\x96\x61\
-\x8d\xe4\x99\x2c\x30\x5d\x4b\x20\xdf\x5c\xfe\x4c\x2d\x3e\x76\x16\
-\x98\xc1\x2d\xb4\x2f\x1f\xb4\xa2\xc8\xb6\xb2\x78\x95\xa6\x00\x4e\
-\x2f\x5e\x69\x5b\x3d\x70\xcd\xfb\xf6\x42\x08\xb1\x64\xed\xba\xd2\
-\xf5\x79\x29\x65\xe5\xae\x0f\xf2\xe7\x56\xc4\x3b\xb5\xb9\x84\xbf\
-\x45\x7c\x85\x75\x43\xa5\xab\xbc\x2c\x25\xaf\x6a\xe3\xba\xb5\x25\
-\x74\x62\x6e\x75\xc6\xa6\xcd\x35\x09\x5b\x32\xb7\xd6\x7e\x58\x57\
-\x1f\xc5\x02\xd4\x4a\x54\x7d\x5d\x76\xed\xd6\xcc\x2d\x09\x35\xdb\
-\x36\x65\x54\xf7\xfd\x5a\x6c\x0d\xdb\x53\x77\x34\xee\x34\x83\x48\
-\xcf\xce\xc6\x1d\xa9\xdb\x1b\x6c\x28\x76\x97\x78\xb6\x37\xbb\x62\
-\xbb\xfe\xdd\x11\xf2\xf8\xbb\x3d\x37\xc6\x9e\x26\x39\xf8\xa6\xe6\
-\xde\xfb\xe0\xa3\x50\xf8\x68\xc6\x13\xba\xd7\xfb\x1b\x18\xbb\x4f\
-\x3c\x7f\xff\x12\xdf\x5f\xe1\x81\x30\xf8\x88\xc6\xf2\xf1\x41\xe5\
-\x3c\xe0\x38\x24\x96\x5f\x19\xb0\xa2\x62\xf9\x44\x24\xff\x53\x0b\
-\x61\x32\x3c\xdc\x22\x0a\x1f\x72\x84\x3c\x1d\xb7\x26\x89\xe1\x67\
-\x45\xab\x35\x84\x9c\x60\x11\xfc\xb6\xcf\xd4\x5b\x52\x64\xba\xf9\
-\xfc\x7c\x3b\xb5\x29\xc6\xc0\x09\xf4\xb8\xda\x35\x9e\x04\x3e\x67\
-\xea\xfd\x7a\xd3\x34\x0c\x69\xa6\x28\x0e\xce\x51\x4b\xe2\x17\xda\
-\x7c\x84\x4a\x8f\x9a\xc5\x6f\xd4\xb9\xc1\xf7\xe5\x31\x73\xf8\xd6\
-\xe3\xfa\xf8\x08\xf5\x3b\x61\x06\xbf\xd6\xc0\xb6\xca\xc9\x53\xfc\
-\xf9\xe5\xc6\x9e\x92\xbf\xea\xe0\x8b\x6f\x31\xbc\xb7\xb8\x8d\xeb\
-\x93\x71\x52\xab\x51\x3e\x42\xa7\xcf\xf0\xe3\x07\x33\xbd\xb5\x57\
-\x2f\x86\x93\x3d\x49\x8f\x64\xe1\x23\x94\x7c\x96\x0f\xff\x6b\xe6\
-\x57\x76\xcb\x37\x1c\xf0\xce\x32\x56\xbc\x3b\x47\x42\xa0\xfc\xb8\
-\x6f\x21\x7c\x84\xa2\xb3\x60\xfc\x73\x1b\x61\x7c\x84\x0a\xda\x20\
-\xfc\xba\xf3\x50\x3e\x42\xf6\xef\xd8\xf9\x9d\x5c\x8e\xf8\xb4\x57\
-\xb2\xf2\x67\x81\xd6\x28\xbc\x61\x6e\x0c\x17\xf8\xf0\x95\xfb\xe4\
-\x46\xb2\x8a\x0f\x3f\x88\xf9\x16\x68\xe1\x73\xbc\xe6\x7b\x66\x01\
-\x5c\xc5\x45\x20\x82\x5d\xa0\x98\x8b\xc0\x70\x76\x01\x2e\xe7\x7b\
-\x8e\xb3\xf3\x71\xc7\x6c\x0e\x02\x0b\x00\x02\x78\x2f\x9c\x8f\x7e\
-\x80\x08\xfc\xc8\x41\xe0\x22\x44\x80\xc3\x91\xd7\x4b\x10\x3e\x6e\
-\xb2\x83\x05\x34\x37\x08\xe8\xf9\x09\x2c\xd0\x00\x13\x80\x9f\xab\
-\xd8\x0f\x13\x38\x06\xe5\x17\xc0\xf8\xd8\x39\x04\x28\x60\x03\x0a\
-\xe0\x22\xa0\xc0\xcf\x50\x81\xdd\x40\x81\xcb\x50\x81\x2b\x30\x7e\
-\x06\x94\x8f\xf1\x01\x90\xc0\x55\xb8\x40\x0d\x48\x40\xeb\x79\xd4\
-\xe9\x0a\xd7\x12\x70\x41\xf8\x96\xa5\xf4\xc1\xdb\xae\x21\xb4\xbe\
-\x82\x7e\xcd\x75\x88\xc0\x64\xea\xd0\x21\x37\xba\xcf\x2b\x38\xca\
-\x6f\x52\x2f\x83\xbc\x9b\x34\xd3\x06\xbe\xd5\x77\x70\xe9\x17\xea\
-\x6e\x03\xe4\xa4\xe1\xaf\xea\xc3\xc6\xdb\x7c\x56\xdc\x0b\x9b\x29\
-\x9b\x3e\x31\xec\xfc\x42\xf5\xe5\xf3\xb3\x7e\x1b\x1e\xe7\x3b\x55\
-\x2f\xad\x67\x17\x58\xa3\x36\xe6\x99\xcd\x81\x17\xaf\x3e\xa7\x76\
-\xf5\x72\x66\x81\xdb\xe4\x01\x3b\xee\x10\x5f\x38\x62\xef\xaa\x2c\
-\x33\xb3\x1f\xbe\xbf\x47\x1c\xcf\xaa\xfa\x61\xcf\xfd\x07\xc4\x82\
-\x70\x56\x7e\x09\x69\xa5\x2e\xf1\xf6\x49\xf5\x8a\xdc\x87\x23\x09\
-\x25\xbf\xb1\x0a\x10\x4e\xae\xe2\x13\xbf\xd3\x6b\x72\xb2\x09\x45\
-\x7f\x30\x0a\xfc\x19\x30\xd2\xd1\xbf\xb4\xab\x0e\xa7\x05\x94\xa5\
-\x30\x0a\x3c\xf2\x1b\xc7\xe9\xd2\xf5\x8c\x1b\x14\xd0\x1e\x1e\xb3\
-\xf1\xdb\xfd\x0e\x15\x5c\xb9\xa6\xb7\xd2\xbf\x3d\xfc\x6d\xd1\x5b\
-\xa9\xc8\x13\xc5\x20\x3d\x13\xbf\xbe\xf8\xb7\x87\xd3\x4c\x02\x0f\
-\x7d\x87\xb8\x65\xf0\xa8\xa0\xb2\x3d\x3c\x65\x12\xf0\x59\x1d\x53\
-\x4c\xfc\xfa\xa2\x68\x0f\xcf\x58\xf8\xc9\xde\x6f\x48\x06\x1f\x64\
-\x19\xc0\xa7\x3d\xa4\xb1\x2c\x97\xb5\xf6\x56\x93\x26\x7e\x7d\xf1\
-\xb6\x07\x96\xcf\xd1\x2e\x78\x4a\x3b\x32\x01\x2b\x4d\x7d\xed\xe1\
-\x1f\x86\xe2\xd4\xee\x4a\x2b\xf0\x8b\xce\x9e\xf6\xd0\x69\xbc\xd2\
-\xd1\xa2\x35\xf1\xeb\x8b\xa7\x3d\x2c\x34\x3e\x4e\x95\x7b\xe2\xbf\
-\x04\xc5\xbb\xd3\xdd\x1e\x4a\x0d\x97\x15\xeb\x9a\xf8\xf5\xa5\xab\
-\x3d\xf4\x37\x5c\x34\x51\xdf\xc4\xaf\x2f\x41\xe1\xff\x1a\x2d\xb1\
-\x4c\xe2\x87\x77\xe7\x3e\xdf\xe1\xfe\x4b\x79\x0e\x4f\x97\x62\x18\
-\x3a\x28\x58\xce\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
-\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x38\x2d\x30\x36\x2d\
-\x30\x33\x54\x32\x33\x3a\x33\x34\x3a\x32\x30\x2b\x30\x32\x3a\x30\
-\x30\x53\xaf\x67\xc0\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x38\x2d\x30\x36\
-\x2d\x30\x33\x54\x32\x33\x3a\x33\x34\x3a\x32\x30\x2b\x30\x32\x3a\
-\x30\x30\x22\xf2\xdf\x7c\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\
-\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x07\x59\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00\x69\x37\xa9\x40\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x02\
-\x62\x4b\x47\x44\x00\x00\xaa\x8d\x23\x32\x00\x00\x00\x09\x70\x48\
-\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01\x42\x28\x9b\x78\x00\
-\x00\x00\x07\x74\x49\x4d\x45\x07\xe2\x06\x03\x17\x23\x1f\x20\x65\
-\x85\x06\x00\x00\x06\x27\x49\x44\x41\x54\x78\xda\xed\x9d\x69\x6c\
-\x55\x45\x14\xc7\x7f\xaf\xa5\x15\xcb\xf2\x78\x14\x8b\x90\x20\x46\
-\x09\xd6\xb0\x89\x0b\x26\x2c\x0a\x9a\x68\x5c\x12\xe3\x02\x02\x51\
-\x88\x18\x88\x1f\x34\x35\x62\xe2\x92\x90\x18\xa3\x31\x92\xe8\x07\
-\x3f\x88\x06\x89\x7c\xc1\x80\xc4\x25\x21\x12\x31\x41\x52\x10\x51\
-\x09\x46\x8d\x0a\xa6\xc6\xe0\xc2\xa2\xa5\x7d\x5d\xa0\xda\xd2\x76\
-\xfc\xd0\x52\xdf\x6d\xdf\x72\xef\x9d\x99\x73\x7c\x2d\xff\xf3\xa9\
-\xaf\x79\x73\xfe\xff\x33\x67\xe6\xcd\xb9\x77\xee\x5c\x38\x8f\xa1\
-\x8d\x52\x65\xff\x55\x94\xd0\xa1\x49\xa0\x44\x39\x00\x0f\xb1\x5c\
-\x99\x81\x2a\x12\xd4\x71\x48\x9b\x84\x26\x6e\xc6\x60\xb8\x46\x9b\
-\x86\x1e\xb6\x62\x30\xbc\xa9\x4d\x43\x0b\x17\xd1\x8e\xc1\xd0\xca\
-\x48\x3d\x12\x9a\x93\xe0\x4a\xca\x01\x18\xc9\x32\x45\x16\x8a\xf8\
-\x09\xd3\x6b\x07\xb5\xa9\x68\x60\x61\x9f\x7c\x83\x61\xb6\x36\x1d\
-\x79\x6c\x09\x04\x60\x83\x36\x1d\x69\x54\xf2\x4f\x20\x00\x2d\x8c\
-\xd0\x21\xa2\x35\x09\xae\xe0\x82\xc0\xdf\xa3\x58\xaa\xc4\x44\x09\
-\x3f\x06\xfa\xdf\x60\xf8\x52\x9b\x92\x24\x16\x0c\x90\x6f\x30\xcc\
-\xd2\xa0\xa2\x33\x04\xd6\x44\xf8\x74\x10\x22\xc5\xdf\x59\x33\xa0\
-\x89\x0a\x79\x32\x1a\x19\xf0\x20\xc3\xb3\x7e\x9e\xe4\x7e\x05\x36\
-\x0a\xf8\x3e\x6b\xff\x1b\x0c\x07\xb4\xa9\x49\x60\x6e\x4e\xf9\x06\
-\xc3\x0c\x69\x3a\xf2\x43\x60\x8d\xc5\x7f\x07\x01\x92\xb4\xe5\xcd\
-\x80\x34\x17\xca\x12\x92\xce\x80\x07\x0a\x08\x1c\xc3\x12\x61\x46\
-\xc2\xf8\x36\x6f\xff\x1b\x0c\xfb\xb5\x29\xfa\xc4\xf5\x05\xe5\x1b\
-\x0c\xd3\x24\x29\xc9\x0e\x81\x70\x53\xdc\xa0\x9d\x08\x47\x73\x3a\
-\x54\x06\x34\xe6\x58\x28\x79\x81\x64\x06\x2c\x0f\x59\xf3\xa7\x58\
-\x2c\xc8\x4a\x10\x5f\x87\xea\x7f\x83\x61\x9f\x36\x55\x1f\xb8\x36\
-\xb4\x7c\x83\xe1\x4a\x29\x5a\x72\x43\x20\xda\xd4\x36\xe8\x26\xc2\
-\x91\xb4\x46\xca\x80\x06\xa9\x89\x50\x2a\x03\x96\x45\xbc\xfb\x33\
-\x96\x7b\x85\x98\x09\xe1\x60\xa4\xfe\x37\x18\x6a\xb5\x29\xbb\xc4\
-\xec\xc8\xf2\x0d\x86\x6a\x09\x6a\x32\x43\x20\xde\x94\xb6\x5a\x84\
-\x9b\x00\x46\xd0\x1c\x2b\x03\x4e\xf5\xbb\x77\xe0\x05\x12\x19\xb0\
-\x94\xd1\xb1\xbe\x57\xc9\x3d\x02\xec\x04\xf0\x45\xac\xfe\x37\x18\
-\xf6\x68\x53\x77\x81\x99\xb1\xe5\x1b\x0c\x53\x7d\xd3\xf3\x3f\x04\
-\xec\xd6\x74\x45\x3f\x11\x56\xd0\x64\x95\x01\xf5\xbd\xbb\x48\xbc\
-\xc1\x77\x06\x2c\x21\x69\xf5\xfd\x71\xdc\xed\x99\xa1\x67\xec\xb7\
-\xea\x7f\x83\x61\xb7\xb6\x04\x1b\x4c\xb3\x96\x6f\xe8\x66\x8a\x4f\
-\x8a\xc3\x1c\xb6\x55\x42\x92\x54\xaf\x8d\x21\x45\x8a\x05\x0e\x5a\
-\x4d\xb0\x89\xcf\x49\x67\x58\x13\xcd\x74\xbb\x22\x9d\x88\x18\xae\
-\x31\x01\x81\xa9\x80\xe0\x64\xc4\xd6\xe2\xc3\xd0\x9c\x11\x8e\x60\
-\x70\xd2\x34\xd1\x19\x3f\x00\xe5\xfd\xfa\x30\xf8\xd7\x28\x21\x81\
-\xb6\x68\xcd\x19\x9c\x34\xe9\xe0\xee\xf4\x04\xab\x99\x9f\x21\x51\
-\xe1\x0e\xbd\x38\xda\x32\xc2\xf1\x19\x24\xd9\xe5\x60\xaa\x2a\x4e\
-\xdb\xd5\xf3\x23\x3d\x8c\x0d\xea\x54\x34\xec\xf5\xcc\x9f\x80\xc7\
-\xe9\x52\x27\x24\x69\x5d\xd4\xf4\x1f\x19\x77\x46\xbc\x6c\x59\xcc\
-\xd6\xca\x1d\xd9\x26\x87\x59\xfc\xae\x4e\x4d\xc2\x7e\x63\x66\xae\
-\xf9\x71\x42\x8c\x8b\x97\xc5\x66\x5f\x71\x71\xbe\x9f\x88\x0a\xde\
-\x53\xa7\xe8\xd3\xb6\x17\xde\x81\x92\xe0\x65\x75\x9a\xbe\xec\xc5\
-\xb0\x6b\xd5\x55\x74\xa8\x93\x75\x6d\xed\xac\x88\xb2\x5a\x5a\x44\
-\xa3\x3a\x65\x97\x76\x2a\x7a\x61\x36\x95\x3a\x75\xda\xae\xec\x08\
-\x97\x47\x95\x0f\x50\x49\xad\x3a\x75\x17\xb6\x9b\x54\x1c\xf9\x00\
-\xe5\x6c\x56\xa7\x6f\x6b\x1b\x29\x8b\x2b\xbf\x07\xcf\xd2\xad\x2e\
-\x22\xae\x75\xf1\xa4\x9d\xf8\x1e\x2c\x2e\xb0\xbb\xf3\xff\x6a\xa7\
-\xb9\xcb\x85\x7c\x80\x39\x9c\x54\x97\x13\xd5\xfe\x70\xfb\x28\xde\
-\x25\x7c\xa7\x2e\x29\x8a\x1d\x62\xa2\x4b\xf9\x00\xa3\xd8\xa9\x2e\
-\x2b\xac\x7d\xe0\xe7\xca\x56\x29\xaf\xa9\x4b\x0b\x63\xeb\x7d\xde\
-\xee\x79\x94\x4e\x75\x81\xf9\xac\x83\x87\xfd\x89\xef\xc1\x6d\xb4\
-\xa8\xcb\xcc\x65\x8d\x2c\xf2\x2d\x1f\x60\x3a\x47\xd5\xa5\x66\xb3\
-\x3a\xff\x37\xd3\xcf\x61\xbc\xc5\xa6\x07\x5f\x56\x4b\xa5\x94\x7c\
-\x80\xe1\x6c\x53\x97\x9c\x69\x6f\xfb\xbe\x8d\x3e\x10\x09\x5e\x50\
-\x97\xdd\x63\xdd\x3c\x23\x2d\xfe\x1c\x56\xf4\x9e\x02\xa2\x69\x6d\
-\xba\x7b\x4a\x17\x70\x4a\x55\xfe\x71\xae\xd3\x94\x0f\x30\x85\x23\
-\x6a\xf2\xbf\x61\x92\xb6\x7c\x80\x14\x9f\xaa\xc8\xdf\xa1\x79\xfc\
-\x4e\x10\x65\x6c\x17\x97\xbf\xc9\xcd\x82\xd7\xcd\xaa\xf9\x2c\x27\
-\xc4\x83\x7e\xcc\xcd\x2e\x11\x57\x65\xc3\x4d\xe2\x01\x70\xe4\xd1\
-\xcd\xa6\x96\x2a\xfe\x14\x0f\xc0\x59\x52\x9c\xb1\x6f\xc6\x4d\x06\
-\x2c\x14\x97\x0f\x65\xcc\x73\xd1\x8c\x9b\x00\x88\xd4\x60\x7e\xbc\
-\xba\x09\x80\xfc\x0c\xe0\xcc\xab\x8b\x39\x60\x22\xc7\x54\x02\xd0\
-\xc5\x58\x5a\x6c\x1b\x71\x91\x01\x3a\x03\x00\x4a\x5d\x6c\xc4\x2c\
-\xe6\x00\x38\xf1\x3c\xe4\x03\x60\x3f\x07\x4c\xe6\xa8\x5a\x00\xba\
-\x19\x47\xda\xae\x09\xfb\x0c\xd0\xeb\x7f\x28\xe1\x46\xfb\x26\x8a\
-\x39\x00\x0e\xbc\x0f\xf9\x00\xd8\xce\x01\x53\xa8\x53\x0d\x80\x61\
-\x3c\xf5\x36\x0d\xd8\x66\x80\x6e\xff\x43\xc2\xb6\x0e\x29\xf6\x00\
-\xa8\x33\x38\xa1\x7a\x49\xd4\x60\x38\x6c\x27\xc0\x2e\x03\xaa\xf3\
-\x6f\x3b\x15\x41\x35\x13\xf4\x02\xa0\x53\x05\xf6\x87\xd5\x20\xb0\
-\x0b\x80\xed\xf8\x33\xbc\xc5\x3b\xba\x01\xb0\x41\x82\x7a\xab\xd1\
-\x7b\x84\x1b\x00\xb8\x95\x5f\xac\xda\xf9\x59\x2b\x00\x33\x2c\x48\
-\xb7\xf3\x5c\xc6\xf1\x08\x15\xac\xe7\xac\x45\x6b\x4a\xb7\x47\x6a\
-\x62\x13\xde\x9b\xe5\xa0\xa4\xab\x2c\x9e\x55\x58\xa9\x13\x80\x0f\
-\x63\x91\x4d\xb3\x3a\xc7\xfa\xb3\x84\x9a\x98\x8f\xed\x6c\xd6\x90\
-\x5f\x12\x6b\x3f\xf9\xb6\x02\x3f\x9c\x93\xd8\x11\xa3\xd5\x5f\x35\
-\x02\x70\x75\x64\x9a\x47\xb9\x3d\x54\xcb\xf7\x71\x3c\x72\xdb\x97\
-\xc9\x07\x60\x6d\x24\x82\x9d\xbc\x1a\xe1\x00\xfd\x24\x6f\x44\xdc\
-\xa1\xec\x7d\x6f\xd8\x40\x7c\x14\x81\xde\xa1\x18\xaf\xd2\x99\xc7\
-\x0f\x11\x3c\x6c\x91\x96\x3f\x2c\xf4\x66\xb9\xd3\xac\x8d\xf9\x42\
-\xaf\x72\xd6\xf5\x7b\x0d\x43\x6e\x13\xbf\x30\x1f\xee\x78\x54\xc3\
-\x4e\x2e\xb5\xf2\x33\x95\x3d\x21\x3d\x5d\x21\x1b\x80\xa7\x43\x50\
-\x3a\xe9\xe8\xad\x11\xab\x68\x08\xe1\xed\x11\xd9\x00\x7c\x52\x80\
-\x4e\x37\x1b\xe3\x3f\xa8\x32\x00\x55\xfd\x5e\xc9\x92\xcd\xde\x95\
-\x94\x5f\xc6\x99\xbc\x64\x0e\xf7\xae\xf2\x5d\xa2\x50\xc5\xf0\x97\
-\xd8\xf9\x15\xc0\xfc\x3c\x44\x82\xab\x7c\x97\x28\x54\x31\x4c\x97\
-\x0b\xc0\xba\x9c\x24\xf6\x7a\x3e\x05\x30\x5f\xc5\xf0\x98\x5c\x00\
-\xb2\xef\x0a\xcb\xbd\xca\x77\x89\xdc\x15\xc3\xfb\x52\xf2\x87\x67\
-\x7d\x47\xc8\x56\xc1\xcb\x63\xd9\x2b\x86\x06\xa9\x13\x52\x17\x0d\
-\x70\x1d\x76\x95\xef\x12\xd9\x2a\x06\xa1\x37\x96\x3d\x1f\x70\xda\
-\xc9\x2b\x4a\xaf\xc9\x1a\x58\x31\x3c\x21\xe3\x78\x5f\x86\xcb\x38\
-\xab\x7c\x97\x08\x56\x0c\x3b\x24\x5c\x56\xf4\x3d\x5a\x1f\x7f\x95\
-\xef\x12\x99\x15\x43\xb3\x04\x9f\x5b\xfa\x56\xf9\x93\xb5\xb5\xf7\
-\xe1\xbf\x8a\x61\x8e\x7f\x67\x2f\x39\x5c\xe5\xbb\x44\x4f\xc5\xf0\
-\x94\x7f\x47\x07\x9c\xae\xf2\x5d\xa2\x8a\x2d\x7c\xec\xdb\x49\x82\
-\xb9\xda\x3a\xf3\xc2\xc9\xee\xd1\xf3\x18\x4a\xf8\x17\xab\x4b\x44\
-\x18\x8d\x2e\x38\x11\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\
-\x65\x3a\x63\x72\x65\x61\x74\x65\x00\x32\x30\x31\x38\x2d\x30\x36\
-\x2d\x30\x33\x54\x32\x33\x3a\x33\x35\x3a\x33\x31\x2b\x30\x32\x3a\
-\x30\x30\xd6\xb0\x07\xd4\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\
-\x74\x65\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x31\x38\x2d\x30\
-\x36\x2d\x30\x33\x54\x32\x33\x3a\x33\x35\x3a\x33\x31\x2b\x30\x32\
-\x3a\x30\x30\xa7\xed\xbf\x68\x00\x00\x00\x19\x74\x45\x58\x74\x53\
-\x6f\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
+which QResource memory-maps when it is registered. Registration happens the
+first time a pixmap or icon is requested, so processes that never draw do
+not pay for the images. Pixmaps are decoded and scaled once per process and
+shared by every board, dialog and widget that asks for them.
+"""
 
-qt_resource_name = b"\
-\x00\x06\
-\x07\x03\x7d\xc3\
-\x00\x69\
-\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x05\
-\x00\x6a\xf9\x86\
-\x00\x64\
-\x00\x69\x00\x63\x00\x65\x00\x36\
-\x00\x04\
-\x00\x06\xfa\x5e\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\
-\x00\x05\
-\x00\x78\xc9\xc4\
-\x00\x72\
-\x00\x65\x00\x73\x00\x65\x00\x74\
-\x00\x05\
-\x00\x6a\xf9\x84\
-\x00\x64\
-\x00\x69\x00\x63\x00\x65\x00\x34\
-\x00\x05\
-\x00\x6a\xf9\x85\
-\x00\x64\
-\x00\x69\x00\x63\x00\x65\x00\x35\
-\x00\x04\
-\x00\x06\xd8\x35\
-\x00\x67\
-\x00\x61\x00\x6d\x00\x65\
-\x00\x05\
-\x00\x6a\xf9\x82\
-\x00\x64\
-\x00\x69\x00\x63\x00\x65\x00\x32\
-\x00\x04\
-\x00\x06\xaf\x95\
-\x00\x64\
-\x00\x69\x00\x63\x00\x65\
-\x00\x09\
-\x08\x53\x66\xf5\
-\x00\x73\
-\x00\x74\x00\x61\x00\x72\x00\x2d\x00\x62\x00\x6c\x00\x75\x00\x65\
-\x00\x0a\
-\x05\x31\xde\xbe\
-\x00\x73\
-\x00\x74\x00\x61\x00\x72\x00\x2d\x00\x67\x00\x72\x00\x65\x00\x65\x00\x6e\
-\x00\x05\
-\x00\x6a\xf9\x81\
-\x00\x64\
-\x00\x69\x00\x63\x00\x65\x00\x31\
-\x00\x08\
-\x0a\x85\x47\xf4\
-\x00\x73\
-\x00\x74\x00\x61\x00\x72\x00\x2d\x00\x72\x00\x65\x00\x64\
-\x00\x05\
-\x00\x6a\x2b\x82\
-\x00\x63\
-\x00\x6c\x00\x65\x00\x61\x00\x72\
-\x00\x04\
-\x00\x06\xcf\x04\
-\x00\x65\
-\x00\x78\x00\x69\x00\x74\
-\x00\x05\
-\x00\x6a\xf9\x83\
-\x00\x64\
-\x00\x69\x00\x63\x00\x65\x00\x33\
-\x00\x0b\
-\x04\x11\x63\xc7\
-\x00\x73\
-\x00\x74\x00\x61\x00\x72\x00\x2d\x00\x79\x00\x65\x00\x6c\x00\x6c\x00\x6f\x00\x77\
-\x00\x04\
-\x00\x07\xaa\x82\
-\x00\x73\
-\x00\x74\x00\x61\x00\x72\
-"
+import os
 
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x11\x00\x00\x00\x02\
-\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x01\x2d\xce\
-\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x01\xaa\xcb\
-\x00\x00\x00\x60\x00\x00\x00\x00\x00\x01\x00\x00\xba\x4c\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x25\x56\
-\x00\x00\x01\x2e\x00\x00\x00\x00\x00\x01\x00\x01\xf9\x76\
-\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x01\x79\xc8\
-\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x01\x4f\xc4\
-\x00\x00\x00\x6e\x00\x00\x00\x00\x00\x01\x00\x01\x0d\x63\
-\x00\x00\x01\x02\x00\x00\x00\x00\x00\x01\x00\x01\xd6\x8f\
-\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\x74\x9b\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x98\x1d\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x6b\xb9\
-\x00\x00\x01\x12\x00\x00\x00\x00\x00\x01\x00\x01\xef\xca\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x01\x46\x18\
-\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x01\x3c\x6c\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x01\x70\x1c\
-"
+from PyQt5.QtCore import QResource, Qt
+from PyQt5.QtGui import QPixmap, QIcon, QGuiApplication
 
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x11\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x01\x2d\xce\
-\x00\x00\x01\x63\xbe\x57\x95\xac\
-\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x01\xaa\xcb\
-\x00\x00\x01\x63\xbe\x57\x95\xac\
-\x00\x00\x00\x60\x00\x00\x00\x00\x00\x01\x00\x00\xba\x4c\
-\x00\x00\x01\x63\xbe\x57\x95\xad\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x25\x56\
-\x00\x00\x01\x63\xbe\x57\x95\xad\
-\x00\x00\x01\x2e\x00\x00\x00\x00\x00\x01\x00\x01\xf9\x76\
-\x00\x00\x01\x63\xc7\x93\xa2\x7e\
-\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x01\x79\xc8\
-\x00\x00\x01\x63\xbe\x57\x95\xaa\
-\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x01\x4f\xc4\
-\x00\x00\x01\x63\xbe\x57\x95\xab\
-\x00\x00\x00\x6e\x00\x00\x00\x00\x00\x01\x00\x01\x0d\x63\
-\x00\x00\x01\x63\xbe\x57\x95\xab\
-\x00\x00\x01\x02\x00\x00\x00\x00\x00\x01\x00\x01\xd6\x8f\
-\x00\x00\x01\x63\xbe\x57\x95\xab\
-\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\x74\x9b\
-\x00\x00\x01\x63\xbe\x57\x95\xab\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x98\x1d\
-\x00\x00\x01\x63\xbe\x57\x95\xac\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x63\xbe\x57\x95\xac\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x6b\xb9\
-\x00\x00\x01\x63\xbe\x57\x95\xad\
-\x00\x00\x01\x12\x00\x00\x00\x00\x00\x01\x00\x01\xef\xca\
-\x00\x00\x01\x63\xc7\x92\x8f\xe7\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x01\x46\x18\
-\x00\x00\x01\x63\xc7\x91\x93\xb1\
-\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x01\x3c\x6c\
-\x00\x00\x01\x63\xc7\x93\x53\x18\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x01\x70\x1c\
-\x00\x00\x01\x63\xc7\x90\x7e\xe7\
-"
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "resources.rcc")
 
-qt_version = QtCore.qVersion().split('.')
-if qt_version < ['5', '8', '0']:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
+registered = False
 
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+# (path, (width, height) or None, device pixel ratio) -> QPixmap
+pixmaps = {}
+icons = {}
 
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
 
-qInitResources()
+def register():
+    global registered
+    if registered:
+        return
+    if not QResource.registerResource(RESOURCE_FILE):
+        raise ValueError("Error! can not register resources from {}".format(RESOURCE_FILE))
+    registered = True
+
+
+def pixmap(path, size=None):
+    """
+    Pixmap of the resource at path, scaled to fit into the QSize size if
+    given. Scaled pixmaps have the device pixel ratio of the application,
+    so they stay sharp on high dpi screens.
+    """
+    ratio = QGuiApplication.instance().devicePixelRatio()
+    key = (path, (size.width(), size.height()) if size else None, ratio)
+    cached = pixmaps.get(key)
+    if cached is not None:
+        return cached
+
+    if size is None:
+        register()
+        cached = QPixmap(path)
+    else:
+        cached = pixmap(path).scaled(size * ratio, Qt.KeepAspectRatio)
+        cached.setDevicePixelRatio(ratio)
+    pixmaps[key] = cached
+    return cached
+
+
+def icon(path):
+    cached = icons.get(path)
+    if cached is None:
+        register()
+        cached = icons[path] = QIcon(path)
+    return cached
@@ -0,0 +1,139 @@
+"""
+Expectiminimax search for computer players
+
+The search runs on engine.Game positions. Decision nodes maximize the value
+of the searching color when it is to move and minimize it otherwise, chance
+nodes average over the six faces of the dice. Results are kept in a bounded
+transposition table with LRU eviction.
+"""
+
+from collections import OrderedDict
+
+import engine
+
+WIN_SCORE = 10000.0
+
+# rough size of one table entry: (hash, color) key, value tuple and dict slot
+ENTRY_BYTES = 256
+
+FIGURE_VALUES = [0.0] + [30.0 + progress for progress in range(1, engine.END + 1)]
+for progress in range(engine.LAST + 1, engine.END):
+    FIGURE_VALUES[progress] += 10.0
+FIGURE_VALUES[engine.END] += 20.0
+
+
+class SearchCancelled(Exception):
+    pass
+
+
+class TranspositionTable:
+    """Mapping from position keys to (depth, value) with a memory cap in bytes."""
+
+    def __init__(self, memory=16 * 2**20):
+        self.capacity = max(1, memory // ENTRY_BYTES)
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, depth):
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < depth:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key, depth, value):
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+        entries[key] = (depth, value)
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def evaluate(game, color):
+    if game.winners:
+        return WIN_SCORE if game.winners[0] == color else -WIN_SCORE
+
+    scores = [sum(FIGURE_VALUES[progress] for progress in game.getFigures(other))
+              for other in range(engine.NUM_PLAYERS)]
+    opponents = [score for other, score in enumerate(scores) if other != color]
+    return scores[color] - sum(opponents) / len(opponents)
+
+
+class Expectiminimax:
+    """
+    Strategy searching depth plies ahead, where both a move and a dice roll
+    count as one ply.
+    """
+
+    def __init__(self, depth=4, memory=16 * 2**20):
+        self.depth = depth
+        self.table = TranspositionTable(memory)
+        self.nodes = 0
+
+    def __call__(self, game, moves, cancel=None):
+        if len(moves) == 1:
+            return moves[0]
+        move, _ = self.bestMove(game, cancel=cancel)
+        return move
+
+    def bestMove(self, game, depth=None, cancel=None):
+        """
+        Best move and its value for the player to move. Setting the
+        threading.Event cancel from another thread aborts the search with
+        SearchCancelled.
+        """
+        depth = self.depth if depth is None else depth
+        color = game.getCurrentPlayer()
+        best_move = None
+        best_value = None
+        for move in game.legalMoves():
+            child = game.copy()
+            child.move(*move)
+            value = self.search(child, depth - 1, color, cancel)
+            if best_value is None or value > best_value:
+                best_move, best_value = move, value
+        return best_move, best_value
+
+    def search(self, game, depth, color, cancel=None):
+        if cancel is not None and cancel.is_set():
+            raise SearchCancelled()
+        self.nodes += 1
+        if depth <= 0 or game.winners:
+            return evaluate(game, color)
+
+        key = (game.key(), color)
+        value = self.table.get(key, depth)
+        if value is not None:
+            return value
+
+        if game.isRolling():
+            value = 0.0
+            for dice in range(1, 7):
+                child = game.copy()
+                child.setDice(dice)
+                value += self.search(child, depth - 1, color, cancel)
+            value /= 6.0
+        else:
+            maximize = game.getCurrentPlayer() == color
+            value = None
+            for move in game.legalMoves():
+                child = game.copy()
+                child.move(*move)
+                child_value = self.search(child, depth - 1, color, cancel)
+                if value is None or (child_value > value if maximize else child_value < value):
+                    value = child_value
+
+        self.table.put(key, depth, value)
+        return value
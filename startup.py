@@ -0,0 +1,28 @@
+"""
+Wall time of the startup phases of ludo.py
+
+Used by `python ludo.py --profile-startup`. This module only depends on
+the standard library so that it can be imported before PyQt5.
+"""
+
+import time
+
+
+class StartupProfile:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, name):
+        """Record the time since the previous mark as phase name."""
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def report(self):
+        lines = []
+        for name, elapsed in self.phases:
+            lines.append("{:<24}{:>10.1f} ms".format(name, 1000.0 * elapsed))
+        lines.append("{:<24}{:>10.1f} ms".format("total", 1000.0 * (self.last - self.start)))
+        return "\n".join(lines)
@@ -0,0 +1,62 @@
+"""
+Computer player strategies
+
+A strategy is a callable strategy(game, moves, cancel=None) returning one
+of the (figure, dice) pairs in moves for the current player of an
+engine.Game. cancel is a threading.Event; searching strategies raise
+search.SearchCancelled once it is set, the others return at once anyway.
+STRATEGIES holds plain functions and the classes of searching strategies;
+getStrategy builds a new instance of the latter for every caller, so
+players never share search state or worker processes.
+"""
+
+import engine
+from search import Expectiminimax
+from mcts import MCTS
+
+
+def randomStrategy(game, moves, cancel=None):
+    return game.rng.choice(moves)
+
+
+def firstStrategy(game, moves, cancel=None):
+    return moves[0]
+
+
+def greedyScore(game, move):
+    figure, dice = move
+    color = game.getCurrentPlayer()
+    progress = game.getFigures(color)[figure]
+    result = engine.ADVANCE[progress][dice]
+
+    score = result
+    if result == engine.END:
+        score += 100
+    if progress == engine.HOME:
+        score += 50
+    if game.captures(color, result):
+        score += 200
+    return score
+
+
+def greedyStrategy(game, moves, cancel=None):
+    return max(moves, key=lambda move: greedyScore(game, move))
+
+
+STRATEGIES = {
+    'random': randomStrategy,
+    'first': firstStrategy,
+    'greedy': greedyStrategy,
+    'expectiminimax': Expectiminimax,
+    'mcts': MCTS,
+}
+
+
+def getStrategy(name, **options):
+    """Strategy called name, options are passed to the class of a searching strategy."""
+    if name not in STRATEGIES:
+        raise ValueError("Error! unknown strategy {}".format(name))
+    strategy = STRATEGIES[name]
+    if isinstance(strategy, type):
+        return strategy(**options)
+    return strategy
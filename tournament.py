@@ -0,0 +1,139 @@
+"""
+Tournament between computer strategies
+
+Games are played with the headless engine in a process pool. Every task
+gets its own seeded dice stream; the seating rotates from game to game
+over the whole tournament, so that each strategy plays as RED, GREEN,
+YELLOW and BLUE equally often whenever the number of games is a multiple
+of the number of seatings (4, or 12 with three strategies), and at most
+one game per seating apart otherwise.
+Placements are counted per seat, so a strategy seated twice in a game
+is ranked on both of its seats.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import engine
+from strategy import STRATEGIES, getStrategy
+
+CHUNK_SIZE = 50
+
+# every worker is one process already: single-process searches with a fixed budget
+STRATEGY_OPTIONS = {
+    'mcts': {'iterations': 25, 'time_limit': None, 'workers': 1},
+}
+
+
+def rotateSeats(lineup):
+    """
+    All seatings of lineup, each strategy equally often on every color.
+    Two strategies take two seats each. With three strategies one of them
+    needs a second seat; every strategy takes that seat in turn, so all
+    three play the same number of seats over the 12 seatings.
+    """
+    checkLineup(lineup)
+    if len(lineup) == 3:
+        tables = [list(lineup) + [double] for double in lineup]
+    else:
+        tables = [[lineup[index % len(lineup)] for index in range(engine.NUM_PLAYERS)]]
+    return [seats[shift:] + seats[:shift] for seats in tables for shift in range(engine.NUM_PLAYERS)]
+
+
+def checkLineup(lineup):
+    """Raise ValueError unless lineup names 2 to 4 known strategies."""
+    if not 2 <= len(lineup) <= engine.NUM_PLAYERS:
+        raise ValueError("Error! a tournament needs 2 to {} strategies, got {}".format(engine.NUM_PLAYERS, len(lineup)))
+    for name in lineup:
+        if name not in STRATEGIES:
+            raise ValueError("Error! unknown strategy {}".format(name))
+
+
+def playGames(lineup, num_games, seed, first):
+    """
+    Worker task: play num_games games of the tournament, starting with
+    game number first, each with the seating of rotateSeats that belongs
+    to its number. Returns the placement counts per strategy name and the
+    wins per color.
+    """
+    seatings = rotateSeats(lineup)
+    strategies = {name: getStrategy(name, **STRATEGY_OPTIONS.get(name, {})) for name in lineup}
+    stream = random.Random(seed)
+    placements = {name: [0] * engine.NUM_PLAYERS for name in lineup}
+    color_wins = [0] * engine.NUM_PLAYERS
+
+    for number in range(first, first + num_games):
+        seats = seatings[number % len(seatings)]
+        game = engine.Game(stream.getrandbits(64))
+        ranking = game.play([strategies[name] for name in seats])
+        for place, color in enumerate(ranking):
+            placements[seats[color]][place] += 1
+        color_wins[ranking[0]] += 1
+    return placements, color_wins
+
+
+class Tournament:
+    def __init__(self, lineup, num_games, workers=None, seed=None):
+        checkLineup(lineup)
+        self.lineup = list(lineup)
+        self.num_games = num_games
+        self.workers = workers or os.cpu_count()
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.placements = {name: [0] * engine.NUM_PLAYERS for name in self.lineup}
+        self.color_wins = [0] * engine.NUM_PLAYERS
+        self.played = 0
+
+    def tasks(self):
+        stream = random.Random(self.seed)
+        for first in range(0, self.num_games, CHUNK_SIZE):
+            num_games = min(CHUNK_SIZE, self.num_games - first)
+            yield self.lineup, num_games, stream.getrandbits(64), first
+
+    def merge(self, placements, color_wins):
+        for name, counts in placements.items():
+            total = self.placements[name]
+            for place, count in enumerate(counts):
+                total[place] += count
+        for color, count in enumerate(color_wins):
+            self.color_wins[color] += count
+        self.played += sum(color_wins)
+
+    def run(self, progress=None):
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(playGames, *task) for task in self.tasks()]
+            for future in as_completed(futures):
+                self.merge(*future.result())
+                if progress:
+                    progress(self)
+        return self.placements
+
+    def report(self):
+        lines = []
+        lines.append("{:<12}{:>8}{:>8}".format("Strategy", "Wins", "Win %")
+                     + "".join("{:>8}".format("#" + str(place + 1)) for place in range(engine.NUM_PLAYERS)))
+        for name in sorted(self.placements, key=lambda name: -self.placements[name][0]):
+            counts = self.placements[name]
+            games = sum(counts)
+            rate = 100.0 * counts[0] / games if games else 0.0
+            line = "{:<12}{:>8}{:>8.1f}".format(name, counts[0], rate)
+            lines.append(line + "".join("{:>8}".format(count) for count in counts))
+        wins = ", ".join("{} {}".format(engine.COLORS[color], count) for color, count in enumerate(self.color_wins))
+        lines.append("Wins by color: " + wins)
+        return "\n".join(lines)
+
+
+def runTournament(lineup, num_games, workers=None, seed=None):
+    tournament = Tournament(lineup, num_games, workers, seed)
+    print("Playing {} games between {} on {} workers (seed {})".format(
+        num_games, ", ".join(tournament.lineup), tournament.workers, tournament.seed))
+
+    start = time.perf_counter()
+    tournament.run(lambda t: print("\r{}/{} games".format(t.played, t.num_games), end="", flush=True))
+    elapsed = time.perf_counter() - start
+
+    print()
+    print(tournament.report())
+    print("{} games in {:.2f}s ({:.0f} games/s)".format(tournament.played, elapsed, tournament.played / elapsed))
+    return tournament